@@ -0,0 +1,204 @@
+#  Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#  SPDX-License-Identifier: Apache-2.0
+
+"""
+Bulk DynamoDB write engine.
+
+Writes lists of typed ``PutRequest`` / ``DeleteRequest`` entries with
+``batch_write_item`` chunks sent concurrently over a bounded worker pool.
+``UnprocessedItems`` are retried with jittered exponential backoff and every
+request is reported as succeeded or failed, so callers can return per-item
+outcomes.
+
+Replace-all writes (delete the records not in the new set, write the new set)
+run as a single ``transact_write_items`` call when they fit in one
+transaction. Larger replacements are written in batches and rolled back to
+the previous records if any write fails.
+"""
+
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple
+from botocore.exceptions import ClientError
+from customLogging.logger import safeLogger
+from models.common import VAMSGeneralErrorResponse
+
+logger = safeLogger(service_name="BatchWriteCommon")
+
+#DynamoDB limits
+BATCH_WRITE_MAX_ITEMS = 25
+TRANSACT_WRITE_MAX_ITEMS = 100
+
+#Concurrent batch_write_item calls per bulk write (kept under the default client connection pool of 10)
+BATCH_WRITE_MAX_WORKERS = 8
+
+#Retries of UnprocessedItems per batch and the backoff bounds between them
+UNPROCESSED_MAX_RETRIES = 8
+UNPROCESSED_BACKOFF_BASE_SECONDS = 0.05
+UNPROCESSED_BACKOFF_MAX_SECONDS = 2.0
+
+
+def _backoff(attempt: int) -> None:
+    """Sleep with full jitter exponential backoff"""
+    time.sleep(random.uniform(0, min(UNPROCESSED_BACKOFF_MAX_SECONDS, UNPROCESSED_BACKOFF_BASE_SECONDS * (2 ** attempt))))
+
+
+def _request_item(request: Dict) -> Dict:
+    """Return the item (PutRequest) or key (DeleteRequest) of a write request"""
+    if 'PutRequest' in request:
+        return request['PutRequest']['Item']
+    return request['DeleteRequest']['Key']
+
+
+def _write_batch(dynamodb_client, table_name: str, batch: List[Dict]) -> Tuple[List[Dict], List[Tuple[Dict, str]]]:
+    """
+    Write one batch of up to 25 requests, retrying unprocessed requests.
+
+    Returns:
+        Tuple of (written requests, [(failed request, error)])
+    """
+    pending = batch
+    attempt = 0
+    while True:
+        try:
+            response = dynamodb_client.batch_write_item(RequestItems={table_name: pending})
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code in ('ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded') \
+                    and attempt < UNPROCESSED_MAX_RETRIES:
+                _backoff(attempt)
+                attempt += 1
+                continue
+            logger.exception(f"Error in batch write: {e}")
+            failed = [(request, 'Batch write failed') for request in pending]
+            return [request for request in batch if request not in pending], failed
+
+        unprocessed = response.get('UnprocessedItems', {}).get(table_name, [])
+        if not unprocessed:
+            return batch, []
+
+        if attempt >= UNPROCESSED_MAX_RETRIES:
+            logger.warning(f"{len(unprocessed)} items still unprocessed after {attempt} retries")
+            written = [request for request in batch if request not in unprocessed]
+            return written, [(request, 'Unprocessed after retries') for request in unprocessed]
+
+        _backoff(attempt)
+        attempt += 1
+        pending = unprocessed
+
+
+def batch_write(dynamodb_client, table_name: str, requests: List[Dict], request_id: Callable[[Dict], str],
+                max_workers: int = BATCH_WRITE_MAX_WORKERS) -> Tuple[List[str], List[Dict]]:
+    """
+    Write PutRequest/DeleteRequest entries concurrently in batches of 25.
+
+    Args:
+        dynamodb_client: boto3 DynamoDB client
+        table_name: Table to write to
+        requests: Typed write requests (as accepted by batch_write_item)
+        request_id: Returns the identifier reported for a request's item (for example its metadataKey)
+        max_workers: Maximum concurrent batch_write_item calls
+
+    Returns:
+        Tuple of (succeeded ids in request order, failed items as {'key', 'error'})
+    """
+    if not requests:
+        return [], []
+
+    batches = [requests[i:i + BATCH_WRITE_MAX_ITEMS] for i in range(0, len(requests), BATCH_WRITE_MAX_ITEMS)]
+    if len(batches) == 1:
+        results = [_write_batch(dynamodb_client, table_name, batches[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+            results = list(executor.map(lambda batch: _write_batch(dynamodb_client, table_name, batch), batches))
+
+    succeeded = []
+    failed = []
+    for written, batch_failed in results:
+        succeeded.extend(request_id(_request_item(request)) for request in written)
+        failed.extend({'key': request_id(_request_item(request)), 'error': error} for request, error in batch_failed)
+
+    if failed:
+        # Keep the caller's request order in the reported successes
+        failed_ids = {item['key'] for item in failed}
+        succeeded = [request_id(_request_item(request)) for request in requests
+                     if request_id(_request_item(request)) not in failed_ids]
+
+    return succeeded, failed
+
+
+def replace_all(dynamodb_client, table_name: str, key_attributes: List[str], existing_items: List[Dict],
+                new_items: List[Dict], request_id: Callable[[Dict], str]) -> Dict[str, int]:
+    """
+    Replace a set of records: delete existing records missing from new_items and put every new item.
+
+    Runs as one transaction when the writes fit in a single TransactWriteItems call. Otherwise the
+    writes are batched and, if any fails, the existing records are restored and newly added ones removed.
+
+    Args:
+        dynamodb_client: boto3 DynamoDB client
+        table_name: Table to write to
+        key_attributes: Primary key attribute names of the table
+        existing_items: Current typed items of the set being replaced
+        new_items: Typed items making up the new set
+        request_id: Returns the identifier of an item (for example its metadataKey)
+
+    Returns:
+        Dictionary with the 'deleted' and 'written' counts
+
+    Raises:
+        VAMSGeneralErrorResponse: When the replacement failed (no changes are left applied
+        unless the message says the rollback was unsuccessful)
+    """
+    def key_of(item):
+        return {attribute: item[attribute] for attribute in key_attributes}
+
+    # A key may appear once per transaction or batch; the last value provided for it wins
+    new_items = list({request_id(item): item for item in new_items}.values())
+    new_ids = {request_id(item) for item in new_items}
+    existing_ids = {request_id(item) for item in existing_items}
+    items_to_delete = [item for item in existing_items if request_id(item) not in new_ids]
+
+    logger.info(f"REPLACE_ALL: Deleting {len(items_to_delete)} keys, upserting {len(new_items)} keys")
+
+    if len(items_to_delete) + len(new_items) <= TRANSACT_WRITE_MAX_ITEMS:
+        transact_items = [{'Delete': {'TableName': table_name, 'Key': key_of(item)}} for item in items_to_delete]
+        transact_items += [{'Put': {'TableName': table_name, 'Item': item}} for item in new_items]
+        try:
+            if transact_items:
+                dynamodb_client.transact_write_items(TransactItems=transact_items)
+            return {'deleted': len(items_to_delete), 'written': len(new_items)}
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            # Oversized transactions (4 MB limit) are retried as batched writes below
+            if error_code != 'ValidationException':
+                logger.exception(f"REPLACE_ALL transaction failed: {e}")
+                raise VAMSGeneralErrorResponse("REPLACE_ALL operation failed, no changes were applied")
+            logger.warning(f"REPLACE_ALL transaction rejected, falling back to batched writes: {e}")
+
+    delete_requests = [{'DeleteRequest': {'Key': key_of(item)}} for item in items_to_delete]
+    _, delete_failed = batch_write(dynamodb_client, table_name, delete_requests, request_id)
+    put_failed = []
+    if not delete_failed:
+        _, put_failed = batch_write(dynamodb_client, table_name,
+                                    [{'PutRequest': {'Item': item}} for item in new_items], request_id)
+
+    if not delete_failed and not put_failed:
+        return {'deleted': len(items_to_delete), 'written': len(new_items)}
+
+    # Roll back: restore every previous record and remove records that did not exist before
+    logger.error(f"REPLACE_ALL writes failed ({len(delete_failed)} deletes, {len(put_failed)} puts), attempting rollback")
+    restore_requests = [{'PutRequest': {'Item': item}} for item in existing_items]
+    restore_requests += [{'DeleteRequest': {'Key': key_of(item)}} for item in new_items
+                         if request_id(item) not in existing_ids]
+    _, restore_failed = batch_write(dynamodb_client, table_name, restore_requests, request_id)
+    if restore_failed:
+        logger.error(f"Rollback failed for {len(restore_failed)} items")
+        raise VAMSGeneralErrorResponse(
+            "REPLACE_ALL operation failed and rollback unsuccessful - data may be inconsistent. "
+            "Please contact administrator."
+        )
+
+    logger.info(f"Rollback successful: restored {len(existing_items)} items")
+    raise VAMSGeneralErrorResponse("REPLACE_ALL operation failed, all changes rolled back successfully")
@@ -139,3 +139,7 @@ STANDARD_JSON_RESPONSE = {
         'Cache-Control': 'no-cache, no-store',
     }
 }
+
+# Maximum number of changed file keys sent with an asset change notification and listed in the
+# subscribers' digest, the remaining files are only counted
+MAX_DIGEST_FILES = 50
@@ -1,8 +1,10 @@
 #  Copyright 2022 Amazon.com, Inc. or its affiliates. All Rights Reserved.
 #  SPDX-License-Identifier: Apache-2.0
 import os
+import time
 import boto3
 from typing import Tuple
+from typing import Optional
 from typing import Any
 from typing import Dict
 from boto3.dynamodb.conditions import Key
@@ -13,6 +15,12 @@ logger = safeLogger(service_name="DynamoDBCommon")
 dynamodb_client = boto3.client('dynamodb')
 dynamodb = boto3.resource('dynamodb')
 
+#Asset table index keyed by assetId (sort key databaseId) used to resolve assets requested without a databaseId
+ASSET_ID_INDEX_NAME = "assetIdGSI"
+
+#Per-container cache of resolved assetId -> databaseId pairs
+_asset_database_id_cache: Dict[str, str] = {}
+
 def to_update_expr(record, op="SET") -> Tuple[Dict[str, str], Dict[str, Any], str]:
     """
     :param record:
@@ -38,6 +46,83 @@ def to_update_expr(record, op="SET") -> Tuple[Dict[str, str], Dict[str, Any], st
     return keys_map, values_map, expr
 
 
+def _emit_asset_scan_fallback_metric(reason):
+    """Log a CloudWatch embedded metric format record counting asset table scan fallbacks"""
+    logger.info("Asset table scan fallback", extra={
+        "_aws": {
+            "Timestamp": int(time.time() * 1000),
+            "CloudWatchMetrics": [{
+                "Namespace": "VAMS",
+                "Dimensions": [["Service"]],
+                "Metrics": [{"Name": "AssetIdScanFallback", "Unit": "Count"}]
+            }]
+        },
+        "Service": "DynamoDBCommon",
+        "Reason": reason,
+        "AssetIdScanFallback": 1
+    })
+
+
+def _select_database_id(database_ids):
+    """Prefer an active database over the archive (#deleted) databases when an assetId exists in several"""
+    if not database_ids:
+        return None
+    active_database_ids = [databaseId for databaseId in database_ids if not databaseId.endswith("#deleted")]
+    return (active_database_ids or database_ids)[0]
+
+
+def _scan_asset_database_id(asset_table_name, assetId):
+    """Last-resort paginated scan of the asset table for an assetId's databaseId"""
+    database_ids = []
+    paginator = dynamodb_client.get_paginator('scan')
+    for page in paginator.paginate(
+        TableName=asset_table_name,
+        FilterExpression="assetId = :id",
+        ExpressionAttributeValues={":id": {"S": assetId}},
+        ProjectionExpression="databaseId",
+    ):
+        database_ids.extend(item['databaseId']['S'] for item in page.get('Items', []))
+    return _select_database_id(database_ids)
+
+
+def get_asset_database_id(assetId, asset_table_name=None) -> Optional[str]:
+    """
+    Resolve the databaseId of an asset from its assetId alone.
+
+    Reads the asset table's assetIdGSI (a single keyed query regardless of table size) and caches
+    the resolved pair for the life of the container. The table scan is only used when the index
+    query itself fails and is counted with the AssetIdScanFallback metric.
+    """
+    if assetId in _asset_database_id_cache:
+        return _asset_database_id_cache[assetId]
+
+    if not asset_table_name:
+        asset_table_name = os.environ["ASSET_STORAGE_TABLE_NAME"]
+
+    try:
+        database_ids = []
+        query_params = {
+            'IndexName': ASSET_ID_INDEX_NAME,
+            'KeyConditionExpression': Key('assetId').eq(assetId),
+            'ProjectionExpression': 'databaseId',
+        }
+        while True:
+            response = dynamodb.Table(asset_table_name).query(**query_params)
+            database_ids.extend(item['databaseId'] for item in response.get('Items', []))
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        databaseId = _select_database_id(database_ids)
+    except Exception as e:
+        logger.warning(f"Asset id index query failed, falling back to table scan: {e}")
+        _emit_asset_scan_fallback_metric("IndexQueryFailed")
+        databaseId = _scan_asset_database_id(asset_table_name, assetId)
+
+    if databaseId:
+        _asset_database_id_cache[assetId] = databaseId
+    return databaseId
+
+
 def get_asset_object_from_id(databaseId, assetId):
     if not assetId:
         raise VAMSGeneralErrorResponse("Empty assetId or databaseId received")
@@ -72,27 +157,31 @@ def get_asset_object_from_id(databaseId, assetId):
             raise VAMSGeneralErrorResponse(f"Error retrieving asset.")
     else:
         #Kept right now for backwards capability until all tables can be updated to use datbaseId/Assetid (comments, subscriptions, asset links)
-        filter_expression = f"assetId = :id"
-        expression_attribute_values = {f":id": {"S": assetId}}
-
-        items = dynamodb_client.scan(
-            TableName=asset_table_name,
-            FilterExpression=filter_expression,
-            ExpressionAttributeValues=expression_attribute_values,
-        )
-        logger.info("Scanned Asset Item:")
-        logger.info(items)
-        item = items.get("Items", [])[0] if items.get("Items", []) else None
-
-        asset_object = {
+        try:
+            resolved_database_id = get_asset_database_id(assetId, asset_table_name)
+            asset_object = get_asset_object_from_id(resolved_database_id, assetId) if resolved_database_id else None
+            if resolved_database_id and not asset_object:
+                #Cached pair is stale (asset archived or moved); resolve once more from the index
+                _asset_database_id_cache.pop(assetId, None)
+                resolved_database_id = get_asset_database_id(assetId, asset_table_name)
+                asset_object = get_asset_object_from_id(resolved_database_id, assetId) if resolved_database_id else None
+        except VAMSGeneralErrorResponse as e:
+            raise e
+        except Exception as e:
+            logger.exception(f"Error resolving asset database: {e}")
+            raise VAMSGeneralErrorResponse(f"Error retrieving asset.")
+
+        if asset_object:
+            return asset_object
+
+        return {
             "object__type": "asset",
-            "assetId": item['assetId']['S'] if item else None,
-            "assetName": item['assetName']['S'] if item else None,
-            "databaseId": item['databaseId']['S'] if item else None,
-            "assetType": item['assetType']['S'] if item else None,
-            "tags": [tag['S'] for tag in item['tags']['L']] if item else None
+            "assetId": None,
+            "assetName": None,
+            "databaseId": None,
+            "assetType": None,
+            "tags": None
         }
-        return asset_object
 
 
 def validate_pagination_info(queryParameters, defaultMaxItemsOverride=10000, defaultPageSizeOverride=3000):
@@ -0,0 +1,169 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Metadata read library for VAMS.
+
+Reads asset metadata, file metadata, and file attributes directly from DynamoDB with the
+same normalization and schema enrichment as the metadata service GET endpoints. The
+metadata service uses it for its responses and internal callers (such as workflow
+execution) use it in-process instead of invoking the metadata service Lambda.
+
+Authorization is left to the caller.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+from boto3.dynamodb.types import TypeDeserializer
+from customLogging.logger import safeLogger
+from common.metadataSchemaValidation import get_aggregated_schemas, enrich_metadata_with_schema
+
+logger = safeLogger(service_name="MetadataRead")
+
+# Composite key path used for asset-level metadata records
+ASSET_METADATA_FILE_PATH = "/"
+
+
+def normalize_metadata_file_path(asset_id: str, file_path: str) -> str:
+    """Normalize a relative file path the way the file metadata endpoints do
+
+    Adds a leading slash and strips a leading "/{assetId}" prefix.
+
+    Args:
+        asset_id: The asset ID
+        file_path: Relative file path, with or without a leading slash
+
+    Returns:
+        The file path used in metadata record keys
+    """
+    if file_path and not file_path.startswith('/'):
+        file_path = '/' + file_path
+    if file_path.startswith(f"/{asset_id}/"):
+        file_path = file_path[len(asset_id)+1:]
+    return file_path
+
+
+def query_metadata_records(dynamodb_client, table_name: str, database_id: str, asset_id: str,
+                           file_path: str, metadata_type: str = 'metadata') -> List[Dict]:
+    """Fetch all metadata or attribute records of an asset or file
+
+    Args:
+        dynamodb_client: DynamoDB client
+        table_name: Asset file metadata table, or file attribute table for attributes
+        database_id: The database ID
+        asset_id: The asset ID
+        file_path: The normalized file path, or ASSET_METADATA_FILE_PATH for asset metadata
+        metadata_type: 'metadata' or 'attribute'
+
+    Returns:
+        List of records with metadataKey, metadataValue, and metadataValueType
+    """
+    composite_key = f"{database_id}:{asset_id}:{file_path}"
+
+    paginator = dynamodb_client.get_paginator('query')
+    page_iterator = paginator.paginate(
+        TableName=table_name,
+        IndexName='DatabaseIdAssetIdFilePathIndex',
+        KeyConditionExpression='#pk = :pkValue',
+        ExpressionAttributeNames={'#pk': 'databaseId:assetId:filePath'},
+        ExpressionAttributeValues={':pkValue': {'S': composite_key}},
+        ScanIndexForward=False
+    ).build_full_result()
+
+    metadata_list = []
+    deserializer = TypeDeserializer()
+    for item in page_iterator.get('Items', []):
+        deserialized_item = {k: deserializer.deserialize(v) for k, v in item.items()}
+        # Normalize field names to metadataKey/metadataValue/metadataValueType
+        if metadata_type == 'attribute':
+            key_field = deserialized_item.get('attributeKey', deserialized_item.get('metadataKey'))
+            value_field = deserialized_item.get('attributeValue', deserialized_item.get('metadataValue'))
+            type_field = deserialized_item.get('attributeValueType', deserialized_item.get('metadataValueType'))
+        else:
+            key_field = deserialized_item['metadataKey']
+            value_field = deserialized_item['metadataValue']
+            type_field = deserialized_item['metadataValueType']
+
+        metadata_list.append({
+            'metadataKey': key_field,
+            'metadataValue': value_field,
+            'metadataValueType': type_field
+        })
+    return metadata_list
+
+
+def enrich_metadata_records(dynamodb_client, schema_table_name: str, database_id: str, entity_type: str,
+                            file_path: Optional[str], metadata_list: List[Dict],
+                            get_database_config: Optional[Callable[[str], Dict]] = None) -> Tuple[List[Dict], bool]:
+    """Enrich metadata records with the schemas of the database and GLOBAL
+
+    Schema fields without a record are added with their default value. If enrichment
+    fails the records are returned unchanged.
+
+    Args:
+        dynamodb_client: DynamoDB client
+        schema_table_name: Metadata schema table name
+        database_id: The database ID
+        entity_type: assetMetadata, fileMetadata, or fileAttribute
+        file_path: File path for extension filtering (file entity types only)
+        metadata_list: Records from query_metadata_records
+        get_database_config: Optional database lookup used to report restrictMetadataOutsideSchemas
+
+    Returns:
+        Tuple of (records, restrictMetadataOutsideSchemas)
+    """
+    try:
+        aggregated_schema = get_aggregated_schemas(
+            database_ids=[database_id, 'GLOBAL'],
+            entity_type=entity_type,
+            file_path=file_path,
+            dynamodb_client=dynamodb_client,
+            schema_table_name=schema_table_name
+        )
+
+        # Calculate restrictMetadataOutsideSchemas
+        restrict_metadata_outside_schemas = False
+        if len(aggregated_schema) > 0 and get_database_config is not None:
+            try:
+                db_config = get_database_config(database_id)
+                restrict_metadata_outside_schemas = db_config.get('restrictMetadataOutsideSchemas', False) == True
+            except Exception as e:
+                logger.warning(f"Error fetching database config for restriction check: {e}")
+                restrict_metadata_outside_schemas = False
+
+        return enrich_metadata_with_schema(metadata_list, aggregated_schema), restrict_metadata_outside_schemas
+    except Exception as e:
+        logger.warning(f"Error enriching metadata with schema: {e}")
+        return metadata_list, False
+
+
+def read_asset_metadata(dynamodb_client, asset_file_metadata_table_name: str, schema_table_name: str,
+                        database_id: str, asset_id: str,
+                        get_database_config: Optional[Callable[[str], Dict]] = None) -> Tuple[List[Dict], bool]:
+    """Read the schema-enriched metadata of an asset
+
+    Returns:
+        Tuple of (records, restrictMetadataOutsideSchemas)
+    """
+    metadata_list = query_metadata_records(
+        dynamodb_client, asset_file_metadata_table_name, database_id, asset_id, ASSET_METADATA_FILE_PATH)
+    return enrich_metadata_records(
+        dynamodb_client, schema_table_name, database_id, 'assetMetadata', None, metadata_list, get_database_config)
+
+
+def read_file_metadata(dynamodb_client, table_name: str, schema_table_name: str, database_id: str,
+                       asset_id: str, file_path: str, metadata_type: str,
+                       get_database_config: Optional[Callable[[str], Dict]] = None) -> Tuple[List[Dict], bool]:
+    """Read the schema-enriched metadata or attributes of a file
+
+    Args:
+        table_name: Asset file metadata table for 'metadata', file attribute table for 'attribute'
+        file_path: The normalized file path (see normalize_metadata_file_path)
+        metadata_type: 'metadata' or 'attribute'
+
+    Returns:
+        Tuple of (records, restrictMetadataOutsideSchemas)
+    """
+    metadata_list = query_metadata_records(
+        dynamodb_client, table_name, database_id, asset_id, file_path, metadata_type)
+    entity_type = 'fileMetadata' if metadata_type == 'metadata' else 'fileAttribute'
+    return enrich_metadata_records(
+        dynamodb_client, schema_table_name, database_id, entity_type, file_path, metadata_list, get_database_config)
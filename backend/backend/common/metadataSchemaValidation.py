@@ -18,13 +18,84 @@ from models.metadata import MetadataValueType
 
 logger = safeLogger(service_name="MetadataSchemaValidation")
 
-# In-memory cache for schemas with 60-second TTL
+# Schema generation counter: a reserved item in the schema table that every schema
+# create/update/delete increments. Cached aggregated schemas are reused until the
+# generation changes, so edits apply on the next generation check in every container.
+SCHEMA_GENERATION_ID = "#schemaGeneration"
+SCHEMA_GENERATION_KEY = {
+    'metadataSchemaId': {'S': SCHEMA_GENERATION_ID},
+    'databaseId:metadataEntityType': {'S': SCHEMA_GENERATION_ID}
+}
+
+# Minimum seconds between generation reads per container (one get_item per interval)
+SCHEMA_GENERATION_CHECK_SECONDS = 1
+
+# Backstop for schema writes made outside the schema service (e.g. deployment defaults)
+SCHEMA_CACHE_MAX_AGE_SECONDS = 900
+
+# In-memory cache of aggregated schemas for the current schema generation
 _schema_cache: Dict[str, Tuple[Any, float]] = {}
-_cache_ttl = 60  # seconds
+_schema_generation = {'value': None, 'checkedAt': 0.0}
+
+
+class AggregatedSchema(dict):
+    """Aggregated schema fields ({fieldName: {field_definition}}) with their compiled validators"""
+    compiled = None
+
+
+def _read_schema_generation(dynamodb_client, schema_table_name: str) -> Optional[int]:
+    """Return the current schema generation, reading it at most once per check interval
+    
+    Clears the schema cache when the generation has changed. Returns None if the
+    generation could not be read, in which case cached schemas are not used.
+    """
+    now = time.time()
+    if _schema_generation['value'] is not None and now - _schema_generation['checkedAt'] < SCHEMA_GENERATION_CHECK_SECONDS:
+        return _schema_generation['value']
+    
+    try:
+        response = dynamodb_client.get_item(
+            TableName=schema_table_name,
+            Key=SCHEMA_GENERATION_KEY,
+            ProjectionExpression='generation',
+            ConsistentRead=True
+        )
+        generation = int(response.get('Item', {}).get('generation', {}).get('N', '0'))
+    except Exception as e:
+        logger.exception(f"Error reading schema generation: {e}")
+        _schema_generation['value'] = None
+        return None
+    
+    if generation != _schema_generation['value']:
+        if _schema_cache:
+            logger.info(f"Schema generation changed to {generation}, clearing {len(_schema_cache)} cached schemas")
+        _schema_cache.clear()
+        _schema_generation['value'] = generation
+    _schema_generation['checkedAt'] = now
+    return generation
+
+
+def bump_schema_generation(dynamodb_client, schema_table_name: str) -> None:
+    """Increment the schema generation after a schema create, update, or delete
+    
+    Failures are logged and not raised: the schema change itself has been saved and
+    cached schemas still expire after SCHEMA_CACHE_MAX_AGE_SECONDS.
+    """
+    _schema_cache.clear()
+    _schema_generation['value'] = None
+    try:
+        dynamodb_client.update_item(
+            TableName=schema_table_name,
+            Key=SCHEMA_GENERATION_KEY,
+            UpdateExpression='ADD generation :one',
+            ExpressionAttributeValues={':one': {'N': '1'}}
+        )
+    except Exception as e:
+        logger.exception(f"Error updating schema generation: {e}")
 
 
 def _get_from_cache(cache_key: str) -> Optional[Dict]:
-    """Get schema from cache if not expired
+    """Get schema from cache if it was cached within the maximum age
     
     Args:
         cache_key: Cache key
@@ -34,7 +105,7 @@ def _get_from_cache(cache_key: str) -> Optional[Dict]:
     """
     if cache_key in _schema_cache:
         cached_data, timestamp = _schema_cache[cache_key]
-        if time.time() - timestamp < _cache_ttl:
+        if time.time() - timestamp < SCHEMA_CACHE_MAX_AGE_SECONDS:
             logger.info(f"Cache hit for key: {cache_key}")
             return cached_data
         else:
@@ -55,6 +126,87 @@ def _set_in_cache(cache_key: str, data: Dict):
     logger.info(f"Cached data for key: {cache_key}")
 
 
+def _depends_on_list(field_def: Dict) -> List[str]:
+    """Return a field's dependsOn keys as a list (single strings are accepted for backward compatibility)"""
+    depends_on_list = field_def.get('dependsOnFieldKeyName')
+    if not depends_on_list:
+        return []
+    if isinstance(depends_on_list, str):
+        return [depends_on_list]
+    return list(depends_on_list)
+
+
+def _compile_dependency_walk(field_name: str, depends_on: Dict[str, List[str]]) -> List[Tuple]:
+    """Flatten the recursive dependsOn check of a field into an ordered list of steps
+    
+    Steps are ('depends', field, dependency) - the dependency must be present and non-empty -
+    and ('cycle', path) for a circular dependency reached through the chain.
+    """
+    steps = []
+    walked = set()
+    
+    def walk(name: str, path: List[str]):
+        if name in path:
+            steps.append(('cycle', ' -> '.join(path + [name])))
+            return
+        if name in walked:
+            return
+        walked.add(name)
+        for depends_on_field in depends_on.get(name, []):
+            steps.append(('depends', name, depends_on_field))
+            walk(depends_on_field, path + [name])
+    
+    walk(field_name, [])
+    return steps
+
+
+def compile_schema(aggregated_schema: Dict[str, Dict]) -> Dict[str, Any]:
+    """Derive the validation rules of an aggregated schema once
+    
+    Args:
+        aggregated_schema: Aggregated schema fields
+        
+    Returns:
+        Dictionary of defaults, required fields, expected types, controlled lists, and dependsOn walks
+    """
+    depends_on = {field_name: _depends_on_list(field_def) for field_name, field_def in aggregated_schema.items()}
+    return {
+        'defaults': {
+            field_name: {
+                'metadataValue': field_def.get('defaultMetadataFieldValue'),
+                'metadataValueType': field_def.get('metadataFieldValueType', 'string')
+            }
+            for field_name, field_def in aggregated_schema.items()
+            if field_def.get('defaultMetadataFieldValue') is not None
+        },
+        'required': [field_name for field_name, field_def in aggregated_schema.items() if field_def.get('required', False)],
+        'types': {
+            field_name: (field_def['metadataFieldValueType'], field_def['metadataFieldValueType'].lower())
+            for field_name, field_def in aggregated_schema.items()
+            if field_def.get('metadataFieldValueType')
+        },
+        'controlledLists': {
+            field_name: field_def.get('controlledListKeys', [])
+            for field_name, field_def in aggregated_schema.items()
+            if (field_def.get('metadataFieldValueType') or '').lower() == 'inline_controlled_list'
+            and field_def.get('controlledListKeys')
+        },
+        'dependencyWalks': {
+            field_name: _compile_dependency_walk(field_name, depends_on)
+            for field_name in aggregated_schema
+            if depends_on[field_name]
+        }
+    }
+
+
+def _compiled(aggregated_schema: Dict[str, Dict]) -> Dict[str, Any]:
+    """Return the compiled validators of an aggregated schema, compiling uncached schemas on demand"""
+    compiled = getattr(aggregated_schema, 'compiled', None)
+    if compiled is None:
+        compiled = compile_schema(aggregated_schema)
+    return compiled
+
+
 def extract_file_extension(file_path: str) -> Optional[str]:
     """Extract file extension from file path
     
@@ -117,10 +269,12 @@ def get_aggregated_schemas(
     extension_key = file_extension if file_extension else "no_ext"
     cache_key = f"{':'.join(sorted(database_ids))}:{entity_type}:{extension_key}"
     
-    # Check cache
-    cached_result = _get_from_cache(cache_key)
-    if cached_result is not None:
-        return cached_result
+    # Check cache (valid for the current schema generation)
+    generation = _read_schema_generation(dynamodb_client, schema_table_name)
+    if generation is not None:
+        cached_result = _get_from_cache(cache_key)
+        if cached_result is not None:
+            return cached_result
     
     # Fetch schemas from DynamoDB
     all_schemas = []
@@ -277,13 +431,14 @@ def get_aggregated_schemas(
             query_successful = False
             # Continue with other databases
     
-    # Aggregate schema fields
-    aggregated_fields = aggregate_schema_fields(all_schemas)
+    # Aggregate schema fields and compile their validators once for this generation
+    aggregated_fields = AggregatedSchema(aggregate_schema_fields(all_schemas))
+    aggregated_fields.compiled = compile_schema(aggregated_fields)
     
     logger.info(f"Aggregated {len(aggregated_fields)} schema fields from {len(all_schemas)} schemas")
     
-    # Only cache if all queries were successful
-    if query_successful:
+    # Only cache if all queries were successful and the generation is known
+    if query_successful and generation is not None:
         _set_in_cache(cache_key, aggregated_fields)
     else:
         logger.warning(f"Not caching results for {cache_key} due to query failures")
@@ -408,6 +563,8 @@ def validate_depends_on_chain(
     2. All fields in dependsOn list have non-empty values
     3. Dependencies don't create circular references
     
+    The recursive walks are compiled once per aggregated schema (see compile_schema).
+    
     Args:
         metadata_dict: Dictionary of metadata {fieldName: {value, valueType}}
         aggregated_schema: Aggregated schema fields
@@ -416,59 +573,31 @@ def validate_depends_on_chain(
         Tuple of (is_valid, error_messages)
     """
     errors = []
-    visited = set()  # Track visited fields to detect circular dependencies
-    
-    def check_field_dependencies(field_name: str, path: List[str]) -> bool:
-        """Recursively check dependencies for a field"""
-        if field_name in path:
-            # Circular dependency detected
-            errors.append(f"Circular dependency detected: {' -> '.join(path + [field_name])}")
-            return False
-        
-        if field_name in visited:
-            return True  # Already validated this field
-        
-        visited.add(field_name)
-        
-        if field_name not in aggregated_schema:
-            return True  # Not a schema field, no dependencies to check
-        
-        depends_on_list = aggregated_schema[field_name].get('dependsOnFieldKeyName')
-        if not depends_on_list:
-            return True  # No dependencies
-        
-        # Handle both list and single string (for backward compatibility)
-        if isinstance(depends_on_list, str):
-            depends_on_list = [depends_on_list]
-        
-        for depends_on_field in depends_on_list:
-            # Check if dependency exists in metadata
-            if depends_on_field not in metadata_dict:
-                errors.append(
-                    f"Field '{field_name}' depends on '{depends_on_field}', "
-                    f"but '{depends_on_field}' is not provided"
-                )
-                return False
-            
-            # Check if dependency has a non-empty value
-            depends_on_value = metadata_dict[depends_on_field].get('metadataValue')
-            if is_empty_value(depends_on_value):
-                errors.append(
-                    f"Field '{field_name}' depends on '{depends_on_field}', "
-                    f"but '{depends_on_field}' is empty"
-                )
-                return False
-            
-            # Recursively check the dependency's dependencies
-            if not check_field_dependencies(depends_on_field, path + [field_name]):
-                return False
-        
-        return True
+    dependency_walks = _compiled(aggregated_schema)['dependencyWalks']
     
     # Check all fields in metadata
     for field_name in metadata_dict.keys():
-        if field_name in aggregated_schema:
-            check_field_dependencies(field_name, [])
+        for step in dependency_walks.get(field_name, []):
+            if step[0] == 'cycle':
+                error = f"Circular dependency detected: {step[1]}"
+            else:
+                _, dependent_field, depends_on_field = step
+                if depends_on_field not in metadata_dict:
+                    error = (
+                        f"Field '{dependent_field}' depends on '{depends_on_field}', "
+                        f"but '{depends_on_field}' is not provided"
+                    )
+                elif is_empty_value(metadata_dict[depends_on_field].get('metadataValue')):
+                    error = (
+                        f"Field '{dependent_field}' depends on '{depends_on_field}', "
+                        f"but '{depends_on_field}' is empty"
+                    )
+                else:
+                    continue
+            # A failed step ends the chain check for this field
+            if error not in errors:
+                errors.append(error)
+            break
     
     is_valid = len(errors) == 0
     return is_valid, errors
@@ -511,37 +640,32 @@ def validate_metadata_against_schema(
     if not aggregated_schema:
         return True, [], metadata_with_defaults
     
+    compiled = _compiled(aggregated_schema)
+    
     # Step 1: Apply default values for missing fields
-    for field_name, field_def in aggregated_schema.items():
+    for field_name, default_item in compiled['defaults'].items():
         if field_name not in metadata_with_defaults:
-            default_value = field_def.get('defaultMetadataFieldValue')
-            if default_value is not None:
-                # Add field with default value
-                metadata_with_defaults[field_name] = {
-                    'metadataValue': default_value,
-                    'metadataValueType': field_def.get('metadataFieldValueType', 'string')
-                }
-                logger.info(f"Applied default value for field '{field_name}': {default_value}")
+            metadata_with_defaults[field_name] = dict(default_item)
+            logger.info(f"Applied default value for field '{field_name}': {default_item['metadataValue']}")
     
     # Step 2: Validate required fields
-    for field_name, field_def in aggregated_schema.items():
-        if field_def.get('required', False):
-            if field_name not in metadata_with_defaults:
-                errors.append(f"Required field '{field_name}' is missing")
-            else:
-                field_value = metadata_with_defaults[field_name].get('metadataValue')
-                if is_empty_value(field_value):
-                    errors.append(f"Required field '{field_name}' cannot be empty")
+    for field_name in compiled['required']:
+        if field_name not in metadata_with_defaults:
+            errors.append(f"Required field '{field_name}' is missing")
+        else:
+            field_value = metadata_with_defaults[field_name].get('metadataValue')
+            if is_empty_value(field_value):
+                errors.append(f"Required field '{field_name}' cannot be empty")
     
     # Step 3: Validate field value types and prevent type changes
+    expected_types = compiled['types']
     for field_name, metadata_item in metadata_with_defaults.items():
-        if field_name in aggregated_schema:
-            expected_type = aggregated_schema[field_name].get('metadataFieldValueType')
+        if field_name in expected_types:
+            expected_type, expected_type_normalized = expected_types[field_name]
             actual_type = metadata_item.get('metadataValueType')
             
-            if expected_type and actual_type:
+            if actual_type:
                 # Normalize types for comparison
-                expected_type_normalized = expected_type.lower()
                 actual_type_normalized = actual_type.lower() if isinstance(actual_type, str) else actual_type
                 
                 if expected_type_normalized != actual_type_normalized:
@@ -569,20 +693,14 @@ def validate_metadata_against_schema(
         errors.extend(depends_errors)
     
     # Step 5: Validate controlled list values (NEW)
-    for field_name, metadata_item in metadata_with_defaults.items():
-        if field_name in aggregated_schema:
-            schema_def = aggregated_schema[field_name]
-            value_type = schema_def.get('metadataFieldValueType')
-            
-            if value_type and value_type.lower() == 'inline_controlled_list':
-                controlled_list = schema_def.get('controlledListKeys', [])
-                actual_value = metadata_item.get('metadataValue')
-                
-                if controlled_list and actual_value not in controlled_list:
-                    errors.append(
-                        f"Field '{field_name}' value '{actual_value}' is not in "
-                        f"controlled list: {controlled_list}"
-                    )
+    for field_name, controlled_list in compiled['controlledLists'].items():
+        if field_name in metadata_with_defaults:
+            actual_value = metadata_with_defaults[field_name].get('metadataValue')
+            if actual_value not in controlled_list:
+                errors.append(
+                    f"Field '{field_name}' value '{actual_value}' is not in "
+                    f"controlled list: {controlled_list}"
+                )
     
     is_valid = len(errors) == 0
     return is_valid, errors, metadata_with_defaults
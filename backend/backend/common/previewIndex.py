@@ -0,0 +1,242 @@
+#  Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#  SPDX-License-Identifier: Apache-2.0
+
+"""
+Preview-existence index.
+
+Keeps a DynamoDB record per base file (``{bucket}:{baseFileKey}``) listing the
+``{baseFileKey}.previewFile.{ext}`` siblings that currently exist in S3. The
+record is maintained by the bucket sync S3 event path so preview lookups are a
+single key read instead of an S3 prefix listing.
+
+Lookups return ``None`` when the index cannot answer (table not configured, no
+record yet for the base file, or a read error) so callers fall back to listing.
+"""
+
+import os
+import boto3
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from botocore.exceptions import ClientError
+from customLogging.logger import safeLogger
+
+logger = safeLogger(service_name="PreviewIndexCommon")
+dynamodb = boto3.resource('dynamodb')
+
+PREVIEW_FILE_MARKER = '.previewFile.'
+ALLOWED_PREVIEW_FILE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.svg', '.gif']
+
+_preview_index_table = None
+
+
+def get_preview_index_table():
+    """Return the preview index table resource, or None when the index is not configured"""
+    global _preview_index_table
+    if _preview_index_table is None:
+        table_name = os.environ.get("PREVIEW_INDEX_STORAGE_TABLE_NAME")
+        if table_name:
+            _preview_index_table = dynamodb.Table(table_name)
+    return _preview_index_table
+
+
+def build_index_key(bucket: str, base_key: str) -> str:
+    """Build the partition key value for a base file (bucket names cannot contain ':')"""
+    return f"{bucket}:{base_key}"
+
+
+def get_base_key_for_preview(preview_key: str) -> Optional[str]:
+    """Return the base file key for a preview file key, or None if the key is not a preview file
+
+    Args:
+        preview_key: S3 key such as ``asset/model.glb.previewFile.gif``
+
+    Returns:
+        The base file key (``asset/model.glb``) or None
+    """
+    if not preview_key or PREVIEW_FILE_MARKER not in preview_key:
+        return None
+
+    base_key, extension = preview_key.rsplit(PREVIEW_FILE_MARKER, 1)
+    if not base_key or base_key.endswith('/'):
+        return None
+    if '.' + extension.lower() not in ALLOWED_PREVIEW_FILE_EXTENSIONS:
+        return None
+    return base_key
+
+
+def _event_time_or_now(event_time: Optional[str]) -> str:
+    return event_time or datetime.now(timezone.utc).isoformat()
+
+
+def record_base_file_created(bucket: str, base_key: str, preview_keys: List[str],
+                             event_time: Optional[str] = None) -> None:
+    """Create or refresh the index record for a base file
+
+    ``preview_keys`` is the authoritative set of preview siblings at the time of the
+    event (listed once by the caller), which also backfills previews that existed
+    before the index was introduced.
+    """
+    table = get_preview_index_table()
+    if table is None:
+        return
+
+    try:
+        update_expression = "SET #baseKey = :baseKey, #bucket = :bucket, #baseUpdated = :updated"
+        attribute_names = {
+            '#baseKey': 'baseFileKey',
+            '#bucket': 'bucketName',
+            '#baseUpdated': 'baseFileUpdatedAt',
+            '#previews': 'previewFileKeys',
+        }
+        attribute_values = {
+            ':baseKey': base_key,
+            ':bucket': bucket,
+            ':updated': _event_time_or_now(event_time),
+        }
+
+        if preview_keys:
+            update_expression += ", #previews = :previews"
+            attribute_values[':previews'] = set(preview_keys)
+        else:
+            # DynamoDB does not allow empty sets; an absent attribute means "no previews"
+            update_expression += " REMOVE #previews"
+
+        table.update_item(
+            Key={'bucketName:baseFileKey': build_index_key(bucket, base_key)},
+            UpdateExpression=update_expression,
+            ExpressionAttributeNames=attribute_names,
+            ExpressionAttributeValues=attribute_values
+        )
+    except Exception as e:
+        logger.warning(f"Error updating preview index for base file {base_key}: {e}")
+
+
+def record_base_file_deleted(bucket: str, base_key: str) -> None:
+    """Drop the index record for a deleted base file (lookups fall back to listing)"""
+    table = get_preview_index_table()
+    if table is None:
+        return
+
+    try:
+        table.delete_item(Key={'bucketName:baseFileKey': build_index_key(bucket, base_key)})
+    except Exception as e:
+        logger.warning(f"Error removing preview index record for base file {base_key}: {e}")
+
+
+def record_preview_file_created(bucket: str, preview_key: str, event_time: Optional[str] = None) -> None:
+    """Add a preview file to its base file's index record"""
+    table = get_preview_index_table()
+    base_key = get_base_key_for_preview(preview_key)
+    if table is None or not base_key:
+        return
+
+    try:
+        table.update_item(
+            Key={'bucketName:baseFileKey': build_index_key(bucket, base_key)},
+            UpdateExpression="SET #baseKey = :baseKey, #bucket = :bucket, #previewUpdated = :updated ADD #previews :preview",
+            ExpressionAttributeNames={
+                '#baseKey': 'baseFileKey',
+                '#bucket': 'bucketName',
+                '#previewUpdated': 'previewUpdatedAt',
+                '#previews': 'previewFileKeys',
+            },
+            ExpressionAttributeValues={
+                ':baseKey': base_key,
+                ':bucket': bucket,
+                ':updated': _event_time_or_now(event_time),
+                ':preview': {preview_key},
+            }
+        )
+    except Exception as e:
+        logger.warning(f"Error adding preview file {preview_key} to preview index: {e}")
+
+
+def record_preview_file_deleted(bucket: str, preview_key: str) -> None:
+    """Remove a preview file from its base file's index record"""
+    table = get_preview_index_table()
+    base_key = get_base_key_for_preview(preview_key)
+    if table is None or not base_key:
+        return
+
+    try:
+        table.update_item(
+            Key={'bucketName:baseFileKey': build_index_key(bucket, base_key)},
+            UpdateExpression="DELETE #previews :preview",
+            ConditionExpression="attribute_exists(#pk)",
+            ExpressionAttributeNames={
+                '#pk': 'bucketName:baseFileKey',
+                '#previews': 'previewFileKeys',
+            },
+            ExpressionAttributeValues={
+                ':preview': {preview_key},
+            }
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            logger.warning(f"Error removing preview file {preview_key} from preview index: {e}")
+    except Exception as e:
+        logger.warning(f"Error removing preview file {preview_key} from preview index: {e}")
+
+
+def get_preview_index_record(bucket: str, base_key: str) -> Optional[Dict]:
+    """Read the index record for a base file, or None if the index cannot answer"""
+    table = get_preview_index_table()
+    if table is None or not base_key:
+        return None
+
+    try:
+        response = table.get_item(Key={'bucketName:baseFileKey': build_index_key(bucket, base_key)})
+        return response.get('Item')
+    except Exception as e:
+        logger.warning(f"Error reading preview index for base file {base_key}: {e}")
+        return None
+
+
+def lookup_preview_file_keys(bucket: str, base_key: str) -> Optional[List[str]]:
+    """Return the sorted preview file keys for a base file
+
+    Returns:
+        List of preview keys (possibly empty) when the index has a record for the
+        base file, or None when the caller should fall back to an S3 listing
+    """
+    record = get_preview_index_record(bucket, base_key)
+    if record is None:
+        return None
+    return sorted(record.get('previewFileKeys', set()))
+
+
+def _parse_timestamp(value) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (S3 event times end in 'Z') into an aware datetime"""
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def is_preview_up_to_date(record: Optional[Dict], base_file_last_modified: Optional[datetime] = None) -> bool:
+    """Check whether an index record has a preview written after the last base file write
+
+    Args:
+        record: Index record from get_preview_index_record
+        base_file_last_modified: Current S3 LastModified of the base file. When given it is used
+            instead of the record's baseFileUpdatedAt, which bucket sync updates asynchronously.
+    """
+    if not record or not record.get('previewFileKeys'):
+        return False
+
+    preview_updated = _parse_timestamp(record.get('previewUpdatedAt')) if record.get('previewUpdatedAt') else None
+    if not preview_updated:
+        # Only backfilled previews, which predate the current base file write
+        return False
+
+    if base_file_last_modified is not None:
+        base_updated = _parse_timestamp(base_file_last_modified)
+    elif record.get('baseFileUpdatedAt'):
+        base_updated = _parse_timestamp(record['baseFileUpdatedAt'])
+    else:
+        return True
+    return base_updated is not None and preview_updated >= base_updated
@@ -4,12 +4,19 @@
 import os
 import boto3
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Optional
+from botocore.config import Config
 from common.validators import validate
 from customLogging.logger import safeLogger
 from common.constants import UNALLOWED_MIME_LIST, UNALLOWED_FILE_EXTENSION_LIST
 
 logger = safeLogger(service_name="S3Common")
-s3c = boto3.client('s3')
+
+#Maximum concurrent HEAD requests when validating object content types
+MAX_CONTENT_TYPE_VALIDATION_WORKERS = 16
+
+s3c = boto3.client('s3', config=Config(max_pool_connections=MAX_CONTENT_TYPE_VALIDATION_WORKERS))
 
 def validateUnallowedFileExtensionAndContentType(keyPath: str, contentType: str):
     #Check if the content type is in the list of unallowed MIME types
@@ -23,17 +30,54 @@ def validateUnallowedFileExtensionAndContentType(keyPath: str, contentType: str)
         return False
     return True
 
-def validateS3AssetExtensionsAndContentType(bucket: str, prefixKey: str):
-    #Get list of all objects in a particular S3 key/prefix
-    resp = s3c.list_objects_v2(Bucket=bucket, Prefix=prefixKey)
-    logger.info(resp)
-
-    #Check for each returned object if it is a valid asset based on ContentType
-    #Check for all malicious executable MIME types
-    if "Contents" in resp:
-        for obj in resp['Contents']:
-            respHeader = s3c.head_object(Bucket=bucket, Key=obj['Key'])
-            logger.info(respHeader)
-            if not validateUnallowedFileExtensionAndContentType(obj['Key'], respHeader['ContentType']):
+def _isUnallowedFileExtension(keyPath: str) -> bool:
+    extension = os.path.splitext(keyPath)[1]
+    return bool(extension) and extension in UNALLOWED_FILE_EXTENSION_LIST
+
+def _validateObjectContentType(bucket: str, key: str) -> bool:
+    respHeader = s3c.head_object(Bucket=bucket, Key=key)
+    return validateUnallowedFileExtensionAndContentType(key, respHeader.get('ContentType', ''))
+
+def validateS3AssetExtensionsAndContentType(bucket: str, prefixKey: str, keys: Optional[Iterable[str]] = None):
+    """Validate that no object under a key/prefix has an unallowed file extension or content type
+
+    Extensions are checked straight from the listing (or the provided keys) and reject without any
+    HEAD request. Only the remaining keys are HEADed for their ContentType, concurrently through a
+    bounded pool that stops at the first violation.
+
+    Args:
+        bucket: The S3 bucket name
+        prefixKey: The S3 key/prefix to list when keys are not provided
+        keys: Optional set of just-written object keys to validate instead of listing the prefix
+
+    Returns:
+        True if all objects are allowed, False otherwise
+    """
+    if keys is None:
+        #Get list of all objects in a particular S3 key/prefix
+        keys = []
+        paginator = s3c.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefixKey):
+            keys.extend(obj['Key'] for obj in page.get('Contents', []))
+    keys = list(dict.fromkeys(keys))
+
+    #Reject on file extension from the key alone
+    for key in keys:
+        if _isUnallowedFileExtension(key):
+            logger.error(f"Unallowed file extension detected in asset: {key}")
+            return False
+
+    if not keys:
+        return True
+
+    #Check each remaining object's ContentType for malicious executable MIME types
+    executor = ThreadPoolExecutor(max_workers=min(MAX_CONTENT_TYPE_VALIDATION_WORKERS, len(keys)))
+    try:
+        futures = [executor.submit(_validateObjectContentType, bucket, key) for key in keys]
+        for future in as_completed(futures):
+            if not future.result():
                 return False
-    return True
\ No newline at end of file
+    finally:
+        #Stop early: drop HEAD requests that have not started yet
+        executor.shutdown(wait=True, cancel_futures=True)
+    return True
@@ -0,0 +1,201 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tag catalog cache for VAMS.
+
+The tag and tag type tables are small but read by almost every asset create/edit form
+and search facet. This module loads both tables once per catalog generation and keeps
+the joined views in memory for the life of the container:
+- tags sorted by name, with their tag type
+- tag types with the names of their tags
+- tags labelled with " [R]" when their tag type is required
+- required tag types that have tags
+"""
+
+import base64
+import bisect
+import json
+import time
+from typing import Any, Dict, List, Optional
+from boto3.dynamodb.types import TypeDeserializer
+from customLogging.logger import safeLogger
+from models.common import VAMSGeneralErrorResponse
+
+logger = safeLogger(service_name="TagCatalog")
+
+# Catalog generation counter: a reserved item in the tag types table that every tag and
+# tag type create/update/delete increments. The cached catalog is reused until the
+# generation changes, so edits apply on the next generation check in every container.
+TAG_CATALOG_GENERATION_ID = "#tagCatalogGeneration"
+TAG_CATALOG_GENERATION_KEY = {'tagTypeName': {'S': TAG_CATALOG_GENERATION_ID}}
+
+# Minimum seconds between generation reads per container (one get_item per interval)
+TAG_CATALOG_GENERATION_CHECK_SECONDS = 1
+
+# Backstop for tag writes made outside the tag services
+TAG_CATALOG_MAX_AGE_SECONDS = 900
+
+# Tag table index on tagTypeName, used to check whether a tag type is in use
+TAG_TYPE_NAME_INDEX = "TagTypeNameIndex"
+
+# In-memory catalog for the current catalog generation
+_catalog_cache = {'catalog': None, 'generation': None, 'loadedAt': 0.0, 'checkedAt': 0.0}
+
+_deserializer = TypeDeserializer()
+
+
+class TagCatalog:
+    """Tags and tag types joined once per catalog generation"""
+
+    def __init__(self, tag_items: List[Dict[str, Any]], tag_type_items: List[Dict[str, Any]]):
+        self.tags = sorted(tag_items, key=lambda tag: tag['tagName'])
+        self.tag_names = [tag['tagName'] for tag in self.tags]
+        self.tag_type_by_tag = {tag['tagName']: tag.get('tagTypeName') for tag in self.tags}
+
+        tags_by_type: Dict[str, List[str]] = {}
+        for tag in self.tags:
+            if tag.get('tagTypeName'):
+                tags_by_type.setdefault(tag['tagTypeName'], []).append(tag['tagName'])
+
+        self.tag_types = sorted(({
+            'tagTypeName': tag_type['tagTypeName'],
+            'description': tag_type.get('description'),
+            'required': tag_type.get('required', 'False'),
+            'tags': tags_by_type.get(tag_type['tagTypeName'], []),
+        } for tag_type in tag_type_items), key=lambda tag_type: tag_type['tagTypeName'])
+        self.tag_type_names = [tag_type['tagTypeName'] for tag_type in self.tag_types]
+
+        required_types = {tag_type['tagTypeName'] for tag_type in self.tag_types if tag_type['required'] == 'True'}
+        self.display_tags = []
+        for tag in self.tags:
+            display_tag = dict(tag)
+            if tag.get('tagTypeName') in required_types:
+                display_tag['tagTypeName'] = tag['tagTypeName'] + " [R]"
+            self.display_tags.append(display_tag)
+
+        # Required tag types only apply to assets when tags of that type exist
+        self.required_tag_types = [tag_type['tagTypeName'] for tag_type in self.tag_types
+                                   if tag_type['required'] == 'True' and tag_type['tags']]
+
+
+def _read_catalog_generation(dynamodb_client, tag_type_table_name: str) -> Optional[int]:
+    """Return the current catalog generation, reading it at most once per check interval
+
+    Returns None if the generation could not be read, in which case the cached catalog is not used.
+    """
+    now = time.time()
+    if _catalog_cache['generation'] is not None and now - _catalog_cache['checkedAt'] < TAG_CATALOG_GENERATION_CHECK_SECONDS:
+        return _catalog_cache['generation']
+
+    try:
+        response = dynamodb_client.get_item(
+            TableName=tag_type_table_name,
+            Key=TAG_CATALOG_GENERATION_KEY,
+            ProjectionExpression='generation',
+            ConsistentRead=True
+        )
+        generation = int(response.get('Item', {}).get('generation', {}).get('N', '0'))
+    except Exception as e:
+        logger.exception(f"Error reading tag catalog generation: {e}")
+        _catalog_cache['generation'] = None
+        return None
+
+    if generation != _catalog_cache['generation']:
+        if _catalog_cache['catalog'] is not None:
+            logger.info(f"Tag catalog generation changed to {generation}, reloading catalog")
+        _catalog_cache['catalog'] = None
+        _catalog_cache['generation'] = generation
+    _catalog_cache['checkedAt'] = now
+    return generation
+
+
+def bump_tag_catalog_generation(dynamodb_client, tag_type_table_name: str) -> None:
+    """Increment the catalog generation after a tag or tag type create, update, or delete
+
+    Failures are logged and not raised: the tag change itself has been saved and the
+    cached catalog still expires after TAG_CATALOG_MAX_AGE_SECONDS.
+    """
+    _catalog_cache['catalog'] = None
+    _catalog_cache['generation'] = None
+    try:
+        dynamodb_client.update_item(
+            TableName=tag_type_table_name,
+            Key=TAG_CATALOG_GENERATION_KEY,
+            UpdateExpression='ADD generation :one',
+            ExpressionAttributeValues={':one': {'N': '1'}}
+        )
+    except Exception as e:
+        logger.exception(f"Error updating tag catalog generation: {e}")
+
+
+def _scan_all(dynamodb_client, table_name: str) -> List[Dict[str, Any]]:
+    """Scan and deserialize every item of a table"""
+    items = []
+    scan_params = {'TableName': table_name}
+    while True:
+        response = dynamodb_client.scan(**scan_params)
+        for item in response.get('Items', []):
+            items.append({k: _deserializer.deserialize(v) for k, v in item.items()})
+        if 'LastEvaluatedKey' not in response:
+            return items
+        scan_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def get_tag_catalog(dynamodb_client, tag_table_name: str, tag_type_table_name: str) -> TagCatalog:
+    """Get the tag catalog, loading both tag tables only when the catalog generation changed
+
+    Args:
+        dynamodb_client: DynamoDB client
+        tag_table_name: Tag table name
+        tag_type_table_name: Tag type table name (holds the catalog generation item)
+
+    Returns:
+        TagCatalog for the current generation
+    """
+    generation = _read_catalog_generation(dynamodb_client, tag_type_table_name)
+    catalog = _catalog_cache['catalog']
+    if (generation is not None and catalog is not None
+            and time.time() - _catalog_cache['loadedAt'] < TAG_CATALOG_MAX_AGE_SECONDS):
+        return catalog
+
+    tag_types = [tag_type for tag_type in _scan_all(dynamodb_client, tag_type_table_name)
+                 if tag_type.get('tagTypeName') != TAG_CATALOG_GENERATION_ID]
+    catalog = TagCatalog(_scan_all(dynamodb_client, tag_table_name), tag_types)
+    logger.info(f"Loaded tag catalog with {len(catalog.tags)} tags and {len(catalog.tag_types)} tag types")
+
+    # Only cache when the generation is known, so a failed read never pins a stale catalog
+    if generation is not None:
+        _catalog_cache['catalog'] = catalog
+        _catalog_cache['loadedAt'] = time.time()
+    return catalog
+
+
+def paginate_catalog_items(items: List[Dict[str, Any]], sort_keys: List[str], query_params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return one page of a sorted catalog view
+
+    Args:
+        items: Catalog view, sorted by sort_keys
+        sort_keys: Sort key of each item (tagName or tagTypeName)
+        query_params: Pagination parameters (maxItems, startingToken)
+
+    Returns:
+        Dictionary with Items (copies of the catalog items) and NextToken when more items remain
+
+    Raises:
+        VAMSGeneralErrorResponse: If the startingToken is not a catalog cursor
+    """
+    start = 0
+    if query_params.get('startingToken'):
+        try:
+            last_key = json.loads(base64.b64decode(query_params['startingToken']).decode('utf-8'))['last']
+        except (json.JSONDecodeError, base64.binascii.Error, UnicodeDecodeError, KeyError, TypeError) as e:
+            logger.exception(f"Invalid startingToken format: {e}")
+            raise VAMSGeneralErrorResponse("Invalid pagination token")
+        start = bisect.bisect_right(sort_keys, last_key)
+
+    end = start + int(query_params['maxItems'])
+    result = {'Items': [dict(item) for item in items[start:end]]}
+    if end < len(items):
+        json_str = json.dumps({'last': sort_keys[end - 1]})
+        result['NextToken'] = base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
+    return result
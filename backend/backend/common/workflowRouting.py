@@ -0,0 +1,126 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Workflow routing cache for VAMS.
+
+Auto-triggered workflow executions route every uploaded file against the workflows of
+the asset's database and the GLOBAL workflows. This module keeps the workflows of each
+database in memory for the life of the container and reloads them only when the
+workflow routing generation changes.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+from boto3.dynamodb.types import TypeDeserializer
+from customLogging.logger import safeLogger
+
+logger = safeLogger(service_name="WorkflowRouting")
+
+# Workflow routing generation counter: a reserved item in the workflow table that every
+# workflow create/update/delete increments. Cached workflows are reused until the
+# generation changes, so edits apply on the next generation check in every container.
+WORKFLOW_ROUTING_GENERATION_ID = "#workflowRoutingGeneration"
+WORKFLOW_ROUTING_GENERATION_KEY = {
+    'databaseId': {'S': WORKFLOW_ROUTING_GENERATION_ID},
+    'workflowId': {'S': WORKFLOW_ROUTING_GENERATION_ID}
+}
+
+# Minimum seconds between generation reads per container (one get_item per interval)
+WORKFLOW_ROUTING_GENERATION_CHECK_SECONDS = 1
+
+# Backstop for workflow writes made outside the workflow services
+WORKFLOW_ROUTING_MAX_AGE_SECONDS = 900
+
+# In-memory workflows per database for the current routing generation
+_workflow_cache: Dict[str, Dict[str, Any]] = {}
+_routing_generation = {'value': None, 'checkedAt': 0.0}
+
+_deserializer = TypeDeserializer()
+
+
+def _read_routing_generation(dynamodb_client, workflow_table_name: str) -> Optional[int]:
+    """Return the current routing generation, reading it at most once per check interval
+
+    Clears the workflow cache when the generation has changed. Returns None if the
+    generation could not be read, in which case cached workflows are not used.
+    """
+    now = time.time()
+    if _routing_generation['value'] is not None and now - _routing_generation['checkedAt'] < WORKFLOW_ROUTING_GENERATION_CHECK_SECONDS:
+        return _routing_generation['value']
+
+    try:
+        response = dynamodb_client.get_item(
+            TableName=workflow_table_name,
+            Key=WORKFLOW_ROUTING_GENERATION_KEY,
+            ProjectionExpression='generation',
+            ConsistentRead=True
+        )
+        generation = int(response.get('Item', {}).get('generation', {}).get('N', '0'))
+    except Exception as e:
+        logger.exception(f"Error reading workflow routing generation: {e}")
+        _routing_generation['value'] = None
+        return None
+
+    if generation != _routing_generation['value']:
+        if _workflow_cache:
+            logger.info(f"Workflow routing generation changed to {generation}, clearing {len(_workflow_cache)} cached databases")
+        _workflow_cache.clear()
+        _routing_generation['value'] = generation
+    _routing_generation['checkedAt'] = now
+    return generation
+
+
+def bump_workflow_routing_generation(dynamodb_client, workflow_table_name: str) -> None:
+    """Increment the routing generation after a workflow create, update, or delete
+
+    Failures are logged and not raised: the workflow change itself has been saved and
+    cached workflows still expire after WORKFLOW_ROUTING_MAX_AGE_SECONDS.
+    """
+    _workflow_cache.clear()
+    _routing_generation['value'] = None
+    try:
+        dynamodb_client.update_item(
+            TableName=workflow_table_name,
+            Key=WORKFLOW_ROUTING_GENERATION_KEY,
+            UpdateExpression='ADD generation :one',
+            ExpressionAttributeValues={':one': {'N': '1'}}
+        )
+    except Exception as e:
+        logger.exception(f"Error updating workflow routing generation: {e}")
+
+
+def get_database_workflows(dynamodb_client, workflow_table_name: str, database_id: str) -> List[Dict[str, Any]]:
+    """Get the workflows of a database, querying the workflow table only when the routing generation changed
+
+    Args:
+        dynamodb_client: DynamoDB client
+        workflow_table_name: Workflow table name (holds the routing generation item)
+        database_id: Database ID, or GLOBAL for global workflows
+
+    Returns:
+        List of deserialized workflow items
+    """
+    generation = _read_routing_generation(dynamodb_client, workflow_table_name)
+    cached = _workflow_cache.get(database_id)
+    if (generation is not None and cached is not None
+            and time.time() - cached['loadedAt'] < WORKFLOW_ROUTING_MAX_AGE_SECONDS):
+        return cached['workflows']
+
+    workflows = []
+    query_params = {
+        'TableName': workflow_table_name,
+        'KeyConditionExpression': 'databaseId = :databaseId',
+        'ExpressionAttributeValues': {':databaseId': {'S': database_id}}
+    }
+    while True:
+        response = dynamodb_client.query(**query_params)
+        for item in response.get('Items', []):
+            workflows.append({k: _deserializer.deserialize(v) for k, v in item.items()})
+        if 'LastEvaluatedKey' not in response:
+            break
+        query_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    # Only cache when the generation is known, so a failed read never pins stale workflows
+    if generation is not None:
+        _workflow_cache[database_id] = {'workflows': workflows, 'loadedAt': time.time()}
+    return workflows
@@ -23,6 +23,7 @@ from aws_lambda_powertools.utilities.parser import parse, ValidationError
 from customLogging.logger import safeLogger
 from common.validators import validate
 from models.common import VAMSGeneralErrorResponse
+from handlers.addon.garnetFramework.garnetIngestion import GarnetIngestionBatcher
 
 # Helper function to convert Decimal to int/float for JSON serialization
 def decimal_to_number(obj):
@@ -57,6 +58,12 @@ except Exception as e:
     logger.exception("Failed loading environment variables")
     raise e
 
+# Buffers NGSI-LD entities and sends them to the Garnet ingestion queue in batches
+garnet_batcher = GarnetIngestionBatcher(sqs, garnet_ingestion_queue_url, 'vams-asset-indexer')
+
+# Time left for flushing when a bulk resync stops to return its resume position
+RESYNC_TIME_RESERVE_MS = 60 * 1000
+
 # Initialize DynamoDB tables
 asset_storage_table = dynamodb.Table(asset_storage_table_name)
 asset_file_metadata_table = dynamodb.Table(asset_file_metadata_storage_table_name)
@@ -112,50 +119,90 @@ def get_asset_link_metadata(asset_link_id: str) -> Dict[str, Any]:
         logger.exception(f"Error getting asset link metadata for {asset_link_id}: {e}")
         return {}
 
-def get_all_asset_links_for_asset(database_id: str, asset_id: str) -> List[str]:
+def query_asset_links(database_id: str, asset_id: str) -> List[Dict[str, Any]]:
     """
-    Get all asset link IDs where this asset is either 'from' or 'to'.
-    Returns list of asset link IDs to re-index.
+    Get the links where this asset is either 'from' or 'to', with one paginated query per GSI.
     
     Args:
         database_id: The database ID
         asset_id: The asset ID
         
     Returns:
-        List of asset link IDs
+        List of {'assetLinkId', 'relationshipType', 'direction'} where direction is 'from' or 'to'
     """
-    try:
-        asset_key = f"{database_id}:{asset_id}"
-        asset_link_ids = []
-        
-        # Get links where this asset is the 'from' asset
-        from_response = asset_links_table.query(
-            IndexName='fromAssetGSI',
-            KeyConditionExpression=Key('fromAssetDatabaseId:fromAssetId').eq(asset_key)
-        )
-        
-        for item in from_response.get('Items', []):
-            link_id = item.get('assetLinkId')
-            if link_id:
-                asset_link_ids.append(link_id)
-        
-        # Get links where this asset is the 'to' asset
-        to_response = asset_links_table.query(
-            IndexName='toAssetGSI',
-            KeyConditionExpression=Key('toAssetDatabaseId:toAssetId').eq(asset_key)
-        )
-        
-        for item in to_response.get('Items', []):
-            link_id = item.get('assetLinkId')
-            if link_id and link_id not in asset_link_ids:  # Avoid duplicates
-                asset_link_ids.append(link_id)
-        
-        logger.info(f"Found {len(asset_link_ids)} asset links for asset {database_id}/{asset_id}")
-        return asset_link_ids
-        
-    except Exception as e:
-        logger.exception(f"Error getting asset links for {database_id}/{asset_id}: {e}")
-        return []
+    asset_key = f"{database_id}:{asset_id}"
+    links = []
+    
+    for direction, index_name, key_name in [
+        ('from', 'fromAssetGSI', 'fromAssetDatabaseId:fromAssetId'),
+        ('to', 'toAssetGSI', 'toAssetDatabaseId:toAssetId'),
+    ]:
+        query_kwargs = {
+            'IndexName': index_name,
+            'KeyConditionExpression': Key(key_name).eq(asset_key),
+            'ProjectionExpression': 'assetLinkId, relationshipType',
+        }
+        while True:
+            response = asset_links_table.query(**query_kwargs)
+            for item in response.get('Items', []):
+                links.append({
+                    'assetLinkId': item.get('assetLinkId'),
+                    'relationshipType': item.get('relationshipType'),
+                    'direction': direction
+                })
+            if 'LastEvaluatedKey' not in response:
+                break
+            query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    return links
+
+def relationship_flags_from_links(links: List[Dict[str, Any]]) -> Dict[str, bool]:
+    """Compute asset relationship flags (children, parents, related) from the asset's links"""
+    return {
+        'has_children': any(link['direction'] == 'from' and link['relationshipType'] == 'parentChild' for link in links),
+        'has_parents': any(link['direction'] == 'to' and link['relationshipType'] == 'parentChild' for link in links),
+        'has_related': any(link['relationshipType'] == 'related' for link in links)
+    }
+
+def build_relationship_flags_index() -> Dict[str, Dict[str, bool]]:
+    """
+    Compute relationship flags for all assets with a single scan of the asset links table.
+    Used by bulk resyncs instead of querying the links of every asset.
+    
+    Returns:
+        Dictionary of "databaseId:assetId" to relationship flags, for assets with links
+    """
+    flags_index: Dict[str, Dict[str, bool]] = {}
+    
+    def flags_for(asset_key: str) -> Dict[str, bool]:
+        return flags_index.setdefault(asset_key, {'has_children': False, 'has_parents': False, 'has_related': False})
+    
+    scan_kwargs = {
+        'ProjectionExpression': '#fromKey, #toKey, relationshipType',
+        'ExpressionAttributeNames': {
+            '#fromKey': 'fromAssetDatabaseId:fromAssetId',
+            '#toKey': 'toAssetDatabaseId:toAssetId'
+        }
+    }
+    while True:
+        response = asset_links_table.scan(**scan_kwargs)
+        for item in response.get('Items', []):
+            from_key = item.get('fromAssetDatabaseId:fromAssetId')
+            to_key = item.get('toAssetDatabaseId:toAssetId')
+            if not from_key or not to_key:
+                continue
+            if item.get('relationshipType') == 'parentChild':
+                flags_for(from_key)['has_children'] = True
+                flags_for(to_key)['has_parents'] = True
+            elif item.get('relationshipType') == 'related':
+                flags_for(from_key)['has_related'] = True
+                flags_for(to_key)['has_related'] = True
+        if 'LastEvaluatedKey' not in response:
+            break
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    
+    logger.info(f"Built relationship flags for {len(flags_index)} linked assets")
+    return flags_index
 
 #######################
 # NGSI-LD Conversion Functions
@@ -749,46 +796,7 @@ def get_asset_version_info(database_id: str, asset_id: str) -> Dict[str, Any]:
 def get_asset_relationship_flags(database_id: str, asset_id: str) -> Dict[str, bool]:
     """Get asset relationship flags (children, parents, related)"""
     try:
-        asset_key = f"{database_id}:{asset_id}"
-        
-        # Check for children (where this asset is the 'from' in parentChild relationships)
-        children_response = asset_links_table.query(
-            IndexName='fromAssetGSI',
-            KeyConditionExpression=Key('fromAssetDatabaseId:fromAssetId').eq(asset_key),
-            FilterExpression=boto3.dynamodb.conditions.Attr('relationshipType').eq('parentChild'),
-        )
-        has_children = len(children_response.get('Items', [])) > 0
-        
-        # Check for parents (where this asset is the 'to' in parentChild relationships)
-        parents_response = asset_links_table.query(
-            IndexName='toAssetGSI',
-            KeyConditionExpression=Key('toAssetDatabaseId:toAssetId').eq(asset_key),
-            FilterExpression=boto3.dynamodb.conditions.Attr('relationshipType').eq('parentChild'),
-        )
-        has_parents = len(parents_response.get('Items', [])) > 0
-        
-        # Check for related assets (where this asset is in 'related' relationships)
-        related_from_response = asset_links_table.query(
-            IndexName='fromAssetGSI',
-            KeyConditionExpression=Key('fromAssetDatabaseId:fromAssetId').eq(asset_key),
-            FilterExpression=boto3.dynamodb.conditions.Attr('relationshipType').eq('related'),
-        )
-        
-        related_to_response = asset_links_table.query(
-            IndexName='toAssetGSI',
-            KeyConditionExpression=Key('toAssetDatabaseId:toAssetId').eq(asset_key),
-            FilterExpression=boto3.dynamodb.conditions.Attr('relationshipType').eq('related'),
-        )
-        
-        has_related = (len(related_from_response.get('Items', [])) > 0 or 
-                      len(related_to_response.get('Items', [])) > 0)
-        
-        return {
-            'has_children': has_children,
-            'has_parents': has_parents,
-            'has_related': has_related
-        }
-        
+        return relationship_flags_from_links(query_asset_links(database_id, asset_id))
     except Exception as e:
         logger.exception(f"Error getting asset relationship flags for {database_id}/{asset_id}: {e}")
         return {
@@ -803,40 +811,19 @@ def get_asset_relationship_flags(database_id: str, asset_id: str) -> Dict[str, b
 
 def send_to_garnet_ingestion_queue(ngsi_ld_entity: Dict[str, Any]) -> bool:
     """
-    Send NGSI-LD entity to Garnet Framework ingestion queue.
+    Queue NGSI-LD entity for the Garnet Framework ingestion queue.
+    
+    Entities are buffered and sent in batches, several entities per message, when
+    the handler flushes at the end of the invocation or once a full batch is buffered.
     
     Args:
         ngsi_ld_entity: The NGSI-LD formatted entity
         
     Returns:
-        True if successful, False otherwise
+        True if queued, False otherwise
     """
-    try:
-        # Log the entity being sent (use decimal_to_number for logging)
-        logger.info(f"Sending NGSI-LD entity to Garnet ingestion queue: {json.dumps(ngsi_ld_entity, indent=2, default=decimal_to_number)}")
-        
-        # Send NGSI-LD entity directly to SQS queue (use decimal_to_number for serialization)
-        response = sqs.send_message(
-            QueueUrl=garnet_ingestion_queue_url,
-            MessageBody=json.dumps(ngsi_ld_entity, default=decimal_to_number),
-            MessageAttributes={
-                'entityType': {
-                    'StringValue': ngsi_ld_entity.get('type', 'VAMSAsset'),
-                    'DataType': 'String'
-                },
-                'source': {
-                    'StringValue': 'vams-asset-indexer',
-                    'DataType': 'String'
-                }
-            }
-        )
-        
-        logger.info(f"Successfully sent entity to Garnet ingestion queue: {ngsi_ld_entity['id']}, MessageId: {response.get('MessageId')}")
-        return True
-        
-    except Exception as e:
-        logger.exception(f"Error sending entity to Garnet ingestion queue: {e}")
-        return False
+    logger.info(f"Queueing NGSI-LD entity for Garnet ingestion: {ngsi_ld_entity['id']}")
+    return garnet_batcher.add(ngsi_ld_entity)
 
 #######################
 # Business Logic Functions
@@ -877,9 +864,9 @@ def handle_asset_stream(event_record: Dict[str, Any]) -> bool:
             
             success = send_to_garnet_ingestion_queue(ngsi_ld_entity)
             if success:
-                logger.info(f"Successfully sent asset deletion to Garnet: {database_id}/{asset_id}")
+                logger.info(f"Queued asset deletion to Garnet: {database_id}/{asset_id}")
             else:
-                logger.error(f"Failed to send asset deletion to Garnet: {database_id}/{asset_id}")
+                logger.error(f"Failed to queue asset deletion to Garnet: {database_id}/{asset_id}")
             return success
         
         # For INSERT/MODIFY events, use NewImage
@@ -918,8 +905,13 @@ def handle_asset_stream(event_record: Dict[str, Any]) -> bool:
         # Get version information
         version_info = get_asset_version_info(database_id, asset_id)
         
-        # Get relationship flags
-        relationship_flags = get_asset_relationship_flags(database_id, asset_id)
+        # Get the asset's links once for both the relationship flags and the link re-index below
+        try:
+            asset_links = query_asset_links(database_id, asset_id)
+        except Exception as e:
+            logger.exception(f"Error getting asset links for {database_id}/{asset_id}: {e}")
+            asset_links = []
+        relationship_flags = relationship_flags_from_links(asset_links)
         
         # Convert to NGSI-LD format
         ngsi_ld_entity = convert_asset_to_ngsi_ld(
@@ -933,13 +925,13 @@ def handle_asset_stream(event_record: Dict[str, Any]) -> bool:
         # Send asset to Garnet ingestion queue
         success = send_to_garnet_ingestion_queue(ngsi_ld_entity)
         if success:
-            logger.info(f"Successfully sent asset to Garnet: {database_id}/{asset_id}")
+            logger.info(f"Queued asset to Garnet: {database_id}/{asset_id}")
         else:
-            logger.error(f"Failed to send asset to Garnet: {database_id}/{asset_id}")
+            logger.error(f"Failed to queue asset to Garnet: {database_id}/{asset_id}")
         
         # Also re-index all asset links related to this asset
         # This ensures asset link entities stay in sync when asset properties change
-        asset_link_ids = get_all_asset_links_for_asset(database_id, asset_id)
+        asset_link_ids = list(dict.fromkeys(link['assetLinkId'] for link in asset_links if link['assetLinkId']))
         
         if asset_link_ids:
             logger.info(f"Re-indexing {len(asset_link_ids)} asset links for asset {database_id}/{asset_id}")
@@ -1044,9 +1036,9 @@ def handle_asset_metadata_stream(event_record: Dict[str, Any]) -> bool:
         # Send to Garnet ingestion queue
         success = send_to_garnet_ingestion_queue(ngsi_ld_entity)
         if success:
-            logger.info(f"Successfully sent asset to Garnet after metadata change: {database_id}/{asset_id}")
+            logger.info(f"Queued asset to Garnet after metadata change: {database_id}/{asset_id}")
         else:
-            logger.error(f"Failed to send asset to Garnet after metadata change: {database_id}/{asset_id}")
+            logger.error(f"Failed to queue asset to Garnet after metadata change: {database_id}/{asset_id}")
         return success
         
     except Exception as e:
@@ -1190,15 +1182,118 @@ def handle_asset_link_metadata_stream(event_record: Dict[str, Any]) -> bool:
         # Send to Garnet ingestion queue
         success = send_to_garnet_ingestion_queue(ngsi_ld_entity)
         if success:
-            logger.info(f"Successfully sent asset link to Garnet after metadata change: {asset_link_id}")
+            logger.info(f"Queued asset link to Garnet after metadata change: {asset_link_id}")
         else:
-            logger.error(f"Failed to send asset link to Garnet after metadata change: {asset_link_id}")
+            logger.error(f"Failed to queue asset link to Garnet after metadata change: {asset_link_id}")
         return success
         
     except Exception as e:
         logger.exception(f"Error handling asset link metadata stream: {e}")
         return False
 
+#######################
+# Bulk Resync Functions
+#######################
+
+def resync_assets(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+    """
+    Send every asset and asset link to Garnet by streaming entities from table scans.
+    
+    Assets are converted page by page with relationship flags taken from one scan of the
+    asset links table, then all asset links are converted. When the invocation runs low
+    on time the scan position is returned in 'resume'; invoke again with it to continue.
+    
+    Direct invocation:
+        {"operation": "resync"}
+        {"operation": "resync", "resume": {"phase": "assetLinks", "exclusiveStartKey": {...}}}
+    """
+    resume = event.get('resume') or {}
+    phase = resume.get('phase', 'assets')
+    start_key = resume.get('exclusiveStartKey')
+    resynced_entities = 0
+    
+    def out_of_time() -> bool:
+        return context is not None and context.get_remaining_time_in_millis() < RESYNC_TIME_RESERVE_MS
+    
+    if phase == 'assets':
+        flags_index = build_relationship_flags_index()
+        bucket_details_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+        no_links = {'has_children': False, 'has_parents': False, 'has_related': False}
+        
+        while True:
+            scan_kwargs = {'ExclusiveStartKey': start_key} if start_key else {}
+            response = asset_storage_table.scan(**scan_kwargs)
+            for asset_details in response.get('Items', []):
+                database_id = asset_details.get('databaseId')
+                asset_id = asset_details.get('assetId')
+                if not database_id or not asset_id:
+                    continue
+                try:
+                    bucket_details = None
+                    bucket_id = asset_details.get('bucketId')
+                    if bucket_id:
+                        if bucket_id not in bucket_details_cache:
+                            bucket_details_cache[bucket_id] = get_bucket_details(bucket_id)
+                        bucket_details = bucket_details_cache[bucket_id]
+                    
+                    ngsi_ld_entity = convert_asset_to_ngsi_ld(
+                        asset_details,
+                        bucket_details,
+                        get_asset_metadata(database_id, asset_id),
+                        get_asset_version_info(database_id, asset_id),
+                        flags_index.get(f"{database_id}:{asset_id}", no_links)
+                    )
+                    if send_to_garnet_ingestion_queue(ngsi_ld_entity):
+                        resynced_entities += 1
+                except Exception as e:
+                    logger.exception(f"Error resyncing asset {database_id}/{asset_id}: {e}")
+            
+            start_key = response.get('LastEvaluatedKey')
+            if not start_key:
+                break
+            if out_of_time():
+                return finish_resync(resynced_entities, {'phase': 'assets', 'exclusiveStartKey': start_key})
+        
+        phase = 'assetLinks'
+    
+    while True:
+        scan_kwargs = {'ExclusiveStartKey': start_key} if start_key else {}
+        response = asset_links_table.scan(**scan_kwargs)
+        for asset_link_details in response.get('Items', []):
+            asset_link_id = asset_link_details.get('assetLinkId')
+            if not asset_link_id:
+                continue
+            try:
+                ngsi_ld_entity = convert_asset_link_to_ngsi_ld(asset_link_details, get_asset_link_metadata(asset_link_id))
+                if send_to_garnet_ingestion_queue(ngsi_ld_entity):
+                    resynced_entities += 1
+            except Exception as e:
+                logger.exception(f"Error resyncing asset link {asset_link_id}: {e}")
+        
+        start_key = response.get('LastEvaluatedKey')
+        if not start_key:
+            break
+        if out_of_time():
+            return finish_resync(resynced_entities, {'phase': 'assetLinks', 'exclusiveStartKey': start_key})
+    
+    return finish_resync(resynced_entities, None)
+
+def finish_resync(resynced_entities: int, resume: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Flush the buffered entities and build the resync response"""
+    garnet_batcher.flush()
+    logger.info(f"Garnet asset resync {'paused' if resume else 'completed'}: {resynced_entities} entities converted, "
+                f"{garnet_batcher.sent_entities} sent, {garnet_batcher.failed_entities} failed")
+    return {
+        'statusCode': 200,
+        'body': {
+            'message': 'Garnet asset resync paused, invoke again with resume' if resume else 'Garnet asset resync completed',
+            'resynced_entities': resynced_entities,
+            'sent_entities': garnet_batcher.sent_entities,
+            'failed_entities': garnet_batcher.failed_entities,
+            'resume': resume
+        }
+    }
+
 #######################
 # Lambda Handler
 #######################
@@ -1215,6 +1310,11 @@ def lambda_handler(event, context: LambdaContext) -> Dict[str, Any]:
         
         successful_records = 0
         failed_records = 0
+        garnet_batcher.reset()
+        
+        # Direct invocation for a bulk resync of all assets and asset links
+        if event.get('operation') == 'resync':
+            return resync_assets(event, context)
         
         # Handle different event sources (same pattern as OpenSearch indexers)
         if 'Records' in event:
@@ -1283,19 +1383,26 @@ def lambda_handler(event, context: LambdaContext) -> Dict[str, Any]:
                     logger.warning(f"Unknown event source: {event_source}")
                     failed_records += 1
         
-        logger.info(f"Garnet asset indexing completed: {successful_records} successful, {failed_records} failed")
+        # Send the entities buffered for this batch
+        garnet_batcher.flush()
+
+        logger.info(f"Garnet asset indexing completed: {successful_records} successful, {failed_records} failed, "
+                    f"{garnet_batcher.sent_entities} entities sent, {garnet_batcher.failed_entities} entities failed")
         
         return {
             'statusCode': 200,
             'body': {
                 'message': 'Garnet asset indexing completed',
                 'successful_records': successful_records,
-                'failed_records': failed_records
+                'failed_records': failed_records,
+                'sent_entities': garnet_batcher.sent_entities,
+                'failed_entities': garnet_batcher.failed_entities
             }
         }
         
     except Exception as e:
         logger.exception(f"Error in Garnet asset indexer lambda handler: {e}")
+        garnet_batcher.flush()
         return {
             'statusCode': 500,
             'body': {
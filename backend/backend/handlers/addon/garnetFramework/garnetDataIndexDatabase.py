@@ -23,6 +23,7 @@ from aws_lambda_powertools.utilities.parser import parse, ValidationError
 from customLogging.logger import safeLogger
 from common.validators import validate
 from models.common import VAMSGeneralErrorResponse
+from handlers.addon.garnetFramework.garnetIngestion import GarnetIngestionBatcher
 
 # Helper function to convert Decimal to int/float for JSON serialization
 def decimal_to_number(obj):
@@ -54,6 +55,12 @@ except Exception as e:
     logger.exception("Failed loading environment variables")
     raise e
 
+# Buffers NGSI-LD entities and sends them to the Garnet ingestion queue in batches
+garnet_batcher = GarnetIngestionBatcher(sqs, garnet_ingestion_queue_url, 'vams-database-indexer')
+
+# Time left for flushing when a bulk resync stops to return its resume position
+RESYNC_TIME_RESERVE_MS = 60 * 1000
+
 # Initialize DynamoDB tables
 database_storage_table = dynamodb.Table(database_storage_table_name)
 database_metadata_table = dynamodb.Table(database_metadata_storage_table_name)
@@ -382,40 +389,19 @@ def get_bucket_details(bucket_id: str) -> Optional[Dict[str, Any]]:
 
 def send_to_garnet_ingestion_queue(ngsi_ld_entity: Dict[str, Any]) -> bool:
     """
-    Send NGSI-LD entity to Garnet Framework ingestion queue.
+    Queue NGSI-LD entity for the Garnet Framework ingestion queue.
+    
+    Entities are buffered and sent in batches, several entities per message, when
+    the handler flushes at the end of the invocation or once a full batch is buffered.
     
     Args:
         ngsi_ld_entity: The NGSI-LD formatted entity
         
     Returns:
-        True if successful, False otherwise
+        True if queued, False otherwise
     """
-    try:
-        # Log the entity being sent (use decimal_to_number for logging)
-        logger.info(f"Sending NGSI-LD entity to Garnet ingestion queue: {json.dumps(ngsi_ld_entity, indent=2, default=decimal_to_number)}")
-        
-        # Send NGSI-LD entity directly to SQS queue (use decimal_to_number for serialization)
-        response = sqs.send_message(
-            QueueUrl=garnet_ingestion_queue_url,
-            MessageBody=json.dumps(ngsi_ld_entity, default=decimal_to_number),
-            MessageAttributes={
-                'entityType': {
-                    'StringValue': 'VAMSDatabase',
-                    'DataType': 'String'
-                },
-                'source': {
-                    'StringValue': 'vams-database-indexer',
-                    'DataType': 'String'
-                }
-            }
-        )
-        
-        logger.info(f"Successfully sent database entity to Garnet ingestion queue: {ngsi_ld_entity['id']}, MessageId: {response.get('MessageId')}")
-        return True
-        
-    except Exception as e:
-        logger.exception(f"Error sending entity to Garnet ingestion queue: {e}")
-        return False
+    logger.info(f"Queueing NGSI-LD entity for Garnet ingestion: {ngsi_ld_entity['id']}")
+    return garnet_batcher.add(ngsi_ld_entity)
 
 #######################
 # Business Logic Functions
@@ -455,9 +441,9 @@ def handle_database_stream(event_record: Dict[str, Any]) -> bool:
             
             success = send_to_garnet_ingestion_queue(ngsi_ld_entity)
             if success:
-                logger.info(f"Successfully sent database deletion to Garnet: {database_id}")
+                logger.info(f"Queued database deletion to Garnet: {database_id}")
             else:
-                logger.error(f"Failed to send database deletion to Garnet: {database_id}")
+                logger.error(f"Failed to queue database deletion to Garnet: {database_id}")
             return success
         
         # For INSERT/MODIFY events, use NewImage
@@ -498,9 +484,9 @@ def handle_database_stream(event_record: Dict[str, Any]) -> bool:
         # Send to Garnet ingestion queue
         success = send_to_garnet_ingestion_queue(ngsi_ld_entity)
         if success:
-            logger.info(f"Successfully sent database to Garnet: {database_id}")
+            logger.info(f"Queued database to Garnet: {database_id}")
         else:
-            logger.error(f"Failed to send database to Garnet: {database_id}")
+            logger.error(f"Failed to queue database to Garnet: {database_id}")
         return success
         
     except Exception as e:
@@ -560,15 +546,77 @@ def handle_database_metadata_stream(event_record: Dict[str, Any]) -> bool:
         # Send to Garnet ingestion queue
         success = send_to_garnet_ingestion_queue(ngsi_ld_entity)
         if success:
-            logger.info(f"Successfully sent database to Garnet after metadata change: {database_id}")
+            logger.info(f"Queued database to Garnet after metadata change: {database_id}")
         else:
-            logger.error(f"Failed to send database to Garnet after metadata change: {database_id}")
+            logger.error(f"Failed to queue database to Garnet after metadata change: {database_id}")
         return success
         
     except Exception as e:
         logger.exception(f"Error handling database metadata stream: {e}")
         return False
 
+#######################
+# Bulk Resync Functions
+#######################
+
+def resync_databases(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+    """
+    Send every database to Garnet by streaming entities from a scan of the database table.
+    
+    When the invocation runs low on time the scan position is returned in 'resume';
+    invoke again with it to continue.
+    
+    Direct invocation:
+        {"operation": "resync"}
+        {"operation": "resync", "resume": {"exclusiveStartKey": {...}}}
+    """
+    start_key = (event.get('resume') or {}).get('exclusiveStartKey')
+    bucket_details_cache: Dict[str, Optional[Dict[str, Any]]] = {}
+    resynced_entities = 0
+    resume = None
+    
+    while True:
+        scan_kwargs = {'ExclusiveStartKey': start_key} if start_key else {}
+        response = database_storage_table.scan(**scan_kwargs)
+        for database_details in response.get('Items', []):
+            database_id = database_details.get('databaseId')
+            if not database_id:
+                continue
+            try:
+                bucket_details = None
+                bucket_id = database_details.get('defaultBucketId')
+                if bucket_id:
+                    if bucket_id not in bucket_details_cache:
+                        bucket_details_cache[bucket_id] = get_bucket_details(bucket_id)
+                    bucket_details = bucket_details_cache[bucket_id]
+                
+                ngsi_ld_entity = convert_database_to_ngsi_ld(database_details, bucket_details, get_database_metadata(database_id))
+                if send_to_garnet_ingestion_queue(ngsi_ld_entity):
+                    resynced_entities += 1
+            except Exception as e:
+                logger.exception(f"Error resyncing database {database_id}: {e}")
+        
+        start_key = response.get('LastEvaluatedKey')
+        if not start_key:
+            break
+        if context is not None and context.get_remaining_time_in_millis() < RESYNC_TIME_RESERVE_MS:
+            resume = {'exclusiveStartKey': start_key}
+            break
+    
+    garnet_batcher.flush()
+    logger.info(f"Garnet database resync {'paused' if resume else 'completed'}: {resynced_entities} entities converted, "
+                f"{garnet_batcher.sent_entities} sent, {garnet_batcher.failed_entities} failed")
+    return {
+        'statusCode': 200,
+        'body': {
+            'message': 'Garnet database resync paused, invoke again with resume' if resume else 'Garnet database resync completed',
+            'resynced_entities': resynced_entities,
+            'sent_entities': garnet_batcher.sent_entities,
+            'failed_entities': garnet_batcher.failed_entities,
+            'resume': resume
+        }
+    }
+
 #######################
 # Lambda Handler
 #######################
@@ -585,6 +633,11 @@ def lambda_handler(event, context: LambdaContext) -> Dict[str, Any]:
         
         successful_records = 0
         failed_records = 0
+        garnet_batcher.reset()
+        
+        # Direct invocation for a bulk resync of all databases
+        if event.get('operation') == 'resync':
+            return resync_databases(event, context)
         
         # Handle different event sources (same pattern as OpenSearch indexers)
         if 'Records' in event:
@@ -637,19 +690,26 @@ def lambda_handler(event, context: LambdaContext) -> Dict[str, Any]:
                     logger.warning(f"Unknown event source: {event_source}")
                     failed_records += 1
         
-        logger.info(f"Garnet database indexing completed: {successful_records} successful, {failed_records} failed")
+        # Send the entities buffered for this batch
+        garnet_batcher.flush()
+
+        logger.info(f"Garnet database indexing completed: {successful_records} successful, {failed_records} failed, "
+                    f"{garnet_batcher.sent_entities} entities sent, {garnet_batcher.failed_entities} entities failed")
         
         return {
             'statusCode': 200,
             'body': {
                 'message': 'Garnet database indexing completed',
                 'successful_records': successful_records,
-                'failed_records': failed_records
+                'failed_records': failed_records,
+                'sent_entities': garnet_batcher.sent_entities,
+                'failed_entities': garnet_batcher.failed_entities
             }
         }
         
     except Exception as e:
         logger.exception(f"Error in Garnet database indexer lambda handler: {e}")
+        garnet_batcher.flush()
         return {
             'statusCode': 500,
             'body': {
@@ -24,6 +24,7 @@ from aws_lambda_powertools.utilities.parser import parse, ValidationError
 from customLogging.logger import safeLogger
 from common.validators import validate
 from models.common import VAMSGeneralErrorResponse
+from handlers.addon.garnetFramework.garnetIngestion import GarnetIngestionBatcher
 
 # Helper function to convert Decimal to int/float for JSON serialization
 def decimal_to_number(obj):
@@ -61,6 +62,9 @@ except Exception as e:
     logger.exception("Failed loading environment variables")
     raise e
 
+# Buffers NGSI-LD entities and sends them to the Garnet ingestion queue in batches
+garnet_batcher = GarnetIngestionBatcher(sqs, garnet_ingestion_queue_url, 'vams-file-indexer')
+
 # Initialize DynamoDB tables
 asset_storage_table = dynamodb.Table(asset_storage_table_name)
 asset_file_metadata_table = dynamodb.Table(asset_file_metadata_storage_table_name)
@@ -531,40 +535,19 @@ def convert_file_to_ngsi_ld(
 
 def send_to_garnet_ingestion_queue(ngsi_ld_entity: Dict[str, Any]) -> bool:
     """
-    Send NGSI-LD entity to Garnet Framework ingestion queue.
+    Queue NGSI-LD entity for the Garnet Framework ingestion queue.
+    
+    Entities are buffered and sent in batches, several entities per message, when
+    the handler flushes at the end of the invocation or once a full batch is buffered.
     
     Args:
         ngsi_ld_entity: The NGSI-LD formatted entity
         
     Returns:
-        True if successful, False otherwise
+        True if queued, False otherwise
     """
-    try:
-        # Log the entity being sent (use decimal_to_number for logging)
-        logger.info(f"Sending NGSI-LD entity to Garnet ingestion queue: {json.dumps(ngsi_ld_entity, indent=2, default=decimal_to_number)}")
-        
-        # Send NGSI-LD entity directly to SQS queue (use decimal_to_number for serialization)
-        response = sqs.send_message(
-            QueueUrl=garnet_ingestion_queue_url,
-            MessageBody=json.dumps(ngsi_ld_entity, default=decimal_to_number),
-            MessageAttributes={
-                'entityType': {
-                    'StringValue': 'VAMSFile',
-                    'DataType': 'String'
-                },
-                'source': {
-                    'StringValue': 'vams-file-indexer',
-                    'DataType': 'String'
-                }
-            }
-        )
-        
-        logger.info(f"Successfully sent file entity to Garnet ingestion queue: {ngsi_ld_entity['id']}, MessageId: {response.get('MessageId')}")
-        return True
-        
-    except Exception as e:
-        logger.exception(f"Error sending entity to Garnet ingestion queue: {e}")
-        return False
+    logger.info(f"Queueing NGSI-LD entity for Garnet ingestion: {ngsi_ld_entity['id']}")
+    return garnet_batcher.add(ngsi_ld_entity)
 
 #######################
 # Business Logic Functions
@@ -678,9 +661,9 @@ def handle_s3_notification(event_record: Dict[str, Any]) -> bool:
         # Send to Garnet ingestion queue
         success = send_to_garnet_ingestion_queue(ngsi_ld_entity)
         if success:
-            logger.info(f"Successfully sent file to Garnet from S3 event: {database_id}/{asset_id}{relative_path}")
+            logger.info(f"Queued file to Garnet from S3 event: {database_id}/{asset_id}{relative_path}")
         else:
-            logger.error(f"Failed to send file to Garnet from S3 event: {database_id}/{asset_id}{relative_path}")
+            logger.error(f"Failed to queue file to Garnet from S3 event: {database_id}/{asset_id}{relative_path}")
         return success
         
     except Exception as e:
@@ -786,9 +769,9 @@ def handle_file_metadata_stream(event_record: Dict[str, Any]) -> bool:
         # Send to Garnet ingestion queue
         success = send_to_garnet_ingestion_queue(ngsi_ld_entity)
         if success:
-            logger.info(f"Successfully sent file to Garnet after metadata change: {database_id}/{asset_id}{file_path}")
+            logger.info(f"Queued file to Garnet after metadata change: {database_id}/{asset_id}{file_path}")
         else:
-            logger.error(f"Failed to send file to Garnet after metadata change: {database_id}/{asset_id}{file_path}")
+            logger.error(f"Failed to queue file to Garnet after metadata change: {database_id}/{asset_id}{file_path}")
         return success
         
     except Exception as e:
@@ -811,6 +794,7 @@ def lambda_handler(event, context: LambdaContext) -> Dict[str, Any]:
         
         successful_records = 0
         failed_records = 0
+        garnet_batcher.reset()
         
         # Extract bucket info from top-level event (if present from sqsBucketSync)
         asset_bucket_name = event.get('ASSET_BUCKET_NAME')
@@ -911,19 +895,26 @@ def lambda_handler(event, context: LambdaContext) -> Dict[str, Any]:
                     logger.warning(f"Unknown event source: {event_source}")
                     failed_records += 1
         
-        logger.info(f"Garnet file indexing completed: {successful_records} successful, {failed_records} failed")
+        # Send the entities buffered for this batch
+        garnet_batcher.flush()
+
+        logger.info(f"Garnet file indexing completed: {successful_records} successful, {failed_records} failed, "
+                    f"{garnet_batcher.sent_entities} entities sent, {garnet_batcher.failed_entities} entities failed")
         
         return {
             'statusCode': 200,
             'body': {
                 'message': 'Garnet file indexing completed',
                 'successful_records': successful_records,
-                'failed_records': failed_records
+                'failed_records': failed_records,
+                'sent_entities': garnet_batcher.sent_entities,
+                'failed_entities': garnet_batcher.failed_entities
             }
         }
         
     except Exception as e:
         logger.exception(f"Error in Garnet file indexer lambda handler: {e}")
+        garnet_batcher.flush()
         return {
             'statusCode': 500,
             'body': {
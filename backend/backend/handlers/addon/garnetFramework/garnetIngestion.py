@@ -0,0 +1,160 @@
+"""
+Batched delivery of NGSI-LD entities to the Garnet Framework ingestion queue.
+
+The Garnet indexers buffer converted entities and send them with SendMessageBatch,
+packing several entities per message. A message holding one entity carries the
+entity object itself and a message holding several carries a JSON array of entities,
+both of which the Garnet ingestion queue accepts.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+from decimal import Decimal
+from typing import Dict, Any, List
+from customLogging.logger import safeLogger
+
+logger = safeLogger(service_name="GarnetIngestion")
+
+# SQS limits: 10 entries per SendMessageBatch and 256 KiB for a message and for a whole
+# batch. Message attributes count towards the size, so keep some headroom for them.
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024 - 4 * 1024
+
+# Maximum number of entities packed into one message
+MAX_ENTITIES_PER_MESSAGE = 50
+
+
+def decimal_to_number(obj):
+    """Convert Decimal objects to int or float for JSON serialization"""
+    if isinstance(obj, Decimal):
+        return int(obj) if obj % 1 == 0 else float(obj)
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+class GarnetIngestionBatcher:
+    """Buffer NGSI-LD entities and send them to the Garnet ingestion queue in batches
+
+    Entities are deduplicated by id within the buffer (the latest version wins), so
+    repeated changes to one entity in a batch are sent once. Call flush() before the
+    invocation ends.
+    """
+
+    def __init__(self, sqs_client, queue_url: str, source: str):
+        self.sqs_client = sqs_client
+        self.queue_url = queue_url
+        self.source = source
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_bytes = 0
+        self.sent_entities = 0
+        self.failed_entities = 0
+
+    def reset(self) -> None:
+        """Drop buffered entities and zero the counters at the start of an invocation"""
+        self._pending = {}
+        self._pending_bytes = 0
+        self.sent_entities = 0
+        self.failed_entities = 0
+
+    def add(self, ngsi_ld_entity: Dict[str, Any]) -> bool:
+        """Buffer an entity, sending the buffer once it fills a whole batch
+
+        Returns:
+            False if the entity cannot be serialized, True otherwise
+        """
+        try:
+            body = json.dumps(ngsi_ld_entity, default=decimal_to_number)
+        except Exception as e:
+            logger.exception(f"Error serializing entity {ngsi_ld_entity.get('id')} for Garnet: {e}")
+            self.failed_entities += 1
+            return False
+
+        entity_id = ngsi_ld_entity['id']
+        previous = self._pending.pop(entity_id, None)
+        if previous is not None:
+            self._pending_bytes -= len(previous['body'])
+        self._pending[entity_id] = {'type': ngsi_ld_entity.get('type', ''), 'body': body}
+        self._pending_bytes += len(body)
+
+        if self._pending_bytes >= MAX_BATCH_BYTES or len(self._pending) >= MAX_BATCH_ENTRIES * MAX_ENTITIES_PER_MESSAGE:
+            self.flush()
+        return True
+
+    def _pack_messages(self) -> List[Dict[str, Any]]:
+        """Pack the buffered entities into messages of a single entity type"""
+        messages = []
+        by_type: Dict[str, List[str]] = {}
+        for entity in self._pending.values():
+            by_type.setdefault(entity['type'], []).append(entity['body'])
+
+        for entity_type, bodies in by_type.items():
+            current: List[str] = []
+            current_bytes = 2
+            for body in bodies:
+                if current and (len(current) >= MAX_ENTITIES_PER_MESSAGE
+                                or current_bytes + len(body) + 1 > MAX_BATCH_BYTES):
+                    messages.append({'type': entity_type, 'bodies': current, 'bytes': current_bytes})
+                    current, current_bytes = [], 2
+                current.append(body)
+                current_bytes += len(body) + 1
+            if current:
+                messages.append({'type': entity_type, 'bodies': current, 'bytes': current_bytes})
+        return messages
+
+    def _send_batch(self, messages: List[Dict[str, Any]]) -> None:
+        """Send up to MAX_BATCH_ENTRIES packed messages with one SendMessageBatch call"""
+        entries = []
+        for index, message in enumerate(messages):
+            bodies = message['bodies']
+            entries.append({
+                'Id': str(index),
+                'MessageBody': bodies[0] if len(bodies) == 1 else f"[{','.join(bodies)}]",
+                'MessageAttributes': {
+                    'entityType': {
+                        'StringValue': message['type'] or 'VAMSEntity',
+                        'DataType': 'String'
+                    },
+                    'source': {
+                        'StringValue': self.source,
+                        'DataType': 'String'
+                    }
+                }
+            })
+
+        try:
+            response = self.sqs_client.send_message_batch(QueueUrl=self.queue_url, Entries=entries)
+            failed_ids = {failure['Id'] for failure in response.get('Failed', [])}
+        except Exception as e:
+            logger.exception(f"Error sending batch to Garnet ingestion queue: {e}")
+            failed_ids = {entry['Id'] for entry in entries}
+
+        for index, message in enumerate(messages):
+            if str(index) in failed_ids:
+                self.failed_entities += len(message['bodies'])
+            else:
+                self.sent_entities += len(message['bodies'])
+        if failed_ids:
+            logger.error(f"Failed to send {len(failed_ids)} of {len(entries)} messages to Garnet ingestion queue")
+
+    def flush(self) -> None:
+        """Send all buffered entities"""
+        if not self._pending:
+            return
+
+        messages = self._pack_messages()
+        self._pending = {}
+        self._pending_bytes = 0
+
+        batch: List[Dict[str, Any]] = []
+        batch_bytes = 0
+        for message in messages:
+            if batch and (len(batch) >= MAX_BATCH_ENTRIES or batch_bytes + message['bytes'] > MAX_BATCH_BYTES):
+                self._send_batch(batch)
+                batch, batch_bytes = [], 0
+            batch.append(message)
+            batch_bytes += message['bytes']
+        if batch:
+            self._send_batch(batch)
+
+        logger.info(f"Garnet ingestion totals: {self.sent_entities} entities sent, {self.failed_entities} failed")
@@ -2,61 +2,86 @@
 #  SPDX-License-Identifier: Apache-2.0
 
 import boto3
-from boto3.dynamodb.conditions import Key
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from customLogging.logger import safeLogger
 
 logger = safeLogger(service_name="AssetCount")
 
-dynamodb = boto3.resource('dynamodb')
-dynamodb_client = boto3.client('dynamodb')
-
-
-def update_asset_count(db_database, asset_database, queryParams, databaseId):
-    # Set default values for pagination parameters if not provided
-    max_items = int(queryParams.get('maxItems', 1000))
-    page_size = int(queryParams.get('pageSize', 100))
-    
-    table = dynamodb.Table(db_database)
-    resp = table.query(
-        KeyConditionExpression=Key('databaseId').eq(databaseId),
-        ScanIndexForward=False,
-    )
-
-    paginator = dynamodb_client.get_paginator('query')
-    condition = {
-        "databaseId": {
-            'AttributeValueList': [ {"S": databaseId} ],
-            'ComparisonOperator': 'EQ'
-        }
+retry_config = Config(
+    retries={
+        'max_attempts': 5,
+        'mode': 'adaptive'
     }
-    pageIterator = paginator.paginate(
-        TableName=asset_database,
-        KeyConditions=condition,
-        ScanIndexForward=False,
-        PaginationConfig={
-            'MaxItems': max_items,
-            'PageSize': page_size, 
-        #    'StartingToken': queryParams['startingToken']
-        }
-    ).build_full_result()
-
-    count = pageIterator['Count']
-    while 'NextToken' in pageIterator:
-        nextToken = pageIterator['NextToken']
-        pageIterator = paginator.paginate(
-            TableName=asset_database,
-            KeyConditions=condition,
-            ScanIndexForward=False,
-            PaginationConfig={
-                'MaxItems': max_items,
-                'PageSize': page_size, 
-                'StartingToken': nextToken
-            }
-        ).build_full_result()
-        count += pageIterator['Count']
-
-    item = resp['Items'][0]
-    item['assetCount'] = str(count)
-    logger.info(item)
-    table.put_item(Item=item)
-    return
+)
+
+dynamodb_client = boto3.client('dynamodb', config=retry_config)
+
+
+def count_assets(asset_database, databaseId):
+    """Count the assets of a database with COUNT queries (no items are returned)"""
+    query_params = {
+        'TableName': asset_database,
+        'KeyConditionExpression': 'databaseId = :databaseId',
+        'ExpressionAttributeValues': {':databaseId': {'S': databaseId}},
+        'Select': 'COUNT',
+    }
+    count = 0
+    while True:
+        response = dynamodb_client.query(**query_params)
+        count += response.get('Count', 0)
+        if 'LastEvaluatedKey' not in response:
+            return count
+        query_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def reconcile_asset_count(db_database, asset_database, databaseId):
+    """Recount a database's assets and store the result as its assetCount
+
+    Returns:
+        The counted number of assets
+    """
+    count = count_assets(asset_database, databaseId)
+    try:
+        dynamodb_client.update_item(
+            TableName=db_database,
+            Key={'databaseId': {'S': databaseId}},
+            UpdateExpression='SET assetCount = :count',
+            ConditionExpression='attribute_exists(databaseId)',
+            ExpressionAttributeValues={':count': {'N': str(count)}},
+        )
+    except ClientError as e:
+        if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+            raise e
+        logger.warning(f"Database {databaseId} no longer exists, asset count not stored")
+    return count
+
+
+def increment_asset_count(db_database, asset_database, databaseId, delta):
+    """Atomically add delta (positive or negative) to a database's assetCount
+
+    Counter failures are logged rather than raised so they never fail the asset operation;
+    the scheduled reconciliation corrects any drift.
+    """
+    try:
+        dynamodb_client.update_item(
+            TableName=db_database,
+            Key={'databaseId': {'S': databaseId}},
+            UpdateExpression='ADD assetCount :delta',
+            ConditionExpression='attribute_exists(databaseId)',
+            ExpressionAttributeValues={':delta': {'N': str(delta)}},
+        )
+    except ClientError as e:
+        error_code = e.response['Error']['Code']
+        if error_code == 'ConditionalCheckFailedException':
+            logger.warning(f"Database {databaseId} not found, asset count not updated")
+            return
+        if error_code == 'ValidationException':
+            # Counts written by earlier versions are strings, which ADD cannot update
+            logger.info(f"Converting asset count of database {databaseId} to a number")
+            try:
+                reconcile_asset_count(db_database, asset_database, databaseId)
+            except Exception as reconcile_error:
+                logger.exception(f"Error recounting assets for database {databaseId}: {reconcile_error}")
+            return
+        logger.exception(f"Error updating asset count for database {databaseId}: {e}")
@@ -16,6 +16,7 @@ from aws_lambda_powertools.utilities.parser import parse, ValidationError
 from common.constants import STANDARD_JSON_RESPONSE
 from common.validators import validate
 from common.dynamodb import validate_pagination_info
+from common.previewIndex import lookup_preview_file_keys
 from handlers.authz import CasbinEnforcer
 from handlers.auth import request_to_claims
 from customLogging.logger import safeLogger
@@ -1285,6 +1286,11 @@ def find_preview_files_for_base(bucket: str, base_key: str) -> List[str]:
     Returns:
         List of preview file keys
     """
+    # Preview-existence index answers with a single key read when it has a record
+    indexed_preview_keys = lookup_preview_file_keys(bucket, base_key)
+    if indexed_preview_keys is not None:
+        return indexed_preview_keys
+
     preview_files = []
     
     try:
@@ -18,7 +18,7 @@ from common.constants import STANDARD_JSON_RESPONSE
 from common.validators import validate
 from handlers.authz import CasbinEnforcer
 from handlers.auth import request_to_claims
-from handlers.assets.assetCount import update_asset_count
+from handlers.assets.assetCount import increment_asset_count
 from handlers.assets.assetFiles import delete_s3_prefix_all_versions
 from customLogging.logger import safeLogger
 from common.dynamodb import validate_pagination_info
@@ -1009,10 +1009,11 @@ def archive_asset(databaseId, assetId, request_model, claims_and_roles):
         asset_table.put_item(Item=asset)
         
         # Delete from original location
-        asset_table.delete_item(Key={'databaseId': databaseId, 'assetId': assetId})
+        delete_response = asset_table.delete_item(Key={'databaseId': databaseId, 'assetId': assetId}, ReturnValues='ALL_OLD')
         
         # Update asset count
-        update_asset_count(db_database, asset_database, {}, databaseId)
+        if 'Attributes' in delete_response:
+            increment_asset_count(db_database, asset_database, databaseId, -1)
 
         #send email for asset file change
         send_subscription_email(databaseId, assetId)
@@ -1103,13 +1104,14 @@ def unarchive_asset(databaseId, assetId, request_model, claims_and_roles):
         asset['databaseId'] = original_db_id
         
         # Save to original location
-        asset_table.put_item(Item=asset)
+        put_response = asset_table.put_item(Item=asset, ReturnValues='ALL_OLD')
         
         # Delete from archived location
         asset_table.delete_item(Key={'databaseId': archived_db_id, 'assetId': assetId})
         
         # Update asset count
-        update_asset_count(db_database, asset_database, {}, original_db_id)
+        if 'Attributes' not in put_response:
+            increment_asset_count(db_database, asset_database, original_db_id, 1)
 
         # Send email notification
         send_subscription_email(original_db_id, assetId)
@@ -1179,17 +1181,33 @@ def delete_asset_permanent(databaseId, assetId, request_model, claims_and_roles)
                 # Log the error but continue with deletion process
                 logger.warning(f"Error deleting SNS topic for asset {assetId}: {e}")
         
-        # Delete subscription record if it exists
+        # Delete subscription records if they exist
         if subscription_table:
             try:
-                # Delete the subscription record where eventName is 'Asset Version Change' and entityName_entityId is 'Asset#{assetId}'
-                subscription_table.delete_item(
-                    Key={
-                        'eventName': 'Asset Version Change',
-                        'entityName_entityId': f'Asset#{assetId}'
-                    }
-                )
-                logger.info(f"Successfully deleted subscription record for asset {assetId}")
+                # Subscription records for all event names of the asset via assetIdGSI, plus the
+                # 'Asset Version Change' record by key for records that predate the assetId attribute
+                subscription_keys = {('Asset Version Change', f'Asset#{assetId}')}
+                query_params = {
+                    'IndexName': 'assetIdGSI',
+                    'KeyConditionExpression': Key('assetId').eq(assetId),
+                    'ProjectionExpression': 'eventName, entityName_entityId'
+                }
+                while True:
+                    response = subscription_table.query(**query_params)
+                    for item in response.get('Items', []):
+                        subscription_keys.add((item['eventName'], item['entityName_entityId']))
+                    if 'LastEvaluatedKey' not in response:
+                        break
+                    query_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+                for event_name, entity_name_entity_id in subscription_keys:
+                    subscription_table.delete_item(
+                        Key={
+                            'eventName': event_name,
+                            'entityName_entityId': entity_name_entity_id
+                        }
+                    )
+                logger.info(f"Successfully deleted subscription records for asset {assetId}")
             except Exception as e:
                 # Log the error but continue with deletion process
                 logger.warning(f"Error deleting subscription record for asset {assetId}: {e}")
@@ -1224,7 +1242,8 @@ def delete_asset_permanent(databaseId, assetId, request_model, claims_and_roles)
         # 2. Delete from asset table (both active and archived locations)
         # First try the original database ID
         original_db_id = databaseId.replace("#deleted", "")
-        asset_table.delete_item(Key={'databaseId': original_db_id, 'assetId': assetId})
+        delete_response = asset_table.delete_item(Key={'databaseId': original_db_id, 'assetId': assetId}, ReturnValues='ALL_OLD')
+        deleted_active_asset = 'Attributes' in delete_response
         deleted_items["dynamodb_tables"].append(f"{asset_database} (databaseId={original_db_id})")
         
         # Then try the archived version
@@ -1423,8 +1442,9 @@ def delete_asset_permanent(databaseId, assetId, request_model, claims_and_roles)
             except Exception as e:
                 logger.warning(f"Error deleting asset file metadata versions: {e}")
 
-        # 9. Update asset count
-        update_asset_count(db_database, asset_database, {}, original_db_id)
+        # 9. Update asset count (archived assets were already uncounted when archived)
+        if deleted_active_asset:
+            increment_asset_count(db_database, asset_database, original_db_id, -1)
         
         # Return success response
         now = datetime.utcnow().isoformat()
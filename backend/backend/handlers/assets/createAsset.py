@@ -8,12 +8,12 @@ import uuid
 from datetime import datetime
 from botocore.config import Config
 from boto3.dynamodb.conditions import Key
-from boto3.dynamodb.types import TypeDeserializer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import parse, ValidationError
 from common.constants import STANDARD_JSON_RESPONSE
 from common.validators import validate
-from handlers.assets.assetCount import update_asset_count
+from common.tagCatalog import get_tag_catalog
+from handlers.assets.assetCount import increment_asset_count
 from handlers.authz import CasbinEnforcer
 from handlers.auth import request_to_claims
 from customLogging.logger import safeLogger
@@ -51,8 +51,6 @@ except Exception as e:
 asset_table = dynamodb.Table(asset_storage_table_name)
 database_table = dynamodb.Table(db_database)
 buckets_table = dynamodb.Table(s3_asset_buckets_table)
-deserializer = TypeDeserializer()
-paginator = dynamodb_client.get_paginator('scan')
 
 #######################
 # Utility Functions
@@ -131,9 +129,14 @@ def get_default_bucket_details(databaseId):
     
 
 def save_asset_details(asset_data):
-    """Save asset details to DynamoDB"""
+    """Save asset details to DynamoDB
+
+    Returns:
+        True if a new asset record was created, False if an existing one was replaced
+    """
     try:
-        asset_table.put_item(Item=asset_data)
+        response = asset_table.put_item(Item=asset_data, ReturnValues='ALL_OLD')
+        return 'Attributes' not in response
     except Exception as e:
         logger.exception(f"Error saving asset details: {e}")
         raise VAMSGeneralErrorResponse(f"Error saving asset.")
@@ -156,115 +159,20 @@ def get_set_tag_types(tags):
     if tags is None or len(tags) == 0:
         return uniqueSetTagTypes
 
-    # Loop to get all tag results (to know their tag types)
-    rawTagItems = []
-    page_iteratorTags = paginator.paginate(
-        TableName=tag_table_name,
-        PaginationConfig={
-            'MaxItems': 1000,
-            'PageSize': 1000,
-        }
-    ).build_full_result()
-    if(len(page_iteratorTags["Items"]) > 0):
-        rawTagItems.extend(page_iteratorTags["Items"])
-        while("NextToken" in page_iteratorTags):
-            page_iteratorTags = paginator.paginate(
-                TableName=tag_table_name,
-                PaginationConfig={
-                    'MaxItems': 1000,
-                    'PageSize': 1000,
-                    'StartingToken': page_iteratorTags["NextToken"]
-                }
-            ).build_full_result()
-            if(len(page_iteratorTags["Items"]) > 0):
-                rawTagItems.extend(page_iteratorTags["Items"])
-
-    # Loop through every tag in the database
-    for tag in rawTagItems:
-        deserialized_document = {k: deserializer.deserialize(v) for k, v in tag.items()}
-
-        # If the tags provided matches the tag looked up, add to uniqueSetTagTypes if it's not already part of the array
-        if deserialized_document["tagName"] in tags:
-            if deserialized_document["tagTypeName"] not in uniqueSetTagTypes:
-                uniqueSetTagTypes.append(deserialized_document["tagTypeName"])
+    catalog = get_tag_catalog(dynamodb_client, tag_table_name, tag_type_table_name)
+
+    # If the tags provided match catalog tags, add their tag type to uniqueSetTagTypes if it's not already part of the array
+    for tag in tags:
+        tagTypeName = catalog.tag_type_by_tag.get(tag)
+        if tag in catalog.tag_type_by_tag and tagTypeName not in uniqueSetTagTypes:
+            uniqueSetTagTypes.append(tagTypeName)
 
     return uniqueSetTagTypes
 
 def get_required_tag_types():
-    """Get tag types that are required for assets"""
-    # Loop to get all tag results for tag type
-    rawTagTypeItems = []
-    page_iteratorTags = paginator.paginate(
-        TableName=tag_type_table_name,
-        PaginationConfig={
-            'MaxItems': 1000,
-            'PageSize': 1000,
-        }
-    ).build_full_result()
-    if(len(page_iteratorTags["Items"]) > 0):
-        rawTagTypeItems.extend(page_iteratorTags["Items"])
-        while("NextToken" in page_iteratorTags):
-            page_iteratorTags = paginator.paginate(
-                TableName=tag_type_table_name,
-                PaginationConfig={
-                    'MaxItems': 1000,
-                    'PageSize': 1000,
-                    'StartingToken': page_iteratorTags["NextToken"]
-                }
-            ).build_full_result()
-            if(len(page_iteratorTags["Items"]) > 0):
-                rawTagTypeItems.extend(page_iteratorTags["Items"])
-
-    # Get tags associated and then exclude tag types from required if no tags associated
-    # Loop to get all tag results for tag type
-    rawTagItems = []
-    page_iteratorTags = paginator.paginate(
-        TableName=tag_table_name,
-        PaginationConfig={
-            'MaxItems': 1000,
-            'PageSize': 1000,
-        }
-    ).build_full_result()
-    if(len(page_iteratorTags["Items"]) > 0):
-        rawTagItems.extend(page_iteratorTags["Items"])
-        while("NextToken" in page_iteratorTags):
-            page_iteratorTags = paginator.paginate(
-                TableName=tag_table_name,
-                PaginationConfig={
-                    'MaxItems': 1000,
-                    'PageSize': 1000,
-                    'StartingToken': page_iteratorTags["NextToken"]
-                }
-            ).build_full_result()
-            if(len(page_iteratorTags["Items"]) > 0):
-                rawTagItems.extend(page_iteratorTags["Items"])
-
-    tags = []
-    for tag in rawTagItems:
-        deserialized_document = {k: deserializer.deserialize(v) for k, v in tag.items()}
-        tags.append(deserialized_document)
-
-    formatted_tag_results = {}
-    for tagResult in tags:
-        tagName = tagResult["tagName"]
-        tagTypeName = tagResult["tagTypeName"]
-
-        if tagTypeName not in formatted_tag_results:
-            formatted_tag_results[tagTypeName] = [tagName]
-        else:
-            formatted_tag_results[tagTypeName].append(tagName)
-
-    # Final tag required loops
-    tagTypesRequired = []
-    for tagType in rawTagTypeItems:
-        deserialized_document = {k: deserializer.deserialize(v) for k, v in tagType.items()}
-
-        # if tagtype has "required" set to true and there are tags in formatted_tag_results for the type, add to list
-        if deserialized_document.get("required", "False") == "True":
-            if deserialized_document["tagTypeName"] in formatted_tag_results:
-                tagTypesRequired.append(deserialized_document["tagTypeName"])
-
-    return tagTypesRequired
+    """Get tag types that are required for assets (required tag types with tags associated)"""
+    catalog = get_tag_catalog(dynamodb_client, tag_table_name, tag_type_table_name)
+    return list(catalog.required_tag_types)
 
 def verify_all_required_tags_satisfied(assetTags):
     """Verify that all required tag types are satisfied by the asset tags"""
@@ -391,30 +299,8 @@ def validate_tags_exist(tags):
     if not tags:
         return True
     
-    # Get all existing tags from database
-    rawTagItems = []
-    page_iterator = paginator.paginate(
-        TableName=tag_table_name,
-        PaginationConfig={'MaxItems': 1000, 'PageSize': 1000}
-    ).build_full_result()
-    
-    if len(page_iterator["Items"]) > 0:
-        rawTagItems.extend(page_iterator["Items"])
-        while "NextToken" in page_iterator:
-            page_iterator = paginator.paginate(
-                TableName=tag_table_name,
-                PaginationConfig={
-                    'MaxItems': 1000, 'PageSize': 1000,
-                    'StartingToken': page_iterator["NextToken"]
-                }
-            ).build_full_result()
-            if len(page_iterator["Items"]) > 0:
-                rawTagItems.extend(page_iterator["Items"])
-    
-    existing_tags = []
-    for tag in rawTagItems:
-        deserialized_document = {k: deserializer.deserialize(v) for k, v in tag.items()}
-        existing_tags.append(deserialized_document["tagName"])
+    # Get all existing tags from the tag catalog
+    existing_tags = get_tag_catalog(dynamodb_client, tag_table_name, tag_type_table_name).tag_type_by_tag
     
     # Check for invalid tags
     invalid_tags = [tag for tag in tags if tag not in existing_tags]
@@ -522,11 +408,9 @@ def create_asset(request_model: CreateAssetRequestModel, claims_and_roles, s3Ext
         }
     }
     
-    # Save asset to DynamoDB
-    save_asset_details(asset)
-    
-    # Update asset count
-    update_asset_count(db_database, asset_storage_table_name, {}, databaseId)
+    # Save asset to DynamoDB and count it if the record is new
+    if save_asset_details(asset):
+        increment_asset_count(db_database, asset_storage_table_name, databaseId, 1)
     
     # Return response
     return CreateAssetResponseModel(
@@ -7,14 +7,15 @@ import os
 import boto3
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from common.constants import MAX_DIGEST_FILES
 from customLogging.logger import safeLogger
 from customLogging.auditLogging import log_file_upload
-from common.s3 import validateS3AssetExtensionsAndContentType
+from common.s3 import validateS3AssetExtensionsAndContentType, validateUnallowedFileExtensionAndContentType
 from models.common import VAMSGeneralErrorResponse
 
 # Configure AWS clients with retry configuration
@@ -35,6 +36,8 @@ logger = safeLogger(service_name="SqsUploadFileLarge")
 TEMPORARY_UPLOAD_PREFIX = 'temp-uploads/'
 PREVIEW_PREFIX = 'previews/'
 MAX_PREVIEW_FILE_SIZE = 5 * 1024 * 1024  # 5MB maximum size for preview files
+UPLOAD_CONTENT_TYPE = 'application/octet-stream'  # Content type fixed at multipart upload creation
+FINALIZATION_MODE_DIRECT = 'direct'  # Parts were uploaded to the final key; no copy on completion
 allowed_preview_extensions = ['.png', '.jpg', '.jpeg', '.svg', '.gif']
 
 # Load environment variables
@@ -132,7 +135,7 @@ def validate_sqs_message(message_data: Dict[str, Any], correlation_id: str = Non
         logger.exception(f"Error validating SQS message{correlation_suffix}: {e}")
         return False
 
-def create_zero_byte_file(bucket_name: str, key: str, upload_id: str, database_id: str, asset_id: str) -> bool:
+def create_zero_byte_file(bucket_name: str, key: str, upload_id: Optional[str], database_id: str, asset_id: str) -> bool:
     """
     Create a zero-byte file in S3.
     Ported from uploadFile.py.
@@ -140,7 +143,7 @@ def create_zero_byte_file(bucket_name: str, key: str, upload_id: str, database_i
     Args:
         bucket_name: The S3 bucket name
         key: The S3 object key
-        upload_id: The upload ID for metadata
+        upload_id: The upload ID for metadata (None when writing directly to the final key)
         database_id: The database ID for metadata
         asset_id: The asset ID for metadata
         
@@ -148,16 +151,19 @@ def create_zero_byte_file(bucket_name: str, key: str, upload_id: str, database_i
         True if successful, False otherwise
     """
     try:
+        metadata = {
+            "databaseid": database_id,
+            "assetid": asset_id,
+        }
+        if upload_id:
+            metadata["uploadid"] = upload_id
+
         s3.put_object(
             Bucket=bucket_name,
             Key=key,
             Body=b'',  # Empty content for zero-byte file
-            ContentType='application/octet-stream',
-            Metadata={
-                "databaseid": database_id,
-                "assetid": asset_id,
-                "uploadid": upload_id,
-            }
+            ContentType=UPLOAD_CONTENT_TYPE,
+            Metadata=metadata
         )
         logger.info(f"Created zero-byte file: {key}")
         return True
@@ -185,6 +191,31 @@ def delete_s3_object(bucket: str, key: str) -> bool:
         logger.exception(f"Error deleting S3 object {key}: {e}")
         return False
 
+def is_direct_finalization(file_info: Dict[str, Any]) -> bool:
+    """
+    Check if a file's multipart upload was created on its final key (direct finalization).
+    Messages queued before direct finalization existed have no mode and use the temporary key.
+    
+    Args:
+        file_info: Dictionary containing file processing information
+        
+    Returns:
+        True if the upload targets the final key, False if it targets the temporary key
+    """
+    return file_info.get('finalizationMode') == FINALIZATION_MODE_DIRECT
+
+def get_upload_s3_key(file_info: Dict[str, Any]) -> str:
+    """
+    Get the S3 key the multipart upload was created on.
+    
+    Args:
+        file_info: Dictionary containing file processing information
+        
+    Returns:
+        The final S3 key for direct finalization, otherwise the temporary S3 key
+    """
+    return file_info['finalS3Key'] if is_direct_finalization(file_info) else file_info['tempS3Key']
+
 def is_preview_file(file_path: str) -> bool:
     """
     Check if file is a preview file (.previewFile.X pattern).
@@ -265,7 +296,7 @@ def validate_preview_file_extension(file_path: str) -> bool:
     file_extension = os.path.splitext(file_path)[1].lower()
     return file_extension in allowed_preview_extensions
 
-def update_asset_after_file_processing(asset_id: str, database_id: str, bucket_name: str, final_s3_key: str):
+def update_asset_after_file_processing(asset_id: str, database_id: str, bucket_name: str, final_s3_key: str, relative_key: str):
     """
     Update asset record after successful file processing.
     Simplified version of the logic from uploadFile.py.
@@ -275,6 +306,7 @@ def update_asset_after_file_processing(asset_id: str, database_id: str, bucket_n
         database_id: The database ID
         bucket_name: The S3 bucket name
         final_s3_key: The final S3 key of the processed file
+        relative_key: The relative key of the processed file, listed in the subscribers' digest
     """
     try:
         # Get asset details
@@ -299,7 +331,7 @@ def update_asset_after_file_processing(asset_id: str, database_id: str, bucket_n
         save_asset_details(asset)
         
         # Send notification to subscribers
-        send_subscription_email(database_id, asset_id)
+        send_subscription_email(database_id, asset_id, [relative_key])
         
         logger.info(f"Updated asset {asset_id} after file processing")
         
@@ -505,7 +537,7 @@ def is_file_archived(bucket: str, key: str, version_id: str = None) -> bool:
         logger.warning(f"Error checking archive status for {key}: {e}")
         return False
 
-def send_subscription_email(database_id: str, asset_id: str):
+def send_subscription_email(database_id: str, asset_id: str, file_keys: list = None):
     """
     Send email notifications to subscribers when an asset is updated.
     Ported from uploadFile.py.
@@ -513,11 +545,17 @@ def send_subscription_email(database_id: str, asset_id: str):
     Args:
         database_id: The database ID
         asset_id: The asset ID
+        file_keys: Relative keys of the changed files, up to MAX_DIGEST_FILES of them are
+            listed in the subscribers' digest and the rest are only counted
     """
     try:
+        file_keys = file_keys or []
+        # Cap the listed keys to keep the payload within the async invoke and SQS message limits
         payload = {
             'databaseId': database_id,
             'assetId': asset_id,
+            'fileKeys': file_keys[:MAX_DIGEST_FILES],
+            'fileCount': len(file_keys),
         }
         lambda_client.invoke(
             FunctionName=send_email_function_name,
@@ -601,31 +639,35 @@ def cleanup_failed_processing(file_info: Dict[str, Any], correlation_ids: Dict[s
         bucket_name = file_info.get('bucketName')
         temp_s3_key = file_info.get('tempS3Key')
         upload_id_s3 = file_info.get('uploadIdS3')
+        direct = is_direct_finalization(file_info)
+        upload_s3_key = file_info.get('finalS3Key') if direct else temp_s3_key
         
-        if not bucket_name or not temp_s3_key:
+        if not bucket_name or not upload_s3_key:
             logger.warning(f"Insufficient information for cleanup - {correlation_str}")
             return
         
         logger.info(f"Starting cleanup after failed processing - {correlation_str}")
         
-        # Try to delete temporary file if it exists
-        try:
-            s3.head_object(Bucket=bucket_name, Key=temp_s3_key)
-            # File exists, delete it
-            delete_s3_object(bucket_name, temp_s3_key)
-            logger.info(f"Cleaned up temporary file: {temp_s3_key} - {correlation_str}")
-        except ClientError as e:
-            if e.response['Error']['Code'] == 'NoSuchKey':
-                logger.debug(f"Temporary file does not exist, no cleanup needed - {correlation_str}")
-            else:
-                logger.warning(f"Error checking temporary file existence during cleanup - {correlation_str}: {e}")
+        # Try to delete temporary file if it exists (a directly finalized file is never
+        # completed unless valid, and its final key may hold a previous version of the file)
+        if not direct:
+            try:
+                s3.head_object(Bucket=bucket_name, Key=temp_s3_key)
+                # File exists, delete it
+                delete_s3_object(bucket_name, temp_s3_key)
+                logger.info(f"Cleaned up temporary file: {temp_s3_key} - {correlation_str}")
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'NoSuchKey':
+                    logger.debug(f"Temporary file does not exist, no cleanup needed - {correlation_str}")
+                else:
+                    logger.warning(f"Error checking temporary file existence during cleanup - {correlation_str}: {e}")
         
         # Try to abort multipart upload if it's still active
         if upload_id_s3 and upload_id_s3 != "zero-byte":
             try:
                 s3.abort_multipart_upload(
                     Bucket=bucket_name,
-                    Key=temp_s3_key,
+                    Key=upload_s3_key,
                     UploadId=upload_id_s3
                 )
                 logger.info(f"Aborted multipart upload: {upload_id_s3} - {correlation_str}")
@@ -695,10 +737,19 @@ def validate_and_move_large_file(file_info: Dict[str, Any], correlation_ids: Dic
         database_id = file_info['databaseId']
         asset_id = file_info['assetId']
         
+        # Directly finalized files were validated before completion and are already at their final key
+        if is_direct_finalization(file_info):
+            logger.info(f"File {relative_key} finalized in place at {final_s3_key}, no move required")
+            if upload_type == "assetFile":
+                update_asset_after_file_processing(asset_id, database_id, bucket_name, final_s3_key, relative_key)
+            elif upload_type == "assetPreview":
+                update_asset_preview_location(asset_id, database_id, final_s3_key)
+            return True
+        
         logger.info(f"Validating and moving file {relative_key} from {temp_s3_key} to {final_s3_key}")
         
         # Validate file content type and check for malicious executables
-        if not validateS3AssetExtensionsAndContentType(bucket_name, temp_s3_key):
+        if not validateS3AssetExtensionsAndContentType(bucket_name, temp_s3_key, keys=[temp_s3_key]):
             logger.error(f"File {relative_key} contains a potentially malicious executable type object")
             # Delete the uploaded file
             delete_s3_object(bucket_name, temp_s3_key)
@@ -748,7 +799,7 @@ def validate_and_move_large_file(file_info: Dict[str, Any], correlation_ids: Dic
         
         # Update asset record if this is an assetFile upload
         if upload_type == "assetFile":
-            update_asset_after_file_processing(asset_id, database_id, bucket_name, final_s3_key)
+            update_asset_after_file_processing(asset_id, database_id, bucket_name, final_s3_key, relative_key)
         elif upload_type == "assetPreview":
             update_asset_preview_location(asset_id, database_id, final_s3_key)
         
@@ -762,7 +813,8 @@ def validate_and_move_large_file(file_info: Dict[str, Any], correlation_ids: Dic
 
 def complete_multipart_upload_for_large_file(file_info: Dict[str, Any], correlation_ids: Dict[str, str]) -> bool:
     """
-    Complete the multipart upload for a large file at the temporary location.
+    Complete the multipart upload for a large file at its upload location (the temporary
+    key, or the final key for directly finalized files, which are validated beforehand).
     Ported from uploadFile.py complete_upload function.
     
     Args:
@@ -781,13 +833,16 @@ def complete_multipart_upload_for_large_file(file_info: Dict[str, Any], correlat
         database_id = file_info['databaseId']
         asset_id = file_info['assetId']
         relative_key = file_info['relativeKey']
+        direct = is_direct_finalization(file_info)
+        upload_s3_key = get_upload_s3_key(file_info)
+        metadata_upload_id = None if direct else upload_id
         
-        logger.info(f"Completing multipart upload for {relative_key} at {temp_s3_key}")
+        logger.info(f"Completing multipart upload for {relative_key} at {upload_s3_key}")
         
         # Handle zero-byte files (identified by uploadIdS3 = "zero-byte")
         if upload_id_s3 == "zero-byte":
             logger.info(f"Creating zero-byte file {relative_key} during async processing")
-            return create_zero_byte_file(bucket_name, temp_s3_key, upload_id, database_id, asset_id)
+            return create_zero_byte_file(bucket_name, upload_s3_key, metadata_upload_id, database_id, asset_id)
         
         # Handle abandoned uploads (no parts provided) - create empty file
         if not parts or len(parts) == 0:
@@ -797,14 +852,14 @@ def complete_multipart_upload_for_large_file(file_info: Dict[str, Any], correlat
             try:
                 s3.abort_multipart_upload(
                     Bucket=bucket_name,
-                    Key=temp_s3_key,
+                    Key=upload_s3_key,
                     UploadId=upload_id_s3
                 )
             except Exception as abort_error:
                 logger.warning(f"Error aborting multipart upload for abandoned file: {abort_error}")
             
-            # Create empty file in temporary location
-            return create_zero_byte_file(bucket_name, temp_s3_key, upload_id, database_id, asset_id)
+            # Create empty file in the upload location
+            return create_zero_byte_file(bucket_name, upload_s3_key, metadata_upload_id, database_id, asset_id)
         
         # Regular multipart upload completion
         actual_parts = sorted([p['PartNumber'] for p in parts])
@@ -817,11 +872,24 @@ def complete_multipart_upload_for_large_file(file_info: Dict[str, Any], correlat
         # Log the parts we received
         logger.info(f"Received {len(actual_parts)} parts for file {relative_key}: {actual_parts}")
         
-        # Complete multipart upload in temporary location
+        # Directly finalized files are validated against their key and creation headers before completion
+        if direct and not validateUnallowedFileExtensionAndContentType(file_info['finalS3Key'], UPLOAD_CONTENT_TYPE):
+            logger.error(f"File {relative_key} contains a potentially malicious executable type object")
+            try:
+                s3.abort_multipart_upload(
+                    Bucket=bucket_name,
+                    Key=upload_s3_key,
+                    UploadId=upload_id_s3
+                )
+            except Exception as abort_error:
+                logger.warning(f"Error aborting multipart upload for unallowed file type: {abort_error}")
+            return False
+        
+        # Complete multipart upload in its upload location
         try:
             s3.complete_multipart_upload(
                 Bucket=bucket_name,
-                Key=temp_s3_key,
+                Key=upload_s3_key,
                 UploadId=upload_id_s3,
                 MultipartUpload={'Parts': [{'PartNumber': p['PartNumber'], 'ETag': p['ETag']} for p in parts]}
             )
@@ -833,7 +901,7 @@ def complete_multipart_upload_for_large_file(file_info: Dict[str, Any], correlat
             try:
                 s3.abort_multipart_upload(
                     Bucket=bucket_name,
-                    Key=temp_s3_key,
+                    Key=upload_s3_key,
                     UploadId=upload_id_s3
                 )
             except Exception as abort_error:
@@ -841,6 +909,11 @@ def complete_multipart_upload_for_large_file(file_info: Dict[str, Any], correlat
             
             return False
         
+        # Directly finalized files carry their final metadata from creation; the S3 upload ID
+        # was bound to the final key when the parts were listed during upload completion
+        if direct:
+            return True
+        
         # Verify the metadata of the completed object
         try:
             head_response = s3.head_object(
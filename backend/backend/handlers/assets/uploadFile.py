@@ -7,6 +7,7 @@ import json
 import uuid
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from datetime import datetime, timedelta
 from botocore.config import Config
@@ -14,7 +15,7 @@ from boto3.dynamodb.conditions import Key
 from boto3.dynamodb.types import TypeDeserializer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import parse, ValidationError
-from common.constants import STANDARD_JSON_RESPONSE
+from common.constants import STANDARD_JSON_RESPONSE, MAX_DIGEST_FILES
 from common.validators import validate
 from handlers.authz import CasbinEnforcer
 from handlers.auth import request_to_claims
@@ -22,11 +23,13 @@ from customLogging.logger import safeLogger
 from customLogging.auditLogging import log_file_upload
 from botocore.exceptions import ClientError
 from common.s3 import validateS3AssetExtensionsAndContentType, validateUnallowedFileExtensionAndContentType
+from common.previewIndex import lookup_preview_file_keys
 from models.common import APIGatewayProxyResponseV2, internal_error, success, validation_error, general_error, authorization_error, VAMSGeneralErrorResponse
 from models.assetsV3 import (
     InitializeUploadRequestModel, InitializeUploadResponseModel, UploadPartModel, UploadFileResponseModel,
     CompleteUploadRequestModel, CompleteUploadResponseModel, FileCompletionResult,
     CompleteExternalUploadRequestModel, ExternalFileModel,
+    CompleteUploadBatchRequestModel, CompleteUploadBatchResponseModel,
     AssetUploadTableModel
 )
 
@@ -44,7 +47,8 @@ s3_config = Config(
     retries={
         'max_attempts': 5,
         'mode': 'adaptive'
-    }
+    },
+    max_pool_connections=16  # Matches MAX_COMPLETION_WORKERS for concurrent file completion
 )
 
 s3 = boto3.client('s3', region_name=region, config=s3_config)
@@ -63,6 +67,10 @@ MAX_PART_SIZE = 150 * 1024 * 1024  # 150MB per part
 MAX_PREVIEW_FILE_SIZE = 5 * 1024 * 1024  # 5MB maximum size for preview files
 MAX_ALLOWED_UPLOAD_PERUSER_PERMINUTE = 20
 LARGE_FILE_THRESHOLD_BYTES = 1 * 1024 * 1024 * 1024   # 1GB threshold for asynchronous processing
+UPLOAD_CONTENT_TYPE = 'application/octet-stream'  # Content type fixed at multipart upload creation
+FINALIZATION_MODE_DIRECT = 'direct'  # Parts are uploaded to the final key; no copy on completion
+FINALIZATION_MODE_TEMPORARY = 'temporary'  # Parts are uploaded to a quarantine key and copied on completion
+MAX_COMPLETION_WORKERS = 16  # Concurrent file completions / copies per request
 allowed_preview_extensions = ['.png', '.jpg', '.jpeg', '.svg', '.gif']
 
 # Load environment variables
@@ -74,6 +82,7 @@ try:
     send_email_function_name = os.environ["SEND_EMAIL_FUNCTION_NAME"]
     token_timeout = os.environ["PRESIGNED_URL_TIMEOUT_SECONDS"]
     large_file_processing_queue_url = os.environ.get("LARGE_FILE_PROCESSING_QUEUE_URL")
+    upload_finalization_mode = os.environ.get("UPLOAD_FINALIZATION_MODE", FINALIZATION_MODE_DIRECT)
 except Exception as e:
     logger.exception("Failed loading environment variables")
     raise e
@@ -437,12 +446,20 @@ def determine_asset_type(assetId, bucket, prefix):
         logger.exception(f"Error determining asset type: {e}")
         return None
 
-def send_subscription_email(database_id, asset_id):
-    """Send email notifications to subscribers when an asset is updated"""
+def send_subscription_email(database_id, asset_id, file_keys=None):
+    """Send email notifications to subscribers when an asset is updated
+    
+    Up to MAX_DIGEST_FILES changed file keys are sent and listed in the subscribers' digest
+    for the asset, the remaining files are only counted.
+    """
     try:
+        file_keys = file_keys or []
+        # Cap the listed keys to keep the payload within the async invoke and SQS message limits
         payload = {
             'databaseId': database_id,
             'assetId': asset_id,
+            'fileKeys': file_keys[:MAX_DIGEST_FILES],
+            'fileCount': len(file_keys),
         }
         lambda_client.invoke(
             FunctionName=send_email_function_name,
@@ -680,6 +697,11 @@ def find_existing_preview_files(bucket: str, base_file_key: str) -> List[str]:
     Returns:
         List of preview file keys
     """
+    # Preview-existence index answers with a single key read when it has a record
+    indexed_preview_keys = lookup_preview_file_keys(bucket, base_file_key)
+    if indexed_preview_keys is not None:
+        return indexed_preview_keys
+
     preview_files = []
     
     try:
@@ -739,13 +761,13 @@ def delete_existing_preview_files(bucket: str, base_file_key: str) -> List[str]:
     
     return deleted_files
 
-def create_zero_byte_file(bucket_name: str, key: str, upload_id: str, database_id: str, asset_id: str) -> bool:
+def create_zero_byte_file(bucket_name: str, key: str, upload_id: Optional[str], database_id: str, asset_id: str) -> bool:
     """Create a zero-byte file in S3
     
     Args:
         bucket_name: The S3 bucket name
         key: The S3 object key
-        upload_id: The upload ID for metadata
+        upload_id: The upload ID for metadata (None when writing directly to the final key)
         database_id: The database ID for metadata
         asset_id: The asset ID for metadata
         
@@ -753,16 +775,19 @@ def create_zero_byte_file(bucket_name: str, key: str, upload_id: str, database_i
         True if successful, False otherwise
     """
     try:
+        metadata = {
+            "databaseid": database_id,
+            "assetid": asset_id,
+        }
+        if upload_id:
+            metadata["uploadid"] = upload_id
+
         s3.put_object(
             Bucket=bucket_name,
             Key=key,
             Body=b'',  # Empty content for zero-byte file
-            ContentType='application/octet-stream',
-            Metadata={
-                "databaseid": database_id,
-                "assetid": asset_id,
-                "uploadid": upload_id,
-            }
+            ContentType=UPLOAD_CONTENT_TYPE,
+            Metadata=metadata
         )
         logger.info(f"Created zero-byte file: {key}")
         return True
@@ -807,6 +832,27 @@ def get_completed_file_size(bucket_name: str, key: str) -> int:
         logger.warning(f"Unexpected error getting file size for {key}: {e}")
         return 0
 
+def requires_quarantine(upload_type: str, relative_key: str, finalization_mode: Optional[str]) -> bool:
+    """Determine if a file must be uploaded to a temporary key and copied on completion
+    
+    Direct finalization uploads parts to the final key and validates extension, content type
+    and size against the upload's parts and creation headers before completing, so the object
+    is written once. Preview uploads keep the temporary path because they are validated against
+    their base files after completion (and are small enough that the copy is cheap). Uploads
+    initialized before direct finalization existed have no mode and also keep the temporary path.
+    
+    Args:
+        upload_type: The upload type (assetFile or assetPreview)
+        relative_key: The relative key of the file
+        finalization_mode: The finalization mode recorded for the upload
+        
+    Returns:
+        True if the file must use the temporary key, False if it can be finalized in place
+    """
+    if finalization_mode != FINALIZATION_MODE_DIRECT:
+        return True
+    return upload_type == "assetPreview" or is_preview_file(relative_key)
+
 def should_process_asynchronously(file_size: int) -> bool:
     """Determine if file should be processed asynchronously based on size
     
@@ -1013,6 +1059,7 @@ def initialize_upload(request_model: InitializeUploadRequestModel, claims_and_ro
     # Process files
     file_responses = []
     total_parts = 0
+    finalization_mode = FINALIZATION_MODE_DIRECT if upload_finalization_mode == FINALIZATION_MODE_DIRECT else FINALIZATION_MODE_TEMPORARY
             
     # Get bucket details from asset's bucketId
     bucketDetails = get_default_bucket_details(asset['bucketId'])
@@ -1041,6 +1088,10 @@ def initialize_upload(request_model: InitializeUploadRequestModel, claims_and_ro
         # Determine temporary S3 key by adding temp prefix to final key
         temp_s3_key = f"{baseAssetsPrefix}{TEMPORARY_UPLOAD_PREFIX}{final_s3_key}"
         
+        # Files finalized in place are uploaded straight to the final key with their final metadata
+        quarantined = requires_quarantine(uploadType, file.relativeKey, finalization_mode)
+        upload_s3_key = temp_s3_key if quarantined else final_s3_key
+        
         # Calculate number of parts
         num_parts = calculate_num_parts(file.file_size, file.num_parts)
         total_parts += num_parts
@@ -1056,16 +1107,20 @@ def initialize_upload(request_model: InitializeUploadRequestModel, claims_and_ro
                 partUploadUrls=[]  # No presigned URLs needed
             ))
         else:
-            # Create multipart upload in temporary location with uploadId in metadata
+            metadata = {
+                "databaseid": databaseId,
+                "assetid": assetId,
+            }
+            if quarantined:
+                # Store the overall uploadId in S3 metadata for verification after completion
+                metadata["uploadid"] = uploadId
+
+            # Create multipart upload (temporary location for quarantined files, final location otherwise)
             resp = s3.create_multipart_upload(
                 Bucket=bucket_name,
-                Key=temp_s3_key,
-                ContentType='application/octet-stream',
-                Metadata={
-                    "databaseid": databaseId,
-                    "assetid": assetId,
-                    "uploadid": uploadId,  # Store the overall uploadId in S3 metadata
-                }
+                Key=upload_s3_key,
+                ContentType=UPLOAD_CONTENT_TYPE,
+                Metadata=metadata
             )
             s3_upload_id = resp['UploadId']
             
@@ -1073,7 +1128,7 @@ def initialize_upload(request_model: InitializeUploadRequestModel, claims_and_ro
             part_urls = []
             for part_number in range(1, num_parts + 1):
                 url = generate_presigned_url(
-                    temp_s3_key, 
+                    upload_s3_key, 
                     s3_upload_id, 
                     part_number, 
                     bucket_name
@@ -1102,6 +1157,7 @@ def initialize_upload(request_model: InitializeUploadRequestModel, claims_and_ro
         totalFiles=len(request_model.files),
         totalParts=total_parts,
         status="initialized",
+        finalizationMode=finalization_mode,
         UserId=user_id  # Include user ID for rate limiting
     )
     save_upload_details(upload_record)
@@ -1307,7 +1363,7 @@ def complete_external_upload(uploadId: str, request_model: CompleteExternalUploa
                 continue
             
             # Validate file content type
-            if not validateS3AssetExtensionsAndContentType(bucket_name, file.tempKey):
+            if not validateS3AssetExtensionsAndContentType(bucket_name, file.tempKey, keys=[file.tempKey]):
                 file_results.append(FileCompletionResult(
                     relativeKey=file.relativeKey,
                     uploadIdS3="external",
@@ -1503,7 +1559,7 @@ def complete_external_upload(uploadId: str, request_model: CompleteExternalUploa
         save_asset_details(asset)
         
         # Send notification to subscribers
-        send_subscription_email(databaseId, assetId)
+        send_subscription_email(databaseId, assetId, [f.relativeKey for f in file_results if f.success])
         
     elif uploadType == "assetPreview" and file_results[0].success:
         # Find the successful preview file
@@ -1579,536 +1635,616 @@ def complete_external_upload(uploadId: str, request_model: CompleteExternalUploa
     else:
         return response
 
-def complete_upload(uploadId: str, request_model: CompleteUploadRequestModel, event):
-    """Complete a multipart upload and update the asset"""
-    assetId = request_model.assetId
-    databaseId = request_model.databaseId
-    uploadType = request_model.uploadType
-    
-    # Get upload details from DynamoDB (just for basic validation)
-    upload_details = get_upload_details(uploadId, assetId)
-    
-    # Verify asset exists
-    asset = get_asset_details(databaseId, assetId)
-    if not asset:
-        raise VAMSGeneralErrorResponse("Asset not found")
+def build_completion_context(asset: dict, databaseId: str, assetId: str, uploadType: str) -> dict:
+    """Look up the bucket and database details shared by every file completed for an asset
     
-    # Verify upload details match request
-    if upload_details['assetId'] != assetId or upload_details['databaseId'] != databaseId:
-        raise VAMSGeneralErrorResponse("Upload details do not match request")
+    Args:
+        asset: The asset record
+        databaseId: The database ID
+        assetId: The asset ID
+        uploadType: The upload type (assetFile or assetPreview)
         
-    # Verify upload type matches
-    if upload_details['uploadType'] != uploadType:
-        raise VAMSGeneralErrorResponse(f"Upload type mismatch.")
-    
-    # Update upload status in DynamoDB
-    try:
-        # Use both uploadId and assetId as the key
-        asset_upload_table.update_item(
-            Key={
-                'uploadId': uploadId,
-                'assetId': assetId
-            },
-            UpdateExpression="SET #status = :status",
-            ExpressionAttributeNames={'#status': 'status'},
-            ExpressionAttributeValues={':status': 'processing'}
-        )
-    except Exception as e:
-        logger.warning(f"Failed to update upload status: {e}")
-
+    Returns:
+        Completion context dictionary used by complete_upload_file and the finalization helpers
+    """
     # Get bucket details from asset's bucketId
     bucketDetails = get_default_bucket_details(asset['bucketId'])
-    bucket_name = bucketDetails['bucketName']
-    baseAssetsPrefix = bucketDetails['baseAssetsPrefix']
     
     # Get database details to check file upload restrictions
     database = get_database_details(databaseId)
     if not database:
         raise VAMSGeneralErrorResponse("Database not found")
     
-    allowed_extensions = database.get('restrictFileUploadsToExtensions', '')
+    return {
+        'asset': asset,
+        'assetId': assetId,
+        'databaseId': databaseId,
+        'uploadType': uploadType,
+        'bucketName': bucketDetails['bucketName'],
+        'baseAssetsPrefix': bucketDetails['baseAssetsPrefix'],
+        'allowedExtensions': database.get('restrictFileUploadsToExtensions', ''),
+    }
+
+def complete_upload_file(file, uploadId: str, finalization_mode: Optional[str], completion_context: dict, request_files: list, event) -> tuple:
+    """Complete a single file of a multipart upload (completion, validation and metadata checks)
     
-    # Track file completion results
-    file_results = []
-    successful_files = []
-    has_failures = False
+    Moving quarantined files to their final location and asset record updates are done by the
+    caller once all files of the request have been completed.
     
-    # Complete multipart uploads for each file
-    for file in request_model.files:
-        try:
-            # Validate file extension if restrictions are configured
-            # Only apply to regular asset files, not asset previews or file preview files
-            if allowed_extensions and allowed_extensions.strip() != "" and uploadType == "assetFile":
-                # Skip validation for .previewFile. files (they have their own extension restrictions)
-                if not is_preview_file(file.relativeKey):
-                    is_valid, error_message = validate_file_extension_against_database(
-                        file.relativeKey, 
-                        allowed_extensions
-                    )
-                    if not is_valid:
-                        # Mark this file as failed
-                        file_results.append(FileCompletionResult(
-                            relativeKey=file.relativeKey,
-                            uploadIdS3=file.uploadIdS3,
-                            success=False,
-                            error=error_message
-                        ))
-                        has_failures = True
-                        
-                        # Abort the multipart upload if it exists
-                        if file.uploadIdS3 != "zero-byte":
-                            try:
-                                # Construct temp key to abort the upload
-                                asset_base_key = asset.get('assetLocation', {}).get('Key', f"{baseAssetsPrefix}{assetId}/")
-                                final_s3_key = normalize_s3_path(asset_base_key, file.relativeKey)
-                                temp_s3_key = f"{baseAssetsPrefix}{TEMPORARY_UPLOAD_PREFIX}{final_s3_key}"
-                                
-                                s3.abort_multipart_upload(
-                                    Bucket=bucket_name,
-                                    Key=temp_s3_key,
-                                    UploadId=file.uploadIdS3
-                                )
-                            except Exception as abort_error:
-                                logger.warning(f"Error aborting multipart upload for invalid extension: {abort_error}")
-                        continue
-            
-            # Construct the temporary S3 key directly (same logic as initialization)
-            if uploadType == "assetFile":
-                # Get the asset's base key from assetLocation
-                asset_base_key = asset.get('assetLocation', {}).get('Key', f"{baseAssetsPrefix}{assetId}/")
-                final_s3_key = normalize_s3_path(asset_base_key, file.relativeKey)
-            else:  # assetPreview
-                #We only want the filename and none of the path if there is a path
-                filename = os.path.basename(file.relativeKey)
-                final_s3_key = f"{baseAssetsPrefix}{PREVIEW_PREFIX}{assetId}/{filename}"
-                
-            temp_s3_key = f"{baseAssetsPrefix}{TEMPORARY_UPLOAD_PREFIX}{final_s3_key}"
-            
-            # Handle zero-byte files (identified by uploadIdS3 = "zero-byte")
-            if file.uploadIdS3 == "zero-byte":
-                # Create zero-byte file now during completion
-                logger.info(f"Creating zero-byte file {file.relativeKey} during completion")
-                
-                if create_zero_byte_file(bucket_name, temp_s3_key, uploadId, databaseId, assetId):
-                    # Create file detail for zero-byte file
-                    file_detail = {
-                        'relativeKey': file.relativeKey,
-                        'temp_s3_key': temp_s3_key,
-                        'final_s3_key': final_s3_key,
-                        'uploadIdS3': file.uploadIdS3
-                    }
-                    
-                    successful_files.append(file_detail)
-                    file_results.append(FileCompletionResult(
-                        relativeKey=file.relativeKey,
-                        uploadIdS3=file.uploadIdS3,
-                        success=True,
-                        largeFileAsynchronousHandling=False
-                    ))
-                    continue
-                else:
-                    file_results.append(FileCompletionResult(
+    Args:
+        file: The file model from the completion request
+        uploadId: The VAMS upload ID the file belongs to
+        finalization_mode: The finalization mode recorded for the upload
+        completion_context: Asset, bucket and database details shared by all files of the request
+        request_files: All files in the request (used to find base files for preview files)
+        event: The API Gateway event (for audit logging)
+        
+    Returns:
+        Tuple of (FileCompletionResult, file detail dict if the file succeeded and was not queued, else None)
+    """
+    asset = completion_context['asset']
+    assetId = completion_context['assetId']
+    databaseId = completion_context['databaseId']
+    uploadType = completion_context['uploadType']
+    bucket_name = completion_context['bucketName']
+    baseAssetsPrefix = completion_context['baseAssetsPrefix']
+    allowed_extensions = completion_context['allowedExtensions']
+    upload_s3_key = None
+    
+    try:
+        # Validate file extension if restrictions are configured
+        # Only apply to regular asset files, not asset previews or file preview files
+        if allowed_extensions and allowed_extensions.strip() != "" and uploadType == "assetFile":
+            # Skip validation for .previewFile. files (they have their own extension restrictions)
+            if not is_preview_file(file.relativeKey):
+                is_valid, error_message = validate_file_extension_against_database(
+                    file.relativeKey, 
+                    allowed_extensions
+                )
+                if not is_valid:
+                    # Mark this file as failed
+                    result = FileCompletionResult(
                         relativeKey=file.relativeKey,
                         uploadIdS3=file.uploadIdS3,
                         success=False,
-                        error="Failed to create zero-byte file"
-                    ))
-                    has_failures = True
-                    continue
-            
-            # Handle abandoned uploads (no parts provided) - create empty file
-            if not file.parts or len(file.parts) == 0:
-                logger.info(f"No parts provided for file {file.relativeKey}, creating empty file")
-                
-                # Abort the existing multipart upload
-                try:
-                    s3.abort_multipart_upload(
-                        Bucket=bucket_name,
-                        Key=temp_s3_key,
-                        UploadId=file.uploadIdS3
+                        error=error_message
                     )
-                except Exception as abort_error:
-                    logger.warning(f"Error aborting multipart upload for abandoned file: {abort_error}")
-                
-                # Create empty file in temporary location
-                if create_zero_byte_file(bucket_name, temp_s3_key, uploadId, databaseId, assetId):
-                    file_detail = {
-                        'relativeKey': file.relativeKey,
-                        'temp_s3_key': temp_s3_key,
-                        'final_s3_key': final_s3_key,
-                        'uploadIdS3': file.uploadIdS3
-                    }
                     
-                    successful_files.append(file_detail)
-                    file_results.append(FileCompletionResult(
-                        relativeKey=file.relativeKey,
-                        uploadIdS3=file.uploadIdS3,
-                        success=True,
-                        largeFileAsynchronousHandling=False
-                    ))
-                    continue
-                else:
-                    file_results.append(FileCompletionResult(
-                        relativeKey=file.relativeKey,
-                        uploadIdS3=file.uploadIdS3,
-                        success=False,
-                        error="Failed to create empty file for abandoned upload"
-                    ))
-                    has_failures = True
-                    continue
-            
-            # Regular multipart upload - first check file size before completing
-            actual_parts = sorted([p.PartNumber for p in file.parts])
+                    # Abort the multipart upload if it exists
+                    if file.uploadIdS3 != "zero-byte":
+                        try:
+                            # Construct the upload key (temporary or final) to abort the upload
+                            asset_base_key = asset.get('assetLocation', {}).get('Key', f"{baseAssetsPrefix}{assetId}/")
+                            final_s3_key = normalize_s3_path(asset_base_key, file.relativeKey)
+                            upload_s3_key = final_s3_key
+                            if requires_quarantine(uploadType, file.relativeKey, finalization_mode):
+                                upload_s3_key = f"{baseAssetsPrefix}{TEMPORARY_UPLOAD_PREFIX}{final_s3_key}"
+
+                            s3.abort_multipart_upload(
+                                Bucket=bucket_name,
+                                Key=upload_s3_key,
+                                UploadId=file.uploadIdS3
+                            )
+                        except Exception as abort_error:
+                            logger.warning(f"Error aborting multipart upload for invalid extension: {abort_error}")
+                    return result, None
+        
+        # Construct the temporary S3 key directly (same logic as initialization)
+        if uploadType == "assetFile":
+            # Get the asset's base key from assetLocation
+            asset_base_key = asset.get('assetLocation', {}).get('Key', f"{baseAssetsPrefix}{assetId}/")
+            final_s3_key = normalize_s3_path(asset_base_key, file.relativeKey)
+        else:  # assetPreview
+            #We only want the filename and none of the path if there is a path
+            filename = os.path.basename(file.relativeKey)
+            final_s3_key = f"{baseAssetsPrefix}{PREVIEW_PREFIX}{assetId}/{filename}"
             
-            # Check for duplicates in part numbers
-            if len(actual_parts) != len(set(actual_parts)):
-                file_results.append(FileCompletionResult(
+        temp_s3_key = f"{baseAssetsPrefix}{TEMPORARY_UPLOAD_PREFIX}{final_s3_key}"
+
+        # Key the multipart upload was created on (same logic as initialization)
+        quarantined = requires_quarantine(uploadType, file.relativeKey, finalization_mode)
+        upload_s3_key = temp_s3_key if quarantined else final_s3_key
+
+        # Handle zero-byte files (identified by uploadIdS3 = "zero-byte")
+        if file.uploadIdS3 == "zero-byte":
+            # Create zero-byte file now during completion
+            logger.info(f"Creating zero-byte file {file.relativeKey} during completion")
+
+            if create_zero_byte_file(bucket_name, upload_s3_key, uploadId if quarantined else None, databaseId, assetId):
+                # Create file detail for zero-byte file
+                file_detail = {
+                    'relativeKey': file.relativeKey,
+                    'temp_s3_key': temp_s3_key,
+                    'final_s3_key': final_s3_key,
+                    'uploadIdS3': file.uploadIdS3,
+                    'finalized': not quarantined
+                }
+                
+                result = FileCompletionResult(
                     relativeKey=file.relativeKey,
                     uploadIdS3=file.uploadIdS3,
-                    success=False,
-                    error=f"Duplicate part numbers provided"
-                ))
-                has_failures = True
-                continue
-            
-            # Log the parts we received
-            logger.info(f"Received {len(actual_parts)} parts for file {file.relativeKey}: {actual_parts}")
-            
-            # Calculate total file size by listing parts before completing upload
-            total_file_size, size_calc_success, size_calc_error = calculate_total_file_size_from_parts(
-                bucket_name, temp_s3_key, file.uploadIdS3, file.parts
-            )
-            
-            if not size_calc_success:
-                file_results.append(FileCompletionResult(
+                    success=True,
+                    largeFileAsynchronousHandling=False
+                )
+                return result, file_detail
+            else:
+                result = FileCompletionResult(
                     relativeKey=file.relativeKey,
                     uploadIdS3=file.uploadIdS3,
                     success=False,
-                    error=size_calc_error
-                ))
-                has_failures = True
-                continue
-                
-            logger.info(f"File {file.relativeKey} total size: {total_file_size} bytes")
+                    error="Failed to create zero-byte file"
+                )
+                return result, None
+        
+        # Handle abandoned uploads (no parts provided) - create empty file
+        if not file.parts or len(file.parts) == 0:
+            logger.info(f"No parts provided for file {file.relativeKey}, creating empty file")
             
-            # Check file size for preview files - both assetPreview type and .previewFile. files
-            if (uploadType == "assetPreview" or is_preview_file(file.relativeKey)) and total_file_size > MAX_PREVIEW_FILE_SIZE:
-                # Abort the multipart upload since it exceeds the size limit
-                try:
-                    s3.abort_multipart_upload(
-                        Bucket=bucket_name,
-                        Key=temp_s3_key,
-                        UploadId=file.uploadIdS3
-                    )
-                except Exception as abort_error:
-                    logger.warning(f"Error aborting multipart upload for oversized preview file: {abort_error}")
+            # Abort the existing multipart upload
+            try:
+                s3.abort_multipart_upload(
+                    Bucket=bucket_name,
+                    Key=upload_s3_key,
+                    UploadId=file.uploadIdS3
+                )
+            except Exception as abort_error:
+                logger.warning(f"Error aborting multipart upload for abandoned file: {abort_error}")
+
+            # Create empty file in the upload location
+            if create_zero_byte_file(bucket_name, upload_s3_key, uploadId if quarantined else None, databaseId, assetId):
+                file_detail = {
+                    'relativeKey': file.relativeKey,
+                    'temp_s3_key': temp_s3_key,
+                    'final_s3_key': final_s3_key,
+                    'uploadIdS3': file.uploadIdS3,
+                    'finalized': not quarantined
+                }
                 
-                file_results.append(FileCompletionResult(
+                result = FileCompletionResult(
+                    relativeKey=file.relativeKey,
+                    uploadIdS3=file.uploadIdS3,
+                    success=True,
+                    largeFileAsynchronousHandling=False
+                )
+                return result, file_detail
+            else:
+                result = FileCompletionResult(
                     relativeKey=file.relativeKey,
                     uploadIdS3=file.uploadIdS3,
                     success=False,
-                    error=f"Preview file exceeds maximum allowed size of 5MB"
-                ))
-                has_failures = True
-                continue
-            
-            # Check if file should be processed asynchronously based on size
-            process_async = should_process_asynchronously(total_file_size)
-            
-            if process_async:
-                logger.info(f"File {file.relativeKey} ({total_file_size} bytes) will be processed asynchronously")
-                
-                # Create file info for SQS message - DO NOT complete the multipart upload yet
-                file_info = {
-                    "relativeKey": file.relativeKey,
-                    "uploadIdS3": file.uploadIdS3,
-                    "parts": [{"PartNumber": p.PartNumber, "ETag": p.ETag} for p in file.parts],
-                    "tempS3Key": temp_s3_key,
-                    "finalS3Key": final_s3_key,
-                    "bucketName": bucket_name,
-                    "databaseId": databaseId,
-                    "assetId": assetId,
-                    "uploadId": uploadId,
-                    "uploadType": uploadType,
-                    "totalFileSize": total_file_size
-                }
-                
-                # Try to queue the file for asynchronous processing
-                if queue_large_file_for_processing(file_info, large_file_processing_queue_url):
-                    # Successfully queued - mark as successful with async flag
-                    # DO NOT add to successful_files since we haven't completed the upload yet
-                    file_results.append(FileCompletionResult(
-                        relativeKey=file.relativeKey,
-                        uploadIdS3=file.uploadIdS3,
-                        success=True,
-                        largeFileAsynchronousHandling=True
-                    ))
-                    logger.info(f"Large file {file.relativeKey} queued for asynchronous processing")
-                    continue
-                else:
-                    # Failed to queue - fall back to synchronous processing
-                    logger.warning(f"Failed to queue large file {file.relativeKey}, falling back to synchronous processing")
-                    process_async = False
+                    error="Failed to create empty file for abandoned upload"
+                )
+                return result, None
+        
+        # Regular multipart upload - first check file size before completing
+        actual_parts = sorted([p.PartNumber for p in file.parts])
+        
+        # Check for duplicates in part numbers
+        if len(actual_parts) != len(set(actual_parts)):
+            result = FileCompletionResult(
+                relativeKey=file.relativeKey,
+                uploadIdS3=file.uploadIdS3,
+                success=False,
+                error=f"Duplicate part numbers provided"
+            )
+            return result, None
+        
+        # Log the parts we received
+        logger.info(f"Received {len(actual_parts)} parts for file {file.relativeKey}: {actual_parts}")
+        
+        # Calculate total file size by listing parts before completing upload
+        # (this also verifies the S3 upload ID belongs to the expected upload key)
+        total_file_size, size_calc_success, size_calc_error = calculate_total_file_size_from_parts(
+            bucket_name, upload_s3_key, file.uploadIdS3, file.parts
+        )
+        
+        if not size_calc_success:
+            result = FileCompletionResult(
+                relativeKey=file.relativeKey,
+                uploadIdS3=file.uploadIdS3,
+                success=False,
+                error=size_calc_error
+            )
+            return result, None
             
-            # Complete multipart upload synchronously (for small files or fallback)
+        logger.info(f"File {file.relativeKey} total size: {total_file_size} bytes")
+        
+        # Check file size for preview files - both assetPreview type and .previewFile. files
+        if (uploadType == "assetPreview" or is_preview_file(file.relativeKey)) and total_file_size > MAX_PREVIEW_FILE_SIZE:
+            # Abort the multipart upload since it exceeds the size limit
             try:
-                s3.complete_multipart_upload(
+                s3.abort_multipart_upload(
                     Bucket=bucket_name,
-                    Key=temp_s3_key,
-                    UploadId=file.uploadIdS3,
-                    MultipartUpload={'Parts': [{'PartNumber': p.PartNumber, 'ETag': p.ETag} for p in file.parts]}
+                    Key=upload_s3_key,
+                    UploadId=file.uploadIdS3
                 )
-            except Exception as e:
-                logger.exception(f"Error completing multipart upload for {file.relativeKey}: {e}")
-                
-                # Abort the multipart upload to clean up S3 resources
-                try:
-                    s3.abort_multipart_upload(
-                        Bucket=bucket_name,
-                        Key=temp_s3_key,
-                        UploadId=file.uploadIdS3
-                    )
-                except Exception as abort_error:
-                    logger.exception(f"Error aborting multipart upload: {abort_error}")
-                
-                file_results.append(FileCompletionResult(
-                    relativeKey=file.relativeKey,
-                    uploadIdS3=file.uploadIdS3,
-                    success=False,
-                    error=f"Error completing multipart upload."
-                ))
-                has_failures = True
-                continue
+            except Exception as abort_error:
+                logger.warning(f"Error aborting multipart upload for oversized preview file: {abort_error}")
             
-            # Now verify the metadata of the completed object
+            result = FileCompletionResult(
+                relativeKey=file.relativeKey,
+                uploadIdS3=file.uploadIdS3,
+                success=False,
+                error=f"Preview file exceeds maximum allowed size of 5MB"
+            )
+            return result, None
+        
+        # Files finalized in place are validated against their key and creation headers before
+        # completion, since there is no temporary object to inspect and discard afterwards
+        if not quarantined and not validateUnallowedFileExtensionAndContentType(final_s3_key, UPLOAD_CONTENT_TYPE):
             try:
-                head_response = s3.head_object(
+                s3.abort_multipart_upload(
                     Bucket=bucket_name,
-                    Key=temp_s3_key
+                    Key=upload_s3_key,
+                    UploadId=file.uploadIdS3
                 )
-                
-                # Extract metadata
-                metadata = head_response.get('Metadata', {})
-                s3_upload_id = metadata.get('uploadid')
-                
-                # Get file size with error handling
-                file_size = 0
-                try:
-                    file_size = head_response.get('ContentLength', 0)
-                    if file_size is None:
-                        logger.warning(f"ContentLength is None for file {file.relativeKey}, defaulting to 0")
-                        file_size = 0
-                except Exception as size_error:
-                    logger.warning(f"Error getting file size for {file.relativeKey}: {size_error}")
-                    # Default to 0 for unknown file sizes (will process synchronously)
-                    file_size = 0
-                
-                # Verify the uploadId matches
-                if s3_upload_id != uploadId:
-                    # Delete the uploaded file since metadata doesn't match
-                    delete_s3_object(bucket_name, temp_s3_key)
-                    
-                    file_results.append(FileCompletionResult(
-                        relativeKey=file.relativeKey,
-                        uploadIdS3=file.uploadIdS3,
-                        success=False,
-                        error=f"Upload ID mismatch."
-                    ))
-                    has_failures = True
-                    continue
-                
-                # Check file size for preview files - both assetPreview type and .previewFile. files
-                if (uploadType == "assetPreview" or is_preview_file(file.relativeKey)) and file_size > MAX_PREVIEW_FILE_SIZE:
-                    # Delete the uploaded file since it exceeds the size limit
-                    delete_s3_object(bucket_name, temp_s3_key)
-                    
-                    file_results.append(FileCompletionResult(
-                        relativeKey=file.relativeKey,
-                        uploadIdS3=file.uploadIdS3,
-                        success=False,
-                        error=f"Preview file exceeds maximum allowed size of 5MB"
-                    ))
-                    has_failures = True
-                    continue
-                
-                # At this point, we've already completed the multipart upload synchronously
-                # (large files would have been queued earlier and continued)
-                
-            except Exception as e:
-                # Delete the uploaded file since we couldn't verify metadata
-                delete_s3_object(bucket_name, temp_s3_key)
-                
-                logger.exception(f"Error verifying file metadata: {e}")
-                file_results.append(FileCompletionResult(
+            except Exception as abort_error:
+                logger.warning(f"Error aborting multipart upload for unallowed file type: {abort_error}")
+
+            # AUDIT LOG: Malicious file detected and upload denied
+            log_file_upload(
+                event,
+                databaseId,
+                assetId,
+                file.relativeKey,
+                True,  # Upload denied
+                "File contains potentially malicious executable type",
+                {
+                    "uploadId": uploadId,
+                    "uploadType": uploadType
+                }
+            )
+
+            result = FileCompletionResult(
+                relativeKey=file.relativeKey,
+                uploadIdS3=file.uploadIdS3,
+                success=False,
+                error="File contains a potentially malicious executable type object"
+            )
+            return result, None
+
+        # Check if file should be processed asynchronously based on size
+        process_async = should_process_asynchronously(total_file_size)
+        
+        if process_async:
+            logger.info(f"File {file.relativeKey} ({total_file_size} bytes) will be processed asynchronously")
+            
+            # Create file info for SQS message - DO NOT complete the multipart upload yet
+            file_info = {
+                "relativeKey": file.relativeKey,
+                "uploadIdS3": file.uploadIdS3,
+                "parts": [{"PartNumber": p.PartNumber, "ETag": p.ETag} for p in file.parts],
+                "tempS3Key": temp_s3_key,
+                "finalS3Key": final_s3_key,
+                "bucketName": bucket_name,
+                "databaseId": databaseId,
+                "assetId": assetId,
+                "uploadId": uploadId,
+                "uploadType": uploadType,
+                "totalFileSize": total_file_size,
+                "finalizationMode": FINALIZATION_MODE_TEMPORARY if quarantined else FINALIZATION_MODE_DIRECT
+            }
+            
+            # Try to queue the file for asynchronous processing
+            if queue_large_file_for_processing(file_info, large_file_processing_queue_url):
+                # Successfully queued - mark as successful with async flag
+                # DO NOT add to successful_files since we haven't completed the upload yet
+                result = FileCompletionResult(
                     relativeKey=file.relativeKey,
                     uploadIdS3=file.uploadIdS3,
-                    success=False,
-                    error=f"Error verifying file metadata."
-                ))
-                has_failures = True
-                continue
+                    success=True,
+                    largeFileAsynchronousHandling=True
+                )
+                logger.info(f"Large file {file.relativeKey} queued for asynchronous processing")
+                return result, None
+            else:
+                # Failed to queue - fall back to synchronous processing
+                logger.warning(f"Failed to queue large file {file.relativeKey}, falling back to synchronous processing")
+                process_async = False
+        
+        # Complete multipart upload synchronously (for small files or fallback)
+        try:
+            s3.complete_multipart_upload(
+                Bucket=bucket_name,
+                Key=upload_s3_key,
+                UploadId=file.uploadIdS3,
+                MultipartUpload={'Parts': [{'PartNumber': p.PartNumber, 'ETag': p.ETag} for p in file.parts]}
+            )
+        except Exception as e:
+            logger.exception(f"Error completing multipart upload for {file.relativeKey}: {e}")
+
+            # Abort the multipart upload to clean up S3 resources
+            try:
+                s3.abort_multipart_upload(
+                    Bucket=bucket_name,
+                    Key=upload_s3_key,
+                    UploadId=file.uploadIdS3
+                )
+            except Exception as abort_error:
+                logger.exception(f"Error aborting multipart upload: {abort_error}")
             
-            # Create a file_detail dictionary with the information we need
+            result = FileCompletionResult(
+                relativeKey=file.relativeKey,
+                uploadIdS3=file.uploadIdS3,
+                success=False,
+                error=f"Error completing multipart upload."
+            )
+            return result, None
+
+        # Files finalized in place were fully validated before completion and are already at their final key
+        if not quarantined:
+            logger.info(f"File {file.relativeKey} finalized in place at {final_s3_key}")
             file_detail = {
                 'relativeKey': file.relativeKey,
                 'temp_s3_key': temp_s3_key,
                 'final_s3_key': final_s3_key,
-                'uploadIdS3': file.uploadIdS3
+                'uploadIdS3': file.uploadIdS3,
+                'finalized': True
             }
+            result = FileCompletionResult(
+                relativeKey=file.relativeKey,
+                uploadIdS3=file.uploadIdS3,
+                success=True,
+                largeFileAsynchronousHandling=False
+            )
+            return result, file_detail
+
+        # Now verify the metadata of the completed object
+        try:
+            head_response = s3.head_object(
+                Bucket=bucket_name,
+                Key=temp_s3_key
+            )
             
-            # Validate file content type
-            if not validateS3AssetExtensionsAndContentType(bucket_name, temp_s3_key):
-                # Delete the uploaded file
+            # Extract metadata
+            metadata = head_response.get('Metadata', {})
+            s3_upload_id = metadata.get('uploadid')
+            
+            # Get file size with error handling
+            file_size = 0
+            try:
+                file_size = head_response.get('ContentLength', 0)
+                if file_size is None:
+                    logger.warning(f"ContentLength is None for file {file.relativeKey}, defaulting to 0")
+                    file_size = 0
+            except Exception as size_error:
+                logger.warning(f"Error getting file size for {file.relativeKey}: {size_error}")
+                # Default to 0 for unknown file sizes (will process synchronously)
+                file_size = 0
+            
+            # Verify the uploadId matches
+            if s3_upload_id != uploadId:
+                # Delete the uploaded file since metadata doesn't match
                 delete_s3_object(bucket_name, temp_s3_key)
                 
-                # AUDIT LOG: Malicious file detected and upload denied
-                log_file_upload(
-                    event,
-                    databaseId,
-                    assetId,
-                    file.relativeKey,
-                    True,  # Upload denied
-                    "File contains potentially malicious executable type",
-                    {
-                        "uploadId": uploadId,
-                        "uploadType": uploadType
-                    }
+                result = FileCompletionResult(
+                    relativeKey=file.relativeKey,
+                    uploadIdS3=file.uploadIdS3,
+                    success=False,
+                    error=f"Upload ID mismatch."
                 )
+                return result, None
+            
+            # Check file size for preview files - both assetPreview type and .previewFile. files
+            if (uploadType == "assetPreview" or is_preview_file(file.relativeKey)) and file_size > MAX_PREVIEW_FILE_SIZE:
+                # Delete the uploaded file since it exceeds the size limit
+                delete_s3_object(bucket_name, temp_s3_key)
                 
-                file_results.append(FileCompletionResult(
+                result = FileCompletionResult(
                     relativeKey=file.relativeKey,
                     uploadIdS3=file.uploadIdS3,
                     success=False,
-                    error="File contains a potentially malicious executable type object"
-                ))
-                has_failures = True
-                continue
+                    error=f"Preview file exceeds maximum allowed size of 5MB"
+                )
+                return result, None
             
-            # Additional validation for preview files
-            if uploadType == "assetPreview":
-                # Validate preview file extension
-                if not validate_preview_file_extension(file.relativeKey):
-                    # Delete the uploaded file
-                    delete_s3_object(bucket_name, temp_s3_key)
-                    
-                    file_results.append(FileCompletionResult(
-                        relativeKey=file.relativeKey,
-                        uploadIdS3=file.uploadIdS3,
-                        success=False,
-                        error=f"Preview file must have one of the allowed extensions: .png, .jpg, .jpeg, .svg, .gif"
-                    ))
-                    has_failures = True
-                    continue
+            # At this point, we've already completed the multipart upload synchronously
+            # (large files would have been queued earlier and continued)
             
-            # Check if this is a preview file in an assetFile upload
-            if uploadType == "assetFile" and is_preview_file(file.relativeKey):
-                # Validate preview file extension
-                if not validate_preview_file_extension(file.relativeKey):
-                    # Delete the uploaded file
-                    delete_s3_object(bucket_name, temp_s3_key)
-                    
-                    file_results.append(FileCompletionResult(
-                        relativeKey=file.relativeKey,
-                        uploadIdS3=file.uploadIdS3,
-                        success=False,
-                        error=f"Preview file must have one of the allowed extensions: .png, .jpg, .jpeg, .svg, .gif"
-                    ))
-                    has_failures = True
-                    continue
-                
-                # Get the base file path
-                base_file_path = get_base_file_path(file.relativeKey)
-                base_file_key = normalize_s3_path(asset_base_key, base_file_path)
-                
-                # Check if the base file exists in the current request
-                base_file_in_request = False
-                for other_file in request_model.files:
-                    if other_file.relativeKey == base_file_path:
-                        base_file_in_request = True
-                        break
-                
-                # If not in the current request, check if it exists in S3
-                if not base_file_in_request:
-                    try:
-                        s3.head_object(Bucket=bucket_name, Key=base_file_key)
-                    except ClientError as e:
-                        if e.response['Error']['Code'] == 'NoSuchKey':
-                            # Base file doesn't exist in S3 or in the current request
-                            # Delete the uploaded file
-                            delete_s3_object(bucket_name, temp_s3_key)
-                            
-                            file_results.append(FileCompletionResult(
-                                relativeKey=file.relativeKey,
-                                uploadIdS3=file.uploadIdS3,
-                                success=False,
-                                error=f"Base files does not exist for all preview files"
-                            ))
-                            logger.warning(f"Preview file {file.relativeKey} is missing its base file {base_file_path}")
-                            has_failures = True
-                            continue
-                        else:
-                            # Other error occurred, log and conservatively reject the file
-                            logger.warning(f"Error checking if base file {base_file_key} exists: {e}")
-                            delete_s3_object(bucket_name, temp_s3_key)
-                            
-                            file_results.append(FileCompletionResult(
-                                relativeKey=file.relativeKey,
-                                uploadIdS3=file.uploadIdS3,
-                                success=False,
-                                error=f"Error verifying base file for preview file"
-                            ))
-                            has_failures = True
-                            continue
+        except Exception as e:
+            # Delete the uploaded file since we couldn't verify metadata
+            delete_s3_object(bucket_name, temp_s3_key)
             
-            # Add to successful files list
-            successful_files.append(file_detail)
-            file_results.append(FileCompletionResult(
+            logger.exception(f"Error verifying file metadata: {e}")
+            result = FileCompletionResult(
                 relativeKey=file.relativeKey,
                 uploadIdS3=file.uploadIdS3,
-                success=True,
-                largeFileAsynchronousHandling=False
-            ))
+                success=False,
+                error=f"Error verifying file metadata."
+            )
+            return result, None
+        
+        # Create a file_detail dictionary with the information we need
+        file_detail = {
+            'relativeKey': file.relativeKey,
+            'temp_s3_key': temp_s3_key,
+            'final_s3_key': final_s3_key,
+            'uploadIdS3': file.uploadIdS3
+        }
+        
+        # Validate file content type
+        if not validateS3AssetExtensionsAndContentType(bucket_name, temp_s3_key, keys=[temp_s3_key]):
+            # Delete the uploaded file
+            delete_s3_object(bucket_name, temp_s3_key)
             
-        except Exception as e:
-            logger.exception(f"Error completing multipart upload for {file.relativeKey}: {e}")
+            # AUDIT LOG: Malicious file detected and upload denied
+            log_file_upload(
+                event,
+                databaseId,
+                assetId,
+                file.relativeKey,
+                True,  # Upload denied
+                "File contains potentially malicious executable type",
+                {
+                    "uploadId": uploadId,
+                    "uploadType": uploadType
+                }
+            )
             
-            # Abort the multipart upload to clean up S3 resources
+            result = FileCompletionResult(
+                relativeKey=file.relativeKey,
+                uploadIdS3=file.uploadIdS3,
+                success=False,
+                error="File contains a potentially malicious executable type object"
+            )
+            return result, None
+        
+        # Additional validation for preview files
+        if uploadType == "assetPreview":
+            # Validate preview file extension
+            if not validate_preview_file_extension(file.relativeKey):
+                # Delete the uploaded file
+                delete_s3_object(bucket_name, temp_s3_key)
+                
+                result = FileCompletionResult(
+                    relativeKey=file.relativeKey,
+                    uploadIdS3=file.uploadIdS3,
+                    success=False,
+                    error=f"Preview file must have one of the allowed extensions: .png, .jpg, .jpeg, .svg, .gif"
+                )
+                return result, None
+        
+        # Check if this is a preview file in an assetFile upload
+        if uploadType == "assetFile" and is_preview_file(file.relativeKey):
+            # Validate preview file extension
+            if not validate_preview_file_extension(file.relativeKey):
+                # Delete the uploaded file
+                delete_s3_object(bucket_name, temp_s3_key)
+                
+                result = FileCompletionResult(
+                    relativeKey=file.relativeKey,
+                    uploadIdS3=file.uploadIdS3,
+                    success=False,
+                    error=f"Preview file must have one of the allowed extensions: .png, .jpg, .jpeg, .svg, .gif"
+                )
+                return result, None
+            
+            # Get the base file path
+            base_file_path = get_base_file_path(file.relativeKey)
+            base_file_key = normalize_s3_path(asset_base_key, base_file_path)
+            
+            # Check if the base file exists in the current request
+            base_file_in_request = False
+            for other_file in request_files:
+                if other_file.relativeKey == base_file_path:
+                    base_file_in_request = True
+                    break
+            
+            # If not in the current request, check if it exists in S3
+            if not base_file_in_request:
+                try:
+                    s3.head_object(Bucket=bucket_name, Key=base_file_key)
+                except ClientError as e:
+                    if e.response['Error']['Code'] == 'NoSuchKey':
+                        # Base file doesn't exist in S3 or in the current request
+                        # Delete the uploaded file
+                        delete_s3_object(bucket_name, temp_s3_key)
+                        
+                        result = FileCompletionResult(
+                            relativeKey=file.relativeKey,
+                            uploadIdS3=file.uploadIdS3,
+                            success=False,
+                            error=f"Base files does not exist for all preview files"
+                        )
+                        logger.warning(f"Preview file {file.relativeKey} is missing its base file {base_file_path}")
+                        return result, None
+                    else:
+                        # Other error occurred, log and conservatively reject the file
+                        logger.warning(f"Error checking if base file {base_file_key} exists: {e}")
+                        delete_s3_object(bucket_name, temp_s3_key)
+                        
+                        result = FileCompletionResult(
+                            relativeKey=file.relativeKey,
+                            uploadIdS3=file.uploadIdS3,
+                            success=False,
+                            error=f"Error verifying base file for preview file"
+                        )
+                        return result, None
+        
+        # Add to successful files list
+        result = FileCompletionResult(
+            relativeKey=file.relativeKey,
+            uploadIdS3=file.uploadIdS3,
+            success=True,
+            largeFileAsynchronousHandling=False
+        )
+        return result, file_detail
+        
+    except Exception as e:
+        logger.exception(f"Error completing multipart upload for {file.relativeKey}: {e}")
+        
+        # Abort the multipart upload to clean up S3 resources
+        if upload_s3_key and file.uploadIdS3 != "zero-byte":
             try:
                 s3.abort_multipart_upload(
                     Bucket=bucket_name,
-                    Key=temp_s3_key,  # Use temp_s3_key directly since it's defined in the outer try block
+                    Key=upload_s3_key,
                     UploadId=file.uploadIdS3
                 )
             except Exception as abort_error:
                 logger.exception(f"Error aborting multipart upload: {abort_error}")
-            
-            file_results.append(FileCompletionResult(
-                relativeKey=file.relativeKey,
-                uploadIdS3=file.uploadIdS3,
-                success=False,
-                error=str(e)
-            ))
-            has_failures = True
+        
+        result = FileCompletionResult(
+            relativeKey=file.relativeKey,
+            uploadIdS3=file.uploadIdS3,
+            success=False,
+            error=str(e)
+        )
+        return result, None
+
+def complete_upload_files(upload_files: list, completion_context: dict, request_files: list, event) -> list:
+    """Complete the files of one or more uploads concurrently
     
-    # If no files were successfully uploaded, return error
-    if not successful_files:
-        delete_upload_details(uploadId, assetId)
-        # Check if any file has largeFileAsynchronousHandling=true
-        has_async_files = any(result.largeFileAsynchronousHandling for result in file_results)
-        return CompleteUploadResponseModel(
-            message="No files were successfully uploaded",
-            uploadId=uploadId,
-            assetId=assetId,
-            fileResults=file_results,
-            overallSuccess=False,
-            largeFileAsynchronousHandling=has_async_files
+    Args:
+        upload_files: List of (uploadId, finalization_mode, file) tuples to complete
+        completion_context: Asset, bucket and database details shared by all files
+        request_files: All files in the request (used to find base files for preview files)
+        event: The API Gateway event (for audit logging)
+        
+    Returns:
+        List of (uploadId, FileCompletionResult, file detail or None) tuples in request order
+    """
+    if not upload_files:
+        return []
+    
+    def complete(item):
+        upload_id, finalization_mode, file = item
+        result, file_detail = complete_upload_file(
+            file, upload_id, finalization_mode, completion_context, request_files, event
         )
+        return upload_id, result, file_detail
     
-    # Get the asset's specified bucket and key location
-    asset_base_key = asset.get('assetLocation', {}).get('Key', f"{baseAssetsPrefix}{assetId}/")
+    with ThreadPoolExecutor(max_workers=min(MAX_COMPLETION_WORKERS, len(upload_files))) as executor:
+        return list(executor.map(complete, upload_files))
+
+def finalize_completed_files(successful_files: list, file_results: list, completion_context: dict) -> None:
+    """Validate preview files against their base files and move quarantined files to their final location
+    
+    Failed files are removed from successful_files (preview validation) and their results are updated
+    in place.
+    
+    Args:
+        successful_files: File details of successfully completed files
+        file_results: FileCompletionResult list for all files in the request
+        completion_context: Asset, bucket and database details shared by all files
+    """
+    asset = completion_context['asset']
+    assetId = completion_context['assetId']
+    databaseId = completion_context['databaseId']
+    bucket_name = completion_context['bucketName']
+    baseAssetsPrefix = completion_context['baseAssetsPrefix']
+    
+    def mark_failed(relative_key, error):
+        for result in file_results:
+            if result.relativeKey == relative_key and result.success:
+                result.success = False
+                result.error = error
     
     # Only for assetFile uploads, validate that .previewFile. files have corresponding base files
-    if uploadType == "assetFile":
+    if completion_context['uploadType'] == "assetFile":
+        # Get the asset's specified bucket and key location
+        asset_base_key = asset.get('assetLocation', {}).get('Key', f"{baseAssetsPrefix}{assetId}/")
+        
         # Check if there are any .previewFile. files in the successful files
         preview_files = [file_detail for file_detail in successful_files if is_preview_file(file_detail['relativeKey'])]
         
@@ -2129,34 +2265,13 @@ def complete_upload(uploadId: str, request_model: CompleteUploadRequestModel, ev
                     if file_detail['relativeKey'] in invalid_files:
                         # Delete the uploaded file
                         delete_s3_object(bucket_name, file_detail['temp_s3_key'])
-                        
-                        # Update file result
-                        for result in file_results:
-                            if result.relativeKey == file_detail['relativeKey'] and result.success:
-                                result.success = False
-                                result.error = f"Base files does not exist for all preview files"
-                                has_failures = True
+                        mark_failed(file_detail['relativeKey'], f"Base files does not exist for all preview files")
                         
                         # Remove from successful files
                         successful_files.remove(file_detail)
-                
-                # If no files remain successful, return error
-                if not successful_files:
-                    delete_upload_details(uploadId, assetId)
-                    # Check if any file has largeFileAsynchronousHandling=true
-                    has_async_files = any(result.largeFileAsynchronousHandling for result in file_results)
-                    return CompleteUploadResponseModel(
-                        message="No files were successfully uploaded",
-                        uploadId=uploadId,
-                        assetId=assetId,
-                        fileResults=file_results,
-                        overallSuccess=False,
-                        largeFileAsynchronousHandling=has_async_files
-                    )
     
-    # Copy successful files from temporary to final location
-    for file_detail in successful_files:
-        
+    # Copy successful files from temporary to final location (files finalized in place are already there)
+    def move(file_detail):
         logger.info(f"Copying file from {file_detail['temp_s3_key']} to {file_detail['final_s3_key']}")
         
         copy_success = copy_s3_object(
@@ -2168,37 +2283,143 @@ def complete_upload(uploadId: str, request_model: CompleteUploadRequestModel, ev
             assetId
         )
         
-        if not copy_success:
-            logger.error(f"Failed to copy file from {file_detail['temp_s3_key']} to {file_detail['final_s3_key']}")
-            # Update the file result to indicate copy failure
-            for result in file_results:
-                if result.relativeKey == file_detail['relativeKey'] and result.success:
-                    result.success = False
-                    result.error = "Failed to copy file to final location"
-                    has_failures = True
-        else:
+        if copy_success:
             # Delete temporary file after successful copy
             delete_s3_object(bucket_name, file_detail['temp_s3_key'])
+        else:
+            logger.error(f"Failed to copy file from {file_detail['temp_s3_key']} to {file_detail['final_s3_key']}")
+        return file_detail, copy_success
+    
+    files_to_move = [file_detail for file_detail in successful_files if not file_detail.get('finalized')]
+    if files_to_move:
+        with ThreadPoolExecutor(max_workers=min(MAX_COMPLETION_WORKERS, len(files_to_move))) as executor:
+            for file_detail, copy_success in executor.map(move, files_to_move):
+                if not copy_success:
+                    # Update the file result to indicate copy failure
+                    mark_failed(file_detail['relativeKey'], "Failed to copy file to final location")
+
+def update_asset_after_file_uploads(completion_context: dict, file_keys: list) -> None:
+    """Update the asset type after asset files were uploaded and notify subscribers
+    
+    Args:
+        completion_context: Asset, bucket and database details shared by all files
+        file_keys: Relative keys of the uploaded files
+    """
+    asset = completion_context['asset']
+    assetId = completion_context['assetId']
+    bucket_name = completion_context['bucketName']
+    baseAssetsPrefix = completion_context['baseAssetsPrefix']
+    asset_base_key = asset.get('assetLocation', {}).get('Key', f"{baseAssetsPrefix}{assetId}/")
+    
+    # Determine asset type using the asset's bucket and key location
+    assetType = determine_asset_type(assetId, bucket_name, asset_base_key)
+    logger.info(f"Asset type determined for asset {assetId}: {assetType}")
+    
+    # Update asset type - ensure we're not overriding with None
+    if assetType:
+        asset['assetType'] = assetType
+    elif 'assetType' not in asset or not asset.get('assetType'):
+        asset['assetType'] = 'none'
+    # If asset already has a type and assetType is None, keep the existing type
+    
+    # Save updated asset
+    save_asset_details(asset)
+    
+    # Send notification to subscribers
+    send_subscription_email(completion_context['databaseId'], assetId, file_keys)
+
+
+def complete_upload(uploadId: str, request_model: CompleteUploadRequestModel, event):
+    """Complete a multipart upload and update the asset"""
+    assetId = request_model.assetId
+    databaseId = request_model.databaseId
+    uploadType = request_model.uploadType
+    
+    # Get upload details from DynamoDB (just for basic validation)
+    upload_details = get_upload_details(uploadId, assetId)
+    
+    # Verify asset exists
+    asset = get_asset_details(databaseId, assetId)
+    if not asset:
+        raise VAMSGeneralErrorResponse("Asset not found")
+    
+    # Verify upload details match request
+    if upload_details['assetId'] != assetId or upload_details['databaseId'] != databaseId:
+        raise VAMSGeneralErrorResponse("Upload details do not match request")
+        
+    # Verify upload type matches
+    if upload_details['uploadType'] != uploadType:
+        raise VAMSGeneralErrorResponse(f"Upload type mismatch.")
+
+    # Uploads initialized before direct finalization have no mode and use the temporary path
+    finalization_mode = upload_details.get('finalizationMode')
+
+    # Update upload status in DynamoDB
+    try:
+        # Use both uploadId and assetId as the key
+        asset_upload_table.update_item(
+            Key={
+                'uploadId': uploadId,
+                'assetId': assetId
+            },
+            UpdateExpression="SET #status = :status",
+            ExpressionAttributeNames={'#status': 'status'},
+            ExpressionAttributeValues={':status': 'processing'}
+        )
+    except Exception as e:
+        logger.warning(f"Failed to update upload status: {e}")
+
+    completion_context = build_completion_context(asset, databaseId, assetId, uploadType)
+    
+    # Complete multipart uploads for each file
+    file_results = []
+    successful_files = []
+    for _, result, file_detail in complete_upload_files(
+        [(uploadId, finalization_mode, file) for file in request_model.files],
+        completion_context,
+        request_model.files,
+        event
+    ):
+        file_results.append(result)
+        if file_detail:
+            successful_files.append(file_detail)
+    
+    # If no files were successfully uploaded, return error
+    if not successful_files:
+        delete_upload_details(uploadId, assetId)
+        # Check if any file has largeFileAsynchronousHandling=true
+        has_async_files = any(result.largeFileAsynchronousHandling for result in file_results)
+        return CompleteUploadResponseModel(
+            message="No files were successfully uploaded",
+            uploadId=uploadId,
+            assetId=assetId,
+            fileResults=file_results,
+            overallSuccess=False,
+            largeFileAsynchronousHandling=has_async_files
+        )
+    
+    # Validate preview files and move quarantined files to their final location
+    finalize_completed_files(successful_files, file_results, completion_context)
+    
+    # If no files remain successful, return error
+    if not successful_files:
+        delete_upload_details(uploadId, assetId)
+        # Check if any file has largeFileAsynchronousHandling=true
+        has_async_files = any(result.largeFileAsynchronousHandling for result in file_results)
+        return CompleteUploadResponseModel(
+            message="No files were successfully uploaded",
+            uploadId=uploadId,
+            assetId=assetId,
+            fileResults=file_results,
+            overallSuccess=False,
+            largeFileAsynchronousHandling=has_async_files
+        )
+    
+    has_failures = any(not result.success for result in file_results)
     
     # Update asset record based on upload type
     if uploadType == "assetFile" and any(f.success for f in file_results):
-        # Determine asset type using the asset's bucket and key location
-        assetType = determine_asset_type(assetId, bucket_name, asset_base_key)
-        logger.info(f"Asset type determined for asset {assetId}: {assetType}")
-        
-        
-        # Update asset type - ensure we're not overriding with None
-        if assetType:
-            asset['assetType'] = assetType
-        elif 'assetType' not in asset or not asset.get('assetType'):
-            asset['assetType'] = 'none'
-        # If asset already has a type and assetType is None, keep the existing type
-        
-        # Save updated asset
-        save_asset_details(asset)
-        
-        # Send notification to subscribers
-        send_subscription_email(databaseId, assetId)
+        update_asset_after_file_uploads(completion_context, [f.relativeKey for f in file_results if f.success])
         
     elif uploadType == "assetPreview" and file_results[0].success:
         # Find the successful preview file
@@ -2274,6 +2495,173 @@ def complete_upload(uploadId: str, request_model: CompleteUploadRequestModel, ev
     else:
         return response
 
+def get_upload_details_batch(uploadIds: List[str], assetId: str) -> dict:
+    """Get the upload records for several uploads of an asset with batched reads
+    
+    Args:
+        uploadIds: The upload IDs to read
+        assetId: The asset ID the uploads belong to
+        
+    Returns:
+        Dictionary of upload records keyed by uploadId
+    """
+    upload_records = {}
+    request_items = {
+        asset_upload_table_name: {
+            'Keys': [{'uploadId': uploadId, 'assetId': assetId} for uploadId in uploadIds]
+        }
+    }
+    
+    try:
+        # BatchGetItem returns unprocessed keys when throttled; retry them with backoff
+        attempt = 0
+        while request_items:
+            response = dynamodb.batch_get_item(RequestItems=request_items)
+            for item in response.get('Responses', {}).get(asset_upload_table_name, []):
+                upload_records[item['uploadId']] = item
+            request_items = response.get('UnprocessedKeys') or {}
+            if request_items:
+                attempt += 1
+                if attempt > 5:
+                    raise VAMSGeneralErrorResponse("Error getting upload details.")
+                time.sleep(min(0.05 * (2 ** attempt), 1))
+    except VAMSGeneralErrorResponse:
+        raise
+    except Exception as e:
+        logger.exception(f"Error getting upload details: {e}")
+        raise VAMSGeneralErrorResponse(f"Error getting upload details.")
+    
+    missing_upload_ids = [uploadId for uploadId in uploadIds if uploadId not in upload_records]
+    if missing_upload_ids:
+        raise VAMSGeneralErrorResponse(f"Upload {missing_upload_ids[0]} not found")
+    
+    return upload_records
+
+def complete_upload_batch(request_model: CompleteUploadBatchRequestModel, event):
+    """Complete several asset file uploads of one asset and update the asset once"""
+    assetId = request_model.assetId
+    databaseId = request_model.databaseId
+    uploadType = request_model.uploadType
+    uploadIds = [upload.uploadId for upload in request_model.uploads]
+    
+    # Verify asset exists
+    asset = get_asset_details(databaseId, assetId)
+    if not asset:
+        raise VAMSGeneralErrorResponse("Asset not found")
+    
+    # Get all upload records with batched reads and verify they match the request
+    upload_records = get_upload_details_batch(uploadIds, assetId)
+    for uploadId in uploadIds:
+        upload_details = upload_records[uploadId]
+        if upload_details['assetId'] != assetId or upload_details['databaseId'] != databaseId:
+            raise VAMSGeneralErrorResponse("Upload details do not match request")
+        if upload_details['uploadType'] != uploadType:
+            raise VAMSGeneralErrorResponse(f"Upload type mismatch.")
+    
+    # Update upload statuses in DynamoDB
+    try:
+        with asset_upload_table.batch_writer() as batch:
+            for uploadId in uploadIds:
+                batch.put_item(Item={**upload_records[uploadId], 'status': 'processing'})
+    except Exception as e:
+        logger.warning(f"Failed to update upload status: {e}")
+    
+    completion_context = build_completion_context(asset, databaseId, assetId, uploadType)
+    
+    # Complete the files of all uploads in one worker pool
+    # Uploads initialized before direct finalization have no mode and use the temporary path
+    all_files = [file for upload in request_model.uploads for file in upload.files]
+    outcomes = complete_upload_files(
+        [(upload.uploadId, upload_records[upload.uploadId].get('finalizationMode'), file)
+         for upload in request_model.uploads for file in upload.files],
+        completion_context,
+        all_files,
+        event
+    )
+    
+    file_results = [result for _, result, _ in outcomes]
+    successful_files = [file_detail for _, _, file_detail in outcomes if file_detail]
+    
+    # Validate preview files against the files of the whole batch and move quarantined files
+    finalize_completed_files(successful_files, file_results, completion_context)
+    
+    # Update asset type and notify subscribers once for the whole batch
+    if successful_files and any(result.success for result in file_results):
+        update_asset_after_file_uploads(completion_context, [result.relativeKey for result in file_results if result.success])
+    
+    # Build per-upload results
+    upload_results = []
+    records_with_errors = []
+    records_to_delete = []
+    for upload in request_model.uploads:
+        upload_outcomes = [(result, file_detail) for uploadId, result, file_detail in outcomes if uploadId == upload.uploadId]
+        upload_file_results = [result for result, _ in upload_outcomes]
+        upload_successful_keys = [result.relativeKey for result, file_detail in upload_outcomes if file_detail and result.success]
+        has_failures = any(not result.success for result in upload_file_results)
+        
+        if not upload_successful_keys:
+            # Matches single upload completion: nothing was finalized synchronously
+            message = "No files were successfully uploaded"
+            has_failures = True
+            records_to_delete.append(upload.uploadId)
+        else:
+            message = "Upload completed" + (" with some failures" if has_failures else " successfully")
+            if has_failures:
+                records_with_errors.append(upload.uploadId)
+            else:
+                records_to_delete.append(upload.uploadId)
+        
+        upload_results.append(CompleteUploadResponseModel(
+            message=message,
+            uploadId=upload.uploadId,
+            assetId=assetId,
+            assetType=asset.get('assetType') if upload_successful_keys else None,
+            fileResults=upload_file_results,
+            overallSuccess=not has_failures,
+            largeFileAsynchronousHandling=any(result.largeFileAsynchronousHandling for result in upload_file_results)
+        ))
+        
+        # AUDIT LOG: Upload completed - log all successful files
+        if upload_successful_keys:
+            log_file_upload(
+                event,
+                databaseId,
+                assetId,
+                ", ".join(upload_successful_keys),
+                False,  # Not denied
+                None,
+                {
+                    "uploadId": upload.uploadId,
+                    "uploadType": uploadType,
+                    "status": "completed",
+                    "successfulFiles": len(upload_successful_keys),
+                    "totalFiles": len(upload.files),
+                    "hasFailures": has_failures
+                }
+            )
+    
+    # Update upload statuses in DynamoDB with batched writes
+    try:
+        with asset_upload_table.batch_writer() as batch:
+            for uploadId in records_with_errors:
+                batch.put_item(Item={**upload_records[uploadId], 'status': 'completed_with_errors'})
+            for uploadId in records_to_delete:
+                # Delete upload record if all successful
+                batch.delete_item(Key={'uploadId': uploadId, 'assetId': assetId})
+    except Exception as e:
+        logger.warning(f"Failed to update upload status: {e}")
+    
+    has_failures = any(not result.overallSuccess for result in upload_results)
+    
+    return CompleteUploadBatchResponseModel(
+        message="Uploads completed" + (" with some failures" if has_failures else " successfully"),
+        assetId=assetId,
+        assetType=asset.get('assetType'),
+        uploadResults=upload_results,
+        overallSuccess=not has_failures,
+        largeFileAsynchronousHandling=any(result.largeFileAsynchronousHandling for result in file_results)
+    )
+
 #######################
 # Lambda Handler
 #######################
@@ -2344,6 +2732,33 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
             
             return success(body=response.dict())
             
+        elif method == 'POST' and path == '/uploads/complete/batch':
+            # Batch Complete Upload API
+            request_model = parse(body, model=CompleteUploadBatchRequestModel)
+            
+            # Check authorization once for all uploads of the asset
+            asset = get_asset_details(request_model.databaseId, request_model.assetId)
+            if not asset:
+                return validation_error(body={'message': "Asset not found"}, event=event)
+            
+            asset["object__type"] = "asset"
+            
+            if len(claims_and_roles["tokens"]) > 0:
+                casbin_enforcer = CasbinEnforcer(claims_and_roles)
+                if not (casbin_enforcer.enforce(asset, "POST") and casbin_enforcer.enforceAPI(event)):
+                    return authorization_error()
+            
+            # Process request
+            response = complete_upload_batch(request_model, event)
+            
+            # Return 409 status if all files failed, otherwise return 200
+            all_files_failed = all(
+                not result.success for upload_result in response.uploadResults for result in upload_result.fileResults
+            )
+            if all_files_failed:
+                return general_error(status_code=409, body=response.dict(), event=event)
+            return success(body=response.dict())
+            
         elif method == 'POST' and '/uploads/' in path and path.endswith('/complete/external'):
             # External Complete Upload API - Extract uploadId from path parameters
             if not event.get('pathParameters') or not event['pathParameters'].get('uploadId'):
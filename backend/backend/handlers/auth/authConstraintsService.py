@@ -6,6 +6,7 @@
 import os
 import boto3
 import json
+import base64
 import uuid
 from datetime import datetime
 from boto3.dynamodb.conditions import Key
@@ -204,9 +205,98 @@ def validate_constraint_role_exists(group_id):
         return True  # Allow if validation fails
 
 
+def _base_constraint_id(full_constraint_id):
+    """Return the base constraintId of a denormalized item (without #group# or #user# suffix)"""
+    return full_constraint_id.split('#group#')[0].split('#user#')[0]
+
+
+def _query_object_type_index(key_condition, first_only=False):
+    """Query ObjectTypeIndex and return all matching items (or only the first one)
+
+    Args:
+        key_condition: KeyConditionExpression on objectType and constraintId
+        first_only: Stop after the first matching item
+
+    Returns:
+        List of matching items
+    """
+    query_kwargs = {
+        'IndexName': 'ObjectTypeIndex',
+        'KeyConditionExpression': key_condition
+    }
+    if first_only:
+        query_kwargs['Limit'] = 1
+
+    items = []
+    while True:
+        response = constraints_table.query(**query_kwargs)
+        items.extend(response.get('Items', []))
+        if (first_only and items) or 'LastEvaluatedKey' not in response:
+            return items
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def _get_constraint_items(base_constraint_id, first_only=False):
+    """Get the denormalized items of a constraint with keyed reads
+
+    Denormalized items are keyed "{base}#group#{groupId}" / "{base}#user#{userId}" (or just
+    "{base}" when the constraint has no permissions) and all carry the constraint's objectType,
+    so they are found with a GetItem on the base key plus a begins_with query on ObjectTypeIndex
+    per allowed object type.
+
+    Args:
+        base_constraint_id: The base constraint ID (without #group# or #user# suffix)
+        first_only: Return as soon as one item of the constraint is found
+
+    Returns:
+        List of the constraint's items (empty if the constraint does not exist)
+    """
+    items = []
+
+    base_item = constraints_table.get_item(Key={'constraintId': base_constraint_id}).get('Item')
+    if base_item:
+        items.append(base_item)
+        if first_only:
+            return items
+
+    # Children share the base ID followed by '#', which also keeps constraints whose IDs
+    # merely start with the same characters out of the result
+    child_prefix = f"{base_constraint_id}#"
+    for object_type in ALLOWED_CONSTRAINT_OBJECT_TYPES:
+        items.extend(_query_object_type_index(
+            Key('objectType').eq(object_type) & Key('constraintId').begins_with(child_prefix),
+            first_only=first_only
+        ))
+        if first_only and items:
+            return items
+
+    return items
+
+
+def _encode_constraints_token(object_type, base_constraint_id):
+    """Encode the list cursor (last returned constraint) as a base64 token"""
+    json_str = json.dumps({'objectType': object_type, 'constraintId': base_constraint_id})
+    return base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
+
+
+def _decode_constraints_token(starting_token):
+    """Decode a list cursor into (objectType, base constraintId)"""
+    try:
+        token = json.loads(base64.b64decode(starting_token).decode('utf-8'))
+        object_type = token['objectType']
+        base_constraint_id = token['constraintId']
+    except (json.JSONDecodeError, base64.binascii.Error, UnicodeDecodeError, KeyError, TypeError) as e:
+        logger.exception(f"Invalid startingToken format: {e}")
+        raise VAMSGeneralErrorResponse("Invalid pagination token")
+
+    if object_type not in ALLOWED_CONSTRAINT_OBJECT_TYPES or not isinstance(base_constraint_id, (str, type(None))):
+        raise VAMSGeneralErrorResponse("Invalid pagination token")
+    return object_type, base_constraint_id
+
+
 def get_constraint_details(constraint_id):
     """Get constraint details from denormalized DynamoDB table
-    Scans for any item with the base constraintId (may have #group# or #user# suffix)
+    Reads the first item found under the base constraintId (may have #group# or #user# suffix)
     
     Args:
         constraint_id: The base constraint ID (without #group# or #user# suffix)
@@ -215,18 +305,7 @@ def get_constraint_details(constraint_id):
         The constraint details or None if not found
     """
     try:
-        from boto3.dynamodb.conditions import Attr
-        
-        # Scan for items that start with the base constraintId
-        # This will match both exact IDs and denormalized IDs with suffixes
-        logger.info(f"Scanning for constraint with ID starting with: {constraint_id}")
-        
-        response = constraints_table.scan(
-            FilterExpression=Attr('constraintId').begins_with(constraint_id)
-        )
-        
-        items = response.get('Items', [])
-        logger.info(f"Scan found {len(items)} items for constraint {constraint_id}")
+        items = _get_constraint_items(constraint_id, first_only=True)
         
         if items:
             logger.debug(f"Retrieved constraint {constraint_id}")
@@ -240,8 +319,10 @@ def get_constraint_details(constraint_id):
 
 
 def get_all_constraints(query_params):
-    """Get all constraints with pagination from denormalized table
-    Deduplicates by base constraintId to return unique constraints
+    """Get all constraints with cursor pagination from denormalized table
+    Walks ObjectTypeIndex one object type at a time. Items of a constraint sort next to each
+    other under its objectType, so deduplicating by base constraintId only needs the previous
+    item, and the cursor is the (objectType, constraintId) of the last returned constraint.
     
     Args:
         query_params: Query parameters for pagination
@@ -250,39 +331,58 @@ def get_all_constraints(query_params):
         Dictionary with Items and optional NextToken
     """
     try:
-        # Use resource-level scan for automatic deserialization
-        scan_kwargs = {
-            'Limit': int(query_params['pageSize'])
-        }
-        
+        page_size = int(query_params['pageSize'])
+        start_object_type = None
+        last_constraint_id = None
         if query_params.get('startingToken'):
-            scan_kwargs['ExclusiveStartKey'] = query_params['startingToken']
-        
-        # Perform scan and collect items
-        response = constraints_table.scan(**scan_kwargs)
-        items = response.get('Items', [])
-        
-        # Deduplicate by base constraintId (remove #group# or #user# suffixes)
-        unique_constraints = {}
-        for item in items:
-            full_constraint_id = item.get('constraintId', '')
-            base_constraint_id = full_constraint_id.split('#group#')[0].split('#user#')[0]
+            start_object_type, last_constraint_id = _decode_constraints_token(query_params['startingToken'])
+
+        object_types = sorted(ALLOWED_CONSTRAINT_OBJECT_TYPES)
+        if start_object_type:
+            object_types = object_types[object_types.index(start_object_type):]
+        
+        unique_items = []
+        result = {}
+        for object_type in object_types:
+            query_kwargs = {
+                'IndexName': 'ObjectTypeIndex',
+                'KeyConditionExpression': Key('objectType').eq(object_type),
+                'Limit': page_size
+            }
+            if object_type == start_object_type and last_constraint_id:
+                # Resume after the last returned constraint; its remaining children are skipped below
+                query_kwargs['KeyConditionExpression'] &= Key('constraintId').gt(last_constraint_id)
+            elif object_type != start_object_type:
+                last_constraint_id = None
+            
+            while 'NextToken' not in result:
+                response = constraints_table.query(**query_kwargs)
+                for item in response.get('Items', []):
+                    base_constraint_id = _base_constraint_id(item.get('constraintId', ''))
+                    if base_constraint_id == last_constraint_id:
+                        continue
+                    if len(unique_items) >= page_size:
+                        # Another constraint follows the full page (a cursor without constraintId
+                        # starts at the beginning of the object type)
+                        result['NextToken'] = _encode_constraints_token(object_type, last_constraint_id)
+                        break
+                    unique_items.append(item)
+                    last_constraint_id = base_constraint_id
+                
+                if 'LastEvaluatedKey' not in response:
+                    break
+                query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
             
-            # Only keep the first occurrence of each base constraintId
-            if base_constraint_id not in unique_constraints:
-                unique_constraints[base_constraint_id] = item
+            if 'NextToken' in result:
+                break
         
         # Transform items from new format to API format
-        formatted_items = [_transform_from_new_format(item) for item in unique_constraints.values()]
+        result['Items'] = [_transform_from_new_format(item) for item in unique_items]
         
-        result = {'Items': formatted_items}
-        
-        # Handle pagination token
-        if 'LastEvaluatedKey' in response:
-            result['NextToken'] = response['LastEvaluatedKey']
-        
-        logger.debug(f"Retrieved {len(formatted_items)} unique constraints from {len(items)} denormalized items")
+        logger.debug(f"Retrieved {len(unique_items)} unique constraints")
         return result
+    except VAMSGeneralErrorResponse as e:
+        raise e
     except Exception as e:
         logger.exception(f"Error getting all constraints: {e}")
         raise VAMSGeneralErrorResponse("Error retrieving constraints")
@@ -302,9 +402,11 @@ def create_or_update_constraint(constraint_data, claims_and_roles):
     try:
         # Generate unique constraintId if not provided or empty
         constraint_id = constraint_data.get('identifier', '').strip()
+        is_new_constraint_id = False
         if not constraint_id:
             constraint_id = str(uuid.uuid4())
             constraint_data['identifier'] = constraint_id
+            is_new_constraint_id = True
             logger.info(f"Generated new constraintId: {constraint_id}")
         
         # Note: Constraints don't have object-level authorization in Casbin
@@ -327,15 +429,21 @@ def create_or_update_constraint(constraint_data, claims_and_roles):
             constraint_data['dateCreated'] = now
             constraint_data['createdBy'] = username
         
-        # Delete existing denormalized items for this constraint (if updating)
-        try:
-            _delete_denormalized_items(constraint_id)
-        except Exception as delete_error:
-            logger.warning(f"Error deleting old denormalized items: {delete_error}")
-        
         # Transform to denormalized format (returns array of items)
         denormalized_items = _transform_to_denormalized_format(constraint_data)
         
+        # Delete existing denormalized items that the new item set does not overwrite (if updating)
+        if not is_new_constraint_id:
+            new_item_ids = {item['constraintId'] for item in denormalized_items}
+            try:
+                existing_items = _get_constraint_items(constraint_id)
+                _delete_denormalized_items(
+                    constraint_id,
+                    [item for item in existing_items if item['constraintId'] not in new_item_ids]
+                )
+            except Exception as delete_error:
+                logger.warning(f"Error deleting old denormalized items: {delete_error}")
+        
         # Write all denormalized items using batch write for efficiency
         with constraints_table.batch_writer() as batch:
             for item in denormalized_items:
@@ -361,33 +469,21 @@ def create_or_update_constraint(constraint_data, claims_and_roles):
         raise VAMSGeneralErrorResponse("Error creating/updating constraint")
 
 
-def _delete_denormalized_items(base_constraint_id):
-    """Delete all denormalized items for a constraint
+def _delete_denormalized_items(base_constraint_id, items_to_delete=None):
+    """Delete denormalized items for a constraint
     
     Args:
         base_constraint_id: The base constraint ID (without #group# or #user# suffix)
+        items_to_delete: Items to delete (defaults to all items of the constraint)
+        
+    Returns:
+        True if all items were deleted, False if the deletion failed
     """
     try:
-        from boto3.dynamodb.conditions import Attr
-        
-        logger.info(f"Scanning for items to delete with ID starting with: {base_constraint_id}")
-        
-        # Scan for all items that start with the base constraintId
-        response = constraints_table.scan(
-            FilterExpression=Attr('constraintId').begins_with(base_constraint_id)
-        )
-        
-        items_to_delete = response.get('Items', [])
+        if items_to_delete is None:
+            items_to_delete = _get_constraint_items(base_constraint_id)
         logger.info(f"Found {len(items_to_delete)} items to delete for constraint {base_constraint_id}")
         
-        # Handle pagination if there are many items
-        while 'LastEvaluatedKey' in response:
-            response = constraints_table.scan(
-                FilterExpression=Attr('constraintId').begins_with(base_constraint_id),
-                ExclusiveStartKey=response['LastEvaluatedKey']
-            )
-            items_to_delete.extend(response.get('Items', []))
-        
         # Delete all denormalized items using batch write
         if items_to_delete:
             with constraints_table.batch_writer() as batch:
@@ -397,9 +493,11 @@ def _delete_denormalized_items(base_constraint_id):
             logger.info(f"Successfully deleted {len(items_to_delete)} denormalized items for constraint {base_constraint_id}")
         else:
             logger.warning(f"No items found to delete for constraint {base_constraint_id}")
+        return True
     except Exception as e:
         logger.exception(f"Error deleting denormalized items: {e}")
-        # Don't raise - allow delete to continue even if cleanup fails
+        # Don't raise - let the caller decide whether a failed cleanup is an error
+        return False
 
 
 def delete_constraint(constraint_id, claims_and_roles):
@@ -422,18 +520,8 @@ def delete_constraint(constraint_id, claims_and_roles):
         # Delete all denormalized items for this constraint
         # Don't check existence first - just try to delete
         # This handles eventual consistency issues and is more efficient
-        _delete_denormalized_items(constraint_id)
-        
-        # Check if any items were actually deleted by doing a quick scan
-        from boto3.dynamodb.conditions import Attr
-        check_response = constraints_table.scan(
-            FilterExpression=Attr('constraintId').begins_with(constraint_id),
-            Limit=1
-        )
-        
-        if len(check_response.get('Items', [])) > 0:
-            # Items still exist, deletion may have failed
-            logger.warning(f"Items still exist after deletion attempt for constraint {constraint_id}")
+        if not _delete_denormalized_items(constraint_id):
+            logger.warning(f"Deletion failed for constraint {constraint_id}")
             raise VAMSGeneralErrorResponse("Error deleting constraint - items may still exist")
         
         logger.info(f"Successfully deleted all items for constraint {constraint_id}")
@@ -2,10 +2,11 @@
 #  SPDX-License-Identifier: Apache-2.0
 
 import os
+import base64
 import boto3
 import json
-from boto3.dynamodb.conditions import Key
-from boto3.dynamodb.types import TypeDeserializer
+from boto3.dynamodb.conditions import Key, Attr
+from botocore.exceptions import ClientError
 from common.validators import validate
 from handlers.auth import request_to_claims
 from handlers.authz import CasbinEnforcer
@@ -15,15 +16,18 @@ from customLogging.logger import safeLogger
 from common.dynamodb import validate_pagination_info
 
 claims_and_roles = {}
+casbin_enforcer = None
 
 # Create a logger object to log the events
 logger = safeLogger(service="CommentService")
 
 dynamodb = boto3.resource("dynamodb")
-dynamodb_client = boto3.client("dynamodb")
 main_rest_response = STANDARD_JSON_RESPONSE
 comment_database = None
 
+# Index on commentOwnerID (sorted by dateCreated) used to list a user's comments without scanning the table
+COMMENT_OWNER_INDEX = "CommentOwnerIdIndex"
+
 try:
     comment_database = os.environ["COMMENT_STORAGE_TABLE_NAME"]
 except:
@@ -31,124 +35,146 @@ except:
     main_rest_response["body"]["message"] = "Failed Loading Comment Storage Environment Variables"
 
 
-def get_all_comments(queryParams: dict, showDeleted=False) -> dict:
+def _encode_comments_token(last_evaluated_key: dict) -> str:
     """
-    Gets all of the comments from the database
-    NOTE: This is not currently used, but could be helpful to populate the comments section when the page first loads and no asset is selected
-    :param queryParams: pagination information
-    :param showDeleted: boolean storing if deleted comments should be returned
-    :returns: all comments in the database
+    Encodes the LastEvaluatedKey of a comments query as a base64 cursor
+    :param last_evaluated_key: LastEvaluatedKey returned by DynamoDB
+    :returns: base64 NextToken
     """
-    deserializer = TypeDeserializer()
-
-    paginator = dynamodb_client.get_paginator("scan")
-    operator = "NOT_CONTAINS"
-    if showDeleted:
-        operator = "CONTAINS"
-    filter = {
-        "assetId": {
-            "AttributeValueList": [{"S": "#deleted"}],
-            "ComparisonOperator": f"{operator}",
-        }
-    }
+    json_str = json.dumps(last_evaluated_key)
+    return base64.b64encode(json_str.encode("utf-8")).decode("utf-8")
+
+
+def _decode_comments_token(starting_token: str) -> dict:
+    """
+    Decodes a cursor created by _encode_comments_token
+    :param starting_token: base64 startingToken from the request
+    :returns: ExclusiveStartKey for the next query
+    """
+    try:
+        exclusive_start_key = json.loads(base64.b64decode(starting_token).decode("utf-8"))
+    except (json.JSONDecodeError, base64.binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination token") from e
+    if not isinstance(exclusive_start_key, dict):
+        raise ValueError("Invalid pagination token")
+    return exclusive_start_key
 
-    # Handle empty string for startingToken
-    pagination_config = {
-        "MaxItems": int(queryParams["maxItems"]),
-        "PageSize": int(queryParams["pageSize"]),
-    }
-    if queryParams["startingToken"] and queryParams["startingToken"] != "":
-        pagination_config["StartingToken"] = queryParams["startingToken"]
 
+def _query_comments_page(queryParams: dict, **query_kwargs) -> dict:
+    """
+    Runs a single page of a comments query
+    :param queryParams: pagination information (pageSize and optional startingToken cursor)
+    :param query_kwargs: query arguments (KeyConditionExpression, IndexName, ...)
+    :returns: dictionary with the page Items and a NextToken cursor when more items remain
+    """
+    query_kwargs.update({
+        "TableName": comment_database,
+        "ScanIndexForward": False,
+        "Limit": int(queryParams["pageSize"]),
+    })
+    if queryParams.get("startingToken"):
+        query_kwargs["ExclusiveStartKey"] = _decode_comments_token(queryParams["startingToken"])
+
+    response = dynamodb.meta.client.query(**query_kwargs)
+
+    result = {"Items": response.get("Items", [])}
+    if "LastEvaluatedKey" in response:
+        result["NextToken"] = _encode_comments_token(response["LastEvaluatedKey"])
+    return result
+
+
+def get_all_comments(userId: str, queryParams: dict, showDeleted=False) -> dict:
+    """
+    Gets the comments written by a user across all assets, newest first
+    NOTE: This is not currently routed, but could be helpful to populate the comments section when the page first loads and no asset is selected
+    :param userId: id of the user whose comments to return
+    :param queryParams: pagination information
+    :param showDeleted: boolean storing if deleted comments should be returned
+    :returns: page of comments the caller is allowed to read
+    """
+    # Deleted comments are re-keyed with #deleted appended to their assetId, but keep their owner
+    deleted_filter = Attr("assetId").contains("#deleted")
     try:
-        pageIterator = paginator.paginate(
-            TableName=comment_database,
-            ScanFilter=filter,
-            PaginationConfig=pagination_config,
-        ).build_full_result()
-
-        logger.info("Fetching results")
-        result = {}
-        items = []
-        for item in pageIterator["Items"]:
-            deserialized_document = {k: deserializer.deserialize(v) for k, v in item.items()}
-            items.append(deserialized_document)
-        result["Items"] = items
-        if "NextToken" in pageIterator:
-            result["NextToken"] = pageIterator["NextToken"]
-        return result
+        result = _query_comments_page(
+            queryParams,
+            IndexName=COMMENT_OWNER_INDEX,
+            KeyConditionExpression=Key("commentOwnerID").eq(userId),
+            FilterExpression=deleted_filter if showDeleted else ~deleted_filter,
+        )
     except Exception as e:
         logger.exception(f"Error in get_all_comments: {str(e)}")
         # Return empty result on error
         return {"Items": []}
 
+    # Evaluate authorization once per asset rather than once per comment
+    allowed_assets = {}
+    items = []
+    for item in result["Items"]:
+        assetId = item["assetId"].replace("#deleted", "")
+        if assetId not in allowed_assets:
+            allowed_assets[assetId] = is_asset_allowed(assetId, "GET")
+        if allowed_assets[assetId]:
+            items.append(item)
+    result["Items"] = items
+    return result
+
 
 def get_comments(assetId: str, queryParams: dict, showDeleted=False) -> dict:
     """
-    Gets all of the comments associated with a specific asset (using assetId)
+    Gets a page of the comments associated with a specific asset (using assetId)
     :param assetId: id of the asset to get comments for
     :param queryParams: pagination information
     :param showDeleted: boolean storing if deleted comments should be returned
-    :returns: dictionary with all comments for specific asset
+    :returns: dictionary with a page of comments for the specific asset and a NextToken cursor
     """
-    paginator = dynamodb.meta.client.get_paginator('query')
-
-    # Handle empty string for startingToken
-    pagination_config = {
-        'MaxItems': int(queryParams['maxItems']),
-        'PageSize': int(queryParams['pageSize']),
-    }
-    if queryParams['startingToken'] and queryParams['startingToken'] != "":
-        pagination_config['StartingToken'] = queryParams['startingToken']
-
     try:
-        response = paginator.paginate(
-            TableName=comment_database,
+        return _query_comments_page(
+            queryParams,
             KeyConditionExpression=Key("assetId").eq(assetId),
-            ScanIndexForward=False,
-            PaginationConfig=pagination_config
-        ).build_full_result()
-
-        return response["Items"]
+        )
     except Exception as e:
         logger.exception(f"Error in get_comments: {str(e)}")
         # Return empty result on error
-        return []
+        return {"Items": []}
 
 
 def get_comments_version(assetId: str, assetVersionId: str, queryParams: dict, showDeleted=False) -> dict:
     """
-    Gets all of the comments for a specific assetId versionId pair (all comments for a specific version of an asset)
+    Gets a page of the comments for a specific assetId versionId pair (comments for a specific version of an asset)
     :param assetId: id of the asset to get comments for
     :param assetVersionId: id of the version to get comments for
     :param queryParams: pagination information
     :param showDeleted: boolean storing if deleted comments should be returned
-    :returns: dictionary with all comments for a specific version of an asset
+    :returns: dictionary with a page of comments for a specific version of an asset and a NextToken cursor
     """
-    paginator = dynamodb.meta.client.get_paginator('query')
-
-    # Handle empty string for startingToken
-    pagination_config = {
-        'MaxItems': int(queryParams['maxItems']),
-        'PageSize': int(queryParams['pageSize']),
-    }
-    if queryParams['startingToken'] and queryParams['startingToken'] != "":
-        pagination_config['StartingToken'] = queryParams['startingToken']
-
     try:
         # Queries partition key (assetId) and queries sort keys that begin_with the desired asset version
-        response = paginator.paginate(
-            TableName=comment_database,
-            KeyConditionExpression=Key("assetId").eq(assetId) & Key("assetVersionId:commentId").begins_with(assetVersionId),
-            ScanIndexForward=False,
-            PaginationConfig=pagination_config
-        ).build_full_result()
-
-        return response["Items"]
+        return _query_comments_page(
+            queryParams,
+            KeyConditionExpression=Key("assetId").eq(assetId) & Key("assetVersionId:commentId").begins_with(assetVersionId + ":"),
+        )
     except Exception as e:
         logger.exception(f"Error in get_comments_version: {str(e)}")
         # Return empty result on error
-        return []
+        return {"Items": []}
+
+
+def is_asset_allowed(assetId: str, action: str) -> bool:
+    """
+    Checks whether the current user may perform an action on the comments of an asset
+    :param assetId: id of the asset the comments are attached to
+    :param action: Casbin action to enforce (GET, DELETE)
+    :returns: True if the action is allowed
+    """
+    global casbin_enforcer
+    if len(claims_and_roles["tokens"]) == 0:
+        return False
+    if casbin_enforcer is None:
+        casbin_enforcer = CasbinEnforcer(claims_and_roles)
+
+    asset_object = get_asset_object_from_id(None, assetId)
+    asset_object.update({"object__type": "asset"})
+    return casbin_enforcer.enforce(asset_object, action)
 
 
 def get_single_comment(assetId: str, assetVersionIdAndCommentId: str, showDeleted=False) -> dict:
@@ -177,47 +203,49 @@ def delete_comment(assetId: str, assetVersionIdAndCommentId: str, userId: str, e
     table = dynamodb.Table(comment_database)
     if "#deleted" in assetId:
         return response
-    item = get_single_comment(assetId, assetVersionIdAndCommentId)
-    if item:
-        logger.info(f"Got comment:")
-        logger.info(item)
-
-        logger.info("Verifying user")
-        comment_user_id = item["commentOwnerID"]
-        if userId != comment_user_id:
-            logger.warning("invalid user - ownerID mismatch with caller")
-            response["statusCode"] = 403
-            response["message"] = "Unauthorized - only the creator of the comment can delete it"
-            return response
-
-        logger.info("Deleting comment")
-        item["assetId"] = assetId + "#deleted"
 
-        # Delete the old comment from the table
-        try:
-            table.delete_item(
-                Key={
-                    "assetId": assetId,
-                    "assetVersionId:commentId": assetVersionIdAndCommentId,
-                }
-            )
-        except Exception as e:
+    # Delete the comment only if the caller owns it; the old item comes back with the result so it is not read first
+    logger.info("Deleting comment")
+    try:
+        item = table.delete_item(
+            Key={
+                "assetId": assetId,
+                "assetVersionId:commentId": assetVersionIdAndCommentId,
+            },
+            ConditionExpression=Attr("assetId").exists() & Attr("commentOwnerID").eq(userId),
+            ReturnValues="ALL_OLD",
+            ReturnValuesOnConditionCheckFailure="ALL_OLD",
+        )["Attributes"]
+    except ClientError as e:
+        if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
             logger.exception(e)
             response["statusCode"] = 500
             response["message"] = "Internal Server Error"
             return response
-
-        # Create a new comment with #deleted appended to the assetId
-        try:
-            table.put_item(Item=item)
-        except Exception as e:
-            logger.exception(e)
-            response["statusCode"] = 500
-            response["message"] = "Internal Server Error"
+        if "Item" not in e.response:
             return response
+        logger.warning("invalid user - ownerID mismatch with caller")
+        response["statusCode"] = 403
+        response["message"] = "Unauthorized - only the creator of the comment can delete it"
+        return response
+    except Exception as e:
+        logger.exception(e)
+        response["statusCode"] = 500
+        response["message"] = "Internal Server Error"
+        return response
 
-        response["statusCode"] = 200
-        response["message"] = "Comment deleted"
+    # Create a new comment with #deleted appended to the assetId
+    item["assetId"] = assetId + "#deleted"
+    try:
+        table.put_item(Item=item)
+    except Exception as e:
+        logger.exception(e)
+        response["statusCode"] = 500
+        response["message"] = "Internal Server Error"
+        return response
+
+    response["statusCode"] = 200
+    response["message"] = "Comment deleted"
     return response
 
 
@@ -234,16 +262,23 @@ def get_handler(response: dict, pathParameters: dict, queryParameters: dict) ->
     if "showDeleted" in queryParameters:
         showDeleted = queryParameters["showDeleted"]
 
-    method_allowed_on_api = False
-
-    asset_object = get_asset_object_from_id(None, pathParameters["assetId"])
-    asset_object.update({"object__type": "asset"})
+    # Reject malformed cursors before running any query
+    if queryParameters.get("startingToken"):
+        try:
+            _decode_comments_token(queryParameters["startingToken"])
+        except ValueError as e:
+            logger.warning(str(e))
+            response["body"] = json.dumps({"message": str(e)})
+            response["statusCode"] = 400
+            return response
 
     # Add Casbin Enforcer to check if the current user has permissions to GET the Comment
-    if len(claims_and_roles["tokens"]) > 0:
-        casbin_enforcer = CasbinEnforcer(claims_and_roles)
-        if casbin_enforcer.enforce(asset_object, "GET"):
-            method_allowed_on_api = True
+    # Comments of an asset share its permissions, so this is evaluated once for the asset rather than per comment.
+    # Listings across assets (no assetId) authorize each distinct asset of the returned page instead.
+    if "assetId" in pathParameters:
+        method_allowed_on_api = is_asset_allowed(pathParameters["assetId"], "GET")
+    else:
+        method_allowed_on_api = len(claims_and_roles["tokens"]) > 0
 
     if method_allowed_on_api:
         if "assetVersionId:commentId" not in pathParameters:
@@ -288,9 +323,10 @@ def get_handler(response: dict, pathParameters: dict, queryParameters: dict) ->
                 response["statusCode"] = 200
                 return response
             else:
-                # if we have nothing, call get_all_comments
+                # if we have nothing, call get_all_comments for the current user
                 logger.info("Listing All Comments")
-                response["body"] = json.dumps({"message": get_all_comments(queryParameters, showDeleted)})
+                userId = claims_and_roles["tokens"][0]
+                response["body"] = json.dumps({"message": get_all_comments(userId, queryParameters, showDeleted)})
                 response["statusCode"] = 200
                 return response
         else:
@@ -390,16 +426,8 @@ def delete_handler(response: dict, pathParameters: dict, event: dict) -> dict:
 
     global claims_and_roles
     claims_and_roles = request_to_claims(event)
-    method_allowed_on_api = False
-
-    asset_object = get_asset_object_from_id(None, pathParameters["assetId"])
-    asset_object.update({"object__type": "asset"})
-
     # Add Casbin Enforcer to check if the current user has permissions to DELETE the Comment
-    if len(claims_and_roles["tokens"]) > 0:
-        casbin_enforcer = CasbinEnforcer(claims_and_roles)
-        if casbin_enforcer.enforce(asset_object, "DELETE"):
-            method_allowed_on_api = True
+    method_allowed_on_api = is_asset_allowed(pathParameters["assetId"], "DELETE")
 
     if method_allowed_on_api:
 
@@ -440,12 +468,14 @@ def lambda_handler(event: dict, context: dict) -> dict:
         httpMethod = event["requestContext"]["http"]["method"]
         logger.info(httpMethod)
 
-        global claims_and_roles
+        global claims_and_roles, casbin_enforcer
         claims_and_roles = request_to_claims(event)
+        casbin_enforcer = None
 
         method_allowed_on_api = False
 
         # Add Casbin Enforcer to check if the current user has permissions to GET the Comment
+        # The enforcer is kept for the object-level checks of this request
         if len(claims_and_roles["tokens"]) > 0:
             casbin_enforcer = CasbinEnforcer(claims_and_roles)
             if casbin_enforcer.enforceAPI(event):
@@ -4,6 +4,7 @@
 import json
 import os
 import base64
+import time
 import boto3
 from boto3.dynamodb.conditions import Key
 from boto3.dynamodb.types import TypeDeserializer
@@ -24,6 +25,12 @@ dbClient = boto3.client('dynamodb')
 deserializer = TypeDeserializer()
 logger = safeLogger(service_name="DatabaseService")
 
+# Seconds a container reuses a bucket lookup when listing databases
+BUCKET_CACHE_SECONDS = 60
+
+# Per-container bucket lookups by bucketId: (bucket item, expiry time)
+bucket_cache = {}
+
 # Load environment variables
 try:
     db_database = os.environ.get("DATABASE_STORAGE_TABLE_NAME")
@@ -74,6 +81,22 @@ def check_assets(database_id):
     )
     return db_response['Count'] > 0
 
+def get_bucket(bucket_id):
+    """Get a bucket record by ID, reusing recent lookups so database listings do not query the buckets table per database"""
+    cached = bucket_cache.get(bucket_id)
+    if cached and cached[1] > time.time():
+        return cached[0]
+
+    buckets_table = dynamodb.Table(s3_asset_buckets_table)
+    bucket_response = buckets_table.query(
+        KeyConditionExpression=Key('bucketId').eq(bucket_id),
+        Limit=1
+    )
+    # Use the first item from the query results
+    bucket = bucket_response.get("Items", [{}])[0] if bucket_response.get("Items") else {}
+    bucket_cache[bucket_id] = (bucket, time.time() + BUCKET_CACHE_SECONDS)
+    return bucket
+
 def get_database(database_id, show_deleted=False, claims_and_roles=None):
     """Get a single database by ID"""
     try:
@@ -105,13 +128,7 @@ def get_database(database_id, show_deleted=False, claims_and_roles=None):
                 bucket_name = None
                 base_assets_prefix = None
                 if database.get('defaultBucketId'):
-                    buckets_table = dynamodb.Table(s3_asset_buckets_table)
-                    bucket_response = buckets_table.query(
-                        KeyConditionExpression=Key('bucketId').eq(database.get('defaultBucketId')),
-                        Limit=1
-                    )
-                    # Use the first item from the query results
-                    bucket = bucket_response.get("Items", [{}])[0] if bucket_response.get("Items") else {}
+                    bucket = get_bucket(database.get('defaultBucketId'))
                     bucket_name = bucket.get('bucketName')
                     base_assets_prefix = bucket.get('baseAssetsPrefix')
                 
@@ -175,6 +192,10 @@ def get_databases(query_params, show_deleted=False, claims_and_roles=None):
         response = dbClient.scan(**scan_params)
 
         items = []
+        casbin_enforcer = None
+        if claims_and_roles and len(claims_and_roles["tokens"]) > 0:
+            casbin_enforcer = CasbinEnforcer(claims_and_roles)
+
         for item in response.get('Items', []):
             deserialized_document = {k: deserializer.deserialize(v) for k, v in item.items()}
 
@@ -183,20 +204,13 @@ def get_databases(query_params, show_deleted=False, claims_and_roles=None):
                 "object__type": "database"
             })
             
-            if claims_and_roles and len(claims_and_roles["tokens"]) > 0:
-                casbin_enforcer = CasbinEnforcer(claims_and_roles)
+            if casbin_enforcer:
                 if casbin_enforcer.enforce(deserialized_document, "GET"):
                     # Get bucket information if defaultBucketId exists
                     bucket_name = None
                     base_assets_prefix = None
                     if deserialized_document.get('defaultBucketId'):
-                        buckets_table = dynamodb.Table(s3_asset_buckets_table)
-                        bucket_response = buckets_table.query(
-                            KeyConditionExpression=Key('bucketId').eq(deserialized_document.get('defaultBucketId')),
-                            Limit=1
-                        )
-                        # Use the first item from the query results
-                        bucket = bucket_response.get("Items", [{}])[0] if bucket_response.get("Items") else {}
+                        bucket = get_bucket(deserialized_document.get('defaultBucketId'))
                         bucket_name = bucket.get('bucketName')
                         base_assets_prefix = bucket.get('baseAssetsPrefix')
                     
@@ -267,20 +281,20 @@ def update_database(database_id, update_data, claims_and_roles=None):
         logger.info(f"Updating database {database_id}")
         
         # Update only the provided fields
-        if 'description' in update_data and update_data['description'] is not None:
-            database['description'] = update_data['description']
-        
-        if 'defaultBucketId' in update_data and update_data['defaultBucketId'] is not None:
-            database['defaultBucketId'] = update_data['defaultBucketId']
-        
-        if 'restrictMetadataOutsideSchemas' in update_data and update_data['restrictMetadataOutsideSchemas'] is not None:
-            database['restrictMetadataOutsideSchemas'] = update_data['restrictMetadataOutsideSchemas']
-        
-        if 'restrictFileUploadsToExtensions' in update_data and update_data['restrictFileUploadsToExtensions'] is not None:
-            database['restrictFileUploadsToExtensions'] = update_data['restrictFileUploadsToExtensions']
+        updated_fields = {
+            field: update_data[field]
+            for field in ['description', 'defaultBucketId', 'restrictMetadataOutsideSchemas', 'restrictFileUploadsToExtensions']
+            if field in update_data and update_data[field] is not None
+        }
         
-        # Save the updated database
-        table.put_item(Item=database)
+        # Save the updated fields in place so the atomically maintained assetCount is not overwritten
+        if updated_fields:
+            table.update_item(
+                Key={'databaseId': database_id},
+                UpdateExpression='SET ' + ', '.join(f"#f{i} = :v{i}" for i in range(len(updated_fields))),
+                ExpressionAttributeNames={f"#f{i}": field for i, field in enumerate(updated_fields)},
+                ExpressionAttributeValues={f":v{i}": value for i, value in enumerate(updated_fields.values())}
+            )
         
         # Create response
         from datetime import datetime
@@ -0,0 +1,85 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Scheduled reconciliation of per-database asset counters.
+
+Asset create, archive, unarchive and delete keep each database's assetCount current with
+atomic ADD updates. This job recounts every database with COUNT queries and rewrites the
+counters that drifted (for example after a failed counter update or a write made outside
+the asset APIs).
+"""
+
+import os
+import boto3
+from botocore.config import Config
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from customLogging.logger import safeLogger
+from handlers.assets.assetCount import count_assets, reconcile_asset_count
+
+retry_config = Config(
+    retries={
+        'max_attempts': 5,
+        'mode': 'adaptive'
+    }
+)
+
+dynamodb_client = boto3.client('dynamodb', config=retry_config)
+logger = safeLogger(service_name="ReconcileAssetCounts")
+
+# Load environment variables
+try:
+    db_database = os.environ["DATABASE_STORAGE_TABLE_NAME"]
+    asset_database = os.environ["ASSET_STORAGE_TABLE_NAME"]
+except Exception as e:
+    logger.exception("Failed loading environment variables")
+    raise e
+
+
+def _stored_count(item):
+    """Return the stored assetCount of a database item, or None if missing or not a number"""
+    count = item.get('assetCount', {})
+    value = count.get('N')
+    return int(value) if value is not None else None
+
+
+def reconcile_all_asset_counts():
+    """Recount the assets of every active database and fix counters that differ
+
+    Returns:
+        Dictionary with the number of databases checked, corrected and failed
+    """
+    result = {'checked': 0, 'corrected': 0, 'failed': 0}
+    scan_params = {
+        'TableName': db_database,
+        'ProjectionExpression': 'databaseId, assetCount',
+    }
+    while True:
+        response = dynamodb_client.scan(**scan_params)
+        for item in response.get('Items', []):
+            database_id = item['databaseId']['S']
+            if database_id.endswith('#deleted'):
+                continue
+
+            result['checked'] += 1
+            try:
+                stored = _stored_count(item)
+                if stored is not None and stored == count_assets(asset_database, database_id):
+                    continue
+                count = reconcile_asset_count(db_database, asset_database, database_id)
+                logger.info(f"Corrected asset count of database {database_id} from {stored} to {count}")
+                result['corrected'] += 1
+            except Exception as e:
+                logger.exception(f"Error reconciling asset count for database {database_id}: {e}")
+                result['failed'] += 1
+
+        if 'LastEvaluatedKey' not in response:
+            return result
+        scan_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def lambda_handler(event, context: LambdaContext):
+    """Lambda handler for the scheduled asset count reconciliation"""
+    result = reconcile_all_asset_counts()
+    logger.info(f"Asset count reconciliation finished: {result}")
+    return result
@@ -995,6 +995,175 @@ def handle_asset_links_stream(event_record: Dict[str, Any]) -> List[IndexOperati
             operation="error"
         )]
 
+#######################
+# Event Batch Coalescing
+#######################
+
+def unwrap_event_records(event: Dict[str, Any]) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[IndexOperationResponse]]:
+    """Unwrap the SQS/SNS envelopes of an event into asset, metadata, and asset links stream records
+
+    Returns:
+        Tuple of (list of ('asset', 'metadata' or 'links', record) in arrival order, error responses for unparseable messages)
+    """
+    entries = []
+    errors = []
+
+    for record in event['Records']:
+        event_source = record.get('eventSource', '')
+
+        if event_source == 'aws:dynamodb':
+            # Determine which table based on event source ARN
+            source_arn = record.get('eventSourceARN', '')
+
+            if asset_storage_table_name in source_arn:
+                entries.append(('asset', record))
+            elif asset_file_metadata_table_name in source_arn:
+                entries.append(('metadata', record))
+            elif asset_links_table_name in source_arn:
+                entries.append(('links', record))
+            else:
+                logger.warning(f"Unknown DynamoDB table in source ARN: {source_arn}")
+
+        elif event_source == 'aws:sqs':
+            # SQS message (contains SNS message with DynamoDB stream record)
+            try:
+                # Parse SQS message body
+                body = record.get('body', '')
+                if isinstance(body, str):
+                    body = json.loads(body)
+
+                # Check if this is an SNS message
+                if body.get('Type') == 'Notification' and body.get('Message'):
+                    # Parse SNS message
+                    sns_message = body.get('Message')
+                    if isinstance(sns_message, str):
+                        sns_message = json.loads(sns_message)
+
+                    # First check if SNS message is a direct DynamoDB stream record (from SNS queuing Lambda)
+                    # This is the direct SNS→SQS path - check by eventSourceARN or eventName
+                    source_arn = sns_message.get('eventSourceARN', '')
+
+                    if asset_storage_table_name in source_arn:
+                        entries.append(('asset', sns_message))
+                    elif asset_file_metadata_table_name in source_arn:
+                        entries.append(('metadata', sns_message))
+                    elif asset_links_table_name in source_arn:
+                        entries.append(('links', sns_message))
+                    # Fallback: check if it's a DynamoDB stream by eventName and try to determine type
+                    elif sns_message.get('eventName') in ['INSERT', 'MODIFY', 'REMOVE']:
+                        # This is a DynamoDB stream record, try to determine type by data structure
+                        dynamodb_data = sns_message.get('dynamodb', {})
+                        new_image = dynamodb_data.get('NewImage', {})
+                        old_image = dynamodb_data.get('OldImage', {})
+                        keys = dynamodb_data.get('Keys', {})
+
+                        # Check if it has assetLinkId (asset links table)
+                        if 'assetLinkId' in new_image or 'assetLinkId' in old_image or 'assetLinkId' in keys:
+                            entries.append(('links', sns_message))
+                        # Check if it has assetId and databaseId (could be asset or metadata)
+                        elif ('assetId' in new_image or 'assetId' in old_image or 'assetId' in keys) and \
+                             ('databaseId' in new_image or 'databaseId' in old_image or 'databaseId' in keys):
+                            # Try to determine if it's asset or metadata by checking assetId format
+                            asset_id_value = new_image.get('assetId', {}).get('S') or \
+                                            old_image.get('assetId', {}).get('S') or \
+                                            keys.get('assetId', {}).get('S')
+
+                            if asset_id_value and '/' in asset_id_value:
+                                # Has path, likely metadata
+                                entries.append(('metadata', sns_message))
+                            else:
+                                # No path, likely asset
+                                entries.append(('asset', sns_message))
+                        else:
+                            logger.warning(f"Cannot determine DynamoDB table type from SNS message structure")
+
+                    else:
+                        logger.warning(f"SNS message does not contain recognized event format (no eventSource, eventName, or Records): {list(sns_message.keys())}")
+                else:
+                    logger.warning("SQS message is not an SNS notification")
+            except json.JSONDecodeError as e:
+                logger.exception(f"Error parsing SQS/SNS message: {e}")
+                errors.append(IndexOperationResponse(
+                    success=False,
+                    message=f"Error parsing SQS/SNS message: {str(e)}",
+                    indexName=opensearch_asset_index,
+                    operation="error"
+                ))
+
+        else:
+            logger.warning(f"Unknown event source: {event_source}")
+
+    return entries, errors
+
+def get_asset_record_targets(source: str, event_record: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    """Get the assets an asset, metadata, or asset links stream record re-indexes
+
+    Returns:
+        List of (databaseId, assetId, operation), empty if the record has no resolvable target
+    """
+    event_name = event_record.get('eventName', '')
+    dynamodb_data = event_record.get('dynamodb', {})
+    # REMOVE events only carry Keys with NEW_IMAGE stream types
+    record_data = dynamodb_data.get('Keys', {}) if event_name == 'REMOVE' else dynamodb_data.get('NewImage', {})
+
+    if source == 'asset':
+        database_id = record_data.get('databaseId', {}).get('S')
+        asset_id = record_data.get('assetId', {}).get('S')
+        if not database_id or not asset_id:
+            return []
+        return [(database_id, asset_id, "delete" if event_name == 'REMOVE' else "index")]
+
+    if source == 'metadata':
+        composite_key = record_data.get('databaseId:assetId:filePath', {}).get('S')
+        parts = composite_key.split(':', 2) if composite_key else []
+        # Only asset-level metadata (file_path is "/") affects the asset index
+        if len(parts) != 3 or parts[2] != '/':
+            return []
+        return [(parts[0], parts[1], "index")]
+
+    from_asset_key = record_data.get('fromAssetDatabaseId:fromAssetId', {}).get('S')
+    to_asset_key = record_data.get('toAssetDatabaseId:toAssetId', {}).get('S')
+    if not from_asset_key or not to_asset_key or ':' not in from_asset_key or ':' not in to_asset_key:
+        return []
+    from_database_id, from_asset_id = from_asset_key.split(':', 1)
+    to_database_id, to_asset_id = to_asset_key.split(':', 1)
+    # Update both assets since their relationship flags may have changed
+    return [(from_database_id, from_asset_id, "index"), (to_database_id, to_asset_id, "index")]
+
+def coalesce_asset_records(entries: List[Tuple[str, Dict[str, Any]]]) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[AssetIndexRequest], int]:
+    """Group the records of an event batch into one index request per asset
+
+    Both operations re-read the asset, and "delete" only removes the document when the asset no
+    longer exists (otherwise it indexes it), so an asset with any REMOVE in the batch gets "delete".
+
+    Returns:
+        Tuple of (records without a resolvable target, index requests, number of asset operations coalesced away)
+    """
+    unresolved = []
+    requests: Dict[Tuple[str, str], AssetIndexRequest] = {}
+    operations = 0
+
+    for source, event_record in entries:
+        targets = get_asset_record_targets(source, event_record)
+        if not targets:
+            # Let the event handler report the unresolvable record
+            unresolved.append((source, event_record))
+            continue
+
+        for database_id, asset_id, operation in targets:
+            operations += 1
+            # Re-insert so requests run in order of each asset's last change
+            previous = requests.pop((database_id, asset_id), None)
+            if previous is not None and previous.operation == "delete":
+                operation = "delete"
+            requests[(database_id, asset_id)] = AssetIndexRequest(
+                databaseId=database_id,
+                assetId=asset_id,
+                operation=operation
+            )
+
+    return unresolved, list(requests.values()), operations - len(requests)
+
 #######################
 # Lambda Handler
 #######################
@@ -1007,111 +1176,28 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
         logger.info(f"Processing asset indexing event: {json.dumps(event, default=str)}")
         
         results = []
+        records_received = 0
+        records_coalesced = 0
         
         # Handle different event sources
         if 'Records' in event:
-            for record in event['Records']:
-                event_source = record.get('eventSource', '')
-                
-                if event_source == 'aws:dynamodb':
-                    # Determine which table based on event source ARN
-                    source_arn = record.get('eventSourceARN', '')
-                    
-                    if asset_storage_table_name in source_arn:
-                        # Asset table stream
-                        result = handle_asset_stream(record)
-                        results.append(result)
-                        
-                    elif asset_file_metadata_table_name in source_arn:
-                        # Metadata table stream
-                        result = handle_metadata_stream(record)
-                        results.append(result)
-                        
-                    elif asset_links_table_name in source_arn:
-                        # Asset links table stream
-                        link_results = handle_asset_links_stream(record)
-                        results.extend(link_results)
-                        
-                    else:
-                        logger.warning(f"Unknown DynamoDB table in source ARN: {source_arn}")
-                
-                elif event_source == 'aws:sqs':
-                    # SQS message (contains SNS message with DynamoDB stream record)
-                    try:
-                        # Parse SQS message body
-                        body = record.get('body', '')
-                        if isinstance(body, str):
-                            body = json.loads(body)
-                        
-                        # Check if this is an SNS message
-                        if body.get('Type') == 'Notification' and body.get('Message'):
-                            # Parse SNS message
-                            sns_message = body.get('Message')
-                            if isinstance(sns_message, str):
-                                sns_message = json.loads(sns_message)
-                            
-                            # First check if SNS message is a direct DynamoDB stream record (from SNS queuing Lambda)
-                            # This is the direct SNS→SQS path - check by eventSourceARN or eventName
-                            source_arn = sns_message.get('eventSourceARN', '')
-                            
-                            if asset_storage_table_name in source_arn:
-                                # Direct asset table stream from SNS queuing Lambda
-                                result = handle_asset_stream(sns_message)
-                                results.append(result)
-                            elif asset_file_metadata_table_name in source_arn:
-                                # Direct metadata table stream from SNS queuing Lambda
-                                result = handle_metadata_stream(sns_message)
-                                results.append(result)
-                            elif asset_links_table_name in source_arn:
-                                # Direct asset links table stream from SNS queuing Lambda
-                                link_results = handle_asset_links_stream(sns_message)
-                                results.extend(link_results)
-                            # Fallback: check if it's a DynamoDB stream by eventName and try to determine type
-                            elif sns_message.get('eventName') in ['INSERT', 'MODIFY', 'REMOVE']:
-                                # This is a DynamoDB stream record, try to determine type by data structure
-                                dynamodb_data = sns_message.get('dynamodb', {})
-                                new_image = dynamodb_data.get('NewImage', {})
-                                old_image = dynamodb_data.get('OldImage', {})
-                                keys = dynamodb_data.get('Keys', {})
-                                
-                                # Check if it has assetLinkId (asset links table)
-                                if 'assetLinkId' in new_image or 'assetLinkId' in old_image or 'assetLinkId' in keys:
-                                    link_results = handle_asset_links_stream(sns_message)
-                                    results.extend(link_results)
-                                # Check if it has assetId and databaseId (could be asset or metadata)
-                                elif ('assetId' in new_image or 'assetId' in old_image or 'assetId' in keys) and \
-                                     ('databaseId' in new_image or 'databaseId' in old_image or 'databaseId' in keys):
-                                    # Try to determine if it's asset or metadata by checking assetId format
-                                    asset_id_value = new_image.get('assetId', {}).get('S') or \
-                                                    old_image.get('assetId', {}).get('S') or \
-                                                    keys.get('assetId', {}).get('S')
-                                    
-                                    if asset_id_value and '/' in asset_id_value:
-                                        # Has path, likely metadata
-                                        result = handle_metadata_stream(sns_message)
-                                        results.append(result)
-                                    else:
-                                        # No path, likely asset
-                                        result = handle_asset_stream(sns_message)
-                                        results.append(result)
-                                else:
-                                    logger.warning(f"Cannot determine DynamoDB table type from SNS message structure")
-                            
-                            else:
-                                logger.warning(f"SNS message does not contain recognized event format (no eventSource, eventName, or Records): {list(sns_message.keys())}")
-                        else:
-                            logger.warning("SQS message is not an SNS notification")
-                    except json.JSONDecodeError as e:
-                        logger.exception(f"Error parsing SQS/SNS message: {e}")
-                        results.append(IndexOperationResponse(
-                            success=False,
-                            message=f"Error parsing SQS/SNS message: {str(e)}",
-                            indexName=opensearch_asset_index,
-                            operation="error"
-                        ))
-                        
+            # Unwrap all envelopes first so repeated changes to one asset in the batch are indexed once
+            entries, results = unwrap_event_records(event)
+            records_received = len(entries)
+            unresolved, requests, records_coalesced = coalesce_asset_records(entries)
+            if records_coalesced:
+                logger.info(f"Coalesced {records_coalesced} asset index operations from {records_received} records in batch")
+            
+            for source, record in unresolved:
+                if source == 'asset':
+                    results.append(handle_asset_stream(record))
+                elif source == 'metadata':
+                    results.append(handle_metadata_stream(record))
                 else:
-                    logger.warning(f"Unknown event source: {event_source}")
+                    results.extend(handle_asset_links_stream(record))
+            
+            for request in requests:
+                results.append(process_asset_index_request(request))
         
         else:
             # Direct invocation with AssetIndexRequest
@@ -1119,6 +1205,7 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
                 request = parse(event, model=AssetIndexRequest)
                 result = process_asset_index_request(request)
                 results.append(result)
+                records_received = 1
             except ValidationError as v:
                 logger.exception(f"Validation error: {v}")
                 return validation_error(body={'message': str(v)}, event=event)
@@ -1129,6 +1216,8 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
         
         response_body = {
             'message': f"Processed {successful}/{total} asset indexing operations successfully",
+            'recordsReceived': records_received,
+            'recordsCoalesced': records_coalesced,
             'results': [r.dict() for r in results]
         }
         
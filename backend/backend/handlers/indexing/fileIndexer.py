@@ -20,6 +20,7 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import parse, ValidationError
 from common.constants import STANDARD_JSON_RESPONSE
 from common.validators import validate
+from common.previewIndex import lookup_preview_file_keys
 from handlers.authz import CasbinEnforcer
 from handlers.auth import request_to_claims
 from customLogging.logger import safeLogger
@@ -583,6 +584,11 @@ def find_preview_file_key(bucket_name: str, s3_key: str) -> str:
     Returns:
         The S3 key of the preview file if found, or empty string if not.
     """
+    # Preview-existence index answers with a single key read when it has a record
+    indexed_preview_keys = lookup_preview_file_keys(bucket_name, s3_key)
+    if indexed_preview_keys is not None:
+        return indexed_preview_keys[0] if indexed_preview_keys else ''
+
     try:
         prefix = s3_key + '.previewFile.'
         response = s3_client.list_objects_v2(
@@ -1491,6 +1497,195 @@ def handle_metadata_stream(event_record: Dict[str, Any]) -> IndexOperationRespon
             operation="error"
         )
 
+#######################
+# Event Batch Coalescing
+#######################
+
+def unwrap_event_records(event: Dict[str, Any]) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[IndexOperationResponse]]:
+    """Unwrap the SQS/SNS envelopes of an event into S3 notification and metadata stream records
+
+    Returns:
+        Tuple of (list of ('s3' or 'metadata', record) in arrival order, error responses for unparseable messages)
+    """
+    entries = []
+    errors = []
+
+    # Extract bucket info from top-level event (if present)
+    asset_bucket_name = event.get('ASSET_BUCKET_NAME')
+    asset_bucket_prefix = event.get('ASSET_BUCKET_PREFIX', '/')
+
+    for record in event['Records']:
+        event_source = record.get('eventSource', '')
+
+        if event_source == 'aws:s3':
+            # Direct S3 bucket notification
+            # Pass bucket info to the record for permanent delete lookups
+            if asset_bucket_name:
+                record['ASSET_BUCKET_NAME'] = asset_bucket_name
+                record['ASSET_BUCKET_PREFIX'] = asset_bucket_prefix
+            entries.append(('s3', record))
+
+        elif event_source == 'aws:sqs':
+            # SQS message (may contain SNS message with S3 event or DynamoDB stream)
+            try:
+                # Parse SQS message body
+                body = record.get('body', '')
+                if isinstance(body, str):
+                    body = json.loads(body)
+
+                # Check if this is an SNS message
+                if body.get('Type') == 'Notification' and body.get('Message'):
+                    # Parse SNS message
+                    sns_message = body.get('Message')
+                    if isinstance(sns_message, str):
+                        sns_message = json.loads(sns_message)
+
+                    # First check if SNS message is a direct DynamoDB stream record (from SNS queuing Lambda)
+                    # This is the direct SNS→SQS path
+                    if sns_message.get('eventSource') == 'aws:dynamodb' or \
+                       sns_message.get('eventName') in ['INSERT', 'MODIFY', 'REMOVE']:
+                        entries.append(('metadata', sns_message))
+
+                    # Check if SNS message contains Records array (nested structure from sqsBucketSync)
+                    elif 'Records' in sns_message:
+                        for inner_record in sns_message['Records']:
+                            inner_event_source = inner_record.get('eventSource', '')
+
+                            if inner_event_source == 'aws:s3':
+                                # Direct S3 record in SNS message
+                                if asset_bucket_name:
+                                    inner_record['ASSET_BUCKET_NAME'] = asset_bucket_name
+                                    inner_record['ASSET_BUCKET_PREFIX'] = asset_bucket_prefix
+                                entries.append(('s3', inner_record))
+
+                            elif inner_event_source == 'aws:sqs':
+                                # Nested SQS record (from sqsBucketSync) - parse further
+                                try:
+                                    inner_body = inner_record.get('body', '')
+                                    if isinstance(inner_body, str):
+                                        inner_body = json.loads(inner_body)
+
+                                    # Check if this inner SQS message contains SNS notification
+                                    if inner_body.get('Type') == 'Notification' and inner_body.get('Message'):
+                                        inner_sns_message = inner_body.get('Message')
+                                        if isinstance(inner_sns_message, str):
+                                            inner_sns_message = json.loads(inner_sns_message)
+
+                                        # Now check for S3 records in the inner SNS message
+                                        if 'Records' in inner_sns_message:
+                                            for s3_record in inner_sns_message['Records']:
+                                                if s3_record.get('eventSource') == 'aws:s3':
+                                                    # Extract bucket info from the nested structure
+                                                    nested_bucket_name = inner_sns_message.get('ASSET_BUCKET_NAME', asset_bucket_name)
+                                                    nested_bucket_prefix = inner_sns_message.get('ASSET_BUCKET_PREFIX', asset_bucket_prefix)
+
+                                                    if nested_bucket_name:
+                                                        s3_record['ASSET_BUCKET_NAME'] = nested_bucket_name
+                                                        s3_record['ASSET_BUCKET_PREFIX'] = nested_bucket_prefix
+
+                                                    entries.append(('s3', s3_record))
+                                except json.JSONDecodeError as inner_e:
+                                    logger.exception(f"Error parsing nested SQS/SNS message: {inner_e}")
+
+                            else:
+                                logger.warning(f"Unknown record event source in SNS message: {inner_event_source}")
+
+                    else:
+                        logger.warning(f"SNS message does not contain recognized event format: {sns_message.keys()}")
+                else:
+                    logger.warning("SQS message is not an SNS notification")
+            except json.JSONDecodeError as e:
+                logger.exception(f"Error parsing SQS/SNS message: {e}")
+                errors.append(IndexOperationResponse(
+                    success=False,
+                    message=f"Error parsing SQS/SNS message: {str(e)}",
+                    indexName=opensearch_file_index,
+                    operation="error"
+                ))
+
+        elif event_source == 'aws:dynamodb':
+            # DynamoDB stream from metadata/attribute tables
+            source_arn = record.get('eventSourceARN', '')
+
+            if asset_file_metadata_table_name in source_arn or \
+               file_attribute_table_name in source_arn:
+                # Metadata or attribute table stream
+                entries.append(('metadata', record))
+            else:
+                logger.warning(f"Unknown DynamoDB table in source ARN: {source_arn}")
+
+        else:
+            logger.warning(f"Unknown event source: {event_source}")
+
+    return entries, errors
+
+def get_s3_event_sequencer(event_record: Dict[str, Any]) -> int:
+    """Get the S3 event sequencer as an integer, or -1 if it is missing
+
+    S3 sequencers are hexadecimal and order the events of a single object key.
+    """
+    sequencer = event_record.get('s3', {}).get('object', {}).get('sequencer')
+    try:
+        return int(sequencer, 16) if sequencer else -1
+    except ValueError:
+        return -1
+
+def get_file_record_target(source: str, event_record: Dict[str, Any], position: int) -> Optional[Tuple[Tuple, Tuple]]:
+    """Get the target document key and precedence of a file index record
+
+    Every S3 event of an object key and every metadata/attribute change of a file resolves to
+    the current state of that file, so only the record with the highest precedence needs to run.
+    Preview file events re-index their base file and rank below events of the base file itself.
+
+    Returns:
+        Tuple of (target key, precedence), or None if the record has no resolvable target
+    """
+    if source == 's3':
+        bucket_name = event_record.get('s3', {}).get('bucket', {}).get('name')
+        s3_key = event_record.get('s3', {}).get('object', {}).get('key')
+        if not bucket_name or not s3_key:
+            return None
+
+        import urllib.parse
+        s3_key = urllib.parse.unquote_plus(s3_key)
+        if '.previewFile.' in s3_key:
+            return ('s3', bucket_name, s3_key.split('.previewFile.')[0]), (0, 0, position)
+        return ('s3', bucket_name, s3_key), (1, get_s3_event_sequencer(event_record), position)
+
+    dynamodb_data = event_record.get('dynamodb', {})
+    if event_record.get('eventName') == 'REMOVE':
+        composite_key = dynamodb_data.get('Keys', {}).get('databaseId:assetId:filePath', {}).get('S')
+    else:
+        composite_key = dynamodb_data.get('NewImage', {}).get('databaseId:assetId:filePath', {}).get('S')
+    if not composite_key:
+        return None
+    return ('metadata', composite_key), (position,)
+
+def coalesce_file_records(entries: List[Tuple[str, Dict[str, Any]]]) -> Tuple[List[Tuple[str, Dict[str, Any]]], int]:
+    """Keep the latest effective record per target document of an event batch
+
+    Returns:
+        Tuple of (records to process in arrival order, number of records coalesced away)
+    """
+    latest: Dict[Tuple, Tuple[Tuple, int]] = {}
+    keep_positions = []
+
+    for position, (source, event_record) in enumerate(entries):
+        target = get_file_record_target(source, event_record, position)
+        if target is None:
+            # Let the event handler report the unresolvable record
+            keep_positions.append(position)
+            continue
+
+        key, precedence = target
+        current = latest.get(key)
+        if current is None or precedence > current[0]:
+            latest[key] = (precedence, position)
+
+    keep_positions.extend(position for _, position in latest.values())
+    keep_positions.sort()
+    return [entries[position] for position in keep_positions], len(entries) - len(keep_positions)
+
 #######################
 # Lambda Handler
 #######################
@@ -1503,121 +1698,23 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
         logger.info(f"Processing file indexing event: {json.dumps(event, default=str)}")
         
         results = []
-        
-        # Extract bucket info from top-level event (if present)
-        asset_bucket_name = event.get('ASSET_BUCKET_NAME')
-        asset_bucket_prefix = event.get('ASSET_BUCKET_PREFIX', '/')
+        records_received = 0
+        records_coalesced = 0
         
         # Handle different event sources
         if 'Records' in event:
-            for record in event['Records']:
-                event_source = record.get('eventSource', '')
-                
-                if event_source == 'aws:s3':
-                    # Direct S3 bucket notification
-                    # Pass bucket info to the record for permanent delete lookups
-                    if asset_bucket_name:
-                        record['ASSET_BUCKET_NAME'] = asset_bucket_name
-                        record['ASSET_BUCKET_PREFIX'] = asset_bucket_prefix
-                    result = handle_s3_notification(record)
-                    results.append(result)
-                    
-                elif event_source == 'aws:sqs':
-                    # SQS message (may contain SNS message with S3 event or DynamoDB stream)
-                    try:
-                        # Parse SQS message body
-                        body = record.get('body', '')
-                        if isinstance(body, str):
-                            body = json.loads(body)
-                        
-                        # Check if this is an SNS message
-                        if body.get('Type') == 'Notification' and body.get('Message'):
-                            # Parse SNS message
-                            sns_message = body.get('Message')
-                            if isinstance(sns_message, str):
-                                sns_message = json.loads(sns_message)
-                            
-                            # First check if SNS message is a direct DynamoDB stream record (from SNS queuing Lambda)
-                            # This is the direct SNS→SQS path
-                            if sns_message.get('eventSource') == 'aws:dynamodb' or \
-                               sns_message.get('eventName') in ['INSERT', 'MODIFY', 'REMOVE']:
-                                # Direct DynamoDB stream record from SNS queuing Lambda
-                                result = handle_metadata_stream(sns_message)
-                                results.append(result)
-                            
-                            # Check if SNS message contains Records array (nested structure from sqsBucketSync)
-                            elif 'Records' in sns_message:
-                                for inner_record in sns_message['Records']:
-                                    inner_event_source = inner_record.get('eventSource', '')
-                                    
-                                    if inner_event_source == 'aws:s3':
-                                        # Direct S3 record in SNS message
-                                        if asset_bucket_name:
-                                            inner_record['ASSET_BUCKET_NAME'] = asset_bucket_name
-                                            inner_record['ASSET_BUCKET_PREFIX'] = asset_bucket_prefix
-                                        result = handle_s3_notification(inner_record)
-                                        results.append(result)
-                                    
-                                    elif inner_event_source == 'aws:sqs':
-                                        # Nested SQS record (from sqsBucketSync) - parse further
-                                        try:
-                                            inner_body = inner_record.get('body', '')
-                                            if isinstance(inner_body, str):
-                                                inner_body = json.loads(inner_body)
-                                            
-                                            # Check if this inner SQS message contains SNS notification
-                                            if inner_body.get('Type') == 'Notification' and inner_body.get('Message'):
-                                                inner_sns_message = inner_body.get('Message')
-                                                if isinstance(inner_sns_message, str):
-                                                    inner_sns_message = json.loads(inner_sns_message)
-                                                
-                                                # Now check for S3 records in the inner SNS message
-                                                if 'Records' in inner_sns_message:
-                                                    for s3_record in inner_sns_message['Records']:
-                                                        if s3_record.get('eventSource') == 'aws:s3':
-                                                            # Extract bucket info from the nested structure
-                                                            nested_bucket_name = inner_sns_message.get('ASSET_BUCKET_NAME', asset_bucket_name)
-                                                            nested_bucket_prefix = inner_sns_message.get('ASSET_BUCKET_PREFIX', asset_bucket_prefix)
-                                                            
-                                                            if nested_bucket_name:
-                                                                s3_record['ASSET_BUCKET_NAME'] = nested_bucket_name
-                                                                s3_record['ASSET_BUCKET_PREFIX'] = nested_bucket_prefix
-                                                            
-                                                            result = handle_s3_notification(s3_record)
-                                                            results.append(result)
-                                        except json.JSONDecodeError as inner_e:
-                                            logger.exception(f"Error parsing nested SQS/SNS message: {inner_e}")
-                                    
-                                    else:
-                                        logger.warning(f"Unknown record event source in SNS message: {inner_event_source}")
-                            
-                            else:
-                                logger.warning(f"SNS message does not contain recognized event format: {sns_message.keys()}")
-                        else:
-                            logger.warning("SQS message is not an SNS notification")
-                    except json.JSONDecodeError as e:
-                        logger.exception(f"Error parsing SQS/SNS message: {e}")
-                        results.append(IndexOperationResponse(
-                            success=False,
-                            message=f"Error parsing SQS/SNS message: {str(e)}",
-                            indexName=opensearch_file_index,
-                            operation="error"
-                        ))
-                    
-                elif event_source == 'aws:dynamodb':
-                    # DynamoDB stream from metadata/attribute tables
-                    source_arn = record.get('eventSourceARN', '')
-                    
-                    if asset_file_metadata_table_name in source_arn or \
-                       file_attribute_table_name in source_arn:
-                        # Metadata or attribute table stream
-                        result = handle_metadata_stream(record)
-                        results.append(result)
-                    else:
-                        logger.warning(f"Unknown DynamoDB table in source ARN: {source_arn}")
-                    
+            # Unwrap all envelopes first so repeated changes to one file in the batch are indexed once
+            entries, results = unwrap_event_records(event)
+            records_received = len(entries)
+            entries, records_coalesced = coalesce_file_records(entries)
+            if records_coalesced:
+                logger.info(f"Coalesced {records_coalesced} of {records_received} file index records in batch")
+            
+            for source, record in entries:
+                if source == 's3':
+                    results.append(handle_s3_notification(record))
                 else:
-                    logger.warning(f"Unknown event source: {event_source}")
+                    results.append(handle_metadata_stream(record))
         
         else:
             # Direct invocation with FileIndexRequest
@@ -1625,6 +1722,7 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
                 request = parse(event, model=FileIndexRequest)
                 result = process_file_index_request(request)
                 results.append(result)
+                records_received = 1
             except ValidationError as v:
                 logger.exception(f"Validation error: {v}")
                 return validation_error(body={'message': str(v)}, event=event)
@@ -1635,6 +1733,8 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
         
         response_body = {
             'message': f"Processed {successful}/{total} file indexing operations successfully",
+            'recordsReceived': records_received,
+            'recordsCoalesced': records_coalesced,
             'results': [r.dict() for r in results]
         }
         
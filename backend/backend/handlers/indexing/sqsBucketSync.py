@@ -8,6 +8,7 @@ import os
 import boto3
 import time
 import hashlib
+import urllib.parse
 from customLogging.logger import safeLogger
 from handlers.assets.createAsset import create_asset
 from models.assetsV3 import CreateAssetRequestModel
@@ -17,6 +18,15 @@ from typing import Dict, List, Optional, Tuple
 from botocore.exceptions import ClientError
 from boto3.dynamodb.conditions import Key
 from common.validators import validate
+from common.previewIndex import (
+    get_base_key_for_preview,
+    get_preview_index_table,
+    record_base_file_created,
+    record_base_file_deleted,
+    record_preview_file_created,
+    record_preview_file_deleted,
+    PREVIEW_FILE_MARKER
+)
 
 # Initialize AWS clients
 dynamodb = boto3.resource('dynamodb')
@@ -989,6 +999,52 @@ def delete_file_metadata_on_s3_delete(database_id: str, asset_id: str, relative_
         # Don't fail the whole operation if metadata deletion fails
         pass
 
+def update_preview_index_on_created(bucket_name: str, object_key: str, event_time: Optional[str] = None):
+    """Maintain the preview-existence index for a created object
+
+    Preview files are added to their base file's record. For base files the preview
+    siblings are listed once here so that read paths can do a single key lookup.
+    """
+    if get_preview_index_table() is None:
+        return
+
+    try:
+        # S3 event keys are URL encoded
+        object_key = urllib.parse.unquote_plus(object_key)
+
+        if get_base_key_for_preview(object_key):
+            record_preview_file_created(bucket_name, object_key, event_time)
+            return
+
+        preview_keys = []
+        prefix = object_key + PREVIEW_FILE_MARKER
+        paginator = s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+            for obj in page.get('Contents', []):
+                if get_base_key_for_preview(obj['Key']) == object_key:
+                    preview_keys.append(obj['Key'])
+
+        record_base_file_created(bucket_name, object_key, preview_keys, event_time)
+    except Exception as e:
+        logger.warning(f"Error updating preview index for {object_key}: {e}")
+
+
+def update_preview_index_on_deleted(bucket_name: str, object_key: str):
+    """Maintain the preview-existence index for a deleted object"""
+    if get_preview_index_table() is None:
+        return
+
+    try:
+        object_key = urllib.parse.unquote_plus(object_key)
+
+        if get_base_key_for_preview(object_key):
+            record_preview_file_deleted(bucket_name, object_key)
+        else:
+            record_base_file_deleted(bucket_name, object_key)
+    except Exception as e:
+        logger.warning(f"Error updating preview index for deleted {object_key}: {e}")
+
+
 def verify_database_exists(database_id):
     """Check if a database exists"""
     table = dynamodb.Table(db_table_name)
@@ -1194,6 +1250,7 @@ def process_s3_record(record: Dict) -> Tuple[bool, bool, str]:
     *. Handles "init" files by deleting them
     *. Updates S3 metadata with database and asset IDs
     *. Detects folder markers (keys ending with '/') and skips indexing
+    *. Maintains the preview-existence index for base and preview files
     
     Args:
         record: The S3 record to process
@@ -1317,6 +1374,9 @@ def process_s3_record(record: Dict) -> Tuple[bool, bool, str]:
         if object_key.endswith('/'):
             logger.info(f"Folder marker detected: {object_key}, processing but skipping indexing")
             return True, False, f"Processed folder marker {object_key}"
+
+        # 7. Maintain the preview-existence index for this file
+        update_preview_index_on_created(bucket_name, object_key, record.get('eventTime'))
         
         return True, True, f"Successfully processed {object_key}"
     except Exception as e:
@@ -1650,6 +1710,9 @@ def lambda_handler_deleted(event, context):
                     # Update asset type based on remaining files
                     logger.info(f"Updating asset type for {asset_id} after file deletion")
                     update_asset_type(bucket_id, asset_id, bucket_name, asset_base_key)
+
+                    # Maintain the preview-existence index
+                    update_preview_index_on_deleted(bucket_name, object_key)
                     
                     # Track successfully processed record
                     successful_records.append(record)
@@ -5,7 +5,10 @@
 
 import os
 import boto3
+import csv
+import io
 import json
+import time
 import base64
 from datetime import datetime
 from boto3.dynamodb.conditions import Key
@@ -19,12 +22,19 @@ from common.validators import validate
 from handlers.authz import CasbinEnforcer
 from handlers.auth import request_to_claims
 from customLogging.logger import safeLogger
+from common.batchWrite import batch_write, replace_all
 from common.metadataSchemaValidation import (
     get_aggregated_schemas,
     validate_metadata_against_schema,
     validate_metadata_keys_against_schema,
     enrich_metadata_with_schema
 )
+from common.metadataRead import (
+    ASSET_METADATA_FILE_PATH,
+    normalize_metadata_file_path,
+    query_metadata_records,
+    enrich_metadata_records
+)
 from models.common import APIGatewayProxyResponseV2, internal_error, success, validation_error, general_error, authorization_error, VAMSGeneralErrorResponse
 from handlers.assets.assetVersions import validate_asset_version_exists, get_asset_metadata_version
 from models.metadata import (
@@ -60,6 +70,12 @@ from models.metadata import (
     DeleteDatabaseMetadataRequestModel,
     DatabaseMetadataResponseModel,
     GetDatabaseMetadataResponseModel,
+    # Bulk Import Models
+    MetadataItemModel,
+    ImportMetadataRequestModel,
+    ImportMetadataRowModel,
+    ImportMetadataRowErrorModel,
+    ImportMetadataResponseModel,
     # Common Models
     BulkOperationResponseModel,
     MetadataValueType,
@@ -86,6 +102,13 @@ claims_and_roles = {}
 # Constants
 MAX_METADATA_RECORDS_PER_ENTITY = 500
 
+# Bulk import limits: rows are processed in chunks until the time budget (kept under the
+# API Gateway integration timeout) runs out, and the caller resumes from the returned nextRow
+MAX_METADATA_IMPORT_FILE_BYTES = 50 * 1024 * 1024
+METADATA_IMPORT_CHUNK_ROWS = 1000
+METADATA_IMPORT_TIME_BUDGET_SECONDS = 20
+MAX_METADATA_IMPORT_ERROR_REPORT_ROWS = 1000
+
 # Load environment variables
 try:
     asset_links_table_v2_name = os.environ["ASSET_LINKS_STORAGE_TABLE_V2_NAME"]
@@ -115,6 +138,11 @@ s3_asset_buckets_table = dynamodb.Table(s3_asset_buckets_table_name)
 # Common Utility Functions
 #######################
 
+def metadata_record_key(item: dict) -> str:
+    """Return the metadata/attribute key of a typed record or record key, as reported in bulk operation results"""
+    return (item.get('attributeKey') or item.get('metadataKey'))['S']
+
+
 def get_bucket_details(bucket_id: str) -> dict:
     """Get S3 bucket details from buckets table
     
@@ -265,6 +293,34 @@ def validate_asset_exists(database_id: str, asset_id: str) -> dict:
         raise VAMSGeneralErrorResponse("Error validating asset")
 
 
+def get_asset_s3_location(asset: dict) -> tuple:
+    """Get the bucket name and base key (ending with a slash) of an asset's files
+    
+    Args:
+        asset: The asset dictionary
+        
+    Returns:
+        Tuple of (bucket name, asset base path)
+        
+    Raises:
+        VAMSGeneralErrorResponse: If the bucket or asset location is not found
+    """
+    bucket_details = get_bucket_details(asset['bucketId'])
+    
+    # Get the asset location from the asset details
+    if 'assetLocation' not in asset or 'Key' not in asset['assetLocation']:
+        raise VAMSGeneralErrorResponse("Asset location not found")
+    
+    # Use the asset's actual location as the base path
+    asset_base_path = asset['assetLocation']['Key']
+    
+    # Ensure asset base path ends with slash
+    if not asset_base_path.endswith('/'):
+        asset_base_path += '/'
+    
+    return bucket_details['bucketName'], asset_base_path
+
+
 def validate_file_exists(database_id: str, asset_id: str, file_path: str) -> bool:
     """Validate that a file exists in S3
     
@@ -282,21 +338,7 @@ def validate_file_exists(database_id: str, asset_id: str, file_path: str) -> boo
     try:
         # First get the asset to get bucket and location information
         asset = validate_asset_exists(database_id, asset_id)
-        
-        # Get bucket details
-        bucket_details = get_bucket_details(asset['bucketId'])
-        bucket_name = bucket_details['bucketName']
-        
-        # Get the asset location from the asset details
-        if 'assetLocation' not in asset or 'Key' not in asset['assetLocation']:
-            raise VAMSGeneralErrorResponse("Asset location not found")
-        
-        # Use the asset's actual location as the base path
-        asset_base_path = asset['assetLocation']['Key']
-        
-        # Ensure asset base path ends with slash
-        if not asset_base_path.endswith('/'):
-            asset_base_path += '/'
+        bucket_name, asset_base_path = get_asset_s3_location(asset)
         
         # Remove leading slash from file_path before combining (to avoid double slash)
         normalized_file_path = file_path.lstrip('/')
@@ -670,28 +712,11 @@ def create_asset_link_metadata(asset_link_id: str, request_model: CreateAssetLin
                     'error': str(e)
                 })
         
-        # Write items in batches of 25
+        # Write items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_write:
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            asset_links_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error in batch write: {e}")
-                    # Mark all items in this batch as failed
-                    for item in batch:
-                        key = item['PutRequest']['Item']['metadataKey']['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({
-                            'key': key,
-                            'error': 'Batch write failed'
-                        })
-        
+            successful_items, write_failures = batch_write(dynamodb_client, asset_links_metadata_table_name, items_to_write, metadata_record_key)
+            failed_items.extend(write_failures)
+
         # Build response
         timestamp = datetime.utcnow().isoformat()
         total_items = len(request_model.metadata)
@@ -884,27 +909,11 @@ def _upsert_asset_link_metadata(asset_link_id: str, metadata_items: list, claims
                     'error': str(e)
                 })
         
-        # Write items in batches of 25
+        # Write items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_write:
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            asset_links_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error in batch write: {e}")
-                    for item in batch:
-                        key = item['PutRequest']['Item']['metadataKey']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({
-                            'key': key,
-                            'error': 'Batch write failed'
-                        })
-        
+            successful_items, write_failures = batch_write(dynamodb_client, asset_links_metadata_table_name, items_to_write, metadata_record_key)
+            failed_items.extend(write_failures)
+
         # Build response
         timestamp = datetime.utcnow().isoformat()
         total_items = len(metadata_items)
@@ -928,7 +937,7 @@ def _upsert_asset_link_metadata(asset_link_id: str, metadata_items: list, claims
 
 
 def _replace_all_asset_link_metadata(asset_link_id: str, metadata_items: list, claims_and_roles: dict) -> BulkOperationResponseModel:
-    """Internal helper: Replace all asset link metadata with rollback on failure"""
+    """Internal helper: Replace all asset link metadata, in one transaction when it fits or with rollback on failure"""
     try:
         # Step 1: Fetch all existing metadata
         paginator = dynamodb_client.get_paginator('query')
@@ -937,125 +946,35 @@ def _replace_all_asset_link_metadata(asset_link_id: str, metadata_items: list, c
             KeyConditionExpression='assetLinkId = :linkId',
             ExpressionAttributeValues={':linkId': {'S': asset_link_id}}
         ).build_full_result()
+        existing_items = page_iterator.get('Items', [])
         
-        existing_metadata = []
-        deserializer = TypeDeserializer()
-        for item in page_iterator.get('Items', []):
-            deserialized = {k: deserializer.deserialize(v) for k, v in item.items()}
-            existing_metadata.append(deserialized)
-        
-        # Step 2: Determine which keys to delete
-        provided_keys = {item.metadataKey for item in metadata_items}
-        existing_keys = {item['metadataKey'] for item in existing_metadata}
-        keys_to_delete = existing_keys - provided_keys
-        
-        # Store items to delete for potential rollback
-        deleted_items_backup = [
-            item for item in existing_metadata 
-            if item['metadataKey'] in keys_to_delete
-        ]
-        
-        logger.info(f"REPLACE_ALL: Deleting {len(keys_to_delete)} keys, upserting {len(provided_keys)} keys")
+        # Step 2: Build the new set of metadata - Use DynamoDB typed format
+        new_items = []
+        for metadata_item in metadata_items:
+            new_items.append({
+                'assetLinkId': {'S': asset_link_id},
+                'metadataKey': {'S': metadata_item.metadataKey},
+                'metadataValue': {'S': metadata_item.metadataValue},
+                'metadataValueType': {'S': metadata_item.metadataValueType.value}
+            })
         
-        # Step 3: Delete keys not in provided list
-        if keys_to_delete:
-            items_to_delete = []
-            for key in keys_to_delete:
-                items_to_delete.append({
-                    'DeleteRequest': {
-                        'Key': {
-                            'assetLinkId': {'S': asset_link_id},
-                            'metadataKey': {'S': key}
-                        }
-                    }
-                })
-            
-            # Delete in batches of 25
-            for i in range(0, len(items_to_delete), 25):
-                batch = items_to_delete[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            asset_links_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error deleting metadata in REPLACE_ALL: {e}")
-                    raise VAMSGeneralErrorResponse("Failed to delete existing metadata")
+        # Step 3: Delete keys not in provided list and upsert all provided metadata
+        result = replace_all(
+            dynamodb_client, asset_links_metadata_table_name, ['assetLinkId', 'metadataKey'],
+            existing_items, new_items, metadata_record_key
+        )
         
-        # Step 4: Upsert all provided metadata
-        try:
-            items_to_write = []
-            for metadata_item in metadata_items:
-                # Use DynamoDB typed format
-                item = {
-                    'assetLinkId': {'S': asset_link_id},
-                    'metadataKey': {'S': metadata_item.metadataKey},
-                    'metadataValue': {'S': metadata_item.metadataValue},
-                    'metadataValueType': {'S': metadata_item.metadataValueType.value}
-                }
-                items_to_write.append({'PutRequest': {'Item': item}})
-            
-            # Write in batches of 25
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                dynamodb_client.batch_write_item(
-                    RequestItems={
-                        asset_links_metadata_table_name: batch
-                    }
-                )
-            
-            # Success - build response
-            timestamp = datetime.utcnow().isoformat()
-            return BulkOperationResponseModel(
-                success=True,
-                totalItems=len(metadata_items),
-                successCount=len(metadata_items),
-                failureCount=0,
-                successfulItems=[item.metadataKey for item in metadata_items],
-                failedItems=[],
-                message=f"Replaced all metadata: deleted {len(keys_to_delete)} keys, upserted {len(metadata_items)} keys",
-                timestamp=timestamp
-            )
-            
-        except Exception as upsert_error:
-            # Step 5: Rollback - attempt to restore deleted items
-            logger.error(f"Upsert failed in REPLACE_ALL, attempting rollback: {upsert_error}")
-            
-            if deleted_items_backup:
-                try:
-                    # Restore deleted items - Use DynamoDB typed format
-                    items_to_restore = []
-                    for item in deleted_items_backup:
-                        restore_item = {
-                            'assetLinkId': {'S': item['assetLinkId']},
-                            'metadataKey': {'S': item['metadataKey']},
-                            'metadataValue': {'S': item['metadataValue']},
-                            'metadataValueType': {'S': item['metadataValueType']}
-                        }
-                        items_to_restore.append({'PutRequest': {'Item': restore_item}})
-                    
-                    # Restore in batches of 25
-                    for i in range(0, len(items_to_restore), 25):
-                        batch = items_to_restore[i:i+25]
-                        dynamodb_client.batch_write_item(
-                            RequestItems={
-                                asset_links_metadata_table_name: batch
-                            }
-                        )
-                    
-                    logger.info(f"Rollback successful: restored {len(deleted_items_backup)} deleted items")
-                    raise VAMSGeneralErrorResponse("REPLACE_ALL operation failed, all changes rolled back successfully")
-                    
-                except Exception as rollback_error:
-                    logger.error(f"Rollback failed: {rollback_error}")
-                    raise VAMSGeneralErrorResponse(
-                        "REPLACE_ALL operation failed and rollback unsuccessful - data may be inconsistent. "
-                        "Please contact administrator."
-                    )
-            else:
-                # No items were deleted, so just report the upsert failure
-                raise VAMSGeneralErrorResponse(f"REPLACE_ALL operation failed during upsert: {str(upsert_error)}")
+        timestamp = datetime.utcnow().isoformat()
+        return BulkOperationResponseModel(
+            success=True,
+            totalItems=len(metadata_items),
+            successCount=len(metadata_items),
+            failureCount=0,
+            successfulItems=[item.metadataKey for item in metadata_items],
+            failedItems=[],
+            message=f"Replaced all metadata: deleted {result['deleted']} keys, upserted {len(metadata_items)} keys",
+            timestamp=timestamp
+        )
         
     except PermissionError as p:
         raise p
@@ -1189,28 +1108,11 @@ def delete_asset_link_metadata(asset_link_id: str, request_model: DeleteAssetLin
                     'error': str(e)
                 })
         
-        # Delete items in batches of 25
+        # Delete items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_delete:
-            for i in range(0, len(items_to_delete), 25):
-                batch = items_to_delete[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            asset_links_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error in batch delete: {e}")
-                    # Mark all items in this batch as failed
-                    for item in batch:
-                        key = item['DeleteRequest']['Key']['metadataKey']['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({
-                            'key': key,
-                            'error': 'Batch delete failed'
-                        })
-        
+            successful_items, write_failures = batch_write(dynamodb_client, asset_links_metadata_table_name, items_to_delete, metadata_record_key)
+            failed_items.extend(write_failures)
+
         # Build response
         timestamp = datetime.utcnow().isoformat()
         total_items = len(request_model.metadataKeys)
@@ -1457,54 +1359,18 @@ def get_asset_metadata(database_id: str, asset_id: str, query_params: dict, clai
         if not check_entity_authorization(asset, "GET", claims_and_roles):
             raise PermissionError("Not authorized to view metadata for this asset")
         
-        # Build composite key for query
-        composite_key = f"{database_id}:{asset_id}:/"
-        
-        # Fetch ALL metadata using paginator (ignore query_params pagination)
-        paginator = dynamodb_client.get_paginator('query')
-        page_iterator = paginator.paginate(
-            TableName=asset_file_metadata_table_name,
-            IndexName='DatabaseIdAssetIdFilePathIndex',
-            KeyConditionExpression='#pk = :pkValue',
-            ExpressionAttributeNames={'#pk': 'databaseId:assetId:filePath'},
-            ExpressionAttributeValues={':pkValue': {'S': composite_key}},
-            ScanIndexForward=False
-        ).build_full_result()
-        
-        # Process ALL items
-        metadata_list = []
-        deserializer = TypeDeserializer()
-        for item in page_iterator.get('Items', []):
-            deserialized_item = {k: deserializer.deserialize(v) for k, v in item.items()}
-            metadata_list.append(deserialized_item)
+        # Fetch ALL metadata (ignore query_params pagination)
+        metadata_list = query_metadata_records(
+            dynamodb_client, asset_file_metadata_table_name, database_id, asset_id, ASSET_METADATA_FILE_PATH
+        )
         
         # Fetch database config and schema enrichment
-        restrict_metadata_outside_schemas = False
+        enriched_metadata, restrict_metadata_outside_schemas = enrich_metadata_records(
+            dynamodb_client, metadata_schema_table_v2_name, database_id, 'assetMetadata', None,
+            metadata_list, get_database_config
+        )
+
         try:
-            database_ids = [database_id, 'GLOBAL']
-            
-            aggregated_schema = get_aggregated_schemas(
-                database_ids=database_ids,
-                entity_type='assetMetadata',
-                file_path=None,
-                dynamodb_client=dynamodb_client,
-                schema_table_name=metadata_schema_table_v2_name
-            )
-            
-            # Calculate restrictMetadataOutsideSchemas
-            schemas_exist = len(aggregated_schema) > 0
-            if schemas_exist:
-                try:
-                    db_config = get_database_config(database_id)
-                    db_restricts = db_config.get('restrictMetadataOutsideSchemas', False) == True
-                    restrict_metadata_outside_schemas = db_restricts
-                except Exception as e:
-                    logger.warning(f"Error fetching database config for restriction check: {e}")
-                    restrict_metadata_outside_schemas = False
-            
-            # Enrich metadata with schema information
-            enriched_metadata = enrich_metadata_with_schema(metadata_list, aggregated_schema)
-            
             # Convert to response models
             response_models = []
             for item in enriched_metadata:
@@ -1834,27 +1700,11 @@ def create_asset_metadata(database_id: str, asset_id: str, request_model: Create
                     'error': str(e)
                 })
         
-        # Write items in batches of 25
+        # Write items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_write:
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            asset_file_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error in batch write: {e}")
-                    for item in batch:
-                        key = item['PutRequest']['Item']['metadataKey']['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({
-                            'key': key,
-                            'error': 'Batch write failed'
-                        })
-        
+            successful_items, write_failures = batch_write(dynamodb_client, asset_file_metadata_table_name, items_to_write, metadata_record_key)
+            failed_items.extend(write_failures)
+
         # Build response
         timestamp = datetime.utcnow().isoformat()
         total_items = len(request_model.metadata)
@@ -2058,27 +1908,11 @@ def _upsert_asset_metadata(database_id: str, asset_id: str, metadata_items: list
                     'error': str(e)
                 })
         
-        # Write items in batches of 25
+        # Write items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_write:
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            asset_file_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error in batch write: {e}")
-                    for item in batch:
-                        key = item['PutRequest']['Item']['metadataKey']['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({
-                            'key': key,
-                            'error': 'Batch write failed'
-                        })
-        
+            successful_items, write_failures = batch_write(dynamodb_client, asset_file_metadata_table_name, items_to_write, metadata_record_key)
+            failed_items.extend(write_failures)
+
         # Build response
         timestamp = datetime.utcnow().isoformat()
         total_items = len(metadata_items)
@@ -2102,9 +1936,10 @@ def _upsert_asset_metadata(database_id: str, asset_id: str, metadata_items: list
 
 
 def _replace_all_asset_metadata(database_id: str, asset_id: str, metadata_items: list, claims_and_roles: dict) -> BulkOperationResponseModel:
-    """Internal helper: Replace all asset metadata with rollback on failure"""
+    """Internal helper: Replace all asset metadata, in one transaction when it fits or with rollback on failure"""
     try:
         composite_key = f"{database_id}:{asset_id}:/"
+        asset_composite_key = f"{database_id}:{asset_id}"
         
         # Step 1: Fetch all existing metadata
         paginator = dynamodb_client.get_paginator('query')
@@ -2115,127 +1950,36 @@ def _replace_all_asset_metadata(database_id: str, asset_id: str, metadata_items:
             ExpressionAttributeNames={'#pk': 'databaseId:assetId:filePath'},
             ExpressionAttributeValues={':pkValue': {'S': composite_key}}
         ).build_full_result()
+        existing_items = page_iterator.get('Items', [])
         
-        existing_metadata = []
-        deserializer = TypeDeserializer()
-        for item in page_iterator.get('Items', []):
-            deserialized = {k: deserializer.deserialize(v) for k, v in item.items()}
-            existing_metadata.append(deserialized)
-        
-        # Step 2: Determine which keys to delete
-        provided_keys = {item.metadataKey for item in metadata_items}
-        existing_keys = {item['metadataKey'] for item in existing_metadata}
-        keys_to_delete = existing_keys - provided_keys
-        
-        # Store items to delete for potential rollback
-        deleted_items_backup = [
-            item for item in existing_metadata 
-            if item['metadataKey'] in keys_to_delete
-        ]
-        
-        logger.info(f"REPLACE_ALL: Deleting {len(keys_to_delete)} keys, upserting {len(provided_keys)} keys")
+        # Step 2: Build the new set of metadata
+        new_items = []
+        for metadata_item in metadata_items:
+            new_items.append({
+                'metadataKey': {'S': metadata_item.metadataKey},
+                'databaseId:assetId:filePath': {'S': composite_key},
+                'databaseId:assetId': {'S': asset_composite_key},
+                'metadataValue': {'S': metadata_item.metadataValue},
+                'metadataValueType': {'S': metadata_item.metadataValueType.value}
+            })
         
-        # Step 3: Delete keys not in provided list
-        if keys_to_delete:
-            items_to_delete = []
-            for key in keys_to_delete:
-                items_to_delete.append({
-                    'DeleteRequest': {
-                        'Key': {
-                            'metadataKey': {'S': key},
-                            'databaseId:assetId:filePath': {'S': composite_key}
-                        }
-                    }
-                })
-            
-            # Delete in batches of 25
-            for i in range(0, len(items_to_delete), 25):
-                batch = items_to_delete[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            asset_file_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error deleting metadata in REPLACE_ALL: {e}")
-                    raise VAMSGeneralErrorResponse("Failed to delete existing metadata")
+        # Step 3: Delete keys not in provided list and upsert all provided metadata
+        result = replace_all(
+            dynamodb_client, asset_file_metadata_table_name, ['metadataKey', 'databaseId:assetId:filePath'],
+            existing_items, new_items, metadata_record_key
+        )
         
-        # Step 4: Upsert all provided metadata
-        try:
-            items_to_write = []
-            asset_composite_key = f"{database_id}:{asset_id}"
-            for metadata_item in metadata_items:
-                item = {
-                    'metadataKey': {'S': metadata_item.metadataKey},
-                    'databaseId:assetId:filePath': {'S': composite_key},
-                    'databaseId:assetId': {'S': asset_composite_key},
-                    'metadataValue': {'S': metadata_item.metadataValue},
-                    'metadataValueType': {'S': metadata_item.metadataValueType.value}
-                }
-                items_to_write.append({'PutRequest': {'Item': item}})
-            
-            # Write in batches of 25
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                dynamodb_client.batch_write_item(
-                    RequestItems={
-                        asset_file_metadata_table_name: batch
-                    }
-                )
-            
-            # Success - build response
-            timestamp = datetime.utcnow().isoformat()
-            return BulkOperationResponseModel(
-                success=True,
-                totalItems=len(metadata_items),
-                successCount=len(metadata_items),
-                failureCount=0,
-                successfulItems=[item.metadataKey for item in metadata_items],
-                failedItems=[],
-                message=f"Replaced all metadata: deleted {len(keys_to_delete)} keys, upserted {len(metadata_items)} keys",
-                timestamp=timestamp
-            )
-            
-        except Exception as upsert_error:
-            # Step 5: Rollback - attempt to restore deleted items
-            logger.error(f"Upsert failed in REPLACE_ALL, attempting rollback: {upsert_error}")
-            
-            if deleted_items_backup:
-                try:
-                    # Restore deleted items
-                    items_to_restore = []
-                    for item in deleted_items_backup:
-                        restore_item = {
-                            'metadataKey': {'S': item['metadataKey']},
-                            'databaseId:assetId:filePath': {'S': composite_key},
-                            'databaseId:assetId': {'S': asset_composite_key},
-                            'metadataValue': {'S': item['metadataValue']},
-                            'metadataValueType': {'S': item['metadataValueType']}
-                        }
-                        items_to_restore.append({'PutRequest': {'Item': restore_item}})
-                    
-                    # Restore in batches of 25
-                    for i in range(0, len(items_to_restore), 25):
-                        batch = items_to_restore[i:i+25]
-                        dynamodb_client.batch_write_item(
-                            RequestItems={
-                                asset_file_metadata_table_name: batch
-                            }
-                        )
-                    
-                    logger.info(f"Rollback successful: restored {len(deleted_items_backup)} deleted items")
-                    raise VAMSGeneralErrorResponse("REPLACE_ALL operation failed, all changes rolled back successfully")
-                    
-                except Exception as rollback_error:
-                    logger.error(f"Rollback failed: {rollback_error}")
-                    raise VAMSGeneralErrorResponse(
-                        "REPLACE_ALL operation failed and rollback unsuccessful - data may be inconsistent. "
-                        "Please contact administrator."
-                    )
-            else:
-                # No items were deleted, so just report the upsert failure
-                raise VAMSGeneralErrorResponse(f"REPLACE_ALL operation failed during upsert: {str(upsert_error)}")
+        timestamp = datetime.utcnow().isoformat()
+        return BulkOperationResponseModel(
+            success=True,
+            totalItems=len(metadata_items),
+            successCount=len(metadata_items),
+            failureCount=0,
+            successfulItems=[item.metadataKey for item in metadata_items],
+            failedItems=[],
+            message=f"Replaced all metadata: deleted {result['deleted']} keys, upserted {len(metadata_items)} keys",
+            timestamp=timestamp
+        )
         
     except PermissionError as p:
         raise p
@@ -2363,27 +2107,11 @@ def delete_asset_metadata(database_id: str, asset_id: str, request_model: Delete
                     'error': str(e)
                 })
         
-        # Delete items in batches of 25
+        # Delete items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_delete:
-            for i in range(0, len(items_to_delete), 25):
-                batch = items_to_delete[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            asset_file_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error in batch delete: {e}")
-                    for item in batch:
-                        key = item['DeleteRequest']['Key']['metadataKey']['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({
-                            'key': key,
-                            'error': 'Batch delete failed'
-                        })
-        
+            successful_items, write_failures = batch_write(dynamodb_client, asset_file_metadata_table_name, items_to_delete, metadata_record_key)
+            failed_items.extend(write_failures)
+
         # Build response
         timestamp = datetime.utcnow().isoformat()
         total_items = len(request_model.metadataKeys)
@@ -2622,70 +2350,21 @@ def get_file_metadata(database_id: str, asset_id: str, file_path: str, metadata_
         if not check_entity_authorization(asset, "GET", claims_and_roles):
             raise PermissionError("Not authorized to view metadata for this file")
         
-        composite_key = f"{database_id}:{asset_id}:{file_path}"
         table_name = asset_file_metadata_table_name if metadata_type == 'metadata' else file_attribute_table_name
         
-        # Fetch ALL metadata using paginator (ignore query_params pagination)
-        paginator = dynamodb_client.get_paginator('query')
-        page_iterator = paginator.paginate(
-            TableName=table_name,
-            IndexName='DatabaseIdAssetIdFilePathIndex',
-            KeyConditionExpression='#pk = :pkValue',
-            ExpressionAttributeNames={'#pk': 'databaseId:assetId:filePath'},
-            ExpressionAttributeValues={':pkValue': {'S': composite_key}},
-            ScanIndexForward=False
-        ).build_full_result()
-        
-        # Process ALL items
-        metadata_list = []
-        deserializer = TypeDeserializer()
-        for item in page_iterator.get('Items', []):
-            deserialized_item = {k: deserializer.deserialize(v) for k, v in item.items()}
-            # Normalize field names to metadataKey/metadataValue/metadataValueType
-            if metadata_type == 'attribute':
-                key_field = deserialized_item.get('attributeKey', deserialized_item.get('metadataKey'))
-                value_field = deserialized_item.get('attributeValue', deserialized_item.get('metadataValue'))
-                type_field = deserialized_item.get('attributeValueType', deserialized_item.get('metadataValueType'))
-            else:
-                key_field = deserialized_item['metadataKey']
-                value_field = deserialized_item['metadataValue']
-                type_field = deserialized_item['metadataValueType']
-            
-            # Store as dict for enrichment
-            metadata_list.append({
-                'metadataKey': key_field,
-                'metadataValue': value_field,
-                'metadataValueType': type_field
-            })
+        # Fetch ALL metadata (ignore query_params pagination)
+        metadata_list = query_metadata_records(
+            dynamodb_client, table_name, database_id, asset_id, file_path, metadata_type
+        )
         
         # Fetch database config and schema enrichment
-        restrict_metadata_outside_schemas = False
+        entity_type = 'fileMetadata' if metadata_type == 'metadata' else 'fileAttribute'
+        enriched_metadata, restrict_metadata_outside_schemas = enrich_metadata_records(
+            dynamodb_client, metadata_schema_table_v2_name, database_id, entity_type, file_path,
+            metadata_list, get_database_config
+        )
+
         try:
-            database_ids = [database_id, 'GLOBAL']
-            entity_type = 'fileMetadata' if metadata_type == 'metadata' else 'fileAttribute'
-            
-            aggregated_schema = get_aggregated_schemas(
-                database_ids=database_ids,
-                entity_type=entity_type,
-                file_path=file_path,
-                dynamodb_client=dynamodb_client,
-                schema_table_name=metadata_schema_table_v2_name
-            )
-            
-            # Calculate restrictMetadataOutsideSchemas
-            schemas_exist = len(aggregated_schema) > 0
-            if schemas_exist:
-                try:
-                    db_config = get_database_config(database_id)
-                    db_restricts = db_config.get('restrictMetadataOutsideSchemas', False) == True
-                    restrict_metadata_outside_schemas = db_restricts
-                except Exception as e:
-                    logger.warning(f"Error fetching database config for restriction check: {e}")
-                    restrict_metadata_outside_schemas = False
-            
-            # Enrich metadata with schema information
-            enriched_metadata = enrich_metadata_with_schema(metadata_list, aggregated_schema)
-            
             # Convert to response models
             response_models = []
             for item in enriched_metadata:
@@ -3031,20 +2710,11 @@ def create_file_metadata(database_id: str, asset_id: str, request_model: CreateF
                 logger.warning(f"Error preparing {request_model.type} item {metadata_item.metadataKey}: {e}")
                 failed_items.append({'key': metadata_item.metadataKey, 'error': str(e)})
         
+        # Write items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_write:
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(RequestItems={table_name: batch})
-                except Exception as e:
-                    logger.exception(f"Error in batch write: {e}")
-                    for item in batch:
-                        key_field = 'metadataKey' if request_model.type == 'metadata' else 'attributeKey'
-                        key = item['PutRequest']['Item'][key_field]['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({'key': key, 'error': 'Batch write failed'})
-        
+            successful_items, write_failures = batch_write(dynamodb_client, table_name, items_to_write, metadata_record_key)
+            failed_items.extend(write_failures)
+
         timestamp = datetime.utcnow().isoformat()
         return BulkOperationResponseModel(
             success=len(successful_items) > 0,
@@ -3253,28 +2923,11 @@ def _upsert_file_metadata(database_id: str, asset_id: str, file_path: str, metad
                     'error': str(e)
                 })
         
-        # Write items in batches of 25
+        # Write items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_write:
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error in batch write: {e}")
-                    for item in batch:
-                        key_field = 'metadataKey' if metadata_type == 'metadata' else 'attributeKey'
-                        key = item['PutRequest']['Item'][key_field]['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({
-                            'key': key,
-                            'error': 'Batch write failed'
-                        })
-        
+            successful_items, write_failures = batch_write(dynamodb_client, table_name, items_to_write, metadata_record_key)
+            failed_items.extend(write_failures)
+
         # Build response
         timestamp = datetime.utcnow().isoformat()
         total_items = len(metadata_items)
@@ -3298,10 +2951,12 @@ def _upsert_file_metadata(database_id: str, asset_id: str, file_path: str, metad
 
 
 def _replace_all_file_metadata(database_id: str, asset_id: str, file_path: str, metadata_type: str, metadata_items: list, claims_and_roles: dict) -> BulkOperationResponseModel:
-    """Internal helper: Replace all file metadata/attributes with rollback on failure"""
+    """Internal helper: Replace all file metadata/attributes, in one transaction when it fits or with rollback on failure"""
     try:
         composite_key = f"{database_id}:{asset_id}:{file_path}"
+        asset_composite_key = f"{database_id}:{asset_id}"
         table_name = asset_file_metadata_table_name if metadata_type == 'metadata' else file_attribute_table_name
+        key_field = 'metadataKey' if metadata_type == 'metadata' else 'attributeKey'
         
         # Step 1: Fetch all existing metadata
         paginator = dynamodb_client.get_paginator('query')
@@ -3312,161 +2967,45 @@ def _replace_all_file_metadata(database_id: str, asset_id: str, file_path: str,
             ExpressionAttributeNames={'#pk': 'databaseId:assetId:filePath'},
             ExpressionAttributeValues={':pkValue': {'S': composite_key}}
         ).build_full_result()
+        existing_items = page_iterator.get('Items', [])
         
-        existing_metadata = []
-        deserializer = TypeDeserializer()
-        for item in page_iterator.get('Items', []):
-            deserialized = {k: deserializer.deserialize(v) for k, v in item.items()}
-            existing_metadata.append(deserialized)
-        
-        # Step 2: Determine which keys to delete
-        provided_keys = {item.metadataKey for item in metadata_items}
-        if metadata_type == 'metadata':
-            existing_keys = {item['metadataKey'] for item in existing_metadata}
-        else:  # attribute
-            existing_keys = {item.get('attributeKey', item.get('metadataKey')) for item in existing_metadata}
-        keys_to_delete = existing_keys - provided_keys
-        
-        # Store items to delete for potential rollback
-        deleted_items_backup = [
-            item for item in existing_metadata 
-            if (item.get('metadataKey') if metadata_type == 'metadata' else item.get('attributeKey', item.get('metadataKey'))) in keys_to_delete
-        ]
-        
-        logger.info(f"REPLACE_ALL: Deleting {len(keys_to_delete)} keys, upserting {len(provided_keys)} keys")
+        # Step 2: Build the new set of metadata/attributes
+        new_items = []
+        for metadata_item in metadata_items:
+            if metadata_type == 'metadata':
+                new_items.append({
+                    'metadataKey': {'S': metadata_item.metadataKey},
+                    'databaseId:assetId:filePath': {'S': composite_key},
+                    'databaseId:assetId': {'S': asset_composite_key},
+                    'metadataValue': {'S': metadata_item.metadataValue},
+                    'metadataValueType': {'S': metadata_item.metadataValueType.value}
+                })
+            else:  # attribute
+                new_items.append({
+                    'attributeKey': {'S': metadata_item.metadataKey},
+                    'databaseId:assetId:filePath': {'S': composite_key},
+                    'databaseId:assetId': {'S': asset_composite_key},
+                    'attributeValue': {'S': metadata_item.metadataValue},
+                    'attributeValueType': {'S': metadata_item.metadataValueType.value}
+                })
         
-        # Step 3: Delete keys not in provided list
-        if keys_to_delete:
-            items_to_delete = []
-            for key in keys_to_delete:
-                if metadata_type == 'metadata':
-                    items_to_delete.append({
-                        'DeleteRequest': {
-                            'Key': {
-                                'metadataKey': {'S': key},
-                                'databaseId:assetId:filePath': {'S': composite_key}
-                            }
-                        }
-                    })
-                else:  # attribute
-                    items_to_delete.append({
-                        'DeleteRequest': {
-                            'Key': {
-                                'attributeKey': {'S': key},
-                                'databaseId:assetId:filePath': {'S': composite_key}
-                            }
-                        }
-                    })
-            
-            # Delete in batches of 25
-            for i in range(0, len(items_to_delete), 25):
-                batch = items_to_delete[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error deleting {metadata_type} in REPLACE_ALL: {e}")
-                    raise VAMSGeneralErrorResponse(f"Failed to delete existing {metadata_type}")
+        # Step 3: Delete keys not in provided list and upsert all provided metadata
+        result = replace_all(
+            dynamodb_client, table_name, [key_field, 'databaseId:assetId:filePath'],
+            existing_items, new_items, metadata_record_key
+        )
         
-        # Step 4: Upsert all provided metadata
-        try:
-            items_to_write = []
-            asset_composite_key = f"{database_id}:{asset_id}"
-            for metadata_item in metadata_items:
-                if metadata_type == 'metadata':
-                    item = {
-                        'metadataKey': {'S': metadata_item.metadataKey},
-                        'databaseId:assetId:filePath': {'S': composite_key},
-                        'databaseId:assetId': {'S': asset_composite_key},
-                        'metadataValue': {'S': metadata_item.metadataValue},
-                        'metadataValueType': {'S': metadata_item.metadataValueType.value}
-                    }
-                else:  # attribute
-                    item = {
-                        'attributeKey': {'S': metadata_item.metadataKey},
-                        'databaseId:assetId:filePath': {'S': composite_key},
-                        'databaseId:assetId': {'S': asset_composite_key},
-                        'attributeValue': {'S': metadata_item.metadataValue},
-                        'attributeValueType': {'S': metadata_item.metadataValueType.value}
-                    }
-                items_to_write.append({'PutRequest': {'Item': item}})
-            
-            # Write in batches of 25
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                dynamodb_client.batch_write_item(
-                    RequestItems={
-                        table_name: batch
-                    }
-                )
-            
-            # Success - build response
-            timestamp = datetime.utcnow().isoformat()
-            return BulkOperationResponseModel(
-                success=True,
-                totalItems=len(metadata_items),
-                successCount=len(metadata_items),
-                failureCount=0,
-                successfulItems=[item.metadataKey for item in metadata_items],
-                failedItems=[],
-                message=f"Replaced all {metadata_type}: deleted {len(keys_to_delete)} keys, upserted {len(metadata_items)} keys",
-                timestamp=timestamp
-            )
-            
-        except Exception as upsert_error:
-            # Step 5: Rollback - attempt to restore deleted items
-            logger.error(f"Upsert failed in REPLACE_ALL, attempting rollback: {upsert_error}")
-            
-            if deleted_items_backup:
-                try:
-                    # Restore deleted items
-                    items_to_restore = []
-                    for item in deleted_items_backup:
-                        if metadata_type == 'metadata':
-                            restore_item = {
-                                'metadataKey': {'S': item['metadataKey']},
-                                'databaseId:assetId:filePath': {'S': composite_key},
-                                'databaseId:assetId': {'S': asset_composite_key},
-                                'metadataValue': {'S': item['metadataValue']},
-                                'metadataValueType': {'S': item['metadataValueType']}
-                            }
-                        else:  # attribute
-                            key = item.get('attributeKey', item.get('metadataKey'))
-                            value = item.get('attributeValue', item.get('metadataValue'))
-                            value_type = item.get('attributeValueType', item.get('metadataValueType'))
-                            restore_item = {
-                                'attributeKey': {'S': key},
-                                'databaseId:assetId:filePath': {'S': composite_key},
-                                'databaseId:assetId': {'S': asset_composite_key},
-                                'attributeValue': {'S': value},
-                                'attributeValueType': {'S': value_type}
-                            }
-                        items_to_restore.append({'PutRequest': {'Item': restore_item}})
-                    
-                    # Restore in batches of 25
-                    for i in range(0, len(items_to_restore), 25):
-                        batch = items_to_restore[i:i+25]
-                        dynamodb_client.batch_write_item(
-                            RequestItems={
-                                table_name: batch
-                            }
-                        )
-                    
-                    logger.info(f"Rollback successful: restored {len(deleted_items_backup)} deleted items")
-                    raise VAMSGeneralErrorResponse("REPLACE_ALL operation failed, all changes rolled back successfully")
-                    
-                except Exception as rollback_error:
-                    logger.error(f"Rollback failed: {rollback_error}")
-                    raise VAMSGeneralErrorResponse(
-                        "REPLACE_ALL operation failed and rollback unsuccessful - data may be inconsistent. "
-                        "Please contact administrator."
-                    )
-            else:
-                # No items were deleted, so just report the upsert failure
-                raise VAMSGeneralErrorResponse(f"REPLACE_ALL operation failed during upsert: {str(upsert_error)}")
+        timestamp = datetime.utcnow().isoformat()
+        return BulkOperationResponseModel(
+            success=True,
+            totalItems=len(metadata_items),
+            successCount=len(metadata_items),
+            failureCount=0,
+            successfulItems=[item.metadataKey for item in metadata_items],
+            failedItems=[],
+            message=f"Replaced all {metadata_type}: deleted {result['deleted']} keys, upserted {len(metadata_items)} keys",
+            timestamp=timestamp
+        )
         
     except PermissionError as p:
         raise p
@@ -3609,20 +3148,11 @@ def delete_file_metadata(database_id: str, asset_id: str, request_model: DeleteF
                 logger.warning(f"Error preparing delete for {request_model.type} key {metadata_key}: {e}")
                 failed_items.append({'key': metadata_key, 'error': str(e)})
         
+        # Delete items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_delete:
-            for i in range(0, len(items_to_delete), 25):
-                batch = items_to_delete[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(RequestItems={table_name: batch})
-                except Exception as e:
-                    logger.exception(f"Error in batch delete: {e}")
-                    for item in batch:
-                        key_field = 'metadataKey' if request_model.type == 'metadata' else 'attributeKey'
-                        key = item['DeleteRequest']['Key'][key_field]['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({'key': key, 'error': 'Batch delete failed'})
-        
+            successful_items, write_failures = batch_write(dynamodb_client, table_name, items_to_delete, metadata_record_key)
+            failed_items.extend(write_failures)
+
         timestamp = datetime.utcnow().isoformat()
         return BulkOperationResponseModel(
             success=len(successful_items) > 0,
@@ -3660,9 +3190,8 @@ def handle_file_metadata_get(event):
         query_request_model = parse(query_parameters, model=GetFileMetadataRequestModel)
         
         # Strip assetId prefix if present (after model validation)
-        file_path = query_request_model.filePath
-        if file_path.startswith(f"/{path_request_model.assetId}/"):
-            file_path = file_path[len(path_request_model.assetId)+1:]
+        file_path = normalize_metadata_file_path(path_request_model.assetId, query_request_model.filePath)
+        if file_path != query_request_model.filePath:
             logger.info(f"Stripped assetId prefix from filePath: {query_request_model.filePath} -> {file_path}")
         
         query_params = {'pageSize': query_request_model.pageSize, 'startingToken': query_request_model.startingToken, 'assetVersionId': query_request_model.assetVersionId}
@@ -4052,19 +3581,11 @@ def create_database_metadata(database_id: str, request_model: CreateDatabaseMeta
             except Exception as e:
                 failed_items.append({'key': metadata_item.metadataKey, 'error': str(e)})
         
+        # Write items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_write:
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(RequestItems={database_metadata_table_name: batch})
-                except Exception as e:
-                    logger.exception(f"Error in batch write: {e}")
-                    for item in batch:
-                        key = item['PutRequest']['Item']['metadataKey']['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({'key': key, 'error': 'Batch write failed'})
-        
+            successful_items, write_failures = batch_write(dynamodb_client, database_metadata_table_name, items_to_write, metadata_record_key)
+            failed_items.extend(write_failures)
+
         timestamp = datetime.utcnow().isoformat()
         return BulkOperationResponseModel(
             success=len(successful_items) > 0,
@@ -4246,27 +3767,11 @@ def _upsert_database_metadata(database_id: str, metadata_items: list, claims_and
                     'error': str(e)
                 })
         
-        # Write items in batches of 25
+        # Write items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_write:
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            database_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error in batch write: {e}")
-                    for item in batch:
-                        key = item['PutRequest']['Item']['metadataKey']['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({
-                            'key': key,
-                            'error': 'Batch write failed'
-                        })
-        
+            successful_items, write_failures = batch_write(dynamodb_client, database_metadata_table_name, items_to_write, metadata_record_key)
+            failed_items.extend(write_failures)
+
         # Build response
         timestamp = datetime.utcnow().isoformat()
         total_items = len(metadata_items)
@@ -4290,7 +3795,7 @@ def _upsert_database_metadata(database_id: str, metadata_items: list, claims_and
 
 
 def _replace_all_database_metadata(database_id: str, metadata_items: list, claims_and_roles: dict) -> BulkOperationResponseModel:
-    """Internal helper: Replace all database metadata with rollback on failure"""
+    """Internal helper: Replace all database metadata, in one transaction when it fits or with rollback on failure"""
     try:
         # Step 1: Fetch all existing metadata
         paginator = dynamodb_client.get_paginator('query')
@@ -4300,124 +3805,35 @@ def _replace_all_database_metadata(database_id: str, metadata_items: list, claim
             KeyConditionExpression='databaseId = :dbId',
             ExpressionAttributeValues={':dbId': {'S': database_id}}
         ).build_full_result()
+        existing_items = page_iterator.get('Items', [])
         
-        existing_metadata = []
-        deserializer = TypeDeserializer()
-        for item in page_iterator.get('Items', []):
-            deserialized = {k: deserializer.deserialize(v) for k, v in item.items()}
-            existing_metadata.append(deserialized)
-        
-        # Step 2: Determine which keys to delete
-        provided_keys = {item.metadataKey for item in metadata_items}
-        existing_keys = {item['metadataKey'] for item in existing_metadata}
-        keys_to_delete = existing_keys - provided_keys
-        
-        # Store items to delete for potential rollback
-        deleted_items_backup = [
-            item for item in existing_metadata 
-            if item['metadataKey'] in keys_to_delete
-        ]
-        
-        logger.info(f"REPLACE_ALL: Deleting {len(keys_to_delete)} keys, upserting {len(provided_keys)} keys")
+        # Step 2: Build the new set of metadata
+        new_items = []
+        for metadata_item in metadata_items:
+            new_items.append({
+                'metadataKey': {'S': metadata_item.metadataKey},
+                'databaseId': {'S': database_id},
+                'metadataValue': {'S': metadata_item.metadataValue},
+                'metadataValueType': {'S': metadata_item.metadataValueType.value}
+            })
         
-        # Step 3: Delete keys not in provided list
-        if keys_to_delete:
-            items_to_delete = []
-            for key in keys_to_delete:
-                items_to_delete.append({
-                    'DeleteRequest': {
-                        'Key': {
-                            'metadataKey': {'S': key},
-                            'databaseId': {'S': database_id}
-                        }
-                    }
-                })
-            
-            # Delete in batches of 25
-            for i in range(0, len(items_to_delete), 25):
-                batch = items_to_delete[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(
-                        RequestItems={
-                            database_metadata_table_name: batch
-                        }
-                    )
-                except Exception as e:
-                    logger.exception(f"Error deleting metadata in REPLACE_ALL: {e}")
-                    raise VAMSGeneralErrorResponse("Failed to delete existing metadata")
+        # Step 3: Delete keys not in provided list and upsert all provided metadata
+        result = replace_all(
+            dynamodb_client, database_metadata_table_name, ['metadataKey', 'databaseId'],
+            existing_items, new_items, metadata_record_key
+        )
         
-        # Step 4: Upsert all provided metadata
-        try:
-            items_to_write = []
-            for metadata_item in metadata_items:
-                item = {
-                    'metadataKey': {'S': metadata_item.metadataKey},
-                    'databaseId': {'S': database_id},
-                    'metadataValue': {'S': metadata_item.metadataValue},
-                    'metadataValueType': {'S': metadata_item.metadataValueType.value}
-                }
-                items_to_write.append({'PutRequest': {'Item': item}})
-            
-            # Write in batches of 25
-            for i in range(0, len(items_to_write), 25):
-                batch = items_to_write[i:i+25]
-                dynamodb_client.batch_write_item(
-                    RequestItems={
-                        database_metadata_table_name: batch
-                    }
-                )
-            
-            # Success - build response
-            timestamp = datetime.utcnow().isoformat()
-            return BulkOperationResponseModel(
-                success=True,
-                totalItems=len(metadata_items),
-                successCount=len(metadata_items),
-                failureCount=0,
-                successfulItems=[item.metadataKey for item in metadata_items],
-                failedItems=[],
-                message=f"Replaced all metadata: deleted {len(keys_to_delete)} keys, upserted {len(metadata_items)} keys",
-                timestamp=timestamp
-            )
-            
-        except Exception as upsert_error:
-            # Step 5: Rollback - attempt to restore deleted items
-            logger.error(f"Upsert failed in REPLACE_ALL, attempting rollback: {upsert_error}")
-            
-            if deleted_items_backup:
-                try:
-                    # Restore deleted items
-                    items_to_restore = []
-                    for item in deleted_items_backup:
-                        restore_item = {
-                            'metadataKey': {'S': item['metadataKey']},
-                            'databaseId': {'S': database_id},
-                            'metadataValue': {'S': item['metadataValue']},
-                            'metadataValueType': {'S': item['metadataValueType']}
-                        }
-                        items_to_restore.append({'PutRequest': {'Item': restore_item}})
-                    
-                    # Restore in batches of 25
-                    for i in range(0, len(items_to_restore), 25):
-                        batch = items_to_restore[i:i+25]
-                        dynamodb_client.batch_write_item(
-                            RequestItems={
-                                database_metadata_table_name: batch
-                            }
-                        )
-                    
-                    logger.info(f"Rollback successful: restored {len(deleted_items_backup)} deleted items")
-                    raise VAMSGeneralErrorResponse("REPLACE_ALL operation failed, all changes rolled back successfully")
-                    
-                except Exception as rollback_error:
-                    logger.error(f"Rollback failed: {rollback_error}")
-                    raise VAMSGeneralErrorResponse(
-                        "REPLACE_ALL operation failed and rollback unsuccessful - data may be inconsistent. "
-                        "Please contact administrator."
-                    )
-            else:
-                # No items were deleted, so just report the upsert failure
-                raise VAMSGeneralErrorResponse(f"REPLACE_ALL operation failed during upsert: {str(upsert_error)}")
+        timestamp = datetime.utcnow().isoformat()
+        return BulkOperationResponseModel(
+            success=True,
+            totalItems=len(metadata_items),
+            successCount=len(metadata_items),
+            failureCount=0,
+            successfulItems=[item.metadataKey for item in metadata_items],
+            failedItems=[],
+            message=f"Replaced all metadata: deleted {result['deleted']} keys, upserted {len(metadata_items)} keys",
+            timestamp=timestamp
+        )
         
     except PermissionError as p:
         raise p
@@ -4523,19 +3939,11 @@ def delete_database_metadata(database_id: str, request_model: DeleteDatabaseMeta
             except Exception as e:
                 failed_items.append({'key': metadata_key, 'error': str(e)})
         
+        # Delete items concurrently, retrying unprocessed items, and report per-item outcomes
         if items_to_delete:
-            for i in range(0, len(items_to_delete), 25):
-                batch = items_to_delete[i:i+25]
-                try:
-                    dynamodb_client.batch_write_item(RequestItems={database_metadata_table_name: batch})
-                except Exception as e:
-                    logger.exception(f"Error in batch delete: {e}")
-                    for item in batch:
-                        key = item['DeleteRequest']['Key']['metadataKey']['S']
-                        if key in successful_items:
-                            successful_items.remove(key)
-                        failed_items.append({'key': key, 'error': 'Batch delete failed'})
-        
+            successful_items, write_failures = batch_write(dynamodb_client, database_metadata_table_name, items_to_delete, metadata_record_key)
+            failed_items.extend(write_failures)
+
         timestamp = datetime.utcnow().isoformat()
         return BulkOperationResponseModel(
             success=len(successful_items) > 0,
@@ -4682,6 +4090,456 @@ def handle_database_metadata_delete(event):
         return internal_error(event=event)
 
 
+#######################
+# Bulk Metadata Import
+#######################
+
+def _read_import_rows(database_id: str, request_model: ImportMetadataRequestModel, claims_and_roles: dict) -> list:
+    """Read the import file from the source asset and return its data rows as dictionaries
+    
+    CSV files use a header row of field names. NDJSON files hold one JSON object per line;
+    blank lines are skipped and do not count as rows. Rows that cannot be parsed are
+    returned with an '_importError' entry so they are reported against their row number.
+    """
+    source_asset = validate_asset_exists(database_id, request_model.sourceAssetId)
+    source_asset.update({"object__type": "asset"})
+    
+    if not check_entity_authorization(source_asset, "GET", claims_and_roles):
+        raise PermissionError("Not authorized to read the import file")
+    
+    bucket_name, asset_base_path = get_asset_s3_location(source_asset)
+    full_key = f"{asset_base_path}{request_model.sourceFilePath.lstrip('/')}"
+    
+    try:
+        response = s3.get_object(Bucket=bucket_name, Key=full_key)
+    except ClientError as e:
+        if e.response['Error']['Code'] in ('NoSuchKey', '404'):
+            raise VAMSGeneralErrorResponse("Import file not found in S3")
+        raise
+    
+    if response.get('ContentLength', 0) > MAX_METADATA_IMPORT_FILE_BYTES:
+        raise VAMSGeneralErrorResponse(
+            f"Import file exceeds the maximum size of {MAX_METADATA_IMPORT_FILE_BYTES // (1024 * 1024)} MB"
+        )
+    
+    try:
+        content = response['Body'].read().decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise VAMSGeneralErrorResponse("Import file must be UTF-8 encoded")
+    
+    rows = []
+    if request_model.format == 'csv':
+        reader = csv.DictReader(io.StringIO(content))
+        for row in reader:
+            if None in row:
+                rows.append({'_importError': "Row has more columns than the header"})
+                continue
+            rows.append({field.strip(): value for field, value in row.items() if field})
+    else:
+        for line in content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                rows.append({'_importError': f"Invalid JSON: {e.msg}"})
+                continue
+            if not isinstance(row, dict):
+                rows.append({'_importError': "Row must be a JSON object"})
+                continue
+            rows.append(row)
+    
+    return rows
+
+
+def _import_record_id(item: dict) -> str:
+    """Return the identifier of an imported record, unique across the files of an asset"""
+    return f"{item['databaseId:assetId:filePath']['S']}|{metadata_record_key(item)}"
+
+
+def _load_import_asset(database_id: str, asset_id: str, import_state: dict):
+    """Load and authorize an import target asset once per import request
+    
+    Returns:
+        Error message for rows of the asset, or None if metadata may be written to it
+    """
+    if asset_id not in import_state['assetErrors']:
+        error = None
+        try:
+            asset = validate_asset_exists(database_id, asset_id)
+            asset.update({"object__type": "asset"})
+            enforcer = import_state['enforcer']
+            if enforcer is None or not enforcer.enforce(asset, "POST"):
+                error = "Not authorized to create metadata for this asset"
+            else:
+                import_state['assets'][asset_id] = asset
+        except VAMSGeneralErrorResponse as e:
+            error = str(e)
+        except Exception as e:
+            logger.exception(f"Error authorizing import asset: {e}")
+            error = "Error validating asset"
+        import_state['assetErrors'][asset_id] = error
+    return import_state['assetErrors'][asset_id]
+
+
+def _get_import_asset_files(asset_id: str, import_state: dict) -> set:
+    """List an import target asset's files once (relative paths with leading slash)"""
+    if asset_id not in import_state['files']:
+        bucket_name, asset_base_path = get_asset_s3_location(import_state['assets'][asset_id])
+        file_paths = set()
+        paginator = s3.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=asset_base_path):
+            for obj in page.get('Contents', []):
+                if not obj['Key'].endswith('/'):
+                    file_paths.add('/' + obj['Key'][len(asset_base_path):])
+        import_state['files'][asset_id] = file_paths
+    return import_state['files'][asset_id]
+
+
+def _get_import_existing_metadata(database_id: str, asset_id: str, metadata_type: str, import_state: dict) -> dict:
+    """Fetch all existing metadata (or attributes) of an asset and its files with one index query
+    
+    Returns:
+        Dictionary of {filePath: {key: {'metadataValue', 'metadataValueType'}}}
+    """
+    cache_key = (asset_id, metadata_type)
+    if cache_key not in import_state['existing']:
+        table_name = asset_file_metadata_table_name if metadata_type == 'metadata' else file_attribute_table_name
+        paginator = dynamodb_client.get_paginator('query')
+        page_iterator = paginator.paginate(
+            TableName=table_name,
+            IndexName='DatabaseIdAssetIdIndex',
+            KeyConditionExpression='#pk = :pkValue',
+            ExpressionAttributeNames={'#pk': 'databaseId:assetId'},
+            ExpressionAttributeValues={':pkValue': {'S': f"{database_id}:{asset_id}"}}
+        ).build_full_result()
+        
+        path_prefix = f"{database_id}:{asset_id}:"
+        existing = {}
+        deserializer = TypeDeserializer()
+        for item in page_iterator.get('Items', []):
+            deserialized = {k: deserializer.deserialize(v) for k, v in item.items()}
+            file_path = deserialized['databaseId:assetId:filePath'][len(path_prefix):]
+            if metadata_type == 'attribute':
+                key = deserialized.get('attributeKey', deserialized.get('metadataKey'))
+                value = deserialized.get('attributeValue', deserialized.get('metadataValue'))
+                value_type = deserialized.get('attributeValueType', deserialized.get('metadataValueType'))
+            else:
+                key = deserialized['metadataKey']
+                value = deserialized['metadataValue']
+                value_type = deserialized['metadataValueType']
+            existing.setdefault(file_path, {})[key] = {
+                'metadataValue': value,
+                'metadataValueType': value_type
+            }
+        import_state['existing'][cache_key] = existing
+    return import_state['existing'][cache_key]
+
+
+def _validate_import_entity(database_id: str, file_path: str, metadata_type: str, existing_metadata: dict,
+                            incoming: dict, import_state: dict) -> list:
+    """Validate the merged metadata of one asset or file against its resolved schema set
+    
+    Returns:
+        List of metadata items to add for schema defaults
+        
+    Raises:
+        VAMSGeneralErrorResponse: If the merged metadata is not valid
+    """
+    merged_metadata = existing_metadata.copy()
+    for metadata_key, (_, row) in incoming.items():
+        merged_metadata[metadata_key] = {
+            'metadataValue': row.metadataValue,
+            'metadataValueType': row.metadataValueType.value
+        }
+    
+    if len(merged_metadata) > MAX_METADATA_RECORDS_PER_ENTITY:
+        raise VAMSGeneralErrorResponse(
+            f"Maximum {MAX_METADATA_RECORDS_PER_ENTITY} {metadata_type} records allowed per "
+            f"{'asset' if file_path == '/' else 'file'} (final would be: {len(merged_metadata)})"
+        )
+    
+    if import_state['skipSchemaValidation']:
+        return []
+    
+    if file_path == '/':
+        entity_type = 'assetMetadata'
+    else:
+        entity_type = 'fileMetadata' if metadata_type == 'metadata' else 'fileAttribute'
+    
+    try:
+        # Schemas are resolved once per entity type and file extension (and cached across requests)
+        aggregated_schema = get_aggregated_schemas(
+            database_ids=[database_id, 'GLOBAL'],
+            entity_type=entity_type,
+            file_path=None if file_path == '/' else file_path,
+            dynamodb_client=dynamodb_client,
+            schema_table_name=metadata_schema_table_v2_name
+        )
+        
+        is_valid, errors, metadata_with_defaults = validate_metadata_against_schema(
+            merged_metadata, aggregated_schema, "POST", existing_metadata
+        )
+        if not is_valid:
+            raise VAMSGeneralErrorResponse("Schema validation failed: " + "; ".join(errors))
+        
+        if aggregated_schema and import_state['restrictMetadataOutsideSchemas']:
+            keys_valid, key_errors = validate_metadata_keys_against_schema(
+                merged_metadata, aggregated_schema, True
+            )
+            if not keys_valid:
+                raise VAMSGeneralErrorResponse("Metadata key validation failed: " + "; ".join(key_errors))
+        
+        # Add any new fields with defaults that weren't in the import
+        return [
+            MetadataItemModel(
+                metadataKey=key,
+                metadataValue=value_dict['metadataValue'],
+                metadataValueType=value_dict['metadataValueType']
+            )
+            for key, value_dict in metadata_with_defaults.items()
+            if key not in existing_metadata and key not in incoming
+        ]
+    except VAMSGeneralErrorResponse:
+        raise
+    except Exception as e:
+        logger.warning(f"Error during schema validation: {e}")
+        # Continue without schema validation if it fails
+        return []
+
+
+def _import_metadata_rows(database_id: str, rows: list, start_row: int, end_row: int, import_state: dict) -> None:
+    """Validate and write one chunk of import rows, recording row outcomes in import_state"""
+    def reject(row_number, row, error):
+        import_state['failureCount'] += 1
+        if len(import_state['errorReport']) < MAX_METADATA_IMPORT_ERROR_REPORT_ROWS:
+            import_state['errorReport'].append(ImportMetadataRowErrorModel(
+                row=row_number,
+                assetId=row.get('assetId') if isinstance(row.get('assetId'), str) else None,
+                filePath=row.get('filePath') if isinstance(row.get('filePath'), str) else None,
+                metadataKey=row.get('metadataKey') if isinstance(row.get('metadataKey'), str) else None,
+                error=error
+            ))
+        else:
+            import_state['errorReportTruncated'] = True
+    
+    # Parse rows and group them by target entity: (assetId, filePath, type)
+    groups = {}
+    for row_number in range(start_row, end_row):
+        raw_row = rows[row_number]
+        if '_importError' in raw_row:
+            reject(row_number, raw_row, raw_row['_importError'])
+            continue
+        
+        # Empty CSV cells fall back to the field defaults
+        raw_row = {k: v for k, v in raw_row.items() if k == 'metadataValue' or v not in ('', None)}
+        try:
+            row = ImportMetadataRowModel(**raw_row)
+        except ValidationError as v:
+            reject(row_number, raw_row, "; ".join(error['msg'] for error in v.errors()))
+            continue
+        except Exception as e:
+            reject(row_number, raw_row, str(e))
+            continue
+        
+        group_key = (row.assetId, row.filePath or '/', row.type)
+        groups.setdefault(group_key, []).append((row_number, row))
+    
+    requests_by_table = {}
+    rows_by_record = {}
+    for (asset_id, file_path, metadata_type), group_rows in groups.items():
+        def reject_group(error):
+            for row_number, row in group_rows:
+                reject(row_number, row.dict(), error)
+        
+        asset_error = _load_import_asset(database_id, asset_id, import_state)
+        if asset_error:
+            reject_group(asset_error)
+            continue
+        
+        try:
+            if file_path != '/' and file_path not in _get_import_asset_files(asset_id, import_state):
+                reject_group("File not found in S3")
+                continue
+            
+            existing_by_path = _get_import_existing_metadata(database_id, asset_id, metadata_type, import_state)
+            existing_metadata = existing_by_path.get(file_path, {})
+            
+            # Later rows for the same key win
+            incoming = {}
+            for row_number, row in group_rows:
+                incoming[row.metadataKey] = (row_number, row)
+            
+            default_items = _validate_import_entity(
+                database_id, file_path, metadata_type, existing_metadata, incoming, import_state
+            )
+        except VAMSGeneralErrorResponse as e:
+            reject_group(str(e))
+            continue
+        except Exception as e:
+            logger.exception(f"Error validating import rows: {e}")
+            reject_group("Error validating metadata")
+            continue
+        
+        table_name = asset_file_metadata_table_name if metadata_type == 'metadata' else file_attribute_table_name
+        composite_key = f"{database_id}:{asset_id}:{file_path}"
+        asset_composite_key = f"{database_id}:{asset_id}"
+        items = [row for _, row in incoming.values()] + default_items
+        for metadata_item in items:
+            if metadata_type == 'metadata':
+                item = {
+                    'metadataKey': {'S': metadata_item.metadataKey},
+                    'databaseId:assetId:filePath': {'S': composite_key},
+                    'databaseId:assetId': {'S': asset_composite_key},
+                    'metadataValue': {'S': metadata_item.metadataValue},
+                    'metadataValueType': {'S': metadata_item.metadataValueType.value}
+                }
+            else:  # attribute
+                item = {
+                    'attributeKey': {'S': metadata_item.metadataKey},
+                    'databaseId:assetId:filePath': {'S': composite_key},
+                    'databaseId:assetId': {'S': asset_composite_key},
+                    'attributeValue': {'S': metadata_item.metadataValue},
+                    'attributeValueType': {'S': metadata_item.metadataValueType.value}
+                }
+            requests_by_table.setdefault(table_name, []).append({'PutRequest': {'Item': item}})
+            rows_by_record[(table_name, _import_record_id(item))] = {
+                'rows': [(row_number, row) for row_number, row in group_rows
+                         if row.metadataKey == metadata_item.metadataKey],
+                'existing': existing_metadata,
+                'existingByPath': existing_by_path,
+                'filePath': file_path,
+                'item': metadata_item
+            }
+    
+    # Write every accepted record of the chunk through concurrent batched writes
+    for table_name, write_requests in requests_by_table.items():
+        succeeded, write_failures = batch_write(dynamodb_client, table_name, write_requests, _import_record_id)
+        for record_id in succeeded:
+            record = rows_by_record[(table_name, record_id)]
+            import_state['successCount'] += len(record['rows'])
+            # Later chunks validate against the records written by this one
+            record['existingByPath'].setdefault(record['filePath'], record['existing'])[record['item'].metadataKey] = {
+                'metadataValue': record['item'].metadataValue,
+                'metadataValueType': record['item'].metadataValueType.value
+            }
+        for failure in write_failures:
+            for row_number, row in rows_by_record[(table_name, failure['key'])]['rows']:
+                reject(row_number, row.dict(), failure['error'])
+
+
+def import_metadata(database_id: str, request_model: ImportMetadataRequestModel, claims_and_roles: dict) -> ImportMetadataResponseModel:
+    """Import asset and file metadata rows from an NDJSON or CSV file stored on an asset
+    
+    Each target asset is loaded and authorized once, existing metadata is fetched once per
+    asset, schemas are resolved once per entity type and file extension, and accepted rows
+    are written with batched DynamoDB writes. Rejected rows are returned in an error report
+    instead of failing the import. When the time budget runs out the response carries
+    nextRow, which the caller passes back as startRow to continue.
+    
+    Args:
+        database_id: The database ID
+        request_model: The import request model
+        claims_and_roles: User claims and roles
+        
+    Returns:
+        ImportMetadataResponseModel with row outcomes
+    """
+    try:
+        started = time.monotonic()
+        database = validate_database_exists(database_id)
+        rows = _read_import_rows(database_id, request_model, claims_and_roles)
+        total_rows = len(rows)
+        
+        if request_model.startRow > total_rows:
+            raise VAMSGeneralErrorResponse(f"startRow {request_model.startRow} is beyond the last row ({total_rows})")
+        
+        # Check if user is SYSTEM - bypass schema validation
+        username = claims_and_roles.get("tokens", ["system"])[0]
+        
+        import_state = {
+            'enforcer': CasbinEnforcer(claims_and_roles) if len(claims_and_roles.get("tokens", [])) > 0 else None,
+            'skipSchemaValidation': username == "SYSTEM_USER",
+            'restrictMetadataOutsideSchemas': database.get('restrictMetadataOutsideSchemas', False),
+            'assets': {},
+            'assetErrors': {},
+            'files': {},
+            'existing': {},
+            'successCount': 0,
+            'failureCount': 0,
+            'errorReport': [],
+            'errorReportTruncated': False
+        }
+        
+        row_number = request_model.startRow
+        while row_number < total_rows:
+            if row_number > request_model.startRow and time.monotonic() - started > METADATA_IMPORT_TIME_BUDGET_SECONDS:
+                break
+            chunk_end = min(row_number + METADATA_IMPORT_CHUNK_ROWS, total_rows)
+            _import_metadata_rows(database_id, rows, row_number, chunk_end, import_state)
+            row_number = chunk_end
+        
+        processed_rows = row_number - request_model.startRow
+        next_row = row_number if row_number < total_rows else None
+        message = f"Imported {import_state['successCount']} of {processed_rows} rows"
+        if next_row is not None:
+            message += f", resume from row {next_row}"
+        
+        return ImportMetadataResponseModel(
+            success=import_state['failureCount'] == 0,
+            totalRows=total_rows,
+            startRow=request_model.startRow,
+            processedRows=processed_rows,
+            successCount=import_state['successCount'],
+            failureCount=import_state['failureCount'],
+            nextRow=next_row,
+            errorReport=sorted(import_state['errorReport'], key=lambda error: error.row),
+            errorReportTruncated=import_state['errorReportTruncated'],
+            message=message,
+            timestamp=datetime.utcnow().isoformat()
+        )
+    except PermissionError:
+        raise
+    except VAMSGeneralErrorResponse:
+        raise
+    except Exception as e:
+        logger.exception(f"Error importing metadata: {e}")
+        raise VAMSGeneralErrorResponse("Error importing metadata")
+
+
+def handle_metadata_import_post(event):
+    """Handle POST requests to import metadata from a file"""
+    path_parameters = event.get('pathParameters', {})
+    
+    try:
+        # Parse and validate path parameters (validation in model)
+        path_request_model = parse(path_parameters, model=DatabaseMetadataPathRequestModel)
+        
+        body = event.get('body')
+        if not body:
+            return validation_error(body={'message': "Request body is required"}, event=event)
+        
+        if isinstance(body, str):
+            try:
+                body = json.loads(body)
+            except json.JSONDecodeError as e:
+                logger.exception(f"Invalid JSON in request body: {e}")
+                return validation_error(body={'message': "Invalid JSON in request body"}, event=event)
+        
+        request_model = parse(body, model=ImportMetadataRequestModel)
+        response = import_metadata(path_request_model.databaseId, request_model, claims_and_roles)
+        return success(body=response.dict())
+    except ValidationError as v:
+        return validation_error(body={'message': str(v)}, event=event)
+    except PermissionError as p:
+        return authorization_error(body={'message': str(p)})
+    except VAMSGeneralErrorResponse as e:
+        return general_error(body={"message": str(e)}, event=event)
+    except Exception as e:
+        logger.exception(f"Error handling import request: {e}")
+        return internal_error(event=event)
+
+
 #######################
 # Lambda Handler
 #######################
@@ -4740,6 +4598,11 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
             elif method == 'DELETE':
                 return handle_asset_metadata_delete(event)
         
+        # Bulk Metadata Import Route
+        elif '/database/' in path and path.rstrip('/').endswith('/metadata/import') and '/assets/' not in path:
+            if method == 'POST':
+                return handle_metadata_import_post(event)
+        
         # Database Metadata Routes
         elif '/database/' in path and '/metadata' in path and '/assets/' not in path:
             if method == 'GET':
@@ -20,6 +20,7 @@ from common.validators import validate
 from handlers.authz import CasbinEnforcer
 from handlers.auth import request_to_claims
 from customLogging.logger import safeLogger
+from common.metadataSchemaValidation import bump_schema_generation, SCHEMA_GENERATION_ID
 from models.common import APIGatewayProxyResponseV2, internal_error, success, validation_error, general_error, authorization_error, VAMSGeneralErrorResponse
 from models.metadataSchema import (
     GetMetadataSchemaRequestModel, GetMetadataSchemasRequestModel,
@@ -303,6 +304,10 @@ def get_all_metadata_schemas(query_params):
         items = []
         
         for item in response.get('Items', []):
+            # Skip the schema generation counter item
+            if item.get('metadataSchemaId', {}).get('S') == SCHEMA_GENERATION_ID:
+                continue
+            
             # Deserialize the DynamoDB item
             deserialized_document = {k: deserializer.deserialize(v) for k, v in item.items()}
             
@@ -401,6 +406,7 @@ def create_metadata_schema(schema_data, claims_and_roles):
         
         # Save to database
         metadata_schema_table.put_item(Item=schema_item)
+        bump_schema_generation(dynamodb_client, metadata_schema_table_name)
         
         logger.info(f"Created metadata schema {metadata_schema_id} for database {schema_data['databaseId']}")
         
@@ -477,6 +483,7 @@ def update_metadata_schema(metadataSchemaId, update_data, claims_and_roles):
         
         # Save the updated schema
         metadata_schema_table.put_item(Item=schema)
+        bump_schema_generation(dynamodb_client, metadata_schema_table_name)
         
         # Return success response
         return MetadataSchemaOperationResponseModel(
@@ -533,6 +540,7 @@ def delete_metadata_schema(metadataSchemaId, claims_and_roles):
                 'databaseId:metadataEntityType': composite_key
             }
         )
+        bump_schema_generation(dynamodb_client, metadata_schema_table_name)
         
         # Return success response
         now = datetime.utcnow().isoformat()
@@ -10,6 +10,7 @@ import os
 import boto3
 import json
 import re
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple, Set
 from boto3.dynamodb.conditions import Key
@@ -44,6 +45,16 @@ logger = safeLogger(service_name="DualIndexSearch")
 # Global variables for claims and roles
 claims_and_roles = {}
 
+# Duration a container reuses its copy of the database catalog; matches the casbin policy refresh
+# so catalog and authorization changes reach search within the same window
+DATABASE_CATALOG_REFRESH_SECONDS = 60
+
+# Per-container database catalog by show_deleted: (load time, database documents, max databases loaded)
+database_catalog_cache = {}
+
+# Per-container accessible database ids by role set: (catalog load time, database ids)
+database_access_cache = {}
+
 # Load environment variables with error handling
 try:
     asset_storage_table_name = os.environ["ASSET_STORAGE_TABLE_NAME"]
@@ -326,75 +337,109 @@ class DatabaseAccessManager:
             logger.exception(f"Error checking database access: {e}")
             return None
     
+    @staticmethod
+    def _access_cache_key(claims_and_roles: Dict[str, Any], show_deleted: bool) -> Tuple:
+        """Cache key for an accessibility result: the caller's tokens (user and roles) and MFA state"""
+        return (
+            tuple(claims_and_roles.get("tokens", [])),
+            bool(claims_and_roles.get("mfaEnabled", False)),
+            show_deleted,
+        )
+
+    @staticmethod
+    def _load_database_catalog(show_deleted: bool, max_databases: int) -> List[Dict[str, Any]]:
+        """Scan the databases table into a list of database documents"""
+        from boto3.dynamodb.types import TypeDeserializer
+        deserializer = TypeDeserializer()
+
+        # Build scan filter for deleted databases
+        operator = "NOT_CONTAINS" if not show_deleted else "CONTAINS"
+        db_filter = {
+            "databaseId": {
+                "AttributeValueList": [{"S": "#deleted"}],
+                "ComparisonOperator": operator
+            }
+        }
+
+        databases = []
+
+        # Use paginator for efficient scanning of large database tables
+        paginator = dynamodb_client.get_paginator('scan')
+        for page in paginator.paginate(
+            TableName=database_storage_table_name,
+            ScanFilter=db_filter,
+            PaginationConfig={
+                'PageSize': 1000,
+                'MaxItems': max_databases  # Configurable limit
+            }
+        ):
+            for item in page.get('Items', []):
+                try:
+                    databases.append({k: deserializer.deserialize(v) for k, v in item.items()})
+                except Exception as item_error:
+                    logger.warning(f"Error processing database item: {item_error}")
+
+        return databases
+
+    @staticmethod
+    def get_database_catalog(show_deleted: bool = False, max_databases: int = 10000) -> Tuple[float, List[Dict[str, Any]]]:
+        """
+        Get the database catalog, reusing the container's copy for DATABASE_CATALOG_REFRESH_SECONDS.
+
+        Returns:
+            Tuple of (catalog load time, database documents); the load time versions the
+            accessibility results cached against this copy of the catalog
+        """
+        cached = database_catalog_cache.get(show_deleted)
+        now = time.time()
+        if cached and now - cached[0] < DATABASE_CATALOG_REFRESH_SECONDS and cached[2] >= max_databases:
+            return cached[0], cached[1]
+
+        databases = DatabaseAccessManager._load_database_catalog(show_deleted, max_databases)
+        database_catalog_cache[show_deleted] = (now, databases, max_databases)
+        # Accessibility results computed over the previous catalog can no longer be reused
+        for cache_key in [key for key in database_access_cache if key[2] == show_deleted]:
+            database_access_cache.pop(cache_key, None)
+        logger.info(f"Loaded database catalog with {len(databases)} databases")
+        return now, databases
+
     @staticmethod
     def get_accessible_databases(claims_and_roles: Dict[str, Any], show_deleted: bool = False, max_databases: int = 10000) -> List[str]:
-        """Get list of databases accessible to the user with enhanced pagination for large datasets"""
+        """
+        Get list of databases accessible to the user.
+
+        The database catalog and the per role set authorization outcome over it are both cached
+        per container, so repeated searches do not rescan the table or re-run enforcement.
+        """
         try:
-            from boto3.dynamodb.types import TypeDeserializer
-            deserializer = TypeDeserializer()
-            
-            # Build scan filter for deleted databases
-            operator = "NOT_CONTAINS" if not show_deleted else "CONTAINS"
-            db_filter = {
-                "databaseId": {
-                    "AttributeValueList": [{"S": "#deleted"}],
-                    "ComparisonOperator": operator
-                }
-            }
-            
+            if len(claims_and_roles.get("tokens", [])) == 0:
+                return []
+
+            catalog_loaded_at, databases = DatabaseAccessManager.get_database_catalog(show_deleted, max_databases)
+
+            cache_key = DatabaseAccessManager._access_cache_key(claims_and_roles, show_deleted)
+            cached = database_access_cache.get(cache_key)
+            if cached and cached[0] == catalog_loaded_at:
+                return cached[1][:max_databases]
+
             accessible_databases = []
-            processed_count = 0
-            
-            # Use paginator for efficient scanning of large database tables
-            paginator = dynamodb_client.get_paginator('scan')
-            
-            # Process databases in chunks to handle large numbers efficiently
-            for page in paginator.paginate(
-                TableName=database_storage_table_name,
-                ScanFilter=db_filter,
-                PaginationConfig={
-                    'PageSize': 100,  # Smaller page size for better memory management
-                    'MaxItems': max_databases  # Configurable limit
-                }
-            ):
-                items = page.get('Items', [])
-                if not items:
-                    break
-                
-                # Process items in current page
-                for item in items:
-                    try:
-                        deserialized_document = {k: deserializer.deserialize(v) for k, v in item.items()}
-                        
-                        # Add Casbin enforcement
-                        deserialized_document.update({"object__type": "asset"})
-                        if len(claims_and_roles.get("tokens", [])) > 0:
-                            casbin_enforcer = CasbinEnforcer(claims_and_roles)
-                            if casbin_enforcer.enforce(deserialized_document, "GET"):
-                                accessible_databases.append(deserialized_document['databaseId'])
-                        
-                        processed_count += 1
-                        
-                        # Log progress for large datasets
-                        if processed_count % 1000 == 0:
-                            logger.info(f"Processed {processed_count} databases, found {len(accessible_databases)} accessible")
-                        
-                        # Safety check to prevent excessive processing
-                        if len(accessible_databases) >= max_databases:
-                            logger.warning(f"Reached maximum database limit of {max_databases}, stopping scan")
-                            break
-                            
-                    except Exception as item_error:
-                        logger.warning(f"Error processing database item: {item_error}")
-                        continue
-                
-                # Break if we've reached the limit
-                if len(accessible_databases) >= max_databases:
-                    break
-            
-            logger.info(f"Database access scan complete: processed {processed_count} databases, found {len(accessible_databases)} accessible")
-            return accessible_databases
-            
+            casbin_enforcer = CasbinEnforcer(claims_and_roles)
+            for database in databases:
+                try:
+                    # Add Casbin enforcement
+                    database_object = dict(database)
+                    database_object.update({"object__type": "asset"})
+                    if casbin_enforcer.enforce(database_object, "GET"):
+                        accessible_databases.append(database['databaseId'])
+                except Exception as item_error:
+                    logger.warning(f"Error processing database item: {item_error}")
+                    continue
+
+            database_access_cache[cache_key] = (catalog_loaded_at, accessible_databases)
+
+            logger.info(f"Database access check complete: processed {len(databases)} databases, found {len(accessible_databases)} accessible")
+            return accessible_databases[:max_databases]
+
         except Exception as e:
             logger.exception(f"Error getting accessible databases: {e}")
             return []
@@ -0,0 +1,142 @@
+#  Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#  SPDX-License-Identifier: Apache-2.0
+
+import os
+import boto3
+import json
+from common.constants import MAX_DIGEST_FILES
+from customLogging.logger import safeLogger
+
+logger = safeLogger(service="SendEmailDigest")
+dynamodb_client = boto3.client('dynamodb')
+sns_client = boto3.client('sns')
+
+try:
+    asset_table_name = os.environ["ASSET_STORAGE_TABLE_NAME"]
+except:
+    logger.exception("Failed loading environment variables")
+    raise
+
+
+def group_change_events(records):
+    """Group queued change events by asset
+
+    Args:
+        records: SQS records queued by sendEmail
+
+    Returns:
+        Dictionary of (databaseId, assetId) to the asset's message IDs, changed file keys
+        (in order, without duplicates), number of changed files that were not listed and
+        number of change events
+    """
+    changes = {}
+    for record in records:
+        try:
+            body = json.loads(record['body'])
+            key = (body['databaseId'], body['assetId'])
+        except (KeyError, TypeError, json.JSONDecodeError):
+            logger.warning(f"Dropping malformed change event {record.get('messageId')}")
+            continue
+
+        change = changes.setdefault(key, {
+            'messageIds': [], 'fileKeys': {}, 'unlistedFileCount': 0, 'eventCount': 0})
+        change['messageIds'].append(record['messageId'])
+        change['eventCount'] += 1
+        file_keys = body.get('fileKeys') or []
+        for file_key in file_keys:
+            change['fileKeys'][file_key] = None
+        # Senders cap the listed keys, fileCount is the number of files the event changed
+        change['unlistedFileCount'] += max(0, (body.get('fileCount') or 0) - len(file_keys))
+    return changes
+
+
+def build_digest_message(asset_name, currentVersionId, file_keys, event_count, file_count=None):
+    """Build the digest email body for the changes of one asset
+
+    file_count is the number of changed files, which can exceed the listed file keys.
+    """
+    if file_count is None:
+        file_count = len(file_keys)
+    if file_keys:
+        listed_keys = file_keys[:MAX_DIGEST_FILES]
+        listed = "\n".join(f"    - {file_key}" for file_key in listed_keys)
+        if file_count > len(listed_keys):
+            listed += f"\n    - ...and {file_count - len(listed_keys)} more"
+        files_summary = f"Changed files ({file_count}):\n{listed}"
+    else:
+        files_summary = "Changed files: not listed for these changes"
+
+    return f'''
+    Dear Subscriber,
+
+    We are excited to inform you that {event_count} change(s) in the files or asset versions of {asset_name} have occured.
+
+    Current Version Number: {currentVersionId}
+
+    {files_summary}
+
+    Thank you for staying updated!
+
+    Best Regards,
+    VAMS Automated System
+    '''
+
+
+def send_asset_digest(databaseId, assetId, change):
+    """Publish one digest to the asset topic for all of its buffered changes
+
+    Returns:
+        True if the digest was published or there is nothing to publish, False to retry the changes
+    """
+    try:
+        resp = dynamodb_client.query(
+            TableName=asset_table_name,
+            ProjectionExpression='assetId, assetName, snsTopic, description, currentVersionId',
+            KeyConditionExpression='assetId = :asset_id AND databaseId = :database_id',
+            ExpressionAttributeValues={
+                ':asset_id': {'S': assetId},
+                ':database_id': {'S': databaseId}
+            },
+        )
+
+        items = resp.get('Items', [])
+        if not items:
+            logger.warning(f"Asset {databaseId}/{assetId} doesn't exist, dropping {change['eventCount']} change event(s)")
+            return True
+
+        asset_obj = items[0]
+        if not asset_obj.get("snsTopic"):
+            # No subscribers
+            return True
+        topic_name = asset_obj.get("snsTopic").get("S")
+        asset_name = asset_obj.get("assetName").get("S")
+        currentVersionId = asset_obj.get("currentVersionId", {}).get("S", "")
+
+        file_keys = list(change['fileKeys'])
+        file_count = len(file_keys) + change.get('unlistedFileCount', 0)
+        sns_client.publish(
+            TopicArn=topic_name,
+            Message=build_digest_message(asset_name, currentVersionId, file_keys, change['eventCount'], file_count),
+            Subject=f'[{asset_name}] - File or Asset Changed ({currentVersionId})'
+        )
+        logger.info(f"Sent digest of {change['eventCount']} change event(s) for asset {assetId}")
+        return True
+    except Exception as e:
+        logger.exception(e)
+        return False
+
+
+def lambda_handler(event, context):
+    """Publish one notification per asset for the change events of an SQS batch
+
+    Changes of assets whose digest could not be sent are reported as batch item failures
+    so that only they are retried.
+    """
+    changes = group_change_events(event.get('Records', []))
+
+    batch_item_failures = []
+    for (databaseId, assetId), change in changes.items():
+        if not send_asset_digest(databaseId, assetId, change):
+            batch_item_failures.extend({'itemIdentifier': message_id} for message_id in change['messageIds'])
+
+    return {'batchItemFailures': batch_item_failures}
@@ -88,6 +88,11 @@ def lambda_handler(event, context):
             'assetId': {
                 'value': event['body']['assetId'],
                 'validator': 'ASSET_ID'
+            },
+            'databaseId': {
+                'value': event['body'].get('databaseId', ''),
+                'validator': 'ID',
+                'optional': True
             }
         })
 
@@ -100,7 +105,12 @@ def lambda_handler(event, context):
         claims_and_roles = request_to_claims(event)
         method_allowed_on_api = False
 
-        asset_object = get_asset_object_from_id(None, event['body']["assetId"])
+        # Keyed asset lookup when the caller provides the databaseId
+        asset_object = None
+        if event['body'].get('databaseId'):
+            asset_object = get_asset_object_from_id(event['body']['databaseId'], event['body']["assetId"])
+        if not asset_object:
+            asset_object = get_asset_object_from_id(None, event['body']["assetId"])
         asset_object.update({"object__type": "asset"})
         if len(claims_and_roles["tokens"]) > 0:
             casbin_enforcer = CasbinEnforcer(claims_and_roles)
@@ -2,6 +2,7 @@
 #  SPDX-License-Identifier: Apache-2.0
 
 import os
+import time
 import boto3
 import json
 
@@ -34,6 +35,10 @@ ALLOWED_ENTITY_NAMES = [
     'Asset'
 ]
 
+# BatchGetItem limits
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 5
+
 def validate_subscription_fields(body):
     """Validate subscription fields against allowed values"""
     
@@ -57,22 +62,56 @@ except:
         {"message": "Failed Loading Environment Variables"})
 
 
-def get_name_for_asset_ids(asset_ids):
-    #TODO: Implement paginiation but should be auto-limited by the amount of records (implementing pagination) returned by the function calling this
-    if not asset_ids:
-        return {}
-    # TODO: Check if we can optimize this further
-    filter_expression = " OR ".join([f"assetId = :id{i}" for i, asset_id in enumerate(asset_ids, 1)])
+def get_asset(asset_id, database_id=None):
+    """Get the asset record for a subscription entity
 
-    expression_attribute_values = {f":id{i}": {"S": asset_id} for i, asset_id in enumerate(asset_ids, 1)}
+    Uses a keyed lookup when the databaseId is known (carried on the subscription record or request)
+    and only resolves the databaseId from the assetId for records that predate it or moved databases.
+    """
+    asset_object = None
+    if database_id:
+        asset_object = get_asset_object_from_id(database_id, asset_id)
 
-    items = dynamodb_client.scan(
-        TableName=asset_table_name,
-        ProjectionExpression='assetId, assetName, databaseId',
-        FilterExpression=filter_expression,
-        ExpressionAttributeValues=expression_attribute_values,
-    )
-    return {item['assetId']['S']: {"assetName": item['assetName']['S'], "databaseId": item['databaseId']['S']} for item in items.get("Items", [])}
+    if not asset_object:
+        resolved_database_id = get_asset_object_from_id(None, asset_id).get("databaseId")
+        if resolved_database_id and resolved_database_id != database_id:
+            asset_object = get_asset_object_from_id(resolved_database_id, asset_id)
+
+    return asset_object
+
+
+def get_assets_for_keys(asset_keys):
+    """Get asset records for (databaseId, assetId) pairs with BatchGetItem
+
+    Returns:
+        Dictionary of asset records keyed by (databaseId, assetId); pairs not found are omitted
+    """
+    deserializer = TypeDeserializer()
+    assets = {}
+    asset_keys = list(asset_keys)
+
+    for i in range(0, len(asset_keys), BATCH_GET_MAX_KEYS):
+        request_items = {
+            asset_table_name: {
+                'Keys': [{'databaseId': {'S': database_id}, 'assetId': {'S': asset_id}}
+                         for database_id, asset_id in asset_keys[i:i + BATCH_GET_MAX_KEYS]]
+            }
+        }
+        attempt = 0
+        while request_items:
+            resp = dynamodb_client.batch_get_item(RequestItems=request_items)
+            for item in resp.get('Responses', {}).get(asset_table_name, []):
+                asset = {k: deserializer.deserialize(v) for k, v in item.items()}
+                assets[(asset['databaseId'], asset['assetId'])] = asset
+            request_items = resp.get('UnprocessedKeys') or {}
+            if request_items:
+                attempt += 1
+                if attempt > BATCH_GET_MAX_RETRIES:
+                    logger.warning("Unprocessed keys remaining after retries, resolving them individually")
+                    break
+                time.sleep(min(0.05 * (2 ** attempt), 1))
+
+    return assets
 
 
 def get_subscriptions(query_params):
@@ -89,44 +128,49 @@ def get_subscriptions(query_params):
         }
     ).build_full_result()
 
-    output_objects = []
-    unique_asset_entity_ids = set()
+    subscriptions = []
     for obj in page_iterator.get('Items', []):
         deserialized_document = {k: deserializer.deserialize(v) for k, v in obj.items()}
         entity_name, entity_id = deserialized_document["entityName_entityId"].split("#")
-        output_obj = {
+        subscriptions.append({
             "eventName": deserialized_document["eventName"],
             "entityName": entity_name,
             "entityId": entity_id,
-            "subscribers": deserialized_document["subscribers"]
-        }
+            "subscribers": deserialized_document["subscribers"],
+            "databaseId": deserialized_document.get("databaseId")
+        })
 
-        # Add Casbin Enforcer to check if the user has access to GET subscription of specific Assets
-        asset_object = get_asset_object_from_id(None, entity_id)
-        asset_object.update({"object__type": "asset"})
-        if len(claims_and_roles["tokens"]) > 0:
-            casbin_enforcer = CasbinEnforcer(claims_and_roles)
-            if casbin_enforcer.enforce(asset_object, "GET"):
-                output_objects.append(output_obj)
-                if entity_name == "Asset":
-                    unique_asset_entity_ids.add(entity_id)
+    # Resolve all subscribed assets with batched keyed reads; records without a (current) databaseId
+    # fall back to a per-asset lookup
+    asset_keys = {(obj["databaseId"], obj["entityId"]) for obj in subscriptions
+                  if obj["entityName"] == "Asset" and obj["databaseId"]}
+    assets = get_assets_for_keys(asset_keys)
+    resolved_assets = {}
+
+    casbin_enforcer = CasbinEnforcer(claims_and_roles) if len(claims_and_roles["tokens"]) > 0 else None
 
     result = {
         "Items": []
     }
 
-    assets_with_name = get_name_for_asset_ids(list(unique_asset_entity_ids))
-    result["Items"] = [
-        {
-            "eventName": obj["eventName"],
-            "entityName": obj["entityName"],
-            "entityId": obj["entityId"],
-            "subscribers": obj["subscribers"],
-            "entityValue": assets_with_name[obj["entityId"]]["assetName"] if obj["entityId"] in assets_with_name else None,
-            "databaseId": assets_with_name[obj["entityId"]]["databaseId"] if obj["entityId"] in assets_with_name else None
-        }
-        for obj in output_objects
-    ]
+    for obj in subscriptions:
+        asset_object = assets.get((obj["databaseId"], obj["entityId"]))
+        if not asset_object:
+            if obj["entityId"] not in resolved_assets:
+                resolved_assets[obj["entityId"]] = get_asset(obj["entityId"])
+            asset_object = resolved_assets[obj["entityId"]] or {"assetId": obj["entityId"]}
+
+        # Add Casbin Enforcer to check if the user has access to GET subscription of specific Assets
+        asset_object.update({"object__type": "asset"})
+        if casbin_enforcer and casbin_enforcer.enforce(asset_object, "GET"):
+            result["Items"].append({
+                "eventName": obj["eventName"],
+                "entityName": obj["entityName"],
+                "entityId": obj["entityId"],
+                "subscribers": obj["subscribers"],
+                "entityValue": asset_object.get("assetName") if obj["entityName"] == "Asset" else None,
+                "databaseId": asset_object.get("databaseId") if obj["entityName"] == "Asset" else None
+            })
 
     if 'NextToken' in page_iterator:
         result['NextToken'] = page_iterator['NextToken']
@@ -159,26 +203,9 @@ def add_sns_topic_in_asset(asset_id, database_id, sns_topic):
     )
 
 
-def get_asset(asset_id):
-    resp = dynamodb_client.scan(
-        TableName=asset_table_name,
-        ProjectionExpression='snsTopic, databaseId',
-        FilterExpression='assetId = :asset_id',
-        ExpressionAttributeValues={':asset_id': {'S': asset_id}},
-    )
-
-    items = resp.get('Items')
-    if items:
-        asset_obj = {"databaseId": items[0].get('databaseId').get("S")}
-        if items[0].get('snsTopic'):
-            asset_obj["snsTopic"] = items[0].get('snsTopic').get("S")
-        return asset_obj
-    return None
-
-
-def delete_sns_subscriptions(asset_id, subscribers, delete_sns=False):
+def delete_sns_subscriptions(asset_obj, subscribers, delete_sns=False):
     asset_table = dynamodb.Table(asset_table_name)
-    asset_obj = get_asset(asset_id)
+    asset_id = asset_obj["assetId"]
 
     if not asset_obj.get("snsTopic"):
         logger.error(f"No topic found for asset {asset_id}")
@@ -201,8 +228,8 @@ def delete_sns_subscriptions(asset_id, subscribers, delete_sns=False):
     return
 
 
-def create_sns_subscriptions(asset_id, emails):
-    asset_obj = get_asset(asset_id)
+def create_sns_subscriptions(asset_obj, emails):
+    asset_id = asset_obj["assetId"]
     asset_sns_topic = asset_obj.get("snsTopic")
 
     if not asset_sns_topic:
@@ -228,6 +255,16 @@ def get_subscription_obj(event_name, entity_name, entity_id):
     return resp.get('Item')
 
 
+def get_subscription_keys(asset_obj):
+    """Keyed attributes stored on asset subscription records (databaseId for keyed asset reads, assetId for assetIdGSI)"""
+    if not asset_obj:
+        return {}
+    return {
+        'databaseId': asset_obj["databaseId"],
+        'assetId': asset_obj["assetId"]
+    }
+
+
 def get_userProfile_Email(userId):
 
     #Try to get user email information
@@ -260,7 +297,26 @@ def get_userProfile_Email(userId):
     return email
 
 
-def create_subscription(body):
+def update_subscription_subscribers(body, subscribers, asset_obj):
+    """Set the subscribers of a subscription record, backfilling its keyed asset attributes"""
+    subscription_table = dynamodb.Table(subscription_table_name)
+    update_expression = 'SET subscribers = :subscribers'
+    expression_attribute_values = {':subscribers': subscribers}
+    for attribute_name, value in get_subscription_keys(asset_obj).items():
+        update_expression += f', {attribute_name} = :{attribute_name}'
+        expression_attribute_values[f':{attribute_name}'] = value
+
+    subscription_table.update_item(
+        Key={
+            'eventName': body["eventName"],
+            'entityName_entityId': f'{body["entityName"]}#{body["entityId"]}'
+        },
+        UpdateExpression=update_expression,
+        ExpressionAttributeValues=expression_attribute_values
+    )
+
+
+def create_subscription(body, asset_obj=None):
     response = STANDARD_JSON_RESPONSE
     subscription_table = dynamodb.Table(subscription_table_name)
     
@@ -290,13 +346,14 @@ def create_subscription(body):
             Item={
                 'eventName': body["eventName"],
                 'entityName_entityId': f'{body["entityName"]}#{body["entityId"]}',
-                'subscribers': body["subscribers"]
+                'subscribers': body["subscribers"],
+                **get_subscription_keys(asset_obj)
             }
         )
 
         if body["entityName"] == "Asset":
             logger.info("creating subscription")
-            create_sns_subscriptions(body["entityId"], emails)
+            create_sns_subscriptions(asset_obj, emails)
 
     else:
         existing_subscribers = [item["S"] for item in items["subscribers"]['L']]
@@ -306,25 +363,16 @@ def create_subscription(body):
             return response
         else:
             if body["entityName"] == "Asset":
-                create_sns_subscriptions(body["entityId"], emails)
-
-            subscription_table.update_item(
-                Key={
-                    'eventName': body["eventName"],
-                    'entityName_entityId': f'{body["entityName"]}#{body["entityId"]}'
-                },
-                UpdateExpression='SET subscribers = :subscribers',
-                ExpressionAttributeValues={
-                    ':subscribers': existing_subscribers + body["subscribers"]
-                }
-            )
+                create_sns_subscriptions(asset_obj, emails)
+
+            update_subscription_subscribers(body, existing_subscribers + body["subscribers"], asset_obj)
 
     response['statusCode'] = 200
     response['body'] = json.dumps({"message": "success"})
     return response
 
 
-def update_subscription(body):
+def update_subscription(body, asset_obj=None):
     response = STANDARD_JSON_RESPONSE
     subscription_table = dynamodb.Table(subscription_table_name)
     
@@ -368,27 +416,18 @@ def update_subscription(body):
         else:
             emailsDeleted.append(email)
 
-    subscription_table.update_item(
-        Key={
-            'eventName': body["eventName"],
-            'entityName_entityId': f'{body["entityName"]}#{body["entityId"]}'
-        },
-        UpdateExpression='SET subscribers = :subscribers',
-        ExpressionAttributeValues={
-            ':subscribers': body["subscribers"]
-        }
-    )
+    update_subscription_subscribers(body, body["subscribers"], asset_obj)
 
     if body["entityName"] == "Asset":
-        create_sns_subscriptions(body["entityId"], list(emailsAdded))
-        delete_sns_subscriptions(body["entityId"], list(emailsDeleted), delete_sns=False)
+        create_sns_subscriptions(asset_obj, list(emailsAdded))
+        delete_sns_subscriptions(asset_obj, list(emailsDeleted), delete_sns=False)
 
     response['statusCode'] = 200
     response['body'] = json.dumps({"message": "success"})
     return response
 
 
-def delete_subscription(body):
+def delete_subscription(body, asset_obj=None):
     response = STANDARD_JSON_RESPONSE
     subscription_table = dynamodb.Table(subscription_table_name)
     try:
@@ -410,7 +449,7 @@ def delete_subscription(body):
 
 
     if body["entityName"] == "Asset":
-        delete_sns_subscriptions(body["entityId"], None, delete_sns=True)
+        delete_sns_subscriptions(asset_obj, None, delete_sns=True)
 
     response['statusCode'] = 200
     response['body'] = json.dumps({"message": "success"})
@@ -477,6 +516,11 @@ def lambda_handler(event, context):
             'subscribers': {
                 'value': event['body']['subscribers'],
                 'validator': 'USERID_ARRAY'
+            },
+            'databaseId': {
+                'value': event['body'].get('databaseId', ''),
+                'validator': 'ID',
+                'optional': True
             }
         })
 
@@ -487,7 +531,19 @@ def lambda_handler(event, context):
 
         if event['body']["entityName"] == "Asset":
             allowed = False
-            asset_object = get_asset_object_from_id(None, event['body']["entityId"])
+
+            # Use the request or existing subscription record's databaseId for a keyed asset lookup
+            database_id = event['body'].get('databaseId')
+            if not database_id:
+                existing_subscription = get_subscription_obj(event['body']["eventName"], event['body']["entityName"], event['body']["entityId"])
+                if existing_subscription and existing_subscription.get('databaseId'):
+                    database_id = existing_subscription['databaseId']['S']
+
+            asset_object = get_asset(event['body']["entityId"], database_id)
+            if not asset_object:
+                response['statusCode'] = 400
+                response['body'] = json.dumps({"message": "Asset doesn't exist."})
+                return response
             asset_object.update({"object__type": "asset"})
 
             if len(claims_and_roles["tokens"]) > 0:
@@ -497,11 +553,11 @@ def lambda_handler(event, context):
                     allowed = True
 
             if allowed and httpMethod == 'POST':
-                return create_subscription(event['body'])
+                return create_subscription(event['body'], asset_object)
             elif allowed and httpMethod == 'PUT':
-                return update_subscription(event['body'])
+                return update_subscription(event['body'], asset_object)
             elif allowed and httpMethod == 'DELETE':
-                return delete_subscription(event['body'])
+                return delete_subscription(event['body'], asset_object)
             else:
                 response['statusCode'] = 403
                 response['body'] = json.dumps({"message": "Not Authorized"})
@@ -27,26 +27,27 @@ except:
     main_rest_response['body']['message'] = "Failed Loading Environment Variables"
 
 
-def get_asset(asset_id):
-    resp = dynamodb_client.scan(
-        TableName=asset_table_name,
-        ProjectionExpression='snsTopic, databaseId',
-        FilterExpression='assetId = :asset_id',
-        ExpressionAttributeValues={':asset_id': {'S': asset_id}},
-    )
+def get_asset(asset_id, database_id=None):
+    """Get the asset record for a subscription entity
+
+    Uses a keyed lookup when the databaseId is known (carried on the subscription record or request)
+    and only resolves the databaseId from the assetId for records that predate it or moved databases.
+    """
+    asset_object = None
+    if database_id:
+        asset_object = get_asset_object_from_id(database_id, asset_id)
 
-    items = resp.get('Items')
-    if items:
-        asset_obj = {"databaseId": items[0].get('databaseId').get("S")}
-        if items[0].get('snsTopic'):
-            asset_obj["snsTopic"] = items[0].get('snsTopic').get("S")
-        return asset_obj
-    return None
+    if not asset_object:
+        resolved_database_id = get_asset_object_from_id(None, asset_id).get("databaseId")
+        if resolved_database_id and resolved_database_id != database_id:
+            asset_object = get_asset_object_from_id(resolved_database_id, asset_id)
 
+    return asset_object
 
-def delete_sns_subscriptions(asset_id, subscribers, delete_sns=False):
+
+def delete_sns_subscriptions(asset_obj, subscribers, delete_sns=False):
     asset_table = dynamodb.Table(asset_table_name)
-    asset_obj = get_asset(asset_id)
+    asset_id = asset_obj["assetId"]
 
     if not asset_obj.get("snsTopic"):
         logger.error(f"No topic found for asset {asset_id}")
@@ -78,10 +79,9 @@ def get_subscription_obj(event_name, entity_name, entity_id):
     return resp.get('Item')
 
 
-def delete_subscription(body):
+def delete_subscription(body, items, asset_obj):
     response = STANDARD_JSON_RESPONSE
     subscription_table = dynamodb.Table(subscription_table_name)
-    items = get_subscription_obj(body["eventName"], body["entityName"], body["entityId"])
 
     if not items or body["subscribers"][0] not in [item["S"] for item in items["subscribers"]['L']]:
         response['statusCode'] = 400
@@ -91,19 +91,22 @@ def delete_subscription(body):
     existing_subscribers = [item["S"] for item in items["subscribers"]['L']]
     existing_subscribers.remove(body["subscribers"][0])
 
+    # Backfill the keyed asset attributes (databaseId, assetId for assetIdGSI) on records that predate them
     subscription_table.update_item(
         Key={
             'eventName': body["eventName"],
             'entityName_entityId': f'{body["entityName"]}#{body["entityId"]}'
         },
-        UpdateExpression='SET subscribers = :subscribers',
+        UpdateExpression='SET subscribers = :subscribers, databaseId = :databaseId, assetId = :assetId',
         ExpressionAttributeValues={
-            ':subscribers': existing_subscribers
+            ':subscribers': existing_subscribers,
+            ':databaseId': asset_obj["databaseId"],
+            ':assetId': asset_obj["assetId"]
         }
     )
 
     if body["entityName"] == "Asset":
-        delete_sns_subscriptions(body["entityId"], list(body["subscribers"]), delete_sns=False)
+        delete_sns_subscriptions(asset_obj, list(body["subscribers"]), delete_sns=False)
 
     response['statusCode'] = 200
     response['body'] = json.dumps({"message": "success"})
@@ -148,6 +151,11 @@ def lambda_handler(event, context):
             'subscribers': {
                 'value': event['body']['subscribers'],
                 'validator': 'USERID_ARRAY'
+            },
+            'databaseId': {
+                'value': event['body'].get('databaseId', ''),
+                'validator': 'ID',
+                'optional': True
             }
         })
 
@@ -160,7 +168,17 @@ def lambda_handler(event, context):
         claims_and_roles = request_to_claims(event)
         method_allowed_on_api = False
 
-        asset_object = get_asset_object_from_id(None, event['body']["entityId"])
+        # Use the request or subscription record's databaseId for a keyed asset lookup
+        items = get_subscription_obj(event['body']["eventName"], event['body']["entityName"], event['body']["entityId"])
+        database_id = event['body'].get('databaseId')
+        if not database_id and items and items.get('databaseId'):
+            database_id = items['databaseId']['S']
+
+        asset_object = get_asset(event['body']["entityId"], database_id)
+        if not asset_object:
+            response['statusCode'] = 400
+            response['body'] = json.dumps({"message": "Asset doesn't exist."})
+            return response
         asset_object.update({"object__type": "asset"})
         if len(claims_and_roles["tokens"]) > 0:
             casbin_enforcer = CasbinEnforcer(claims_and_roles)
@@ -169,7 +187,7 @@ def lambda_handler(event, context):
                 method_allowed_on_api = True
 
         if method_allowed_on_api and httpMethod == 'DELETE':
-            return delete_subscription(event['body'])
+            return delete_subscription(event['body'], items, asset_object)
         else:
             response['statusCode'] = 403
             response['body'] = json.dumps({"message": "Not Authorized"})
@@ -10,6 +10,7 @@ from aws_lambda_powertools.utilities.parser import parse, ValidationError
 from botocore.config import Config
 
 from common.constants import STANDARD_JSON_RESPONSE
+from common.tagCatalog import bump_tag_catalog_generation
 from handlers.auth import request_to_claims
 from handlers.authz import CasbinEnforcer
 from customLogging.logger import safeLogger
@@ -31,6 +32,7 @@ from models.tag import (
 # Configure retry
 retry_config = Config(retries={'max_attempts': 5, 'mode': 'adaptive'})
 dynamodb = boto3.resource('dynamodb', config=retry_config)
+dynamodb_client = boto3.client('dynamodb', config=retry_config)
 logger = safeLogger(service_name="CreateTagType")
 
 # Global variables
@@ -88,6 +90,7 @@ def create_tag_type(request_model: CreateTagTypeRequestModel, claims_and_roles:
             Item=item,
             ConditionExpression="attribute_not_exists(tagTypeName)"
         )
+        bump_tag_catalog_generation(dynamodb_client, tag_type_table_name)
         
         logger.info(f"Created tag type: {request_model.tagTypeName}")
         
@@ -146,6 +149,7 @@ def update_tag_type(request_model: UpdateTagTypeRequestModel, claims_and_roles:
             },
             ConditionExpression='attribute_exists(tagTypeName)'
         )
+        bump_tag_catalog_generation(dynamodb_client, tag_type_table_name)
         
         logger.info(f"Updated tag type: {request_model.tagTypeName}")
         
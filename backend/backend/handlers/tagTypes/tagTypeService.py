@@ -6,7 +6,6 @@ import boto3
 import json
 from datetime import datetime
 from boto3.dynamodb.conditions import Key
-from boto3.dynamodb.types import TypeDeserializer
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import parse, ValidationError
 from botocore.config import Config
@@ -16,6 +15,7 @@ from handlers.authz import CasbinEnforcer
 from customLogging.logger import safeLogger
 from common.dynamodb import validate_pagination_info
 from common.constants import STANDARD_JSON_RESPONSE
+from common.tagCatalog import get_tag_catalog, paginate_catalog_items, bump_tag_catalog_generation, TAG_TYPE_NAME_INDEX
 from models.common import (
     APIGatewayProxyResponseV2,
     success,
@@ -71,74 +71,16 @@ def get_tag_types(query_params: dict, claims_and_roles: dict) -> dict:
         VAMSGeneralErrorResponse: If retrieval fails
     """
     try:
-        deserializer = TypeDeserializer()
-        paginator = dynamodb_client.get_paginator('scan')
+        # Tag types are served from the cached tag catalog, already joined with their tags
+        catalog = get_tag_catalog(dynamodb_client, tag_table_name, tag_type_table_name)
+        page = paginate_catalog_items(catalog.tag_types, catalog.tag_type_names, query_params)
         
-        # Get tag types with pagination
-        page_iterator_tag_types = paginator.paginate(
-            TableName=tag_type_table_name,
-            PaginationConfig={
-                'MaxItems': int(query_params['maxItems']),
-                'PageSize': int(query_params['pageSize']),
-                'StartingToken': query_params.get('startingToken')
-            }
-        ).build_full_result()
-        
-        # Get all tags (no pagination needed for tags lookup)
-        raw_tag_items = []
-        page_iterator_tags = paginator.paginate(
-            TableName=tag_table_name,
-            PaginationConfig={
-                'MaxItems': 1000,
-                'PageSize': 1000,
-            }
-        ).build_full_result()
-        
-        if len(page_iterator_tags.get("Items", [])) > 0:
-            raw_tag_items.extend(page_iterator_tags["Items"])
-            
-            # Continue fetching if there are more tags
-            while "NextToken" in page_iterator_tags:
-                page_iterator_tags = paginator.paginate(
-                    TableName=tag_table_name,
-                    PaginationConfig={
-                        'MaxItems': 1000,
-                        'PageSize': 1000,
-                        'StartingToken': page_iterator_tags["NextToken"]
-                    }
-                ).build_full_result()
-                if len(page_iterator_tags.get("Items", [])) > 0:
-                    raw_tag_items.extend(page_iterator_tags["Items"])
-        
-        # Deserialize and organize tags by tag type
-        formatted_tag_results = {}
-        for tag in raw_tag_items:
-            deserialized_tag = {k: deserializer.deserialize(v) for k, v in tag.items()}
-            tag_name = deserialized_tag.get("tagName")
-            tag_type_name = deserialized_tag.get("tagTypeName")
-            
-            if tag_type_name and tag_name:
-                if tag_type_name not in formatted_tag_results:
-                    formatted_tag_results[tag_type_name] = [tag_name]
-                else:
-                    formatted_tag_results[tag_type_name].append(tag_name)
-        
-        # Process tag types and check authorization
+        # Check authorization
         formatted_tag_type_results = []
-        for tag_type_item in page_iterator_tag_types.get("Items", []):
-            deserialized_tag_type = {k: deserializer.deserialize(v) for k, v in tag_type_item.items()}
-            
-            tag_type = {
-                "tagTypeName": deserialized_tag_type.get("tagTypeName"),
-                "description": deserialized_tag_type.get("description"),
-                "required": deserialized_tag_type.get("required", "False"),
-                "tags": formatted_tag_results.get(deserialized_tag_type.get("tagTypeName"), [])
-            }
-            
-            # Check authorization
+        casbin_enforcer = CasbinEnforcer(claims_and_roles) if len(claims_and_roles["tokens"]) > 0 else None
+        for tag_type in page["Items"]:
             tag_type.update({"object__type": "tagType"})
-            if len(claims_and_roles["tokens"]) > 0:
-                casbin_enforcer = CasbinEnforcer(claims_and_roles)
+            if casbin_enforcer:
                 if casbin_enforcer.enforce(tag_type, "GET"):
                     # Remove object__type before adding to results
                     tag_type.pop("object__type", None)
@@ -150,11 +92,13 @@ def get_tag_types(query_params: dict, claims_and_roles: dict) -> dict:
         
         # Build response
         result = {"Items": formatted_tag_type_results}
-        if 'NextToken' in page_iterator_tag_types:
-            result['NextToken'] = page_iterator_tag_types['NextToken']
+        if 'NextToken' in page:
+            result['NextToken'] = page['NextToken']
         
         return result
         
+    except VAMSGeneralErrorResponse:
+        raise
     except Exception as e:
         logger.exception(f"Error getting tag types: {e}")
         raise VAMSGeneralErrorResponse(f"Error retrieving tag types: {str(e)}")
@@ -181,13 +125,16 @@ def delete_tag_type(tag_type_name: str, claims_and_roles: dict) -> TagTypeOperat
             raise VAMSGeneralErrorResponse("Tag type not found", status_code=404)
         
         # Check if tag type is in use by any tags
-        tag_results = tag_table.scan().get('Items', [])
-        for tag in tag_results:
-            if tag.get("tagTypeName") == tag_type_name:
-                raise VAMSGeneralErrorResponse(
-                    "Cannot delete tag type that is currently in use by a tag",
-                    status_code=400
-                )
+        tags_of_type = tag_table.query(
+            IndexName=TAG_TYPE_NAME_INDEX,
+            KeyConditionExpression=Key('tagTypeName').eq(tag_type_name),
+            Limit=1
+        )
+        if tags_of_type.get('Items'):
+            raise VAMSGeneralErrorResponse(
+                "Cannot delete tag type that is currently in use by a tag",
+                status_code=400
+            )
         
         # Check authorization
         tag_type.update({"object__type": "tagType"})
@@ -202,6 +149,7 @@ def delete_tag_type(tag_type_name: str, claims_and_roles: dict) -> TagTypeOperat
             Key={'tagTypeName': tag_type_name},
             ConditionExpression='attribute_exists(tagTypeName)'
         )
+        bump_tag_catalog_generation(dynamodb_client, tag_type_table_name)
         
         # Return success response
         timestamp = datetime.utcnow().isoformat()
@@ -11,6 +11,7 @@ from botocore.config import Config
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import parse, ValidationError
 from common.constants import STANDARD_JSON_RESPONSE
+from common.tagCatalog import bump_tag_catalog_generation
 from common.validators import validate
 from handlers.authz import CasbinEnforcer
 from handlers.auth import request_to_claims
@@ -29,6 +30,7 @@ retry_config = Config(
 )
 
 dynamodb = boto3.resource('dynamodb', config=retry_config)
+dynamodb_client = boto3.client('dynamodb', config=retry_config)
 logger = safeLogger(service_name="CreateTag")
 
 # Global variables for claims and roles
@@ -108,6 +110,7 @@ def create_tag(tag_data, claims_and_roles):
             },
             ConditionExpression='attribute_not_exists(tagName)'
         )
+        bump_tag_catalog_generation(dynamodb_client, tag_type_db_table_name)
         
         # Return success response
         now = datetime.utcnow().isoformat()
@@ -188,6 +191,7 @@ def update_tag(tag_data, claims_and_roles):
             },
             ConditionExpression='attribute_exists(tagName)'
         )
+        bump_tag_catalog_generation(dynamodb_client, tag_type_db_table_name)
         
         # Return success response
         now = datetime.utcnow().isoformat()
@@ -7,8 +7,6 @@ import os
 import boto3
 import json
 from datetime import datetime
-from boto3.dynamodb.conditions import Key
-from boto3.dynamodb.types import TypeDeserializer
 from botocore.config import Config
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from aws_lambda_powertools.utilities.parser import parse, ValidationError
@@ -18,6 +16,7 @@ from customLogging.logger import safeLogger
 from common.validators import validate
 from common.dynamodb import validate_pagination_info
 from common.constants import STANDARD_JSON_RESPONSE
+from common.tagCatalog import get_tag_catalog, paginate_catalog_items, bump_tag_catalog_generation
 from models.common import APIGatewayProxyResponseV2, internal_error, success, validation_error, general_error, authorization_error, VAMSGeneralErrorResponse
 from models.tag import (
     GetTagsRequestModel, TagResponseModel, TagOperationResponseModel
@@ -38,9 +37,6 @@ logger = safeLogger(service_name="TagService")
 # Global variables for claims and roles
 claims_and_roles = {}
 
-deserializer = TypeDeserializer()
-paginator = dynamodb_client.get_paginator('scan')
-
 # Load environment variables with error handling
 try:
     tag_db_table_name = os.environ["TAGS_STORAGE_TABLE_NAME"]
@@ -57,56 +53,12 @@ tag_type_table = dynamodb.Table(tag_type_db_table_name)
 # Business Logic Functions
 #######################
 
-def get_tag_types():
-    """Get all tag types from DynamoDB
-    
-    Returns:
-        List of tag type dictionaries with tagTypeName and required fields
-    """
-    try:
-        raw_tag_type_items = []
-        page_iterator_tag_types = paginator.paginate(
-            TableName=tag_type_db_table_name,
-            PaginationConfig={
-                'MaxItems': 1000,
-                'PageSize': 1000,
-            }
-        ).build_full_result()
-        
-        if len(page_iterator_tag_types["Items"]) > 0:
-            raw_tag_type_items.extend(page_iterator_tag_types["Items"])
-            while "NextToken" in page_iterator_tag_types:
-                page_iterator_tag_types = paginator.paginate(
-                    TableName=tag_type_db_table_name,
-                    PaginationConfig={
-                        'MaxItems': 1000,
-                        'PageSize': 1000,
-                        'StartingToken': page_iterator_tag_types["NextToken"]
-                    }
-                ).build_full_result()
-                if len(page_iterator_tag_types["Items"]) > 0:
-                    raw_tag_type_items.extend(page_iterator_tag_types["Items"])
-        
-        tag_type_results = []
-        for tag_type_result in raw_tag_type_items:
-            deserialized_document = {k: deserializer.deserialize(v) for k, v in tag_type_result.items()}
-            
-            tag_type = {
-                "tagTypeName": deserialized_document["tagTypeName"],
-                "required": deserialized_document.get("required", "False"),
-            }
-            
-            tag_type_results.append(tag_type)
-        
-        return tag_type_results
-        
-    except Exception as e:
-        logger.exception(f"Error getting tag types: {e}")
-        raise VAMSGeneralErrorResponse("Error retrieving tag types")
-
 def get_tags(query_params):
     """Get all tags with pagination and authorization filtering
     
+    Tags are served from the cached tag catalog, which already carries the "[R]"
+    designation of tags whose tag type is required.
+    
     Args:
         query_params: Dictionary with pagination parameters (maxItems, pageSize, startingToken)
         
@@ -114,42 +66,22 @@ def get_tags(query_params):
         Dictionary with Items and optional NextToken
     """
     try:
-        # Get tag types for required tags designation
-        tag_types = get_tag_types()
-        
-        # Query tags with pagination
-        page_iterator_tags = paginator.paginate(
-            TableName=tag_db_table_name,
-            PaginationConfig={
-                'MaxItems': int(query_params['maxItems']),
-                'PageSize': int(query_params['pageSize']),
-                'StartingToken': query_params.get('startingToken')
-            }
-        ).build_full_result()
+        catalog = get_tag_catalog(dynamodb_client, tag_db_table_name, tag_type_db_table_name)
+        page = paginate_catalog_items(catalog.display_tags, catalog.tag_names, query_params)
         
         authorized_tags = []
+        casbin_enforcer = CasbinEnforcer(claims_and_roles) if len(claims_and_roles["tokens"]) > 0 else None
         
-        for tag in page_iterator_tags["Items"]:
-            deserialized_document = {k: deserializer.deserialize(v) for k, v in tag.items()}
-            
-            # For each tag type coming back from tags, add "[R]" to the end if it matches to a required tag type
-            for tag_type in tag_types:
-                if deserialized_document["tagTypeName"] == tag_type["tagTypeName"]:
-                    if tag_type["required"] == "True":
-                        deserialized_document["tagTypeName"] = deserialized_document["tagTypeName"] + " [R]"
-                    break
-            
+        for tag in page["Items"]:
             # Add Casbin Enforcer to check if the current user has permissions to GET the Tag
-            deserialized_document.update({"object__type": "tag"})
+            tag.update({"object__type": "tag"})
             
-            if len(claims_and_roles["tokens"]) > 0:
-                casbin_enforcer = CasbinEnforcer(claims_and_roles)
-                if casbin_enforcer.enforce(deserialized_document, "GET"):
-                    authorized_tags.append(deserialized_document)
+            if casbin_enforcer and casbin_enforcer.enforce(tag, "GET"):
+                authorized_tags.append(tag)
         
         result = {"Items": authorized_tags}
-        if 'NextToken' in page_iterator_tags:
-            result['NextToken'] = page_iterator_tags['NextToken']
+        if 'NextToken' in page:
+            result['NextToken'] = page['NextToken']
         
         return result
         
@@ -202,6 +134,7 @@ def delete_tag(tag_name, claims_and_roles):
             Key={'tagName': tag_name},
             ConditionExpression='attribute_exists(tagName)'
         )
+        bump_tag_catalog_generation(dynamodb_client, tag_type_db_table_name)
         
         # Return success response
         now = datetime.utcnow().isoformat()
@@ -26,6 +26,7 @@ from common.stepfunctions_builder import (
 from handlers.auth import request_to_claims
 from handlers.authz import CasbinEnforcer
 from customLogging.logger import safeLogger
+from common.workflowRouting import bump_workflow_routing_generation
 from models.common import (
     APIGatewayProxyResponseV2,
     internal_error,
@@ -53,6 +54,7 @@ retry_config = Config(
 lambda_client = boto3.client('lambda', config=retry_config)
 sf_client = boto3.client('stepfunctions', config=retry_config)
 dynamodb = boto3.resource('dynamodb', config=retry_config)
+dynamodb_client = boto3.client('dynamodb', config=retry_config)
 
 try:
     workflow_Database = os.environ["WORKFLOW_STORAGE_TABLE_NAME"]
@@ -461,6 +463,7 @@ def create_workflow(payload, claims_and_roles):
             Item['dateCreated'] = json.dumps(dtNow)
 
         table.put_item(Item=Item)
+        bump_workflow_routing_generation(dynamodb_client, workflow_Database)
 
         action = "updated" if is_update else "created"
         logger.info(f"Workflow {action} by {username}: {workflow_id}")
@@ -9,6 +9,7 @@ from boto3.dynamodb.conditions import Attr
 import json
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from common.validators import validate
+from common.metadataRead import normalize_metadata_file_path, read_asset_metadata, read_file_metadata
 from handlers.auth import request_to_claims
 from handlers.authz import CasbinEnforcer
 from customLogging.logger import safeLogger
@@ -26,10 +27,10 @@ from models.common import (
 logger = safeLogger(service="ExecuteWorkflow")
 
 try:
-    client = boto3.client('lambda')
     s3c = boto3.client('s3')
     sfn_client = boto3.client('stepfunctions')
     dynamodb = boto3.resource('dynamodb')
+    dynamodb_client = boto3.client('dynamodb')
 except Exception as e:
     logger.exception("Failed Loading Error Functions")
 
@@ -42,7 +43,9 @@ try:
     workflow_database = os.environ["WORKFLOW_STORAGE_TABLE_NAME"]
     workflow_execution_database = os.environ["WORKFLOW_EXECUTION_STORAGE_TABLE_NAME"]
     bucket_name_assetAuxiliary = os.environ["S3_ASSETAUXILIARY_STORAGE_BUCKET"]
-    metadata_service_function = os.environ['METADATA_SERVICE_LAMBDA_FUNCTION_NAME']
+    asset_file_metadata_table_name = os.environ["ASSET_FILE_METADATA_STORAGE_TABLE_NAME"]
+    file_attribute_table_name = os.environ["FILE_ATTRIBUTE_STORAGE_TABLE_NAME"]
+    metadata_schema_table_name = os.environ["METADATA_SCHEMA_STORAGE_TABLE_V2_NAME"]
 except:
     logger.exception("Failed loading environment variables")
 
@@ -91,15 +94,6 @@ def get_pipelines(databaseId, pipelineId):
     return response['Items']
 
 
-def _metadata_service_lambda(payload):
-    """Invoke metadata service lambda"""
-    return client.invoke(
-        FunctionName=metadata_service_function,
-        InvocationType='RequestResponse',
-        Payload=json.dumps(payload).encode('utf-8')
-    )
-
-
 def resolve_asset_file_path(asset_base_key: str, file_path: str) -> str:
     """
     Intelligently resolve the full S3 key, avoiding duplication if file_path already contains the asset base key.
@@ -131,127 +125,49 @@ def resolve_asset_file_path(asset_base_key: str, file_path: str) -> str:
         return resolved_path
 
 
-def get_asset_metadata(databaseId, assetId, event):
-    """Get asset metadata using new metadata service"""
-    try:
-        # Build Lambda event for metadata service GET endpoint
-        l_payload = {
-            'requestContext': {
-                'http': {
-                    'path': f'/database/{databaseId}/assets/{assetId}/metadata',
-                    'method': 'GET'
-                },
-                'authorizer': event['requestContext']['authorizer']
-            },
-            'pathParameters': {
-                'databaseId': databaseId,
-                'assetId': assetId
-            },
-            'queryStringParameters': {}
-        }
-
-        logger.info("Fetching asset metadata from metadata service")
-        logger.info(l_payload)
-
-        metadata_response = _metadata_service_lambda(l_payload)
-        logger.info("Asset metadata response received")
-
-        stream = metadata_response.get('Payload', "")
-        response_body = {}
-        if stream:
-            json_response = json.loads(stream.read().decode("utf-8"))
-            logger.info(f"Asset metadata payload status: {json_response.get('statusCode')}")
-            if "body" in json_response and json_response.get('statusCode') == 200:
-                response_body = json.loads(json_response['body'])
+def can_read_metadata(event, claims_and_roles, asset, metadata_path):
+    """Check metadata read access as the metadata service GET endpoints do
 
-        return response_body
-    except Exception as e:
-        logger.exception(f"Failed fetching asset metadata: {e}")
-        return {}
-
-
-def get_file_metadata(databaseId, assetId, filePath, event):
-    """Get file metadata using new metadata service"""
-    try:
-        # Build Lambda event for metadata service GET endpoint
-        l_payload = {
-            'requestContext': {
-                'http': {
-                    'path': f'/database/{databaseId}/assets/{assetId}/metadata/file',
-                    'method': 'GET'
-                },
-                'authorizer': event['requestContext']['authorizer']
-            },
-            'pathParameters': {
-                'databaseId': databaseId,
-                'assetId': assetId
+    Requires GET on the metadata API route (Tier 1) and GET on the asset (Tier 2).
+    """
+    if len(claims_and_roles["tokens"]) == 0:
+        return False
+
+    metadata_event = {
+        'requestContext': {
+            'http': {
+                'path': metadata_path,
+                'method': 'GET'
             },
-            'queryStringParameters': {
-                'filePath': filePath,
-                'type': 'metadata'
-            }
+            'authorizer': event['requestContext']['authorizer']
         }
+    }
+    casbin_enforcer = CasbinEnforcer(claims_and_roles)
+    return casbin_enforcer.enforceAPI(metadata_event) and casbin_enforcer.enforce(asset, "GET")
 
-        logger.info(f"Fetching file metadata from metadata service for file: {filePath}")
-        logger.info(l_payload)
-
-        metadata_response = _metadata_service_lambda(l_payload)
-        logger.info("File metadata response received")
 
-        stream = metadata_response.get('Payload', "")
-        response_body = {}
-        if stream:
-            json_response = json.loads(stream.read().decode("utf-8"))
-            logger.info(f"File metadata payload status: {json_response.get('statusCode')}")
-            if "body" in json_response and json_response.get('statusCode') == 200:
-                response_body = json.loads(json_response['body'])
-
-        return response_body
+def get_asset_metadata(databaseId, assetId):
+    """Get schema-enriched asset metadata from the metadata tables"""
+    try:
+        metadata, _ = read_asset_metadata(
+            dynamodb_client, asset_file_metadata_table_name, metadata_schema_table_name, databaseId, assetId)
+        return metadata
     except Exception as e:
-        logger.exception(f"Failed fetching file metadata: {e}")
-        return {}
+        logger.exception(f"Failed fetching asset metadata: {e}")
+        return []
 
 
-def get_file_attributes(databaseId, assetId, filePath, event):
-    """Get file attributes using new metadata service"""
+def get_file_metadata(databaseId, assetId, filePath, metadata_type):
+    """Get schema-enriched file metadata or attributes from the metadata tables"""
     try:
-        # Build Lambda event for metadata service GET endpoint
-        l_payload = {
-            'requestContext': {
-                'http': {
-                    'path': f'/database/{databaseId}/assets/{assetId}/metadata/file',
-                    'method': 'GET'
-                },
-                'authorizer': event['requestContext']['authorizer']
-            },
-            'pathParameters': {
-                'databaseId': databaseId,
-                'assetId': assetId
-            },
-            'queryStringParameters': {
-                'filePath': filePath,
-                'type': 'attribute'
-            }
-        }
-
-        logger.info(f"Fetching file attributes from metadata service for file: {filePath}")
-        logger.info(l_payload)
-
-        metadata_response = _metadata_service_lambda(l_payload)
-        logger.info("File attributes response received")
-
-        stream = metadata_response.get('Payload', "")
-        response_body = {}
-        if stream:
-            json_response = json.loads(stream.read().decode("utf-8"))
-            logger.info(f"File attributes payload status: {json_response.get('statusCode')}")
-            if "body" in json_response and json_response.get('statusCode') == 200:
-                response_body = json.loads(json_response['body'])
-
-        return response_body
+        table_name = asset_file_metadata_table_name if metadata_type == 'metadata' else file_attribute_table_name
+        metadata, _ = read_file_metadata(
+            dynamodb_client, table_name, metadata_schema_table_name, databaseId, assetId,
+            normalize_metadata_file_path(assetId, filePath), metadata_type)
+        return metadata
     except Exception as e:
-        logger.exception(f"Failed fetching file attributes: {e}")
-        return {}
+        logger.exception(f"Failed fetching file {metadata_type}: {e}")
+        return []
 
 
 def simplify_metadata_array(metadata_array):
@@ -274,24 +190,29 @@ def simplify_metadata_array(metadata_array):
     return simplified
 
 
-def get_separate_metadata(databaseId, assetId, filePath, event):
-    """Get asset metadata, file metadata, and file attributes separately using new metadata service"""
+def get_separate_metadata(databaseId, assetId, filePath, asset, event, claims_and_roles):
+    """Get asset metadata, file metadata, and file attributes separately
+
+    Metadata is read in-process with the shared metadata read library. Metadata the
+    user cannot read through the metadata service is returned empty.
+    """
     try:
         # Always get asset metadata
-        asset_metadata_response = get_asset_metadata(databaseId, assetId, event)
-
-        # Extract metadata list from response (new format)
-        asset_metadata = asset_metadata_response.get("metadata", [])
+        asset_metadata = []
+        if can_read_metadata(event, claims_and_roles, asset, f'/database/{databaseId}/assets/{assetId}/metadata'):
+            asset_metadata = get_asset_metadata(databaseId, assetId)
+        else:
+            logger.warning("Not authorized to view asset metadata, continuing without it")
 
-        # If a file path is provided, also get file metadata and attributes
+        # If a file path is provided, also get file metadata and attributes (folders have none)
         file_metadata = []
         file_attributes = []
-        if filePath:
-            file_metadata_response = get_file_metadata(databaseId, assetId, filePath, event)
-            file_metadata = file_metadata_response.get("metadata", [])
-
-            file_attributes_response = get_file_attributes(databaseId, assetId, filePath, event)
-            file_attributes = file_attributes_response.get("metadata", [])
+        if filePath and not filePath.endswith('/'):
+            if can_read_metadata(event, claims_and_roles, asset, f'/database/{databaseId}/assets/{assetId}/metadata/file'):
+                file_metadata = get_file_metadata(databaseId, assetId, filePath, 'metadata')
+                file_attributes = get_file_metadata(databaseId, assetId, filePath, 'attribute')
+            else:
+                logger.warning("Not authorized to view file metadata, continuing without it")
 
         logger.info(f"Retrieved metadata - Asset: {len(asset_metadata)} items, File: {len(file_metadata)} items, Attributes: {len(file_attributes)} items")
 
@@ -523,7 +444,22 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
             message = 'Missing path parameter(s) (%s) in API call' % (', '.join(missing_field_names))
             return validation_error(body={'message': message}, event=event)
 
+        # Auto-triggered executions for a batch of files on one asset carry the file list in fileKeys
+        file_keys = request_body.get('fileKeys')
+        if file_keys is not None:
+            if not isinstance(file_keys, list) or not file_keys or not all(isinstance(key, str) for key in file_keys):
+                return validation_error(body={'message': 'fileKeys must be a non-empty list of file paths'}, event=event)
+            if 'fileKey' in request_body:
+                return validation_error(body={'message': 'Only one of fileKey or fileKeys can be provided'}, event=event)
+
         logger.info("Validating Parameters")
+        file_keys_validation = {
+            f'assetKey{index}': {
+                'value': key,
+                'validator': 'ASSET_PATH',
+                'isFolder': False
+            } for index, key in enumerate(file_keys or [])
+        }
         (valid, message) = validate({
             'databaseId': {
                 'value': pathParams.get('databaseId', ''),
@@ -548,6 +484,7 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
                 'isFolder': False,
                 'optional': True
             },
+            **file_keys_validation,
         })
 
         if not valid:
@@ -628,17 +565,21 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
             # Extract relative path for metadata lookup
             relative_file_path = request_body['fileKey']
             logger.info(f"Using file key from request: {file_key}, relative path: {relative_file_path}")
+        elif file_keys:
+            logger.info(f"Using asset's base prefix key for a batch of {len(file_keys)} files: {file_key}")
         else:
             logger.info(f"Using asset's base prefix key (no particular file): {file_key}")
 
         #Get current executions for workflow on asset with file key filter. If currently one running, error.
-        executionResults = get_workflow_executions(pathParams['databaseId'], pathParams['assetId'], request_body.get('workflowDatabaseId'), pathParams['workflowId'], file_key)
-        if len(executionResults['Items']) > 0:
-            logger.error(f"Workflow has a currently running execution on the file: {file_key}")
-            return validation_error(body={'message': 'Workflow has a currently running execution on this file'}, event=event)
+        #File batches are not checked: each batch execution covers its own set of uploaded files.
+        if not file_keys:
+            executionResults = get_workflow_executions(pathParams['databaseId'], pathParams['assetId'], request_body.get('workflowDatabaseId'), pathParams['workflowId'], file_key)
+            if len(executionResults['Items']) > 0:
+                logger.error(f"Workflow has a currently running execution on the file: {file_key}")
+                return validation_error(body={'message': 'Workflow has a currently running execution on this file'}, event=event)
 
-        # Get separate metadata (asset, file metadata, file attributes) using new metadata service
-        metadata_result = get_separate_metadata(pathParams['databaseId'], pathParams['assetId'], relative_file_path, event)
+        # Get separate metadata (asset, file metadata, file attributes)
+        metadata_result = get_separate_metadata(pathParams['databaseId'], pathParams['assetId'], relative_file_path, asset, event, claims_and_roles)
 
         # Simplify metadata arrays to reduce JSON size for pipeline input
         simplified_asset_metadata = simplify_metadata_array(
@@ -666,6 +607,8 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
                 "fileAttributes": simplified_file_attributes
             },
         }
+        if file_keys:
+            inputMetadata["VAMS"]["fileKeys"] = file_keys
 
         logger.info("Launching Workflow:")
         executionId = launchWorkflow(asset_bucket, asset_file_key, file_key, workflow['workflow_arn'], pathParams['databaseId'],
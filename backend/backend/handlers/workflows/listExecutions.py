@@ -10,6 +10,7 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 from common.validators import validate
 from handlers.auth import request_to_claims
 from handlers.authz import CasbinEnforcer
+from handlers.workflows.workflowExecutionStatus import refresh_open_executions
 from customLogging.logger import safeLogger
 from common.dynamodb import validate_pagination_info
 from models.common import (
@@ -24,7 +25,6 @@ from models.common import (
 
 logger = safeLogger(service="ListExecutionsWorkflow")
 
-sfn = boto3.client('stepfunctions')
 dynamodb = boto3.resource('dynamodb')
 
 try:
@@ -107,69 +107,35 @@ def get_executions(database_id, asset_id, workflow_database_id, workflow_id, que
             "Items": []
         }
 
+        # Authorize each distinct workflow once (Tier 2) with a single enforcer for the request
+        casbin_enforcer = CasbinEnforcer(claims_and_roles) if len(claims_and_roles["tokens"]) > 0 else None
+        workflow_allowed = {}
+        allowed_items = []
         for item in page_iterator['Items']:
-            try:
-                logger.info("workflow execution: ")
-                logger.info(item)
-                # Add Casbin Enforcer to check if the current user has permissions to GET the workflow (Tier 2):
+            workflow_key = (item.get('databaseId'), item.get('workflowDatabaseId'), item.get('workflowId'))
+            if workflow_key not in workflow_allowed:
                 item.update({
                     "object__type": "workflow"
                 })
-                if len(claims_and_roles["tokens"]) > 0:
-                    casbin_enforcer = CasbinEnforcer(claims_and_roles)
-                    if casbin_enforcer.enforce(item, "GET"):
-                        workflow_arn = item['workflow_arn']
-                        execution_arn = workflow_arn.replace("stateMachine", "execution")
-                        execution_arn = execution_arn + ":" + item['executionId']
-                        logger.info(execution_arn)
-
-                        startDate = item.get('startDate', "")
-                        stopDate = item.get('stopDate', "")
-                        executionStatus = item.get('executionStatus', "")
-                        executionId = item['executionId']
-
-                        #If we don't have start/stop information, this means we could still have a running process (or now stopped).
-                        # Fetch it from step functions.
-                        if not stopDate:
-                            execution = sfn.describe_execution(
-                                executionArn=execution_arn
-                            )
-                            logger.info(execution)
-                            startDate = execution.get('startDate', "")
-                            executionStatus = execution['status']
-                            executionId = execution['name']
-
-                            if startDate:
-                                startDate = startDate.strftime("%m/%d/%Y, %H:%M:%S")
-                            stopDate = execution.get('stopDate', "")
-                            if stopDate:
-                                stopDate = stopDate.strftime("%m/%d/%Y, %H:%M:%S")
-
-                                item.update({
-                                    'startDate': startDate,
-                                    'stopDate': stopDate,
-                                    'executionStatus': execution['status']
-                                })
-
-                                #Update the execution table to add start/end date and Status once something is found to have stopped running
-                                logger.info("Update Execution Table")
-                                table = dynamodb.Table(workflow_execution_database)
-                                table.put_item(
-                                    Item=item
-                                )
-
-                        result["Items"].append({
-                            'workflowDatabaseId': item['workflowDatabaseId'],
-                            'workflowId': item['workflowId'],
-                            'executionId': executionId,
-                            'executionStatus': executionStatus,
-                            'startDate': startDate,
-                            'stopDate': stopDate,
-                            'inputAssetFileKey': item.get('inputAssetFileKey', ''),
-                        })
-            except Exception as e:
-                logger.exception(e)
-                logger.info("Continuing with trying to fetch exceutions...")
+                workflow_allowed[workflow_key] = casbin_enforcer is not None and casbin_enforcer.enforce(item, "GET")
+            if workflow_allowed[workflow_key]:
+                allowed_items.append(item)
+
+        # Executions without a stopDate may still be running (or stopped before the status updater
+        # recorded them), so fetch their status from step functions concurrently
+        refreshed = refresh_open_executions(workflow_execution_database, allowed_items)
+
+        for item in allowed_items:
+            status = refreshed.get(item['executionId'], {})
+            result["Items"].append({
+                'workflowDatabaseId': item['workflowDatabaseId'],
+                'workflowId': item['workflowId'],
+                'executionId': status.get('executionId', item['executionId']),
+                'executionStatus': status.get('executionStatus', item.get('executionStatus', "")),
+                'startDate': status.get('startDate', item.get('startDate', "")),
+                'stopDate': status.get('stopDate', item.get('stopDate', "")),
+                'inputAssetFileKey': item.get('inputAssetFileKey', ''),
+            })
 
         if "NextToken" in page_iterator:
             result["NextToken"] = page_iterator["NextToken"]
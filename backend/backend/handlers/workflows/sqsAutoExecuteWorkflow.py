@@ -15,6 +15,7 @@ from botocore.exceptions import ClientError
 from botocore.config import Config
 from aws_lambda_powertools.utilities.typing import LambdaContext
 from customLogging.logger import safeLogger
+from common.workflowRouting import get_database_workflows
 from models.common import APIGatewayProxyResponseV2, internal_error, success
 
 # Configure AWS clients with retry configuration
@@ -26,13 +27,21 @@ retry_config = Config(
 )
 
 dynamodb = boto3.resource('dynamodb', config=retry_config)
+dynamodb_client = boto3.client('dynamodb', config=retry_config)
 lambda_client = boto3.client('lambda', config=retry_config)
+s3_client = boto3.client('s3', config=retry_config)
 logger = safeLogger(service_name="SqsAutoExecuteWorkflow")
 
 # Excluded patterns or prefixes from file paths to exclude
 excluded_prefixes = ['pipeline', 'pipelines', 'preview', 'previews', 'temp-upload', 'temp-uploads', 'workspace', 'workspaces']
 excluded_patterns = ['.previewFile.']
 
+# Maximum number of files carried by one execution when executions are batched per asset
+MAX_FILES_PER_EXECUTION = 100
+
+# Asset and bucket lookups shared by the file events of one SQS batch
+batch_lookups = {'assets': {}, 'buckets': {}}
+
 # Load environment variables with error handling
 try:
     workflow_storage_table_name = os.environ["WORKFLOW_STORAGE_TABLE_NAME"]
@@ -40,6 +49,8 @@ try:
     database_storage_table_name = os.environ["DATABASE_STORAGE_TABLE_NAME"]
     s3_asset_buckets_table_name = os.environ["S3_ASSET_BUCKETS_STORAGE_TABLE_NAME"]
     execute_workflow_lambda_name = os.environ["EXECUTE_WORKFLOW_LAMBDA_FUNCTION_NAME"]
+    # When enabled, the files of one asset in an SQS batch start one execution per workflow with the file list
+    execution_per_asset_batch = os.environ.get("EXECUTION_PER_ASSET_BATCH", "false").lower() == "true"
 except Exception as e:
     logger.exception("Failed loading environment variables")
     raise e
@@ -85,12 +96,9 @@ def should_skip_file(s3_key: str, file_path: str) -> bool:
 
 
 def get_workflows_for_database(database_id: str) -> List[Dict[str, Any]]:
-    """Get all workflows for a specific database"""
+    """Get all workflows for a specific database from the workflow routing cache"""
     try:
-        response = workflow_storage_table.query(
-            KeyConditionExpression=Key('databaseId').eq(database_id)
-        )
-        return response.get('Items', [])
+        return get_database_workflows(dynamodb_client, workflow_storage_table_name, database_id)
     except Exception as e:
         logger.exception(f"Error getting workflows for database {database_id}: {e}")
         return []
@@ -173,7 +181,7 @@ def should_trigger_workflow(auto_trigger_extensions: Optional[str], file_extensi
     return file_extension in parsed_extensions
 
 
-def invoke_execute_workflow(workflow: Dict[str, Any], database_id: str, asset_id: str, file_path: str) -> bool:
+def invoke_execute_workflow(workflow: Dict[str, Any], database_id: str, asset_id: str, file_paths: List[str]) -> bool:
     """
     Invoke the executeWorkflow Lambda function
     
@@ -181,7 +189,8 @@ def invoke_execute_workflow(workflow: Dict[str, Any], database_id: str, asset_id
         workflow: The workflow object
         database_id: Database ID (of the asset)
         asset_id: Asset ID
-        file_path: File path that triggered the workflow
+        file_paths: File paths that triggered the workflow. A single file runs the workflow on
+            that file, several files run it once on the asset with the file list.
     
     Returns:
         True if invocation succeeded, False otherwise
@@ -190,6 +199,17 @@ def invoke_execute_workflow(workflow: Dict[str, Any], database_id: str, asset_id
         workflow_id = workflow.get('workflowId')
         workflow_database_id = workflow.get('databaseId', database_id)  # Workflow's database (may be GLOBAL)
         
+        request_body = {
+            'workflowDatabaseId': workflow_database_id,  # Required field
+            'triggerSource': 'auto-trigger-sqs'
+        }
+        if len(file_paths) == 1:
+            request_body['fileKey'] = file_paths[0]  # Use fileKey instead of assetFileKey
+            file_description = f"file {file_paths[0]}"
+        else:
+            request_body['fileKeys'] = file_paths
+            file_description = f"{len(file_paths)} files"
+        
         # Build the event structure for executeWorkflow
         event = {
             'requestContext': {
@@ -206,15 +226,11 @@ def invoke_execute_workflow(workflow: Dict[str, Any], database_id: str, asset_id
                 'assetId': asset_id,
                 'workflowId': workflow_id
             },
-            'body': json.dumps({
-                'workflowDatabaseId': workflow_database_id,  # Required field
-                'fileKey': file_path,  # Use fileKey instead of assetFileKey
-                'triggerSource': 'auto-trigger-sqs'
-            })
+            'body': json.dumps(request_body)
         }
         
         # Invoke the executeWorkflow Lambda synchronously to check response
-        logger.info(f"Invoking executeWorkflow for workflow {workflow_id} (database: {workflow_database_id}) on file {file_path}")
+        logger.info(f"Invoking executeWorkflow for workflow {workflow_id} (database: {workflow_database_id}) on {file_description}")
         response = lambda_client.invoke(
             FunctionName=execute_workflow_lambda_name,
             InvocationType='RequestResponse',  # Synchronous to check response
@@ -255,99 +271,136 @@ def invoke_execute_workflow(workflow: Dict[str, Any], database_id: str, asset_id
         return False
 
 
-def process_file_event(database_id: str, asset_id: str, bucket_name: str, s3_key: str, file_path: str) -> Dict[str, Any]:
+def process_file_events(file_events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
-    Process a file event and trigger matching workflows
+    Trigger matching workflows for the file events of an SQS batch
+    
+    Events are grouped by asset and workflow, so each file starts at most one execution per
+    workflow. With EXECUTION_PER_ASSET_BATCH enabled, the files of an asset start one execution
+    per workflow that carries the file list (up to MAX_FILES_PER_EXECUTION files each).
     
     Args:
-        database_id: Database ID
-        asset_id: Asset ID
-        bucket_name: S3 bucket name
-        s3_key: S3 object key
-        file_path: Relative file path
+        file_events: Resolved file events with databaseId, assetId, bucketName, s3Key and filePath
     
     Returns:
-        Dictionary with processing results
+        List of per-file processing results
     """
-    result = {
-        'filePath': file_path,
-        'databaseId': database_id,
-        'assetId': asset_id,
-        'workflowsFound': 0,
-        'workflowsTriggered': 0,
-        'workflowsSucceeded': 0,
-        'workflowsFailed': 0,
-        'failures': []
-    }
+    results = []
+    # (databaseId, assetId, workflowDatabaseId, workflowId) -> workflow and triggering file results by file path
+    executions: Dict[tuple, Dict[str, Any]] = {}
     
-    try:
-        # Check if file should be skipped
-        if should_skip_file(s3_key, file_path):
-            logger.info(f"Skipping excluded file: {file_path}")
-            return result
-        
-        # Extract file extension
-        file_extension = extract_file_extension(file_path)
-        logger.info(f"Processing file {file_path} with extension: {file_extension}")
-        
-        # Get workflows for the specific database
-        database_workflows = get_workflows_for_database(database_id)
-        
-        # Get workflows for GLOBAL database
-        global_workflows = get_workflows_for_database("GLOBAL")
-        
-        # Combine both lists
-        all_workflows = database_workflows + global_workflows
-        result['workflowsFound'] = len(all_workflows)
-        
-        logger.info(f"Found {len(all_workflows)} workflows ({len(database_workflows)} database-specific, {len(global_workflows)} global)")
+    for file_event in file_events:
+        database_id = file_event['databaseId']
+        asset_id = file_event['assetId']
+        file_path = file_event['filePath']
+        result = {
+            'filePath': file_path,
+            'databaseId': database_id,
+            'assetId': asset_id,
+            'workflowsFound': 0,
+            'workflowsTriggered': 0,
+            'workflowsSucceeded': 0,
+            'workflowsFailed': 0,
+            'failures': []
+        }
+        results.append(result)
         
-        # Process each workflow
-        for workflow in all_workflows:
-            workflow_id = workflow.get('workflowId', 'unknown')
+        try:
+            # Check if file should be skipped
+            if should_skip_file(file_event['s3Key'], file_path):
+                logger.info(f"Skipping excluded file: {file_path}")
+                continue
             
-            try:
-                # Get autoTriggerOnFileExtensionsUpload field
+            # Extract file extension
+            file_extension = extract_file_extension(file_path)
+            logger.info(f"Processing file {file_path} with extension: {file_extension}")
+            
+            # Workflows for the specific database and the GLOBAL database (cached per container)
+            all_workflows = get_workflows_for_database(database_id) + get_workflows_for_database("GLOBAL")
+            result['workflowsFound'] = len(all_workflows)
+            
+            for workflow in all_workflows:
+                workflow_id = workflow.get('workflowId', 'unknown')
                 auto_trigger_extensions = workflow.get('autoTriggerOnFileExtensionsUpload', '')
+                if not should_trigger_workflow(auto_trigger_extensions, file_extension):
+                    logger.debug(f"Workflow {workflow_id} not triggered (extensions: {auto_trigger_extensions}, file ext: {file_extension})")
+                    continue
                 
-                # Check if workflow should be triggered
-                if should_trigger_workflow(auto_trigger_extensions, file_extension):
-                    result['workflowsTriggered'] += 1
-                    logger.info(f"Triggering workflow {workflow_id} for file {file_path}")
-                    
-                    # Invoke executeWorkflow
-                    if invoke_execute_workflow(workflow, database_id, asset_id, file_path):
+                logger.info(f"Triggering workflow {workflow_id} for file {file_path}")
+                result['workflowsTriggered'] += 1
+                execution_key = (database_id, asset_id, workflow.get('databaseId', database_id), workflow_id)
+                execution = executions.setdefault(execution_key, {'workflow': workflow, 'files': {}})
+                execution['files'].setdefault(file_path, []).append(result)
+                
+        except Exception as e:
+            logger.exception(f"Error processing file event for {file_path}: {e}")
+            result['failures'].append({
+                'error': f"Error processing file event: {str(e)}"
+            })
+    
+    for (database_id, asset_id, _, workflow_id), execution in executions.items():
+        file_paths = list(execution['files'])
+        if execution_per_asset_batch:
+            file_batches = [file_paths[i:i + MAX_FILES_PER_EXECUTION] for i in range(0, len(file_paths), MAX_FILES_PER_EXECUTION)]
+        else:
+            file_batches = [[file_path] for file_path in file_paths]
+        
+        for file_batch in file_batches:
+            try:
+                succeeded = invoke_execute_workflow(execution['workflow'], database_id, asset_id, file_batch)
+                error = 'Failed to invoke workflow'
+            except Exception as e:
+                # Log error but continue processing other workflows
+                logger.exception(f"Error processing workflow {workflow_id}: {e}")
+                succeeded = False
+                error = str(e)
+            
+            for file_path in file_batch:
+                for result in execution['files'][file_path]:
+                    if succeeded:
                         result['workflowsSucceeded'] += 1
                     else:
                         result['workflowsFailed'] += 1
                         result['failures'].append({
                             'workflowId': workflow_id,
-                            'error': 'Failed to invoke workflow'
+                            'error': error
                         })
-                else:
-                    logger.debug(f"Workflow {workflow_id} not triggered (extensions: {auto_trigger_extensions}, file ext: {file_extension})")
-                    
-            except Exception as e:
-                # Log error but continue processing other workflows
-                logger.exception(f"Error processing workflow {workflow_id}: {e}")
-                result['workflowsFailed'] += 1
-                result['failures'].append({
-                    'workflowId': workflow_id,
-                    'error': str(e)
-                })
-        
-        return result
-        
-    except Exception as e:
-        logger.exception(f"Error processing file event for {file_path}: {e}")
-        result['failures'].append({
-            'error': f"Error processing file event: {str(e)}"
-        })
-        return result
+    
+    return results
+
+
+def get_asset_details(database_id: str, asset_id: str) -> Optional[Dict[str, Any]]:
+    """Get an asset, reusing the lookup for other files of the same asset in the batch"""
+    key = (database_id, asset_id)
+    if key not in batch_lookups['assets']:
+        asset_response = asset_storage_table.get_item(
+            Key={
+                'databaseId': database_id,
+                'assetId': asset_id
+            }
+        )
+        batch_lookups['assets'][key] = asset_response.get('Item')
+    return batch_lookups['assets'][key]
+
+
+def get_bucket_details(bucket_id: str) -> Optional[Dict[str, Any]]:
+    """Get a bucket, reusing the lookup for other files in the same bucket in the batch"""
+    if bucket_id not in batch_lookups['buckets']:
+        bucket_response = s3_asset_buckets_table.query(
+            KeyConditionExpression=Key('bucketId').eq(bucket_id),
+            Limit=1
+        )
+        bucket_items = bucket_response.get('Items', [])
+        batch_lookups['buckets'][bucket_id] = bucket_items[0] if bucket_items else None
+    return batch_lookups['buckets'][bucket_id]
 
 
 def handle_s3_notification(event_record: Dict[str, Any], asset_bucket_name: Optional[str] = None, asset_bucket_prefix: Optional[str] = None) -> Dict[str, Any]:
-    """Handle S3 bucket notification from SQS/SNS"""
+    """Handle S3 bucket notification from SQS/SNS
+    
+    Returns:
+        Dictionary with the resolved fileEvent, or the reason the notification was skipped
+    """
     try:
         # Extract S3 information from event
         s3_info = event_record.get('s3', {})
@@ -375,7 +428,6 @@ def handle_s3_notification(event_record: Dict[str, Any], asset_bucket_name: Opti
         
         # Try to get metadata from S3 object
         try:
-            s3_client = boto3.client('s3', config=retry_config)
             s3_response = s3_client.head_object(Bucket=bucket_name, Key=s3_key)
             s3_metadata = s3_response.get('Metadata', {})
             
@@ -387,14 +439,7 @@ def handle_s3_notification(event_record: Dict[str, Any], asset_bucket_name: Opti
                 return {'skipped': 'missing metadata'}
             
             # Get asset details to calculate relative path
-            asset_response = asset_storage_table.get_item(
-                Key={
-                    'databaseId': database_id,
-                    'assetId': asset_id
-                }
-            )
-            
-            asset = asset_response.get('Item')
+            asset = get_asset_details(database_id, asset_id)
             if not asset:
                 logger.warning(f"Asset not found: {database_id}/{asset_id}")
                 return {'skipped': 'asset not found'}
@@ -405,17 +450,11 @@ def handle_s3_notification(event_record: Dict[str, Any], asset_bucket_name: Opti
                 logger.warning(f"No bucket ID for asset: {asset_id}")
                 return {'skipped': 'no bucket ID'}
             
-            bucket_response = s3_asset_buckets_table.query(
-                KeyConditionExpression=Key('bucketId').eq(bucket_id),
-                Limit=1
-            )
-            
-            bucket_items = bucket_response.get('Items', [])
-            if not bucket_items:
+            bucket = get_bucket_details(bucket_id)
+            if not bucket:
                 logger.warning(f"Bucket not found: {bucket_id}")
                 return {'skipped': 'bucket not found'}
             
-            bucket = bucket_items[0]
             base_assets_prefix = bucket.get('baseAssetsPrefix', '/')
             
             # Normalize prefix
@@ -437,8 +476,16 @@ def handle_s3_notification(event_record: Dict[str, Any], asset_bucket_name: Opti
             if not relative_path.startswith('/'):
                 relative_path = '/' + relative_path
             
-            # Process the file event
-            return process_file_event(database_id, asset_id, bucket_name, s3_key, relative_path)
+            # File events are processed together once the whole batch is resolved
+            return {
+                'fileEvent': {
+                    'databaseId': database_id,
+                    'assetId': asset_id,
+                    'bucketName': bucket_name,
+                    's3Key': s3_key,
+                    'filePath': relative_path
+                }
+            }
             
         except ClientError as e:
             logger.exception(f"Error getting S3 object metadata: {e}")
@@ -454,6 +501,8 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
     try:
         logger.info(f"Processing SQS auto-execute workflow event: {json.dumps(event, default=str)}")
         
+        batch_lookups['assets'].clear()
+        batch_lookups['buckets'].clear()
         results = []
         
         # Handle SQS records
@@ -571,6 +620,10 @@ def lambda_handler(event, context: LambdaContext) -> APIGatewayProxyResponseV2:
                         logger.exception(f"Error parsing SQS/SNS message: {e}")
                         results.append({'error': f'Error parsing message: {str(e)}'})
         
+        # Route and execute the file events of the whole batch together
+        file_events = [result['fileEvent'] for result in results if 'fileEvent' in result]
+        results = [result for result in results if 'fileEvent' not in result] + process_file_events(file_events)
+        
         # Summarize results
         total_files = len(results)
         total_workflows_found = sum(r.get('workflowsFound', 0) for r in results)
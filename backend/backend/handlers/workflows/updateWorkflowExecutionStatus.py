@@ -0,0 +1,75 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Record the final status of workflow executions from Step Functions status change events.
+
+An EventBridge rule routes "Step Functions Execution Status Change" events with a terminal
+status to this handler, which stores the start/stop dates and status on the execution row so
+listing executions does not need to call DescribeExecution for completed runs.
+"""
+
+import os
+import json
+from aws_lambda_powertools.utilities.typing import LambdaContext
+from customLogging.logger import safeLogger
+from handlers.workflows.workflowExecutionStatus import (
+    format_execution_date,
+    record_execution_completion,
+    sfn_client,
+)
+
+logger = safeLogger(service_name="UpdateWorkflowExecutionStatus")
+
+# Load environment variables
+try:
+    workflow_execution_database = os.environ["WORKFLOW_EXECUTION_STORAGE_TABLE_NAME"]
+except Exception as e:
+    logger.exception("Failed loading environment variables")
+    raise e
+
+TERMINAL_STATUSES = ("SUCCEEDED", "FAILED", "TIMED_OUT", "ABORTED")
+
+
+def _get_execution_input(detail):
+    """Return the parsed input of the execution, describing it when the event omits the input"""
+    execution_input = detail.get('input')
+    if not execution_input:
+        execution_input = sfn_client.describe_execution(executionArn=detail['executionArn']).get('input')
+    return json.loads(execution_input) if execution_input else {}
+
+
+def lambda_handler(event, context: LambdaContext):
+    """Lambda handler for Step Functions execution status change events"""
+    detail = event.get('detail', {})
+    status = detail.get('status')
+    execution_id = detail.get('name')
+
+    if status not in TERMINAL_STATUSES or not execution_id:
+        logger.info(f"Ignoring execution status change event with status {status}")
+        return {'updated': False}
+
+    try:
+        execution_input = _get_execution_input(detail)
+        database_id = execution_input.get('databaseId')
+        asset_id = execution_input.get('assetId')
+        if not database_id or not asset_id:
+            # Not a VAMS workflow execution (or one launched without an asset)
+            logger.info(f"Execution {execution_id} has no databaseId/assetId input, skipping")
+            return {'updated': False}
+
+        updated = record_execution_completion(
+            workflow_execution_database,
+            f"${database_id}:${asset_id}",
+            execution_id,
+            status,
+            format_execution_date(detail.get('startDate')),
+            format_execution_date(detail.get('stopDate')),
+        )
+        if not updated:
+            logger.info(f"Execution {execution_id} has no open row in the executions table, skipping")
+        return {'updated': updated}
+    except Exception as e:
+        # Rows left open are reconciled the next time the executions are listed
+        logger.exception(f"Error recording status of execution {execution_id}: {e}")
+        raise e
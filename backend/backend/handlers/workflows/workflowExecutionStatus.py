@@ -0,0 +1,129 @@
+#  Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#  SPDX-License-Identifier: Apache-2.0
+
+"""
+Helpers to record the final status of workflow executions in the workflow executions table.
+
+Execution rows are created with empty startDate/stopDate when a workflow is launched. The
+EventBridge-driven updateWorkflowExecutionStatus handler fills them in when a Step Functions
+execution ends; listExecutions reconciles rows that are still open (for example executions
+that ended before the updater was deployed) from DescribeExecution.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from customLogging.logger import safeLogger
+
+logger = safeLogger(service_name="WorkflowExecutionStatus")
+
+retry_config = Config(
+    retries={
+        'max_attempts': 5,
+        'mode': 'adaptive'
+    }
+)
+
+dynamodb_client = boto3.client('dynamodb', config=retry_config)
+sfn_client = boto3.client('stepfunctions', config=retry_config)
+
+# Format of the startDate/stopDate strings stored on execution rows
+EXECUTION_DATE_FORMAT = "%m/%d/%Y, %H:%M:%S"
+
+# Bound on concurrent DescribeExecution/UpdateItem calls per listing (Step Functions API throttling)
+MAX_STATUS_WORKERS = 10
+
+
+def format_execution_date(value):
+    """Format a Step Functions date (datetime or epoch milliseconds) as stored on execution rows"""
+    if not value:
+        return ""
+    if isinstance(value, (int, float)):
+        value = datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    return value.strftime(EXECUTION_DATE_FORMAT)
+
+
+def get_execution_arn(item):
+    """Build the Step Functions execution ARN of an execution row"""
+    if item.get('execution_arn'):
+        return item['execution_arn']
+    return item['workflow_arn'].replace("stateMachine", "execution") + ":" + item['executionId']
+
+
+def record_execution_completion(table_name, partition_key, execution_id, status, start_date, stop_date):
+    """Store the final status of an execution on its row
+
+    The update is conditional: the row must exist and must not already have a stopDate, so
+    concurrent updaters never overwrite a recorded completion or create rows.
+
+    Returns:
+        True if the row was updated, False if it was missing or already completed
+    """
+    try:
+        dynamodb_client.update_item(
+            TableName=table_name,
+            Key={
+                'databaseId:assetId': {'S': partition_key},
+                'executionId': {'S': execution_id},
+            },
+            UpdateExpression='SET startDate = :startDate, stopDate = :stopDate, executionStatus = :status',
+            ConditionExpression='attribute_exists(executionId) AND '
+                                '(attribute_not_exists(stopDate) OR stopDate = :empty)',
+            ExpressionAttributeValues={
+                ':startDate': {'S': start_date},
+                ':stopDate': {'S': stop_date},
+                ':status': {'S': status},
+                ':empty': {'S': ""},
+            },
+        )
+        return True
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+            return False
+        raise e
+
+
+def _refresh_execution(table_name, item):
+    """Describe an open execution and record its completion if it has stopped"""
+    execution = sfn_client.describe_execution(executionArn=get_execution_arn(item))
+    status = {
+        'executionId': execution['name'],
+        'executionStatus': execution['status'],
+        'startDate': format_execution_date(execution.get('startDate')),
+        'stopDate': format_execution_date(execution.get('stopDate')),
+    }
+    if status['stopDate']:
+        try:
+            record_execution_completion(table_name, item['databaseId:assetId'], item['executionId'],
+                                        status['executionStatus'], status['startDate'], status['stopDate'])
+        except Exception as e:
+            # The listing still returns the fresh status; the next listing or the updater retries the write
+            logger.exception(f"Error recording completion of execution {item['executionId']}: {e}")
+    return status
+
+
+def refresh_open_executions(table_name, items):
+    """Fetch the Step Functions status of execution rows without a stopDate
+
+    Executions are described concurrently (at most MAX_STATUS_WORKERS at a time) and the ones
+    that have stopped are written back with conditional updates.
+
+    Returns:
+        Dictionary of executionId -> status fields (executionId, executionStatus, startDate, stopDate)
+        for every row that could be described
+    """
+    open_items = [item for item in items if not item.get('stopDate')]
+    if not open_items:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(MAX_STATUS_WORKERS, len(open_items))) as executor:
+        futures = {item['executionId']: executor.submit(_refresh_execution, table_name, item) for item in open_items}
+        for execution_id, future in futures.items():
+            try:
+                results[execution_id] = future.result()
+            except Exception as e:
+                logger.exception(f"Error fetching status of execution {execution_id}: {e}")
+    return results
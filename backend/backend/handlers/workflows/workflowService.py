@@ -13,6 +13,7 @@ from handlers.auth import request_to_claims
 from handlers.authz import CasbinEnforcer
 from customLogging.logger import safeLogger
 from common.dynamodb import validate_pagination_info
+from common.workflowRouting import bump_workflow_routing_generation, WORKFLOW_ROUTING_GENERATION_ID
 from models.common import (
     APIGatewayProxyResponseV2,
     internal_error,
@@ -65,6 +66,9 @@ def get_all_workflows(queryParams, showDeleted=False, claims_and_roles=None):
     result = {}
     items = []
     for item in pageIterator['Items']:
+        # Skip the workflow routing generation counter
+        if item.get('databaseId', {}).get('S') == WORKFLOW_ROUTING_GENERATION_ID:
+            continue
         deserialized_document = {k: deserializer.deserialize(v) for k, v in item.items()}
 
         # Ensure autoTriggerOnFileExtensionsUpload field exists (return empty string if missing)
@@ -195,6 +199,7 @@ def delete_workflow(databaseId, workflowId, claims_and_roles=None):
             )
             result = table.delete_item(Key={'databaseId': databaseId, 'workflowId': workflowId})
             logger.info(result)
+            bump_workflow_routing_generation(dynamodb_client, workflow_database)
             response['statusCode'] = 200
             response['message'] = "Workflow deleted"
         else:
@@ -308,6 +308,75 @@ class CompleteUploadResponseModel(BaseModel, extra='ignore'):
     overallSuccess: bool = True
     largeFileAsynchronousHandling: bool = False
 
+
+MAX_BATCH_COMPLETE_UPLOADS = 20  # Maximum uploads completed in one batch completion request
+
+
+class CompleteUploadBatchItemModel(BaseModel, extra='ignore'):
+    """A single upload to complete in a batch completion request"""
+    uploadId: str = Field(min_length=1, max_length=256, strip_whitespace=True)
+    files: List[UploadFileCompletionModel]
+
+
+class CompleteUploadBatchRequestModel(BaseModel, extra='ignore'):
+    """Request model for completing multiple asset file uploads of one asset in a single request"""
+    assetId: str = Field(min_length=1, max_length=256, strip_whitespace=False, pattern=filename_pattern)
+    databaseId: str = Field(min_length=4, max_length=256, strip_whitespace=True, pattern=id_pattern)
+    uploadType: Literal["assetFile"]
+    uploads: List[CompleteUploadBatchItemModel]
+
+    @root_validator
+    def validate_fields(cls, values):
+        uploads = values.get('uploads') or []
+        if len(uploads) == 0:
+            message = "At least one upload must be provided to complete"
+            logger.error(message)
+            raise ValueError(message)
+
+        if len(uploads) > MAX_BATCH_COMPLETE_UPLOADS:
+            message = f"A maximum of {MAX_BATCH_COMPLETE_UPLOADS} uploads can be completed per request"
+            logger.error(message)
+            raise ValueError(message)
+
+        upload_ids = [upload.uploadId for upload in uploads]
+        if len(upload_ids) != len(set(upload_ids)):
+            message = "Duplicate uploadId values are not allowed"
+            logger.error(message)
+            raise ValueError(message)
+
+        # Same per-file rules as single upload completion, applied across the whole batch
+        upload_ids_s3 = []
+        for upload in uploads:
+            if not upload.files or len(upload.files) == 0:
+                message = "At least one file must be provided to complete the upload"
+                logger.error(message)
+                raise ValueError(message)
+            for file in upload.files:
+                if file.uploadIdS3 == "zero-byte":
+                    if file.parts and len(file.parts) > 0:
+                        message = "Zero-byte files should not have any parts"
+                        logger.error(message)
+                        raise ValueError(message)
+                else:
+                    upload_ids_s3.append(file.uploadIdS3)
+
+        if len(upload_ids_s3) != len(set(upload_ids_s3)):
+            message = "Duplicate uploadIdS3 values are not allowed"
+            logger.error(message)
+            raise ValueError(message)
+
+        return values
+
+
+class CompleteUploadBatchResponseModel(BaseModel, extra='ignore'):
+    """Response model for completing multiple uploads in a single request"""
+    message: str
+    assetId: str
+    assetType: Optional[str] = None
+    uploadResults: List[CompleteUploadResponseModel] = []
+    overallSuccess: bool = True
+    largeFileAsynchronousHandling: bool = False
+
 ######################## Create Folder API Models ##########################
 class CreateFolderRequestModel(BaseModel, extra='ignore'):
     """Request model for creating a folder in S3 for an asset"""
@@ -907,6 +976,7 @@ class AssetUploadTableModel(BaseModel, extra='ignore'):
     status: str = "initialized"  # Upload status (initialized, completed, failed)
     isExternalUpload: bool = False  # Flag for external uploads
     temporaryPrefix: Optional[str] = None  # Base temporary prefix for external uploads
+    finalizationMode: Optional[str] = None  # "direct" (parts uploaded to final keys) or "temporary"
     UserId: Optional[str] = None  # User ID for rate limiting (matches DynamoDB GSI field name)
     
     def to_dict(self):
@@ -927,6 +997,8 @@ class AssetUploadTableModel(BaseModel, extra='ignore'):
         # Add optional fields only if they exist
         if self.temporaryPrefix:
             result["temporaryPrefix"] = self.temporaryPrefix
+        if self.finalizationMode:
+            result["finalizationMode"] = self.finalizationMode
         if self.UserId:
             result["UserId"] = self.UserId
             
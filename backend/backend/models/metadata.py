@@ -832,4 +832,128 @@ class GetDatabaseMetadataResponseModel(BaseModel, extra='ignore'):
     metadata: List[DatabaseMetadataResponseModel] = Field(default=[], description="List of metadata items")
     restrictMetadataOutsideSchemas: bool = Field(..., description="True if database restricts metadata outside schemas AND schemas exist")
     NextToken: Optional[str] = Field(None, description="Token for next page")
-    message: str = Field(default="Success", description="Response message")
\ No newline at end of file
+    message: str = Field(default="Success", description="Response message")
+
+
+#######################
+# Bulk Metadata Import Models
+#######################
+
+class ImportMetadataRequestModel(BaseModel, extra='ignore'):
+    """Request model for importing metadata rows from an NDJSON or CSV file stored on an asset"""
+    sourceAssetId: str = Field(..., description="Asset ID (in the same database) holding the import file")
+    sourceFilePath: str = Field(..., description="Relative path of the import file within the source asset")
+    format: Optional[Literal["ndjson", "csv"]] = Field(
+        None, description="File format; inferred from the file extension when not provided")
+    startRow: int = Field(default=0, ge=0, description="Zero-based data row to resume the import from")
+
+    @validator('format', pre=True)
+    def normalize_format(cls, v):
+        """Convert format to lowercase"""
+        if isinstance(v, str):
+            return v.lower()
+        return v
+
+    @root_validator
+    def validate_fields(cls, values):
+        """Normalize and validate the source file and resolve the format"""
+        from common.validators import validate
+
+        # Normalize: Add leading slash if missing
+        file_path = values.get('sourceFilePath', '')
+        if file_path and not file_path.startswith('/'):
+            values['sourceFilePath'] = '/' + file_path
+
+        (valid, message) = validate({
+            'sourceAssetId': {
+                'value': values.get('sourceAssetId'),
+                'validator': 'ASSET_ID'
+            },
+            'sourceFilePath': {
+                'value': values.get('sourceFilePath'),
+                'validator': 'RELATIVE_FILE_PATH'
+            }
+        })
+        if not valid:
+            logger.error(message)
+            raise ValueError(message)
+
+        if not values.get('format'):
+            lower_path = values.get('sourceFilePath', '').lower()
+            if lower_path.endswith('.csv'):
+                values['format'] = 'csv'
+            elif lower_path.endswith(('.ndjson', '.jsonl')):
+                values['format'] = 'ndjson'
+            else:
+                raise ValueError(
+                    "format must be provided when the source file extension is not .csv, .ndjson or .jsonl")
+
+        return values
+
+
+class ImportMetadataRowModel(MetadataItemModel, extra='ignore'):
+    """A single import row: one metadata item (or file attribute) for an asset or one of its files"""
+    assetId: str = Field(..., description="Asset ID")
+    filePath: Optional[str] = Field(None, description="Relative file path; omit for asset metadata")
+    type: Literal["metadata", "attribute"] = Field(default="metadata", description="Type: metadata or attribute")
+
+    @root_validator
+    def validate_row(cls, values):
+        """Validate the target asset/file and attribute constraints"""
+        from common.validators import validate
+
+        # Normalize: Add leading slash if missing
+        file_path = values.get('filePath')
+        if file_path and not file_path.startswith('/'):
+            values['filePath'] = '/' + file_path
+
+        (valid, message) = validate({
+            'assetId': {
+                'value': values.get('assetId'),
+                'validator': 'ASSET_ID'
+            },
+            'filePath': {
+                'value': values.get('filePath'),
+                'validator': 'RELATIVE_FILE_PATH',
+                'optional': True
+            }
+        })
+        if not valid:
+            raise ValueError(message)
+
+        if values.get('filePath', '') and values['filePath'].endswith('/'):
+            raise ValueError("File path cannot be a folder (must not end with /)")
+
+        if values.get('type') == 'attribute':
+            if not values.get('filePath'):
+                raise ValueError("Attributes can only be imported for files (filePath is required)")
+            if values.get('metadataValueType') != MetadataValueType.STRING:
+                raise ValueError("File attributes only support 'string' metadataValueType")
+
+        return values
+
+
+class ImportMetadataRowErrorModel(BaseModel, extra='ignore'):
+    """A rejected import row"""
+    row: int = Field(..., description="Zero-based data row of the source file")
+    assetId: Optional[str] = Field(None, description="Asset ID of the row")
+    filePath: Optional[str] = Field(None, description="File path of the row")
+    metadataKey: Optional[str] = Field(None, description="Metadata key of the row")
+    error: str = Field(..., description="Reason the row was not imported")
+
+
+class ImportMetadataResponseModel(BaseModel, extra='ignore'):
+    """Response model for a bulk metadata import request"""
+    success: bool = Field(..., description="True if no row failed in this request")
+    totalRows: int = Field(..., description="Total number of data rows in the source file")
+    startRow: int = Field(..., description="First row processed by this request")
+    processedRows: int = Field(..., description="Number of rows processed by this request")
+    successCount: int = Field(..., description="Number of rows written")
+    failureCount: int = Field(..., description="Number of rows rejected")
+    nextRow: Optional[int] = Field(
+        None, description="Row to resume from with startRow; absent when the import is complete")
+    errorReport: List[ImportMetadataRowErrorModel] = Field(default=[], description="Rejected rows with reasons")
+    errorReportTruncated: bool = Field(
+        default=False, description="True if more rows failed than are listed in errorReport")
+    message: str = Field(..., description="Overall operation message")
+    timestamp: str = Field(..., description="Operation timestamp")
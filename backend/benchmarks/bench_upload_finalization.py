@@ -0,0 +1,106 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Benchmark for asset file upload finalization against a local S3 stand-in (moto).
+
+Compares the S3 requests made when completing a multipart upload in each finalization
+mode of handlers/assets/uploadFile.py:
+
+- temporary: CompleteMultipartUpload on the temp-uploads/ key, then a managed copy to the
+  final key with MetadataDirective=REPLACE (as copy_s3_object does), then deleting the temp key
+- direct: ListParts to verify the part set and size (as calculate_total_file_size_from_parts
+  does), then CompleteMultipartUpload on the final key created with its metadata
+
+Parts are uploaded before the timer starts, so only finalization is measured.
+
+Usage (from the backend directory, with requirements-dev.txt installed):
+
+    python -m benchmarks.bench_upload_finalization [--sizes 64 256 1024] [--part-size 8] [--repeat 1]
+"""
+
+import argparse
+import os
+import time
+
+import boto3
+from moto import mock_aws
+
+BUCKET = "vams-asset-bucket"
+ASSET_PREFIX = "assets/asset1/"
+# Mirrors TEMPORARY_UPLOAD_PREFIX and UPLOAD_CONTENT_TYPE in handlers/assets/uploadFile.py
+TEMPORARY_UPLOAD_PREFIX = "temp-uploads/"
+UPLOAD_CONTENT_TYPE = "application/octet-stream"
+METADATA = {"databaseid": "db01", "assetid": "asset1"}
+
+
+def _upload_parts(s3, key, size_mb, part_size_mb, metadata):
+    """Create a multipart upload on key and upload its parts; return its UploadId and parts."""
+    upload_id = s3.create_multipart_upload(Bucket=BUCKET, Key=key, ContentType=UPLOAD_CONTENT_TYPE,
+                                           Metadata=metadata)["UploadId"]
+    part = os.urandom(part_size_mb * 1024 * 1024)
+    parts = []
+    for part_number in range(1, size_mb // part_size_mb + 1):
+        etag = s3.upload_part(Bucket=BUCKET, Key=key, UploadId=upload_id, PartNumber=part_number,
+                              Body=part)["ETag"]
+        parts.append({"PartNumber": part_number, "ETag": etag})
+    return upload_id, parts
+
+
+def finalize_temporary(s3, key, upload_id, parts):
+    """Previous path: complete the temp key, copy it to the final key and delete it."""
+    s3.complete_multipart_upload(Bucket=BUCKET, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts})
+    final_key = key[len(TEMPORARY_UPLOAD_PREFIX):]
+    s3.copy(CopySource={"Bucket": BUCKET, "Key": key}, Bucket=BUCKET, Key=final_key,
+            ExtraArgs={"MetadataDirective": "REPLACE", "Metadata": METADATA})
+    s3.delete_object(Bucket=BUCKET, Key=key)
+    return final_key
+
+
+def finalize_direct(s3, key, upload_id, parts):
+    """Direct path: verify the uploaded parts, then complete the final key in place."""
+    uploaded = s3.list_parts(Bucket=BUCKET, Key=key, UploadId=upload_id)["Parts"]
+    assert {part["PartNumber"] for part in uploaded} == {part["PartNumber"] for part in parts}, "part mismatch"
+    s3.complete_multipart_upload(Bucket=BUCKET, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts})
+    return key
+
+
+def _time(s3, finalize, key, size_mb, part_size_mb, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        upload_id, parts = _upload_parts(s3, key, size_mb, part_size_mb, METADATA)
+        start = time.perf_counter()
+        final_key = finalize(s3, key, upload_id, parts)
+        best = min(best, time.perf_counter() - start)
+        head = s3.head_object(Bucket=BUCKET, Key=final_key)
+        assert head["ContentLength"] == size_mb * 1024 * 1024, "final object size mismatch"
+        assert head["Metadata"] == METADATA, "final object metadata mismatch"
+        s3.delete_object(Bucket=BUCKET, Key=final_key)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 256, 1024], help="File sizes in MB")
+    parser.add_argument("--part-size", type=int, default=8, help="Part size in MB (at least 5)")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        s3 = boto3.client("s3")
+        s3.create_bucket(Bucket=BUCKET)
+        print(f"Finalization time against moto ({args.part_size}MB parts, best of {args.repeat})")
+        for size_mb in args.sizes:
+            temporary_time = _time(s3, finalize_temporary, f"{TEMPORARY_UPLOAD_PREFIX}{ASSET_PREFIX}model.bin",
+                                   size_mb, args.part_size, args.repeat)
+            direct_time = _time(s3, finalize_direct, f"{ASSET_PREFIX}model.bin",
+                                size_mb, args.part_size, args.repeat)
+            print(
+                f"{size_mb:6d} MB  temp+copy {temporary_time:8.2f}s  direct {direct_time:6.2f}s  "
+                f"speedup {temporary_time / direct_time:6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Unit tests for the bulk DynamoDB write engine in the common batchWrite module.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+from unittest.mock import MagicMock
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+# conftest replaces the `common` package with a MagicMock, so load the module from its file;
+# models.common imports the audit logger from customLogging, which conftest mocks as a plain module
+batchWrite = load_backend_module("batchWrite", "common/batchWrite.py",
+                                 dependencies={"customLogging.auditLogging": MagicMock()})
+
+TABLE = "test-metadata"
+KEY_ATTRIBUTES = ["metadataKey", "entityId"]
+
+
+def _key(item):
+    return item["metadataKey"]["S"]
+
+
+def _item(key, value="value"):
+    return {"metadataKey": {"S": key}, "entityId": {"S": "entity1"}, "metadataValue": {"S": value}}
+
+
+class _CallRecorder:
+    """Wrap the DynamoDB client to record write calls and optionally inject failures."""
+
+    def __init__(self, client, unprocessed_once=0, fail_puts_for=None):
+        self._client = client
+        self.calls = []
+        self._unprocessed_once = unprocessed_once
+        self._fail_puts_for = fail_puts_for
+
+    def batch_write_item(self, RequestItems):
+        requests = RequestItems[TABLE]
+        self.calls.append(("batch_write_item", len(requests)))
+        if self._fail_puts_for and any(
+                "PutRequest" in request and _key(request["PutRequest"]["Item"]) == self._fail_puts_for
+                for request in requests):
+            raise batchWrite.ClientError({"Error": {"Code": "InternalServerError", "Message": "boom"}},
+                                         "BatchWriteItem")
+        if self._unprocessed_once:
+            held_back = requests[:self._unprocessed_once]
+            self._unprocessed_once = 0
+            self._client.batch_write_item(RequestItems={TABLE: requests[len(held_back):]})
+            return {"UnprocessedItems": {TABLE: held_back}}
+        return self._client.batch_write_item(RequestItems=RequestItems)
+
+    def transact_write_items(self, TransactItems):
+        self.calls.append(("transact_write_items", len(TransactItems)))
+        return self._client.transact_write_items(TransactItems=TransactItems)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    with mock_aws():
+        dynamodb_client = boto3.client("dynamodb", region_name="us-east-1")
+        dynamodb_client.create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "metadataKey", "KeyType": "HASH"},
+                       {"AttributeName": "entityId", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "metadataKey", "AttributeType": "S"},
+                                  {"AttributeName": "entityId", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST")
+        monkeypatch.setattr(batchWrite, "_backoff", lambda attempt: None)
+        yield dynamodb_client
+
+
+def _stored(client):
+    return {item["metadataKey"]["S"]: item["metadataValue"]["S"] for item in client.scan(TableName=TABLE)["Items"]}
+
+
+def test_batch_write_reports_every_item_in_request_order(client):
+    requests = [{"PutRequest": {"Item": _item(f"key{index:03d}")}} for index in range(120)]
+    recorder = _CallRecorder(client)
+
+    succeeded, failed = batchWrite.batch_write(recorder, TABLE, requests, _key)
+
+    assert succeeded == [f"key{index:03d}" for index in range(120)]
+    assert failed == []
+    assert sorted(size for _, size in recorder.calls) == [20, 25, 25, 25, 25]
+    assert len(_stored(client)) == 120
+
+
+def test_batch_write_retries_unprocessed_items(client):
+    requests = [{"PutRequest": {"Item": _item(f"key{index}")}} for index in range(10)]
+    recorder = _CallRecorder(client, unprocessed_once=4)
+
+    succeeded, failed = batchWrite.batch_write(recorder, TABLE, requests, _key)
+
+    assert failed == []
+    assert len(succeeded) == 10
+    assert recorder.calls == [("batch_write_item", 10), ("batch_write_item", 4)]
+    assert len(_stored(client)) == 10
+
+
+def test_batch_write_reports_failed_batches_per_item(client):
+    requests = [{"PutRequest": {"Item": _item(f"key{index:02d}")}} for index in range(30)]
+    recorder = _CallRecorder(client, fail_puts_for="key27")
+
+    succeeded, failed = batchWrite.batch_write(recorder, TABLE, requests, _key)
+
+    assert succeeded == [f"key{index:02d}" for index in range(25)]
+    assert [item["key"] for item in failed] == [f"key{index:02d}" for index in range(25, 30)]
+    assert all(item["error"] == "Batch write failed" for item in failed)
+
+
+def test_small_replace_all_is_one_transaction(client):
+    for key in ("keep", "drop"):
+        client.put_item(TableName=TABLE, Item=_item(key, "old"))
+    existing = client.scan(TableName=TABLE)["Items"]
+    recorder = _CallRecorder(client)
+
+    result = batchWrite.replace_all(recorder, TABLE, KEY_ATTRIBUTES, existing,
+                                    [_item("keep", "new"), _item("added", "new")], _key)
+
+    assert result == {"deleted": 1, "written": 2}
+    assert recorder.calls == [("transact_write_items", 3)]
+    assert _stored(client) == {"keep": "new", "added": "new"}
+
+
+def test_large_replace_all_rolls_back_on_failure(client):
+    for index in range(60):
+        client.put_item(TableName=TABLE, Item=_item(f"old{index:02d}", "old"))
+    client.put_item(TableName=TABLE, Item=_item("shared", "old"))
+    existing = client.scan(TableName=TABLE)["Items"]
+    before = _stored(client)
+    new_items = [_item(f"new{index:02d}", "new") for index in range(60)] + [_item("shared", "new")]
+    recorder = _CallRecorder(client, fail_puts_for="new59")
+
+    with pytest.raises(batchWrite.VAMSGeneralErrorResponse, match="rolled back successfully"):
+        batchWrite.replace_all(recorder, TABLE, KEY_ATTRIBUTES, existing, new_items, _key)
+
+    assert _stored(client) == before
@@ -0,0 +1,130 @@
+"""
+Unit tests for assetId-only asset resolution in the common dynamodb module.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+from unittest.mock import MagicMock
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import CallCounter, load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+# conftest replaces the `common` package with a MagicMock, so load the module from its file;
+# models.common imports the audit logger from customLogging, which conftest mocks as a plain module
+dynamodbcommon = load_backend_module("dynamodbcommon", "common/dynamodb.py",
+                                     dependencies={"customLogging.auditLogging": MagicMock()})
+
+
+@pytest.fixture
+def asset_table(monkeypatch):
+    monkeypatch.setenv("ASSET_STORAGE_TABLE_NAME", "test-assets")
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="test-assets",
+            KeySchema=[{"AttributeName": "databaseId", "KeyType": "HASH"},
+                       {"AttributeName": "assetId", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "databaseId", "AttributeType": "S"},
+                                  {"AttributeName": "assetId", "AttributeType": "S"}],
+            GlobalSecondaryIndexes=[{
+                "IndexName": "assetIdGSI",
+                "KeySchema": [{"AttributeName": "assetId", "KeyType": "HASH"},
+                              {"AttributeName": "databaseId", "KeyType": "RANGE"}],
+                "Projection": {"ProjectionType": "ALL"},
+            }],
+            BillingMode="PAY_PER_REQUEST")
+
+        # The client and the resource's tables record their reads into one list
+        calls = []
+        reads = ["query", "scan", "get_item"]
+        resource = boto3.resource("dynamodb", region_name="us-east-1")
+        monkeypatch.setattr(dynamodbcommon, "dynamodb_client", CallCounter(client, reads, calls=calls))
+        monkeypatch.setattr(dynamodbcommon, "dynamodb", CallCounter(resource, reads, calls=calls))
+        monkeypatch.setattr(dynamodbcommon, "_asset_database_id_cache", {})
+        yield client, calls
+
+
+def _put_assets(client, database_id, count, start=0):
+    for index in range(start, start + count):
+        client.put_item(TableName="test-assets", Item={
+            "databaseId": {"S": database_id},
+            "assetId": {"S": f"asset{index}"},
+            "assetName": {"S": f"name{index}"},
+        })
+
+
+@pytest.mark.parametrize("asset_count", [10, 1000])
+def test_read_cost_is_constant_as_asset_count_grows(asset_table, asset_count):
+    client, calls = asset_table
+    _put_assets(client, "db1", asset_count)
+
+    asset = dynamodbcommon.get_asset_object_from_id(None, "asset5")
+
+    assert asset["databaseId"] == "db1"
+    assert asset["assetName"] == "name5"
+    # One index query for the databaseId and one keyed query for the asset, never a scan
+    assert calls == ["query", "query"]
+
+
+def test_resolved_pairs_are_cached_per_container(asset_table):
+    client, calls = asset_table
+    _put_assets(client, "db1", 3)
+
+    dynamodbcommon.get_asset_object_from_id(None, "asset1")
+    calls.clear()
+    asset = dynamodbcommon.get_asset_object_from_id(None, "asset1")
+
+    assert asset["databaseId"] == "db1"
+    assert calls == ["query"]
+
+
+def test_stale_cached_pair_is_resolved_again(asset_table):
+    client, _ = asset_table
+    _put_assets(client, "db1", 1)
+    dynamodbcommon.get_asset_object_from_id(None, "asset0")
+
+    # Archiving moves the asset to the #deleted database
+    client.delete_item(TableName="test-assets", Key={"databaseId": {"S": "db1"}, "assetId": {"S": "asset0"}})
+    _put_assets(client, "db1#deleted", 1)
+
+    assert dynamodbcommon.get_asset_object_from_id(None, "asset0")["databaseId"] == "db1#deleted"
+
+
+def test_prefers_active_database_over_archive(asset_table):
+    client, _ = asset_table
+    _put_assets(client, "db1", 1)
+    _put_assets(client, "db0#deleted", 1)
+
+    assert dynamodbcommon.get_asset_object_from_id(None, "asset0")["databaseId"] == "db1"
+
+
+def test_missing_asset_returns_empty_asset_without_scan(asset_table):
+    client, calls = asset_table
+    _put_assets(client, "db1", 5)
+
+    asset = dynamodbcommon.get_asset_object_from_id(None, "missing")
+
+    assert asset["databaseId"] is None
+    assert asset["object__type"] == "asset"
+    assert "scan" not in calls
+
+
+def test_scan_fallback_when_index_query_fails(asset_table, monkeypatch):
+    client, calls = asset_table
+    _put_assets(client, "db1", 3)
+    monkeypatch.setattr(dynamodbcommon, "ASSET_ID_INDEX_NAME", "missingIndex")
+    logger = MagicMock()
+    monkeypatch.setattr(dynamodbcommon, "logger", logger)
+
+    asset = dynamodbcommon.get_asset_object_from_id(None, "asset2")
+
+    assert asset["databaseId"] == "db1"
+    assert "scan" in calls
+    metric = logger.info.call_args.kwargs["extra"]
+    assert (metric["AssetIdScanFallback"], metric["Reason"]) == (1, "IndexQueryFailed")
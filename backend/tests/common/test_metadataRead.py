@@ -0,0 +1,142 @@
+"""
+Unit tests for the shared metadata read library used by the metadata service and workflow execution.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+# models.metadata (imported by metadataSchemaValidation) requires geojson
+pytest.importorskip("geojson")
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+METADATA_TABLE = "test-asset-file-metadata"
+ATTRIBUTE_TABLE = "test-file-attributes"
+SCHEMA_TABLE = "test-metadata-schemas"
+
+
+# conftest replaces the `common` package with a MagicMock, so load the modules from their files
+schemaValidation = load_backend_module("metadataSchemaValidationReal", "common/metadataSchemaValidation.py")
+metadataRead = load_backend_module("metadataReadReal", "common/metadataRead.py",
+                                   dependencies={"common.metadataSchemaValidation": schemaValidation})
+
+
+def _create_metadata_table(client, table_name):
+    client.create_table(
+        TableName=table_name,
+        KeySchema=[{"AttributeName": "metadataKey", "KeyType": "HASH"},
+                   {"AttributeName": "databaseId:assetId:filePath", "KeyType": "RANGE"}],
+        AttributeDefinitions=[{"AttributeName": "metadataKey", "AttributeType": "S"},
+                              {"AttributeName": "databaseId:assetId:filePath", "AttributeType": "S"}],
+        GlobalSecondaryIndexes=[{
+            "IndexName": "DatabaseIdAssetIdFilePathIndex",
+            "KeySchema": [{"AttributeName": "databaseId:assetId:filePath", "KeyType": "HASH"},
+                          {"AttributeName": "metadataKey", "KeyType": "RANGE"}],
+            "Projection": {"ProjectionType": "ALL"},
+        }],
+        BillingMode="PAY_PER_REQUEST")
+
+
+@pytest.fixture
+def tables(monkeypatch):
+    """Create mocked metadata, attribute and schema tables and reset the schema cache."""
+    monkeypatch.setattr(schemaValidation, "SCHEMA_GENERATION_CHECK_SECONDS", 0)
+    schemaValidation._schema_cache.clear()
+    schemaValidation._schema_generation.update({"value": None, "checkedAt": 0.0})
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        _create_metadata_table(client, METADATA_TABLE)
+        _create_metadata_table(client, ATTRIBUTE_TABLE)
+        client.create_table(
+            TableName=SCHEMA_TABLE,
+            KeySchema=[{"AttributeName": "metadataSchemaId", "KeyType": "HASH"},
+                       {"AttributeName": "databaseId:metadataEntityType", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "metadataSchemaId", "AttributeType": "S"},
+                                  {"AttributeName": "databaseId:metadataEntityType", "AttributeType": "S"}],
+            GlobalSecondaryIndexes=[{
+                "IndexName": "DatabaseIdMetadataEntityTypeIndex",
+                "KeySchema": [{"AttributeName": "databaseId:metadataEntityType", "KeyType": "HASH"},
+                              {"AttributeName": "metadataSchemaId", "KeyType": "RANGE"}],
+                "Projection": {"ProjectionType": "ALL"},
+            }],
+            BillingMode="PAY_PER_REQUEST")
+        yield client
+
+
+def _put_record(client, table_name, file_path, key, value, attribute=False):
+    prefix = "attribute" if attribute else "metadata"
+    client.put_item(TableName=table_name, Item={
+        "metadataKey": {"S": key},
+        "databaseId:assetId:filePath": {"S": f"db1:asset1:{file_path}"},
+        f"{prefix}Key": {"S": key},
+        f"{prefix}Value": {"S": value},
+        f"{prefix}ValueType": {"S": "string"},
+    })
+
+
+def _put_schema(client, entity_type, fields):
+    client.put_item(TableName=SCHEMA_TABLE, Item={
+        "metadataSchemaId": {"S": f"{entity_type}Schema"},
+        "databaseId:metadataEntityType": {"S": f"db1:{entity_type}"},
+        "databaseId": {"S": "db1"},
+        "schemaName": {"S": f"{entity_type}Schema"},
+        "fields": {"S": json.dumps({"fields": fields})},
+        "enabled": {"BOOL": True},
+    })
+
+
+def test_asset_metadata_is_enriched_with_schema_fields(tables):
+    _put_record(tables, METADATA_TABLE, "/", "notes", "free text")
+    _put_record(tables, METADATA_TABLE, "/", "title", "Engine")
+    _put_record(tables, METADATA_TABLE, "/model.obj", "polygons", "12")
+    _put_schema(tables, "assetMetadata", [
+        {"metadataFieldKeyName": "title", "metadataFieldValueType": "string", "sequence": 1},
+        {"metadataFieldKeyName": "owner", "metadataFieldValueType": "string", "sequence": 2,
+         "defaultMetadataFieldValue": "unassigned"},
+    ])
+
+    metadata, restrict = metadataRead.read_asset_metadata(
+        tables, METADATA_TABLE, SCHEMA_TABLE, "db1", "asset1",
+        lambda database_id: {"restrictMetadataOutsideSchemas": True})
+
+    # Schema fields first in sequence order (missing ones with their default), then the rest
+    assert [(item["metadataKey"], item["metadataValue"]) for item in metadata] == [
+        ("title", "Engine"), ("owner", "unassigned"), ("notes", "free text")]
+    assert [item["metadataSchemaField"] for item in metadata] == [True, True, False]
+    assert restrict is True
+
+
+def test_file_attributes_are_normalized_to_metadata_fields(tables):
+    _put_record(tables, ATTRIBUTE_TABLE, "/parts/model.obj", "units", "mm", attribute=True)
+
+    file_path = metadataRead.normalize_metadata_file_path("asset1", "asset1/parts/model.obj")
+    attributes, restrict = metadataRead.read_file_metadata(
+        tables, ATTRIBUTE_TABLE, SCHEMA_TABLE, "db1", "asset1", file_path, "attribute")
+
+    assert file_path == "/parts/model.obj"
+    assert [(item["metadataKey"], item["metadataValue"], item["metadataValueType"]) for item in attributes] == [
+        ("units", "mm", "string")]
+    # Without a database config lookup the restriction is never reported
+    assert restrict is False
+
+
+def test_records_returned_unenriched_when_schemas_fail(tables, monkeypatch):
+    _put_record(tables, METADATA_TABLE, "/", "title", "Engine")
+
+    def failing_schemas(**kwargs):
+        raise RuntimeError("schema table unavailable")
+
+    monkeypatch.setattr(metadataRead, "get_aggregated_schemas", failing_schemas)
+    metadata, restrict = metadataRead.read_asset_metadata(
+        tables, METADATA_TABLE, SCHEMA_TABLE, "db1", "asset1", lambda database_id: {})
+
+    assert metadata == [{"metadataKey": "title", "metadataValue": "Engine", "metadataValueType": "string"}]
+    assert restrict is False
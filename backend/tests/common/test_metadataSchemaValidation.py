@@ -0,0 +1,138 @@
+"""
+Unit tests for the schema-generation cache and compiled validators in the common metadataSchemaValidation module.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import CallCounter, load_backend_module
+
+# models.metadata (imported by the module) requires geojson
+pytest.importorskip("geojson")
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+# conftest replaces the `common` package with a MagicMock, so load the module from its file
+schemaValidation = load_backend_module("metadataSchemaValidation", "common/metadataSchemaValidation.py")
+
+TABLE = "test-metadata-schemas"
+
+
+def _put_schema(client, schema_id, fields):
+    client.put_item(TableName=TABLE, Item={
+        "metadataSchemaId": {"S": schema_id},
+        "databaseId:metadataEntityType": {"S": "db1:assetMetadata"},
+        "databaseId": {"S": "db1"},
+        "schemaName": {"S": schema_id},
+        "fields": {"S": json.dumps({"fields": fields})},
+        "enabled": {"BOOL": True},
+    })
+
+
+@pytest.fixture
+def schema_table(monkeypatch):
+    """Create a mocked schema table and reset the module caches."""
+    monkeypatch.setattr(schemaValidation, "SCHEMA_GENERATION_CHECK_SECONDS", 0)
+    schemaValidation._schema_cache.clear()
+    schemaValidation._schema_generation.update({"value": None, "checkedAt": 0.0})
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "metadataSchemaId", "KeyType": "HASH"},
+                       {"AttributeName": "databaseId:metadataEntityType", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "metadataSchemaId", "AttributeType": "S"},
+                                  {"AttributeName": "databaseId:metadataEntityType", "AttributeType": "S"}],
+            GlobalSecondaryIndexes=[{
+                "IndexName": "DatabaseIdMetadataEntityTypeIndex",
+                "KeySchema": [{"AttributeName": "databaseId:metadataEntityType", "KeyType": "HASH"},
+                              {"AttributeName": "metadataSchemaId", "KeyType": "RANGE"}],
+                "Projection": {"ProjectionType": "ALL"},
+            }],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        yield client
+
+
+def _aggregate(client):
+    return schemaValidation.get_aggregated_schemas(["db1", "GLOBAL"], "assetMetadata", None, client, TABLE)
+
+
+def test_cached_schemas_reused_while_generation_unchanged(schema_table):
+    _put_schema(schema_table, "s1", [{"metadataFieldKeyName": "title", "metadataFieldValueType": "string"}])
+    counter = CallCounter(schema_table, ["query", "get_item", "update_item"])
+
+    assert list(_aggregate(counter)) == ["title"]
+    assert list(_aggregate(counter)) == ["title"]
+
+    # One query per database on the first call, then only generation reads
+    assert counter.calls == ["get_item", "query", "query", "get_item"]
+
+
+def test_generation_bump_invalidates_cached_schemas(schema_table):
+    _put_schema(schema_table, "s1", [{"metadataFieldKeyName": "title", "metadataFieldValueType": "string"}])
+    assert list(_aggregate(schema_table)) == ["title"]
+
+    # Another container saves a schema change and bumps the generation
+    _put_schema(schema_table, "s1", [{"metadataFieldKeyName": "owner", "metadataFieldValueType": "string"}])
+    schema_table.update_item(TableName=TABLE, Key=schemaValidation.SCHEMA_GENERATION_KEY,
+                             UpdateExpression="ADD generation :one", ExpressionAttributeValues={":one": {"N": "1"}})
+
+    assert list(_aggregate(schema_table)) == ["owner"]
+
+
+def test_bump_schema_generation_increments_counter(schema_table):
+    schemaValidation.bump_schema_generation(schema_table, TABLE)
+    schemaValidation.bump_schema_generation(schema_table, TABLE)
+
+    item = schema_table.get_item(TableName=TABLE, Key=schemaValidation.SCHEMA_GENERATION_KEY)["Item"]
+    assert item["generation"]["N"] == "2"
+
+
+def test_compiled_validation_applies_defaults_required_and_depends_on(schema_table):
+    _put_schema(schema_table, "s1", [
+        {"metadataFieldKeyName": "status", "metadataFieldValueType": "string", "defaultMetadataFieldValue": "draft"},
+        {"metadataFieldKeyName": "title", "metadataFieldValueType": "string", "required": True},
+        {"metadataFieldKeyName": "reviewer", "metadataFieldValueType": "string", "dependsOnFieldKeyName": ["owner"]},
+        {"metadataFieldKeyName": "owner", "metadataFieldValueType": "string", "dependsOnFieldKeyName": ["team"]},
+        {"metadataFieldKeyName": "team", "metadataFieldValueType": "string"},
+    ])
+    schema = _aggregate(schema_table)
+    assert schema.compiled is not None
+
+    is_valid, errors, with_defaults = schemaValidation.validate_metadata_against_schema(
+        {"reviewer": {"metadataValue": "alice", "metadataValueType": "string"},
+         "owner": {"metadataValue": "bob", "metadataValueType": "string"}},
+        schema, "POST")
+
+    assert not is_valid
+    assert with_defaults["status"] == {"metadataValue": "draft", "metadataValueType": "string"}
+    assert "Required field 'title' is missing" in errors
+    assert errors.count("Field 'owner' depends on 'team', but 'team' is not provided") == 1
+
+    is_valid, errors, _ = schemaValidation.validate_metadata_against_schema(
+        {"title": {"metadataValue": "Bridge", "metadataValueType": "string"},
+         "reviewer": {"metadataValue": "alice", "metadataValueType": "string"},
+         "owner": {"metadataValue": "bob", "metadataValueType": "string"},
+         "team": {"metadataValue": "inspections", "metadataValueType": "string"}},
+        schema, "POST")
+    assert is_valid, errors
+
+
+def test_depends_on_cycle_reported():
+    schema = {
+        "a": {"metadataFieldValueType": "string", "dependsOnFieldKeyName": ["b"]},
+        "b": {"metadataFieldValueType": "string", "dependsOnFieldKeyName": ["a"]},
+    }
+    metadata = {"a": {"metadataValue": "1"}, "b": {"metadataValue": "2"}}
+
+    is_valid, errors = schemaValidation.validate_depends_on_chain(metadata, schema)
+
+    assert not is_valid
+    assert "Circular dependency detected: a -> b -> a" in errors
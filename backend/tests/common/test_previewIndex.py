@@ -0,0 +1,137 @@
+"""
+Unit tests for the preview-existence index common module.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+from datetime import datetime, timezone
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+# conftest replaces the `common` package with a MagicMock, so load the module from its file
+previewIndex = load_backend_module("previewIndex", "common/previewIndex.py")
+
+
+TABLE_NAME = "previewIndexStorageTable"
+BUCKET = "test-asset-bucket"
+BASE_KEY = "test-asset/models/chair.glb"
+
+
+@pytest.fixture
+def preview_index_table(monkeypatch):
+    """Create a mocked preview index table and point the module at it."""
+    with mock_aws():
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        monkeypatch.setenv("PREVIEW_INDEX_STORAGE_TABLE_NAME", TABLE_NAME)
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        table = dynamodb.create_table(
+            TableName=TABLE_NAME,
+            KeySchema=[{"AttributeName": "bucketName:baseFileKey", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "bucketName:baseFileKey", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        monkeypatch.setattr(previewIndex, "dynamodb", dynamodb)
+        monkeypatch.setattr(previewIndex, "_preview_index_table", None)
+        yield table
+
+
+class TestGetBaseKeyForPreview:
+    """Test mapping of preview file keys to their base file key."""
+
+    def test_preview_key(self):
+        assert previewIndex.get_base_key_for_preview(f"{BASE_KEY}.previewFile.gif") == BASE_KEY
+
+    def test_preview_key_uppercase_extension(self):
+        assert previewIndex.get_base_key_for_preview(f"{BASE_KEY}.previewFile.JPG") == BASE_KEY
+
+    def test_non_preview_key(self):
+        assert previewIndex.get_base_key_for_preview(BASE_KEY) is None
+
+    def test_unsupported_preview_extension(self):
+        assert previewIndex.get_base_key_for_preview(f"{BASE_KEY}.previewFile.txt") is None
+
+
+class TestPreviewIndexLookups:
+    """Test index maintenance and lookups."""
+
+    def test_lookup_without_table_configured(self, monkeypatch):
+        monkeypatch.delenv("PREVIEW_INDEX_STORAGE_TABLE_NAME", raising=False)
+        monkeypatch.setattr(previewIndex, "_preview_index_table", None)
+
+        assert previewIndex.lookup_preview_file_keys(BUCKET, BASE_KEY) is None
+
+    def test_lookup_unknown_base_file_falls_back(self, preview_index_table):
+        assert previewIndex.lookup_preview_file_keys(BUCKET, BASE_KEY) is None
+
+    def test_base_file_without_previews(self, preview_index_table):
+        previewIndex.record_base_file_created(BUCKET, BASE_KEY, [], "2025-01-01T00:00:00.000Z")
+
+        assert previewIndex.lookup_preview_file_keys(BUCKET, BASE_KEY) == []
+
+    def test_preview_created_and_deleted(self, preview_index_table):
+        gif_key = f"{BASE_KEY}.previewFile.gif"
+        jpg_key = f"{BASE_KEY}.previewFile.jpg"
+        previewIndex.record_base_file_created(BUCKET, BASE_KEY, [], "2025-01-01T00:00:00.000Z")
+        previewIndex.record_preview_file_created(BUCKET, jpg_key, "2025-01-01T00:01:00.000Z")
+        previewIndex.record_preview_file_created(BUCKET, gif_key, "2025-01-01T00:02:00.000Z")
+
+        assert previewIndex.lookup_preview_file_keys(BUCKET, BASE_KEY) == [gif_key, jpg_key]
+
+        previewIndex.record_preview_file_deleted(BUCKET, jpg_key)
+
+        assert previewIndex.lookup_preview_file_keys(BUCKET, BASE_KEY) == [gif_key]
+
+    def test_preview_deleted_without_record(self, preview_index_table):
+        previewIndex.record_preview_file_deleted(BUCKET, f"{BASE_KEY}.previewFile.gif")
+
+        assert previewIndex.lookup_preview_file_keys(BUCKET, BASE_KEY) is None
+
+    def test_base_file_deleted(self, preview_index_table):
+        previewIndex.record_base_file_created(BUCKET, BASE_KEY, [f"{BASE_KEY}.previewFile.gif"])
+        previewIndex.record_base_file_deleted(BUCKET, BASE_KEY)
+
+        assert previewIndex.lookup_preview_file_keys(BUCKET, BASE_KEY) is None
+
+
+class TestIsPreviewUpToDate:
+    """Test preview freshness against the base file write time."""
+
+    def test_preview_written_after_base_file(self, preview_index_table):
+        previewIndex.record_base_file_created(BUCKET, BASE_KEY, [], "2025-01-01T00:00:00.000Z")
+        previewIndex.record_preview_file_created(BUCKET, f"{BASE_KEY}.previewFile.gif", "2025-01-01T00:05:00.000Z")
+
+        assert previewIndex.is_preview_up_to_date(previewIndex.get_preview_index_record(BUCKET, BASE_KEY))
+
+    def test_base_file_rewritten_after_preview(self, preview_index_table):
+        preview_key = f"{BASE_KEY}.previewFile.gif"
+        previewIndex.record_preview_file_created(BUCKET, preview_key, "2025-01-01T00:05:00.000Z")
+        previewIndex.record_base_file_created(BUCKET, BASE_KEY, [preview_key], "2025-01-02T00:00:00.000Z")
+
+        assert not previewIndex.is_preview_up_to_date(previewIndex.get_preview_index_record(BUCKET, BASE_KEY))
+
+    def test_backfilled_preview_is_not_up_to_date(self, preview_index_table):
+        previewIndex.record_base_file_created(BUCKET, BASE_KEY, [f"{BASE_KEY}.previewFile.gif"],
+                                              "2025-01-01T00:00:00.000Z")
+
+        assert not previewIndex.is_preview_up_to_date(previewIndex.get_preview_index_record(BUCKET, BASE_KEY))
+
+    def test_base_file_last_modified_overrides_stale_index(self, preview_index_table):
+        # Bucket sync has not yet recorded the re-upload, so the index still shows the old base write
+        preview_key = f"{BASE_KEY}.previewFile.gif"
+        previewIndex.record_base_file_created(BUCKET, BASE_KEY, [], "2025-01-01T00:00:00.000Z")
+        previewIndex.record_preview_file_created(BUCKET, preview_key, "2025-01-01T00:05:00.000Z")
+        record = previewIndex.get_preview_index_record(BUCKET, BASE_KEY)
+
+        reuploaded_at = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        assert not previewIndex.is_preview_up_to_date(record, reuploaded_at)
+        assert previewIndex.is_preview_up_to_date(record, datetime(2025, 1, 1, 0, 1, tzinfo=timezone.utc))
+
+    def test_no_record(self):
+        assert not previewIndex.is_preview_up_to_date(None)
@@ -0,0 +1,100 @@
+"""
+Unit tests for the S3 asset content validation in the common s3 module.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+
+# conftest replaces the `common` package with a MagicMock, so load modules from their files
+constants = load_backend_module("constants", "common/constants.py")
+s3common = load_backend_module("s3common", "common/s3.py")
+s3common.UNALLOWED_FILE_EXTENSION_LIST = constants.UNALLOWED_FILE_EXTENSION_LIST
+s3common.UNALLOWED_MIME_LIST = constants.UNALLOWED_MIME_LIST
+
+BUCKET = "test-asset-bucket"
+PREFIX = "test-asset/"
+
+
+@pytest.fixture
+def s3_bucket(monkeypatch):
+    """Create a mocked asset bucket and point the module's client at it."""
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        monkeypatch.setattr(s3common, "s3c", client)
+        yield client
+
+
+class _HeadCounter:
+    """Wrap the S3 client to count HEAD requests."""
+
+    def __init__(self, client):
+        self._client = client
+        self.head_keys = []
+
+    def head_object(self, **kwargs):
+        self.head_keys.append(kwargs["Key"])
+        return self._client.head_object(**kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+def test_allows_objects_with_allowed_extensions_and_content_types(s3_bucket):
+    for index in range(25):
+        s3_bucket.put_object(Bucket=BUCKET, Key=f"{PREFIX}model_{index}.glb", Body=b"x",
+                             ContentType="model/gltf-binary")
+
+    assert s3common.validateS3AssetExtensionsAndContentType(BUCKET, PREFIX) is True
+
+
+def test_rejects_unallowed_extension_from_listing_without_head(s3_bucket, monkeypatch):
+    s3_bucket.put_object(Bucket=BUCKET, Key=f"{PREFIX}model.glb", Body=b"x")
+    s3_bucket.put_object(Bucket=BUCKET, Key=f"{PREFIX}payload.jar", Body=b"x")
+    counter = _HeadCounter(s3_bucket)
+    monkeypatch.setattr(s3common, "s3c", counter)
+
+    assert s3common.validateS3AssetExtensionsAndContentType(BUCKET, PREFIX) is False
+    assert counter.head_keys == []
+
+
+def test_rejects_unallowed_content_type(s3_bucket):
+    s3_bucket.put_object(Bucket=BUCKET, Key=f"{PREFIX}model.glb", Body=b"x", ContentType="model/gltf-binary")
+    s3_bucket.put_object(Bucket=BUCKET, Key=f"{PREFIX}disguised.bin", Body=b"x",
+                         ContentType="application/java-archive")
+
+    assert s3common.validateS3AssetExtensionsAndContentType(BUCKET, PREFIX) is False
+
+
+def test_validates_provided_keys_without_listing_prefix(s3_bucket, monkeypatch):
+    # An unrelated object under the prefix must not be looked at when keys are provided
+    s3_bucket.put_object(Bucket=BUCKET, Key=f"{PREFIX}other.bin", Body=b"x", ContentType="application/java-archive")
+    s3_bucket.put_object(Bucket=BUCKET, Key=f"{PREFIX}uploaded.glb", Body=b"x")
+    counter = _HeadCounter(s3_bucket)
+    monkeypatch.setattr(s3common, "s3c", counter)
+
+    assert s3common.validateS3AssetExtensionsAndContentType(
+        BUCKET, PREFIX, keys=[f"{PREFIX}uploaded.glb", f"{PREFIX}uploaded.glb"]) is True
+    assert counter.head_keys == [f"{PREFIX}uploaded.glb"]
+
+
+def test_lists_beyond_first_page(s3_bucket):
+    for index in range(1001):
+        s3_bucket.put_object(Bucket=BUCKET, Key=f"{PREFIX}{index:05d}.glb", Body=b"")
+    s3_bucket.put_object(Bucket=BUCKET, Key=f"{PREFIX}zzzz.exe", Body=b"")
+
+    assert s3common.validateS3AssetExtensionsAndContentType(BUCKET, PREFIX) is False
+
+
+def test_empty_prefix_is_valid(s3_bucket):
+    assert s3common.validateS3AssetExtensionsAndContentType(BUCKET, PREFIX) is True
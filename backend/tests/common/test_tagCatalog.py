@@ -0,0 +1,136 @@
+"""
+Unit tests for the generation-invalidated tag catalog cache in the common tagCatalog module.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+from unittest.mock import MagicMock
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import CallCounter, load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+# conftest replaces the `common` package with a MagicMock, so load the module from its file;
+# models.common imports the audit logger from customLogging, which conftest mocks as a plain module
+tagCatalog = load_backend_module("tagCatalog", "common/tagCatalog.py",
+                                 dependencies={"customLogging.auditLogging": MagicMock()})
+
+TAG_TABLE = "test-tags"
+TAG_TYPE_TABLE = "test-tag-types"
+
+
+@pytest.fixture
+def tables(monkeypatch):
+    """Create mocked tag tables and reset the module cache."""
+    monkeypatch.setattr(tagCatalog, "_catalog_cache",
+                        {'catalog': None, 'generation': None, 'loadedAt': 0.0, 'checkedAt': 0.0})
+    # Check the generation on every call so tests see writes immediately
+    monkeypatch.setattr(tagCatalog, "TAG_CATALOG_GENERATION_CHECK_SECONDS", 0)
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName=TAG_TABLE,
+            KeySchema=[{"AttributeName": "tagName", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "tagName", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST")
+        client.create_table(
+            TableName=TAG_TYPE_TABLE,
+            KeySchema=[{"AttributeName": "tagTypeName", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "tagTypeName", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST")
+        yield client, CallCounter(client, ["scan", "get_item", "update_item"])
+
+
+def _put_tag_type(client, name, required="False"):
+    client.put_item(TableName=TAG_TYPE_TABLE, Item={
+        "tagTypeName": {"S": name},
+        "description": {"S": f"{name} tags"},
+        "required": {"S": required},
+    })
+
+
+def _put_tag(client, name, tag_type):
+    client.put_item(TableName=TAG_TABLE, Item={
+        "tagName": {"S": name},
+        "description": {"S": f"{name} tag"},
+        "tagTypeName": {"S": tag_type},
+    })
+
+
+def _get(counter):
+    return tagCatalog.get_tag_catalog(counter, TAG_TABLE, TAG_TYPE_TABLE)
+
+
+def test_catalog_joins_tags_and_types(tables):
+    client, counter = tables
+    _put_tag_type(client, "status", required="True")
+    _put_tag_type(client, "region")
+    _put_tag_type(client, "unused", required="True")
+    _put_tag(client, "draft", "status")
+    _put_tag(client, "approved", "status")
+    _put_tag(client, "emea", "region")
+
+    catalog = _get(counter)
+
+    assert catalog.tag_names == ["approved", "draft", "emea"]
+    assert catalog.tag_type_by_tag == {"approved": "status", "draft": "status", "emea": "region"}
+    assert [(t["tagTypeName"], t["tags"]) for t in catalog.tag_types] == [
+        ("region", ["emea"]), ("status", ["approved", "draft"]), ("unused", [])]
+    assert [t["tagTypeName"] for t in catalog.display_tags] == ["status [R]", "status [R]", "region"]
+    assert catalog.required_tag_types == ["status"]
+
+
+def test_catalog_is_reused_until_generation_changes(tables):
+    client, counter = tables
+    _put_tag_type(client, "status")
+    _put_tag(client, "draft", "status")
+
+    first = _get(counter)
+    second = _get(counter)
+    assert second is first
+    assert counter.calls.count("scan") == 2
+
+    _put_tag(client, "approved", "status")
+    tagCatalog.bump_tag_catalog_generation(counter, TAG_TYPE_TABLE)
+    counter.calls.clear()
+
+    third = _get(counter)
+    assert third.tag_names == ["approved", "draft"]
+    assert counter.calls == ["get_item", "scan", "scan"]
+    # The generation counter item never shows up as a tag type
+    assert [t["tagTypeName"] for t in third.tag_types] == ["status"]
+
+
+def test_pagination_cursor_walks_sorted_items(tables):
+    client, counter = tables
+    _put_tag_type(client, "status")
+    for name in ("d", "a", "c", "b", "e"):
+        _put_tag(client, name, "status")
+    catalog = _get(counter)
+
+    seen = []
+    token = None
+    while True:
+        page = tagCatalog.paginate_catalog_items(
+            catalog.tags, catalog.tag_names, {"maxItems": 2, "startingToken": token})
+        seen.extend(item["tagName"] for item in page["Items"])
+        token = page.get("NextToken")
+        if not token:
+            break
+
+    assert seen == ["a", "b", "c", "d", "e"]
+
+    # Pages are copies, so callers can annotate items without touching the cache
+    page = tagCatalog.paginate_catalog_items(catalog.tags, catalog.tag_names, {"maxItems": 1})
+    page["Items"][0]["object__type"] = "tag"
+    assert "object__type" not in catalog.tags[0]
+
+
+def test_invalid_cursor_is_rejected(tables):
+    with pytest.raises(tagCatalog.VAMSGeneralErrorResponse):
+        tagCatalog.paginate_catalog_items([], [], {"maxItems": 10, "startingToken": "not-a-cursor"})
@@ -5,6 +5,7 @@ This file contains fixtures and configuration for pytest tests.
 """
 
 import boto3
+import importlib.util
 import json
 import os
 import sys
@@ -20,7 +21,10 @@ class MockSafeLogger:
     def __init__(self, service=None, service_name=None):
         self.service = service_name if service_name is not None else service
         
-    def info(self, message):
+    def debug(self, message):
+        pass
+        
+    def info(self, message, **kwargs):
         pass
         
     def warning(self, message):
@@ -48,6 +52,7 @@ sys.modules['common.validators'].validate = lambda params: (True, "")
 sys.modules['common.dynamodb'] = MagicMock()
 sys.modules['common.dynamodb'].get_asset_object_from_id = lambda asset_id: {"assetId": asset_id}
 sys.modules['common.constants'] = MagicMock()
+sys.modules['common.constants'].MAX_DIGEST_FILES = 50
 sys.modules['common.constants'].STANDARD_JSON_RESPONSE = {
     "statusCode": 200,
     "headers": {
@@ -133,6 +138,97 @@ os.environ['CONSTRAINTS_TABLE_NAME'] = 'constraintTable'
 os.environ["USER_ROLES_TABLE_NAME"] = "userRolesTable"
 os.environ["ROLES_TABLE_NAME"] = "rolesTable"
 
+# Root of the backend source tree (backend/backend)
+BACKEND_SOURCE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "backend"))
+
+
+def load_backend_module(name: str, relative_path: str, dependencies: Optional[Dict[str, Any]] = None):
+    """
+    Load a backend source module from its file under the given module name.
+
+    The mocks above replace the common and handlers packages in sys.modules, so tests of the real
+    implementation load it from its file instead of importing it. Backend modules first imported
+    while loading that bound a mocked dependency (such as models.common binding a stub audit logger)
+    are dropped from sys.modules afterwards, so the stubs do not leak into later imports.
+
+    Args:
+        name: Name to load the module under (not registered in sys.modules)
+        relative_path: Path of the source file relative to BACKEND_SOURCE_DIR
+        dependencies: Modules to register under their import names while the module is loaded,
+            in place of the mocks; the previous sys.modules entries are restored afterwards
+
+    Returns:
+        module: The loaded module
+    """
+    dependencies = dependencies or {}
+    previous = {import_name: sys.modules.get(import_name) for import_name in dependencies}
+    already_imported = set(sys.modules)
+    sys.modules.update(dependencies)
+    try:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(BACKEND_SOURCE_DIR, relative_path))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        stubs = [dependency for dependency in dependencies.values() if isinstance(dependency, MagicMock)]
+        for import_name in set(sys.modules) - already_imported - set(dependencies):
+            imported = sys.modules[import_name]
+            if not (getattr(imported, "__file__", None) or "").startswith(BACKEND_SOURCE_DIR + os.sep):
+                continue
+            if any(value is getattr(stub, attribute, None)
+                   for attribute, value in vars(imported).items() if not attribute.startswith("_")
+                   for stub in stubs if attribute in dir(stub)):
+                del sys.modules[import_name]
+        for import_name, previous_module in previous.items():
+            if previous_module is not None:
+                sys.modules[import_name] = previous_module
+            else:
+                del sys.modules[import_name]
+
+
+class CallCounter:
+    """
+    Wrap a boto3 client, resource or table to record calls to selected operations.
+
+    Calls are appended to ``calls`` in order as operation names, or as (operation, kwargs) tuples
+    when record_kwargs is set. Tables of a wrapped resource share the wrapper's calls, and
+    paginators are recorded under the name of the paginated operation.
+    """
+
+    def __init__(self, target, operations, record_kwargs=False, calls=None):
+        """
+        Args:
+            target: The boto3 client, resource or table to wrap
+            operations: Operation names to record
+            record_kwargs: Record (operation, kwargs) tuples instead of operation names
+            calls: Existing list to record into, to share calls between wrappers
+        """
+        self._target = target
+        self._operations = set(operations)
+        self._record_kwargs = record_kwargs
+        self.calls = calls if calls is not None else []
+
+    def _record(self, name, kwargs):
+        if name in self._operations:
+            self.calls.append((name, kwargs) if self._record_kwargs else name)
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if name == "Table":
+            return lambda table_name: CallCounter(
+                attribute(table_name), self._operations, self._record_kwargs, self.calls)
+        if name == "get_paginator":
+            def paginator(operation):
+                self._record(operation, {})
+                return attribute(operation)
+            return paginator
+        if name in self._operations:
+            def counted(*args, **kwargs):
+                self._record(name, kwargs)
+                return attribute(*args, **kwargs)
+            return counted
+        return attribute
+
 
 @pytest.fixture(scope="function")
 def lambda_context():
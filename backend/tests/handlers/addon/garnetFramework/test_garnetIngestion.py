@@ -0,0 +1,116 @@
+"""
+Tests for batched delivery of NGSI-LD entities to the Garnet Framework ingestion queue.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+from decimal import Decimal
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+# conftest replaces the `handlers` package with a MagicMock, so load the module from its file
+garnetIngestion = load_backend_module("garnetIngestion", "handlers/addon/garnetFramework/garnetIngestion.py")
+
+
+class _BatchCounter:
+    """Wrap the SQS client to record SendMessageBatch calls."""
+
+    def __init__(self, client):
+        self._client = client
+        self.batches = []
+
+    def send_message_batch(self, **kwargs):
+        self.batches.append(kwargs["Entries"])
+        return self._client.send_message_batch(**kwargs)
+
+
+@pytest.fixture
+def queue():
+    with mock_aws():
+        sqs = boto3.client("sqs", region_name="us-east-1")
+        queue_url = sqs.create_queue(QueueName="garnet-ingestion")["QueueUrl"]
+        yield sqs, queue_url
+
+
+def _received_entities(sqs, queue_url):
+    """Drain the queue and unpack single-entity and packed messages."""
+    entities = []
+    while True:
+        messages = sqs.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10).get("Messages", [])
+        if not messages:
+            return entities
+        for message in messages:
+            body = json.loads(message["Body"])
+            entities.extend(body if isinstance(body, list) else [body])
+
+
+def test_entities_are_packed_into_one_batch(queue):
+    sqs, queue_url = queue
+    counter = _BatchCounter(sqs)
+    batcher = garnetIngestion.GarnetIngestionBatcher(counter, queue_url, "vams-asset-indexer")
+
+    for index in range(120):
+        batcher.add({"id": f"urn:vams:asset:db1:a{index}", "type": "VAMSAsset", "size": Decimal("1.5")})
+    batcher.add({"id": "urn:vams:assetlink:l1", "type": "VAMSAssetLink"})
+    batcher.flush()
+
+    # 120 assets need 3 messages of at most 50 entities, plus one message for the link type
+    assert len(counter.batches) == 1
+    assert len(counter.batches[0]) == 4
+    assert {entry["MessageAttributes"]["entityType"]["StringValue"] for entry in counter.batches[0]} == {
+        "VAMSAsset", "VAMSAssetLink"}
+    entities = _received_entities(sqs, queue_url)
+    assert len(entities) == 121
+    assert all(entity["size"] == 1.5 for entity in entities if entity["type"] == "VAMSAsset")
+    assert (batcher.sent_entities, batcher.failed_entities) == (121, 0)
+
+
+def test_single_entity_message_carries_the_entity_object(queue):
+    sqs, queue_url = queue
+    batcher = garnetIngestion.GarnetIngestionBatcher(sqs, queue_url, "vams-database-indexer")
+
+    batcher.add({"id": "urn:vams:database:db1", "type": "VAMSDatabase", "name": "old"})
+    batcher.add({"id": "urn:vams:database:db1", "type": "VAMSDatabase", "name": "new"})
+    batcher.flush()
+
+    message = sqs.receive_message(QueueUrl=queue_url)["Messages"][0]
+    # Repeated changes to one entity are sent once, with the latest state
+    assert json.loads(message["Body"]) == {"id": "urn:vams:database:db1", "type": "VAMSDatabase", "name": "new"}
+
+
+def test_batches_respect_the_size_limit(queue, monkeypatch):
+    sqs, queue_url = queue
+    monkeypatch.setattr(garnetIngestion, "MAX_BATCH_BYTES", 2000)
+    counter = _BatchCounter(sqs)
+    batcher = garnetIngestion.GarnetIngestionBatcher(counter, queue_url, "vams-file-indexer")
+
+    for index in range(10):
+        batcher.add({"id": f"urn:vams:file:{index}", "type": "VAMSFile", "payload": "x" * 450})
+    batcher.flush()
+
+    for entries in counter.batches:
+        assert sum(len(entry["MessageBody"]) for entry in entries) <= 2000
+    assert len(_received_entities(sqs, queue_url)) == 10
+
+
+def test_failed_sends_are_counted(queue):
+    _, queue_url = queue
+
+    class _FailingClient:
+        def send_message_batch(self, **kwargs):
+            raise RuntimeError("queue unavailable")
+
+    batcher = garnetIngestion.GarnetIngestionBatcher(_FailingClient(), queue_url, "vams-asset-indexer")
+    batcher.add({"id": "urn:vams:asset:db1:a1", "type": "VAMSAsset"})
+    batcher.add({"id": "urn:vams:asset:db1:a2", "type": "VAMSAsset"})
+    batcher.flush()
+
+    assert (batcher.sent_entities, batcher.failed_entities) == (0, 2)
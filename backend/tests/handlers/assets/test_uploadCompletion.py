@@ -0,0 +1,304 @@
+"""
+Tests for completing asset file uploads, one upload at a time and in batches, against moto.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+from unittest.mock import MagicMock
+import boto3
+import pytest
+from aws_lambda_powertools.utilities.parser import ValidationError, parse
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+os.environ.setdefault("PRESIGNED_URL_TIMEOUT_SECONDS", "3600")
+
+# The upload models validate relative keys with the patterns of the real validators. models.common
+# imports the audit logger from customLogging, which conftest mocks as a plain module, and the preview
+# index and content inspection in common are stubbed (the tests replace the functions they call)
+validators = load_backend_module("validatorsReal", "common/validators.py")
+assetsV3 = load_backend_module("assetsV3Real", "models/assetsV3.py", dependencies={"common.validators": validators})
+uploadFile = load_backend_module(
+    "uploadFileReal", "handlers/assets/uploadFile.py",
+    dependencies={"common.validators": validators,
+                  "models.assetsV3": assetsV3,
+                  "customLogging.auditLogging": MagicMock(),
+                  "common.previewIndex": MagicMock(),
+                  "common.s3": MagicMock()})
+
+BUCKET = "vams-asset-bucket"
+DATABASE_ID = "db01"
+ASSET_ID = "asset1"
+ASSET_PREFIX = "assets/asset1/"
+
+
+def _create_table(dynamodb, name, hash_key, range_key=None):
+    keys = [(hash_key, "HASH")] + ([(range_key, "RANGE")] if range_key else [])
+    dynamodb.create_table(
+        TableName=name,
+        KeySchema=[{"AttributeName": key, "KeyType": key_type} for key, key_type in keys],
+        AttributeDefinitions=[{"AttributeName": key, "AttributeType": "S"} for key, _ in keys],
+        BillingMode="PAY_PER_REQUEST")
+    return dynamodb.Table(name)
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    with mock_aws():
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=BUCKET)
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        buckets_table = _create_table(dynamodb, uploadFile.s3_asset_buckets_table, "bucketId", "bucketName")
+        asset_table = _create_table(dynamodb, uploadFile.asset_storage_table_name, "databaseId", "assetId")
+        upload_table = _create_table(dynamodb, uploadFile.asset_upload_table_name, "uploadId", "assetId")
+        database_table = _create_table(dynamodb, uploadFile.database_storage_table_name, "databaseId")
+
+        buckets_table.put_item(Item={"bucketId": "bucket1", "bucketName": BUCKET, "baseAssetsPrefix": "assets"})
+        database_table.put_item(Item={"databaseId": DATABASE_ID, "restrictFileUploadsToExtensions": ""})
+        asset_table.put_item(Item={"databaseId": DATABASE_ID, "assetId": ASSET_ID, "bucketId": "bucket1",
+                                   "assetLocation": {"Key": ASSET_PREFIX}})
+
+        notifications = MagicMock()
+        monkeypatch.setattr(uploadFile, "s3", s3)
+        monkeypatch.setattr(uploadFile, "s3_resource", boto3.resource("s3", region_name="us-east-1"))
+        monkeypatch.setattr(uploadFile, "dynamodb", dynamodb)
+        monkeypatch.setattr(uploadFile, "buckets_table", buckets_table)
+        monkeypatch.setattr(uploadFile, "asset_table", asset_table)
+        monkeypatch.setattr(uploadFile, "asset_upload_table", upload_table)
+        monkeypatch.setattr(uploadFile, "lambda_client", notifications)
+        monkeypatch.setattr(uploadFile, "log_file_upload", MagicMock())
+        monkeypatch.setattr(uploadFile, "request_to_claims", lambda event: {"tokens": []})
+        # Content inspection lives in common.s3 and has its own tests
+        monkeypatch.setattr(uploadFile, "validateS3AssetExtensionsAndContentType", lambda *args, **kwargs: True)
+        monkeypatch.setattr(uploadFile, "validateUnallowedFileExtensionAndContentType", lambda *args: True)
+
+        yield s3, upload_table, notifications
+
+
+def _record_upload(upload_table, upload_id, finalization_mode=uploadFile.FINALIZATION_MODE_DIRECT):
+    item = {"uploadId": upload_id, "assetId": ASSET_ID, "databaseId": DATABASE_ID, "uploadType": "assetFile",
+            "status": "initialized"}
+    if finalization_mode:
+        item["finalizationMode"] = finalization_mode
+    upload_table.put_item(Item=item)
+
+
+def _start_file(s3, upload_id, relative_key, quarantined=False, parts=1):
+    """Create the multipart upload of a file the way initialization does and upload its parts."""
+    key = ASSET_PREFIX + relative_key.lstrip("/")
+    metadata = {"databaseid": DATABASE_ID, "assetid": ASSET_ID}
+    if quarantined:
+        key = f"assets/{uploadFile.TEMPORARY_UPLOAD_PREFIX}{key}"
+        metadata["uploadid"] = upload_id
+    upload_id_s3 = s3.create_multipart_upload(Bucket=BUCKET, Key=key, ContentType=uploadFile.UPLOAD_CONTENT_TYPE,
+                                              Metadata=metadata)["UploadId"]
+    completed_parts = []
+    for part_number in range(1, parts + 1):
+        etag = s3.upload_part(Bucket=BUCKET, Key=key, UploadId=upload_id_s3, PartNumber=part_number,
+                              Body=b"content")["ETag"]
+        completed_parts.append({"PartNumber": part_number, "ETag": etag})
+    return {"relativeKey": relative_key, "uploadIdS3": upload_id_s3, "parts": completed_parts}
+
+
+def _keys(s3):
+    return sorted(item["Key"] for item in s3.list_objects_v2(Bucket=BUCKET).get("Contents", []))
+
+
+def _notified_keys(notifications):
+    payloads = [json.loads(call.kwargs["Payload"]) for call in notifications.invoke.call_args_list]
+    return [sorted(payload["fileKeys"]) for payload in payloads]
+
+
+def _event(path, body, upload_id=None):
+    event = {"requestContext": {"http": {"path": path, "method": "POST"}}, "body": json.dumps(body)}
+    if upload_id:
+        event["pathParameters"] = {"uploadId": upload_id}
+    return event
+
+
+def _batch_body(uploads):
+    return {"assetId": ASSET_ID, "databaseId": DATABASE_ID, "uploadType": "assetFile", "uploads": uploads}
+
+
+def test_build_completion_context_reads_bucket_and_database(aws):
+    asset = uploadFile.get_asset_details(DATABASE_ID, ASSET_ID)
+
+    context = uploadFile.build_completion_context(asset, DATABASE_ID, ASSET_ID, "assetFile")
+
+    assert (context["bucketName"], context["baseAssetsPrefix"], context["allowedExtensions"]) == (BUCKET, "assets/", "")
+    with pytest.raises(uploadFile.VAMSGeneralErrorResponse):
+        uploadFile.build_completion_context(asset, "missing-db", ASSET_ID, "assetFile")
+
+
+def test_complete_upload_finalizes_direct_and_quarantined_files(aws):
+    s3, upload_table, notifications = aws
+    _record_upload(upload_table, "up1")
+    files = [
+        _start_file(s3, "up1", "/model.obj"),
+        _start_file(s3, "up1", "/model.obj.previewFile.png", quarantined=True),
+        {"relativeKey": "/empty.txt", "uploadIdS3": "zero-byte", "parts": []},
+    ]
+    request = uploadFile.CompleteUploadRequestModel(assetId=ASSET_ID, databaseId=DATABASE_ID, uploadType="assetFile",
+                                                    files=files)
+
+    response = uploadFile.complete_upload("up1", request, {})
+
+    assert response.overallSuccess and all(result.success for result in response.fileResults)
+    # The preview file was quarantined and copied out of the temporary prefix; the others were written in place
+    assert _keys(s3) == [ASSET_PREFIX + "empty.txt", ASSET_PREFIX + "model.obj",
+                         ASSET_PREFIX + "model.obj.previewFile.png"]
+    assert response.assetType == "folder"
+    assert "Item" not in upload_table.get_item(Key={"uploadId": "up1", "assetId": ASSET_ID})
+    assert _notified_keys(notifications) == [["/empty.txt", "/model.obj", "/model.obj.previewFile.png"]]
+
+
+def test_quarantined_preview_without_base_file_is_rejected(aws):
+    s3, upload_table, notifications = aws
+    # Uploads recorded before direct finalization have no mode and quarantine every file
+    _record_upload(upload_table, "up1", finalization_mode=None)
+    files = [
+        _start_file(s3, "up1", "/notes.txt", quarantined=True),
+        _start_file(s3, "up1", "/scan.e57.previewFile.png", quarantined=True),
+    ]
+    request = uploadFile.CompleteUploadRequestModel(assetId=ASSET_ID, databaseId=DATABASE_ID, uploadType="assetFile",
+                                                    files=files)
+
+    response = uploadFile.complete_upload("up1", request, {})
+
+    results = {result.relativeKey: result for result in response.fileResults}
+    assert results["/notes.txt"].success
+    assert not results["/scan.e57.previewFile.png"].success
+    assert "base file" in results["/scan.e57.previewFile.png"].error.lower()
+    # The rejected preview is removed from the temporary prefix and never reaches the asset
+    assert _keys(s3) == [ASSET_PREFIX + "notes.txt"]
+    assert upload_table.get_item(Key={"uploadId": "up1", "assetId": ASSET_ID})["Item"]["status"] == \
+        "completed_with_errors"
+    assert _notified_keys(notifications) == [["/notes.txt"]]
+
+
+def test_complete_upload_files_reports_each_file(aws):
+    s3, _, _ = aws
+    asset = uploadFile.get_asset_details(DATABASE_ID, ASSET_ID)
+    context = uploadFile.build_completion_context(asset, DATABASE_ID, ASSET_ID, "assetFile")
+    good = assetsV3.UploadFileCompletionModel(**_start_file(s3, "up1", "/a.txt"))
+    missing_part = _start_file(s3, "up2", "/b.txt")
+    missing_part["parts"].append({"PartNumber": 2, "ETag": "\"etag\""})
+    bad = assetsV3.UploadFileCompletionModel(**missing_part)
+
+    outcomes = uploadFile.complete_upload_files(
+        [("up1", uploadFile.FINALIZATION_MODE_DIRECT, good), ("up2", uploadFile.FINALIZATION_MODE_DIRECT, bad)],
+        context, [good, bad], {})
+
+    assert [(upload_id, result.success) for upload_id, result, _ in outcomes] == [("up1", True), ("up2", False)]
+    assert "Missing parts: [2]" in outcomes[1][1].error
+    assert outcomes[0][2]["finalized"] and outcomes[1][2] is None
+    assert uploadFile.complete_upload_files([], context, [], {}) == []
+
+
+def test_finalize_completed_files_moves_only_quarantined_files(aws):
+    s3, _, notifications = aws
+    asset = uploadFile.get_asset_details(DATABASE_ID, ASSET_ID)
+    context = uploadFile.build_completion_context(asset, DATABASE_ID, ASSET_ID, "assetFile")
+    temp_key = f"assets/{uploadFile.TEMPORARY_UPLOAD_PREFIX}{ASSET_PREFIX}a.txt"
+    s3.put_object(Bucket=BUCKET, Key=temp_key, Body=b"a")
+    s3.put_object(Bucket=BUCKET, Key=ASSET_PREFIX + "b.txt", Body=b"b")
+    successful_files = [
+        {"relativeKey": "/a.txt", "temp_s3_key": temp_key, "final_s3_key": ASSET_PREFIX + "a.txt"},
+        {"relativeKey": "/b.txt", "temp_s3_key": "unused", "final_s3_key": ASSET_PREFIX + "b.txt", "finalized": True},
+    ]
+    file_results = [uploadFile.FileCompletionResult(relativeKey=key, uploadIdS3="id", success=True)
+                    for key in ["/a.txt", "/b.txt"]]
+
+    uploadFile.finalize_completed_files(successful_files, file_results, context)
+    uploadFile.update_asset_after_file_uploads(context, ["/a.txt", "/b.txt"])
+
+    assert _keys(s3) == [ASSET_PREFIX + "a.txt", ASSET_PREFIX + "b.txt"]
+    assert s3.head_object(Bucket=BUCKET, Key=ASSET_PREFIX + "a.txt")["Metadata"] == {
+        "databaseid": DATABASE_ID, "assetid": ASSET_ID}
+    assert all(result.success for result in file_results)
+    assert uploadFile.get_asset_details(DATABASE_ID, ASSET_ID)["assetType"] == "folder"
+    assert _notified_keys(notifications) == [["/a.txt", "/b.txt"]]
+
+
+def test_get_upload_details_batch_requires_every_upload(aws):
+    _, upload_table, _ = aws
+    _record_upload(upload_table, "up1")
+    _record_upload(upload_table, "up2")
+
+    assert sorted(uploadFile.get_upload_details_batch(["up1", "up2"], ASSET_ID)) == ["up1", "up2"]
+    with pytest.raises(uploadFile.VAMSGeneralErrorResponse, match="Upload up3 not found"):
+        uploadFile.get_upload_details_batch(["up1", "up3"], ASSET_ID)
+
+
+def test_complete_upload_batch_with_partial_failure(aws):
+    s3, upload_table, notifications = aws
+    _record_upload(upload_table, "up1")
+    _record_upload(upload_table, "up2")
+    failing = _start_file(s3, "up2", "/c.txt")
+    failing["parts"].append({"PartNumber": 2, "ETag": "\"etag\""})
+    request = parse(_batch_body([
+        {"uploadId": "up1", "files": [_start_file(s3, "up1", "/a.txt")]},
+        # The preview file's base file is uploaded by another upload of the batch
+        {"uploadId": "up2", "files": [_start_file(s3, "up2", "/a.txt.previewFile.png", quarantined=True), failing]},
+    ]), model=uploadFile.CompleteUploadBatchRequestModel)
+
+    response = uploadFile.complete_upload_batch(request, {})
+
+    results = {result.uploadId: result for result in response.uploadResults}
+    assert not response.overallSuccess
+    assert results["up1"].overallSuccess
+    assert [file.success for file in results["up2"].fileResults] == [True, False]
+    assert _keys(s3) == [ASSET_PREFIX + "a.txt", ASSET_PREFIX + "a.txt.previewFile.png"]
+    assert "Item" not in upload_table.get_item(Key={"uploadId": "up1", "assetId": ASSET_ID})
+    assert upload_table.get_item(Key={"uploadId": "up2", "assetId": ASSET_ID})["Item"]["status"] == \
+        "completed_with_errors"
+    # Subscribers are notified once for the whole batch
+    assert _notified_keys(notifications) == [["/a.txt", "/a.txt.previewFile.png"]]
+
+
+def test_complete_upload_batch_route(aws):
+    s3, upload_table, notifications = aws
+    _record_upload(upload_table, "up1")
+    _record_upload(upload_table, "up2")
+    body = _batch_body([
+        {"uploadId": "up1", "files": [_start_file(s3, "up1", "/a.txt")]},
+        {"uploadId": "up2", "files": [{"relativeKey": "/b.txt", "uploadIdS3": "zero-byte", "parts": []}]},
+    ])
+
+    response = uploadFile.lambda_handler(_event("/uploads/complete/batch", body), None)
+
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["overallSuccess"]
+    assert _notified_keys(notifications) == [["/a.txt", "/b.txt"]]
+
+    # A batch where every file fails is a conflict, like single upload completion
+    _record_upload(upload_table, "up3")
+    failing = _start_file(s3, "up3", "/c.txt")
+    failing["parts"].append({"PartNumber": 2, "ETag": "\"etag\""})
+    response = uploadFile.lambda_handler(_event("/uploads/complete/batch", _batch_body([
+        {"uploadId": "up3", "files": [failing]}])), None)
+
+    assert response["statusCode"] == 409
+    assert len(notifications.invoke.call_args_list) == 1
+
+
+def test_batch_completion_is_limited_to_max_batch_complete_uploads(aws):
+    limit = assetsV3.MAX_BATCH_COMPLETE_UPLOADS
+
+    def uploads(count):
+        return [{"uploadId": f"up{index}", "files": [{"relativeKey": f"/f{index}.txt", "uploadIdS3": "zero-byte",
+                                                      "parts": []}]}
+                for index in range(count)]
+
+    assert len(parse(_batch_body(uploads(limit)), model=uploadFile.CompleteUploadBatchRequestModel).uploads) == limit
+    with pytest.raises(ValidationError, match=f"A maximum of {limit} uploads"):
+        parse(_batch_body(uploads(limit + 1)), model=uploadFile.CompleteUploadBatchRequestModel)
+
+    response = uploadFile.lambda_handler(_event("/uploads/complete/batch", _batch_body(uploads(limit + 1))), None)
+
+    assert response["statusCode"] == 400
+    assert f"A maximum of {limit} uploads" in json.loads(response["body"])["message"]
@@ -0,0 +1,143 @@
+"""
+Tests for keyed constraint access in the auth constraints service: constraint items are read,
+replaced and deleted through ObjectTypeIndex queries and the list endpoint pages with cursors.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+import boto3
+import pytest
+from unittest.mock import MagicMock
+from moto import mock_aws
+
+from backend.tests.conftest import CallCounter, load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ["CONSTRAINTS_TABLE_NAME"] = "test-constraints"
+
+# conftest replaces the `handlers` package with a MagicMock, so load the module from its file;
+# models.common imports the audit logger from customLogging, which conftest mocks as a plain module
+authConstraintsService = load_backend_module("authConstraintsServiceKeyed",
+                                             "handlers/auth/authConstraintsService.py",
+                                             dependencies={"customLogging.auditLogging": MagicMock()})
+
+OBJECT_TYPES = ["database", "asset", "api"]
+CLAIMS = {"tokens": ["test_token"]}
+
+
+@pytest.fixture
+def constraints_table(monkeypatch):
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="test-constraints",
+            KeySchema=[{"AttributeName": "constraintId", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "constraintId", "AttributeType": "S"},
+                                  {"AttributeName": "objectType", "AttributeType": "S"}],
+            GlobalSecondaryIndexes=[{
+                "IndexName": "ObjectTypeIndex",
+                "KeySchema": [{"AttributeName": "objectType", "KeyType": "HASH"},
+                              {"AttributeName": "constraintId", "KeyType": "RANGE"}],
+                "Projection": {"ProjectionType": "ALL"},
+            }],
+            BillingMode="PAY_PER_REQUEST")
+        table = boto3.resource("dynamodb", region_name="us-east-1").Table("test-constraints")
+
+        counter = CallCounter(table, ["scan", "query", "get_item"])
+        monkeypatch.setattr(authConstraintsService, "constraints_table", counter)
+        monkeypatch.setattr(authConstraintsService, "roles_table", None)
+        monkeypatch.setattr(authConstraintsService, "ALLOWED_CONSTRAINT_OBJECT_TYPES", OBJECT_TYPES)
+        yield table, counter
+
+
+def _write_constraint(constraint_id, object_type="asset", groups=(), users=()):
+    authConstraintsService.create_or_update_constraint({
+        "identifier": constraint_id,
+        "name": constraint_id,
+        "description": "test constraint",
+        "objectType": object_type,
+        "criteriaAnd": [{"field": "databaseId", "operator": "equals", "value": "db1"}],
+        "groupPermissions": [{"groupId": g, "permission": "GET", "permissionType": "allow"} for g in groups],
+        "userPermissions": [{"userId": u, "permission": "GET", "permissionType": "allow"} for u in users],
+    }, CLAIMS)
+
+
+def _stored_ids(table):
+    return sorted(item["constraintId"] for item in table.scan()["Items"])
+
+
+def test_get_constraint_details_without_scan(constraints_table):
+    table, counter = constraints_table
+    _write_constraint("c1", groups=["admin"], users=["user1"])
+    _write_constraint("c10", groups=["admin"])
+    counter.calls.clear()
+
+    constraint = authConstraintsService.get_constraint_details("c1")
+
+    assert constraint["constraintId"] == "c1"
+    assert "scan" not in counter.calls
+    assert authConstraintsService.get_constraint_details("missing") is None
+
+
+def test_update_replaces_children_and_keeps_prefix_neighbours(constraints_table):
+    table, counter = constraints_table
+    _write_constraint("c1", object_type="database", groups=["admin", "readers"])
+    _write_constraint("c10", groups=["readers"])
+    counter.calls.clear()
+
+    # Update changes the object type and drops a group
+    _write_constraint("c1", object_type="asset", groups=["admin"], users=["user1"])
+
+    assert "scan" not in counter.calls
+    assert _stored_ids(table) == ["c1#group#admin", "c1#user#user1", "c10#group#readers"]
+    assert authConstraintsService.get_constraint_details("c1")["objectType"] == "asset"
+
+
+def test_delete_removes_only_own_items(constraints_table):
+    table, counter = constraints_table
+    _write_constraint("c1", groups=["admin"], users=["user1"])
+    _write_constraint("c10", groups=["admin"])
+    _write_constraint("empty")
+    counter.calls.clear()
+
+    authConstraintsService.delete_constraint("c1", CLAIMS)
+    authConstraintsService.delete_constraint("empty", CLAIMS)
+
+    assert "scan" not in counter.calls
+    assert _stored_ids(table) == ["c10#group#admin"]
+
+
+def test_list_constraints_pages_with_cursor(constraints_table):
+    table, counter = constraints_table
+    expected = []
+    for index in range(7):
+        constraint_id = f"c{index}"
+        _write_constraint(constraint_id, object_type=OBJECT_TYPES[index % 3],
+                          groups=["admin", "readers"], users=["user1"])
+        expected.append(constraint_id)
+    _write_constraint("no-permissions", object_type="api")
+    expected.append("no-permissions")
+    counter.calls.clear()
+
+    listed = []
+    token = None
+    pages = 0
+    while True:
+        result = authConstraintsService.get_all_constraints({"pageSize": 3, "startingToken": token})
+        assert len(result["Items"]) <= 3
+        listed.extend(item["constraintId"] for item in result["Items"])
+        pages += 1
+        token = result.get("NextToken")
+        if not token:
+            break
+
+    assert sorted(listed) == sorted(expected)
+    assert pages == 3
+    assert "scan" not in counter.calls
+
+
+def test_list_constraints_rejects_invalid_token(constraints_table):
+    with pytest.raises(authConstraintsService.VAMSGeneralErrorResponse):
+        authConstraintsService.get_all_constraints({"pageSize": 3, "startingToken": "not-a-token"})
@@ -0,0 +1,203 @@
+"""
+Tests for keyed comment access in commentService: cursor-paginated listings, the owner index
+listing with per-asset authorization and the conditional (read-free) delete.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import boto3
+import pytest
+from moto import mock_aws
+
+# pytest puts the parent of the backend package on sys.path, so the module imports directly
+import backend.backend.handlers.comments.commentService as commentService
+from backend.tests.conftest import CallCounter
+
+COMMENT_TABLE = "commentStorageTable"
+
+
+class _Logger:
+    def info(self, message):
+        pass
+
+    def warning(self, message):
+        pass
+
+    def error(self, message):
+        pass
+
+    def exception(self, message):
+        pass
+
+
+@pytest.fixture
+def comments(monkeypatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        resource = boto3.resource("dynamodb", region_name="us-east-1")
+        table = resource.create_table(
+            TableName=COMMENT_TABLE,
+            BillingMode="PAY_PER_REQUEST",
+            KeySchema=[
+                {"AttributeName": "assetId", "KeyType": "HASH"},
+                {"AttributeName": "assetVersionId:commentId", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "assetId", "AttributeType": "S"},
+                {"AttributeName": "assetVersionId:commentId", "AttributeType": "S"},
+                {"AttributeName": "commentOwnerID", "AttributeType": "S"},
+                {"AttributeName": "dateCreated", "AttributeType": "S"},
+            ],
+            GlobalSecondaryIndexes=[{
+                "IndexName": commentService.COMMENT_OWNER_INDEX,
+                "KeySchema": [
+                    {"AttributeName": "commentOwnerID", "KeyType": "HASH"},
+                    {"AttributeName": "dateCreated", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            }],
+        )
+        monkeypatch.setattr(commentService, "dynamodb", resource)
+        monkeypatch.setattr(commentService, "comment_database", COMMENT_TABLE)
+        monkeypatch.setattr(commentService, "logger", _Logger())
+        monkeypatch.setattr(commentService, "validate", lambda params: (True, ""))
+        monkeypatch.setattr(commentService, "request_to_claims", lambda event: {"tokens": ["user1"]})
+
+        counter = CallCounter(resource.meta.client, ["query", "scan", "get_item", "delete_item", "put_item"])
+        monkeypatch.setattr(resource.meta, "client", counter)
+        yield table, counter
+
+
+@pytest.fixture
+def enforcer(monkeypatch):
+    """Casbin enforcer stub allowing every asset except 'denied-asset' and counting object checks."""
+    checks = []
+
+    class _Enforcer:
+        def __init__(self, claims_and_roles):
+            pass
+
+        def enforceAPI(self, event):
+            return True
+
+        def enforce(self, asset_object, action):
+            checks.append((asset_object["assetId"], action))
+            return asset_object["assetId"] != "denied-asset"
+
+    monkeypatch.setattr(commentService, "CasbinEnforcer", _Enforcer)
+    monkeypatch.setattr(commentService, "get_asset_object_from_id",
+                        lambda database_id, asset_id: {"assetId": asset_id})
+    return checks
+
+
+def _put_comment(table, asset_id, version_id, comment_id, owner="user1", date="2025-01-01T00:00:00.000000Z"):
+    item = {
+        "assetId": asset_id,
+        "assetVersionId:commentId": f"{version_id}:{comment_id}",
+        "commentBody": f"body {comment_id}",
+        "commentOwnerID": owner,
+        "commentOwnerUsername": owner,
+        "dateCreated": date,
+    }
+    table.put_item(Item=item)
+    return item
+
+
+def _event(method, path_parameters, query_parameters=None):
+    return {
+        "requestContext": {"http": {"method": method}},
+        "pathParameters": path_parameters,
+        "queryStringParameters": query_parameters if query_parameters is not None else {},
+    }
+
+
+def test_asset_listing_pages_with_cursor_and_single_authorization(comments, enforcer):
+    table, counter = comments
+    for index in range(5):
+        _put_comment(table, "asset1", "v1", f"c{index}")
+    _put_comment(table, "asset2", "v1", "other")
+
+    seen = []
+    token = None
+    pages = 0
+    while True:
+        query = {"pageSize": "2"}
+        if token:
+            query["startingToken"] = token
+        response = commentService.lambda_handler(_event("GET", {"assetId": "asset1"}, query), None)
+        assert response["statusCode"] == 200
+        message = json.loads(response["body"])["message"]
+        assert len(message["Items"]) <= 2
+        seen.extend(item["assetVersionId:commentId"] for item in message["Items"])
+        pages += 1
+        token = message.get("NextToken")
+        if not token:
+            break
+
+    assert sorted(seen) == [f"v1:c{index}" for index in range(5)]
+    assert pages == 3
+    assert "scan" not in counter.calls
+    assert enforcer == [("asset1", "GET")] * pages
+
+
+def test_version_listing_does_not_match_longer_version_ids(comments, enforcer):
+    table, _ = comments
+    _put_comment(table, "asset1", "v1", "a")
+    _put_comment(table, "asset1", "v10", "b")
+
+    response = commentService.lambda_handler(
+        _event("GET", {"assetId": "asset1", "assetVersionId": "v1"}, {"pageSize": "10"}), None)
+
+    message = json.loads(response["body"])["message"]
+    assert [item["assetVersionId:commentId"] for item in message["Items"]] == ["v1:a"]
+
+
+def test_invalid_cursor_is_rejected(comments, enforcer):
+    response = commentService.lambda_handler(
+        _event("GET", {"assetId": "asset1"}, {"startingToken": "not-a-cursor"}), None)
+
+    assert response["statusCode"] == 400
+
+
+def test_all_comments_queries_owner_index_and_authorizes_each_asset_once(comments, enforcer):
+    table, counter = comments
+    _put_comment(table, "asset1", "v1", "a", date="2025-01-01T00:00:01.000000Z")
+    _put_comment(table, "asset1", "v1", "b", date="2025-01-01T00:00:02.000000Z")
+    _put_comment(table, "denied-asset", "v1", "c", date="2025-01-01T00:00:03.000000Z")
+    _put_comment(table, "asset2", "v1", "d", owner="user2")
+    _put_comment(table, "asset3#deleted", "v1", "e")
+
+    commentService.claims_and_roles = {"tokens": ["user1"]}
+    commentService.casbin_enforcer = None
+    result = commentService.get_all_comments("user1", {"pageSize": "10", "startingToken": None})
+
+    assert [item["assetVersionId:commentId"] for item in result["Items"]] == ["v1:b", "v1:a"]
+    assert counter.calls == ["query"]
+    assert sorted(enforcer) == [("asset1", "GET"), ("denied-asset", "GET")]
+
+
+def test_delete_is_conditional_without_reading_first(comments, enforcer):
+    table, counter = comments
+    _put_comment(table, "asset1", "v1", "mine")
+    _put_comment(table, "asset1", "v1", "theirs", owner="user2")
+
+    response = commentService.lambda_handler(
+        _event("DELETE", {"assetId": "asset1", "assetVersionId:commentId": "v1:theirs"}), None)
+    assert response["statusCode"] == 403
+
+    response = commentService.lambda_handler(
+        _event("DELETE", {"assetId": "asset1", "assetVersionId:commentId": "v1:missing"}), None)
+    assert response["statusCode"] == 404
+
+    counter.calls.clear()
+    response = commentService.lambda_handler(
+        _event("DELETE", {"assetId": "asset1", "assetVersionId:commentId": "v1:mine"}), None)
+    assert response["statusCode"] == 200
+    assert counter.calls == ["delete_item", "put_item"]
+
+    assert "Item" not in table.get_item(Key={"assetId": "asset1", "assetVersionId:commentId": "v1:mine"})
+    moved = table.get_item(Key={"assetId": "asset1#deleted", "assetVersionId:commentId": "v1:mine"})["Item"]
+    assert moved["commentBody"] == "body mine"
+    assert "Item" in table.get_item(Key={"assetId": "asset1", "assetVersionId:commentId": "v1:theirs"})
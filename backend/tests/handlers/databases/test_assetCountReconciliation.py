@@ -0,0 +1,120 @@
+"""
+Tests for the maintained per-database asset counters: atomic ADD updates from the asset APIs
+and the scheduled COUNT-query reconciliation.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import CallCounter, load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ["DATABASE_STORAGE_TABLE_NAME"] = "test-databases"
+os.environ["ASSET_STORAGE_TABLE_NAME"] = "test-assets"
+
+DB_TABLE = "test-databases"
+ASSET_TABLE = "test-assets"
+
+
+# conftest replaces the `handlers` package with a MagicMock, so load the modules from their files
+assetCount = load_backend_module("assetCountReal", "handlers/assets/assetCount.py")
+reconcileAssetCounts = load_backend_module("reconcileAssetCountsReal", "handlers/databases/reconcileAssetCounts.py",
+                                           dependencies={"handlers.assets.assetCount": assetCount})
+
+
+@pytest.fixture
+def tables(monkeypatch):
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName=DB_TABLE,
+            KeySchema=[{"AttributeName": "databaseId", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "databaseId", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST")
+        client.create_table(
+            TableName=ASSET_TABLE,
+            KeySchema=[{"AttributeName": "databaseId", "KeyType": "HASH"},
+                       {"AttributeName": "assetId", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "databaseId", "AttributeType": "S"},
+                                  {"AttributeName": "assetId", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST")
+
+        counter = CallCounter(client, ["query", "scan", "update_item", "put_item"], record_kwargs=True)
+        monkeypatch.setattr(assetCount, "dynamodb_client", counter)
+        monkeypatch.setattr(reconcileAssetCounts, "dynamodb_client", counter)
+        yield client, counter
+
+
+def _put_database(client, database_id, asset_count):
+    item = {"databaseId": {"S": database_id}}
+    if asset_count is not None:
+        item["assetCount"] = asset_count
+    client.put_item(TableName=DB_TABLE, Item=item)
+
+
+def _put_assets(client, database_id, count):
+    for index in range(count):
+        client.put_item(TableName=ASSET_TABLE, Item={
+            "databaseId": {"S": database_id},
+            "assetId": {"S": f"asset-{index}"},
+        })
+
+
+def _stored_count(client, database_id):
+    return client.get_item(TableName=DB_TABLE, Key={"databaseId": {"S": database_id}})["Item"]["assetCount"]
+
+
+def test_increment_uses_atomic_add_without_counting(tables):
+    client, counter = tables
+    _put_database(client, "db1", {"N": "5"})
+
+    assetCount.increment_asset_count(DB_TABLE, ASSET_TABLE, "db1", 1)
+    assetCount.increment_asset_count(DB_TABLE, ASSET_TABLE, "db1", 1)
+    assetCount.increment_asset_count(DB_TABLE, ASSET_TABLE, "db1", -1)
+
+    assert _stored_count(client, "db1") == {"N": "6"}
+    assert [name for name, _ in counter.calls] == ["update_item"] * 3
+    assert "ADD assetCount" in counter.calls[0][1]["UpdateExpression"]
+
+
+def test_increment_converts_legacy_string_count(tables):
+    client, _ = tables
+    _put_database(client, "db1", {"S": "3"})
+    _put_assets(client, "db1", 4)
+
+    assetCount.increment_asset_count(DB_TABLE, ASSET_TABLE, "db1", 1)
+
+    assert _stored_count(client, "db1") == {"N": "4"}
+
+
+def test_increment_does_not_create_missing_database(tables):
+    client, _ = tables
+
+    assetCount.increment_asset_count(DB_TABLE, ASSET_TABLE, "missing", 1)
+
+    assert "Item" not in client.get_item(TableName=DB_TABLE, Key={"databaseId": {"S": "missing"}})
+
+
+def test_reconcile_corrects_drifted_counts_with_count_queries(tables):
+    client, counter = tables
+    _put_database(client, "db-ok", {"N": "2"})
+    _put_database(client, "db-drifted", {"N": "9"})
+    _put_database(client, "db-legacy", {"S": "1"})
+    _put_database(client, "db-old#deleted", {"N": "7"})
+    _put_assets(client, "db-ok", 2)
+    _put_assets(client, "db-drifted", 3)
+    _put_assets(client, "db-legacy", 1)
+
+    result = reconcileAssetCounts.reconcile_all_asset_counts()
+
+    assert result == {"checked": 3, "corrected": 2, "failed": 0}
+    assert _stored_count(client, "db-ok") == {"N": "2"}
+    assert _stored_count(client, "db-drifted") == {"N": "3"}
+    assert _stored_count(client, "db-legacy") == {"N": "1"}
+    assert _stored_count(client, "db-old#deleted") == {"N": "7"}
+    assert all(kwargs["Select"] == "COUNT" for name, kwargs in counter.calls if name == "query")
@@ -0,0 +1,184 @@
+"""
+Tests for coalescing the records of an indexer SQS batch so that each file or asset document
+is indexed once per batch.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+from unittest.mock import MagicMock
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("ASSET_STORAGE_TABLE_NAME", "assetStorageTable")
+os.environ.setdefault("ASSET_FILE_METADATA_STORAGE_TABLE_NAME", "assetFileMetadataStorageTable")
+os.environ.setdefault("FILE_ATTRIBUTE_STORAGE_TABLE_NAME", "fileAttributeStorageTable")
+os.environ.setdefault("S3_ASSET_BUCKETS_STORAGE_TABLE_NAME", "s3AssetBucketsStorageTable")
+os.environ.setdefault("ASSET_LINKS_STORAGE_TABLE_V2_NAME", "assetLinksStorageTableV2")
+os.environ.setdefault("ASSET_VERSIONS_STORAGE_TABLE_NAME", "assetVersionsStorageTable")
+os.environ.setdefault("OPENSEARCH_FILE_INDEX_SSM_PARAM", "/vams/fileIndex")
+os.environ.setdefault("OPENSEARCH_ASSET_INDEX_SSM_PARAM", "/vams/assetIndex")
+os.environ.setdefault("OPENSEARCH_ENDPOINT_SSM_PARAM", "/vams/endpoint")
+
+# models.common imports the audit logger from customLogging, which conftest mocks as a plain module
+audit_logging = {"customLogging.auditLogging": MagicMock()}
+
+
+# The indexers read their OpenSearch configuration from SSM when they are imported; the preview index
+# lookup of the file indexer is stubbed, since the tests replace the handlers that call it
+with mock_aws():
+    _ssm = boto3.client("ssm", region_name="us-east-1")
+    for _name, _value in [("/vams/fileIndex", "files"), ("/vams/assetIndex", "assets"),
+                          ("/vams/endpoint", "https://search.example.com")]:
+        _ssm.put_parameter(Name=_name, Value=_value, Type="String")
+    fileIndexer = load_backend_module("fileIndexerReal", "handlers/indexing/fileIndexer.py",
+                                      dependencies={**audit_logging, "common.previewIndex": MagicMock()})
+    assetIndexer = load_backend_module("assetIndexerReal", "handlers/indexing/assetIndexer.py",
+                                       dependencies=audit_logging)
+
+
+def _sqs(message):
+    """Wrap a message in the SNS and SQS envelopes used by the indexer queues."""
+    return {"eventSource": "aws:sqs",
+            "body": json.dumps({"Type": "Notification", "Message": json.dumps(message)})}
+
+
+def _s3(key, event_name="ObjectCreated:Put", sequencer=None):
+    s3_object = {"key": key}
+    if sequencer:
+        s3_object["sequencer"] = sequencer
+    return {"eventSource": "aws:s3", "eventName": event_name,
+            "s3": {"bucket": {"name": "bucket"}, "object": s3_object}}
+
+
+def _stream(table_name, event_name, image):
+    image = {name: {"S": value} for name, value in image.items()}
+    data = {"Keys": image} if event_name == "REMOVE" else {"NewImage": image}
+    return {"eventSource": "aws:dynamodb", "eventName": event_name,
+            "eventSourceARN": f"arn:aws:dynamodb:us-east-1:123456789012:table/{table_name}/stream/1",
+            "dynamodb": data}
+
+
+def _body(response):
+    return json.loads(response["body"])
+
+
+@pytest.fixture
+def file_calls(monkeypatch):
+    """Record the records the file indexer hands to its event handlers."""
+    calls = []
+    index_response = fileIndexer.IndexOperationResponse(success=True, message="ok", indexName="files",
+                                                        operation="index")
+
+    def handle_s3(record):
+        calls.append(("s3", record["eventName"], record["s3"]["object"]["key"]))
+        return index_response
+
+    def handle_metadata(record):
+        data = record["dynamodb"].get("NewImage") or record["dynamodb"]["Keys"]
+        calls.append(("metadata", record["eventName"], data["databaseId:assetId:filePath"]["S"]))
+        return index_response
+
+    monkeypatch.setattr(fileIndexer, "handle_s3_notification", handle_s3)
+    monkeypatch.setattr(fileIndexer, "handle_metadata_stream", handle_metadata)
+    return calls
+
+
+def test_file_batch_indexes_each_file_once(file_calls):
+    metadata_table = os.environ["ASSET_FILE_METADATA_STORAGE_TABLE_NAME"]
+    attribute_table = os.environ["FILE_ATTRIBUTE_STORAGE_TABLE_NAME"]
+    file_key = "db1:asset1:/model.obj"
+    event = {"Records": [
+        _sqs({"Records": [_s3("asset1/model.obj", sequencer="0A")]}),
+        _sqs(_stream(metadata_table, "INSERT", {"databaseId:assetId:filePath": file_key})),
+        _sqs({"Records": [_s3("asset1/model.obj.previewFile.png")]}),
+        _sqs(_stream(attribute_table, "MODIFY", {"databaseId:assetId:filePath": file_key})),
+        _sqs({"Records": [_s3("asset1/model.obj", sequencer="0B")]}),
+        _sqs({"Records": [_s3("asset1/other.obj")]}),
+        _stream(metadata_table, "REMOVE", {"databaseId:assetId:filePath": file_key}),
+    ]}
+
+    body = _body(fileIndexer.lambda_handler(event, None))
+
+    assert file_calls == [
+        ("s3", "ObjectCreated:Put", "asset1/model.obj"),
+        ("s3", "ObjectCreated:Put", "asset1/other.obj"),
+        ("metadata", "REMOVE", file_key),
+    ]
+    assert (body["recordsReceived"], body["recordsCoalesced"]) == (7, 4)
+
+
+def test_s3_events_of_a_key_keep_the_latest_by_sequencer(file_calls):
+    # SQS does not preserve order, so the S3 sequencer decides which event of a key is the latest
+    event = {"Records": [
+        _sqs({"Records": [_s3("asset1/model.obj", "ObjectRemoved:Delete", sequencer="00FF")]}),
+        _sqs({"Records": [_s3("asset1/model.obj", "ObjectCreated:Put", sequencer="0A")]}),
+        _sqs({"Records": [_s3("asset1/notes.txt.previewFile.png", "ObjectRemoved:Delete")]}),
+        _sqs({"Records": [_s3("asset1/notes.txt.previewFile.jpg")]}),
+    ]}
+
+    body = _body(fileIndexer.lambda_handler(event, None))
+
+    assert file_calls == [
+        ("s3", "ObjectRemoved:Delete", "asset1/model.obj"),
+        ("s3", "ObjectCreated:Put", "asset1/notes.txt.previewFile.jpg"),
+    ]
+    assert body["recordsCoalesced"] == 2
+
+
+def test_unresolvable_and_unparseable_file_records_are_still_reported(file_calls):
+    event = {"Records": [
+        {"eventSource": "aws:sqs", "body": "not json"},
+        _sqs({"Records": [_s3("asset1/model.obj")]}),
+        _sqs({"eventName": "MODIFY", "dynamodb": {"NewImage": {"databaseId:assetId:filePath": {"S": ""}}}}),
+    ]}
+
+    body = _body(fileIndexer.lambda_handler(event, None))
+
+    assert file_calls == [("s3", "ObjectCreated:Put", "asset1/model.obj"), ("metadata", "MODIFY", "")]
+    assert [result["operation"] for result in body["results"]] == ["error", "index", "index"]
+    assert body["recordsCoalesced"] == 0
+
+
+@pytest.fixture
+def asset_calls(monkeypatch):
+    """Record the index requests the asset indexer processes."""
+    calls = []
+
+    def process(request):
+        calls.append((request.databaseId, request.assetId, request.operation))
+        return assetIndexer.IndexOperationResponse(success=True, message="ok", indexName="assets",
+                                                   operation=request.operation)
+
+    monkeypatch.setattr(assetIndexer, "process_asset_index_request", process)
+    return calls
+
+
+def test_asset_batch_indexes_each_asset_once(asset_calls):
+    asset_table = os.environ["ASSET_STORAGE_TABLE_NAME"]
+    metadata_table = os.environ["ASSET_FILE_METADATA_STORAGE_TABLE_NAME"]
+    links_table = os.environ["ASSET_LINKS_STORAGE_TABLE_V2_NAME"]
+    event = {"Records": [
+        _sqs(_stream(asset_table, "MODIFY", {"databaseId": "db1", "assetId": "asset1"})),
+        _sqs(_stream(metadata_table, "INSERT", {"databaseId:assetId:filePath": "db1:asset1:/"})),
+        _sqs(_stream(metadata_table, "INSERT", {"databaseId:assetId:filePath": "db1:asset1:/model.obj"})),
+        _sqs(_stream(links_table, "INSERT", {"fromAssetDatabaseId:fromAssetId": "db1:asset1",
+                                             "toAssetDatabaseId:toAssetId": "db1:asset2"})),
+        _sqs(_stream(asset_table, "REMOVE", {"databaseId": "db1", "assetId": "asset2"})),
+        _sqs(_stream(metadata_table, "MODIFY", {"databaseId:assetId:filePath": "db1:asset2:/"})),
+        _sqs(_stream(asset_table, "MODIFY", {"databaseId": "db1", "assetId": "asset1"})),
+    ]}
+
+    body = _body(assetIndexer.lambda_handler(event, None))
+
+    # asset2 keeps "delete" from its REMOVE, which still indexes the asset if it exists again
+    assert asset_calls == [("db1", "asset2", "delete"), ("db1", "asset1", "index")]
+    # The file-level metadata record has no asset target and goes to its handler, which skips it
+    assert [result["operation"] for result in body["results"]] == ["skip", "delete", "index"]
+    assert (body["recordsReceived"], body["recordsCoalesced"]) == (7, 5)
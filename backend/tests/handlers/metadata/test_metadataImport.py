@@ -0,0 +1,309 @@
+"""
+Tests for the bulk metadata import of the metadata service against moto.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+import sys
+from unittest.mock import MagicMock
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+# models.metadata (imported by the service) requires geojson
+pytest.importorskip("geojson")
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("ASSET_LINKS_STORAGE_TABLE_V2_NAME", "assetLinksStorageTableV2")
+os.environ.setdefault("ASSET_LINKS_METADATA_STORAGE_TABLE_NAME", "assetLinksMetadataStorageTable")
+os.environ.setdefault("ASSET_STORAGE_TABLE_NAME", "assetStorageTable")
+os.environ.setdefault("DATABASE_STORAGE_TABLE_NAME", "databaseStorageTable")
+os.environ.setdefault("DATABASE_METADATA_STORAGE_TABLE_NAME", "databaseMetadataStorageTable")
+os.environ.setdefault("ASSET_FILE_METADATA_STORAGE_TABLE_NAME", "assetFileMetadataStorageTable")
+os.environ.setdefault("FILE_ATTRIBUTE_STORAGE_TABLE_NAME", "fileAttributeStorageTable")
+os.environ.setdefault("S3_ASSET_BUCKETS_STORAGE_TABLE_NAME", "s3AssetBucketsStorageTable")
+os.environ.setdefault("METADATA_SCHEMA_STORAGE_TABLE_V2_NAME", "metadataSchemaStorageTableV2")
+
+# models.common imports the audit logger from customLogging, which conftest mocks as a plain module
+audit_logging = {"customLogging.auditLogging": MagicMock()}
+
+# The import validates rows, writes them in batches and resolves schemas with the real common modules;
+# asset versions are only read by the versioned metadata routes
+validators = load_backend_module("validatorsReal", "common/validators.py")
+schemaValidation = load_backend_module("metadataSchemaValidationReal", "common/metadataSchemaValidation.py")
+metadataService = load_backend_module(
+    "metadataServiceReal", "handlers/metadata/metadataService.py",
+    dependencies={**audit_logging,
+                  "common.validators": validators,
+                  "common.batchWrite": load_backend_module("batchWriteReal", "common/batchWrite.py",
+                                                           dependencies=audit_logging),
+                  "common.metadataSchemaValidation": schemaValidation,
+                  "common.metadataRead": load_backend_module(
+                      "metadataReadReal", "common/metadataRead.py",
+                      dependencies={"common.metadataSchemaValidation": schemaValidation}),
+                  "handlers.assets.assetVersions": MagicMock()})
+
+BUCKET = "vams-asset-bucket"
+DATABASE_ID = "db01"
+CLAIMS = {"tokens": ["user1"], "roles": ["role1"]}
+
+
+def _create_table(client, name, hash_key, range_key=None, indexes=()):
+    keys = [(hash_key, "HASH")] + ([(range_key, "RANGE")] if range_key else [])
+    attributes = {key for key, _ in keys} | {key for _, index_keys in indexes for key in index_keys}
+    table = {
+        "TableName": name,
+        "KeySchema": [{"AttributeName": key, "KeyType": key_type} for key, key_type in keys],
+        "AttributeDefinitions": [{"AttributeName": key, "AttributeType": "S"} for key in sorted(attributes)],
+        "BillingMode": "PAY_PER_REQUEST",
+    }
+    if indexes:
+        table["GlobalSecondaryIndexes"] = [{
+            "IndexName": index_name,
+            "KeySchema": [{"AttributeName": index_keys[0], "KeyType": "HASH"},
+                          {"AttributeName": index_keys[1], "KeyType": "RANGE"}],
+            "Projection": {"ProjectionType": "ALL"},
+        } for index_name, index_keys in indexes]
+    client.create_table(**table)
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    """Create the service's tables and the asset bucket, and authorize every action not denied."""
+    # The request models import the validators when they validate
+    monkeypatch.setitem(sys.modules, "common.validators", validators)
+    schemaValidation._schema_cache.clear()
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        _create_table(client, metadataService.database_storage_table_name, "databaseId")
+        _create_table(client, metadataService.asset_storage_table_name, "databaseId", "assetId")
+        _create_table(client, metadataService.s3_asset_buckets_table_name, "bucketId", "bucketName")
+        _create_table(client, metadataService.asset_file_metadata_table_name,
+                      "metadataKey", "databaseId:assetId:filePath",
+                      indexes=[("DatabaseIdAssetIdIndex", ("databaseId:assetId", "metadataKey"))])
+        _create_table(client, metadataService.file_attribute_table_name,
+                      "attributeKey", "databaseId:assetId:filePath",
+                      indexes=[("DatabaseIdAssetIdIndex", ("databaseId:assetId", "attributeKey"))])
+        _create_table(client, metadataService.metadata_schema_table_v2_name,
+                      "metadataSchemaId", "databaseId:metadataEntityType",
+                      indexes=[("DatabaseIdMetadataEntityTypeIndex",
+                                ("databaseId:metadataEntityType", "metadataSchemaId"))])
+
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        database_table = dynamodb.Table(metadataService.database_storage_table_name)
+        asset_table = dynamodb.Table(metadataService.asset_storage_table_name)
+        buckets_table = dynamodb.Table(metadataService.s3_asset_buckets_table_name)
+        database_table.put_item(Item={"databaseId": DATABASE_ID})
+        buckets_table.put_item(Item={"bucketId": "bucket1", "bucketName": BUCKET, "baseAssetsPrefix": "assets"})
+        for asset_id in ["asset1", "asset2"]:
+            asset_table.put_item(Item={"databaseId": DATABASE_ID, "assetId": asset_id, "bucketId": "bucket1",
+                                       "assetLocation": {"Key": f"assets/{asset_id}/"}})
+
+        s3 = boto3.client("s3", region_name="us-east-1")
+        s3.create_bucket(Bucket=BUCKET)
+        s3.put_object(Bucket=BUCKET, Key="assets/asset1/model.obj", Body=b"model")
+        s3.put_object(Bucket=BUCKET, Key="assets/asset2/model.obj", Body=b"model")
+
+        denied = set()
+
+        class Enforcer:
+            def __init__(self, claims_and_roles):
+                pass
+
+            def enforce(self, entity, action):
+                return (entity.get("assetId"), action) not in denied
+
+            def enforceAPI(self, event):
+                return True
+
+        monkeypatch.setattr(metadataService, "dynamodb", dynamodb)
+        monkeypatch.setattr(metadataService, "dynamodb_client", client)
+        monkeypatch.setattr(metadataService, "s3", s3)
+        monkeypatch.setattr(metadataService, "database_storage_table", database_table)
+        monkeypatch.setattr(metadataService, "asset_storage_table", asset_table)
+        monkeypatch.setattr(metadataService, "s3_asset_buckets_table", buckets_table)
+        monkeypatch.setattr(metadataService, "CasbinEnforcer", Enforcer)
+        monkeypatch.setattr(metadataService, "request_to_claims", lambda event: CLAIMS)
+
+        yield client, s3, denied
+
+
+def _put_import_file(s3, content, path="import.ndjson"):
+    s3.put_object(Bucket=BUCKET, Key=f"assets/asset1/{path}", Body=content.encode("utf-8"))
+
+
+def _ndjson(*rows):
+    return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows) + "\n"
+
+
+def _import(path="/import.ndjson", start_row=0):
+    request_model = metadataService.ImportMetadataRequestModel(
+        sourceAssetId="asset1", sourceFilePath=path, startRow=start_row)
+    return metadataService.import_metadata(DATABASE_ID, request_model, CLAIMS)
+
+
+def _metadata(client, table_name, key_name):
+    items = client.scan(TableName=table_name)["Items"]
+    return sorted((item["databaseId:assetId:filePath"]["S"], item[key_name]["S"]) for item in items)
+
+
+def _errors(response):
+    return [(error.row, error.error) for error in response.errorReport]
+
+
+def test_import_writes_asset_and_file_metadata_and_attributes(aws):
+    client, s3, _ = aws
+    _put_import_file(s3, _ndjson(
+        {"assetId": "asset1", "metadataKey": "title", "metadataValue": "Bridge"},
+        "",
+        {"assetId": "asset1", "filePath": "model.obj", "metadataKey": "lod", "metadataValue": "2",
+         "metadataValueType": "number"},
+        {"assetId": "asset2", "filePath": "/model.obj", "type": "attribute", "metadataKey": "source",
+         "metadataValue": "scan"},
+    ))
+
+    response = _import()
+
+    assert (response.success, response.totalRows, response.successCount, response.nextRow) == (True, 3, 3, None)
+    assert _metadata(client, metadataService.asset_file_metadata_table_name, "metadataKey") == [
+        ("db01:asset1:/", "title"), ("db01:asset1:/model.obj", "lod")]
+    assert _metadata(client, metadataService.file_attribute_table_name, "attributeKey") == [
+        ("db01:asset2:/model.obj", "source")]
+
+
+def test_csv_import_reports_unparseable_rows(aws):
+    client, s3, _ = aws
+    _put_import_file(s3, "assetId,filePath,metadataKey,metadataValue\n"
+                         "asset1,,title,Bridge\n"
+                         "asset1,/model.obj,lod,2,extra\n"
+                         "asset1,/missing.obj,lod,2\n", path="import.csv")
+
+    response = _import(path="/import.csv")
+
+    assert (response.successCount, response.failureCount) == (1, 2)
+    assert _errors(response) == [(1, "Row has more columns than the header"), (2, "File not found in S3")]
+    assert _metadata(client, metadataService.asset_file_metadata_table_name, "metadataKey") == [
+        ("db01:asset1:/", "title")]
+
+
+def test_rows_violating_the_schema_are_rejected(aws):
+    client, s3, _ = aws
+    client.put_item(TableName=metadataService.metadata_schema_table_v2_name, Item={
+        "metadataSchemaId": {"S": "s1"},
+        "databaseId:metadataEntityType": {"S": f"{DATABASE_ID}:assetMetadata"},
+        "databaseId": {"S": DATABASE_ID},
+        "schemaName": {"S": "s1"},
+        "fields": {"S": json.dumps({"fields": [
+            {"metadataFieldKeyName": "title", "metadataFieldValueType": "string", "required": True}]})},
+        "enabled": {"BOOL": True},
+    })
+    _put_import_file(s3, _ndjson(
+        {"assetId": "asset1", "metadataKey": "owner", "metadataValue": "bob"},
+        {"assetId": "asset2", "metadataKey": "title", "metadataValue": "Tower"},
+        {"assetId": "asset1", "metadataKey": "lod", "metadataValue": "high", "metadataValueType": "number"},
+        "{not json",
+    ))
+
+    response = _import()
+
+    assert (response.success, response.successCount, response.failureCount) == (False, 1, 3)
+    assert [row for row, _ in _errors(response)] == [0, 2, 3]
+    assert _errors(response)[0][1] == "VAMS General Error: Schema validation failed: Required field 'title' is missing"
+    assert _errors(response)[2][1].startswith("Invalid JSON")
+    assert _metadata(client, metadataService.asset_file_metadata_table_name, "metadataKey") == [
+        ("db01:asset2:/", "title")]
+
+
+def test_rows_of_an_unauthorized_asset_are_rejected(aws):
+    client, s3, denied = aws
+    denied.add(("asset2", "POST"))
+    _put_import_file(s3, _ndjson(
+        {"assetId": "asset1", "metadataKey": "title", "metadataValue": "Bridge"},
+        {"assetId": "asset2", "metadataKey": "title", "metadataValue": "Tower"},
+        {"assetId": "asset2", "filePath": "/model.obj", "metadataKey": "lod", "metadataValue": "2"},
+        {"assetId": "asset3", "metadataKey": "title", "metadataValue": "Dam"},
+    ))
+
+    response = _import()
+
+    assert _errors(response) == [(1, "Not authorized to create metadata for this asset"),
+                                 (2, "Not authorized to create metadata for this asset"),
+                                 (3, "VAMS General Error: Asset not found")]
+    assert _metadata(client, metadataService.asset_file_metadata_table_name, "metadataKey") == [
+        ("db01:asset1:/", "title")]
+
+
+def test_unauthorized_source_file_fails_the_import(aws):
+    _, s3, denied = aws
+    denied.add(("asset1", "GET"))
+    _put_import_file(s3, _ndjson({"assetId": "asset2", "metadataKey": "title", "metadataValue": "Tower"}))
+
+    with pytest.raises(PermissionError):
+        _import()
+
+
+def test_import_resumes_from_next_row_after_the_time_budget(aws, monkeypatch):
+    client, s3, _ = aws
+    # One chunk per request: the budget is spent as soon as the first chunk is written
+    monkeypatch.setattr(metadataService, "METADATA_IMPORT_CHUNK_ROWS", 2)
+    monkeypatch.setattr(metadataService, "METADATA_IMPORT_TIME_BUDGET_SECONDS", -1)
+    _put_import_file(s3, _ndjson(*[{"assetId": "asset1", "metadataKey": f"key{index}", "metadataValue": "v"}
+                                   for index in range(5)]))
+
+    first = _import()
+    assert (first.startRow, first.processedRows, first.successCount, first.nextRow) == (0, 2, 2, 2)
+
+    second = _import(start_row=first.nextRow)
+    third = _import(start_row=second.nextRow)
+    assert (second.nextRow, third.processedRows, third.nextRow) == (4, 1, None)
+    assert len(_metadata(client, metadataService.asset_file_metadata_table_name, "metadataKey")) == 5
+
+    with pytest.raises(metadataService.VAMSGeneralErrorResponse, match="beyond the last row"):
+        _import(start_row=6)
+
+
+def test_error_report_is_capped(aws, monkeypatch):
+    _, s3, _ = aws
+    monkeypatch.setattr(metadataService, "MAX_METADATA_IMPORT_ERROR_REPORT_ROWS", 2)
+    _put_import_file(s3, _ndjson("[]", "[]", "[]"))
+
+    response = _import()
+
+    assert (response.failureCount, len(response.errorReport), response.errorReportTruncated) == (3, 2, True)
+
+
+def test_import_file_over_the_size_limit_is_rejected(aws, monkeypatch):
+    _, s3, _ = aws
+    monkeypatch.setattr(metadataService, "MAX_METADATA_IMPORT_FILE_BYTES", 16)
+    _put_import_file(s3, _ndjson({"assetId": "asset1", "metadataKey": "title", "metadataValue": "Bridge"}))
+
+    with pytest.raises(metadataService.VAMSGeneralErrorResponse, match="maximum size"):
+        _import()
+
+
+def test_import_route(aws):
+    _, s3, denied = aws
+    _put_import_file(s3, _ndjson({"assetId": "asset1", "metadataKey": "title", "metadataValue": "Bridge"}))
+
+    def event(body):
+        return {"requestContext": {"http": {"path": f"/database/{DATABASE_ID}/metadata/import", "method": "POST"}},
+                "pathParameters": {"databaseId": DATABASE_ID}, "body": json.dumps(body) if body else None}
+
+    response = metadataService.lambda_handler(event({"sourceAssetId": "asset1", "sourceFilePath": "import.ndjson"}),
+                                              None)
+    assert response["statusCode"] == 200
+    assert json.loads(response["body"])["successCount"] == 1
+
+    assert metadataService.lambda_handler(event(None), None)["statusCode"] == 400
+    assert metadataService.lambda_handler(event({"sourceAssetId": "asset1", "sourceFilePath": "import.txt"}),
+                                          None)["statusCode"] == 400
+
+    denied.add(("asset1", "GET"))
+    response = metadataService.lambda_handler(event({"sourceAssetId": "asset1", "sourceFilePath": "import.ndjson"}),
+                                              None)
+    assert response["statusCode"] == 403
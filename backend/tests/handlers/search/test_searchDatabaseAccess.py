@@ -0,0 +1,134 @@
+"""
+Tests for the cached database catalog and accessibility results in the search handler.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+from unittest.mock import MagicMock
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import CallCounter, load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.update({
+    "ASSET_STORAGE_TABLE_NAME": "test-assets",
+    "DATABASE_STORAGE_TABLE_NAME": "test-databases",
+    "OPENSEARCH_ASSET_INDEX_SSM_PARAM": "/test/assetIndex",
+    "OPENSEARCH_FILE_INDEX_SSM_PARAM": "/test/fileIndex",
+    "OPENSEARCH_ENDPOINT_SSM_PARAM": "/test/endpoint",
+})
+
+
+def _load_search_module():
+    # conftest replaces the `handlers` package with a MagicMock, so load the module from its file;
+    # the search module reads its OpenSearch configuration from SSM on import, and models.common imports
+    # the audit logger from customLogging, which conftest mocks as a plain module
+    with mock_aws():
+        ssm = boto3.client("ssm", region_name="us-east-1")
+        for name in ("/test/assetIndex", "/test/fileIndex", "/test/endpoint"):
+            ssm.put_parameter(Name=name, Value="test", Type="String")
+        return load_backend_module("searchDatabaseAccess", "handlers/search/search.py",
+                                   dependencies={"customLogging.auditLogging": MagicMock()})
+
+
+search_module = _load_search_module()
+
+
+class _Enforcer:
+    """Casbin stand-in allowing databases whose id starts with one of the caller's roles."""
+
+    enforce_calls = 0
+
+    def __init__(self, claims_and_roles):
+        self.prefixes = claims_and_roles["roles"]
+
+    def enforce(self, obj, act):
+        _Enforcer.enforce_calls += 1
+        return any(obj["databaseId"].startswith(prefix) for prefix in self.prefixes)
+
+
+@pytest.fixture
+def search(monkeypatch):
+    with mock_aws():
+        module = search_module
+        monkeypatch.setattr(module, "database_catalog_cache", {})
+        monkeypatch.setattr(module, "database_access_cache", {})
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="test-databases",
+            KeySchema=[{"AttributeName": "databaseId", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "databaseId", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST")
+        for index in range(50):
+            prefix = "team" if index % 2 else "other"
+            client.put_item(TableName="test-databases", Item={"databaseId": {"S": f"{prefix}-db{index}"}})
+        client.put_item(TableName="test-databases", Item={"databaseId": {"S": "team-archived#deleted"}})
+
+        counter = CallCounter(client, ["scan"])
+        monkeypatch.setattr(module, "dynamodb_client", counter)
+        monkeypatch.setattr(module, "CasbinEnforcer", _Enforcer)
+        _Enforcer.enforce_calls = 0
+        yield module, client, counter
+
+
+def _claims(*roles, user="user@example.com"):
+    return {"tokens": [user, *roles], "roles": list(roles)}
+
+
+def test_repeated_searches_reuse_catalog_and_access_results(search):
+    module, _, counter = search
+    manager = module.DatabaseAccessManager()
+
+    first = manager.get_accessible_databases(_claims("team"))
+    enforce_calls = _Enforcer.enforce_calls
+    second = manager.get_accessible_databases(_claims("team"))
+
+    assert len(first) == 25
+    assert all(database_id.startswith("team-db") for database_id in first)
+    assert second == first
+    assert counter.calls.count("scan") == 1
+    assert _Enforcer.enforce_calls == enforce_calls
+
+
+def test_access_results_are_cached_per_role_set(search):
+    module, _, counter = search
+    manager = module.DatabaseAccessManager()
+
+    team = manager.get_accessible_databases(_claims("team"))
+    other = manager.get_accessible_databases(_claims("other", user="other@example.com"))
+
+    assert set(team).isdisjoint(other)
+    assert len(other) == 25
+    assert counter.calls.count("scan") == 1
+
+
+def test_catalog_refreshes_after_refresh_window(search, monkeypatch):
+    module, client, counter = search
+    manager = module.DatabaseAccessManager()
+    manager.get_accessible_databases(_claims("team"))
+
+    client.put_item(TableName="test-databases", Item={"databaseId": {"S": "team-new"}})
+    assert "team-new" not in manager.get_accessible_databases(_claims("team"))
+
+    monkeypatch.setattr(module, "DATABASE_CATALOG_REFRESH_SECONDS", 0)
+    assert "team-new" in manager.get_accessible_databases(_claims("team"))
+    assert counter.calls.count("scan") == 2
+
+
+def test_deleted_databases_use_their_own_catalog(search):
+    module, _, _ = search
+    manager = module.DatabaseAccessManager()
+
+    assert manager.get_accessible_databases(_claims("team"), show_deleted=True) == ["team-archived#deleted"]
+    assert "team-archived#deleted" not in manager.get_accessible_databases(_claims("team"))
+
+
+def test_no_tokens_returns_no_databases(search):
+    module, _, counter = search
+
+    assert module.DatabaseAccessManager().get_accessible_databases({"tokens": []}) == []
+    assert counter.calls.count("scan") == 0
@@ -0,0 +1,157 @@
+"""
+Tests for coalesced asset change notifications: sendEmail queues change events and
+sendEmailDigest publishes one digest per asset per SQS batch.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("SEND_EMAIL_DIGEST_QUEUE_URL", "sendEmailDigestQueue")
+
+ASSET_TABLE = "assetStorageTable"
+
+
+# conftest replaces the `handlers` package with a MagicMock, so load the modules from their files
+sendEmail = load_backend_module("sendEmail", "handlers/sendEmail/sendEmail.py")
+sendEmailDigest = load_backend_module("sendEmailDigest", "handlers/sendEmail/sendEmailDigest.py")
+
+
+class _PublishCounter:
+    """Wrap the SNS client to record published messages."""
+
+    def __init__(self, client):
+        self._client = client
+        self.published = []
+
+    def publish(self, **kwargs):
+        self.published.append(kwargs)
+        return self._client.publish(**kwargs)
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    with mock_aws():
+        dynamodb = boto3.client("dynamodb", region_name="us-east-1")
+        dynamodb.create_table(
+            TableName=ASSET_TABLE,
+            KeySchema=[
+                {"AttributeName": "databaseId", "KeyType": "HASH"},
+                {"AttributeName": "assetId", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "databaseId", "AttributeType": "S"},
+                {"AttributeName": "assetId", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST")
+        sns = boto3.client("sns", region_name="us-east-1")
+        topic_arn = sns.create_topic(Name="AssetTopicasset1")["TopicArn"]
+        dynamodb.put_item(TableName=ASSET_TABLE, Item={
+            "databaseId": {"S": "db1"},
+            "assetId": {"S": "asset1"},
+            "assetName": {"S": "Asset One"},
+            "snsTopic": {"S": topic_arn},
+            "currentVersionId": {"S": "3"},
+        })
+        dynamodb.put_item(TableName=ASSET_TABLE, Item={
+            "databaseId": {"S": "db1"},
+            "assetId": {"S": "unsubscribed"},
+            "assetName": {"S": "Unsubscribed"},
+            "currentVersionId": {"S": "1"},
+        })
+        sqs = boto3.client("sqs", region_name="us-east-1")
+        queue_url = sqs.create_queue(QueueName="sendEmailDigestQueue")["QueueUrl"]
+
+        publisher = _PublishCounter(sns)
+        monkeypatch.setattr(sendEmail, "sqs_client", sqs)
+        monkeypatch.setattr(sendEmail, "digest_queue_url", queue_url)
+        monkeypatch.setattr(sendEmailDigest, "dynamodb_client", dynamodb)
+        monkeypatch.setattr(sendEmailDigest, "sns_client", publisher)
+        monkeypatch.setattr(sendEmailDigest, "asset_table_name", ASSET_TABLE)
+        yield sqs, queue_url, publisher
+
+
+def _receive_batch(sqs, queue_url):
+    """Drain the queue into an SQS event, as the event source mapping delivers it."""
+    records = []
+    while True:
+        messages = sqs.receive_message(QueueUrl=queue_url, MaxNumberOfMessages=10).get("Messages", [])
+        if not messages:
+            return {"Records": records}
+        records.extend({"messageId": message["MessageId"], "body": message["Body"]} for message in messages)
+
+
+def test_change_events_collapse_to_one_publish_per_asset(aws):
+    sqs, queue_url, publisher = aws
+    for index in range(25):
+        response = sendEmail.lambda_handler(
+            {"databaseId": "db1", "assetId": "asset1", "fileKeys": [f"/file{index % 20}.txt"]}, None)
+        assert response["statusCode"] == 200
+    sendEmail.lambda_handler({"databaseId": "db1", "assetId": "unsubscribed"}, None)
+    assert publisher.published == []
+
+    result = sendEmailDigest.lambda_handler(_receive_batch(sqs, queue_url), None)
+
+    assert result == {"batchItemFailures": []}
+    assert len(publisher.published) == 1
+    digest = publisher.published[0]
+    assert digest["Subject"] == "[Asset One] - File or Asset Changed (3)"
+    assert "25 change(s)" in digest["Message"]
+    assert "Changed files (20):" in digest["Message"]
+    assert "/file19.txt" in digest["Message"]
+
+
+def test_digest_lists_a_bounded_number_of_files(aws):
+    _, _, publisher = aws
+    file_keys = [f"/f{index}" for index in range(sendEmailDigest.MAX_DIGEST_FILES + 5)]
+    records = [{"messageId": "m1", "body": json.dumps(
+        {"databaseId": "db1", "assetId": "asset1", "fileKeys": file_keys})}]
+
+    sendEmailDigest.lambda_handler({"Records": records}, None)
+
+    assert "...and 5 more" in publisher.published[0]["Message"]
+
+
+def test_capped_change_events_report_the_file_count(aws):
+    sqs, queue_url, publisher = aws
+    file_keys = [f"/batch/f{index}" for index in range(500)]
+    sendEmail.lambda_handler({"databaseId": "db1", "assetId": "asset1", "fileKeys": file_keys}, None)
+    sendEmail.lambda_handler({"databaseId": "db1", "assetId": "asset1", "fileKeys": ["/single.txt"]}, None)
+
+    batch = _receive_batch(sqs, queue_url)
+    queued = sorted((json.loads(record["body"]) for record in batch["Records"]), key=lambda body: body["fileCount"])
+    assert [(len(body["fileKeys"]), body["fileCount"]) for body in queued] == [
+        (1, 1), (sendEmailDigest.MAX_DIGEST_FILES, 500)]
+
+    sendEmailDigest.lambda_handler(batch, None)
+
+    message = publisher.published[0]["Message"]
+    assert "Changed files (501):" in message
+    assert "...and 451 more" in message
+
+
+def test_failed_assets_are_reported_for_retry(aws, monkeypatch):
+    _, _, publisher = aws
+
+    def failing_publish(**kwargs):
+        raise RuntimeError("SNS unavailable")
+
+    monkeypatch.setattr(publisher, "publish", failing_publish)
+    records = [
+        {"messageId": "m1", "body": '{"databaseId": "db1", "assetId": "asset1"}'},
+        {"messageId": "m2", "body": '{"databaseId": "db1", "assetId": "asset1"}'},
+        {"messageId": "m3", "body": '{"databaseId": "db1", "assetId": "missing"}'},
+        {"messageId": "m4", "body": "not json"},
+    ]
+
+    result = sendEmailDigest.lambda_handler({"Records": records}, None)
+
+    assert result == {"batchItemFailures": [{"itemIdentifier": "m1"}, {"itemIdentifier": "m2"}]}
@@ -0,0 +1,133 @@
+"""
+Tests for keyed subscription access in the subscription service: subscribed assets are
+resolved with BatchGetItem from the databaseId carried on subscription records.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import CallCounter, load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ["SUBSCRIPTIONS_STORAGE_TABLE_NAME"] = "test-subscriptions"
+os.environ["ASSET_STORAGE_TABLE_NAME"] = "test-assets"
+os.environ["USER_STORAGE_TABLE_NAME"] = "test-users"
+
+# conftest replaces the `handlers` package with a MagicMock, so load the module from its file
+subscriptionService = load_backend_module("subscriptionServiceKeyed",
+                                          "handlers/subscription/subscriptionService.py")
+
+QUERY_PARAMS = {"maxItems": "1000", "pageSize": "1000", "startingToken": None}
+
+
+@pytest.fixture
+def tables(monkeypatch):
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName="test-subscriptions",
+            KeySchema=[{"AttributeName": "eventName", "KeyType": "HASH"},
+                       {"AttributeName": "entityName_entityId", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "eventName", "AttributeType": "S"},
+                                  {"AttributeName": "entityName_entityId", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST")
+        client.create_table(
+            TableName="test-assets",
+            KeySchema=[{"AttributeName": "databaseId", "KeyType": "HASH"},
+                       {"AttributeName": "assetId", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "databaseId", "AttributeType": "S"},
+                                  {"AttributeName": "assetId", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST")
+
+        counter = CallCounter(client, ["batch_get_item", "scan", "query", "get_item"])
+        monkeypatch.setattr(subscriptionService, "dynamodb_client", counter)
+        monkeypatch.setattr(subscriptionService, "claims_and_roles", {"tokens": ["test_token"]})
+        yield client, counter
+
+
+def _put_subscription(client, asset_id, database_id=None):
+    item = {
+        "eventName": {"S": "Asset Version Change"},
+        "entityName_entityId": {"S": f"Asset#{asset_id}"},
+        "subscribers": {"L": [{"S": "user1"}]},
+    }
+    if database_id:
+        item["databaseId"] = {"S": database_id}
+        item["assetId"] = {"S": asset_id}
+    client.put_item(TableName="test-subscriptions", Item=item)
+
+
+def _put_asset(client, database_id, asset_id):
+    client.put_item(TableName="test-assets", Item={
+        "databaseId": {"S": database_id},
+        "assetId": {"S": asset_id},
+        "assetName": {"S": f"name-{asset_id}"},
+    })
+
+
+def test_get_subscriptions_resolves_assets_with_batched_keyed_reads(tables, monkeypatch):
+    client, counter = tables
+    for index in range(150):
+        _put_asset(client, "db1", f"asset{index}")
+        _put_subscription(client, f"asset{index}", "db1")
+
+    def unexpected_lookup(*args):
+        raise AssertionError("per-subscription asset lookup")
+    monkeypatch.setattr(subscriptionService, "get_asset_object_from_id", unexpected_lookup)
+
+    response = subscriptionService.get_subscriptions(dict(QUERY_PARAMS))
+    items = json.loads(response["body"])["message"]["Items"]
+
+    assert len(items) == 150
+    assert {item["entityValue"] for item in items} == {f"name-asset{index}" for index in range(150)}
+    assert all(item["databaseId"] == "db1" for item in items)
+    # One scan of the subscriptions table, two BatchGetItem calls of up to 100 keys
+    assert counter.calls.count("scan") <= 1
+    assert counter.calls.count("batch_get_item") == 2
+
+
+def test_get_subscriptions_falls_back_for_records_without_database_id(tables, monkeypatch):
+    client, _ = tables
+    _put_asset(client, "db1", "legacy")
+    _put_subscription(client, "legacy")
+
+    lookups = []
+
+    def lookup(database_id, asset_id):
+        lookups.append((database_id, asset_id))
+        if database_id is None:
+            return {"databaseId": "db1", "assetId": asset_id}
+        return {"databaseId": database_id, "assetId": asset_id, "assetName": "legacy-name"}
+    monkeypatch.setattr(subscriptionService, "get_asset_object_from_id", lookup)
+
+    response = subscriptionService.get_subscriptions(dict(QUERY_PARAMS))
+    items = json.loads(response["body"])["message"]["Items"]
+
+    assert items[0]["entityValue"] == "legacy-name"
+    assert items[0]["databaseId"] == "db1"
+    assert lookups == [(None, "legacy"), ("db1", "legacy")]
+
+
+def test_subscription_keys_are_written_on_subscriber_update(tables):
+    client, _ = tables
+    _put_subscription(client, "asset1")
+    boto3_resource = boto3.resource("dynamodb", region_name="us-east-1")
+    subscriptionService.dynamodb = boto3_resource
+
+    subscriptionService.update_subscription_subscribers(
+        {"eventName": "Asset Version Change", "entityName": "Asset", "entityId": "asset1"},
+        ["user1", "user2"],
+        {"databaseId": "db1", "assetId": "asset1"})
+
+    item = client.get_item(TableName="test-subscriptions", Key={
+        "eventName": {"S": "Asset Version Change"},
+        "entityName_entityId": {"S": "Asset#asset1"}})["Item"]
+    assert item["databaseId"] == {"S": "db1"}
+    assert item["assetId"] == {"S": "asset1"}
+    assert [subscriber["S"] for subscriber in item["subscribers"]["L"]] == ["user1", "user2"]
@@ -0,0 +1,148 @@
+"""
+Tests for auto-triggered workflow routing in sqsAutoExecuteWorkflow: the per-container workflow
+routing cache and grouping the file events of an SQS batch by asset and workflow.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import os
+from unittest.mock import MagicMock
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import CallCounter, load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("WORKFLOW_STORAGE_TABLE_NAME", "workflowStorageTable")
+os.environ.setdefault("S3_ASSET_BUCKETS_STORAGE_TABLE_NAME", "s3AssetBucketsStorageTable")
+os.environ.setdefault("EXECUTE_WORKFLOW_LAMBDA_FUNCTION_NAME", "executeWorkflowFunction")
+
+WORKFLOW_TABLE = "test-workflows"
+
+# conftest replaces the `handlers` and `common` packages with MagicMocks, so load the modules from their files;
+# models.common imports the audit logger from customLogging, which conftest mocks as a plain module
+workflowRouting = load_backend_module("workflowRoutingReal", "common/workflowRouting.py")
+sqsAutoExecuteWorkflow = load_backend_module("sqsAutoExecuteWorkflowReal",
+                                             "handlers/workflows/sqsAutoExecuteWorkflow.py",
+                                             dependencies={"common.workflowRouting": workflowRouting,
+                                                           "customLogging.auditLogging": MagicMock()})
+
+
+@pytest.fixture
+def workflows(monkeypatch):
+    """Create a mocked workflow table, reset the routing cache and record executeWorkflow invocations."""
+    monkeypatch.setattr(workflowRouting, "_workflow_cache", {})
+    monkeypatch.setattr(workflowRouting, "_routing_generation", {'value': None, 'checkedAt': 0.0})
+    # Check the generation on every call so tests see writes immediately
+    monkeypatch.setattr(workflowRouting, "WORKFLOW_ROUTING_GENERATION_CHECK_SECONDS", 0)
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName=WORKFLOW_TABLE,
+            KeySchema=[
+                {"AttributeName": "databaseId", "KeyType": "HASH"},
+                {"AttributeName": "workflowId", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "databaseId", "AttributeType": "S"},
+                {"AttributeName": "workflowId", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST")
+        counter = CallCounter(client, ["query", "get_item", "update_item"])
+        monkeypatch.setattr(sqsAutoExecuteWorkflow, "dynamodb_client", counter)
+        monkeypatch.setattr(sqsAutoExecuteWorkflow, "workflow_storage_table_name", WORKFLOW_TABLE)
+
+        invocations = []
+
+        def invoke(workflow, database_id, asset_id, file_paths):
+            invocations.append((workflow["workflowId"], asset_id, list(file_paths)))
+            return True
+
+        monkeypatch.setattr(sqsAutoExecuteWorkflow, "invoke_execute_workflow", invoke)
+        yield client, counter, invocations
+
+
+def _put_workflow(client, database_id, workflow_id, extensions):
+    client.put_item(TableName=WORKFLOW_TABLE, Item={
+        "databaseId": {"S": database_id},
+        "workflowId": {"S": workflow_id},
+        "autoTriggerOnFileExtensionsUpload": {"S": extensions},
+    })
+
+
+def _file_events(asset_id, file_paths):
+    return [{
+        "databaseId": "db1",
+        "assetId": asset_id,
+        "bucketName": "bucket",
+        "s3Key": f"{asset_id}{file_path}",
+        "filePath": file_path,
+    } for file_path in file_paths]
+
+
+def test_routing_is_cached_until_workflows_change(workflows):
+    client, counter, invocations = workflows
+    _put_workflow(client, "db1", "convert", "obj,fbx")
+    _put_workflow(client, "GLOBAL", "thumbnail", "all")
+
+    for index in range(3):
+        sqsAutoExecuteWorkflow.process_file_events(_file_events("asset1", [f"/model{index}.obj"]))
+
+    assert counter.calls.count("query") == 2
+    assert len(invocations) == 6
+
+    _put_workflow(client, "db1", "validate", "obj")
+    workflowRouting.bump_workflow_routing_generation(counter, WORKFLOW_TABLE)
+    invocations.clear()
+
+    sqsAutoExecuteWorkflow.process_file_events(_file_events("asset1", ["/model.obj"]))
+    assert sorted(workflow_id for workflow_id, _, _ in invocations) == ["convert", "thumbnail", "validate"]
+
+
+def test_batch_starts_one_execution_per_file_and_workflow(workflows, monkeypatch):
+    client, _, invocations = workflows
+    monkeypatch.setattr(sqsAutoExecuteWorkflow, "execution_per_asset_batch", False)
+    _put_workflow(client, "db1", "convert", "obj")
+
+    results = sqsAutoExecuteWorkflow.process_file_events(
+        _file_events("asset1", ["/a.obj", "/b.obj", "/a.obj", "/notes.txt"]))
+
+    # The duplicate event for /a.obj shares the execution of the first one
+    assert invocations == [("convert", "asset1", ["/a.obj"]), ("convert", "asset1", ["/b.obj"])]
+    assert [result["workflowsSucceeded"] for result in results] == [1, 1, 1, 0]
+
+
+def test_execution_per_asset_batch_carries_the_file_list(workflows, monkeypatch):
+    client, _, invocations = workflows
+    monkeypatch.setattr(sqsAutoExecuteWorkflow, "execution_per_asset_batch", True)
+    monkeypatch.setattr(sqsAutoExecuteWorkflow, "MAX_FILES_PER_EXECUTION", 3)
+    _put_workflow(client, "db1", "convert", "obj")
+    _put_workflow(client, "GLOBAL", "thumbnail", "all")
+
+    file_paths = [f"/model{index}.obj" for index in range(5)]
+    results = sqsAutoExecuteWorkflow.process_file_events(
+        _file_events("asset1", file_paths) + _file_events("asset2", ["/scan.obj"]))
+
+    assert sorted(invocations) == [
+        ("convert", "asset1", file_paths[:3]),
+        ("convert", "asset1", file_paths[3:]),
+        ("convert", "asset2", ["/scan.obj"]),
+        ("thumbnail", "asset1", file_paths[:3]),
+        ("thumbnail", "asset1", file_paths[3:]),
+        ("thumbnail", "asset2", ["/scan.obj"]),
+    ]
+    assert all(result["workflowsSucceeded"] == 2 for result in results)
+
+
+def test_failed_batch_execution_is_reported_for_each_file(workflows, monkeypatch):
+    client, _, _ = workflows
+    monkeypatch.setattr(sqsAutoExecuteWorkflow, "execution_per_asset_batch", True)
+    monkeypatch.setattr(sqsAutoExecuteWorkflow, "invoke_execute_workflow", lambda *args: False)
+    _put_workflow(client, "db1", "convert", "obj")
+
+    results = sqsAutoExecuteWorkflow.process_file_events(_file_events("asset1", ["/a.obj", "/b.obj"]))
+
+    assert [(result["workflowsFailed"], result["failures"][0]["workflowId"]) for result in results] == [
+        (1, "convert"), (1, "convert")]
@@ -0,0 +1,184 @@
+"""
+Tests for recording workflow execution completions: conditional row updates, concurrent
+reconciliation of open executions and the Step Functions status change event handler.
+
+Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+SPDX-License-Identifier: Apache-2.0
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timezone
+import boto3
+import pytest
+from moto import mock_aws
+
+from backend.tests.conftest import load_backend_module
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ["WORKFLOW_EXECUTION_STORAGE_TABLE_NAME"] = "test-workflow-executions"
+
+EXECUTION_TABLE = "test-workflow-executions"
+PARTITION_KEY = "$db1:$asset1"
+WORKFLOW_ARN = "arn:aws:states:us-east-1:123456789012:stateMachine:vams-wf1"
+
+
+# conftest replaces the `handlers` package with a MagicMock, so load the modules from their files
+workflowExecutionStatus = load_backend_module("workflowExecutionStatusReal",
+                                              "handlers/workflows/workflowExecutionStatus.py")
+updateWorkflowExecutionStatus = load_backend_module(
+    "updateWorkflowExecutionStatusReal", "handlers/workflows/updateWorkflowExecutionStatus.py",
+    dependencies={"handlers.workflows.workflowExecutionStatus": workflowExecutionStatus})
+
+
+class _FakeStepFunctions:
+    """Step Functions stub returning canned executions and tracking concurrent describe calls."""
+
+    def __init__(self, executions):
+        self.executions = executions
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._all_started = threading.Barrier(min(len(executions), workflowExecutionStatus.MAX_STATUS_WORKERS),
+                                              timeout=5)
+
+    def describe_execution(self, executionArn):
+        with self._lock:
+            self.calls.append(executionArn)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            self._all_started.wait()
+        except threading.BrokenBarrierError:
+            pass
+        with self._lock:
+            self.active -= 1
+        return self.executions[executionArn]
+
+
+@pytest.fixture
+def table(monkeypatch):
+    with mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName=EXECUTION_TABLE,
+            KeySchema=[{"AttributeName": "databaseId:assetId", "KeyType": "HASH"},
+                       {"AttributeName": "executionId", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "databaseId:assetId", "AttributeType": "S"},
+                                  {"AttributeName": "executionId", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST")
+        monkeypatch.setattr(workflowExecutionStatus, "dynamodb_client", client)
+        yield client
+
+
+def _put_execution(client, execution_id, stop_date="", status="NEW"):
+    client.put_item(TableName=EXECUTION_TABLE, Item={
+        "databaseId:assetId": {"S": PARTITION_KEY},
+        "executionId": {"S": execution_id},
+        "workflow_arn": {"S": WORKFLOW_ARN},
+        "startDate": {"S": ""},
+        "stopDate": {"S": stop_date},
+        "executionStatus": {"S": status},
+    })
+
+
+def _row(execution_id, stop_date=""):
+    return {
+        "databaseId:assetId": PARTITION_KEY,
+        "executionId": execution_id,
+        "workflow_arn": WORKFLOW_ARN,
+        "stopDate": stop_date,
+    }
+
+
+def _stored(client, execution_id):
+    return client.get_item(TableName=EXECUTION_TABLE, Key={
+        "databaseId:assetId": {"S": PARTITION_KEY},
+        "executionId": {"S": execution_id},
+    })["Item"]
+
+
+def test_record_completion_updates_open_row_once(table):
+    _put_execution(table, "exec1")
+
+    assert workflowExecutionStatus.record_execution_completion(
+        EXECUTION_TABLE, PARTITION_KEY, "exec1", "SUCCEEDED", "01/01/2025, 10:00:00", "01/01/2025, 10:05:00")
+    assert not workflowExecutionStatus.record_execution_completion(
+        EXECUTION_TABLE, PARTITION_KEY, "exec1", "FAILED", "01/01/2025, 10:00:00", "01/01/2025, 11:00:00")
+
+    item = _stored(table, "exec1")
+    assert item["executionStatus"] == {"S": "SUCCEEDED"}
+    assert item["stopDate"] == {"S": "01/01/2025, 10:05:00"}
+    assert item["workflow_arn"] == {"S": WORKFLOW_ARN}
+
+
+def test_record_completion_does_not_create_missing_rows(table):
+    assert not workflowExecutionStatus.record_execution_completion(
+        EXECUTION_TABLE, PARTITION_KEY, "missing", "SUCCEEDED", "", "01/01/2025, 10:05:00")
+
+    assert "Item" not in table.get_item(TableName=EXECUTION_TABLE, Key={
+        "databaseId:assetId": {"S": PARTITION_KEY},
+        "executionId": {"S": "missing"},
+    })
+
+
+def test_refresh_describes_only_open_executions_concurrently(table, monkeypatch):
+    started = datetime(2025, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+    stopped = datetime(2025, 1, 1, 10, 5, 0, tzinfo=timezone.utc)
+    executions = {}
+    rows = []
+    for index in range(4):
+        execution_id = f"exec{index}"
+        _put_execution(table, execution_id)
+        rows.append(_row(execution_id))
+        execution = {"name": execution_id, "status": "RUNNING", "startDate": started}
+        if index % 2 == 0:
+            execution.update({"status": "SUCCEEDED", "stopDate": stopped})
+        executions[workflowExecutionStatus.get_execution_arn(rows[-1])] = execution
+    _put_execution(table, "done", stop_date="01/01/2025, 09:00:00", status="SUCCEEDED")
+    rows.append(_row("done", stop_date="01/01/2025, 09:00:00"))
+
+    sfn = _FakeStepFunctions(executions)
+    monkeypatch.setattr(workflowExecutionStatus, "sfn_client", sfn)
+
+    result = workflowExecutionStatus.refresh_open_executions(EXECUTION_TABLE, rows)
+
+    assert sorted(result) == ["exec0", "exec1", "exec2", "exec3"]
+    assert len(sfn.calls) == 4
+    assert sfn.max_active > 1
+    assert result["exec0"]["stopDate"] == "01/01/2025, 10:05:00"
+    assert result["exec1"] == {"executionId": "exec1", "executionStatus": "RUNNING",
+                               "startDate": "01/01/2025, 10:00:00", "stopDate": ""}
+    assert _stored(table, "exec0")["executionStatus"] == {"S": "SUCCEEDED"}
+    assert _stored(table, "exec1")["executionStatus"] == {"S": "NEW"}
+
+
+def test_status_change_event_records_completion(table):
+    _put_execution(table, "exec1")
+    event = {
+        "detail-type": "Step Functions Execution Status Change",
+        "source": "aws.states",
+        "detail": {
+            "name": "exec1",
+            "status": "FAILED",
+            "executionArn": WORKFLOW_ARN.replace("stateMachine", "execution") + ":exec1",
+            "startDate": 1735725600000,
+            "stopDate": 1735725900000,
+            "input": json.dumps({"databaseId": "db1", "assetId": "asset1", "workflowId": "wf1"}),
+        },
+    }
+
+    assert updateWorkflowExecutionStatus.lambda_handler(event, None) == {"updated": True}
+
+    item = _stored(table, "exec1")
+    assert item["executionStatus"] == {"S": "FAILED"}
+    assert item["startDate"] == {"S": "01/01/2025, 10:00:00"}
+    assert item["stopDate"] == {"S": "01/01/2025, 10:05:00"}
+
+
+def test_status_change_event_ignores_non_vams_executions(table):
+    event = {"detail": {"name": "other", "status": "SUCCEEDED", "input": json.dumps({"foo": "bar"})}}
+
+    assert updateWorkflowExecutionStatus.lambda_handler(event, None) == {"updated": False}
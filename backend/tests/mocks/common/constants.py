@@ -17,3 +17,4 @@ STANDARD_JSON_RESPONSE = {
 DEFAULT_REGION = "us-east-1"
 DEFAULT_PAGE_SIZE = 20
 MAX_PAGE_SIZE = 100
+MAX_DIGEST_FILES = 50
@@ -19,12 +19,13 @@ class safeLogger:
         """
         self.service = service_name if service_name is not None else service
         
-    def info(self, message):
+    def info(self, message, **kwargs):
         """
         Log an informational message.
         
         Args:
             message: The message to log
+            **kwargs: Logging keyword arguments such as extra
         """
         # In the mock implementation, we don't actually log anything
         pass
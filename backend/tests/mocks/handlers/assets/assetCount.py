@@ -1,6 +1,12 @@
 # Mock for assetCount.py
 from unittest.mock import MagicMock
 
-# Create a mock function for update_asset_count
-update_asset_count = MagicMock()
-update_asset_count.return_value = None
\ No newline at end of file
+# Create mock functions for the asset count helpers
+increment_asset_count = MagicMock()
+increment_asset_count.return_value = None
+
+reconcile_asset_count = MagicMock()
+reconcile_asset_count.return_value = 0
+
+count_assets = MagicMock()
+count_assets.return_value = 0
@@ -3,11 +3,9 @@
 
 import os
 import boto3
-import threading
 from botocore.exceptions import ClientError
 from utils.logging import log
-from boto3.s3.transfer import TransferConfig
-from utils.pipeline.extensions import split_large_file
+from . import s3_transfer
 
 logger = log.get_logger()
 
@@ -32,88 +30,23 @@ def download(bucket_name, object_key, file_path):
 
 def uploadV2(bucket_name, object_key, file_path):
     logger.info(
-        f"Uploading Object to S3 Bucket w/ auto chunking for multi-part.\nBucket:{bucket_name}.\n:Object: {object_key}"
+        f"Uploading Object to S3 Bucket w/ concurrent multi-part.\nBucket:{bucket_name}.\n:Object: {object_key}"
     )
-
-   # Multipart upload
-    try:
-        GB = 1024 ** 3
-        MB = 1024 ** 2
-        config = TransferConfig(multipart_threshold=1*GB, max_concurrency=10,
-                                multipart_chunksize=100*MB, use_threads=True
-                                )
-        s3.meta.client.upload_file(file_path, bucket_name, object_key,
-                                   ExtraArgs={},
-                                   Config=config,
-                                   Callback=ProgressPercentage(file_path)
-                                   )
-    except ClientError as e:
-        logger.exception(e)
-        return None
-    return object_key
+    return s3_transfer.upload_file(bucket_name, object_key, file_path)
 
 
 def upload(bucket_name, object_key, file_path):
     logger.info(
         f"Uploading Object to S3 Bucket.\nBucket:{bucket_name}.\n:Object: {object_key}"
     )
+    return s3_transfer.upload_file(bucket_name, object_key, file_path)
 
-    # Check if our file is larger than 1GB; If so, split it up and upload each part otherwise upload as is
-    if os.path.getsize(file_path) > 1000000000:
-        logger.info(
-            f"Splitting Large File to S3 Multi-part upload: {file_path}")
-        split_large_file(file_path)
-
-        try:
-            # Create Multipart Upload
-            multipart_upload = client.create_multipart_upload(
-                Bucket=bucket_name,
-                Key=object_key,
-            )
-
-            # Upload each part of the file
-            uploadedS3Parts = []
-            part_number = 1
-            for part in split_large_file(file_path):
-                logger.info(f"Uploading Multi-part Split File: {part}")
-
-                uploadPart = client.MultipartUploadPart(
-                    bucket_name, object_key, multipart_upload['UploadId'], part_number
-                )
-
-                uploadPartResponse = uploadPart.upload(
-                    Body=part,
-                )
-
-                uploadedS3Parts.append({
-                    'PartNumber': part_number,
-                    'ETag': uploadPartResponse['ETag']
-                })
 
-                part_number = part_number + 1
-
-            # Complete Multipart Upload
-            completeResult = client.complete_multipart_upload(
-                Bucket=bucket_name,
-                Key=object_key,
-                MultipartUpload={
-                    'Parts': uploadedS3Parts
-                },
-                UploadId=multipart_upload['UploadId'],
-            )
-        except ClientError as e:
-            logger.exception(e)
-            return None
-        return object_key
-
-    else:
-        try:
-            with open(file_path, "rb") as data:
-                client.upload_fileobj(data, bucket_name, object_key)
-        except ClientError as e:
-            logger.exception(e)
-            return None
-        return object_key
+def upload_directory(bucket_name, key_prefix, local_dir, relative_paths=None):
+    logger.info(
+        f"Uploading Directory to S3 Bucket.\nBucket:{bucket_name}.\n:Prefix: {key_prefix}"
+    )
+    return s3_transfer.upload_directory(bucket_name, key_prefix, local_dir, relative_paths)
 
 
 def exists(bucket_name, object_key):
@@ -231,23 +164,3 @@ def get_all_files_in_path(bucket, path):
     logger.info("Files in the path: ")
     logger.info(len(result["Items"]))
     return result["Items"]
-
-# Class for multipart upload
-class ProgressPercentage(object):
-    def __init__(self, filename):
-        self._filename = filename
-        self._size = float(os.path.getsize(filename))
-        self._seen_so_far = 0
-        self._lock = threading.Lock()
-
-    def __call__(self, bytes_amount):
-        # To simplify we'll assume this is hooked up
-        # to a single filename.
-        with self._lock:
-            self._seen_so_far += bytes_amount
-            percentage = (self._seen_so_far / self._size) * 100
-            # sys.stdout.write(
-            #     "\r%s  %s / %s  (%.2f%%)" % (
-            #         self._filename, self._seen_so_far, self._size,
-            #         percentage))
-            # sys.stdout.flush()
@@ -0,0 +1,141 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Container S3 transfer utilities shared by the VAMS pipeline containers.
+
+- Files are streamed from disk: small files with a single PUT, large files as multipart
+  uploads whose parts are read from their file offsets while they are sent (no split files
+  or whole-file buffering).
+- All uploads of a container share one transfer manager, so S3_TRANSFER_MAX_CONCURRENCY
+  bounds the requests in flight across every file and part, including directory uploads.
+- Every PUT / part carries a SHA-256 checksum that S3 verifies server side; a
+  mismatching body is rejected and the upload fails.
+
+This is the single source of the module. The infrastructure copies it into each pipeline
+container that uses it before the container image is built (see
+infra/lib/nestedStacks/pipelines/constructs/shared-pipeline-modules.ts).
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+
+# Same root logger configuration as the containers' logging utilities
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger()
+
+MB = 1024 ** 2
+
+# Files above this size use a multipart upload
+MULTIPART_THRESHOLD = int(os.getenv("S3_MULTIPART_THRESHOLD_BYTES", str(256 * MB)))
+# Size of each multipart part, grown automatically to stay within the S3 part count limit
+MULTIPART_PART_SIZE = int(os.getenv("S3_MULTIPART_PART_SIZE_BYTES", str(64 * MB)))
+# Concurrent S3 requests (PUTs and parts) across all uploads of the container
+MAX_CONCURRENCY = int(os.getenv("S3_TRANSFER_MAX_CONCURRENCY", "16"))
+
+UPLOAD_EXTRA_ARGS = {"ChecksumAlgorithm": "SHA256"}
+
+client = boto3.client(
+    "s3",
+    region_name=os.getenv("AWS_REGION", "us-east-1"),
+    config=Config(
+        retries={"max_attempts": 10, "mode": "adaptive"},
+        max_pool_connections=MAX_CONCURRENCY * 2,
+    ),
+)
+
+transfer_config = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_PART_SIZE,
+    max_concurrency=MAX_CONCURRENCY,
+    use_threads=True,
+)
+
+_transfer_manager = None
+_transfer_manager_lock = threading.Lock()
+
+
+def get_transfer_manager():
+    """Return the transfer manager shared by all uploads of the container"""
+    global _transfer_manager
+    with _transfer_manager_lock:
+        if _transfer_manager is None:
+            _transfer_manager = create_transfer_manager(client, transfer_config)
+        return _transfer_manager
+
+
+def _submit_upload(bucket_name: str, object_key: str, file_path: str):
+    return get_transfer_manager().upload(file_path, bucket_name, object_key, extra_args=UPLOAD_EXTRA_ARGS)
+
+
+def upload_file(bucket_name: str, object_key: str, file_path: str) -> Optional[str]:
+    """
+    Upload a single file, using a concurrent multipart upload above MULTIPART_THRESHOLD.
+
+    Returns:
+        The object key on success, or None on failure
+    """
+    try:
+        _submit_upload(bucket_name, object_key, file_path).result()
+    except (BotoCoreError, ClientError, OSError) as e:
+        logger.exception(e)
+        return None
+    return object_key
+
+
+def upload_directory(
+    bucket_name: str,
+    key_prefix: str,
+    local_dir: str,
+    relative_paths: Optional[List[str]] = None,
+) -> Dict[str, List[str]]:
+    """
+    Upload files from a local directory under an S3 key prefix.
+
+    The files are queued on the shared transfer manager, so the directory upload runs at most
+    MAX_CONCURRENCY requests at a time regardless of the number or size of the files.
+
+    Args:
+        bucket_name: Destination bucket
+        key_prefix: Destination key prefix (joined with each relative path)
+        local_dir: Local directory the relative paths are resolved against
+        relative_paths: Files to upload; defaults to every file under local_dir
+
+    Returns:
+        Dictionary with the 'uploaded' object keys and the 'failed' relative paths
+    """
+    if relative_paths is None:
+        relative_paths = []
+        for root, _, files in os.walk(local_dir):
+            for name in files:
+                relative_paths.append(os.path.relpath(os.path.join(root, name), local_dir))
+
+    result = {"uploaded": [], "failed": []}
+    if not relative_paths:
+        return result
+
+    logger.info(f"Uploading {len(relative_paths)} files from {local_dir} to s3://{bucket_name}/{key_prefix}")
+
+    futures = []
+    for relative_path in relative_paths:
+        object_key = os.path.join(key_prefix, relative_path)
+        futures.append(
+            (relative_path, object_key, _submit_upload(bucket_name, object_key, os.path.join(local_dir, relative_path)))
+        )
+
+    for relative_path, object_key, future in futures:
+        try:
+            future.result()
+            result["uploaded"].append(object_key)
+        except (BotoCoreError, ClientError, OSError) as e:
+            logger.error(f"Failed to upload {relative_path}: {e}")
+            result["failed"].append(relative_path)
+
+    return result
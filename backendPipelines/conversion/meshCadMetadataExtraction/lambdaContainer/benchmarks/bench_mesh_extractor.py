@@ -0,0 +1,122 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmarks for the mesh metadata extractor.
+
+Compares the previous per-face Python loop and np.unique(axis=0) row sort
+against the vectorized implementations in metadata_extractors.mesh_extractor,
+individually and end to end through extract_mesh_statistics on a synthetic
+scan-sized triangle mesh (2M faces by default).
+
+Usage (from the lambdaContainer directory, inside the pipeline image or an
+environment with requirements.txt installed):
+
+    python -m benchmarks.bench_mesh_extractor [--faces 2000000] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+import trimesh
+
+from metadata_extractors import mesh_extractor
+
+
+def _legacy_degenerate_faces(faces):
+    """Previous implementation: np.unique per face in a Python loop."""
+    degenerate = 0
+    for face in faces:
+        if len(np.unique(face)) < 3:
+            degenerate += 1
+    return degenerate
+
+
+def _legacy_unique_vertices(vertices):
+    """Previous implementation: lexicographic sort of float rows."""
+    return len(np.unique(vertices, axis=0))
+
+
+def _legacy_mesh_statistics(mesh):
+    """Previous single-mesh extract_mesh_statistics body."""
+    stats = {
+        'faces': len(mesh.faces),
+        'vertices': len(mesh.vertices),
+        'edges': len(mesh.edges),
+        'watertight': mesh.is_watertight,
+        'manifold': mesh.is_volume,
+    }
+    stats['duplicate_vertices'] = len(mesh.vertices) - _legacy_unique_vertices(mesh.vertices)
+    stats['degenerate_faces'] = _legacy_degenerate_faces(mesh.faces)
+    return stats
+
+
+def build_synthetic_mesh(n_faces: int, seed: int = 0):
+    """
+    Build a scanned-style triangle soup: random faces over a vertex pool that contains
+    exact duplicate vertices, with about 1% degenerate faces.
+    """
+    rng = np.random.default_rng(seed)
+    n_vertices = max(n_faces // 2, 4)
+    vertices = rng.random((n_vertices, 3)) * 100.0
+    # Duplicate 5% of the vertices (as unmerged exports do)
+    duplicates = rng.integers(0, n_vertices, size=n_vertices // 20)
+    vertices[rng.integers(0, n_vertices, size=len(duplicates))] = vertices[duplicates]
+    faces = rng.integers(0, n_vertices, size=(n_faces, 3), dtype=np.int64)
+    degenerate_rows = rng.integers(0, n_faces, size=n_faces // 100)
+    faces[degenerate_rows, 2] = faces[degenerate_rows, 0]
+    return vertices, faces
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--faces", type=int, default=2_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    vertices, faces = build_synthetic_mesh(args.faces)
+    print(f"Synthetic mesh: {len(faces):,} faces, {len(vertices):,} vertices")
+
+    legacy_time, legacy_count = _time(lambda: _legacy_degenerate_faces(faces), 1)
+    vector_time, vector_count = _time(lambda: mesh_extractor.count_degenerate_faces(faces), args.repeat)
+    assert legacy_count == vector_count, "degenerate face count mismatch"
+    print(
+        f"degenerate_faces       legacy {legacy_time:8.3f}s  vectorized {vector_time:8.3f}s  "
+        f"speedup {legacy_time / vector_time:6.1f}x  ({vector_count:,} degenerate)"
+    )
+
+    legacy_time, legacy_count = _time(lambda: _legacy_unique_vertices(vertices), 1)
+    vector_time, vector_count = _time(lambda: mesh_extractor.count_unique_rows(vertices), args.repeat)
+    assert legacy_count == vector_count, "unique vertex count mismatch"
+    print(
+        f"unique_vertices        legacy {legacy_time:8.3f}s  hashed     {vector_time:8.3f}s  "
+        f"speedup {legacy_time / vector_time:6.1f}x  ({len(vertices) - vector_count:,} duplicates)"
+    )
+
+    # End to end on a trimesh object; fresh meshes so trimesh's property caches do not carry over
+    legacy_time, legacy_stats = _time(
+        lambda: _legacy_mesh_statistics(trimesh.Trimesh(vertices, faces, process=False)), 1
+    )
+    vector_time, vector_stats = _time(
+        lambda: mesh_extractor.extract_mesh_statistics(trimesh.Trimesh(vertices, faces, process=False)), 1
+    )
+    assert legacy_stats == vector_stats, "mesh statistics mismatch"
+    print(
+        f"extract_mesh_statistics legacy {legacy_time:7.3f}s  vectorized {vector_time:8.3f}s  "
+        f"speedup {legacy_time / vector_time:6.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -37,17 +37,20 @@ def extract_mesh_metadata(file_path: str) -> Dict[str, Any]:
         # Initialize metadata dictionary
         metadata = {}
         
+        # Walk the loaded geometry once; the extractors below share the summary
+        summary = summarize_geometry(mesh)
+        
         # Extract geometric metadata
-        metadata['AB_geometric_metadata'] = extract_geometric_metadata(mesh)
+        metadata['AB_geometric_metadata'] = extract_geometric_metadata(mesh, summary)
         
         # Extract mesh statistics
-        metadata['AB_mesh_statistics'] = extract_mesh_statistics(mesh)
+        metadata['AB_mesh_statistics'] = extract_mesh_statistics(mesh, summary)
         
         # Extract format-specific metadata
         metadata['AB_format_specific'] = extract_format_specific_metadata(mesh, file_extension)
         
         # Extract visual metadata (textures, materials)
-        metadata['AB_visual_metadata'] = extract_visual_metadata(mesh)
+        metadata['AB_visual_metadata'] = extract_visual_metadata(mesh, summary)
         
         # Extract animation data if available
         if hasattr(mesh, 'animation'):
@@ -55,7 +58,7 @@ def extract_mesh_metadata(file_path: str) -> Dict[str, Any]:
         
         # Extract scene hierarchy if it's a scene
         if isinstance(mesh, trimesh.Scene):
-            metadata['AB_scene_hierarchy'] = extract_scene_hierarchy(mesh)
+            metadata['AB_scene_hierarchy'] = extract_scene_hierarchy(mesh, summary)
         
         
         return metadata
@@ -66,12 +69,154 @@ def extract_mesh_metadata(file_path: str) -> Dict[str, Any]:
         return {
         }
 
-def extract_geometric_metadata(mesh) -> Dict[str, Any]:
+def summarize_geometry(mesh) -> Dict[str, Any]:
+    """
+    Walk a mesh or scene once and collect the per-geometry values shared by the extractors.
+    
+    Expensive trimesh properties (volume, watertightness, ...) are evaluated exactly
+    once per geometry here instead of once per extractor.
+    
+    Args:
+        mesh: Trimesh mesh or scene
+        
+    Returns:
+        Dictionary with a 'geometries' mapping of geometry name (None for a single mesh)
+        to its summary
+    """
+    if isinstance(mesh, trimesh.Scene):
+        items = mesh.geometry.items()
+    else:
+        items = [(None, mesh)]
+    
+    geometries = {}
+    for name, geom in items:
+        try:
+            geometries[name] = _summarize_single_geometry(geom)
+        except Exception as e:
+            logger.warning(f"Error summarizing geometry {name}: {str(e)}")
+            geometries[name] = {'type': type(geom).__name__}
+    
+    return {'geometries': geometries}
+
+def _summarize_single_geometry(geom) -> Dict[str, Any]:
+    """
+    Collect counts, mass properties, topology flags and visuals for one geometry.
+    Attributes a geometry type does not support are stored as None.
+    """
+    info = {'type': type(geom).__name__}
+    
+    info['face_count'] = len(geom.faces) if hasattr(geom, 'faces') else None
+    info['vertex_count'] = len(geom.vertices) if hasattr(geom, 'vertices') else None
+    if isinstance(geom, trimesh.Trimesh):
+        # Trimesh edges are the three (unmerged) edges of every face
+        info['edge_count'] = 3 * len(geom.faces)
+    else:
+        info['edge_count'] = len(geom.edges) if hasattr(geom, 'edges') else None
+    info['volume'] = geom.volume if hasattr(geom, 'volume') else None
+    info['area'] = geom.area if hasattr(geom, 'area') else None
+    info['watertight'] = geom.is_watertight if hasattr(geom, 'is_watertight') else None
+    info['manifold'] = geom.is_volume if hasattr(geom, 'is_volume') else None
+    
+    visual = getattr(geom, 'visual', None)
+    info['material'] = getattr(visual, 'material', None) if visual is not None else None
+    info['texture'] = getattr(visual, 'texture', None) if visual is not None else None
+    
+    return info
+
+def count_degenerate_faces(faces: np.ndarray) -> int:
+    """
+    Count faces that reference the same vertex more than once.
+    
+    Args:
+        faces: (n, k) array of vertex indices
+        
+    Returns:
+        Number of degenerate faces
+    """
+    faces = np.asarray(faces)
+    if faces.ndim != 2 or len(faces) == 0:
+        return 0
+    
+    if faces.shape[1] == 3:
+        # Row-wise equality masks for triangles
+        degenerate = (
+            (faces[:, 0] == faces[:, 1]) |
+            (faces[:, 1] == faces[:, 2]) |
+            (faces[:, 0] == faces[:, 2])
+        )
+    else:
+        # General polygons: a repeated index shows up as equal neighbours once each row is sorted
+        sorted_faces = np.sort(faces, axis=1)
+        degenerate = (sorted_faces[:, 1:] == sorted_faces[:, :-1]).any(axis=1)
+    
+    return int(np.count_nonzero(degenerate))
+
+def count_unique_rows(data: np.ndarray, digits: Optional[int] = None) -> int:
+    """
+    Count unique rows by hashing quantized rows to 64-bit keys.
+    
+    Avoids the lexicographic sort of np.unique(axis=0) on float rows. Floats are
+    quantized to the trimesh merge tolerance (or ``digits`` decimals) first, so
+    vertices closer than that tolerance count as duplicates, matching what
+    trimesh's merge_vertices would merge.
+    
+    Args:
+        data: (n, m) array of rows
+        digits: Decimal digits kept when quantizing floats; defaults to trimesh's tol.merge
+        
+    Returns:
+        Number of unique rows
+    """
+    data = np.asarray(data)
+    if len(data) == 0:
+        return 0
+    if data.ndim == 1:
+        data = data.reshape(-1, 1)
+    
+    if data.dtype.kind == 'f':
+        if digits is None:
+            digits = trimesh.util.decimal_to_digits(trimesh.tol.merge)
+        as_int = trimesh.grouping.float_to_int(data, digits=digits)
+    else:
+        as_int = data
+    as_int = np.ascontiguousarray(as_int, dtype=np.int64)
+    
+    # Mix every column into a single 64-bit key (wrapping multiply/xor-shift)
+    keys = np.zeros(len(as_int), dtype=np.uint64)
+    for column in as_int.view(np.uint64).T:
+        keys ^= column
+        keys *= np.uint64(0x9E3779B97F4A7C15)
+        keys ^= keys >> np.uint64(29)
+    
+    keys.sort()
+    return int(1 + np.count_nonzero(keys[1:] != keys[:-1]))
+
+def count_unique_colors(colors: np.ndarray) -> int:
+    """
+    Count unique vertex colors, packing RGBA bytes into one 32-bit key per row.
+    
+    Args:
+        colors: (n, 3|4) array of colors
+        
+    Returns:
+        Number of unique colors
+    """
+    colors = np.asarray(colors)
+    if len(colors) == 0:
+        return 0
+    if colors.dtype == np.uint8 and colors.ndim == 2 and colors.shape[1] <= 4:
+        packed = np.zeros((len(colors), 4), dtype=np.uint8)
+        packed[:, :colors.shape[1]] = colors
+        return int(len(np.unique(packed.view(np.uint32).reshape(-1))))
+    return count_unique_rows(colors)
+
+def extract_geometric_metadata(mesh, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Extract geometric metadata from a mesh.
     
     Args:
         mesh: Trimesh mesh or scene
+        summary: Optional result of summarize_geometry(mesh) to reuse
         
     Returns:
         Dictionary containing geometric metadata
@@ -79,11 +224,14 @@ def extract_geometric_metadata(mesh) -> Dict[str, Any]:
     try:
         # Handle both single meshes and scenes
         if isinstance(mesh, trimesh.Scene):
+            if summary is None:
+                summary = summarize_geometry(mesh)
+            geometries = summary['geometries'].values()
             # For scenes, get the bounds of all geometry
             bounds = mesh.bounds
             # Get total volume and area if possible
-            volume = sum(g.volume for g in mesh.geometry.values() if hasattr(g, 'volume'))
-            area = sum(g.area for g in mesh.geometry.values() if hasattr(g, 'area'))
+            volume = sum(g['volume'] for g in geometries if g.get('volume') is not None)
+            area = sum(g['area'] for g in geometries if g.get('area') is not None)
         else:
             # For single meshes
             bounds = mesh.bounds
@@ -130,49 +278,51 @@ def extract_geometric_metadata(mesh) -> Dict[str, Any]:
             'extraction_error': str(e)
         }
 
-def extract_mesh_statistics(mesh) -> Dict[str, Any]:
+def extract_mesh_statistics(mesh, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Extract mesh statistics.
     
     Args:
         mesh: Trimesh mesh or scene
+        summary: Optional result of summarize_geometry(mesh) to reuse
         
     Returns:
         Dictionary containing mesh statistics
     """
     try:
+        if summary is None:
+            summary = summarize_geometry(mesh)
+        
         if isinstance(mesh, trimesh.Scene):
             # Aggregate statistics for all meshes in the scene
+            geometries = summary['geometries'].values()
             stats = {
                 'mesh_count': len(mesh.geometry),
-                'total_faces': sum(len(g.faces) for g in mesh.geometry.values() if hasattr(g, 'faces')),
-                'total_vertices': sum(len(g.vertices) for g in mesh.geometry.values() if hasattr(g, 'vertices')),
-                'total_edges': sum(len(g.edges) for g in mesh.geometry.values() if hasattr(g, 'edges')),
-                'watertight': all(g.is_watertight for g in mesh.geometry.values() if hasattr(g, 'is_watertight')),
-                'manifold': all(g.is_volume for g in mesh.geometry.values() if hasattr(g, 'is_volume'))
+                'total_faces': sum(g['face_count'] for g in geometries if g.get('face_count') is not None),
+                'total_vertices': sum(g['vertex_count'] for g in geometries if g.get('vertex_count') is not None),
+                'total_edges': sum(g['edge_count'] for g in geometries if g.get('edge_count') is not None),
+                'watertight': all(g['watertight'] for g in geometries if g.get('watertight') is not None),
+                'manifold': all(g['manifold'] for g in geometries if g.get('manifold') is not None)
             }
         else:
             # Statistics for a single mesh
+            info = summary['geometries'][None]
             stats = {
-                'faces': len(mesh.faces) if hasattr(mesh, 'faces') else 0,
-                'vertices': len(mesh.vertices) if hasattr(mesh, 'vertices') else 0,
-                'edges': len(mesh.edges) if hasattr(mesh, 'edges') else 0,
-                'watertight': mesh.is_watertight if hasattr(mesh, 'is_watertight') else False,
-                'manifold': mesh.is_volume if hasattr(mesh, 'is_volume') else False
+                'faces': info.get('face_count') or 0,
+                'vertices': info.get('vertex_count') or 0,
+                'edges': info.get('edge_count') or 0,
+                'watertight': bool(info.get('watertight')),
+                'manifold': bool(info.get('manifold'))
             }
             
             # Check for duplicate vertices
             if hasattr(mesh, 'vertices'):
-                unique_verts = len(np.unique(mesh.vertices, axis=0))
+                unique_verts = count_unique_rows(mesh.vertices)
                 stats['duplicate_vertices'] = len(mesh.vertices) - unique_verts
             
             # Check for degenerate faces
             if hasattr(mesh, 'faces'):
-                degenerate = 0
-                for face in mesh.faces:
-                    if len(np.unique(face)) < 3:
-                        degenerate += 1
-                stats['degenerate_faces'] = degenerate
+                stats['degenerate_faces'] = count_degenerate_faces(mesh.faces)
         
         return stats
     except Exception as e:
@@ -237,12 +387,13 @@ def extract_format_specific_metadata(mesh, file_extension: str) -> Dict[str, Any
             'extraction_error': str(e)
         }
 
-def extract_visual_metadata(mesh) -> Dict[str, Any]:
+def extract_visual_metadata(mesh, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Extract visual metadata (textures, materials).
     
     Args:
         mesh: Trimesh mesh or scene
+        summary: Optional result of summarize_geometry(mesh) to reuse
         
     Returns:
         Dictionary containing visual metadata
@@ -252,28 +403,29 @@ def extract_visual_metadata(mesh) -> Dict[str, Any]:
         
         # Handle both single meshes and scenes
         if isinstance(mesh, trimesh.Scene):
+            if summary is None:
+                summary = summarize_geometry(mesh)
             # For scenes, collect materials and textures from all meshes
             materials = []
             textures = []
             
-            for name, geom in mesh.geometry.items():
-                if hasattr(geom, 'visual') and hasattr(geom.visual, 'material'):
-                    mat = geom.visual.material
-                    if mat is not None:
-                        materials.append({
-                            'geometry_name': name,
-                            'material_name': getattr(mat, 'name', f"material_{len(materials)}"),
-                            'properties': extract_material_properties(mat)
-                        })
+            for name, info in summary['geometries'].items():
+                mat = info.get('material')
+                if mat is not None:
+                    materials.append({
+                        'geometry_name': name,
+                        'material_name': getattr(mat, 'name', f"material_{len(materials)}"),
+                        'properties': extract_material_properties(mat)
+                    })
                 
                 # Extract textures
-                if hasattr(geom, 'visual') and hasattr(geom.visual, 'texture'):
-                    if geom.visual.texture is not None:
-                        textures.append({
-                            'geometry_name': name,
-                            'texture_name': getattr(geom.visual.texture, 'name', f"texture_{len(textures)}"),
-                            'properties': extract_texture_properties(geom.visual.texture)
-                        })
+                texture = info.get('texture')
+                if texture is not None:
+                    textures.append({
+                        'geometry_name': name,
+                        'texture_name': getattr(texture, 'name', f"texture_{len(textures)}"),
+                        'properties': extract_texture_properties(texture)
+                    })
             
             visual_data['materials'] = materials
             visual_data['textures'] = textures
@@ -301,8 +453,7 @@ def extract_visual_metadata(mesh) -> Dict[str, Any]:
             if mesh.visual.vertex_colors is not None:
                 visual_data['has_vertex_colors'] = True
                 # Count unique colors
-                unique_colors = np.unique(mesh.visual.vertex_colors, axis=0)
-                visual_data['unique_vertex_colors'] = len(unique_colors)
+                visual_data['unique_vertex_colors'] = count_unique_colors(mesh.visual.vertex_colors)
         
         return visual_data
     except Exception as e:
@@ -403,17 +554,22 @@ def extract_animation_data(mesh) -> Dict[str, Any]:
             'extraction_error': str(e)
         }
 
-def extract_scene_hierarchy(scene) -> Dict[str, Any]:
+def extract_scene_hierarchy(scene, summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Extract scene hierarchy from a Trimesh scene.
     
     Args:
         scene: Trimesh scene
+        summary: Optional result of summarize_geometry(scene) to reuse
         
     Returns:
         Dictionary containing scene hierarchy
     """
     try:
+        if summary is None:
+            summary = summarize_geometry(scene)
+        geometries = summary['geometries']
+        
         hierarchy = {
             'node_count': len(scene.graph.nodes),
             'nodes': []
@@ -421,28 +577,25 @@ def extract_scene_hierarchy(scene) -> Dict[str, Any]:
         
         # Extract node information
         for node_name in scene.graph.nodes_geometry:
-            # Get transformation matrix
-            transform = scene.graph.get(node_name)[0]
-            
-            # Get geometry reference
-            geom_name = scene.graph.get(node_name)[1]
+            # Get transformation matrix and geometry reference
+            transform, geom_name = scene.graph.get(node_name)
             
             # Get geometry if available
-            if geom_name in scene.geometry:
-                geom = scene.geometry[geom_name]
+            if geom_name in geometries:
+                info = geometries[geom_name]
                 
                 # Extract node data
                 node_data = {
                     'name': node_name,
                     'geometry_name': geom_name,
                     'transform': transform.tolist(),
-                    'geometry_type': type(geom).__name__,
+                    'geometry_type': info['type'],
                 }
                 
                 # Add basic geometry stats
-                if hasattr(geom, 'vertices') and hasattr(geom, 'faces'):
-                    node_data['vertex_count'] = len(geom.vertices)
-                    node_data['face_count'] = len(geom.faces)
+                if info.get('vertex_count') is not None and info.get('face_count') is not None:
+                    node_data['vertex_count'] = info['vertex_count']
+                    node_data['face_count'] = info['face_count']
                 
                 hierarchy['nodes'].append(node_data)
         
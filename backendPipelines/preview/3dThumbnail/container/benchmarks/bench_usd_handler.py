@@ -0,0 +1,112 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Microbenchmarks for the USD handler geometry paths.
+
+Compares the previous per-face Python loops against the vectorized NumPy
+implementations in preview_pipeline.format_handlers.usd_handler on a synthetic
+stage-sized mesh (mixed triangles, quads and n-gons, 5M faces by default).
+
+Usage (from the container directory, inside the pipeline image or an environment
+with requirements.txt installed):
+
+    python -m benchmarks.bench_usd_handler [--faces 5000000] [--repeat 3]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from preview_pipeline.format_handlers import usd_handler
+
+
+def _legacy_triangulate_faces(face_vertex_counts, face_vertex_indices):
+    """Previous implementation: per-face fan triangulation appending Python lists."""
+    triangles = []
+    idx = 0
+    indices_len = len(face_vertex_indices)
+    for count in face_vertex_counts:
+        if count < 3:
+            idx += count
+            continue
+        if idx + count > indices_len:
+            break
+        v0 = face_vertex_indices[idx]
+        for i in range(1, count - 1):
+            triangles.append([v0, face_vertex_indices[idx + i], face_vertex_indices[idx + i + 1]])
+        idx += count
+    return triangles
+
+
+def _legacy_face_varying_average(sampled, face_vertex_indices, num_points):
+    """Previous implementation: np.add.at accumulation of face-varying samples."""
+    fvi = np.array(face_vertex_indices)
+    color_accum = np.zeros((num_points, 3), dtype=np.float64)
+    color_count = np.zeros(num_points, dtype=np.int32)
+    np.add.at(color_accum, fvi, sampled)
+    np.add.at(color_count, fvi, 1)
+    mask = color_count > 0
+    color_accum[mask] /= color_count[mask, np.newaxis]
+    return color_accum
+
+
+def build_synthetic_stage_arrays(n_faces: int, seed: int = 0):
+    """
+    Build faceVertexCounts/faceVertexIndices as a USD mesh would expose them:
+    70% quads, 25% triangles and 5% pentagons over a shared vertex pool.
+    """
+    rng = np.random.default_rng(seed)
+    counts = rng.choice(np.array([4, 3, 5], dtype=np.int32), size=n_faces, p=[0.70, 0.25, 0.05])
+    n_points = max(n_faces // 2, 4)
+    indices = rng.integers(0, n_points, size=int(counts.sum()), dtype=np.int32)
+    return counts, indices, n_points
+
+
+def _time(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--faces", type=int, default=5_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    counts, indices, n_points = build_synthetic_stage_arrays(args.faces)
+    print(f"Synthetic stage: {len(counts):,} faces, {len(indices):,} face-vertex indices, {n_points:,} points")
+
+    # The legacy loop received Python lists converted from the Vt arrays
+    legacy_time, legacy_tris = _time(
+        lambda: _legacy_triangulate_faces(list(counts), list(indices)), 1
+    )
+    vector_time, vector_tris = _time(lambda: usd_handler._triangulate_faces(counts, indices), args.repeat)
+    assert np.array_equal(np.array(legacy_tris, dtype=np.int64), vector_tris), "triangulation mismatch"
+    print(
+        f"triangulate_faces      legacy {legacy_time:8.3f}s  vectorized {vector_time:8.3f}s  "
+        f"speedup {legacy_time / vector_time:6.1f}x  ({len(vector_tris):,} triangles)"
+    )
+
+    sampled = np.random.default_rng(1).random((len(indices), 3)) * 255
+    legacy_time, legacy_colors = _time(
+        lambda: _legacy_face_varying_average(sampled, indices, n_points), 1
+    )
+    vector_time, vector_colors = _time(
+        lambda: usd_handler._average_per_vertex(sampled, indices, n_points), args.repeat
+    )
+    assert np.allclose(legacy_colors, vector_colors), "face-varying average mismatch"
+    print(
+        f"face_varying_average   legacy {legacy_time:8.3f}s  vectorized {vector_time:8.3f}s  "
+        f"speedup {legacy_time / vector_time:6.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,9 @@ Follows the pcPotreeViewer pipeline pattern: parse input, dispatch to handler, u
 
 import os
 import json
+import shutil
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .utils.pipeline.objects import (
@@ -32,6 +34,9 @@ logger = get_logger()
 # Maximum input file size: 100 GB
 MAX_INPUT_FILE_SIZE = 100 * 1024 * 1024 * 1024
 
+# Number of upcoming batch inputs downloaded in the background while the current one renders
+BATCH_PREFETCH_DEPTH = max(1, int(os.getenv("BATCH_PREFETCH_DEPTH", "2")))
+
 
 def hello():
     logger.info("Preview 3D Thumbnail Pipeline - Generates preview images from 3D files")
@@ -45,6 +50,10 @@ def run(params: dict) -> PipelineExecutionParams:
     definition = PipelineDefinition(**params)
     logger.info(f"Pipeline Definition: {definition}")
 
+    # Batch mode: many input files processed within one container launch
+    if definition.batchManifest:
+        return _run_batch(definition)
+
     # Set pipeline current stage
     if definition.currentStage is None:
         current_stage = PipelineStage(**definition.stages.pop(0))
@@ -123,6 +132,141 @@ def run(params: dict) -> PipelineExecutionParams:
     return output
 
 
+def _run_batch(definition: PipelineDefinition) -> PipelineExecutionParams:
+    """
+    Batch runner for Preview 3D Thumbnail Pipeline.
+
+    The batch manifest in S3 lists one single-file pipeline definition per input
+    file. All files are processed in this container launch so the heavy format
+    modules and the offscreen plotter are only initialized once. The next inputs
+    are downloaded on background threads while the current file renders.
+
+    Each file reports its own outcome to the workflow task token in its definition,
+    so a failing file does not fail the other files of the batch.
+    """
+    manifest = definition.batchManifest
+    logger.info(f"Running Preview 3D Thumbnail Pipeline in batch mode. Manifest: {manifest}")
+
+    try:
+        items = _load_batch_items(manifest)
+    except Exception as e:
+        logger.exception(f"Failed to load batch manifest: {e}")
+        output = PipelineExecutionParams(
+            definition.jobName,
+            None,
+            [definition.to_json()],
+            definition.inputMetadata,
+            definition.inputParameters,
+            definition.externalSfnTaskToken,
+            PipelineStatus.FAILED,
+        )
+        if definition.localTest == "False":
+            sfn.send_task_failure(f"Unable to load batch manifest: {str(e)}")
+        return output
+
+    logger.info(f"Batch contains {len(items)} input files")
+
+    batch_results = []
+    renderer.enable_persistent_plotter()
+    try:
+        with ThreadPoolExecutor(max_workers=BATCH_PREFETCH_DEPTH) as executor:
+            pending = {}
+
+            def _schedule(index):
+                if index < len(items) and index not in pending:
+                    pending[index] = executor.submit(_prefetch_batch_item, items[index], index)
+
+            for index in range(BATCH_PREFETCH_DEPTH):
+                _schedule(index)
+
+            for index, item_definition in enumerate(items):
+                # Keep the prefetch window full while this file renders
+                _schedule(index + BATCH_PREFETCH_DEPTH)
+                stage, prepared, local_input_dir = pending.pop(index).result()
+
+                if isinstance(prepared, PipelineStage):
+                    result_stage = prepared
+                else:
+                    try:
+                        result_stage = _render_and_upload(stage, prepared, False)
+                    except Exception as e:
+                        logger.exception(f"Unexpected error in preview pipeline: {e}")
+                        result_stage = _error_response(stage, f"Unexpected pipeline error: {str(e)}")
+
+                shutil.rmtree(local_input_dir, ignore_errors=True)
+                batch_results.append(_report_batch_item(item_definition, result_stage))
+    finally:
+        renderer.close_persistent_plotter()
+
+    succeeded = sum(1 for result in batch_results if result["status"] == PipelineStatus.COMPLETE)
+    logger.info(f"Batch finished: {succeeded} of {len(batch_results)} files succeeded")
+
+    output = PipelineExecutionParams(
+        definition.jobName,
+        None,
+        [definition.to_json()],
+        definition.inputMetadata,
+        definition.inputParameters,
+        definition.externalSfnTaskToken,
+        PipelineStatus.COMPLETE,
+        batch_results,
+    )
+
+    # Per-file failures were already reported to their own workflows
+    if definition.localTest == "False":
+        sfn.send_task_success(output)
+
+    return output
+
+
+def _load_batch_items(manifest: dict) -> list:
+    """Download the batch manifest and return the per-file pipeline definitions."""
+    manifest_location = StageInput(**manifest)
+    manifest_data = s3.read_json(manifest_location.bucketName, manifest_location.objectKey)
+    if manifest_data is None:
+        raise ValueError(
+            f"Batch manifest not found: {manifest_location.bucketName}/{manifest_location.objectKey}"
+        )
+    return [PipelineDefinition(**item) for item in manifest_data.get("items", [])]
+
+
+def _prefetch_batch_item(item_definition: PipelineDefinition, index: int):
+    """
+    Validate and download the input of one batch item.
+    Runs on a background thread; returns (stage, prepared input or failed stage, input dir).
+    """
+    stage = PipelineStage(**item_definition.stages[0])
+    local_input_dir = _create_dir(["tmp", "input", str(index)])
+    try:
+        prepared = _prepare_input(
+            stage,
+            item_definition.inputParameters,
+            False,
+            item_definition.assetId,
+            local_input_dir,
+        )
+    except Exception as e:
+        logger.exception(f"Failed to prepare batch input: {e}")
+        prepared = _error_response(stage, f"Failed to prepare input: {str(e)}")
+    return stage, prepared, local_input_dir
+
+
+def _report_batch_item(item_definition: PipelineDefinition, result_stage: PipelineStage) -> dict:
+    """Send the outcome of one batch file to its workflow and return its result entry."""
+    token = item_definition.externalSfnTaskToken
+    if item_definition.localTest == "False":
+        if result_stage.status is PipelineStatus.FAILED:
+            sfn.send_external_task_failure(token, result_stage.errorMessage)
+        else:
+            sfn.send_external_task_success(token)
+
+    return {
+        "objectKey": StageInput(**result_stage.inputFile).objectKey,
+        "status": result_stage.status,
+        "errorMessage": result_stage.errorMessage,
+    }
+
+
 def _run_preview_pipeline(
     stage: PipelineStage,
     inputMetadata: str = "",
@@ -139,6 +283,33 @@ def _run_preview_pipeline(
     4. Save as GIF (with size optimization / JPEG fallback)
     5. Upload to S3 output directory
     """
+    local_input_dir = _create_dir(["tmp", "input"])
+
+    logger.info("Running Preview 3D Thumbnail Pipeline...")
+    logger.info(f"Stage: {stage}")
+
+    prepared = _prepare_input(stage, inputParameters, localTest, assetId, local_input_dir)
+    if isinstance(prepared, PipelineStage):
+        return prepared
+
+    return _render_and_upload(stage, prepared, localTest)
+
+
+def _prepare_input(
+    stage: PipelineStage,
+    inputParameters: str,
+    localTest: bool,
+    assetId: str,
+    local_input_dir: str,
+):
+    """
+    Resolve, validate and download the input file for a stage.
+
+    Returns a dict describing the local input (filepath, extension and relative
+    output subdirectory) or a failed PipelineStage if the input cannot be used.
+    Only performs I/O, so batch mode runs it on a background thread to prefetch
+    the next inputs while the current one renders.
+    """
     # Parse input parameters
     inputParametersObject = {}
     if isinstance(inputParameters, str) and inputParameters != "":
@@ -147,13 +318,6 @@ def _run_preview_pipeline(
         except Exception:
             logger.error("Input parameters is not valid JSON.")
 
-    # Create local working directories
-    local_input_dir = _create_dir(["tmp", "input"])
-    local_output_dir = _create_dir(["tmp", "output"])
-
-    logger.info("Running Preview 3D Thumbnail Pipeline...")
-    logger.info(f"Stage: {stage}")
-
     # Get pipeline stage input and output
     stage_input = StageInput(**stage.inputFile)
     stage_output = StageOutput(**stage.outputFiles)
@@ -274,6 +438,23 @@ def _run_preview_pipeline(
         except Exception as e:
             logger.warning(f"Failed to download some GLTF dependencies: {e}")
 
+    return {
+        "localFilepath": local_filepath,
+        "ext": ext,
+        "relativeSubdir": relative_subdir,
+    }
+
+
+def _render_and_upload(stage: PipelineStage, prepared: dict, localTest: bool) -> PipelineStage:
+    """
+    Load a prepared input file, render its preview and upload the result.
+    """
+    local_filepath = prepared["localFilepath"]
+    ext = prepared["ext"]
+    relative_subdir = prepared["relativeSubdir"]
+    stage_output = StageOutput(**stage.outputFiles)
+    local_output_dir = _create_dir(["tmp", "output"])
+
     # Load with appropriate handler
     try:
         pv_data = _load_file(local_filepath, ext)
@@ -336,7 +517,6 @@ def _run_preview_pipeline(
 
         if localTest:
             # In localTest mode, copy output to the mounted /data/output directory
-            import shutil
             local_output_base = os.path.join(stage_output.objectDir, relative_subdir) if relative_subdir else stage_output.objectDir
             if not os.path.isdir(local_output_base):
                 os.makedirs(local_output_base, exist_ok=True)
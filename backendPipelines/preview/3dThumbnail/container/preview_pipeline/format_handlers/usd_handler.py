@@ -83,49 +83,43 @@ def load(file_path: str) -> pv.PolyData:
             logger.warning(f"Skipping prim {prim.GetPath()}: empty geometry data")
             continue
 
-        # Convert points to numpy and apply world transform
-        points_np = np.array(points, dtype=np.float64)
+        # Vt arrays expose contiguous buffers, so these conversions are single copies
+        points_np = np.asarray(points, dtype=np.float64).reshape(-1, 3)
         if len(points_np) == 0:
             logger.warning(f"Skipping prim {prim.GetPath()}: no vertices")
             continue
+        counts_np = np.asarray(face_vertex_counts, dtype=np.int64)
+        indices_np = np.asarray(face_vertex_indices, dtype=np.int64)
 
         world_transform = xform_cache.GetLocalToWorldTransform(prim)
         matrix = np.array(world_transform, dtype=np.float64)
 
-        # Apply 4x4 transform to points (homogeneous coordinates).
+        # Apply 4x4 transform to points.
         # USD Gf.Matrix4d uses row-vector convention: p' = p * M
-        # so the correct multiplication is points_h @ matrix (NOT matrix.T).
-        # Transposing was incorrect and caused multi-prim scenes to have
-        # wrong world positions, leading to bad camera framing / bounds.
-        ones = np.ones((len(points_np), 1), dtype=np.float64)
-        points_h = np.hstack([points_np, ones])
-        transformed = points_h @ matrix
-        points_np = transformed[:, :3]
+        # so the correct multiplication is p @ M (NOT M.T). Transposing was
+        # incorrect and caused multi-prim scenes to have wrong world positions,
+        # leading to bad camera framing / bounds. Only the rotation/scale block
+        # and the translation row contribute to xyz, so skip the homogeneous column.
+        points_np = points_np @ matrix[:3, :3] + matrix[3, :3]
 
         # Triangulate faces (handle quads and n-gons)
-        triangles = _triangulate_faces(
-            list(face_vertex_counts),
-            list(face_vertex_indices),
-        )
+        triangles = _triangulate_faces(counts_np, indices_np)
 
-        if not triangles:
+        if len(triangles) == 0:
             logger.warning(f"Skipping prim {prim.GetPath()}: no triangles after triangulation")
             continue
 
-        # Offset triangle indices
-        triangles_np = np.array(triangles, dtype=np.int64) + vertex_offset
-
+        # Offset triangle indices into the merged vertex array
         all_vertices.append(points_np)
-        all_faces.append(triangles_np)
+        all_faces.append(triangles + vertex_offset)
 
         # Extract per-vertex colors: try texture-baked colors first, then displayColor,
         # then fall back to the material's base color (flat color from shader graph)
-        fvi_list = list(face_vertex_indices)
         colors = _extract_texture_colors(
-            stage, prim, file_path, list(face_vertex_counts), fvi_list, len(points_np)
+            stage, prim, file_path, counts_np, indices_np, len(points_np)
         )
         if colors is None:
-            colors = _extract_display_colors(mesh, len(points_np))
+            colors = _extract_display_colors(mesh, len(points_np), counts_np, indices_np)
         if colors is None:
             colors = _extract_material_base_color(prim, len(points_np))
         if colors is not None:
@@ -137,19 +131,17 @@ def load(file_path: str) -> pv.PolyData:
     if not all_vertices:
         raise ValueError("No valid mesh geometry found in USD stage")
 
-    # Merge all geometry
-    merged_vertices = np.vstack(all_vertices)
-    merged_faces = np.vstack(all_faces)
-
-    # Build PyVista PolyData
+    # Merge all geometry with a single concatenation per array
+    merged_vertices = np.concatenate(all_vertices)
+    merged_faces = np.concatenate(all_faces)
     n_faces = len(merged_faces)
-    pv_faces = np.column_stack([np.full(n_faces, 3), merged_faces]).ravel()
-    pv_mesh = pv.PolyData(merged_vertices, pv_faces)
+
+    # Build PyVista PolyData directly from the (M, 3) triangle array
+    pv_mesh = pv.PolyData.from_regular_faces(merged_vertices, merged_faces)
 
     # Apply vertex colors if available
     if all_colors and sum(len(c) for c in all_colors) == len(merged_vertices):
-        merged_colors = np.vstack(all_colors)
-        pv_mesh.point_data["RGB"] = merged_colors
+        pv_mesh.point_data["RGB"] = np.concatenate(all_colors)
 
     # Normalize up-axis based on USD stage metadata
     pv_mesh = _normalize_usd_up_axis(stage, pv_mesh)
@@ -221,40 +213,85 @@ def _extract_material_base_color(prim, num_points):
 
 def _triangulate_faces(face_vertex_counts, face_vertex_indices):
     """
-    Triangulate polygon faces into triangles.
+    Triangulate polygon faces into an (M, 3) int64 array of triangles.
     Handles triangles (3), quads (4), and arbitrary n-gons via fan triangulation.
-    """
-    triangles = []
-    idx = 0
-    indices_len = len(face_vertex_indices)
 
-    for count in face_vertex_counts:
-        if count < 3:
-            idx += count
-            continue
-
-        # Bounds check to handle malformed USD files
-        if idx + count > indices_len:
-            logger.warning(
-                f"Face vertex indices out of bounds at idx={idx}, count={count}, "
-                f"total indices={indices_len}. Stopping triangulation."
-            )
-            break
-
-        # Fan triangulation from first vertex
-        v0 = face_vertex_indices[idx]
-        for i in range(1, count - 1):
-            v1 = face_vertex_indices[idx + i]
-            v2 = face_vertex_indices[idx + i + 1]
-            triangles.append([v0, v1, v2])
-        idx += count
+    Vectorized over faceVertexCounts/faceVertexIndices: face offsets come from a
+    cumulative sum of the counts, and every fan triangle (v0, vi, vi+1) is gathered
+    from the index buffer with repeat/arange offsets instead of a per-face loop.
+    """
+    counts = np.asarray(face_vertex_counts, dtype=np.int64)
+    indices = np.asarray(face_vertex_indices, dtype=np.int64)
+    indices_len = len(indices)
+
+    if len(counts) == 0:
+        return np.empty((0, 3), dtype=np.int64)
+
+    # Fast path: already fully triangulated
+    if counts.min() == 3 and counts.max() == 3 and len(counts) * 3 == indices_len:
+        return indices.reshape(-1, 3)
+
+    offsets = np.cumsum(counts) - counts
+
+    # Bounds check to handle malformed USD files: stop at the first polygon that
+    # runs past the end of the index buffer (degenerate faces are only skipped)
+    out_of_bounds = np.flatnonzero((offsets + counts > indices_len) & (counts >= 3))
+    if len(out_of_bounds) > 0:
+        first_bad = out_of_bounds[0]
+        logger.warning(
+            f"Face vertex indices out of bounds at idx={offsets[first_bad]}, count={counts[first_bad]}, "
+            f"total indices={indices_len}. Stopping triangulation."
+        )
+        counts = counts[:first_bad]
+        offsets = offsets[:first_bad]
+
+    # Faces with fewer than 3 vertices produce no triangles
+    valid = counts >= 3
+    counts = counts[valid]
+    offsets = offsets[valid]
+
+    tris_per_face = counts - 2
+    n_tris = int(tris_per_face.sum())
+    if n_tris == 0:
+        return np.empty((0, 3), dtype=np.int64)
+
+    # For each triangle: the offset of its face and its fan position i (1..count-2)
+    face_base = np.repeat(offsets, tris_per_face)
+    first_tri = np.cumsum(tris_per_face) - tris_per_face
+    fan_pos = np.arange(n_tris, dtype=np.int64) - np.repeat(first_tri, tris_per_face) + 1
+
+    triangles = np.empty((n_tris, 3), dtype=np.int64)
+    triangles[:, 0] = indices[face_base]
+    triangles[:, 1] = indices[face_base + fan_pos]
+    triangles[:, 2] = indices[face_base + fan_pos + 1]
     return triangles
 
 
-def _extract_display_colors(mesh, num_points):
+def _average_per_vertex(values, vertex_ids, num_points):
+    """
+    Average (K, C) per-sample values onto the vertices given by vertex_ids.
+    Uses bincount per channel, which is much faster than np.add.at for large meshes.
+    Vertices without samples get zeros.
+    """
+    vertex_ids = np.asarray(vertex_ids, dtype=np.int64)
+    counts = np.bincount(vertex_ids, minlength=num_points)[:num_points]
+    averaged = np.zeros((num_points, values.shape[1]), dtype=np.float64)
+    for channel in range(values.shape[1]):
+        averaged[:, channel] = np.bincount(
+            vertex_ids, weights=values[:, channel], minlength=num_points
+        )[:num_points]
+    mask = counts > 0
+    averaged[mask] /= counts[mask, np.newaxis]
+    return averaged
+
+
+def _extract_display_colors(mesh, num_points, face_vertex_counts=None, face_vertex_indices=None):
     """
     Extract displayColor primvar from a UsdGeom.Mesh.
     Returns an (N, 3) uint8 numpy array of RGB colors, or None if not available.
+
+    Constant and vertex colors map directly. Uniform (per-face) and faceVarying
+    colors are expanded onto vertices by averaging the samples that touch each vertex.
     """
     from pxr import UsdGeom
 
@@ -265,11 +302,12 @@ def _extract_display_colors(mesh, num_points):
         return None
 
     try:
-        colors_raw = color_primvar.Get()
+        # ComputeFlattened resolves indexed primvars in C++
+        colors_raw = color_primvar.ComputeFlattened()
         if colors_raw is None or len(colors_raw) == 0:
             return None
 
-        colors_np = np.array(colors_raw, dtype=np.float64)
+        colors_np = np.asarray(colors_raw, dtype=np.float64)
 
         # Handle constant interpolation (single color for entire mesh)
         if len(colors_np.shape) == 1:
@@ -282,18 +320,33 @@ def _extract_display_colors(mesh, num_points):
             )
             return None
 
+        colors_np = colors_np[:, :3]
+        interpolation = str(color_primvar.GetInterpolation())
+
         if colors_np.shape[0] == 1:
             # Broadcast single color to all vertices
-            colors_np = np.tile(colors_np, (num_points, 1))
-        elif colors_np.shape[0] != num_points:
-            # Face-varying or other interpolation - skip for now
+            colors_np = np.broadcast_to(colors_np, (num_points, 3))
+        elif colors_np.shape[0] == num_points:
+            pass
+        elif face_vertex_indices is not None and interpolation == "faceVarying" \
+                and colors_np.shape[0] == len(face_vertex_indices):
+            colors_np = _average_per_vertex(colors_np, face_vertex_indices, num_points)
+        elif face_vertex_counts is not None and face_vertex_indices is not None \
+                and interpolation == "uniform" and colors_np.shape[0] == len(face_vertex_counts):
+            # Expand per-face colors to every face-vertex, then average per vertex
+            face_colors = np.repeat(colors_np, np.asarray(face_vertex_counts, dtype=np.int64), axis=0)
+            n = min(len(face_colors), len(face_vertex_indices))
+            colors_np = _average_per_vertex(
+                face_colors[:n], np.asarray(face_vertex_indices)[:n], num_points
+            )
+        else:
             logger.warning(
                 f"displayColor count ({colors_np.shape[0]}) != vertex count ({num_points}), skipping colors"
             )
             return None
 
         # Convert from float [0,1] to uint8 [0,255]
-        colors_uint8 = (np.clip(colors_np[:, :3], 0.0, 1.0) * 255).astype(np.uint8)
+        colors_uint8 = (np.clip(colors_np, 0.0, 1.0) * 255).astype(np.uint8)
         return colors_uint8
 
     except Exception as e:
@@ -359,9 +412,10 @@ def _get_uv_coords(prim):
     for name in common_names:
         pvar = primvar_api.GetPrimvar(name)
         if pvar and pvar.HasValue():
-            uvs_raw = pvar.Get()
+            # ComputeFlattened gathers indexed primvars in C++
+            uvs_raw = pvar.ComputeFlattened()
             if uvs_raw is not None and len(uvs_raw) > 0:
-                uvs = np.array(uvs_raw, dtype=np.float64)
+                uvs = np.asarray(uvs_raw, dtype=np.float64)
                 if uvs.ndim == 2 and uvs.shape[1] >= 2:
                     interpolation = str(pvar.GetInterpolation())
                     return uvs[:, :2], interpolation
@@ -372,9 +426,9 @@ def _get_uv_coords(prim):
             continue
         type_name = str(pvar.GetTypeName())
         if "2f" in type_name or "float2" in type_name or "texCoord" in type_name:
-            uvs_raw = pvar.Get()
+            uvs_raw = pvar.ComputeFlattened()
             if uvs_raw is not None and len(uvs_raw) > 0:
-                uvs = np.array(uvs_raw, dtype=np.float64)
+                uvs = np.asarray(uvs_raw, dtype=np.float64)
                 if uvs.ndim == 2 and uvs.shape[1] >= 2:
                     interpolation = str(pvar.GetInterpolation())
                     logger.info(f"    Found UV primvar: {pvar.GetName()} ({type_name})")
@@ -625,7 +679,7 @@ def _bake_texture_to_colors(texture_image, uvs, interpolation, face_vertex_indic
 
     if interpolation == "faceVarying":
         # UVs are per face-vertex (one per entry in face_vertex_indices)
-        fvi = np.array(face_vertex_indices)
+        fvi = np.asarray(face_vertex_indices, dtype=np.int64)
         num_fv = min(len(uvs), len(fvi))
 
         uv_coords = uvs[:num_fv]
@@ -633,15 +687,8 @@ def _bake_texture_to_colors(texture_image, uvs, interpolation, face_vertex_indic
         py = np.clip((1.0 - uv_coords[:, 1] % 1.0) * (h - 1), 0, h - 1).astype(np.int32)
         sampled = tex_array[py, px, :3].astype(np.float64)
 
-        # Accumulate per vertex and average
-        color_accum = np.zeros((num_points, 3), dtype=np.float64)
-        color_count = np.zeros(num_points, dtype=np.int32)
-        np.add.at(color_accum, fvi[:num_fv], sampled)
-        np.add.at(color_count, fvi[:num_fv], 1)
-
-        mask = color_count > 0
-        color_accum[mask] /= color_count[mask, np.newaxis]
-        return color_accum.astype(np.uint8)
+        # Average per vertex (handles shared vertices at UV seams)
+        return _average_per_vertex(sampled, fvi[:num_fv], num_points).astype(np.uint8)
 
     else:
         # Per-vertex UVs (vertex or uniform interpolation)
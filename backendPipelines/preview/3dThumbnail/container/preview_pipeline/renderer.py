@@ -35,6 +35,53 @@ _FOCUS_PERCENTILE_HI = 98
 # 25 degrees is the industry standard for 3D product thumbnails.
 _CAMERA_ELEVATION_DEG = 25
 
+# Offscreen plotter kept open across renders in batch mode (None = create per render)
+_persistent_plotter = None
+_persistent_enabled = False
+
+
+def enable_persistent_plotter():
+    """
+    Keep one offscreen plotter (and its render window / GL context) open across
+    renders. Used by batch mode so each file does not pay the context setup cost.
+    """
+    global _persistent_enabled
+    _persistent_enabled = True
+
+
+def close_persistent_plotter():
+    """Close the persistent plotter and return to one plotter per render."""
+    global _persistent_plotter, _persistent_enabled
+    _persistent_enabled = False
+    if _persistent_plotter is not None:
+        _persistent_plotter.close()
+        _persistent_plotter = None
+
+
+def _acquire_plotter(resolution: tuple) -> pv.Plotter:
+    """Return a clean offscreen plotter, reusing the persistent one when enabled."""
+    global _persistent_plotter
+    if not _persistent_enabled:
+        plotter = pv.Plotter(off_screen=True, window_size=resolution)
+    elif _persistent_plotter is None:
+        plotter = _persistent_plotter = pv.Plotter(off_screen=True, window_size=resolution)
+    else:
+        # Clear leftovers from the previous render (also after a failed render)
+        plotter = _persistent_plotter
+        plotter.clear_actors()
+        for light in getattr(plotter, "_preview_lights", []):
+            plotter.renderer.RemoveLight(light)
+        plotter.window_size = resolution
+    plotter._preview_lights = []
+    plotter.set_background(_BG_COLOR)
+    return plotter
+
+
+def _release_plotter(plotter: pv.Plotter):
+    """Close a per-render plotter; the persistent plotter stays open for the next render."""
+    if plotter is not _persistent_plotter:
+        plotter.close()
+
 
 def generate_rotating_frames(
     pv_data: pv.PolyData,
@@ -48,8 +95,7 @@ def generate_rotating_frames(
     """
     logger.info(f"Generating {n_frames} rotating frames at {resolution}")
 
-    plotter = pv.Plotter(off_screen=True, window_size=resolution)
-    plotter.set_background(_BG_COLOR)
+    plotter = _acquire_plotter(resolution)
 
     is_point_cloud = pv_data.n_cells == 0 or pv_data.n_cells == pv_data.n_points
 
@@ -92,7 +138,7 @@ def generate_rotating_frames(
         img = _add_alpha_from_depth(plotter, img)
         frames.append(img)
 
-    plotter.close()
+    _release_plotter(plotter)
     logger.info(f"Generated {len(frames)} frames")
     return frames
 
@@ -108,8 +154,7 @@ def generate_static_frame(
     """
     logger.info(f"Generating static frame at {resolution}")
 
-    plotter = pv.Plotter(off_screen=True, window_size=resolution)
-    plotter.set_background(_BG_COLOR)
+    plotter = _acquire_plotter(resolution)
 
     is_point_cloud = pv_data.n_cells == 0 or pv_data.n_cells == pv_data.n_points
 
@@ -142,7 +187,7 @@ def generate_static_frame(
     plotter.render()
     img = plotter.screenshot(return_img=True)
     img = _add_alpha_from_depth(plotter, img)
-    plotter.close()
+    _release_plotter(plotter)
 
     return img
 
@@ -180,7 +225,9 @@ def _add_mesh(plotter: pv.Plotter, pv_data: pv.PolyData):
             specular_power=15,
         )
 
-    plotter.add_light(pv.Light(position=(1, 1, 1), intensity=0.8))
+    light = pv.Light(position=(1, 1, 1), intensity=0.8)
+    plotter.add_light(light)
+    plotter._preview_lights.append(light)
 
 
 def _add_point_cloud(plotter: pv.Plotter, pv_data: pv.PolyData):
@@ -79,6 +79,7 @@ class PipelineDefinition(JsonEncodable):
     assetId: str = ""
     completedStages: list[PipelineStage] = None
     currentStage: PipelineStage = None
+    batchManifest: dict = None  # {bucketName, objectKey} of a batch manifest listing per-file definitions
 
 
 @dataclass
@@ -90,3 +91,4 @@ class PipelineExecutionParams(JsonEncodable):
     inputParameters: str
     externalSfnTaskToken: str = ""
     status: PipelineStatus = PipelineStatus.PENDING
+    batchResults: list[dict] = None  # Per-file results when running in batch mode
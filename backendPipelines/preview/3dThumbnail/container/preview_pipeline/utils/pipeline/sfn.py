@@ -52,3 +52,32 @@ def send_external_task_heartbeat(externalSfnTaskToken: str):
         except Exception as e:
             logger.exception(e)
             # Don't raise error further, just fail silently if these fail.
+
+
+def send_external_task_success(externalSfnTaskToken: str):
+    """Report success directly to an external (VAMS workflow) task token. Used by batch mode."""
+    if externalSfnTaskToken:
+        try:
+            logger.info(f"Sending External Task Success. Token: {externalSfnTaskToken}")
+            return client.send_task_success(
+                taskToken=externalSfnTaskToken,
+                output=json.dumps({'status': 'Pipeline Success'}),
+            )
+        except Exception as e:
+            logger.exception(e)
+            # Don't raise error further so the remaining batch files still get processed.
+
+
+def send_external_task_failure(externalSfnTaskToken: str, errorMessage: str = ''):
+    """Report failure directly to an external (VAMS workflow) task token. Used by batch mode."""
+    if externalSfnTaskToken:
+        try:
+            logger.error(f"Sending External Task Failure. Token: {externalSfnTaskToken}")
+            return client.send_task_failure(
+                taskToken=externalSfnTaskToken,
+                error='Pipeline Failure: ' + (errorMessage or ''),
+                cause='See AWS cloudwatch logs for full error log and cause.'
+            )
+        except Exception as e:
+            logger.exception(e)
+            # Don't raise error further so the remaining batch files still get processed.
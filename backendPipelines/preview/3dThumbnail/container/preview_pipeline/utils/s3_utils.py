@@ -1,13 +1,13 @@
 # Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import os
-import threading
 
 import boto3
 from botocore.exceptions import ClientError
-from boto3.s3.transfer import TransferConfig
 from .logging import get_logger
+from . import s3_transfer
 
 logger = get_logger()
 
@@ -32,31 +32,10 @@ def download(bucket_name, object_key, file_path):
 
 def upload(bucket_name, object_key, file_path):
     logger.info(
-        f"Uploading Object to S3 Bucket w/ auto chunking for multi-part.\n"
+        f"Uploading Object to S3 Bucket w/ concurrent multi-part.\n"
         f"Bucket:{bucket_name}.\nObject: {object_key}"
     )
-
-    try:
-        GB = 1024 ** 3
-        MB = 1024 ** 2
-        config = TransferConfig(
-            multipart_threshold=1 * GB,
-            max_concurrency=10,
-            multipart_chunksize=100 * MB,
-            use_threads=True,
-        )
-        s3.meta.client.upload_file(
-            file_path,
-            bucket_name,
-            object_key,
-            ExtraArgs={},
-            Config=config,
-            Callback=ProgressPercentage(file_path),
-        )
-    except ClientError as e:
-        logger.exception(e)
-        return None
-    return object_key
+    return s3_transfer.upload_file(bucket_name, object_key, file_path)
 
 
 def get_object_size(bucket_name, object_key):
@@ -91,17 +70,15 @@ def list_objects_with_prefix(bucket_name, prefix):
         return []
 
 
-class ProgressPercentage(object):
-    def __init__(self, filename):
-        self._filename = filename
-        self._size = float(os.path.getsize(filename))
-        self._seen_so_far = 0
-        self._lock = threading.Lock()
-
-    def __call__(self, bytes_amount):
-        with self._lock:
-            self._seen_so_far += bytes_amount
-            percentage = (self._seen_so_far / self._size) * 100
-            logger.debug(
-                f"Upload progress: {self._filename} {self._seen_so_far}/{self._size} ({percentage:.2f}%)"
-            )
+def read_json(bucket_name, object_key):
+    """
+    Read and parse a JSON object from S3.
+    Returns the parsed object, or None if the object doesn't exist or on error.
+    """
+    logger.info(f"Reading JSON object: {bucket_name}/{object_key}")
+    try:
+        response = client.get_object(Bucket=bucket_name, Key=object_key)
+        return json.loads(response["Body"].read())
+    except ClientError as e:
+        logger.exception(f"Failed to read JSON object: {e}")
+        return None
@@ -16,21 +16,47 @@ def lambda_handler(event, context):
     logger.info(f"Event: {event}")
     logger.info(f"Context: {context}")
 
-    definition = construct_preview_3d_thumbnail_definition(event)
+    if event.get("batchManifestS3Path"):
+        definition = construct_preview_3d_thumbnail_batch_definition(event)
+    else:
+        definition = construct_preview_3d_thumbnail_definition(event)
 
     logger.info(f"Definition: {definition}")
 
     return {
         "jobName": event.get("jobName"),
-        "currentStageType": definition["stages"][0]["type"],
+        "currentStageType": definition["stages"][0]["type"] if definition["stages"] else "PREVIEW_3D_THUMBNAIL",
         "definition": [json.dumps(definition)],
         "inputMetadata": "", #Don't pass metadata as not needed here and causes less room for errors due to long metadata for ECS payloads
         "inputParameters": event.get("inputParameters", ""),
         "externalSfnTaskToken": event.get("externalSfnTaskToken", ""),
+        "batchManifestS3Path": event.get("batchManifestS3Path", ""),
         "status": "STARTING"
     }
 
 
+def construct_preview_3d_thumbnail_batch_definition(event) -> dict:
+    """
+    Batch definition for the container. The per-file definitions live in the batch
+    manifest on S3 as they can exceed the container command override size limit.
+    """
+    manifest_bucket, manifest_key = event['batchManifestS3Path'].replace("s3://", "").split("/", 1)
+
+    definition = {
+        "jobName": event.get("jobName"),
+        "stages": [],
+        "inputMetadata": "",
+        "inputParameters": "",
+        "externalSfnTaskToken": "",
+        "batchManifest": {
+            "bucketName": manifest_bucket,
+            "objectKey": manifest_key,
+        },
+    }
+
+    return definition
+
+
 def construct_preview_3d_thumbnail_definition(event) -> dict:
     input_s3_asset_file_uri = event['inputS3AssetFilePath']
     output_s3_asset_files_uri = event.get('outputS3AssetFilesPath', '')
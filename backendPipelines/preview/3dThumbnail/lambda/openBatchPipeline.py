@@ -0,0 +1,147 @@
+#  Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#  SPDX-License-Identifier: Apache-2.0
+
+import os
+import uuid
+import boto3
+import json
+import datetime
+from customLogging.logger import safeLogger
+from constructPipeline import construct_preview_3d_thumbnail_definition
+
+logger = safeLogger(service="OpenBatchPipeline")
+
+sfn = boto3.client(
+    'stepfunctions',
+    region_name=os.environ["AWS_REGION"]
+)
+s3 = boto3.client('s3')
+
+STATE_MACHINE_ARN = os.environ["STATE_MACHINE_ARN"]
+ALLOWED_INPUT_FILEEXTENSIONS = os.environ["ALLOWED_INPUT_FILEEXTENSIONS"]
+BATCH_MANIFEST_BUCKET = os.environ["BATCH_MANIFEST_BUCKET"]
+MAX_FILES_PER_BATCH = int(os.environ.get("MAX_FILES_PER_BATCH", "100"))
+
+BATCH_MANIFEST_PREFIX = "pipelines/preview3dThumbnail/batches/"
+
+
+def abort_external_workflow(error, task_token):
+    if (task_token != None and task_token != ""):
+        logger.error(f"Aborting external task: {task_token}")
+        try:
+            sfn.send_task_failure(
+                taskToken=task_token,
+                error='Pipeline Failure: ' + error,
+                cause='See AWS cloudwatch logs for error cause.'
+            )
+        except Exception as e:
+            logger.exception(e)
+
+
+def is_valid_input(payload):
+    """Apply the same input checks as openPipeline, aborting the file's workflow when invalid"""
+    input_s3_asset_file_uri = payload.get('inputS3AssetFilePath', '')
+    external_sfn_task_token = payload.get('sfnExternalTaskToken', '')
+
+    #Folder check
+    if (not input_s3_asset_file_uri or input_s3_asset_file_uri.endswith("/")):
+        abort_external_workflow("Input S3 URI cannot be a folder for this pipeline", external_sfn_task_token)
+        return False
+
+    # Check to make sure we are working with the right file types
+    file_root, extension = os.path.splitext(input_s3_asset_file_uri)
+    if (not extension or extension == '' or extension.lower() not in ALLOWED_INPUT_FILEEXTENSIONS):
+        abort_external_workflow("Pipeline cannot process file type provided", external_sfn_task_token)
+        return False
+
+    return True
+
+
+def start_batch(payloads):
+    """
+    Write a batch manifest with one single-file pipeline definition per payload and
+    start one state machine execution (one container launch) for the whole batch.
+    """
+    job_name = f"PipelineBatchJob_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+
+    items = []
+    for payload in payloads:
+        items.append(construct_preview_3d_thumbnail_definition({
+            "jobName": job_name,
+            "inputS3AssetFilePath": payload['inputS3AssetFilePath'],
+            "outputS3AssetFilesPath": payload.get('outputS3AssetFilesPath', ''),
+            "inputOutputS3AssetAuxiliaryFilesPath": payload.get('inputOutputS3AssetAuxiliaryFilesPath', ''),
+            "inputParameters": payload.get('inputParameters', ''),
+            "externalSfnTaskToken": payload.get('sfnExternalTaskToken', ''),
+            "assetId": payload.get('assetId', ''),
+        }))
+
+    manifest_key = f"{BATCH_MANIFEST_PREFIX}{job_name}.json"
+
+    try:
+        s3.put_object(
+            Bucket=BATCH_MANIFEST_BUCKET,
+            Key=manifest_key,
+            Body=json.dumps({"items": items}).encode('utf-8'),
+            ContentType='application/json'
+        )
+
+        sfn_input = {
+            "jobName": job_name,
+            "batchManifestS3Path": f"s3://{BATCH_MANIFEST_BUCKET}/{manifest_key}",
+            "inputMetadata": "",
+            "inputParameters": "",
+            "externalSfnTaskToken": "",
+        }
+
+        logger.info(f"Starting SFN State Machine for batch of {len(items)} files: {STATE_MACHINE_ARN}")
+        sfn_response = sfn.start_execution(
+            stateMachineArn=STATE_MACHINE_ARN,
+            name=job_name,
+            input=json.dumps(sfn_input)
+        )
+        logger.info(f"SFN Response: {sfn_response}")
+    except Exception as e:
+        logger.exception(e)
+        for payload in payloads:
+            abort_external_workflow("Internal Server Error", payload.get('sfnExternalTaskToken', ''))
+        return False
+
+    return True
+
+
+def lambda_handler(event, context):
+    """
+    OpenBatchPipeline
+    Groups queued preview thumbnail jobs from an SQS batch into multi-file
+    batches and starts one state machine execution per batch
+    """
+
+    logger.info(f"Event: {event}")
+
+    payloads = []
+    for record in event.get('Records', []):
+        try:
+            payload = json.loads(record['body'])
+        except Exception as e:
+            logger.exception(f"Invalid batch queue message: {e}")
+            continue
+
+        if is_valid_input(payload):
+            payloads.append(payload)
+
+    batches_started = 0
+    for start in range(0, len(payloads), MAX_FILES_PER_BATCH):
+        if start_batch(payloads[start:start + MAX_FILES_PER_BATCH]):
+            batches_started += 1
+
+    logger.info(f"Started {batches_started} batch executions for {len(payloads)} files")
+
+    return {
+        'statusCode': 200,
+        'body': {
+            "message": "Starting Asset Processing State Machine",
+            "files": len(payloads),
+            "batches": batches_started
+        }
+    }
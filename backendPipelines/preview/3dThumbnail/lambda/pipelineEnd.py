@@ -12,6 +12,41 @@ sfn = boto3.client(
     'stepfunctions',
     region_name=os.environ["AWS_REGION"]
 )
+s3 = boto3.client('s3')
+
+
+def abort_batch_workflows(batch_manifest_s3_path, error):
+    """
+    Fail the workflow task token of every file in a batch whose container did not finish.
+    Files the container already reported on reject the second callback, which is ignored.
+    """
+    manifest_bucket, manifest_key = batch_manifest_s3_path.replace("s3://", "").split("/", 1)
+    try:
+        manifest = json.loads(s3.get_object(Bucket=manifest_bucket, Key=manifest_key)["Body"].read())
+    except Exception as e:
+        logger.exception(f"Unable to read batch manifest {batch_manifest_s3_path}: {e}")
+        return
+
+    for item in manifest.get("items", []):
+        task_token = item.get("externalSfnTaskToken", "")
+        if not task_token:
+            continue
+        try:
+            sfn.send_task_failure(
+                taskToken=task_token,
+                error='Pipeline Failure: ' + error,
+                cause='See AWS cloudwatch logs for error cause.'
+            )
+        except Exception as e:
+            logger.warning(f"Unable to send batch task failure: {e}")
+
+def delete_batch_manifest(batch_manifest_s3_path):
+    """Remove the batch manifest from the auxiliary bucket once the batch has finished"""
+    manifest_bucket, manifest_key = batch_manifest_s3_path.replace("s3://", "").split("/", 1)
+    try:
+        s3.delete_object(Bucket=manifest_bucket, Key=manifest_key)
+    except Exception as e:
+        logger.warning(f"Unable to delete batch manifest {batch_manifest_s3_path}: {e}")
 
 def lambda_handler(event, context):
     """
@@ -23,6 +58,7 @@ def lambda_handler(event, context):
     logger.info(f"Context Input: {context}")
 
     externalSfnTaskToken = event.get('externalSfnTaskToken', "")
+    batchManifestS3Path = event.get('batchManifestS3Path', "")
 
     if("error" not in event):
         logger.info("Pipeline Success")
@@ -30,6 +66,13 @@ def lambda_handler(event, context):
         logger.error("Pipeline Failure")
         logger.error(event["error"])
 
+        # Batch executions carry one workflow task token per file in the manifest
+        if batchManifestS3Path:
+            abort_batch_workflows(batchManifestS3Path, event["error"].get("Error", "Batch Failure"))
+
+    if batchManifestS3Path:
+        delete_batch_manifest(batchManifestS3Path)
+
     if (externalSfnTaskToken != None and externalSfnTaskToken != ""):
         logger.info(f"External Sfn Task Token: {event['externalSfnTaskToken']}")
 
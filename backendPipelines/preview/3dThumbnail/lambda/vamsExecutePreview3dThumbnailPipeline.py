@@ -9,11 +9,56 @@ import os
 import boto3
 import json
 from customLogging.logger import safeLogger
+from common.previewIndex import get_preview_index_record, is_preview_up_to_date
 
 
 logger = safeLogger(service="VamsExecutePreview3dThumbnailPipeline")
 lambda_client = boto3.client('lambda')
+sqs_client = boto3.client('sqs')
+sfn_client = boto3.client('stepfunctions')
+s3_client = boto3.client('s3')
 OPEN_PIPELINE_FUNCTION_NAME = os.environ["OPEN_PIPELINE_FUNCTION_NAME"]
+# When set, executions are queued and grouped into multi-file container batches by openBatchPipeline
+BATCH_QUEUE_URL = os.environ.get("BATCH_QUEUE_URL", "")
+# When set, files that already have an up-to-date preview are skipped without launching a container
+PREVIEW_INDEX_STORAGE_TABLE_NAME = os.environ.get("PREVIEW_INDEX_STORAGE_TABLE_NAME", "")
+
+
+def overwrite_requested(input_parameters):
+    """Return True if inputParameters.overwriteExistingPreviewFiles is set"""
+    if not input_parameters:
+        return False
+    if isinstance(input_parameters, str):
+        try:
+            input_parameters = json.loads(input_parameters)
+        except json.JSONDecodeError:
+            return False
+    if not isinstance(input_parameters, dict):
+        return False
+    overwrite = input_parameters.get("overwriteExistingPreviewFiles", False)
+    if not isinstance(overwrite, bool):
+        overwrite = str(overwrite).lower() in ("true", "1", "yes")
+    return overwrite
+
+
+def has_up_to_date_preview(input_s3_asset_file_path):
+    """
+    Check the preview-existence index for a preview written after the input file's current S3 write.
+    The index's own base file timestamp is updated asynchronously by bucket sync, so a re-uploaded
+    file is compared against its LastModified instead.
+    Returns False whenever the index cannot answer so the pipeline runs as normal.
+    """
+    if not PREVIEW_INDEX_STORAGE_TABLE_NAME or not input_s3_asset_file_path.startswith("s3://"):
+        return False
+
+    try:
+        bucket, key = input_s3_asset_file_path.replace("s3://", "", 1).split("/", 1)
+        last_modified = s3_client.head_object(Bucket=bucket, Key=key)['LastModified']
+    except Exception as e:
+        logger.warning(f"Unable to read input file {input_s3_asset_file_path} for preview check: {e}")
+        return False
+
+    return is_preview_up_to_date(get_preview_index_record(bucket, key), last_modified)
 
 
 def execute_pipeline(input_s3_asset_file_path, output_s3_asset_files_path, output_s3_asset_preview_path, output_s3_asset_metadata_path
@@ -35,6 +80,15 @@ def execute_pipeline(input_s3_asset_file_path, output_s3_asset_files_path, outpu
         "assetId": asset_id
     }
 
+    # Batch execution: queue the file so it gets grouped with other pending thumbnail jobs
+    if BATCH_QUEUE_URL:
+        logger.info("Queueing file for batch pipeline execution")
+        sqs_client.send_message(
+            QueueUrl=BATCH_QUEUE_URL,
+            MessageBody=json.dumps(messagePayload)
+        )
+        return
+
     # Invoke the pipeline construct pipeline lambda
     logger.info("Invoking Asset Lambda .........")
     lambda_response = lambda_client.invoke(FunctionName=OPEN_PIPELINE_FUNCTION_NAME,
@@ -121,6 +175,18 @@ def lambda_handler(event, context):
             logger.error(response)
             return response
 
+        # Skip files that already have an up-to-date preview before launching a container
+        if not overwrite_requested(input_parameters) and has_up_to_date_preview(input_path):
+            logger.info(f"Up-to-date preview already exists for {input_path}, skipping pipeline execution")
+            sfn_client.send_task_success(
+                taskToken=external_task_token,
+                output=json.dumps({'status': 'Pipeline Skipped', 'message': 'Up-to-date preview file already exists'})
+            )
+            return {
+                'statusCode': 200,
+                'body': 'Skipped'
+            }
+
         # Starts excution of pipeline
         execute_pipeline(data['inputS3AssetFilePath'],
                                             data.get('outputS3AssetFilesPath', ''),
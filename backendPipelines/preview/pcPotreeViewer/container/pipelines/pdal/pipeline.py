@@ -104,17 +104,13 @@ def run(stage: PipelineStage, inputMetadata: str = '', inputParameters: str = ''
 
     #stage.outputFiles.fileNames = []
 
-    # gather outputs and upload to s3
-    for file in pipeline_response["output_files"]:
-        object_key = os.path.join(output.objectDir, file)
-        file_path = os.path.join(local_output_dir, file)
-
-        # TODO: delete temporary files in S3
-        logger.info(f"Uploading PDAL File: {file_path}")
-        s3.uploadV2(output.bucketName, object_key, file_path)
-
-        #Final output filenames to append on stage
-        #stage.outputFiles.fileNames.append(object_key)
+    # gather outputs and upload to s3 concurrently
+    logger.info(f"Uploading {len(pipeline_response['output_files'])} PDAL Files from: {local_output_dir}")
+    upload_result = s3.upload_directory(
+        output.bucketName, output.objectDir, local_output_dir, pipeline_response["output_files"]
+    )
+    if upload_result["failed"]:
+        return ext.error_response(stage, f"Failed to upload output files: {upload_result['failed']}")
 
     return ext.success_response(stage)
 
@@ -98,16 +98,13 @@ def run(stage: PipelineStage, inputMetadata: str = '', inputParameters: str = ''
 
     #stage.outputFiles.fileNames = []
 
-    # gather outputs and upload to s3
-    for file in pipeline_response["output_files"]:
-        object_key = os.path.join(output.objectDir, file)
-        file_path = os.path.join(local_output_dir, file)
-
-        logger.info(f"Uploading Potree File: {file_path}")
-        s3.uploadV2(output.bucketName, object_key, file_path)
-
-        #Final output filenames to append on stage
-        #stage.outputFiles.fileNames.append(object_key)
+    # gather outputs and upload to s3 concurrently
+    logger.info(f"Uploading {len(pipeline_response['output_files'])} Potree Files from: {local_output_dir}")
+    upload_result = s3.upload_directory(
+        output.bucketName, output.objectDir, local_output_dir, pipeline_response["output_files"]
+    )
+    if upload_result["failed"]:
+        return ext.error_response(stage, f"Failed to upload output files: {upload_result['failed']}")
 
     # send success response back to core | keep source bucket ,key, file extension the same as we are not making intermediate conversion files
     return ext.success_response(stage)
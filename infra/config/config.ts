@@ -207,11 +207,39 @@ export function getConfig(app: cdk.App): Config {
             enabled: false,
             autoRegisterWithVAMS: false,
             autoRegisterAutoTriggerOnFileUpload: false,
+            batchExecution: {
+                enabled: false,
+                maxFilesPerBatch: 100,
+                maxBatchingWindowSeconds: 30,
+                perFileTimeoutMinutes: 10,
+            },
         };
     }
     if (config.app.pipelines.usePreview3dThumbnail.enabled == undefined) {
         config.app.pipelines.usePreview3dThumbnail.enabled = false;
     }
+    if (config.app.pipelines.usePreview3dThumbnail.batchExecution == undefined) {
+        config.app.pipelines.usePreview3dThumbnail.batchExecution = {
+            enabled: false,
+            maxFilesPerBatch: 100,
+            maxBatchingWindowSeconds: 30,
+            perFileTimeoutMinutes: 10,
+        };
+    }
+    if (config.app.pipelines.usePreview3dThumbnail.batchExecution.maxFilesPerBatch == undefined) {
+        config.app.pipelines.usePreview3dThumbnail.batchExecution.maxFilesPerBatch = 100;
+    }
+    if (
+        config.app.pipelines.usePreview3dThumbnail.batchExecution.maxBatchingWindowSeconds ==
+        undefined
+    ) {
+        config.app.pipelines.usePreview3dThumbnail.batchExecution.maxBatchingWindowSeconds = 30;
+    }
+    if (
+        config.app.pipelines.usePreview3dThumbnail.batchExecution.perFileTimeoutMinutes == undefined
+    ) {
+        config.app.pipelines.usePreview3dThumbnail.batchExecution.perFileTimeoutMinutes = 10;
+    }
 
     // Cosmos Predict defaults
     if (config.app.pipelines.useNvidiaCosmos == undefined) {
@@ -394,6 +422,16 @@ export function getConfig(app: cdk.App): Config {
         };
     }
 
+    // Initialize workflowAutoExecution configuration if undefined (backward compatibility)
+    if (config.app.workflowAutoExecution == undefined) {
+        config.app.workflowAutoExecution = {
+            executionPerAssetBatch: false,
+        };
+    }
+    if (config.app.workflowAutoExecution.executionPerAssetBatch == undefined) {
+        config.app.workflowAutoExecution.executionPerAssetBatch = false;
+    }
+
     //Load S3 Policy statements JSON
     const s3AdditionalBucketPolicyFile: string = readFileSync(
         join(__dirname, "policy", "s3AdditionalBucketPolicyConfig.json"),
@@ -1136,6 +1174,12 @@ export interface ConfigPublic {
                 enabled: boolean;
                 autoRegisterWithVAMS: boolean;
                 autoRegisterAutoTriggerOnFileUpload: boolean;
+                batchExecution: {
+                    enabled: boolean;
+                    maxFilesPerBatch: number;
+                    maxBatchingWindowSeconds: number;
+                    perFileTimeoutMinutes: number;
+                };
             };
             useNvidiaCosmos: {
                 enabled: boolean;
@@ -1260,6 +1304,9 @@ export interface ConfigPublic {
             autoLoadDefaultAssetSchema: boolean;
             autoLoadDefaultAssetFileSchema: boolean;
         };
+        workflowAutoExecution: {
+            executionPerAssetBatch: boolean;
+        };
     };
 }
 
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+VAMS Data Migration Runtime - Parallel, Resumable DynamoDB Table Processing
+
+Shared helpers for the deployment data migration scripts. Instead of scanning a whole
+table into memory and then transforming and writing it record by record, a migration
+phase hands a page-processing function to parallel_scan(). The table is read with a
+parallel scan (Segment/TotalSegments), and each page is transformed and written as soon
+as it is read, so memory use stays bounded and reads overlap with writes.
+
+Key Features:
+- Parallel segmented scans with one worker thread per segment
+- Per-segment checkpoint file so an interrupted migration resumes where it stopped
+- Batched writes and deletes with exponential backoff for unprocessed items
+- BatchGetItem existence checks in place of per-record GetItem/Scan lookups
+- Parallel Select=COUNT scans for verification counts
+
+Usage:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'tools'))
+    from migration_runtime import MigrationCheckpoint, parallel_scan, batch_write_items
+
+    checkpoint = MigrationCheckpoint('migration_checkpoint.json')
+    stats = parallel_scan(dynamodb_client, {'TableName': 'old-table'}, process_page,
+                          total_segments=8, checkpoint=checkpoint, phase='metadata')
+
+Requirements:
+    - Python 3.6+
+    - boto3
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from botocore.exceptions import ClientError
+
+logger = logging.getLogger(__name__)
+
+# DynamoDB API limits
+BATCH_WRITE_LIMIT = 25
+BATCH_GET_LIMIT = 100
+
+DEFAULT_TOTAL_SEGMENTS = 8
+DEFAULT_MAX_RETRIES = 8
+
+
+class MigrationCheckpoint:
+    """
+    Per-phase, per-segment progress of a migration, persisted to a JSON file.
+
+    For every segment of a phase the file records the last fully processed scan key,
+    whether the segment finished, and the counters it accumulated. A rerun of the
+    migration skips finished segments and continues the others from their last key.
+    Pass path=None (for example in dry-run mode) to track progress in memory only.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._state = {}
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self._state = json.load(f)
+                logger.info(f"Loaded migration checkpoint from {path}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable checkpoint file {path}: {e}")
+                self._state = {}
+
+    def get_segment(self, phase: str, total_segments: int, segment: int) -> Dict:
+        """
+        Return the stored state of a segment, or an empty state if there is none.
+
+        A checkpoint written with a different number of segments cannot be resumed
+        (segment boundaries differ), so the phase starts over in that case.
+        """
+        with self._lock:
+            phase_state = self._state.get(phase)
+            if not phase_state:
+                return {}
+            if phase_state.get('totalSegments') != total_segments:
+                logger.warning(f"Checkpoint for phase '{phase}' was written with "
+                               f"{phase_state.get('totalSegments')} segments, not {total_segments}; "
+                               f"restarting the phase")
+                del self._state[phase]
+                return {}
+            return dict(phase_state.get('segments', {}).get(str(segment), {}))
+
+    def save_segment(self, phase: str, total_segments: int, segment: int,
+                     last_evaluated_key: Optional[Dict], done: bool, stats: Dict[str, int]):
+        """Record the progress of a segment and persist the checkpoint file."""
+        with self._lock:
+            phase_state = self._state.setdefault(phase, {'totalSegments': total_segments, 'segments': {}})
+            phase_state['segments'][str(segment)] = {
+                'lastEvaluatedKey': last_evaluated_key,
+                'done': done,
+                'stats': stats,
+            }
+            self._write()
+
+    def is_phase_complete(self, phase: str) -> bool:
+        """True if every segment of the phase has finished."""
+        with self._lock:
+            phase_state = self._state.get(phase)
+            if not phase_state:
+                return False
+            segments = phase_state.get('segments', {})
+            return (len(segments) == phase_state.get('totalSegments')
+                    and all(s.get('done') for s in segments.values()))
+
+    def clear(self):
+        """Forget all progress and remove the checkpoint file."""
+        with self._lock:
+            self._state = {}
+            if self.path and os.path.exists(self.path):
+                os.remove(self.path)
+                logger.info(f"Removed migration checkpoint {self.path}")
+
+    def _write(self):
+        if not self.path:
+            return
+        # Write to a temporary file and rename so an interruption never leaves a partial file
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self._state, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def _add_stats(total: Dict[str, int], stats: Optional[Dict[str, int]]):
+    for key, value in (stats or {}).items():
+        total[key] = total.get(key, 0) + value
+
+
+def parallel_scan(dynamodb_client, scan_kwargs: Dict,
+                  process_page: Callable[[List[Dict]], Optional[Dict[str, int]]],
+                  total_segments: int = DEFAULT_TOTAL_SEGMENTS,
+                  limit: Optional[int] = None,
+                  checkpoint: Optional[MigrationCheckpoint] = None,
+                  phase: Optional[str] = None) -> Dict[str, int]:
+    """
+    Scan a table with parallel segments and hand each page to process_page.
+
+    process_page receives the items of one scan page (DynamoDB wire format) and returns
+    a dict of counters (e.g. {'written': 10, 'errors': 0}), which are summed per segment
+    and over the whole scan. Pages are processed by the segment's worker thread, so
+    process_page must be thread safe. The segment's position is checkpointed after each
+    processed page; a page interrupted midway is processed again on resume, so
+    process_page must be idempotent.
+
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        scan_kwargs: Scan parameters (TableName, ProjectionExpression, FilterExpression, ...)
+        process_page: Function called with the items of each scan page
+        total_segments: Number of parallel scan segments (and worker threads)
+        limit: Maximum number of items to process (for testing); forces a single segment
+        checkpoint: Optional checkpoint used to resume and record progress
+        phase: Checkpoint phase name (required when checkpoint is given)
+
+    Returns:
+        Summed counters from process_page plus 'scanned' (items read in this run)
+        and 'resumed' (items covered by segments restored from the checkpoint)
+    """
+    if limit:
+        total_segments = 1
+    total_segments = max(1, int(total_segments))
+    table_name = scan_kwargs.get('TableName')
+
+    totals = {'scanned': 0, 'resumed': 0}
+    totals_lock = threading.Lock()
+
+    def scan_segment(segment: int):
+        state = checkpoint.get_segment(phase, total_segments, segment) if checkpoint else {}
+        segment_stats = dict(state.get('stats', {}))
+        if segment_stats:
+            with totals_lock:
+                _add_stats(totals, {k: v for k, v in segment_stats.items() if k != 'scanned'})
+                totals['resumed'] += segment_stats.get('scanned', 0)
+        if state.get('done'):
+            logger.info(f"  {table_name} segment {segment + 1}/{total_segments} already complete, skipping")
+            return
+
+        kwargs = dict(scan_kwargs)
+        if total_segments > 1:
+            kwargs['Segment'] = segment
+            kwargs['TotalSegments'] = total_segments
+        if state.get('lastEvaluatedKey'):
+            kwargs['ExclusiveStartKey'] = state['lastEvaluatedKey']
+            logger.info(f"  Resuming {table_name} segment {segment + 1}/{total_segments} from checkpoint")
+
+        remaining = limit
+        while True:
+            if remaining is not None:
+                kwargs['Limit'] = remaining
+            response = dynamodb_client.scan(**kwargs)
+            items = response.get('Items', [])
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+
+            page_stats = process_page(items) if items else {}
+            page_stats = dict(page_stats or {})
+            page_stats['scanned'] = len(items)
+            _add_stats(segment_stats, page_stats)
+            with totals_lock:
+                _add_stats(totals, page_stats)
+
+            last_key = response.get('LastEvaluatedKey')
+            done = not last_key or remaining == 0
+            if checkpoint:
+                checkpoint.save_segment(phase, total_segments, segment, last_key, done, segment_stats)
+            if done:
+                break
+            kwargs['ExclusiveStartKey'] = last_key
+
+        logger.debug(f"  {table_name} segment {segment + 1}/{total_segments} complete "
+                     f"({segment_stats.get('scanned', 0)} items)")
+
+    if total_segments == 1:
+        scan_segment(0)
+    else:
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            # Consume results so the first exception from any segment is raised here
+            for _ in executor.map(scan_segment, range(total_segments)):
+                pass
+
+    return totals
+
+
+def parallel_count(dynamodb_client, table_name: str,
+                   total_segments: int = DEFAULT_TOTAL_SEGMENTS,
+                   scan_kwargs: Optional[Dict] = None) -> int:
+    """
+    Count the items of a table (optionally filtered) with parallel Select=COUNT scans.
+
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        table_name: Name of the DynamoDB table
+        total_segments: Number of parallel scan segments
+        scan_kwargs: Additional scan parameters such as FilterExpression
+
+    Returns:
+        Number of matching items across all pages and segments
+    """
+    total_segments = max(1, int(total_segments))
+    base_kwargs = dict(scan_kwargs or {})
+    base_kwargs['TableName'] = table_name
+    base_kwargs['Select'] = 'COUNT'
+
+    def count_segment(segment: int) -> int:
+        kwargs = dict(base_kwargs)
+        if total_segments > 1:
+            kwargs['Segment'] = segment
+            kwargs['TotalSegments'] = total_segments
+        count = 0
+        while True:
+            response = dynamodb_client.scan(**kwargs)
+            count += response.get('Count', 0)
+            if 'LastEvaluatedKey' not in response:
+                return count
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    if total_segments == 1:
+        return count_segment(0)
+    with ThreadPoolExecutor(max_workers=total_segments) as executor:
+        return sum(executor.map(count_segment, range(total_segments)))
+
+
+def batch_write_items(dynamodb_client, table_name: str, write_requests: List[Dict],
+                      max_retries: int = DEFAULT_MAX_RETRIES) -> Tuple[int, int]:
+    """
+    Send PutRequest/DeleteRequest entries with BatchWriteItem in chunks of 25.
+
+    Unprocessed items are retried with exponential backoff. A chunk that fails with
+    a client error is counted as failed and the remaining chunks are still written.
+
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        table_name: Name of the target DynamoDB table
+        write_requests: List of {'PutRequest': ...} or {'DeleteRequest': ...} entries
+        max_retries: Maximum retries of unprocessed items per chunk
+
+    Returns:
+        Tuple of (success_count, failure_count)
+    """
+    success_count = 0
+    failure_count = 0
+
+    for i in range(0, len(write_requests), BATCH_WRITE_LIMIT):
+        chunk = write_requests[i:i + BATCH_WRITE_LIMIT]
+        pending = chunk
+        attempt = 0
+        try:
+            while pending:
+                response = dynamodb_client.batch_write_item(RequestItems={table_name: pending})
+                pending = response.get('UnprocessedItems', {}).get(table_name, [])
+                if not pending:
+                    break
+                if attempt >= max_retries:
+                    logger.error(f"  Failed to write {len(pending)} items to {table_name} "
+                                 f"after {max_retries} retries")
+                    break
+                attempt += 1
+                time.sleep(min(0.05 * (2 ** attempt), 5.0))
+            failure_count += len(pending)
+            success_count += len(chunk) - len(pending)
+        except ClientError as e:
+            logger.error(f"Error in batch_write_item to {table_name}: {e}")
+            failure_count += len(chunk)
+
+    return success_count, failure_count
+
+
+def batch_get_existing_keys(dynamodb_client, table_name: str, keys: Iterable[Dict],
+                            key_attributes: List[str],
+                            max_retries: int = DEFAULT_MAX_RETRIES) -> Set[Tuple]:
+    """
+    Find which of the given primary keys exist in a table using BatchGetItem.
+
+    Only the key attributes are projected, so the check reads as little as possible.
+
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        table_name: Name of the DynamoDB table
+        keys: Primary keys in DynamoDB wire format
+        key_attributes: Names of the key attributes (partition key first)
+        max_retries: Maximum retries of unprocessed keys per chunk
+
+    Returns:
+        Set of key tuples (string values in key_attributes order) that exist
+    """
+    # Deduplicate keys: BatchGetItem rejects duplicate keys within a request
+    unique_keys = {}
+    for key in keys:
+        unique_keys[key_tuple(key, key_attributes)] = key
+    key_list = list(unique_keys.values())
+
+    projection = ', '.join(f"#k{i}" for i in range(len(key_attributes)))
+    attribute_names = {f"#k{i}": name for i, name in enumerate(key_attributes)}
+
+    existing = set()
+    for i in range(0, len(key_list), BATCH_GET_LIMIT):
+        request = {
+            table_name: {
+                'Keys': key_list[i:i + BATCH_GET_LIMIT],
+                'ProjectionExpression': projection,
+                'ExpressionAttributeNames': attribute_names,
+            }
+        }
+        attempt = 0
+        while request:
+            response = dynamodb_client.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(table_name, []):
+                existing.add(key_tuple(item, key_attributes))
+            request = response.get('UnprocessedKeys') or None
+            if request:
+                if attempt >= max_retries:
+                    raise RuntimeError(f"Unable to read {len(request[table_name]['Keys'])} keys "
+                                       f"from {table_name} after {max_retries} retries")
+                attempt += 1
+                time.sleep(min(0.05 * (2 ** attempt), 5.0))
+
+    return existing
+
+
+def key_tuple(item: Dict, key_attributes: List[str]) -> Tuple:
+    """Return the string key values of an item (DynamoDB wire format) as a tuple."""
+    return tuple(item.get(name, {}).get('S', '') for name in key_attributes)
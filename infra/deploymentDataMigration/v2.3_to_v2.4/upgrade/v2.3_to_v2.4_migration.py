@@ -20,6 +20,8 @@ Key Features:
 - Dry-run mode for safe testing
 - Comprehensive error handling and logging
 - Idempotent operations (safe to re-run)
+- Constraints and metadata are read with parallel segmented scans and written page by page
+- Per-segment checkpoint file so an interrupted run resumes where it stopped
 
 Usage:
     # Dry run (recommended first step)
@@ -43,15 +45,20 @@ import json
 import logging
 import os
 import sys
+import threading
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Set, Tuple
 from botocore.exceptions import ClientError
 from boto3.dynamodb.types import TypeDeserializer
 
-# Add tools directory to path for importing reindex_utility
+# Add tools directory to path for importing reindex_utility and migration_runtime
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'tools'))
 from reindex_utility import invoke_reindexer_lambda
+from migration_runtime import (
+    DEFAULT_TOTAL_SEGMENTS, MigrationCheckpoint, batch_get_existing_keys, batch_write_items,
+    key_tuple, parallel_count, parallel_scan
+)
 
 # Configure logging
 logging.basicConfig(
@@ -61,6 +68,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Primary key attributes of the new metadata table
+METADATA_KEY_ATTRIBUTES = ['metadataKey', 'databaseId:assetId:filePath']
+
 
 def load_config_from_file(config_file: str) -> dict:
     """
@@ -96,22 +106,17 @@ def load_config_from_file(config_file: str) -> dict:
 # PHASE 1-4: CONSTRAINTS MIGRATION
 #######################
 
-def scan_old_constraints(dynamodb_client, auth_table_name: str, limit: int = None) -> List[Dict]:
+def old_constraints_scan_kwargs(auth_table_name: str) -> Dict:
     """
-    Scan AuthEntitiesTable for all constraint entities.
+    Build the scan parameters that select constraint entities in AuthEntitiesTable.
     
     Args:
-        dynamodb_client: Boto3 DynamoDB client
         auth_table_name: Name of the AuthEntitiesTable
-        limit: Maximum number of constraints to retrieve (for testing)
         
     Returns:
-        List of constraint items from old table
+        Scan keyword arguments (TableName, FilterExpression, ExpressionAttributeValues)
     """
-    logger.info(f"Scanning {auth_table_name} for constraints...")
-    
-    constraints = []
-    scan_kwargs = {
+    return {
         'TableName': auth_table_name,
         'FilterExpression': 'entityType = :entityType AND begins_with(sk, :skPrefix)',
         'ExpressionAttributeValues': {
@@ -119,28 +124,6 @@ def scan_old_constraints(dynamodb_client, auth_table_name: str, limit: int = Non
             ':skPrefix': {'S': 'constraint#'}
         }
     }
-    
-    if limit:
-        scan_kwargs['Limit'] = limit
-    
-    try:
-        response = dynamodb_client.scan(**scan_kwargs)
-        constraints.extend(response.get('Items', []))
-        
-        # Handle pagination
-        while 'LastEvaluatedKey' in response and (not limit or len(constraints) < limit):
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-            if limit:
-                scan_kwargs['Limit'] = limit - len(constraints)
-            response = dynamodb_client.scan(**scan_kwargs)
-            constraints.extend(response.get('Items', []))
-        
-        logger.info(f"Found {len(constraints)} constraints in old table")
-        return constraints
-        
-    except ClientError as e:
-        logger.error(f"Error scanning old table: {e}")
-        raise
 
 
 def extract_string_value(dynamo_value: Dict) -> str:
@@ -239,31 +222,31 @@ def transform_constraint_to_new_format(old_constraint: Dict) -> List[Dict]:
     return items
 
 
-def check_constraint_exists(dynamodb_client, constraints_table_name: str, base_constraint_id: str) -> bool:
+def get_base_constraint_id(constraint_id: str) -> str:
+    """Strip the #group# / #user# suffix from a denormalized constraintId."""
+    return constraint_id.split('#group#')[0].split('#user#')[0]
+
+
+def find_existing_constraints(dynamodb_client, constraints_table_name: str,
+                              constraints: List[List[Dict]]) -> Set[str]:
     """
-    Check if a constraint already exists in the new denormalized table.
-    Scans for any item with the base constraintId (may have #group# or #user# suffix).
+    Find which constraints already exist in the new denormalized table.
+    
+    Looks up the exact constraintIds each constraint would be written as with BatchGetItem
+    (100 keys per request) instead of one filtered scan per constraint.
     
     Args:
         dynamodb_client: Boto3 DynamoDB client
         constraints_table_name: Name of the ConstraintsStorageTable
-        base_constraint_id: The base constraint ID to check
+        constraints: List of lists - each inner list contains denormalized items for one constraint
         
     Returns:
-        True if constraint exists, False otherwise
+        Set of base constraint IDs that already have at least one item in the new table
     """
-    try:
-        # Scan for items that start with the base constraintId
-        response = dynamodb_client.scan(
-            TableName=constraints_table_name,
-            FilterExpression='begins_with(constraintId, :base_id)',
-            ExpressionAttributeValues={':base_id': {'S': base_constraint_id}},
-            Limit=1
-        )
-        return response.get('Count', 0) > 0
-    except ClientError as e:
-        logger.warning(f"Error checking if constraint {base_constraint_id} exists: {e}")
-        return False
+    keys = [{'constraintId': item['constraintId']}
+            for constraint_items in constraints for item in constraint_items]
+    existing_ids = batch_get_existing_keys(dynamodb_client, constraints_table_name, keys, ['constraintId'])
+    return set(get_base_constraint_id(key[0]) for key in existing_ids)
 
 
 def batch_write_constraints(dynamodb_client, constraints_table_name: str, 
@@ -286,72 +269,30 @@ def batch_write_constraints(dynamodb_client, constraints_table_name: str,
         all_items.extend(constraint_items)
     
     if dry_run:
-        logger.info(f"DRY RUN: Would write {len(all_items)} denormalized items ({len(constraints)} unique constraints) to {constraints_table_name}")
+        logger.debug(f"DRY RUN: Would write {len(all_items)} denormalized items ({len(constraints)} unique constraints) to {constraints_table_name}")
         return len(constraints), 0, 0
     
-    logger.info(f"Writing {len(all_items)} denormalized items ({len(constraints)} unique constraints) to {constraints_table_name}...")
-    logger.info("Checking for existing records to avoid duplicates...")
-    
-    # Filter out existing constraints by checking base constraintId
+    # Filter out existing constraints by checking their keys in the new table
+    existing_base_ids = find_existing_constraints(dynamodb_client, constraints_table_name, constraints)
     constraints_to_write = []
     skipped_count = 0
-    checked_base_ids = set()
     
     for constraint_items in constraints:
-        # Extract base constraintId from first item
-        first_item_id = constraint_items[0]['constraintId']['S']
-        base_constraint_id = first_item_id.split('#group#')[0].split('#user#')[0]
-        
-        # Only check once per base constraint
-        if base_constraint_id not in checked_base_ids:
-            checked_base_ids.add(base_constraint_id)
-            if check_constraint_exists(dynamodb_client, constraints_table_name, base_constraint_id):
-                logger.debug(f"Skipping existing constraint: {base_constraint_id}")
-                skipped_count += 1
-            else:
-                constraints_to_write.extend(constraint_items)
+        base_constraint_id = get_base_constraint_id(constraint_items[0]['constraintId']['S'])
+        if base_constraint_id in existing_base_ids:
+            logger.debug(f"Skipping existing constraint: {base_constraint_id}")
+            skipped_count += 1
         else:
             constraints_to_write.extend(constraint_items)
     
-    if skipped_count > 0:
-        logger.info(f"Skipped {skipped_count} existing constraints (already in new table)")
-    
     if not constraints_to_write:
-        logger.info("No new constraints to write - all already exist in target table")
         return 0, 0, skipped_count
     
-    logger.info(f"Writing {len(constraints_to_write)} denormalized items...")
-    
-    success_count = 0
-    failure_count = 0
-    batch_size = 25  # DynamoDB BatchWriteItem limit
-    
-    for i in range(0, len(constraints_to_write), batch_size):
-        batch = constraints_to_write[i:i + batch_size]
-        
-        request_items = {
-            constraints_table_name: [
-                {'PutRequest': {'Item': item}} for item in batch
-            ]
-        }
-        
-        try:
-            response = dynamodb_client.batch_write_item(RequestItems=request_items)
-            
-            # Handle unprocessed items
-            unprocessed = response.get('UnprocessedItems', {})
-            if unprocessed:
-                logger.warning(f"Batch {i//batch_size + 1}: {len(unprocessed.get(constraints_table_name, []))} unprocessed items")
-                failure_count += len(unprocessed.get(constraints_table_name, []))
-                success_count += len(batch) - len(unprocessed.get(constraints_table_name, []))
-            else:
-                success_count += len(batch)
-                
-            logger.info(f"Batch {i//batch_size + 1}/{(len(constraints_to_write) + batch_size - 1)//batch_size}: Wrote {len(batch)} items")
-            
-        except ClientError as e:
-            logger.error(f"Error writing batch {i//batch_size + 1}: {e}")
-            failure_count += len(batch)
+    logger.debug(f"Writing {len(constraints_to_write)} denormalized items to {constraints_table_name}...")
+    success_count, failure_count = batch_write_items(
+        dynamodb_client, constraints_table_name,
+        [{'PutRequest': {'Item': item}} for item in constraints_to_write]
+    )
     
     # Return count of unique constraints, not denormalized items
     unique_constraints_written = len(constraints) - skipped_count
@@ -373,47 +314,84 @@ def batch_delete_old_constraints(dynamodb_client, auth_table_name: str,
         Tuple of (success_count, failure_count)
     """
     if dry_run:
-        logger.info(f"DRY RUN: Would delete {len(constraint_keys)} constraints from {auth_table_name}")
+        logger.debug(f"DRY RUN: Would delete {len(constraint_keys)} constraints from {auth_table_name}")
         return len(constraint_keys), 0
     
-    logger.info(f"Deleting {len(constraint_keys)} constraints from {auth_table_name}...")
+    logger.debug(f"Deleting {len(constraint_keys)} constraints from {auth_table_name}...")
+    return batch_write_items(
+        dynamodb_client, auth_table_name,
+        [{'DeleteRequest': {'Key': key}} for key in constraint_keys]
+    )
+
+
+def migrate_constraints_page(dynamodb_client, auth_table_name: str, constraints_table_name: str,
+                             old_constraints: List[Dict], delete_old_data: bool = False,
+                             dry_run: bool = False) -> Dict[str, int]:
+    """
+    Transform, write and optionally delete one scan page of old constraints.
     
-    success_count = 0
-    failure_count = 0
-    batch_size = 25  # DynamoDB BatchWriteItem limit
+    Called from the parallel scan of AuthEntitiesTable, so pages are migrated as they are
+    read. Old records of a page are only deleted when every constraint on the page was
+    written (or already existed) in the new table.
     
-    for i in range(0, len(constraint_keys), batch_size):
-        batch = constraint_keys[i:i + batch_size]
-        
-        request_items = {
-            auth_table_name: [
-                {'DeleteRequest': {'Key': key}} for key in batch
-            ]
-        }
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        auth_table_name: Name of the AuthEntitiesTable
+        constraints_table_name: Name of the ConstraintsStorageTable
+        old_constraints: Constraint items of one scan page (old DynamoDB format)
+        delete_old_data: If True, delete the migrated constraints from the old table
+        dry_run: If True, don't actually write or delete
         
+    Returns:
+        Page counters (constraints, items, transformErrors, success, failure, skipped,
+        deleted, deleteFailures)
+    """
+    transformed_constraints = []
+    constraint_keys = []
+    transform_errors = 0
+    total_denormalized_items = 0
+    
+    for old_constraint in old_constraints:
         try:
-            response = dynamodb_client.batch_write_item(RequestItems=request_items)
-            
-            # Handle unprocessed items
-            unprocessed = response.get('UnprocessedItems', {})
-            if unprocessed:
-                logger.warning(f"Batch {i//batch_size + 1}: {len(unprocessed.get(auth_table_name, []))} unprocessed deletions")
-                failure_count += len(unprocessed.get(auth_table_name, []))
-                success_count += len(batch) - len(unprocessed.get(auth_table_name, []))
-            else:
-                success_count += len(batch)
-                
-            logger.info(f"Batch {i//batch_size + 1}/{(len(constraint_keys) + batch_size - 1)//batch_size}: Deleted {len(batch)} constraints")
+            denormalized_items = transform_constraint_to_new_format(old_constraint)
+            transformed_constraints.append(denormalized_items)
+            total_denormalized_items += len(denormalized_items)
             
-        except ClientError as e:
-            logger.error(f"Error deleting batch {i//batch_size + 1}: {e}")
-            failure_count += len(batch)
+            constraint_keys.append({
+                'entityType': old_constraint.get('entityType'),
+                'sk': old_constraint.get('sk')
+            })
+        except Exception as e:
+            logger.error(f"Error transforming constraint {old_constraint.get('sk')}: {e}")
+            transform_errors += 1
+    
+    stats = {
+        'constraints': len(old_constraints),
+        'items': total_denormalized_items,
+        'transformErrors': transform_errors,
+        'success': 0,
+        'failure': 0,
+        'skipped': 0,
+        'deleted': 0,
+        'deleteFailures': 0
+    }
     
-    return success_count, failure_count
+    if transformed_constraints:
+        stats['success'], stats['failure'], stats['skipped'] = batch_write_constraints(
+            dynamodb_client, constraints_table_name, transformed_constraints, dry_run
+        )
+    
+    if delete_old_data and constraint_keys and stats['failure'] == 0:
+        stats['deleted'], stats['deleteFailures'] = batch_delete_old_constraints(
+            dynamodb_client, auth_table_name, constraint_keys, dry_run
+        )
+    
+    return stats
 
 
 def verify_constraints_migration(dynamodb_client, auth_table_name: str, constraints_table_name: str, 
-                                 expected_count: int, deleted: bool = False) -> bool:
+                                 expected_count: int, deleted: bool = False,
+                                 total_segments: int = DEFAULT_TOTAL_SEGMENTS) -> bool:
     """
     Verify constraints migration success by counting items in both tables.
     Note: New table has denormalized items, so count will be higher than unique constraints.
@@ -424,6 +402,7 @@ def verify_constraints_migration(dynamodb_client, auth_table_name: str, constrai
         constraints_table_name: Name of the ConstraintsStorageTable
         expected_count: Expected number of unique constraints migrated
         deleted: Whether old data was deleted
+        total_segments: Number of parallel scan segments
         
     Returns:
         True if verification passed, False otherwise
@@ -432,31 +411,24 @@ def verify_constraints_migration(dynamodb_client, auth_table_name: str, constrai
     
     try:
         # Count constraints in old table
-        old_response = dynamodb_client.scan(
-            TableName=auth_table_name,
-            Select='COUNT',
-            FilterExpression='entityType = :entityType AND begins_with(sk, :skPrefix)',
-            ExpressionAttributeValues={
-                ':entityType': {'S': 'constraint'},
-                ':skPrefix': {'S': 'constraint#'}
-            }
-        )
-        old_count = old_response.get('Count', 0)
+        old_scan_kwargs = old_constraints_scan_kwargs(auth_table_name)
+        del old_scan_kwargs['TableName']
+        old_count = parallel_count(dynamodb_client, auth_table_name, total_segments, old_scan_kwargs)
         
         # Count total items in new table (includes denormalized items)
-        new_response = dynamodb_client.scan(
-            TableName=constraints_table_name,
-            Select='COUNT'
-        )
-        new_total_items = new_response.get('Count', 0)
+        new_total_items = parallel_count(dynamodb_client, constraints_table_name, total_segments)
         
-        # Count unique constraints in new table by scanning and deduplicating
-        scan_response = dynamodb_client.scan(TableName=constraints_table_name)
+        # Count unique constraints in new table by scanning only the keys and deduplicating
         unique_constraints = set()
-        for item in scan_response.get('Items', []):
-            full_id = item.get('constraintId', {}).get('S', '')
-            base_id = full_id.split('#group#')[0].split('#user#')[0]
-            unique_constraints.add(base_id)
+        unique_lock = threading.Lock()
+        
+        def collect_base_ids(items):
+            base_ids = set(get_base_constraint_id(item.get('constraintId', {}).get('S', '')) for item in items)
+            with unique_lock:
+                unique_constraints.update(base_ids)
+        
+        parallel_scan(dynamodb_client, {'TableName': constraints_table_name, 'ProjectionExpression': 'constraintId'},
+                      collect_base_ids, total_segments)
         
         new_unique_count = len(unique_constraints)
         
@@ -1048,48 +1020,6 @@ def parse_asset_id(asset_id: str, database_id: str) -> Tuple[bool, str, str]:
         return (False, asset_id, "/")
 
 
-def scan_old_metadata(dynamodb_client, old_metadata_table_name: str, limit: int = None) -> List[Dict]:
-    """
-    Scan old metadata table for all metadata records.
-    
-    Args:
-        dynamodb_client: Boto3 DynamoDB client
-        old_metadata_table_name: Name of the old metadata table
-        limit: Maximum number of records to retrieve (for testing)
-        
-    Returns:
-        List of metadata items from old table
-    """
-    logger.info(f"Scanning {old_metadata_table_name} for metadata records...")
-    
-    metadata_records = []
-    scan_kwargs = {
-        'TableName': old_metadata_table_name
-    }
-    
-    if limit:
-        scan_kwargs['Limit'] = limit
-    
-    try:
-        response = dynamodb_client.scan(**scan_kwargs)
-        metadata_records.extend(response.get('Items', []))
-        
-        # Handle pagination
-        while 'LastEvaluatedKey' in response and (not limit or len(metadata_records) < limit):
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-            if limit:
-                scan_kwargs['Limit'] = limit - len(metadata_records)
-            response = dynamodb_client.scan(**scan_kwargs)
-            metadata_records.extend(response.get('Items', []))
-        
-        logger.info(f"Found {len(metadata_records)} metadata records in old table")
-        return metadata_records
-        
-    except ClientError as e:
-        logger.error(f"Error scanning old metadata table: {e}")
-        raise
-
-
 def transform_metadata_to_new_format(old_metadata_record: Dict) -> List[Dict]:
     """
     Transform metadata from old single-record format to new individual-field format.
@@ -1151,31 +1081,27 @@ def transform_metadata_to_new_format(old_metadata_record: Dict) -> List[Dict]:
     return items
 
 
-def check_metadata_exists(dynamodb_client, new_metadata_table_name: str, composite_key: str, metadata_key: str) -> bool:
+def find_existing_metadata(dynamodb_client, new_metadata_table_name: str,
+                           metadata_items: List[Dict]) -> Set[Tuple]:
     """
-    Check if a metadata record already exists in the new table.
+    Find which metadata items already exist in the new table.
+    
+    Uses BatchGetItem (100 keys per request, key attributes only) instead of one
+    GetItem per metadata field.
     
     Args:
         dynamodb_client: Boto3 DynamoDB client
         new_metadata_table_name: Name of the new metadata table
-        composite_key: The composite key (databaseId:assetId:filePath)
-        metadata_key: The metadata key
+        metadata_items: Metadata items in new DynamoDB format
         
     Returns:
-        True if metadata exists, False otherwise
+        Set of (metadataKey, databaseId:assetId:filePath) tuples that already exist
     """
-    try:
-        response = dynamodb_client.get_item(
-            TableName=new_metadata_table_name,
-            Key={
-                'metadataKey': {'S': metadata_key},
-                'databaseId:assetId:filePath': {'S': composite_key}
-            }
-        )
-        return 'Item' in response
-    except ClientError as e:
-        logger.warning(f"Error checking if metadata exists: {e}")
-        return False
+    keys = [{
+        'metadataKey': item['metadataKey'],
+        'databaseId:assetId:filePath': item['databaseId:assetId:filePath']
+    } for item in metadata_items]
+    return batch_get_existing_keys(dynamodb_client, new_metadata_table_name, keys, METADATA_KEY_ATTRIBUTES)
 
 
 def batch_write_metadata(dynamodb_client, new_metadata_table_name: str, 
@@ -1193,66 +1119,29 @@ def batch_write_metadata(dynamodb_client, new_metadata_table_name: str,
         Tuple of (success_count, failure_count, skipped_count)
     """
     if dry_run:
-        logger.info(f"DRY RUN: Would write {len(metadata_items)} metadata items to {new_metadata_table_name}")
+        logger.debug(f"DRY RUN: Would write {len(metadata_items)} metadata items to {new_metadata_table_name}")
         return len(metadata_items), 0, 0
     
-    logger.info(f"Writing {len(metadata_items)} metadata items to {new_metadata_table_name}...")
-    logger.info("Checking for existing records to avoid duplicates...")
-    
     # Filter out existing metadata
+    existing_keys = find_existing_metadata(dynamodb_client, new_metadata_table_name, metadata_items)
     items_to_write = []
     skipped_count = 0
     
     for item in metadata_items:
-        composite_key = item['databaseId:assetId:filePath']['S']
-        metadata_key = item['metadataKey']['S']
-        
-        if check_metadata_exists(dynamodb_client, new_metadata_table_name, composite_key, metadata_key):
-            logger.debug(f"Skipping existing metadata: {composite_key} / {metadata_key}")
+        if key_tuple(item, METADATA_KEY_ATTRIBUTES) in existing_keys:
+            logger.debug(f"Skipping existing metadata: {item['databaseId:assetId:filePath']['S']} / {item['metadataKey']['S']}")
             skipped_count += 1
         else:
             items_to_write.append(item)
     
-    if skipped_count > 0:
-        logger.info(f"Skipped {skipped_count} existing metadata items (already in new table)")
-    
     if not items_to_write:
-        logger.info("No new metadata to write - all already exist in target table")
         return 0, 0, skipped_count
     
-    logger.info(f"Writing {len(items_to_write)} new metadata items...")
-    
-    success_count = 0
-    failure_count = 0
-    batch_size = 25  # DynamoDB BatchWriteItem limit
-    
-    for i in range(0, len(items_to_write), batch_size):
-        batch = items_to_write[i:i + batch_size]
-        
-        request_items = {
-            new_metadata_table_name: [
-                {'PutRequest': {'Item': item}} for item in batch
-            ]
-        }
-        
-        try:
-            response = dynamodb_client.batch_write_item(RequestItems=request_items)
-            
-            # Handle unprocessed items
-            unprocessed = response.get('UnprocessedItems', {})
-            if unprocessed:
-                logger.warning(f"Batch {i//batch_size + 1}: {len(unprocessed.get(new_metadata_table_name, []))} unprocessed items")
-                failure_count += len(unprocessed.get(new_metadata_table_name, []))
-                success_count += len(batch) - len(unprocessed.get(new_metadata_table_name, []))
-            else:
-                success_count += len(batch)
-                
-            if (i//batch_size + 1) % 10 == 0:
-                logger.info(f"Batch {i//batch_size + 1}/{(len(items_to_write) + batch_size - 1)//batch_size}: Wrote {len(batch)} items")
-            
-        except ClientError as e:
-            logger.error(f"Error writing batch {i//batch_size + 1}: {e}")
-            failure_count += len(batch)
+    logger.debug(f"Writing {len(items_to_write)} new metadata items to {new_metadata_table_name}...")
+    success_count, failure_count = batch_write_items(
+        dynamodb_client, new_metadata_table_name,
+        [{'PutRequest': {'Item': item}} for item in items_to_write]
+    )
     
     return success_count, failure_count, skipped_count
 
@@ -1272,48 +1161,85 @@ def batch_delete_old_metadata(dynamodb_client, old_metadata_table_name: str,
         Tuple of (success_count, failure_count)
     """
     if dry_run:
-        logger.info(f"DRY RUN: Would delete {len(metadata_keys)} metadata records from {old_metadata_table_name}")
+        logger.debug(f"DRY RUN: Would delete {len(metadata_keys)} metadata records from {old_metadata_table_name}")
         return len(metadata_keys), 0
     
-    logger.info(f"Deleting {len(metadata_keys)} metadata records from {old_metadata_table_name}...")
+    logger.debug(f"Deleting {len(metadata_keys)} metadata records from {old_metadata_table_name}...")
+    return batch_write_items(
+        dynamodb_client, old_metadata_table_name,
+        [{'DeleteRequest': {'Key': key}} for key in metadata_keys]
+    )
+
+
+def migrate_metadata_page(dynamodb_client, old_metadata_table_name: str, new_metadata_table_name: str,
+                          old_metadata_records: List[Dict], delete_old_data: bool = False,
+                          dry_run: bool = False) -> Dict[str, int]:
+    """
+    Transform, write and optionally delete one scan page of old metadata records.
     
-    success_count = 0
-    failure_count = 0
-    batch_size = 25  # DynamoDB BatchWriteItem limit
+    Called from the parallel scan of the old metadata table, so pages are migrated as
+    they are read. Old records of a page are only deleted when all of the page's
+    metadata items were written (or already existed) in the new table.
     
-    for i in range(0, len(metadata_keys), batch_size):
-        batch = metadata_keys[i:i + batch_size]
-        
-        request_items = {
-            old_metadata_table_name: [
-                {'DeleteRequest': {'Key': key}} for key in batch
-            ]
-        }
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        old_metadata_table_name: Name of the old metadata table
+        new_metadata_table_name: Name of the new metadata table
+        old_metadata_records: Records of one scan page (old DynamoDB format)
+        delete_old_data: If True, delete the migrated records from the old table
+        dry_run: If True, don't actually write or delete
         
+    Returns:
+        Page counters (records, items, transformErrors, success, failure, skipped,
+        deleted, deleteFailures)
+    """
+    metadata_items = []
+    metadata_record_keys = []
+    transform_errors = 0
+    
+    for old_record in old_metadata_records:
         try:
-            response = dynamodb_client.batch_write_item(RequestItems=request_items)
+            metadata_items.extend(transform_metadata_to_new_format(old_record))
             
-            # Handle unprocessed items
-            unprocessed = response.get('UnprocessedItems', {})
-            if unprocessed:
-                logger.warning(f"Batch {i//batch_size + 1}: {len(unprocessed.get(old_metadata_table_name, []))} unprocessed deletions")
-                failure_count += len(unprocessed.get(old_metadata_table_name, []))
-                success_count += len(batch) - len(unprocessed.get(old_metadata_table_name, []))
-            else:
-                success_count += len(batch)
-                
-            if (i//batch_size + 1) % 10 == 0:
-                logger.info(f"Batch {i//batch_size + 1}/{(len(metadata_keys) + batch_size - 1)//batch_size}: Deleted {len(batch)} records")
-            
-        except ClientError as e:
-            logger.error(f"Error deleting batch {i//batch_size + 1}: {e}")
-            failure_count += len(batch)
+            # Store key for potential deletion
+            database_id = extract_string_value(old_record.get('databaseId', {}))
+            asset_id = extract_string_value(old_record.get('assetId', {}))
+            if database_id and asset_id:
+                metadata_record_keys.append({
+                    'databaseId': {'S': database_id},
+                    'assetId': {'S': asset_id}
+                })
+        except Exception as e:
+            logger.error(f"Error transforming metadata record: {e}")
+            transform_errors += 1
+    
+    stats = {
+        'records': len(old_metadata_records),
+        'items': len(metadata_items),
+        'transformErrors': transform_errors,
+        'success': 0,
+        'failure': 0,
+        'skipped': 0,
+        'deleted': 0,
+        'deleteFailures': 0
+    }
     
-    return success_count, failure_count
+    if metadata_items:
+        stats['success'], stats['failure'], stats['skipped'] = batch_write_metadata(
+            dynamodb_client, new_metadata_table_name, metadata_items, dry_run
+        )
+    
+    if delete_old_data and metadata_record_keys and stats['failure'] == 0 and transform_errors == 0:
+        stats['deleted'], stats['deleteFailures'] = batch_delete_old_metadata(
+            dynamodb_client, old_metadata_table_name, metadata_record_keys, dry_run
+        )
+    
+    return stats
 
 
 def verify_metadata_migration(dynamodb_client, old_metadata_table_name: str, new_metadata_table_name: str, 
-                              expected_count: int, deleted: bool = False) -> bool:
+                              expected_count: int, deleted: bool = False,
+                              total_segments: int = DEFAULT_TOTAL_SEGMENTS) -> bool:
     """
     Verify metadata migration success by counting items in both tables.
     
@@ -1323,6 +1249,7 @@ def verify_metadata_migration(dynamodb_client, old_metadata_table_name: str, new
         new_metadata_table_name: Name of the new metadata table
         expected_count: Expected number of metadata items migrated
         deleted: Whether old data was deleted
+        total_segments: Number of parallel scan segments
         
     Returns:
         True if verification passed, False otherwise
@@ -1330,19 +1257,9 @@ def verify_metadata_migration(dynamodb_client, old_metadata_table_name: str, new
     logger.info("Verifying metadata migration...")
     
     try:
-        # Count records in old table
-        old_response = dynamodb_client.scan(
-            TableName=old_metadata_table_name,
-            Select='COUNT'
-        )
-        old_count = old_response.get('Count', 0)
-        
-        # Count items in new table
-        new_response = dynamodb_client.scan(
-            TableName=new_metadata_table_name,
-            Select='COUNT'
-        )
-        new_count = new_response.get('Count', 0)
+        # Count records in both tables (all pages, parallel segments)
+        old_count = parallel_count(dynamodb_client, old_metadata_table_name, total_segments)
+        new_count = parallel_count(dynamodb_client, new_metadata_table_name, total_segments)
         
         logger.info(f"Old table ({old_metadata_table_name}): {old_count} records")
         logger.info(f"New table ({new_metadata_table_name}): {new_count} metadata items")
@@ -1413,6 +1330,12 @@ Notes:
                         help='AWS region')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], default='INFO',
                         help='Logging level (default: INFO)')
+    parser.add_argument('--segments', type=int,
+                        help=f'Number of parallel scan segments (default: {DEFAULT_TOTAL_SEGMENTS})')
+    parser.add_argument('--checkpoint-file',
+                        help='Path of the resume checkpoint file (default: <config file>.checkpoint.json)')
+    parser.add_argument('--reset-checkpoint', action='store_true',
+                        help='Discard any existing checkpoint and start the migration from the beginning')
     
     args = parser.parse_args()
     
@@ -1434,6 +1357,9 @@ Notes:
     profile = args.profile or config.get('aws_profile')
     region = args.region or config.get('aws_region')
     log_level = args.log_level or config.get('log_level', 'INFO')
+    total_segments = args.segments or config.get('scan_segments') or DEFAULT_TOTAL_SEGMENTS
+    checkpoint_file = (args.checkpoint_file or config.get('checkpoint_file')
+                       or f"{os.path.splitext(args.config)[0]}.checkpoint.json")
     
     # Validate required parameters for Phase 1-4 (Constraints)
     if not auth_table_name or not constraints_table_name:
@@ -1468,6 +1394,14 @@ Notes:
     session = boto3.Session(**session_kwargs)
     dynamodb_client = session.client('dynamodb')
     
+    # Progress is only persisted for real runs without a test limit
+    if dry_run or limit:
+        checkpoint = MigrationCheckpoint(None)
+    else:
+        checkpoint = MigrationCheckpoint(checkpoint_file)
+        if args.reset_checkpoint:
+            checkpoint.clear()
+    
     logger.info("=" * 80)
     logger.info("VAMS v2.3 to v2.4 COMPLETE MIGRATION")
     logger.info("=" * 80)
@@ -1487,6 +1421,8 @@ Notes:
     logger.info(f"Dry Run: {dry_run}")
     if limit:
         logger.info(f"Limit: {limit} items per table")
+    logger.info(f"Scan Segments: {1 if limit else total_segments}")
+    logger.info(f"Checkpoint File: {checkpoint.path or 'disabled (dry run or limit)'}")
     logger.info("=" * 80)
     
     # Track overall migration timing
@@ -1511,72 +1447,45 @@ Notes:
     logger.info("PHASE 1-4: CONSTRAINTS TABLE MIGRATION")
     logger.info("=" * 80)
     
-    # Phase 1: Scan old constraints table
-    logger.info("\n📖 PHASE 1: Scanning old table for constraints...")
+    # Phases 1-4 run per scan page: each page of old constraints is transformed, written
+    # and (optionally) deleted while the other segments keep scanning
+    logger.info(f"\n📖 PHASES 1-4: Scanning, transforming and writing constraints ({1 if limit else total_segments} parallel segments)...")
     try:
-        old_constraints = scan_old_constraints(dynamodb_client, auth_table_name, limit)
-        if not old_constraints:
+        constraint_stats = parallel_scan(
+            dynamodb_client,
+            old_constraints_scan_kwargs(auth_table_name),
+            lambda page: migrate_constraints_page(
+                dynamodb_client, auth_table_name, constraints_table_name, page, delete_old_data, dry_run
+            ),
+            total_segments=total_segments,
+            limit=limit,
+            checkpoint=checkpoint,
+            phase='constraints'
+        )
+        constraints_write_success = constraint_stats.get('success', 0)
+        constraints_write_failure = constraint_stats.get('failure', 0)
+        constraints_write_skipped = constraint_stats.get('skipped', 0)
+        
+        if not constraint_stats.get('constraints', 0):
             logger.warning("No constraints found in old table. Skipping constraints migration.")
         else:
-            # Phase 2: Transform constraints
-            logger.info(f"\n🔄 PHASE 2: Transforming {len(old_constraints)} constraints to denormalized format...")
-            transformed_constraints = []
-            constraint_keys = []
-            transform_errors = 0
-            total_denormalized_items = 0
-            
-            for idx, old_constraint in enumerate(old_constraints, 1):
-                try:
-                    denormalized_items = transform_constraint_to_new_format(old_constraint)
-                    transformed_constraints.append(denormalized_items)
-                    total_denormalized_items += len(denormalized_items)
-                    
-                    constraint_keys.append({
-                        'entityType': old_constraint.get('entityType'),
-                        'sk': old_constraint.get('sk')
-                    })
-                    
-                    if idx % 100 == 0:
-                        logger.info(f"Transformed {idx}/{len(old_constraints)} constraints...")
-                        
-                except Exception as e:
-                    logger.error(f"Error transforming constraint {idx}: {e}")
-                    transform_errors += 1
-            
-            logger.info(f"Transformation complete: {len(transformed_constraints)} constraints → {total_denormalized_items} denormalized items, {transform_errors} errors")
-            
-            # Phase 3: Write to new table
-            logger.info(f"\n💾 PHASE 3: Writing constraints to new table...")
-            try:
-                constraints_write_success, constraints_write_failure, constraints_write_skipped = batch_write_constraints(
-                    dynamodb_client, constraints_table_name, transformed_constraints, dry_run
-                )
-                logger.info(f"Write complete: {constraints_write_success} success, {constraints_write_failure} failures, {constraints_write_skipped} skipped")
-            except Exception as e:
-                logger.error(f"Failed to write to new table: {e}")
-                return 1
-            
-            # Phase 4: Optional deletion from old table
-            if delete_old_data and constraints_write_success > 0:
-                logger.info(f"\n🗑️ PHASE 4: Deleting constraints from old table...")
-                try:
-                    keys_to_delete = constraint_keys[:constraints_write_success]
-                    delete_success, delete_failure = batch_delete_old_constraints(
-                        dynamodb_client, auth_table_name, keys_to_delete, dry_run
-                    )
-                    logger.info(f"Deletion complete: {delete_success} success, {delete_failure} failures")
-                except Exception as e:
-                    logger.error(f"Failed to delete from old table: {e}")
-                    logger.warning("Migration succeeded but cleanup failed. Old data remains in AuthEntitiesTable.")
+            if constraint_stats.get('resumed', 0):
+                logger.info(f"Resumed from checkpoint: {constraint_stats['resumed']} old records were processed by a previous run")
+            logger.info(f"Transformation complete: {constraint_stats.get('constraints', 0)} constraints → {constraint_stats.get('items', 0)} denormalized items, {constraint_stats.get('transformErrors', 0)} errors")
+            logger.info(f"Write complete: {constraints_write_success} success, {constraints_write_failure} failures, {constraints_write_skipped} skipped")
+            if delete_old_data:
+                logger.info(f"Deletion complete: {constraint_stats.get('deleted', 0)} success, {constraint_stats.get('deleteFailures', 0)} failures")
             else:
-                logger.info("\n⏭️ PHASE 4: Skipping deletion (--delete-old-data not specified or no successful writes)")
+                logger.info("⏭️ Skipping deletion (--delete-old-data not specified)")
             
             # Verification
             if not dry_run and constraints_write_success > 0:
                 verify_constraints_migration(dynamodb_client, auth_table_name, constraints_table_name, 
-                                           constraints_write_success, delete_old_data)
+                                           constraints_write_success, delete_old_data, total_segments)
     except Exception as e:
         logger.error(f"Constraints migration failed: {e}")
+        if checkpoint.path:
+            logger.info(f"Progress was saved to {checkpoint.path}; re-run the migration to resume")
         return 1
     
     #######################
@@ -1587,74 +1496,44 @@ Notes:
     logger.info("PHASE 5: METADATA TABLE MIGRATION")
     logger.info("=" * 80)
     
-    # Scan old metadata table
-    logger.info("\n📖 Scanning old metadata table...")
+    # Each scan page of old metadata is transformed and written while the scan continues
+    logger.info(f"\n📖 Scanning, transforming and writing metadata ({1 if limit else total_segments} parallel segments)...")
     try:
-        old_metadata_records = scan_old_metadata(dynamodb_client, old_metadata_table_name, limit)
-        if not old_metadata_records:
+        metadata_stats = parallel_scan(
+            dynamodb_client,
+            {'TableName': old_metadata_table_name},
+            lambda page: migrate_metadata_page(
+                dynamodb_client, old_metadata_table_name, new_metadata_table_name, page, delete_old_data, dry_run
+            ),
+            total_segments=total_segments,
+            limit=limit,
+            checkpoint=checkpoint,
+            phase='metadata'
+        )
+        metadata_write_success = metadata_stats.get('success', 0)
+        metadata_write_failure = metadata_stats.get('failure', 0)
+        metadata_write_skipped = metadata_stats.get('skipped', 0)
+        
+        if not metadata_stats.get('records', 0):
             logger.warning("No metadata records found in old table. Skipping metadata migration.")
         else:
-            # Transform metadata
-            logger.info(f"\n🔄 Transforming {len(old_metadata_records)} metadata records to new format...")
-            all_metadata_items = []
-            metadata_record_keys = []
-            transform_errors = 0
-            
-            for idx, old_record in enumerate(old_metadata_records, 1):
-                try:
-                    new_items = transform_metadata_to_new_format(old_record)
-                    all_metadata_items.extend(new_items)
-                    
-                    # Store key for potential deletion (need to determine primary key structure)
-                    database_id = extract_string_value(old_record.get('databaseId', {}))
-                    asset_id = extract_string_value(old_record.get('assetId', {}))
-                    if database_id and asset_id:
-                        metadata_record_keys.append({
-                            'databaseId': {'S': database_id},
-                            'assetId': {'S': asset_id}
-                        })
-                    
-                    if idx % 100 == 0:
-                        logger.info(f"Transformed {idx}/{len(old_metadata_records)} records...")
-                        
-                except Exception as e:
-                    logger.error(f"Error transforming metadata record {idx}: {e}")
-                    transform_errors += 1
-            
-            logger.info(f"Transformation complete: {len(old_metadata_records)} records → {len(all_metadata_items)} metadata items, {transform_errors} errors")
-            
-            # Write to new table
-            logger.info(f"\n💾 Writing metadata to new table...")
-            try:
-                metadata_write_success, metadata_write_failure, metadata_write_skipped = batch_write_metadata(
-                    dynamodb_client, new_metadata_table_name, all_metadata_items, dry_run
-                )
-                logger.info(f"Write complete: {metadata_write_success} success, {metadata_write_failure} failures, {metadata_write_skipped} skipped")
-            except Exception as e:
-                logger.error(f"Failed to write metadata to new table: {e}")
-                return 1
-            
-            # Optional deletion from old table
-            if delete_old_data and metadata_write_success > 0:
-                logger.info(f"\n🗑️ Deleting metadata from old table...")
-                try:
-                    keys_to_delete = metadata_record_keys[:len(old_metadata_records)]
-                    delete_success, delete_failure = batch_delete_old_metadata(
-                        dynamodb_client, old_metadata_table_name, keys_to_delete, dry_run
-                    )
-                    logger.info(f"Deletion complete: {delete_success} success, {delete_failure} failures")
-                except Exception as e:
-                    logger.error(f"Failed to delete from old metadata table: {e}")
-                    logger.warning("Migration succeeded but cleanup failed. Old data remains in old metadata table.")
+            if metadata_stats.get('resumed', 0):
+                logger.info(f"Resumed from checkpoint: {metadata_stats['resumed']} old records were processed by a previous run")
+            logger.info(f"Transformation complete: {metadata_stats.get('records', 0)} records → {metadata_stats.get('items', 0)} metadata items, {metadata_stats.get('transformErrors', 0)} errors")
+            logger.info(f"Write complete: {metadata_write_success} success, {metadata_write_failure} failures, {metadata_write_skipped} skipped")
+            if delete_old_data:
+                logger.info(f"Deletion complete: {metadata_stats.get('deleted', 0)} success, {metadata_stats.get('deleteFailures', 0)} failures")
             else:
-                logger.info("\n⏭️ Skipping deletion (--delete-old-data not specified or no successful writes)")
+                logger.info("⏭️ Skipping deletion (--delete-old-data not specified)")
             
             # Verification
             if not dry_run and metadata_write_success > 0:
                 verify_metadata_migration(dynamodb_client, old_metadata_table_name, new_metadata_table_name, 
-                                        metadata_write_success, delete_old_data)
+                                        metadata_write_success, delete_old_data, total_segments)
     except Exception as e:
         logger.error(f"Metadata migration failed: {e}")
+        if checkpoint.path:
+            logger.info(f"Progress was saved to {checkpoint.path}; re-run the migration to resume")
         return 1
     
     #######################
@@ -1822,6 +1701,9 @@ Notes:
     
     # Determine overall status
     total_failures = constraints_write_failure + metadata_write_failure + metadata_schema_write_failure
+    # Every phase ran to the end, so nothing is left to resume. A re-run starts over and
+    # retries any failed items (already migrated items are skipped).
+    checkpoint.clear()
     if total_failures == 0:
         logger.info(f"Status: ✅ SUCCESS")
         if dry_run:
@@ -31,6 +31,8 @@ Key Features:
 - Continue-on-error for individual batches
 - Progress reporting every 100 records
 - Batch writes of 25 items for efficiency
+- Parallel segmented scans; V1 pages are transformed and written as they are read
+- Per-segment checkpoint file so an interrupted run resumes where it stopped
 
 Usage:
     # Dry run (recommended first step)
@@ -52,11 +54,19 @@ import argparse
 import boto3
 import json
 import logging
+import os
 import sys
+import threading
 from datetime import datetime, timezone
 from typing import Dict, List, Tuple
 from botocore.exceptions import ClientError
 
+# Add tools directory to path for importing migration_runtime
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'tools'))
+from migration_runtime import (
+    DEFAULT_TOTAL_SEGMENTS, MigrationCheckpoint, batch_write_items, parallel_count, parallel_scan
+)
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -100,17 +110,19 @@ def load_config_from_file(config_file: str) -> dict:
 # PHASE 1: BUILD LOOKUP CACHE
 #######################
 
-def build_asset_to_database_cache(dynamodb_client, asset_table_name: str, limit: int = None) -> Dict[str, str]:
+def build_asset_to_database_cache(dynamodb_client, asset_table_name: str, limit: int = None,
+                                  total_segments: int = DEFAULT_TOTAL_SEGMENTS) -> Dict[str, str]:
     """
     Scan the asset storage table and build a mapping of assetId -> databaseId.
 
     The asset storage table has PK=databaseId, SK=assetId. We scan all items
-    to build a reverse lookup from assetId to databaseId.
+    (key attributes only, parallel segments) to build a reverse lookup from assetId to databaseId.
 
     Args:
         dynamodb_client: Boto3 DynamoDB client
         asset_table_name: Name of the AssetStorageTable
         limit: Maximum number of assets to retrieve (for testing)
+        total_segments: Number of parallel scan segments
 
     Returns:
         Dict mapping assetId -> databaseId
@@ -118,37 +130,27 @@ def build_asset_to_database_cache(dynamodb_client, asset_table_name: str, limit:
     logger.info(f"Scanning {asset_table_name} to build assetId -> databaseId lookup cache...")
 
     cache = {}
-    scan_kwargs = {
-        'TableName': asset_table_name,
-        'ProjectionExpression': 'databaseId, assetId'
-    }
-
-    items_scanned = 0
+    cache_lock = threading.Lock()
 
-    try:
-        response = dynamodb_client.scan(**scan_kwargs)
-        for item in response.get('Items', []):
+    def add_page(items):
+        page = {}
+        for item in items:
             asset_id = item.get('assetId', {}).get('S', '')
             database_id = item.get('databaseId', {}).get('S', '')
             if asset_id and database_id:
-                cache[asset_id] = database_id
-                items_scanned += 1
-
-        # Handle pagination
-        while 'LastEvaluatedKey' in response:
-            if limit and items_scanned >= limit:
-                break
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-            response = dynamodb_client.scan(**scan_kwargs)
-            for item in response.get('Items', []):
-                asset_id = item.get('assetId', {}).get('S', '')
-                database_id = item.get('databaseId', {}).get('S', '')
-                if asset_id and database_id:
-                    cache[asset_id] = database_id
-                    items_scanned += 1
-
-            if items_scanned % 500 == 0:
-                logger.info(f"  Cached {items_scanned} asset records...")
+                page[asset_id] = database_id
+        with cache_lock:
+            cache.update(page)
+        return {'cached': len(page)}
+
+    try:
+        parallel_scan(
+            dynamodb_client,
+            {'TableName': asset_table_name, 'ProjectionExpression': 'databaseId, assetId'},
+            add_page,
+            total_segments=total_segments,
+            limit=limit
+        )
 
         logger.info(f"Built lookup cache with {len(cache)} assetId -> databaseId mappings")
         return cache
@@ -159,53 +161,49 @@ def build_asset_to_database_cache(dynamodb_client, asset_table_name: str, limit:
 
 
 def clear_table(dynamodb_client, table_name: str, key_schema: List[Dict],
-                 dry_run: bool = False) -> int:
+                dry_run: bool = False, total_segments: int = DEFAULT_TOTAL_SEGMENTS) -> int:
     """
     Delete all items from a DynamoDB table.
 
+    Only the key attributes are scanned (parallel segments) and items are removed with
+    batched DeleteRequests.
+
     Args:
         dynamodb_client: Boto3 DynamoDB client
         table_name: Name of the table to clear
         key_schema: List of key attribute names, e.g. ['databaseId:assetId', 'assetVersionId']
         dry_run: If True, only count items without deleting
+        total_segments: Number of parallel scan segments
 
     Returns:
         Number of items deleted (or that would be deleted in dry-run)
     """
     logger.info(f"Clearing all items from {table_name}...")
 
-    deleted_count = 0
-    scan_kwargs = {'TableName': table_name}
-
-    try:
-        while True:
-            response = dynamodb_client.scan(**scan_kwargs)
-            items = response.get('Items', [])
-
-            for item in items:
-                if dry_run:
-                    deleted_count += 1
-                    continue
-
-                # Build the key from the item using the key schema
-                key = {}
-                for key_attr in key_schema:
-                    if key_attr in item:
-                        key[key_attr] = item[key_attr]
-
-                if key:
-                    dynamodb_client.delete_item(TableName=table_name, Key=key)
-                    deleted_count += 1
+    def delete_page(items):
+        if dry_run:
+            return {'deleted': len(items)}
+        keys = [{key_attr: item[key_attr] for key_attr in key_schema if key_attr in item} for item in items]
+        deleted, errors = batch_write_items(
+            dynamodb_client, table_name, [{'DeleteRequest': {'Key': key}} for key in keys if key]
+        )
+        return {'deleted': deleted, 'errors': errors}
 
-                if deleted_count % 100 == 0 and deleted_count > 0:
-                    logger.info(f"  Deleted {deleted_count} items from {table_name}...")
+    # Key attribute names contain ':', so they must be projected through placeholders
+    scan_kwargs = {
+        'TableName': table_name,
+        'ProjectionExpression': ', '.join(f"#k{i}" for i in range(len(key_schema))),
+        'ExpressionAttributeNames': {f"#k{i}": key_attr for i, key_attr in enumerate(key_schema)}
+    }
 
-            if 'LastEvaluatedKey' not in response:
-                break
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+    try:
+        stats = parallel_scan(dynamodb_client, scan_kwargs, delete_page, total_segments=total_segments)
+        deleted_count = stats.get('deleted', 0)
 
         action = "Would delete" if dry_run else "Deleted"
         logger.info(f"  {action} {deleted_count} items from {table_name}")
+        if stats.get('errors', 0):
+            raise RuntimeError(f"Failed to delete {stats['errors']} items from {table_name}")
         return deleted_count
 
     except ClientError as e:
@@ -217,55 +215,12 @@ def clear_table(dynamodb_client, table_name: str, key_schema: List[Dict],
 # PHASE 2: MIGRATE ASSET VERSIONS (V1 -> V2)
 #######################
 
-def scan_all_items(dynamodb_client, table_name: str, limit: int = None) -> List[Dict]:
-    """
-    Scan all items from a DynamoDB table with pagination support.
-
-    Args:
-        dynamodb_client: Boto3 DynamoDB client
-        table_name: Name of the DynamoDB table
-        limit: Maximum number of records to retrieve (for testing)
-
-    Returns:
-        List of all items from the table
-    """
-    logger.info(f"Scanning {table_name} for all records...")
-
-    records = []
-    scan_kwargs = {
-        'TableName': table_name
-    }
-
-    try:
-        response = dynamodb_client.scan(**scan_kwargs)
-        records.extend(response.get('Items', []))
-
-        # Handle pagination
-        while 'LastEvaluatedKey' in response and (not limit or len(records) < limit):
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-            response = dynamodb_client.scan(**scan_kwargs)
-            records.extend(response.get('Items', []))
-
-            if len(records) % 500 == 0:
-                logger.info(f"  Scanned {len(records)} records from {table_name}...")
-
-        if limit and len(records) > limit:
-            records = records[:limit]
-
-        logger.info(f"Found {len(records)} records in {table_name}")
-        return records
-
-    except ClientError as e:
-        logger.error(f"Error scanning table {table_name}: {e}")
-        raise
-
-
 def flush_batch_write(dynamodb_client, table_name: str, batch: List[Dict],
                       dry_run: bool = False) -> Tuple[int, int]:
     """
     Write a batch of PutRequest items to a DynamoDB table using batch_write_item.
 
-    Handles unprocessed items by retrying them.
+    Handles unprocessed items by retrying them with exponential backoff.
 
     Args:
         dynamodb_client: Boto3 DynamoDB client
@@ -282,41 +237,7 @@ def flush_batch_write(dynamodb_client, table_name: str, batch: List[Dict],
     if dry_run:
         return len(batch), 0
 
-    write_requests = [{'PutRequest': {'Item': item}} for item in batch]
-
-    written = 0
-    errors = 0
-
-    try:
-        response = dynamodb_client.batch_write_item(
-            RequestItems={table_name: write_requests}
-        )
-        written += len(write_requests)
-
-        # Handle unprocessed items with retry
-        unprocessed = response.get('UnprocessedItems', {}).get(table_name, [])
-        retry_count = 0
-        max_retries = 3
-
-        while unprocessed and retry_count < max_retries:
-            retry_count += 1
-            logger.warning(f"  Retrying {len(unprocessed)} unprocessed items (attempt {retry_count}/{max_retries})")
-            response = dynamodb_client.batch_write_item(
-                RequestItems={table_name: unprocessed}
-            )
-            unprocessed = response.get('UnprocessedItems', {}).get(table_name, [])
-
-        if unprocessed:
-            errors += len(unprocessed)
-            written -= len(unprocessed)
-            logger.error(f"  Failed to write {len(unprocessed)} items after {max_retries} retries")
-
-    except ClientError as e:
-        logger.error(f"Error in batch_write_item to {table_name}: {e}")
-        errors += len(batch)
-        written = 0
-
-    return written, errors
+    return batch_write_items(dynamodb_client, table_name, [{'PutRequest': {'Item': item}} for item in batch])
 
 
 def migrate_asset_versions(dynamodb_client, v1_table_name: str, v2_table_name: str,
@@ -335,7 +256,7 @@ def migrate_asset_versions(dynamodb_client, v1_table_name: str, v2_table_name: s
         dynamodb_client: Boto3 DynamoDB client
         v1_table_name: Name of the V1 AssetVersionsStorageTable
         v2_table_name: Name of the V2 AssetVersionsStorageTableV2
-        v1_records: List of all V1 items (DynamoDB wire format)
+        v1_records: V1 items of one scan page (DynamoDB wire format)
         asset_db_cache: Mapping of assetId -> databaseId
         batch_size: Number of items per batch_write (max 25)
         dry_run: If True, don't actually write
@@ -349,7 +270,7 @@ def migrate_asset_versions(dynamodb_client, v1_table_name: str, v2_table_name: s
     error_count = 0
     total = len(v1_records)
 
-    logger.info(f"Migrating {total} asset version records from {v1_table_name} to {v2_table_name}...")
+    logger.debug(f"Migrating {total} asset version records from {v1_table_name} to {v2_table_name}...")
 
     batch = []
 
@@ -398,7 +319,7 @@ def migrate_asset_versions(dynamodb_client, v1_table_name: str, v2_table_name: s
 
         # Progress reporting
         if idx % 100 == 0:
-            logger.info(f"  Progress: {idx}/{total} records processed "
+            logger.debug(f"  Progress: {idx}/{total} records processed "
                         f"(migrated={migrated_count}, orphaned={orphaned_count}, "
                         f"errors={error_count})")
 
@@ -465,7 +386,7 @@ def migrate_asset_file_versions(dynamodb_client, v1_table_name: str, v2_table_na
         dynamodb_client: Boto3 DynamoDB client
         v1_table_name: Name of the V1 AssetFileVersionsStorageTable
         v2_table_name: Name of the V2 AssetFileVersionsStorageTableV2
-        v1_records: List of all V1 items (DynamoDB wire format)
+        v1_records: V1 items of one scan page (DynamoDB wire format)
         asset_db_cache: Mapping of assetId -> databaseId
         batch_size: Number of items per batch_write (max 25)
         dry_run: If True, don't actually write
@@ -479,7 +400,7 @@ def migrate_asset_file_versions(dynamodb_client, v1_table_name: str, v2_table_na
     error_count = 0
     total = len(v1_records)
 
-    logger.info(f"Migrating {total} asset file version records from {v1_table_name} to {v2_table_name}...")
+    logger.debug(f"Migrating {total} asset file version records from {v1_table_name} to {v2_table_name}...")
 
     batch = []
 
@@ -533,7 +454,7 @@ def migrate_asset_file_versions(dynamodb_client, v1_table_name: str, v2_table_na
 
         # Progress reporting
         if idx % 100 == 0:
-            logger.info(f"  Progress: {idx}/{total} file version records processed "
+            logger.debug(f"  Progress: {idx}/{total} file version records processed "
                         f"(migrated={migrated_count}, orphaned={orphaned_count}, "
                         f"errors={error_count})")
 
@@ -562,7 +483,7 @@ def backfill_metadata_versions_database_asset_id(dynamodb_client, table_name: st
     Args:
         dynamodb_client: Boto3 DynamoDB client
         table_name: Name of the AssetFileMetadataVersionsStorageTable
-        records: List of all items (DynamoDB wire format)
+        records: Items of one scan page (DynamoDB wire format)
         dry_run: If True, don't actually write
 
     Returns:
@@ -573,7 +494,7 @@ def backfill_metadata_versions_database_asset_id(dynamodb_client, table_name: st
     error_count = 0
     total = len(records)
 
-    logger.info(f"Backfilling databaseId:assetId on {total} metadata version records...")
+    logger.debug(f"Backfilling databaseId:assetId on {total} metadata version records...")
 
     for idx, record in enumerate(records, 1):
         pk_value = record.get('databaseId:assetId:assetVersionId', {}).get('S', '')
@@ -626,46 +547,42 @@ def backfill_metadata_versions_database_asset_id(dynamodb_client, table_name: st
 
         # Progress reporting
         if idx % 100 == 0:
-            logger.info(f"  Progress: {idx}/{total} metadata version records processed "
+            logger.debug(f"  Progress: {idx}/{total} metadata version records processed "
                         f"(updated={updated_count}, skipped={skipped_count}, errors={error_count})")
 
     return updated_count, skipped_count, error_count
 
 
-def verify_metadata_versions_backfill(dynamodb_client, table_name: str) -> bool:
+def verify_metadata_versions_backfill(dynamodb_client, table_name: str,
+                                      total_segments: int = DEFAULT_TOTAL_SEGMENTS) -> bool:
     """
     Verify that all records in AssetFileMetadataVersionsStorageTable have databaseId:assetId.
 
     Args:
         dynamodb_client: Boto3 DynamoDB client
         table_name: Name of the table
+        total_segments: Number of parallel scan segments
 
     Returns:
         True if verification passed, False otherwise
     """
     logger.info(f"Verifying metadata versions backfill on {table_name}...")
 
-    total_count = 0
-    with_field_count = 0
-    without_field_count = 0
+    def check_page(items):
+        with_field = sum(1 for item in items if item.get('databaseId:assetId', {}).get('S', ''))
+        return {'withField': with_field, 'withoutField': len(items) - with_field}
 
-    scan_kwargs = {'TableName': table_name}
+    scan_kwargs = {
+        'TableName': table_name,
+        'ProjectionExpression': '#gsiKey',
+        'ExpressionAttributeNames': {'#gsiKey': 'databaseId:assetId'}
+    }
 
     try:
-        response = dynamodb_client.scan(**scan_kwargs)
-        while True:
-            for item in response.get('Items', []):
-                total_count += 1
-                has_field = 'databaseId:assetId' in item and item.get('databaseId:assetId', {}).get('S', '')
-                if has_field:
-                    with_field_count += 1
-                else:
-                    without_field_count += 1
-
-            if 'LastEvaluatedKey' not in response:
-                break
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-            response = dynamodb_client.scan(**scan_kwargs)
+        stats = parallel_scan(dynamodb_client, scan_kwargs, check_page, total_segments=total_segments)
+        total_count = stats.get('scanned', 0)
+        with_field_count = stats.get('withField', 0)
+        without_field_count = stats.get('withoutField', 0)
 
         logger.info(f"  Total records: {total_count}")
         logger.info(f"  Records with databaseId:assetId: {with_field_count}")
@@ -687,33 +604,21 @@ def verify_metadata_versions_backfill(dynamodb_client, table_name: str) -> bool:
 # PHASE 5: VERIFICATION
 #######################
 
-def count_table_items(dynamodb_client, table_name: str) -> int:
+def count_table_items(dynamodb_client, table_name: str,
+                      total_segments: int = DEFAULT_TOTAL_SEGMENTS) -> int:
     """
     Count the total number of items in a DynamoDB table.
 
     Args:
         dynamodb_client: Boto3 DynamoDB client
         table_name: Name of the DynamoDB table
+        total_segments: Number of parallel Select=COUNT scan segments
 
     Returns:
         Total item count
     """
-    count = 0
-    scan_kwargs = {
-        'TableName': table_name,
-        'Select': 'COUNT'
-    }
-
     try:
-        response = dynamodb_client.scan(**scan_kwargs)
-        count += response.get('Count', 0)
-
-        while 'LastEvaluatedKey' in response:
-            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
-            response = dynamodb_client.scan(**scan_kwargs)
-            count += response.get('Count', 0)
-
-        return count
+        return parallel_count(dynamodb_client, table_name, total_segments)
 
     except ClientError as e:
         logger.error(f"Error counting items in {table_name}: {e}")
@@ -722,7 +627,8 @@ def count_table_items(dynamodb_client, table_name: str) -> int:
 
 def verify_asset_versions_migration(dynamodb_client,
                                      v1_table_name: str, v2_table_name: str,
-                                     orphaned_count: int) -> bool:
+                                     orphaned_count: int,
+                                     total_segments: int = DEFAULT_TOTAL_SEGMENTS) -> bool:
     """
     Verify asset versions migration by comparing V1 and V2 table counts.
 
@@ -733,6 +639,7 @@ def verify_asset_versions_migration(dynamodb_client,
         v1_table_name: Name of the V1 AssetVersionsStorageTable
         v2_table_name: Name of the V2 AssetVersionsStorageTableV2
         orphaned_count: Number of orphaned records skipped during migration
+        total_segments: Number of parallel scan segments
 
     Returns:
         True if verification passed, False otherwise
@@ -742,8 +649,8 @@ def verify_asset_versions_migration(dynamodb_client,
     logger.info(f"  V2 table: {v2_table_name}")
 
     try:
-        v1_count = count_table_items(dynamodb_client, v1_table_name)
-        v2_count = count_table_items(dynamodb_client, v2_table_name)
+        v1_count = count_table_items(dynamodb_client, v1_table_name, total_segments)
+        v2_count = count_table_items(dynamodb_client, v2_table_name, total_segments)
         expected_v2_count = v1_count - orphaned_count
 
         logger.info(f"  V1 record count: {v1_count}")
@@ -766,7 +673,8 @@ def verify_asset_versions_migration(dynamodb_client,
 
 def verify_asset_file_versions_migration(dynamodb_client,
                                           v1_table_name: str, v2_table_name: str,
-                                          orphaned_count: int) -> bool:
+                                          orphaned_count: int,
+                                          total_segments: int = DEFAULT_TOTAL_SEGMENTS) -> bool:
     """
     Verify asset file versions migration by comparing V1 and V2 table counts.
 
@@ -777,6 +685,7 @@ def verify_asset_file_versions_migration(dynamodb_client,
         v1_table_name: Name of the V1 AssetFileVersionsStorageTable
         v2_table_name: Name of the V2 AssetFileVersionsStorageTableV2
         orphaned_count: Number of orphaned records skipped during migration
+        total_segments: Number of parallel scan segments
 
     Returns:
         True if verification passed, False otherwise
@@ -786,8 +695,8 @@ def verify_asset_file_versions_migration(dynamodb_client,
     logger.info(f"  V2 table: {v2_table_name}")
 
     try:
-        v1_count = count_table_items(dynamodb_client, v1_table_name)
-        v2_count = count_table_items(dynamodb_client, v2_table_name)
+        v1_count = count_table_items(dynamodb_client, v1_table_name, total_segments)
+        v2_count = count_table_items(dynamodb_client, v2_table_name, total_segments)
         expected_v2_count = v1_count - orphaned_count
 
         logger.info(f"  V1 record count: {v1_count}")
@@ -858,6 +767,44 @@ def verify_v2_key_structure(dynamodb_client, v2_table_name: str,
 # MAIN MIGRATION FUNCTION
 #######################
 
+def run_phase(dynamodb_client, table_name: str, process_page, total_segments: int, limit: int,
+              checkpoint: MigrationCheckpoint, phase: str, projection: List[str] = None) -> Dict[str, int]:
+    """
+    Run a migration phase over a source table with a parallel, checkpointed scan.
+
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        table_name: Name of the source table
+        process_page: Function that migrates the items of one scan page and returns counters
+        total_segments: Number of parallel scan segments
+        limit: Maximum number of items to process (for testing)
+        checkpoint: Checkpoint used to resume and record progress
+        phase: Checkpoint phase name
+        projection: Optional list of attribute names to read instead of whole items
+
+    Returns:
+        Summed page counters plus 'scanned' and 'resumed' item counts
+    """
+    logger.info(f"Scanning {table_name} ({1 if limit else total_segments} parallel segments)...")
+    scan_kwargs = {'TableName': table_name}
+    if projection:
+        scan_kwargs['ProjectionExpression'] = ', '.join(f"#p{i}" for i in range(len(projection)))
+        scan_kwargs['ExpressionAttributeNames'] = {f"#p{i}": name for i, name in enumerate(projection)}
+
+    stats = parallel_scan(dynamodb_client, scan_kwargs, process_page, total_segments=total_segments,
+                          limit=limit, checkpoint=checkpoint, phase=phase)
+    if stats.get('resumed'):
+        logger.info(f"Resumed from checkpoint: {stats['resumed']} records were processed by a previous run")
+    logger.info(f"Scanned {stats.get('scanned', 0)} records from {table_name}")
+    return stats
+
+
+def log_resume_hint(checkpoint: MigrationCheckpoint):
+    """Tell the operator where progress was saved after a failed phase."""
+    if checkpoint.path:
+        logger.info(f"Progress was saved to {checkpoint.path}; re-run the migration to resume")
+
+
 def main():
     """Main function to run the migration."""
     parser = argparse.ArgumentParser(
@@ -874,12 +821,16 @@ Examples:
   # Test with limited items
   python v2.4_to_v2.5_migration.py --config v2.4_to_v2.5_migration_config.json --limit 10 --dry-run
 
+  # Start over instead of resuming an interrupted run
+  python v2.4_to_v2.5_migration.py --config v2.4_to_v2.5_migration_config.json --reset-checkpoint
+
 Notes:
   - Configuration file is required
   - Table names must be provided in config file (V1 and V2 for both tables)
   - Dry-run mode is recommended for initial testing
   - Migration is idempotent - PutItem overwrites existing V2 records
   - No V1 data is deleted - this is a copy operation
+  - An interrupted run resumes from the checkpoint file on the next run
         """
     )
 
@@ -897,6 +848,12 @@ Notes:
                         help='Logging level (default: INFO)')
     parser.add_argument('--clear-v2', action='store_true',
                         help='Clear all data in V2 destination tables before migrating (use with caution)')
+    parser.add_argument('--segments', type=int,
+                        help=f'Number of parallel scan segments (default: {DEFAULT_TOTAL_SEGMENTS})')
+    parser.add_argument('--checkpoint-file',
+                        help='Path of the resume checkpoint file (default: <config file>.checkpoint.json)')
+    parser.add_argument('--reset-checkpoint', action='store_true',
+                        help='Discard any existing checkpoint and start the migration from the beginning')
 
     args = parser.parse_args()
 
@@ -915,6 +872,9 @@ Notes:
     profile = args.profile or config.get('aws_profile')
     region = args.region or config.get('aws_region')
     log_level = args.log_level or config.get('log_level', 'INFO')
+    total_segments = args.segments or config.get('scan_segments') or DEFAULT_TOTAL_SEGMENTS
+    checkpoint_file = (args.checkpoint_file or config.get('checkpoint_file')
+                       or f"{os.path.splitext(args.config)[0]}.checkpoint.json")
 
     # Validate required parameters
     if not asset_table_name:
@@ -950,6 +910,14 @@ Notes:
     session = boto3.Session(**session_kwargs)
     dynamodb_client = session.client('dynamodb')
 
+    # Progress is only persisted for real runs without a test limit
+    if dry_run or limit:
+        checkpoint = MigrationCheckpoint(None)
+    else:
+        checkpoint = MigrationCheckpoint(checkpoint_file)
+        if args.reset_checkpoint or args.clear_v2:
+            checkpoint.clear()
+
     logger.info("=" * 80)
     logger.info("VAMS v2.4 to v2.5 MIGRATION - Full Table Copy (V1 -> V2)")
     logger.info("=" * 80)
@@ -962,6 +930,8 @@ Notes:
     logger.info(f"Dry Run: {dry_run}")
     if limit:
         logger.info(f"Limit: {limit} items")
+    logger.info(f"Scan Segments: {1 if limit else total_segments}")
+    logger.info(f"Checkpoint File: {checkpoint.path or 'disabled (dry run or limit)'}")
     logger.info("=" * 80)
 
     # Track migration timing
@@ -977,9 +947,9 @@ Notes:
 
         try:
             clear_table(dynamodb_client, versions_v2_table_name,
-                        ['databaseId:assetId', 'assetVersionId'], dry_run)
+                        ['databaseId:assetId', 'assetVersionId'], dry_run, total_segments)
             clear_table(dynamodb_client, file_versions_v2_table_name,
-                        ['databaseId:assetId:assetVersionId', 'fileKey'], dry_run)
+                        ['databaseId:assetId:assetVersionId', 'fileKey'], dry_run, total_segments)
         except Exception as e:
             logger.error(f"Failed to clear V2 tables: {e}")
             return 1
@@ -994,7 +964,7 @@ Notes:
     logger.info("=" * 80)
 
     try:
-        asset_db_cache = build_asset_to_database_cache(dynamodb_client, asset_table_name, limit)
+        asset_db_cache = build_asset_to_database_cache(dynamodb_client, asset_table_name, limit, total_segments)
         if not asset_db_cache:
             logger.warning("No assets found in asset storage table. Nothing to migrate.")
             return 0
@@ -1015,20 +985,30 @@ Notes:
     av_skipped_count = 0
     av_orphaned_count = 0
     av_error_count = 0
-    v1_version_records = []
+    av_scanned_count = 0
+
+    def migrate_asset_versions_page(records):
+        migrated, skipped, orphaned, errors = migrate_asset_versions(
+            dynamodb_client, versions_v1_table_name, versions_v2_table_name,
+            records, asset_db_cache, batch_size, dry_run
+        )
+        return {'migrated': migrated, 'skipped': skipped, 'orphaned': orphaned, 'errors': errors}
 
     try:
-        v1_version_records = scan_all_items(dynamodb_client, versions_v1_table_name, limit)
-        if not v1_version_records:
+        # V1 pages are transformed and written to V2 as they are read by the parallel scan
+        av_stats = run_phase(dynamodb_client, versions_v1_table_name, migrate_asset_versions_page,
+                             total_segments, limit, checkpoint, 'asset_versions')
+        av_migrated_count = av_stats.get('migrated', 0)
+        av_skipped_count = av_stats.get('skipped', 0)
+        av_orphaned_count = av_stats.get('orphaned', 0)
+        av_error_count = av_stats.get('errors', 0)
+        av_scanned_count = av_stats.get('scanned', 0) + av_stats.get('resumed', 0)
+
+        if not av_scanned_count:
             logger.warning("No asset version records found in V1 table. Nothing to migrate for asset versions.")
         else:
             if dry_run:
-                logger.info(f"DRY RUN: Would migrate {len(v1_version_records)} asset version records to V2")
-
-            av_migrated_count, av_skipped_count, av_orphaned_count, av_error_count = migrate_asset_versions(
-                dynamodb_client, versions_v1_table_name, versions_v2_table_name,
-                v1_version_records, asset_db_cache, batch_size, dry_run
-            )
+                logger.info(f"DRY RUN: Would migrate {av_migrated_count} asset version records to V2")
 
             logger.info("")
             logger.info(f"Asset versions migration complete:")
@@ -1038,6 +1018,7 @@ Notes:
 
     except Exception as e:
         logger.error(f"Phase 2 failed: {e}")
+        log_resume_hint(checkpoint)
         return 1
 
     #######################
@@ -1053,20 +1034,29 @@ Notes:
     fv_skipped_count = 0
     fv_orphaned_count = 0
     fv_error_count = 0
-    v1_file_version_records = []
+    fv_scanned_count = 0
+
+    def migrate_asset_file_versions_page(records):
+        migrated, skipped, orphaned, errors = migrate_asset_file_versions(
+            dynamodb_client, file_versions_v1_table_name, file_versions_v2_table_name,
+            records, asset_db_cache, batch_size, dry_run
+        )
+        return {'migrated': migrated, 'skipped': skipped, 'orphaned': orphaned, 'errors': errors}
 
     try:
-        v1_file_version_records = scan_all_items(dynamodb_client, file_versions_v1_table_name, limit)
-        if not v1_file_version_records:
+        fv_stats = run_phase(dynamodb_client, file_versions_v1_table_name, migrate_asset_file_versions_page,
+                             total_segments, limit, checkpoint, 'asset_file_versions')
+        fv_migrated_count = fv_stats.get('migrated', 0)
+        fv_skipped_count = fv_stats.get('skipped', 0)
+        fv_orphaned_count = fv_stats.get('orphaned', 0)
+        fv_error_count = fv_stats.get('errors', 0)
+        fv_scanned_count = fv_stats.get('scanned', 0) + fv_stats.get('resumed', 0)
+
+        if not fv_scanned_count:
             logger.warning("No asset file version records found in V1 table. Nothing to migrate for file versions.")
         else:
             if dry_run:
-                logger.info(f"DRY RUN: Would migrate {len(v1_file_version_records)} asset file version records to V2")
-
-            fv_migrated_count, fv_skipped_count, fv_orphaned_count, fv_error_count = migrate_asset_file_versions(
-                dynamodb_client, file_versions_v1_table_name, file_versions_v2_table_name,
-                v1_file_version_records, asset_db_cache, batch_size, dry_run
-            )
+                logger.info(f"DRY RUN: Would migrate {fv_migrated_count} asset file version records to V2")
 
             logger.info("")
             logger.info(f"File versions migration complete:")
@@ -1076,6 +1066,7 @@ Notes:
 
     except Exception as e:
         logger.error(f"Phase 3 failed: {e}")
+        log_resume_hint(checkpoint)
         return 1
 
     #######################
@@ -1092,18 +1083,28 @@ Notes:
     mv_error_count = 0
     metadata_versions_table_name = config.get('asset_file_metadata_versions_storage_table_name')
 
+    def backfill_metadata_versions_page(records):
+        updated, skipped, errors = backfill_metadata_versions_database_asset_id(
+            dynamodb_client, metadata_versions_table_name, records, dry_run
+        )
+        return {'updated': updated, 'skipped': skipped, 'errors': errors}
+
     if metadata_versions_table_name:
         try:
-            mv_records = scan_all_items(dynamodb_client, metadata_versions_table_name, limit)
-            if not mv_records:
+            # Only the key attributes and the backfilled field are needed
+            mv_stats = run_phase(dynamodb_client, metadata_versions_table_name, backfill_metadata_versions_page,
+                                 total_segments, limit, checkpoint, 'metadata_versions_backfill',
+                                 projection=['databaseId:assetId:assetVersionId', 'type:filePath:metadataKey',
+                                             'databaseId:assetId'])
+            mv_updated_count = mv_stats.get('updated', 0)
+            mv_skipped_count = mv_stats.get('skipped', 0)
+            mv_error_count = mv_stats.get('errors', 0)
+
+            if not mv_stats.get('scanned', 0) + mv_stats.get('resumed', 0):
                 logger.warning("No metadata version records found. Nothing to backfill.")
             else:
                 if dry_run:
-                    logger.info(f"DRY RUN: Would backfill databaseId:assetId on {len(mv_records)} metadata version records")
-
-                mv_updated_count, mv_skipped_count, mv_error_count = backfill_metadata_versions_database_asset_id(
-                    dynamodb_client, metadata_versions_table_name, mv_records, dry_run
-                )
+                    logger.info(f"DRY RUN: Would backfill databaseId:assetId on {mv_updated_count} metadata version records")
 
                 logger.info("")
                 logger.info(f"Metadata versions backfill complete:")
@@ -1113,6 +1114,7 @@ Notes:
 
         except Exception as e:
             logger.error(f"Phase 4 failed: {e}")
+            log_resume_hint(checkpoint)
             return 1
     else:
         logger.warning("asset_file_metadata_versions_storage_table_name not in config, skipping Phase 4")
@@ -1131,7 +1133,7 @@ Notes:
         try:
             logger.info("--- Verifying Asset Versions (V1 -> V2) ---")
             av_verification = verify_asset_versions_migration(
-                dynamodb_client, versions_v1_table_name, versions_v2_table_name, av_orphaned_count
+                dynamodb_client, versions_v1_table_name, versions_v2_table_name, av_orphaned_count, total_segments
             )
             av_key_check = verify_v2_key_structure(
                 dynamodb_client, versions_v2_table_name, 'databaseId:assetId'
@@ -1140,7 +1142,7 @@ Notes:
             logger.info("")
             logger.info("--- Verifying Asset File Versions (V1 -> V2) ---")
             fv_verification = verify_asset_file_versions_migration(
-                dynamodb_client, file_versions_v1_table_name, file_versions_v2_table_name, fv_orphaned_count
+                dynamodb_client, file_versions_v1_table_name, file_versions_v2_table_name, fv_orphaned_count, total_segments
             )
             fv_key_check = verify_v2_key_structure(
                 dynamodb_client, file_versions_v2_table_name, 'databaseId:assetId:assetVersionId'
@@ -1152,7 +1154,7 @@ Notes:
                 logger.info("")
                 logger.info("--- Verifying Metadata Versions Backfill ---")
                 mv_verification = verify_metadata_versions_backfill(
-                    dynamodb_client, metadata_versions_table_name
+                    dynamodb_client, metadata_versions_table_name, total_segments
                 )
 
             verification_passed = av_verification and av_key_check and fv_verification and fv_key_check and mv_verification
@@ -1167,6 +1169,11 @@ Notes:
     #######################
 
     total_error_count = av_error_count + fv_error_count + mv_error_count
+
+    # Every phase ran to the end, so nothing is left to resume. A re-run starts over and
+    # retries any failed records (PutItem overwrites records that were already copied).
+    checkpoint.clear()
+
     migration_end_time = datetime.now(timezone.utc)
     migration_duration = (migration_end_time - migration_start_time).total_seconds()
 
@@ -1180,13 +1187,13 @@ Notes:
     logger.info(f"Asset Lookup Cache: {len(asset_db_cache)} assets")
     logger.info("")
     logger.info(f"Asset Versions (V1 -> V2):")
-    logger.info(f"  V1 Records Scanned: {len(v1_version_records)}")
+    logger.info(f"  V1 Records Scanned: {av_scanned_count}")
     logger.info(f"  Migrated to V2: {av_migrated_count}")
     logger.info(f"  Orphaned (no matching asset): {av_orphaned_count}")
     logger.info(f"  Errors: {av_error_count}")
     logger.info("")
     logger.info(f"Asset File Versions (V1 -> V2):")
-    logger.info(f"  V1 Records Scanned: {len(v1_file_version_records)}")
+    logger.info(f"  V1 Records Scanned: {fv_scanned_count}")
     logger.info(f"  Migrated to V2: {fv_migrated_count}")
     logger.info(f"  Orphaned (no matching asset): {fv_orphaned_count}")
     logger.info(f"  Errors: {fv_error_count}")
@@ -0,0 +1,9 @@
+# Copyright 2024 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+VAMS v2.5 to v2.6 Migration Package
+
+This package contains scripts for backfilling the databaseId and assetId fields
+on existing asset subscription records in the SubscriptionsStorageTable.
+"""
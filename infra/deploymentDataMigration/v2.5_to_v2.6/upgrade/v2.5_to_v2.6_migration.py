@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# Copyright 2024 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Data Migration Script for VAMS v2.5 to v2.6 - Subscription Keyed Access Backfill
+
+v2.6 subscription records carry the subscribed asset's databaseId (so the subscription
+service resolves assets with keyed reads / BatchGetItem instead of asset table scans) and
+an assetId field for the new assetIdGSI on the SubscriptionsStorageTable. Records created
+or modified by v2.6 already have both fields; this script backfills existing records in place.
+
+Table Changes:
+  SubscriptionsStorageTable: PK = eventName, SK = entityName_entityId (unchanged)
+                             + databaseId field (keyed asset lookups)
+                             + assetId field    (assetIdGSI partition key)
+
+Migration Phases:
+1. Build lookup cache: Scan asset storage table, build assetId -> databaseId mapping
+2. Backfill subscriptions: Scan subscriptions, SET databaseId and assetId on Asset records missing them
+3. Verify: Count Asset subscription records still missing the fields
+
+Key Features:
+- Idempotent (safe to re-run) - records that already have both fields are skipped
+- Dry-run mode for safe testing
+- Continue-on-error for individual records
+- Progress reporting every 100 records
+
+Usage:
+    # Dry run (recommended first step)
+    python v2.5_to_v2.6_migration.py --config v2.5_to_v2.6_migration_config.json --dry-run
+
+    # Production migration
+    python v2.5_to_v2.6_migration.py --config v2.5_to_v2.6_migration_config.json
+
+    # Test with limited items
+    python v2.5_to_v2.6_migration.py --config v2.5_to_v2.6_migration_config.json --limit 10 --dry-run
+
+Requirements:
+    - Python 3.6+
+    - boto3
+    - AWS credentials with DynamoDB read/write permissions
+"""
+
+import argparse
+import boto3
+import json
+import logging
+import sys
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+from botocore.exceptions import ClientError
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler(sys.stdout)]
+)
+logger = logging.getLogger(__name__)
+
+ASSET_ENTITY_PREFIX = 'Asset#'
+ARCHIVED_DATABASE_SUFFIX = '#deleted'
+
+
+def load_config_from_file(config_file: str) -> dict:
+    """
+    Load configuration from a JSON file.
+
+    Args:
+        config_file: Path to the configuration file
+
+    Returns:
+        dict: Configuration dictionary
+    """
+    try:
+        with open(config_file, 'r') as f:
+            config = json.load(f)
+
+        # Remove comment fields
+        config = {k: v for k, v in config.items() if not k.startswith('_comment') and k != 'comments'}
+
+        logger.info(f"Loaded configuration from {config_file}")
+        return config
+    except FileNotFoundError:
+        logger.error(f"Configuration file not found: {config_file}")
+        sys.exit(1)
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in configuration file: {e}")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"Error loading configuration from {config_file}: {e}")
+        sys.exit(1)
+
+
+def scan_all_items(dynamodb_client, table_name: str, projection: str = None, limit: int = None) -> List[Dict]:
+    """
+    Scan all items from a table, following pagination.
+
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        table_name: Name of the table to scan
+        projection: Optional projection expression
+        limit: Maximum number of items to retrieve (for testing)
+
+    Returns:
+        List of items (DynamoDB wire format)
+    """
+    items = []
+    scan_kwargs = {'TableName': table_name}
+    if projection:
+        scan_kwargs['ProjectionExpression'] = projection
+
+    while True:
+        response = dynamodb_client.scan(**scan_kwargs)
+        items.extend(response.get('Items', []))
+        if limit and len(items) >= limit:
+            return items[:limit]
+        if 'LastEvaluatedKey' not in response:
+            return items
+        scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+#######################
+# PHASE 1: BUILD LOOKUP CACHE
+#######################
+
+def build_asset_to_database_cache(dynamodb_client, asset_table_name: str) -> Dict[str, str]:
+    """
+    Scan the asset storage table and build a mapping of assetId -> databaseId.
+
+    Archived assets live under '<databaseId>#deleted'; an active record for the same
+    assetId takes precedence over an archived one.
+
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        asset_table_name: Name of the AssetStorageTable
+
+    Returns:
+        Dict mapping assetId -> databaseId
+    """
+    logger.info(f"Scanning {asset_table_name} to build assetId -> databaseId lookup cache...")
+
+    cache = {}
+    try:
+        for item in scan_all_items(dynamodb_client, asset_table_name, 'databaseId, assetId'):
+            asset_id = item.get('assetId', {}).get('S', '')
+            database_id = item.get('databaseId', {}).get('S', '')
+            if not asset_id or not database_id:
+                continue
+            if asset_id in cache and database_id.endswith(ARCHIVED_DATABASE_SUFFIX):
+                continue
+            cache[asset_id] = database_id
+    except ClientError as e:
+        logger.error(f"Error scanning asset storage table: {e}")
+        raise
+
+    logger.info(f"Built lookup cache with {len(cache)} assetId -> databaseId mappings")
+    return cache
+
+
+#######################
+# PHASE 2: BACKFILL SUBSCRIPTIONS
+#######################
+
+def backfill_subscriptions(dynamodb_client, table_name: str, records: List[Dict],
+                           asset_db_cache: Dict[str, str], dry_run: bool = False) -> Tuple[int, int, int, int]:
+    """
+    Backfill databaseId and assetId on Asset subscription records.
+
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        table_name: Name of the SubscriptionsStorageTable
+        records: List of all subscription items (DynamoDB wire format)
+        asset_db_cache: assetId -> databaseId mapping
+        dry_run: If True, don't actually write
+
+    Returns:
+        Tuple of (updated_count, skipped_count, orphaned_count, error_count)
+    """
+    updated_count = 0
+    skipped_count = 0
+    orphaned_count = 0
+    error_count = 0
+    total = len(records)
+
+    logger.info(f"Backfilling databaseId and assetId on {total} subscription records...")
+
+    for idx, record in enumerate(records, 1):
+        event_name = record.get('eventName', {}).get('S', '')
+        entity_key = record.get('entityName_entityId', {}).get('S', '')
+
+        if not event_name or not entity_key:
+            logger.warning(f"Record {idx}: Missing PK or SK, skipping")
+            error_count += 1
+            continue
+
+        # Only asset subscriptions reference assets
+        if not entity_key.startswith(ASSET_ENTITY_PREFIX):
+            skipped_count += 1
+            continue
+
+        asset_id = entity_key[len(ASSET_ENTITY_PREFIX):]
+        database_id = asset_db_cache.get(asset_id)
+
+        # Skip records that are already up to date (idempotent)
+        if (record.get('assetId', {}).get('S') == asset_id and
+                record.get('databaseId', {}).get('S') == database_id):
+            skipped_count += 1
+            continue
+
+        if not database_id:
+            logger.warning(f"Record {idx}: No asset found for subscription {event_name} / {entity_key}, skipping")
+            orphaned_count += 1
+            continue
+
+        if dry_run:
+            updated_count += 1
+            continue
+
+        try:
+            dynamodb_client.update_item(
+                TableName=table_name,
+                Key={
+                    'eventName': {'S': event_name},
+                    'entityName_entityId': {'S': entity_key}
+                },
+                UpdateExpression='SET #databaseId = :databaseId, #assetId = :assetId',
+                ConditionExpression='attribute_exists(eventName)',
+                ExpressionAttributeNames={
+                    '#databaseId': 'databaseId',
+                    '#assetId': 'assetId'
+                },
+                ExpressionAttributeValues={
+                    ':databaseId': {'S': database_id},
+                    ':assetId': {'S': asset_id}
+                }
+            )
+            updated_count += 1
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                # Deleted since the scan
+                skipped_count += 1
+            else:
+                logger.error(f"Error updating subscription record {idx}: {e}")
+                error_count += 1
+
+        # Progress reporting
+        if idx % 100 == 0:
+            logger.info(f"  Progress: {idx}/{total} subscription records processed "
+                        f"(updated={updated_count}, skipped={skipped_count}, "
+                        f"orphaned={orphaned_count}, errors={error_count})")
+
+    return updated_count, skipped_count, orphaned_count, error_count
+
+
+#######################
+# PHASE 3: VERIFY
+#######################
+
+def verify_subscriptions_backfill(dynamodb_client, table_name: str) -> int:
+    """
+    Count Asset subscription records still missing databaseId or assetId.
+
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        table_name: Name of the SubscriptionsStorageTable
+
+    Returns:
+        Number of Asset subscription records missing the backfilled fields
+    """
+    missing = 0
+    for record in scan_all_items(dynamodb_client, table_name):
+        entity_key = record.get('entityName_entityId', {}).get('S', '')
+        if not entity_key.startswith(ASSET_ENTITY_PREFIX):
+            continue
+        if not record.get('databaseId', {}).get('S') or not record.get('assetId', {}).get('S'):
+            missing += 1
+    return missing
+
+
+def main():
+    """Main function to run the migration."""
+    parser = argparse.ArgumentParser(
+        description='VAMS v2.5 to v2.6 Migration Script - Subscription Keyed Access Backfill',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Dry run (recommended first)
+  python v2.5_to_v2.6_migration.py --config v2.5_to_v2.6_migration_config.json --dry-run
+
+  # Production migration
+  python v2.5_to_v2.6_migration.py --config v2.5_to_v2.6_migration_config.json
+
+  # Test with limited items
+  python v2.5_to_v2.6_migration.py --config v2.5_to_v2.6_migration_config.json --limit 10 --dry-run
+
+Notes:
+  - Configuration file is required
+  - Dry-run mode is recommended for initial testing
+  - Migration is idempotent - records that already have the fields are skipped
+        """
+    )
+
+    parser.add_argument('--config', required=True,
+                        help='Path to configuration JSON file (required)')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='Perform dry run without making changes')
+    parser.add_argument('--limit', type=int,
+                        help='Maximum number of subscription records to process (for testing)')
+    parser.add_argument('--profile',
+                        help='AWS profile name')
+    parser.add_argument('--region',
+                        help='AWS region')
+    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'], default='INFO',
+                        help='Logging level (default: INFO)')
+
+    args = parser.parse_args()
+
+    # Load configuration from file
+    config = load_config_from_file(args.config)
+
+    # Command-line arguments override config file
+    asset_table_name = config.get('asset_storage_table_name')
+    subscriptions_table_name = config.get('subscriptions_storage_table_name')
+    dry_run = args.dry_run or config.get('dry_run', False)
+    limit = args.limit or config.get('limit')
+    profile = args.profile or config.get('aws_profile')
+    region = args.region or config.get('aws_region')
+    log_level = args.log_level or config.get('log_level', 'INFO')
+
+    # Validate required parameters
+    if not asset_table_name:
+        logger.error("Error: asset_storage_table_name is required in config file")
+        return 1
+
+    if not subscriptions_table_name:
+        logger.error("Error: subscriptions_storage_table_name is required in config file")
+        return 1
+
+    # Configure logging
+    logging.getLogger().setLevel(getattr(logging, log_level))
+
+    # Initialize AWS session
+    session_kwargs = {}
+    if profile:
+        session_kwargs['profile_name'] = profile
+    if region:
+        session_kwargs['region_name'] = region
+
+    session = boto3.Session(**session_kwargs)
+    dynamodb_client = session.client('dynamodb')
+
+    logger.info("=" * 80)
+    logger.info("VAMS v2.5 to v2.6 MIGRATION - Subscription Keyed Access Backfill")
+    logger.info("=" * 80)
+    logger.info(f"Asset Storage Table (lookup): {asset_table_name}")
+    logger.info(f"Subscriptions Table:          {subscriptions_table_name}")
+    logger.info(f"Dry Run: {dry_run}")
+    if limit:
+        logger.info(f"Limit: {limit} items")
+    logger.info("=" * 80)
+
+    migration_start_time = datetime.now(timezone.utc)
+
+    logger.info("")
+    logger.info("=" * 80)
+    logger.info("PHASE 1: BUILD ASSET-TO-DATABASE LOOKUP CACHE")
+    logger.info("=" * 80)
+
+    try:
+        asset_db_cache = build_asset_to_database_cache(dynamodb_client, asset_table_name)
+    except Exception as e:
+        logger.error(f"Failed to build lookup cache: {e}")
+        return 1
+
+    logger.info("")
+    logger.info("=" * 80)
+    logger.info("PHASE 2: BACKFILL SUBSCRIPTION RECORDS")
+    logger.info("=" * 80)
+
+    try:
+        records = scan_all_items(dynamodb_client, subscriptions_table_name, limit=limit)
+        updated, skipped, orphaned, errors = backfill_subscriptions(
+            dynamodb_client, subscriptions_table_name, records, asset_db_cache, dry_run)
+    except Exception as e:
+        logger.error(f"Failed to backfill subscription records: {e}")
+        return 1
+
+    logger.info(f"Subscription records: updated={updated}, skipped={skipped}, "
+                f"orphaned={orphaned}, errors={errors}")
+
+    logger.info("")
+    logger.info("=" * 80)
+    logger.info("PHASE 3: VERIFY")
+    logger.info("=" * 80)
+
+    if dry_run:
+        logger.info("Dry run - skipping verification")
+    else:
+        missing = verify_subscriptions_backfill(dynamodb_client, subscriptions_table_name)
+        if missing > orphaned:
+            logger.warning(f"{missing} Asset subscription records are still missing databaseId/assetId")
+        else:
+            logger.info(f"Verification passed ({missing} orphaned records without an existing asset)")
+
+    duration = datetime.now(timezone.utc) - migration_start_time
+    logger.info("")
+    logger.info(f"Migration finished in {duration.total_seconds():.1f} seconds")
+
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -219,6 +219,8 @@ export function buildAssetFiles(
                 storageResources.dynamo.assetFileMetadataStorageTable.tableName,
             FILE_ATTRIBUTE_STORAGE_TABLE_NAME:
                 storageResources.dynamo.fileAttributeStorageTable.tableName,
+            PREVIEW_INDEX_STORAGE_TABLE_NAME:
+                storageResources.dynamo.previewIndexStorageTable.tableName,
             S3_ASSET_AUXILIARY_BUCKET: storageResources.s3.assetAuxiliaryBucket.bucketName,
             SEND_EMAIL_FUNCTION_NAME: sendEmailFunction.functionName,
         },
@@ -227,6 +229,7 @@ export function buildAssetFiles(
     storageResources.dynamo.s3AssetBucketsStorageTable.grantReadData(fun);
     storageResources.dynamo.assetStorageTable.grantReadWriteData(fun);
     storageResources.s3.assetAuxiliaryBucket.grantReadWrite(fun);
+    storageResources.dynamo.previewIndexStorageTable.grantReadData(fun);
     storageResources.dynamo.assetFileVersionsStorageTable.grantReadData(fun);
     storageResources.dynamo.assetVersionsStorageTable.grantReadData(fun);
     storageResources.dynamo.assetFileMetadataStorageTable.grantReadWriteData(fun);
@@ -280,6 +283,8 @@ export function buildUploadFileFunction(
             PRESIGNED_URL_TIMEOUT_SECONDS:
                 config.app.authProvider.presignedUrlTimeoutSeconds.toString(),
             LARGE_FILE_PROCESSING_QUEUE_URL: largeFileProcessingQueue.queueUrl,
+            PREVIEW_INDEX_STORAGE_TABLE_NAME:
+                storageResources.dynamo.previewIndexStorageTable.tableName,
         },
     });
 
@@ -288,6 +293,7 @@ export function buildUploadFileFunction(
     storageResources.s3.assetAuxiliaryBucket.grantReadWrite(fun);
     storageResources.dynamo.assetStorageTable.grantReadWriteData(fun);
     storageResources.dynamo.assetUploadsStorageTable.grantReadWriteData(fun);
+    storageResources.dynamo.previewIndexStorageTable.grantReadData(fun);
     sendEmailFunction.grantInvoke(fun);
 
     grantReadWritePermissionsToAllAssetBuckets(fun);
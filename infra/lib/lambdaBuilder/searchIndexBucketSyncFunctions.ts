@@ -125,6 +125,8 @@ export function buildFileIndexingFunction(
                 storageResources.dynamo.fileAttributeStorageTable.tableName,
             S3_ASSET_BUCKETS_STORAGE_TABLE_NAME:
                 storageResources.dynamo.s3AssetBucketsStorageTable.tableName,
+            PREVIEW_INDEX_STORAGE_TABLE_NAME:
+                storageResources.dynamo.previewIndexStorageTable.tableName,
             OPENSEARCH_FILE_INDEX_SSM_PARAM: config.openSearchFileIndexNameSSMParam,
             OPENSEARCH_ENDPOINT_SSM_PARAM: config.openSearchDomainEndpointSSMParam,
             OPENSEARCH_TYPE: config.app.openSearch.useProvisioned.enabled
@@ -146,6 +148,7 @@ export function buildFileIndexingFunction(
     storageResources.dynamo.assetFileMetadataStorageTable.grantReadData(fun);
     storageResources.dynamo.fileAttributeStorageTable.grantReadData(fun);
     storageResources.dynamo.s3AssetBucketsStorageTable.grantReadData(fun);
+    storageResources.dynamo.previewIndexStorageTable.grantReadData(fun);
 
     // Grant S3 read permissions
     grantReadPermissionsToAllAssetBuckets(fun);
@@ -272,6 +275,8 @@ export function buildSqsBucketSyncFunction(
                 storageResources.dynamo.assetFileMetadataStorageTable.tableName,
             FILE_ATTRIBUTE_STORAGE_TABLE_NAME:
                 storageResources.dynamo.fileAttributeStorageTable.tableName,
+            PREVIEW_INDEX_STORAGE_TABLE_NAME:
+                storageResources.dynamo.previewIndexStorageTable.tableName,
             ASSET_STORAGE_TABLE_NAME: storageResources.dynamo.assetStorageTable.tableName,
             ASSET_VERSIONS_STORAGE_TABLE_NAME:
                 storageResources.dynamo.assetVersionsStorageTable.tableName,
@@ -294,6 +299,7 @@ export function buildSqsBucketSyncFunction(
     storageResources.dynamo.assetVersionsStorageTable.grantReadWriteData(fun);
     storageResources.dynamo.tagTypeStorageTable.grantReadData(fun);
     storageResources.dynamo.tagStorageTable.grantReadData(fun);
+    storageResources.dynamo.previewIndexStorageTable.grantReadWriteData(fun);
 
     // Grant SNS publish permissions
     storageResources.sns.fileIndexerSnsTopic.grantPublish(fun);
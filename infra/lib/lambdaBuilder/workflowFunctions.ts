@@ -131,6 +131,53 @@ export function buildListWorkflowExecutionsFunction(
     return fun;
 }
 
+export function buildUpdateWorkflowExecutionStatusFunction(
+    scope: Construct,
+    lambdaCommonBaseLayer: LayerVersion,
+    storageResources: storageResources,
+    config: Config.Config,
+    vpc: ec2.IVpc,
+    subnets: ec2.ISubnet[]
+): lambda.Function {
+    const name = "updateWorkflowExecutionStatus";
+    const fun = new lambda.Function(scope, name, {
+        code: lambda.Code.fromAsset(path.join(__dirname, `../../../backend/backend`)),
+        handler: `handlers.workflows.${name}.lambda_handler`,
+        runtime: LAMBDA_PYTHON_RUNTIME,
+        layers: [lambdaCommonBaseLayer],
+        timeout: Duration.minutes(1),
+        memorySize: Config.LAMBDA_MEMORY_SIZE,
+        vpc:
+            config.app.useGlobalVpc.enabled && config.app.useGlobalVpc.useForAllLambdas
+                ? vpc
+                : undefined, //Use VPC when flagged to use for all lambdas
+        vpcSubnets:
+            config.app.useGlobalVpc.enabled && config.app.useGlobalVpc.useForAllLambdas
+                ? { subnets: subnets }
+                : undefined,
+        environment: {
+            WORKFLOW_EXECUTION_STORAGE_TABLE_NAME:
+                storageResources.dynamo.workflowExecutionsStorageTable.tableName,
+        },
+    });
+    storageResources.dynamo.workflowExecutionsStorageTable.grantReadWriteData(fun);
+    fun.addToRolePolicy(
+        new iam.PolicyStatement({
+            effect: iam.Effect.ALLOW,
+            actions: ["states:DescribeExecution"],
+            resources: [
+                IAMArn("*" + config.name + "*").statemachine,
+                IAMArn("*" + config.name + "*").statemachineExecution,
+            ],
+        })
+    );
+    kmsKeyLambdaPermissionAddToResourcePolicy(fun, storageResources.encryption.kmsKey);
+    setupSecurityAndLoggingEnvironmentAndPermissions(fun, storageResources);
+    globalLambdaEnvironmentsAndPermissions(fun, config);
+
+    return fun;
+}
+
 export function buildCreateWorkflowFunction(
     scope: Construct,
     lambdaCommonBaseLayer: LayerVersion,
@@ -215,7 +262,6 @@ export function buildExecuteWorkflowFunction(
     scope: Construct,
     lambdaCommonBaseLayer: LayerVersion,
     storageResources: storageResources,
-    metadataServiceFunction: lambda.IFunction,
     config: Config.Config,
     vpc: ec2.IVpc,
     subnets: ec2.ISubnet[]
@@ -245,7 +291,12 @@ export function buildExecuteWorkflowFunction(
             WORKFLOW_EXECUTION_STORAGE_TABLE_NAME:
                 storageResources.dynamo.workflowExecutionsStorageTable.tableName,
             S3_ASSETAUXILIARY_STORAGE_BUCKET: storageResources.s3.assetAuxiliaryBucket.bucketName,
-            METADATA_SERVICE_LAMBDA_FUNCTION_NAME: metadataServiceFunction.functionName,
+            ASSET_FILE_METADATA_STORAGE_TABLE_NAME:
+                storageResources.dynamo.assetFileMetadataStorageTable.tableName,
+            FILE_ATTRIBUTE_STORAGE_TABLE_NAME:
+                storageResources.dynamo.fileAttributeStorageTable.tableName,
+            METADATA_SCHEMA_STORAGE_TABLE_V2_NAME:
+                storageResources.dynamo.metadataSchemaStorageTableV2.tableName,
         },
     });
 
@@ -255,7 +306,9 @@ export function buildExecuteWorkflowFunction(
     storageResources.dynamo.assetStorageTable.grantReadData(fun);
     storageResources.dynamo.workflowExecutionsStorageTable.grantReadWriteData(fun);
     storageResources.s3.assetAuxiliaryBucket.grantReadWrite(fun);
-    metadataServiceFunction.grantInvoke(fun);
+    storageResources.dynamo.assetFileMetadataStorageTable.grantReadData(fun);
+    storageResources.dynamo.fileAttributeStorageTable.grantReadData(fun);
+    storageResources.dynamo.metadataSchemaStorageTableV2.grantReadData(fun);
 
     grantReadWritePermissionsToAllAssetBuckets(fun);
     kmsKeyLambdaPermissionAddToResourcePolicy(fun, storageResources.encryption.kmsKey);
@@ -312,6 +365,9 @@ export function buildSqsAutoExecuteWorkflowFunction(
             S3_ASSET_BUCKETS_STORAGE_TABLE_NAME:
                 storageResources.dynamo.s3AssetBucketsStorageTable.tableName,
             EXECUTE_WORKFLOW_LAMBDA_FUNCTION_NAME: executeWorkflowFunction.functionName,
+            EXECUTION_PER_ASSET_BATCH: config.app.workflowAutoExecution.executionPerAssetBatch
+                ? "true"
+                : "false",
         },
     });
 
@@ -9,6 +9,8 @@ import { Names } from "aws-cdk-lib";
 import * as apigateway from "aws-cdk-lib/aws-apigatewayv2";
 import * as sqs from "aws-cdk-lib/aws-sqs";
 import * as eventsources from "aws-cdk-lib/aws-lambda-event-sources";
+import * as events from "aws-cdk-lib/aws-events";
+import * as eventsTargets from "aws-cdk-lib/aws-events-targets";
 import { SqsSubscription } from "aws-cdk-lib/aws-sns-subscriptions";
 
 import { ApiGatewayV2LambdaConstruct } from "./constructs/apigatewayv2-lambda-construct";
@@ -20,9 +22,11 @@ import * as cdk from "aws-cdk-lib";
 import {
     buildCreateDatabaseLambdaFunction,
     buildDatabaseService,
+    buildReconcileAssetCountsFunction,
 } from "../../lambdaBuilder/databaseFunctions";
 import {
     buildListWorkflowExecutionsFunction,
+    buildUpdateWorkflowExecutionStatusFunction,
     buildWorkflowService,
     buildCreateWorkflowFunction,
     buildExecuteWorkflowFunction,
@@ -75,7 +79,10 @@ import {
 } from "../../lambdaBuilder/tagTypeFunctions";
 import { buildRoleService, buildCreateRoleFunction } from "../../lambdaBuilder/roleFunctions";
 import { buildUserRolesService } from "../../lambdaBuilder/userRoleFunctions";
-import { buildSendEmailFunction } from "../../lambdaBuilder/sendEmailFunctions";
+import {
+    buildSendEmailFunction,
+    buildSendEmailDigestFunction,
+} from "../../lambdaBuilder/sendEmailFunctions";
 import { NagSuppressions } from "cdk-nag";
 import * as Config from "../../../config/config";
 import * as ec2 from "aws-cdk-lib/aws-ec2";
@@ -174,16 +181,76 @@ export class ApiBuilderNestedStack extends NestedStack {
             api: api,
         });
 
+        //Asset counters are maintained atomically by the asset APIs; recount hourly to correct drift
+        const reconcileAssetCountsFunction = buildReconcileAssetCountsFunction(
+            this,
+            lambdaCommonBaseLayer,
+            storageResources,
+            config,
+            vpc,
+            subnets,
+            storageResources.encryption.kmsKey
+        );
+        new events.Rule(this, "ReconcileAssetCountsSchedule", {
+            schedule: events.Schedule.rate(cdk.Duration.hours(1)),
+            targets: [new eventsTargets.LambdaFunction(reconcileAssetCountsFunction)],
+        });
+
         //Email Resources
+        // Asset change events are buffered on the digest queue so subscribers get one
+        // notification per asset per batching window instead of one per change
+        const sendEmailDigestQueue = new sqs.Queue(this, "SendEmailDigestQueue", {
+            queueName: `${config.name}-${config.env.coreStackName}-sendEmailDigest-queue`,
+            visibilityTimeout: cdk.Duration.minutes(30), // 6x Lambda timeout
+            retentionPeriod: cdk.Duration.days(1),
+            encryption: storageResources.encryption.kmsKey
+                ? sqs.QueueEncryption.KMS
+                : sqs.QueueEncryption.SQS_MANAGED,
+            encryptionMasterKey: storageResources.encryption.kmsKey,
+            enforceSSL: true,
+        });
+
         const sendEmailFunction = buildSendEmailFunction(
             this,
             lambdaCommonBaseLayer,
             storageResources,
+            sendEmailDigestQueue,
             config,
             vpc,
             subnets
         );
 
+        const sendEmailDigestFunction = buildSendEmailDigestFunction(
+            this,
+            lambdaCommonBaseLayer,
+            storageResources,
+            config,
+            vpc,
+            subnets
+        );
+
+        const esmSendEmailDigest = new lambda.EventSourceMapping(
+            this,
+            "SendEmailDigestEventSourceMapping",
+            {
+                target: sendEmailDigestFunction,
+                eventSourceArn: sendEmailDigestQueue.queueArn,
+                batchSize: 1000,
+                maxBatchingWindow: cdk.Duration.seconds(60), // Digest window per asset
+                reportBatchItemFailures: true,
+            }
+        );
+
+        // Due to cdk version upgrade, not all regions support tags for EventSourceMapping
+        // this line should remove the tags for regions that dont support it (govcloud currently not supported)
+        if (config.app.govCloud.enabled) {
+            const cfnEsmSendEmailDigest = esmSendEmailDigest.node
+                .defaultChild as lambda.CfnEventSourceMapping;
+            cfnEsmSendEmailDigest.addPropertyDeletionOverride("Tags");
+        }
+
+        sendEmailDigestQueue.grantConsumeMessages(sendEmailDigestFunction);
+
         //Comment Resources
         const commentService = buildCommentService(
             this,
@@ -720,6 +787,12 @@ export class ApiBuilderNestedStack extends NestedStack {
             api: api,
         });
 
+        attachFunctionToApi(this, uploadFileFunction, {
+            routePath: "/uploads/complete/batch",
+            method: apigateway.HttpMethod.POST,
+            api: api,
+        });
+
         // Create large file processor Lambda function
         const sqsUploadFileLargeFunction = buildSqsUploadFileLargeFunction(
             this,
@@ -917,6 +990,13 @@ export class ApiBuilderNestedStack extends NestedStack {
             });
         }
 
+        // Bulk Metadata Import Route
+        attachFunctionToApi(this, metadataService, {
+            routePath: "/database/{databaseId}/metadata/import",
+            method: apigateway.HttpMethod.POST,
+            api: api,
+        });
+
         const metadataSchemaService = buildMetadataSchemaService(
             this,
             lambdaCommonBaseLayer,
@@ -1062,6 +1142,26 @@ export class ApiBuilderNestedStack extends NestedStack {
             api: api,
         });
 
+        //Record execution completions as they happen so listing executions only describes open runs
+        const updateWorkflowExecutionStatusFunction = buildUpdateWorkflowExecutionStatusFunction(
+            this,
+            lambdaCommonBaseLayer,
+            storageResources,
+            config,
+            vpc,
+            subnets
+        );
+        new events.Rule(this, "WorkflowExecutionStatusChangeRule", {
+            eventPattern: {
+                source: ["aws.states"],
+                detailType: ["Step Functions Execution Status Change"],
+                detail: {
+                    status: ["SUCCEEDED", "FAILED", "TIMED_OUT", "ABORTED"],
+                },
+            },
+            targets: [new eventsTargets.LambdaFunction(updateWorkflowExecutionStatusFunction)],
+        });
+
         const processWorkflowExecutionOutputFunction = buildProcessWorkflowExecutionOutputFunction(
             this,
             lambdaCommonBaseLayer,
@@ -1093,7 +1193,6 @@ export class ApiBuilderNestedStack extends NestedStack {
             this,
             lambdaCommonBaseLayer,
             storageResources,
-            metadataService,
             config,
             vpc,
             subnets
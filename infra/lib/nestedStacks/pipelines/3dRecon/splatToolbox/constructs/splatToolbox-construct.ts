@@ -198,6 +198,7 @@ export class SplatToolboxConstruct extends Construct {
                     "container"
                 ),
                 dockerfileName: "Dockerfile",
+                sharedModulesPath: "utils/aws",
                 containerExecutionCommand: ["python", "__main__.py"],
                 batchJobDefinitionName: `SplatToolboxGpuJob-${
                     props.config.name + "_" + props.config.app.baseStackName
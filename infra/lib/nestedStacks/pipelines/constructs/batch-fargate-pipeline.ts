@@ -12,6 +12,7 @@ import { Construct } from "constructs";
 import { CfnJobDefinition } from "aws-cdk-lib/aws-batch";
 import { generateUniqueNameHash } from "../../../helper/security";
 import path = require("path");
+import { copySharedPipelineModules } from "./shared-pipeline-modules";
 
 export interface BatchFargatePipelineConstructProps extends cdk.StackProps {
     config: Config.Config;
@@ -22,6 +23,11 @@ export interface BatchFargatePipelineConstructProps extends cdk.StackProps {
     executionRole: iam.Role;
     imageAssetPath: string;
     dockerfileName: string;
+    /**
+     * Package directory within the image asset path that the shared pipeline container
+     * modules (backendPipelines/common) are copied into before the image is built.
+     */
+    sharedModulesPath?: string;
     batchJobDefinitionName: string;
     /**
      * Ephemeral storage size in GiB for the Fargate container.
@@ -59,13 +65,14 @@ export class BatchFargatePipelineConstruct extends Construct {
         );
 
         // Docker container image
-        const containerImage = ecs.AssetImage.fromAsset(
-            path.join(__dirname, props.imageAssetPath),
-            {
-                file: props.dockerfileName,
-                platform: cdk.aws_ecr_assets.Platform.LINUX_AMD64, //Fix to the LINUX_AMD64 platform to standardize instruction set across all loads
-            }
-        );
+        const imageAssetPath = path.join(__dirname, props.imageAssetPath);
+        if (props.sharedModulesPath) {
+            copySharedPipelineModules(imageAssetPath, props.sharedModulesPath);
+        }
+        const containerImage = ecs.AssetImage.fromAsset(imageAssetPath, {
+            file: props.dockerfileName,
+            platform: cdk.aws_ecr_assets.Platform.LINUX_AMD64, //Fix to the LINUX_AMD64 platform to standardize instruction set across all loads
+        });
 
         const batchJobName =
             props.batchJobDefinitionName +
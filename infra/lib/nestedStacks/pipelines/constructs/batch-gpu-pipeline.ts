@@ -12,6 +12,7 @@ import * as cdk from "aws-cdk-lib";
 import { Construct } from "constructs";
 import { CfnJobDefinition, CfnComputeEnvironment, CfnJobQueue } from "aws-cdk-lib/aws-batch";
 import path = require("path");
+import { copySharedPipelineModules } from "./shared-pipeline-modules";
 
 export interface BatchGpuPipelineConstructProps extends cdk.StackProps {
     vpc: ec2.IVpc;
@@ -21,6 +22,11 @@ export interface BatchGpuPipelineConstructProps extends cdk.StackProps {
     executionRole: iam.Role;
     imageAssetPath: string;
     dockerfileName: string;
+    /**
+     * Package directory within the image asset path that the shared pipeline container
+     * modules (backendPipelines/common) are copied into before the image is built.
+     */
+    sharedModulesPath?: string;
     containerExecutionCommand: string[];
     batchJobDefinitionName: string;
     // Optional GPU-specific configurations
@@ -169,13 +175,14 @@ chmod 775 /mnt/workspace
         );
 
         // Docker container image
-        const containerImage = ecs.AssetImage.fromAsset(
-            path.join(__dirname, props.imageAssetPath),
-            {
-                file: props.dockerfileName,
-                platform: cdk.aws_ecr_assets.Platform.LINUX_AMD64,
-            }
-        );
+        const imageAssetPath = path.join(__dirname, props.imageAssetPath);
+        if (props.sharedModulesPath) {
+            copySharedPipelineModules(imageAssetPath, props.sharedModulesPath);
+        }
+        const containerImage = ecs.AssetImage.fromAsset(imageAssetPath, {
+            file: props.dockerfileName,
+            platform: cdk.aws_ecr_assets.Platform.LINUX_AMD64,
+        });
 
         // Create a temporary task definition to bind the image
         const tempTaskDef = new ecs.TaskDefinition(this, "TempTaskDef", {
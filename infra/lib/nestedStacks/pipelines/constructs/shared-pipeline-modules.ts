@@ -0,0 +1,43 @@
+/*
+ * Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+ * SPDX-License-Identifier: Apache-2.0
+ */
+import * as fs from "fs";
+import path = require("path");
+
+/**
+ * Python modules shared by the pipeline containers. Each container image is built from its own
+ * directory, so the single copy under backendPipelines/common is copied into the container's
+ * build context before the image asset is staged. The copies are ignored by git.
+ */
+export const SHARED_PIPELINE_MODULES = ["s3_transfer.py"];
+
+const sharedPipelineModulesPath = path.join(
+    __dirname,
+    "..",
+    "..",
+    "..",
+    "..",
+    "..",
+    "backendPipelines",
+    "common"
+);
+
+/**
+ * Copy the shared pipeline modules into a container build context
+ *
+ * @param imageAssetPath Absolute path of the container build context
+ * @param sharedModulesPath Package directory within the build context to copy the modules into
+ */
+export function copySharedPipelineModules(imageAssetPath: string, sharedModulesPath: string): void {
+    const targetDir = path.join(imageAssetPath, sharedModulesPath);
+    if (!fs.existsSync(targetDir)) {
+        throw new Error(`Shared pipeline module directory ${targetDir} does not exist`);
+    }
+    for (const moduleName of SHARED_PIPELINE_MODULES) {
+        fs.copyFileSync(
+            path.join(sharedPipelineModulesPath, moduleName),
+            path.join(targetDir, moduleName)
+        );
+    }
+}
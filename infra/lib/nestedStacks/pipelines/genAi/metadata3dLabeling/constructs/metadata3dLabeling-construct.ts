@@ -224,6 +224,7 @@ export class Metadata3dLabelingConstruct extends NestedStack {
                     "container"
                 ),
                 dockerfileName: "Dockerfile_BlenderRenderer",
+                sharedModulesPath: "main/utils/aws",
                 batchJobDefinitionName: "Metadata3dLabelingJob_BlenderRenderer",
             }
         );
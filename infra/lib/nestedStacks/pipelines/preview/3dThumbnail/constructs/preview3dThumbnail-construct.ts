@@ -10,12 +10,15 @@ import * as tasks from "aws-cdk-lib/aws-stepfunctions-tasks";
 import * as iam from "aws-cdk-lib/aws-iam";
 import * as path from "path";
 import * as lambda from "aws-cdk-lib/aws-lambda";
+import * as eventsources from "aws-cdk-lib/aws-lambda-event-sources";
+import * as sqs from "aws-cdk-lib/aws-sqs";
 import * as cdk from "aws-cdk-lib";
 import { Duration, Stack, NestedStack } from "aws-cdk-lib";
 import { Construct } from "constructs";
 import {
     buildConstructPipelineFunction,
     buildOpenPipelineFunction,
+    buildOpenBatchPipelineFunction,
     buildVamsExecutePreview3dThumbnailPipelineFunction,
     buildPipelineEndFunction,
 } from "../lambdaBuilder/preview3dThumbnailFunctions";
@@ -197,6 +200,7 @@ export class Preview3dThumbnailConstruct extends NestedStack {
                     "container"
                 ),
                 dockerfileName: "Dockerfile",
+                sharedModulesPath: "preview_pipeline/utils",
                 ephemeralStorageGiB: 200,
                 batchJobDefinitionName:
                     "Preview3dThumbnailJob" +
@@ -222,6 +226,22 @@ export class Preview3dThumbnailConstruct extends NestedStack {
             props.storageResources.encryption.kmsKey
         );
 
+        // A batch container renders up to maxFilesPerBatch files, so its time budget scales with it
+        const batchExecutionConfig =
+            props.config.app.pipelines.usePreview3dThumbnail.batchExecution;
+        const containerTimeout = batchExecutionConfig.enabled
+            ? Duration.minutes(
+                  Math.max(
+                      60,
+                      batchExecutionConfig.maxFilesPerBatch *
+                          batchExecutionConfig.perFileTimeoutMinutes
+                  )
+              )
+            : Duration.hours(1);
+        // The container state times out first so the catch path still runs pipelineEnd,
+        // which fails the workflow task tokens of the files that did not finish
+        const stateMachineTimeout = containerTimeout.plus(Duration.minutes(15));
+
         // creates pipeline definition based on event notification input
         const constructPipelineTask = new tasks.LambdaInvoke(this, "ConstructPipelineTask", {
             lambdaFunction: constructPipelineFunction,
@@ -275,6 +295,7 @@ export class Preview3dThumbnailConstruct extends NestedStack {
                 jobName: sfn.JsonPath.stringAt("$.jobName"),
                 jobDefinitionArn: batchPipeline.batchJobDefinition.jobDefinitionArn,
                 jobQueueArn: batchPipeline.batchJobQueue.jobQueueArn,
+                taskTimeout: sfn.Timeout.duration(containerTimeout),
                 containerOverrides: {
                     command: [...sfn.JsonPath.listAt("$.definition")],
                     environment: {
@@ -292,6 +313,9 @@ export class Preview3dThumbnailConstruct extends NestedStack {
         /**
          * SFN Definition
          */
+        constructPipelineTask.addCatch(handleBatchError, {
+            resultPath: "$.error",
+        });
         const sfnPipelineDefinition = sfn.Chain.start(
             constructPipelineTask.next(preview3dThumbnailBatchJob)
         );
@@ -324,7 +348,7 @@ export class Preview3dThumbnailConstruct extends NestedStack {
             "Preview3dThumbnailProcessing-StateMachine",
             {
                 definitionBody: sfn.DefinitionBody.fromChainable(sfnPipelineDefinition),
-                timeout: Duration.hours(1),
+                timeout: stateMachineTimeout,
                 logs: {
                     destination: stateMachineLogGroup,
                     includeExecutionData: true,
@@ -360,12 +384,94 @@ export class Preview3dThumbnailConstruct extends NestedStack {
                 props.lambdaCommonBaseLayer,
                 props.storageResources.s3.assetAuxiliaryBucket,
                 openPipelineFunction,
+                props.storageResources.dynamo.previewIndexStorageTable,
                 props.config,
                 props.vpc,
                 props.pipelineSubnets,
                 props.storageResources.encryption.kmsKey
             );
 
+        // Batch execution: queue executions and group them into multi-file container launches
+        if (batchExecutionConfig.enabled) {
+            const batchQueue = new sqs.Queue(this, "Preview3dThumbnailBatchQueue", {
+                visibilityTimeout: cdk.Duration.seconds(360), // Corresponding function's timeout is 300
+                encryption: props.storageResources.encryption.kmsKey
+                    ? sqs.QueueEncryption.KMS
+                    : sqs.QueueEncryption.SQS_MANAGED,
+                encryptionMasterKey: props.storageResources.encryption.kmsKey,
+                enforceSSL: true,
+            });
+
+            const openBatchPipelineFunction = buildOpenBatchPipelineFunction(
+                this,
+                props.lambdaCommonBaseLayer,
+                props.storageResources.s3.assetAuxiliaryBucket,
+                pipelineStateMachine,
+                allowedInputFileExtensions,
+                batchExecutionConfig.maxFilesPerBatch,
+                props.config,
+                props.vpc,
+                props.pipelineSubnets,
+                props.storageResources.encryption.kmsKey
+            );
+
+            batchQueue.grantConsumeMessages(openBatchPipelineFunction);
+            batchQueue.grantSendMessages(preview3dThumbnailPipelineVamsExecuteFunction);
+            preview3dThumbnailPipelineVamsExecuteFunction.addEnvironment(
+                "BATCH_QUEUE_URL",
+                batchQueue.queueUrl
+            );
+
+            // Setup event source mapping with GovCloud support
+            if (props.config.app.govCloud.enabled) {
+                const esmBatchQueue = new lambda.EventSourceMapping(
+                    this,
+                    "Preview3dThumbnailBatchQueueEventSource",
+                    {
+                        eventSourceArn: batchQueue.queueArn,
+                        target: openBatchPipelineFunction,
+                        batchSize: batchExecutionConfig.maxFilesPerBatch,
+                        maxBatchingWindow: cdk.Duration.seconds(
+                            batchExecutionConfig.maxBatchingWindowSeconds
+                        ),
+                    }
+                );
+                const cfnEsmBatchQueue = esmBatchQueue.node
+                    .defaultChild as lambda.CfnEventSourceMapping;
+                cfnEsmBatchQueue.addPropertyDeletionOverride("Tags");
+            } else {
+                openBatchPipelineFunction.addEventSource(
+                    new eventsources.SqsEventSource(batchQueue, {
+                        batchSize: batchExecutionConfig.maxFilesPerBatch,
+                        maxBatchingWindow: cdk.Duration.seconds(
+                            batchExecutionConfig.maxBatchingWindowSeconds
+                        ),
+                    })
+                );
+            }
+
+            NagSuppressions.addResourceSuppressions(
+                openBatchPipelineFunction,
+                [
+                    {
+                        id: "AwsSolutions-IAM4",
+                        reason: "openBatchPipeline requires AWS Managed Policies, AWSLambdaBasicExecutionRole and AWSLambdaVPCAccessExecutionRole for CloudWatch logging and VPC network interface management",
+                    },
+                    {
+                        id: "AwsSolutions-IAM5",
+                        reason: "openBatchPipeline uses default policy that contains wildcards for writing batch manifests to the auxiliary bucket, starting the state machine and sending task callbacks",
+                    },
+                ],
+                true
+            );
+            NagSuppressions.addResourceSuppressions(batchQueue, [
+                {
+                    id: "AwsSolutions-SQS3",
+                    reason: "Failed batch starts are reported to each file's workflow task token, so a dead-letter queue is not needed",
+                },
+            ]);
+        }
+
         // Create custom resource to automatically register pipeline and workflow
         if (props.config.app.pipelines.usePreview3dThumbnail.autoRegisterWithVAMS === true) {
             const importFunction = lambda.Function.fromFunctionArn(
@@ -376,6 +482,13 @@ export class Preview3dThumbnailConstruct extends NestedStack {
                 }`
             );
 
+            // A queued file can wait for the batching window and then be the last file of its batch
+            const workflowTaskTimeoutSeconds = batchExecutionConfig.enabled
+                ? stateMachineTimeout.toSeconds() +
+                  batchExecutionConfig.maxBatchingWindowSeconds +
+                  300
+                : 3600; // 1 hour
+
             const importProvider = new cr.Provider(this, "ImportProvider", {
                 onEventHandler: importFunction,
             });
@@ -395,7 +508,7 @@ export class Preview3dThumbnailConstruct extends NestedStack {
                     outputType: ".gif,.jpg,.png",
                     waitForCallback: "Enabled", // Asynchronous pipeline
                     lambdaName: preview3dThumbnailPipelineVamsExecuteFunction.functionName,
-                    taskTimeout: "3600", // 1 hour
+                    taskTimeout: workflowTaskTimeoutSeconds.toString(),
                     taskHeartbeatTimeout: "",
                     inputParameters: '{"overwriteExistingPreviewFiles": true}',
                     workflowId: "preview-3d-thumbnail",
@@ -5,11 +5,13 @@
 
 import * as lambda from "aws-cdk-lib/aws-lambda";
 import * as path from "path";
+import * as fs from "fs";
 import * as s3 from "aws-cdk-lib/aws-s3";
 import * as ec2 from "aws-cdk-lib/aws-ec2";
 import * as sfn from "aws-cdk-lib/aws-stepfunctions";
+import * as dynamodb from "aws-cdk-lib/aws-dynamodb";
 import { Construct } from "constructs";
-import { Duration } from "aws-cdk-lib";
+import { AssetHashType, Duration } from "aws-cdk-lib";
 import { LayerVersion } from "aws-cdk-lib/aws-lambda";
 import { LAMBDA_PYTHON_RUNTIME } from "../../../../../../config/config";
 import * as Config from "../../../../../../config/config";
@@ -31,16 +33,49 @@ export function buildVamsExecutePreview3dThumbnailPipelineFunction(
     lambdaCommonBaseLayer: LayerVersion,
     assetAuxiliaryBucket: s3.IBucket,
     openPipelineLambdaFunction: lambda.IFunction,
+    previewIndexStorageTable: dynamodb.ITable,
     config: Config.Config,
     vpc: ec2.IVpc,
     subnets: ec2.ISubnet[],
     kmsKey?: kms.IKey
 ): lambda.Function {
     const name = "vamsExecutePreview3dThumbnailPipeline";
+    const lambdaPath = path.join(
+        __dirname,
+        `../../../../../../../backendPipelines/preview/3dThumbnail/lambda`
+    );
+    // The up-to-date preview check reuses the backend preview index helpers, so bundle them as common/
+    const backendCommonPath = path.join(__dirname, `../../../../../../../backend/backend/common`);
     const fun = new lambda.Function(scope, name, {
-        code: lambda.Code.fromAsset(
-            path.join(__dirname, `../../../../../../../backendPipelines/preview/3dThumbnail/lambda`)
-        ),
+        code: lambda.Code.fromAsset(lambdaPath, {
+            assetHashType: AssetHashType.OUTPUT,
+            bundling: {
+                image: LAMBDA_PYTHON_RUNTIME.bundlingImage,
+                volumes: [{ hostPath: backendCommonPath, containerPath: "/asset-common" }],
+                command: [
+                    "bash",
+                    "-c",
+                    "cp -r /asset-input/. /asset-output/ && mkdir -p /asset-output/common && " +
+                        "cp /asset-common/previewIndex.py /asset-output/common/ && " +
+                        "touch /asset-output/common/__init__.py",
+                ],
+                local: {
+                    tryBundle(outputDir: string) {
+                        fs.cpSync(lambdaPath, outputDir, {
+                            recursive: true,
+                            filter: (src) => !src.includes("__pycache__"),
+                        });
+                        fs.mkdirSync(path.join(outputDir, "common"), { recursive: true });
+                        fs.copyFileSync(
+                            path.join(backendCommonPath, "previewIndex.py"),
+                            path.join(outputDir, "common", "previewIndex.py")
+                        );
+                        fs.writeFileSync(path.join(outputDir, "common", "__init__.py"), "");
+                        return true;
+                    },
+                },
+            },
+        }),
         handler: `${name}.lambda_handler`,
         runtime: LAMBDA_PYTHON_RUNTIME,
         layers: [lambdaCommonBaseLayer],
@@ -56,16 +91,27 @@ export function buildVamsExecutePreview3dThumbnailPipelineFunction(
                 : undefined,
         environment: {
             OPEN_PIPELINE_FUNCTION_NAME: openPipelineLambdaFunction.functionName,
+            PREVIEW_INDEX_STORAGE_TABLE_NAME: previewIndexStorageTable.tableName,
         },
     });
 
     grantReadPermissionsToAllAssetBuckets(fun);
     assetAuxiliaryBucket.grantRead(fun);
     openPipelineLambdaFunction.grantInvoke(fun);
+    previewIndexStorageTable.grantReadData(fun);
     kmsKeyLambdaPermissionAddToResourcePolicy(fun, kmsKey);
     globalLambdaEnvironmentsAndPermissions(fun, config);
     suppressCdkNagErrorsByGrantReadWrite(scope);
 
+    // Skipped executions (up-to-date preview already exists) close out the workflow task token directly
+    const stateTaskPolicy = new iam.PolicyStatement({
+        actions: ["states:SendTaskSuccess", "states:SendTaskFailure"],
+        resources: [
+            `arn:${ServiceHelper.Partition()}:states:${config.env.region}:${config.env.account}:*`,
+        ],
+    });
+    fun.addToRolePolicy(stateTaskPolicy);
+
     return fun;
 }
 
@@ -201,6 +247,8 @@ export function buildPipelineEndFunction(
 
     grantReadPermissionsToAllAssetBuckets(fun);
     assetAuxiliaryBucket.grantRead(fun);
+    // Batch manifests are deleted when the batch finishes
+    assetAuxiliaryBucket.grantDelete(fun);
     kmsKeyLambdaPermissionAddToResourcePolicy(fun, kmsKey);
     globalLambdaEnvironmentsAndPermissions(fun, config);
     suppressCdkNagErrorsByGrantReadWrite(scope);
@@ -215,3 +263,59 @@ export function buildPipelineEndFunction(
 
     return fun; //return
 }
+
+export function buildOpenBatchPipelineFunction(
+    scope: Construct,
+    lambdaCommonBaseLayer: LayerVersion,
+    assetAuxiliaryBucket: s3.IBucket,
+    pipelineStateMachine: sfn.StateMachine,
+    allowedPipelineInputExtensions: string,
+    maxFilesPerBatch: number,
+    config: Config.Config,
+    vpc: ec2.IVpc,
+    subnets: ec2.ISubnet[],
+    kmsKey?: kms.IKey
+): lambda.Function {
+    const name = "openBatchPipeline";
+
+    const fun = new lambda.Function(scope, name, {
+        code: lambda.Code.fromAsset(
+            path.join(__dirname, `../../../../../../../backendPipelines/preview/3dThumbnail/lambda`)
+        ),
+        handler: `${name}.lambda_handler`,
+        runtime: LAMBDA_PYTHON_RUNTIME,
+        layers: [lambdaCommonBaseLayer],
+        timeout: Duration.minutes(5),
+        memorySize: Config.LAMBDA_MEMORY_SIZE,
+        vpc:
+            config.app.useGlobalVpc.enabled && config.app.useGlobalVpc.useForAllLambdas
+                ? vpc
+                : undefined, //Use VPC when flagged to use for all lambdas
+        vpcSubnets:
+            config.app.useGlobalVpc.enabled && config.app.useGlobalVpc.useForAllLambdas
+                ? { subnets: subnets }
+                : undefined,
+        environment: {
+            STATE_MACHINE_ARN: pipelineStateMachine.stateMachineArn,
+            ALLOWED_INPUT_FILEEXTENSIONS: allowedPipelineInputExtensions,
+            BATCH_MANIFEST_BUCKET: assetAuxiliaryBucket.bucketName,
+            MAX_FILES_PER_BATCH: maxFilesPerBatch.toString(),
+        },
+    });
+
+    assetAuxiliaryBucket.grantReadWrite(fun);
+    pipelineStateMachine.grantStartExecution(fun);
+    kmsKeyLambdaPermissionAddToResourcePolicy(fun, kmsKey);
+    globalLambdaEnvironmentsAndPermissions(fun, config);
+    suppressCdkNagErrorsByGrantReadWrite(scope);
+
+    const stateTaskPolicy = new iam.PolicyStatement({
+        actions: ["states:SendTaskSuccess", "states:SendTaskFailure"],
+        resources: [
+            `arn:${ServiceHelper.Partition()}:states:${config.env.region}:${config.env.account}:*`,
+        ],
+    });
+    fun.addToRolePolicy(stateTaskPolicy);
+
+    return fun;
+}
@@ -196,6 +196,7 @@ export class PcPotreeViewerConstruct extends NestedStack {
                     "container"
                 ),
                 dockerfileName: "Dockerfile_PDAL",
+                sharedModulesPath: "utils/aws",
                 batchJobDefinitionName:
                     "PcPotreeViewerJob_PDAL" +
                     props.config.name +
@@ -229,6 +230,7 @@ export class PcPotreeViewerConstruct extends NestedStack {
                     "container"
                 ),
                 dockerfileName: "Dockerfile_Potree",
+                sharedModulesPath: "utils/aws",
                 batchJobDefinitionName:
                     "PcPotreeViewerJob_Potree" +
                     props.config.name +
@@ -85,6 +85,7 @@ export interface storageResources {
         databaseMetadataStorageTable: dynamodb.Table;
         assetFileMetadataStorageTable: dynamodb.Table;
         fileAttributeStorageTable: dynamodb.Table;
+        previewIndexStorageTable: dynamodb.Table;
         pipelineStorageTable: dynamodb.Table;
         rolesStorageTable: dynamodb.Table;
         s3AssetBucketsStorageTable: dynamodb.Table;
@@ -696,6 +697,19 @@ export function storageResourcesBuilder(
         },
     });
 
+    //Lists a user's comments across assets (newest first) without scanning the table
+    commentStorageTable.addGlobalSecondaryIndex({
+        indexName: "CommentOwnerIdIndex",
+        partitionKey: {
+            name: "commentOwnerID",
+            type: dynamodb.AttributeType.STRING,
+        },
+        sortKey: {
+            name: "dateCreated",
+            type: dynamodb.AttributeType.STRING,
+        },
+    });
+
     const appFeatureEnabledStorageTable = new dynamodb.Table(
         scope,
         "AppFeatureEnabledStorageTable",
@@ -957,6 +971,16 @@ export function storageResourcesBuilder(
         projectionType: dynamodb.ProjectionType.ALL,
     });
 
+    // Preview-existence index: one record per base file listing its .previewFile.* siblings.
+    // Maintained by the bucket sync S3 event path so preview lookups avoid S3 prefix listings.
+    const previewIndexStorageTable = new dynamodb.Table(scope, "PreviewIndexStorageTable", {
+        ...dynamodbDefaultProps,
+        partitionKey: {
+            name: "bucketName:baseFileKey",
+            type: dynamodb.AttributeType.STRING,
+        },
+    });
+
     //Old
     new dynamodb.Table(scope, "MetadataSchemaStorageTable", {
         ...dynamodbDefaultProps,
@@ -1034,6 +1058,16 @@ export function storageResourcesBuilder(
         },
     });
 
+    //Checks whether a tag type is in use without scanning the tags
+    tagStorageTable.addGlobalSecondaryIndex({
+        indexName: "TagTypeNameIndex",
+        partitionKey: {
+            name: "tagTypeName",
+            type: dynamodb.AttributeType.STRING,
+        },
+        projectionType: dynamodb.ProjectionType.KEYS_ONLY,
+    });
+
     const tagTypeStorageTable = new dynamodb.Table(scope, "TagTypeStorageTable", {
         ...dynamodbDefaultProps,
         partitionKey: {
@@ -1054,6 +1088,18 @@ export function storageResourcesBuilder(
         },
     });
 
+    subscriptionsStorageTable.addGlobalSecondaryIndex({
+        indexName: "assetIdGSI",
+        partitionKey: {
+            name: "assetId",
+            type: dynamodb.AttributeType.STRING,
+        },
+        sortKey: {
+            name: "eventName",
+            type: dynamodb.AttributeType.STRING,
+        },
+    });
+
     const rolesStorageTable = new dynamodb.Table(scope, "RolesStorageTable", {
         ...dynamodbDefaultProps,
         partitionKey: {
@@ -1439,6 +1485,7 @@ export function storageResourcesBuilder(
             databaseMetadataStorageTable: databaseMetadataStorageTable,
             assetFileMetadataStorageTable: assetFileMetadataStorageTable,
             fileAttributeStorageTable: fileAttributeStorageTable,
+            previewIndexStorageTable: previewIndexStorageTable,
             authEntitiesStorageTable: authEntitiesTable,
             tagStorageTable: tagStorageTable,
             tagTypeStorageTable: tagTypeStorageTable,
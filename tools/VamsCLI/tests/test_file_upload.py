@@ -15,7 +15,7 @@ from vamscli.utils.file_processor import (
     collect_files_from_list, create_upload_sequences, validate_file_for_upload,
     validate_preview_files_have_base_files, format_file_size
 )
-from vamscli.utils.upload_manager import UploadManager, UploadProgress, PartUploadInfo
+from vamscli.utils.upload_manager import UploadManager, UploadProgress, PartUploadInfo, SequenceInitResult
 from vamscli.utils.exceptions import (
     InvalidFileError, FileTooLargeError, PreviewFileError, UploadSequenceError,
     FileUploadError, AuthenticationError, APIError
@@ -23,7 +23,7 @@ from vamscli.utils.exceptions import (
 from vamscli.constants import (
     DEFAULT_CHUNK_SIZE_SMALL, DEFAULT_CHUNK_SIZE_LARGE, MAX_FILE_SIZE_SMALL_CHUNKS,
     MAX_SEQUENCE_SIZE, MAX_PREVIEW_FILE_SIZE, MAX_FILES_PER_REQUEST, 
-    MAX_TOTAL_PARTS_PER_REQUEST, MAX_PARTS_PER_FILE
+    MAX_TOTAL_PARTS_PER_REQUEST, MAX_PARTS_PER_FILE, MAX_BATCH_COMPLETE_UPLOADS
 )
 
 
@@ -406,6 +406,73 @@ class TestUploadManager:
         # Test basic properties
         assert hasattr(manager, 'max_parallel')
         assert hasattr(manager, 'max_retries')
+    
+    def _uploaded_sequences(self, sequence, count):
+        """Create initialized sequences whose parts were all uploaded."""
+        file_info = sequence.files[0]
+        init_results = []
+        for index in range(count):
+            part_upload = PartUploadInfo(
+                file_info, sequence.file_parts[file_info.relative_key][0],
+                "https://s3.amazonaws.com/presigned-url", index
+            )
+            part_upload.status = "completed"
+            part_upload.etag = f"etag-{index}"
+            init_response = {
+                "uploadId": f"upload-{index}",
+                "files": [{"relativeKey": file_info.relative_key, "uploadIdS3": f"s3-upload-{index}"}]
+            }
+            init_results.append(SequenceInitResult(index, f"upload-{index}", init_response, sequence, [part_upload]))
+        return init_results
+    
+    def test_complete_sequences_batch(self, mock_api_client, sample_sequence):
+        """Test asset file sequences are completed with batch completion requests."""
+        count = MAX_BATCH_COMPLETE_UPLOADS + 1
+        mock_api_client.complete_uploads_batch.side_effect = lambda database_id, asset_id, uploads: {
+            "uploadResults": [
+                {"uploadId": upload["uploadId"], "overallSuccess": True} for upload in uploads
+            ]
+        }
+        manager = UploadManager(mock_api_client)
+        progress = UploadProgress([sample_sequence])
+        
+        results = asyncio.run(manager._complete_sequences_batch(
+            self._uploaded_sequences(sample_sequence, count), "test-db", "test-asset", progress
+        ))
+        
+        # One request per MAX_BATCH_COMPLETE_UPLOADS uploads and no single completions
+        batch_calls = mock_api_client.complete_uploads_batch.call_args_list
+        assert [len(call.args[2]) for call in batch_calls] == [MAX_BATCH_COMPLETE_UPLOADS, 1]
+        assert batch_calls[0].args[2][0] == {
+            "uploadId": "upload-0",
+            "files": [{
+                "relativeKey": "test.txt",
+                "uploadIdS3": "s3-upload-0",
+                "parts": [{"PartNumber": 1, "ETag": "etag-0"}]
+            }]
+        }
+        mock_api_client.complete_upload.assert_not_called()
+        
+        assert [result["completion_result"]["uploadId"] for result in results] == [
+            f"upload-{index}" for index in range(count)
+        ]
+        assert all(result["successful_files"] == ["test.txt"] for result in results)
+        assert progress.completed_sequences == count
+    
+    def test_complete_sequences_batch_failure(self, mock_api_client, sample_sequence):
+        """Test a failed batch completion request fails the sequences of the batch."""
+        mock_api_client.complete_uploads_batch.side_effect = APIError("Batch upload completion failed")
+        manager = UploadManager(mock_api_client)
+        progress = UploadProgress([sample_sequence])
+        
+        results = asyncio.run(manager._complete_sequences_batch(
+            self._uploaded_sequences(sample_sequence, 2), "test-db", "test-asset", progress
+        ))
+        
+        assert len(results) == 2
+        assert all("Batch upload completion failed" in result["error"] for result in results)
+        assert all(result["failed_files"] == ["test.txt"] for result in results)
+        assert progress.completed_sequences == 0
 
 
 class TestFileUploadCommand:
@@ -941,6 +941,83 @@ class TestMetadataCommandsIntegration:
             assert 'key3: Schema validation failed' in result.output
 
 
+class TestDatabaseMetadataImportCommand:
+    """Test metadata database import command."""
+    
+    def test_import_help(self, cli_runner):
+        """Test import command help."""
+        result = cli_runner.invoke(cli, ['metadata', 'database', 'import', '--help'])
+        assert result.exit_code == 0
+        assert 'Import asset and file metadata' in result.output
+        assert '--source-asset-id' in result.output
+        assert '--source-file-path' in result.output
+        assert '--start-row' in result.output
+    
+    def test_import_resumes_until_complete(self, cli_runner, metadata_command_mocks):
+        """Test import keeps requesting from nextRow and combines the results."""
+        with metadata_command_mocks as mocks:
+            mocks['api_client'].import_metadata_v2.side_effect = [
+                {
+                    'success': False, 'totalRows': 3, 'startRow': 0, 'processedRows': 2,
+                    'successCount': 1, 'failureCount': 1, 'nextRow': 2,
+                    'errorReport': [{'row': 1, 'assetId': 'a2', 'filePath': '/missing.glb',
+                                     'metadataKey': 'k', 'error': 'File not found in S3'}],
+                    'errorReportTruncated': False, 'message': 'Imported 1 of 2 rows, resume from row 2',
+                    'timestamp': '2024-12-30T14:30:00.000Z'
+                },
+                {
+                    'success': True, 'totalRows': 3, 'startRow': 2, 'processedRows': 1,
+                    'successCount': 1, 'failureCount': 0, 'nextRow': None,
+                    'errorReport': [], 'errorReportTruncated': False, 'message': 'Imported 1 of 1 rows',
+                    'timestamp': '2024-12-30T14:30:05.000Z'
+                }
+            ]
+            
+            result = cli_runner.invoke(cli, [
+                'metadata', 'database', 'import',
+                '-d', 'test-db',
+                '--source-asset-id', 'imports',
+                '--source-file-path', '/metadata.ndjson',
+                '--json-output'
+            ])
+            
+            assert result.exit_code == 0
+            output_json = json.loads(result.output)
+            assert output_json['processedRows'] == 3
+            assert output_json['successCount'] == 2
+            assert output_json['failureCount'] == 1
+            assert output_json['nextRow'] is None
+            assert output_json['errorReport'][0]['row'] == 1
+            
+            calls = mocks['api_client'].import_metadata_v2.call_args_list
+            assert [call.args[4] for call in calls] == [0, 2]
+            assert calls[0].args[:4] == ('test-db', 'imports', '/metadata.ndjson', None)
+    
+    def test_import_reports_failed_rows(self, cli_runner, metadata_command_mocks):
+        """Test import CLI output lists failed rows."""
+        with metadata_command_mocks as mocks:
+            mocks['api_client'].import_metadata_v2.return_value = {
+                'success': False, 'totalRows': 1, 'startRow': 0, 'processedRows': 1,
+                'successCount': 0, 'failureCount': 1, 'nextRow': None,
+                'errorReport': [{'row': 0, 'assetId': 'a1', 'metadataKey': 'size',
+                                 'error': 'Not authorized to create metadata for this asset'}],
+                'errorReportTruncated': False, 'message': 'Imported 0 of 1 rows',
+                'timestamp': '2024-12-30T14:30:00.000Z'
+            }
+            
+            result = cli_runner.invoke(cli, [
+                'metadata', 'database', 'import',
+                '-d', 'test-db',
+                '--source-asset-id', 'imports',
+                '--source-file-path', '/metadata.csv'
+            ])
+            
+            assert result.exit_code == 0
+            assert 'Total Rows: 1' in result.output
+            assert 'Failed: 1' in result.output
+            assert 'Row 0: a1 [size]: Not authorized to create metadata for this asset' in result.output
+
+
 #######################
 # Error Handling Tests
 #######################
@@ -118,6 +118,38 @@ def format_bulk_operation_result(result: Dict[str, Any], operation: str) -> str:
     return '\n'.join(lines)
 
 
+def format_import_result(result: Dict[str, Any]) -> str:
+    """
+    Format metadata import result for CLI display.
+    
+    Args:
+        result: Combined ImportMetadataResponseModel results of all import requests
+    
+    Returns:
+        Formatted string for display
+    """
+    lines = []
+    lines.append(f"Total Rows: {result.get('totalRows', 0)}")
+    lines.append(f"Imported: {result.get('successCount', 0)}")
+    lines.append(f"Failed: {result.get('failureCount', 0)}")
+    
+    if result.get('nextRow') is not None:
+        lines.append(f"Stopped before row {result['nextRow']} (resume with --start-row {result['nextRow']})")
+    
+    if result.get('errorReport'):
+        lines.append(f"\nFailed rows:")
+        for error in result['errorReport']:
+            target = error.get('assetId') or 'unknown'
+            if error.get('filePath'):
+                target += error['filePath']
+            key = f" [{error['metadataKey']}]" if error.get('metadataKey') else ''
+            lines.append(f"  • Row {error.get('row')}: {target}{key}: {error.get('error', 'unknown error')}")
+        if result.get('errorReportTruncated'):
+            lines.append("  • ... more failed rows not listed")
+    
+    return '\n'.join(lines)
+
+
 #######################
 # Main Metadata Group
 #######################
@@ -876,4 +908,95 @@ def delete(ctx: click.Context, database_id: str, json_input: str, json_output: b
             error_type="Database Error",
             helpful_message="Verify the database ID is correct."
         )
-        raise click.ClickException(str(e))
\ No newline at end of file
+        raise click.ClickException(str(e))
+
+
+@database.command(name='import')
+@click.option('-d', '--database-id', required=True, help='Database ID')
+@click.option('--source-asset-id', required=True, help='Asset ID (in the same database) holding the import file')
+@click.option('--source-file-path', required=True, help='Relative path of the NDJSON or CSV import file in the source asset')
+@click.option('--format', 'file_format', type=click.Choice(['ndjson', 'csv']),
+              help='Import file format (default: inferred from the file extension)')
+@click.option('--start-row', default=0, type=int, help='Zero-based data row to start from (default: 0)')
+@click.option('--json-output', is_flag=True, help='Output raw JSON response')
+@click.pass_context
+@requires_setup_and_auth
+def import_metadata(ctx: click.Context, database_id: str, source_asset_id: str, source_file_path: str,
+                    file_format: str, start_row: int, json_output: bool):
+    """
+    Import asset and file metadata for many assets from an NDJSON or CSV file.
+    
+    Upload the import file to an asset of the database first. Each row targets
+    an asset (and optionally one of its files):
+    
+    \b
+        {"assetId": "a1", "metadataKey": "title", "metadataValue": "Bridge A"}
+        {"assetId": "a1", "filePath": "/scan.e57", "metadataKey": "scan_date",
+         "metadataValue": "2024-06-01T00:00:00Z", "metadataValueType": "date"}
+    
+    CSV files use a header row with the same field names (assetId, filePath,
+    type, metadataKey, metadataValue, metadataValueType). Rows that fail are
+    listed in the error report; the rest of the import continues. Large files
+    are imported over several requests automatically.
+    
+    Examples:
+        vamscli metadata database import -d my-db --source-asset-id imports --source-file-path /metadata.ndjson
+        vamscli metadata database import -d my-db --source-asset-id imports --source-file-path /metadata.csv --json-output
+    """
+    profile_manager = get_profile_manager_from_context(ctx)
+    config = profile_manager.load_config()
+    api_client = APIClient(config['api_gateway_url'], profile_manager)
+    
+    combined = {
+        'totalRows': 0,
+        'startRow': start_row,
+        'processedRows': 0,
+        'successCount': 0,
+        'failureCount': 0,
+        'nextRow': start_row,
+        'errorReport': [],
+        'errorReportTruncated': False
+    }
+    
+    try:
+        # Each request returns nextRow until every row has been processed
+        while combined['nextRow'] is not None:
+            output_status(f"Importing metadata from row {combined['nextRow']}...", json_output)
+            
+            result = api_client.import_metadata_v2(
+                database_id, source_asset_id, source_file_path, file_format, combined['nextRow']
+            )
+            
+            combined['totalRows'] = result.get('totalRows', 0)
+            combined['processedRows'] += result.get('processedRows', 0)
+            combined['successCount'] += result.get('successCount', 0)
+            combined['failureCount'] += result.get('failureCount', 0)
+            combined['errorReport'].extend(result.get('errorReport', []))
+            combined['errorReportTruncated'] = combined['errorReportTruncated'] or result.get('errorReportTruncated', False)
+            combined['nextRow'] = result.get('nextRow')
+            combined['message'] = result.get('message')
+            combined['timestamp'] = result.get('timestamp')
+        
+        combined['success'] = combined['failureCount'] == 0
+        combined['message'] = f"Imported {combined['successCount']} of {combined['processedRows']} rows"
+        
+        output_result(
+            combined,
+            json_output,
+            success_message="✓ Metadata import completed!",
+            cli_formatter=format_import_result
+        )
+        
+        return combined
+        
+    except (DatabaseNotFoundError, InvalidDatabaseDataError) as e:
+        if combined['processedRows']:
+            # Report what was imported so the import can be resumed
+            output_result(combined, json_output, cli_formatter=format_import_result)
+        output_error(
+            e,
+            json_output,
+            error_type="Metadata Import Error",
+            helpful_message="Verify the database ID, source asset ID, and import file path are correct."
+        )
+        raise click.ClickException(str(e))
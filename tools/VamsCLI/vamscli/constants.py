@@ -14,6 +14,7 @@ API_DATABASE_ASSETS = "/database/{databaseId}/assets"
 API_DATABASE_ASSET = "/database/{databaseId}/assets/{assetId}"
 API_UPLOADS = "/uploads"
 API_UPLOADS_COMPLETE = "/uploads/{uploadId}/complete"
+API_UPLOADS_COMPLETE_BATCH = "/uploads/complete/batch"
 
 # File Management API Endpoints
 API_CREATE_FOLDER = "/database/{databaseId}/assets/{assetId}/createFolder"
@@ -69,6 +70,7 @@ API_ASSET_LINK_METADATA = "/asset-links/{assetLinkId}/metadata"
 API_ASSET_METADATA = "/database/{databaseId}/assets/{assetId}/metadata"
 API_FILE_METADATA = "/database/{databaseId}/assets/{assetId}/metadata/file"
 API_DATABASE_METADATA = "/database/{databaseId}/metadata"
+API_METADATA_IMPORT = "/database/{databaseId}/metadata/import"
 
 # Cognito User Management API Endpoints
 API_COGNITO_USERS = "/user/cognito"
@@ -127,6 +129,7 @@ MAX_TOTAL_PARTS_PER_REQUEST = 200  # Maximum total parts across all files
 MAX_PARTS_PER_FILE = 200  # Maximum parts per individual file
 MAX_PART_SIZE = 5 * 1024 * 1024 * 1024  # 5GB maximum part size (S3 limit)
 MAX_UPLOADS_PER_USER_PER_MINUTE = 20  # Rate limit for upload initialization
+MAX_BATCH_COMPLETE_UPLOADS = 20  # Maximum uploads completed in one batch completion request
 
 # Download Configuration
 DEFAULT_PARALLEL_DOWNLOADS = 5
@@ -866,6 +866,52 @@ class APIClient:
         except Exception as e:
             raise APIError(f"Failed to complete upload: {e}")
 
+    def complete_uploads_batch(self, database_id: str, asset_id: str, uploads: list) -> dict:
+        """Complete several asset file uploads of one asset in a single request.
+        
+        Args:
+            database_id: Database ID
+            asset_id: Asset ID
+            uploads: List of {"uploadId": ..., "files": [...]} entries (up to 20)
+            
+        Returns:
+            Batch completion response with per-upload results
+        """
+        from ..constants import API_UPLOADS_COMPLETE_BATCH
+        
+        data = {
+            "databaseId": database_id,
+            "assetId": asset_id,
+            "uploadType": "assetFile",
+            "uploads": uploads
+        }
+        
+        try:
+            response = self.post(API_UPLOADS_COMPLETE_BATCH, data=data, include_auth=True)
+            return response.json()
+            
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 400:
+                error_data = e.response.json() if e.response.content else {}
+                error_message = error_data.get('message', str(e))
+                raise InvalidAssetDataError(f"Invalid completion data: {error_message}")
+                
+            elif e.response.status_code == 404:
+                raise AssetNotFoundError(f"Asset '{asset_id}' not found in database '{database_id}'")
+                
+            elif e.response.status_code == 409:
+                # All files failed; the body still carries the per-upload results
+                error_data = e.response.json() if e.response.content else {}
+                return error_data
+                
+            elif e.response.status_code in [401, 403]:
+                raise AuthenticationError(f"Authentication failed: {e}")
+            else:
+                raise APIError(f"Batch upload completion failed: {e}")
+                
+        except Exception as e:
+            raise APIError(f"Failed to complete uploads: {e}")
+
     # File Management API Methods
 
     def create_folder(self, database_id: str, asset_id: str, folder_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -2927,6 +2973,56 @@ class APIClient:
         except Exception as e:
             raise APIError(f"Failed to delete database metadata: {e}")
 
+    def import_metadata_v2(self, database_id: str, source_asset_id: str, source_file_path: str,
+                           file_format: str = None, start_row: int = 0) -> Dict[str, Any]:
+        """
+        Import asset and file metadata rows from an NDJSON or CSV file stored on an asset.
+        
+        Args:
+            database_id: Database ID
+            source_asset_id: Asset ID (in the same database) holding the import file
+            source_file_path: Relative path of the import file within the source asset
+            file_format: 'ndjson' or 'csv' (inferred from the file extension when not provided)
+            start_row: Zero-based data row to resume the import from
+        
+        Returns:
+            ImportMetadataResponseModel with row outcomes and nextRow when rows remain
+        
+        Raises:
+            DatabaseNotFoundError: When database doesn't exist
+            InvalidDatabaseDataError: When the import request is invalid
+            APIError: When API call fails
+        """
+        try:
+            from ..constants import API_METADATA_IMPORT
+            endpoint = API_METADATA_IMPORT.format(databaseId=database_id)
+            data = {
+                'sourceAssetId': source_asset_id,
+                'sourceFilePath': source_file_path,
+                'startRow': start_row
+            }
+            if file_format:
+                data['format'] = file_format
+            
+            response = self.post(endpoint, data=data, include_auth=True)
+            return response.json()
+            
+        except requests.exceptions.HTTPError as e:
+            if e.response.status_code == 400:
+                error_data = e.response.json() if e.response.content else {}
+                error_message = error_data.get('message', str(e))
+                raise InvalidDatabaseDataError(f"Invalid metadata import: {error_message}")
+                
+            elif e.response.status_code == 404:
+                raise DatabaseNotFoundError(f"Database '{database_id}' not found")
+            elif e.response.status_code in [401, 403]:
+                raise AuthenticationError(f"Authentication failed: {e}")
+            else:
+                raise APIError(f"Metadata import failed: {e}")
+                
+        except Exception as e:
+            raise APIError(f"Failed to import metadata: {e}")
+
     # Metadata Schema API Methods
 
     def get_metadata_schema(self, database_id: str, max_items: int = 1000, page_size: int = 100, starting_token: str = None) -> Dict[str, Any]:
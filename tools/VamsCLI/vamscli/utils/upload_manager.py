@@ -8,7 +8,7 @@ from typing import List, Dict, Any, Optional, Callable, Tuple
 from pathlib import Path
 from collections import defaultdict
 
-from ..constants import DEFAULT_PARALLEL_UPLOADS, DEFAULT_RETRY_ATTEMPTS
+from ..constants import DEFAULT_PARALLEL_UPLOADS, DEFAULT_RETRY_ATTEMPTS, MAX_BATCH_COMPLETE_UPLOADS
 from .exceptions import FileUploadError, PartUploadError
 from .file_processor import UploadSequence, FileInfo, format_file_size
 from .api_client import APIClient
@@ -228,11 +228,11 @@ class UploadManager:
             sequence.sequence_id, upload_id, init_response, sequence, part_uploads
         )
     
-    async def _complete_sequence(self, init_result: SequenceInitResult, database_id: str,
-                                asset_id: str, upload_type: str, progress: UploadProgress) -> Dict[str, Any]:
-        """Complete a sequence upload (Stage 3).
+    def _prepare_completion(self, init_result: SequenceInitResult) -> Tuple[List[Dict[str, Any]], set, set]:
+        """Build the completion files of a sequence from its uploaded parts.
         
-        This is called after all parts for this sequence have been uploaded.
+        Returns:
+            Tuple of (completion files, successful file keys, failed file keys)
         """
         sequence = init_result.sequence
         init_response = init_result.init_response
@@ -289,18 +289,12 @@ class UploadManager:
                 else:
                     failed_files.add(file_key)
         
-        # Complete upload if we have any successful files (run synchronous API call in executor)
-        completion_result = None
-        if completion_files:
-            try:
-                loop = asyncio.get_event_loop()
-                completion_result = await loop.run_in_executor(
-                    None,
-                    self.api_client.complete_upload,
-                    init_result.upload_id, database_id, asset_id, upload_type, completion_files
-                )
-            except Exception as e:
-                raise FileUploadError(f"Failed to complete upload for sequence {sequence.sequence_id}: {e}")
+        return completion_files, successful_files, failed_files
+    
+    def _sequence_result(self, init_result: SequenceInitResult, successful_files: set, failed_files: set,
+                         completion_result: Optional[Dict[str, Any]], progress: UploadProgress) -> Dict[str, Any]:
+        """Record a completed sequence and build its result."""
+        part_uploads = init_result.part_uploads
         
         # Update completed sequences count
         progress.completed_sequences += 1
@@ -308,7 +302,7 @@ class UploadManager:
             self.progress_callback(progress)
         
         return {
-            "sequence_id": sequence.sequence_id,
+            "sequence_id": init_result.sequence_id,
             "upload_id": init_result.upload_id,
             "successful_files": list(successful_files),
             "failed_files": list(failed_files),
@@ -318,13 +312,94 @@ class UploadManager:
             "failed_parts": sum(1 for p in part_uploads if p.status == "failed")
         }
     
+    async def _complete_sequence(self, init_result: SequenceInitResult, database_id: str,
+                                asset_id: str, upload_type: str, progress: UploadProgress) -> Dict[str, Any]:
+        """Complete a sequence upload (Stage 3).
+        
+        This is called after all parts for this sequence have been uploaded.
+        """
+        completion_files, successful_files, failed_files = self._prepare_completion(init_result)
+        
+        # Complete upload if we have any successful files (run synchronous API call in executor)
+        completion_result = None
+        if completion_files:
+            try:
+                loop = asyncio.get_event_loop()
+                completion_result = await loop.run_in_executor(
+                    None,
+                    self.api_client.complete_upload,
+                    init_result.upload_id, database_id, asset_id, upload_type, completion_files
+                )
+            except Exception as e:
+                raise FileUploadError(f"Failed to complete upload for sequence {init_result.sequence_id}: {e}")
+        
+        return self._sequence_result(init_result, successful_files, failed_files, completion_result, progress)
+    
+    async def _complete_sequences_batch(self, init_results: List[SequenceInitResult], database_id: str,
+                                        asset_id: str, progress: UploadProgress) -> List[Dict[str, Any]]:
+        """Complete the asset file uploads of several sequences with batch completion requests.
+        
+        The backend updates the asset and notifies subscribers once per request instead of once
+        per sequence.
+        """
+        results = []
+        for start in range(0, len(init_results), MAX_BATCH_COMPLETE_UPLOADS):
+            chunk = init_results[start:start + MAX_BATCH_COMPLETE_UPLOADS]
+            
+            prepared = [(init_result, *self._prepare_completion(init_result)) for init_result in chunk]
+            uploads = [
+                {"uploadId": init_result.upload_id, "files": completion_files}
+                for init_result, completion_files, _, _ in prepared
+                if completion_files
+            ]
+            
+            upload_results = {}
+            if uploads:
+                try:
+                    loop = asyncio.get_event_loop()
+                    batch_result = await loop.run_in_executor(
+                        None,
+                        self.api_client.complete_uploads_batch,
+                        database_id, asset_id, uploads
+                    )
+                    upload_results = {
+                        upload_result.get("uploadId"): upload_result
+                        for upload_result in batch_result.get("uploadResults", [])
+                    }
+                except Exception as e:
+                    error = f"Failed to complete uploads for sequences {[r.sequence_id for r in chunk]}: {e}"
+                    for init_result, completion_files, successful_files, failed_files in prepared:
+                        if completion_files:
+                            results.append({
+                                "sequence_id": init_result.sequence_id,
+                                "error": error,
+                                "successful_files": [],
+                                "failed_files": [f.relative_key for f in init_result.sequence.files]
+                            })
+                        else:
+                            results.append(self._sequence_result(
+                                init_result, successful_files, failed_files, None, progress
+                            ))
+                    continue
+            
+            for init_result, completion_files, successful_files, failed_files in prepared:
+                results.append(self._sequence_result(
+                    init_result, successful_files, failed_files,
+                    upload_results.get(init_result.upload_id), progress
+                ))
+        
+        return results
+    
     async def _process_sequence(self, sequence: UploadSequence, database_id: str, asset_id: str,
                                upload_type: str, semaphore: asyncio.Semaphore, 
-                               progress: UploadProgress) -> Dict[str, Any]:
+                               progress: UploadProgress, defer_completion: bool = False):
         """Process a single sequence: initialize, upload parts, complete.
         
         This allows sequences to be processed independently - as soon as one is initialized,
         its parts can start uploading while other sequences are still initializing.
+        
+        With defer_completion the sequence is returned as a SequenceInitResult once its parts
+        are uploaded, so that the caller can complete it in a batch completion request.
         """
         try:
             # Stage 1: Initialize this sequence
@@ -344,6 +419,9 @@ class UploadManager:
             if self.progress_callback:
                 self.progress_callback(progress)
             
+            if defer_completion:
+                return init_result
+            
             # Stage 3: Complete this sequence (completion API call)
             return await self._complete_sequence(init_result, database_id, asset_id, upload_type, progress)
             
@@ -355,6 +433,26 @@ class UploadManager:
                 "failed_files": [f.relative_key for f in sequence.files]
             }
     
+    async def _complete_deferred_sequences(self, sequence_results: list, database_id: str,
+                                           asset_id: str, progress: UploadProgress) -> list:
+        """Complete the uploaded sequences of a deferred run, regular sequences before previews.
+        
+        Results of sequences that failed before completion are kept as they are.
+        """
+        uploaded = [result for result in sequence_results if isinstance(result, SequenceInitResult)]
+        regular = [r for r in uploaded if not any(f.is_preview_file for f in r.sequence.files)]
+        preview = [r for r in uploaded if any(f.is_preview_file for f in r.sequence.files)]
+        
+        completed = {}
+        for init_results in (regular, preview):
+            for result in await self._complete_sequences_batch(init_results, database_id, asset_id, progress):
+                completed[result["sequence_id"]] = result
+        
+        return [
+            completed[result.sequence_id] if isinstance(result, SequenceInitResult) else result
+            for result in sequence_results
+        ]
+    
     async def _upload_part_with_retry(self, part_upload: PartUploadInfo, 
                                     semaphore: asyncio.Semaphore, 
                                     progress: UploadProgress):
@@ -444,6 +542,8 @@ class UploadManager:
         - All sequences share the same part upload pool (respecting max_parallel)
         - Preview sequences complete their API calls AFTER regular sequences
         - Progress updates in real-time as sequences initialize and complete
+        - Asset file uploads of several sequences are completed with batch completion
+          requests once their parts are uploaded, so the asset is updated once per batch
         """
         progress = UploadProgress(sequences)
         
@@ -469,17 +569,25 @@ class UploadManager:
         # This ensures preview completion APIs are called after regular ones
         all_sequences_ordered = regular_sequences + preview_sequences
         
+        # Several asset file sequences are completed together after their parts are uploaded
+        batch_completion = upload_type == "assetFile" and len(all_sequences_ordered) > 1
+        
         # Process all sequences concurrently
         # Each sequence will: initialize → upload parts → complete
         # But preview sequences will wait for regular sequences to complete their APIs
         sequence_tasks = [
-            self._process_sequence(seq, database_id, asset_id, upload_type, semaphore, progress)
+            self._process_sequence(seq, database_id, asset_id, upload_type, semaphore, progress,
+                                   defer_completion=batch_completion)
             for seq in all_sequences_ordered
         ]
         
         # Wait for all sequences to complete
         try:
             sequence_results = await asyncio.gather(*sequence_tasks, return_exceptions=True)
+            if batch_completion:
+                sequence_results = await self._complete_deferred_sequences(
+                    sequence_results, database_id, asset_id, progress
+                )
         except Exception as e:
             sequence_results = [{
                 "sequence_id": seq.sequence_id,
@@ -124,6 +124,7 @@ export const AssetDetailsPane: React.FC<AssetDetailsPaneProps> = ({
             const result = (await checkSubscription({
                 userId: username,
                 assetId: asset.assetId,
+                databaseId: asset.databaseId,
             })) as [boolean, any];
 
             if (result[0] && result[1] === "success") {
@@ -148,6 +149,7 @@ export const AssetDetailsPane: React.FC<AssetDetailsPaneProps> = ({
             entityName: "Asset",
             subscribers: [userName],
             entityId: asset.assetId,
+            databaseId: asset.databaseId,
         };
 
         try {
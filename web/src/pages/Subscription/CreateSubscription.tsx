@@ -44,6 +44,7 @@ const ruleBody = {
     eventName: "Asset Version Change",
     entityName: "",
     entityId: "",
+    databaseId: "",
     subscribers: [""],
 };
 
@@ -233,6 +234,7 @@ export default function CreateSubscription({
                     ? selectedItems[0].databaseName
                     : selectedItems[0].assetId
                 : "";
+        ruleBody.databaseId = selectedItems.length > 0 ? selectedItems[0].databaseName || "" : "";
 
         ruleBody.subscribers = formState.subscribers
             ? (typeof formState.subscribers === "string" ? formState.subscribers.split(",") : [])
@@ -325,6 +327,7 @@ export default function CreateSubscription({
                                         });
                                 } else {
                                     ruleBody.entityId = formState.entityId;
+                                    ruleBody.databaseId = formState.databaseId || "";
                                     // selectedEntityType?.value === "Database"
                                     //     ? formState.databaseId
                                     //     : formState.entityId;
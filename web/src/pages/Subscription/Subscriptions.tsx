@@ -15,6 +15,7 @@ const ruleBody = {
     eventName: "Subscription Change",
     entityName: "",
     entityId: "",
+    databaseId: "",
     subscribers: [],
 };
 export const SubscriptionListDefinition = new ListDefinition({
@@ -28,6 +29,7 @@ export const SubscriptionListDefinition = new ListDefinition({
         console.log(item);
         ruleBody.entityName = item.entityName;
         ruleBody.entityId = item.entityId;
+        ruleBody.databaseId = item.databaseId || "";
         ruleBody.subscribers = item.subscribers;
         ruleBody.eventName = item.eventName;
         try {